@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+
+#
+# Paasmaker - Platform as a Service
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+
+# Compare the size and speed of the job record encoding used by the
+# Redis job backend against the older plain JSON encoding.
+# Run from the root of the Paasmaker checkout:
+#   ./misc/job-encoding-benchmark.py [iterations]
+
+import os
+import sys
+import json
+import time
+import uuid
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import paasmaker
+from paasmaker.common.job.manager import codec
+
+iterations = 10000
+if len(sys.argv) > 1:
+	iterations = int(sys.argv[1])
+
+# A typical job record, similar to what the job manager stores.
+root_id = str(uuid.uuid4())
+record = {
+	'job_id': str(uuid.uuid4()),
+	'parent_id': root_id,
+	'root_id': root_id,
+	'node': str(uuid.uuid4()),
+	'state': 'SUCCESS',
+	'time': time.time(),
+	'title': 'Register instances on node',
+	'plugin': 'paasmaker.job.heart.registerinstance',
+	'summary': None,
+	'abort_handler': False,
+	'parameters': {
+		'instance_type_id': 12,
+		'application_id': 4,
+		'instances': [str(uuid.uuid4()) for i in range(10)]
+	}
+}
+
+def json_encode(values):
+	out = {}
+	for key, value in values.iteritems():
+		out[key] = json.dumps(value, cls=paasmaker.util.jsonencoder.JsonEncoder)
+	return out
+
+def json_decode(values):
+	result = {}
+	for key, value in values.iteritems():
+		if value:
+			result[key] = json.loads(value)
+		else:
+			result[key] = None
+	return result
+
+json_encoded = json_encode(record)
+codec_encoded = codec.encode_record(record)
+
+def size(encoded):
+	return sum([len(key) + len(value) for key, value in encoded.iteritems()])
+
+print "Record size (keys and values):"
+print "  JSON:  %d bytes" % size(json_encoded)
+print "  Codec: %d bytes" % size(codec_encoded)
+print
+
+def report(name, json_func, codec_func):
+	json_time = timeit.timeit(json_func, number=iterations)
+	codec_time = timeit.timeit(codec_func, number=iterations)
+	print "%s, %d iterations:" % (name, iterations)
+	print "  JSON:  %0.3fs (%0.1fus each)" % (json_time, json_time / iterations * 1000000)
+	print "  Codec: %0.3fs (%0.1fus each)" % (codec_time, codec_time / iterations * 1000000)
+	print
+
+report("Encode", lambda: json_encode(record), lambda: codec.encode_record(record))
+report("Decode", lambda: json_decode(json_encoded), lambda: codec.decode_record(codec_encoded))
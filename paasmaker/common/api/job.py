@@ -14,6 +14,10 @@ from apirequest import APIRequest, StreamAPIRequest, APIResponse
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
+# How much longer than a log search's time limit to wait for the
+# results, allowing for it being passed on to the node with the log.
+SEARCH_TIMEOUT_MARGIN = 10.0
+
 class JobAbortAPIRequest(APIRequest):
 	"""
 	Send an abort request to a specific job ID.
@@ -34,6 +38,79 @@ class JobAbortAPIRequest(APIRequest):
 	def get_endpoint(self):
 		return '/job/abort/%s' % self.job_id
 
+class JobMetricsAPIRequest(APIRequest):
+	"""
+	Fetch the job execution metrics from a node. Each node
+	only reports on the jobs that it ran itself.
+	"""
+	def __init__(self, *args, **kwargs):
+		super(JobMetricsAPIRequest, self).__init__(*args, **kwargs)
+		self.method = 'GET'
+
+	def get_endpoint(self):
+		return '/job/metrics'
+
+class JobLogSearchAPIRequest(APIRequest):
+	"""
+	Search a job's log for matching lines. The search is
+	done by the node that has the log, and returns at most
+	the requested number of lines.
+	"""
+	def __init__(self, *args, **kwargs):
+		super(JobLogSearchAPIRequest, self).__init__(*args, **kwargs)
+		self.method = 'POST'
+		self.job_id = None
+		self.params = {}
+
+	def set_job(self, job_id):
+		"""
+		Set the ID of the job whose log to search.
+
+		:arg str job_id: The job ID.
+		"""
+		self.job_id = job_id
+
+	def set_pattern(self, pattern, regex=False, ignore_case=False):
+		"""
+		Set the pattern to search for.
+
+		:arg str pattern: The text to search for.
+		:arg bool regex: If true, the pattern is a regular
+			expression rather than plain text.
+		:arg bool ignore_case: If true, match regardless of case.
+		"""
+		self.params['pattern'] = pattern
+		self.params['regex'] = regex
+		self.params['ignore_case'] = ignore_case
+
+	def set_limits(self, max_matches, time_limit):
+		"""
+		Set the limits on the search. If not set, the server's
+		defaults apply.
+
+		:arg int max_matches: Stop after finding this many lines.
+		:arg float time_limit: Stop after searching for this many seconds.
+		"""
+		self.params['max_matches'] = max_matches
+		self.params['time_limit'] = time_limit
+
+	def build_payload(self):
+		return self.params
+
+	def get_endpoint(self):
+		return '/job/log/%s/search' % self.job_id
+
+	def send(self, callback=None, **kwargs):
+		"""
+		Send the request, as for ``APIRequest.send()``. Unless
+		you supply a ``request_timeout``, the request waits for
+		a little longer than the search's time limit.
+		"""
+		if not kwargs.has_key('request_timeout'):
+			time_limit = self.params.get('time_limit', paasmaker.util.logsearch.DEFAULT_TIME_LIMIT)
+			kwargs['request_timeout'] = time_limit + SEARCH_TIMEOUT_MARGIN
+		super(JobLogSearchAPIRequest, self).send(callback, **kwargs)
+
 class JobStreamAPIRequest(StreamAPIRequest):
 
 	def subscribe(self, job_id):
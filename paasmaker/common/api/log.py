@@ -7,6 +7,8 @@
 #
 
 import logging
+import base64
+import zlib
 
 import paasmaker
 from apirequest import APIRequest, StreamAPIRequest, APIResponse
@@ -17,7 +19,7 @@ logger.addHandler(logging.NullHandler())
 # Stream logs back to the client.
 class LogStreamAPIRequest(StreamAPIRequest):
 
-	def subscribe(self, job_id, position=0, unittest_force_remote=False):
+	def subscribe(self, job_id, position=0, unittest_force_remote=False, compress=False, line=None, timestamp=None):
 		"""
 		Subscribe to a remote log. The callback you set with ``set_lines_callback()``
 		will be called.
@@ -28,9 +30,25 @@ class LogStreamAPIRequest(StreamAPIRequest):
 		:arg int|None position: The log position to stream from, in bytes.
 		:arg bool unittest_force_remote: For internal testing use. Do not use
 			this.
+		:arg bool compress: If true, ask the remote end to compress
+			larger batches of lines. They are decompressed before
+			being passed to your lines callback.
+		:arg int|None line: If supplied, stream from this line number
+			instead of ``position``. Lines are numbered from zero, and
+			negative numbers count back from the end of the log.
+		:arg float|None timestamp: If supplied, stream from the first line
+			logged at or after this unix timestamp instead of ``position``.
 		"""
 		logging.debug("Subscribing to %s", job_id)
-		self.emit('log.subscribe', {'job_id': job_id, 'position': position, 'unittest_force_remote': unittest_force_remote})
+		arguments = {'job_id': job_id, 'position': position, 'unittest_force_remote': unittest_force_remote}
+		# These are only sent if needed, so this works with older servers.
+		if compress:
+			arguments['compress'] = True
+		if line is not None:
+			arguments['line'] = line
+		if timestamp is not None:
+			arguments['timestamp'] = timestamp
+		self.emit('log.subscribe', arguments)
 
 	def unsubscribe(self, job_id):
 		"""
@@ -49,7 +67,25 @@ class LogStreamAPIRequest(StreamAPIRequest):
 				print "\\n".join(lines)
 
 		"""
+		def compressed(job_id, data, position):
+			lines = zlib.decompress(base64.b64decode(data)).splitlines(True)
+			callback(job_id, lines, position)
+
 		self.on('log.lines', callback)
+		self.on('log.compressed', compressed)
+
+	def set_start_callback(self, callback):
+		"""
+		Set the callback called when the remote end starts streaming
+		a log, with the position in the log that it is streaming from.
+		This is sent before any lines, and again each time you
+		subscribe. The callback looks like this::
+
+			def started(job_id, position):
+				pass
+
+		"""
+		self.on('log.start', callback)
 
 	def set_cantfind_callback(self, callback):
 		"""
@@ -37,7 +37,6 @@ from sqlalchemy import func
 import sqlalchemy
 import colander
 from paasmaker.thirdparty.pika import TornadoConnection
-from paasmaker.thirdparty.tornadoredis import Client as TornadoRedisClient
 import pika
 import yaml
 
@@ -295,6 +294,24 @@ class HeartSchema(StrictAboutExtraKeysColanderMappingSchema):
 		default=False,
 		missing=False)
 
+	instance_log_segment_size = colander.SchemaNode(colander.Integer(),
+		title="Instance log segment size",
+		description="Once an instance's output log reaches this size, in bytes, it is rotated. Older segments are compressed. 0 means don't rotate by size.",
+		default=10485760,
+		missing=10485760)
+
+	instance_log_segment_age = colander.SchemaNode(colander.Integer(),
+		title="Instance log segment age",
+		description="An instance's output log is rotated once it has been written to for this long, in seconds. 0 means don't rotate by age.",
+		default=86400,
+		missing=86400)
+
+	instance_log_max_size = colander.SchemaNode(colander.Integer(),
+		title="Instance log disk budget",
+		description="The most disk space, in bytes, that an instance's output log and it's rotated segments can use. The oldest segments are removed to stay within this. 0 means no limit.",
+		default=104857600,
+		missing=104857600)
+
 	@staticmethod
 	def default():
 		return {'enabled': False}
@@ -411,11 +428,49 @@ class RouterSchema(StrictAboutExtraKeysColanderMappingSchema):
 			'nginx': NginxSchema.default()
 		}
 
+class RedisPoolSchema(StrictAboutExtraKeysColanderMappingSchema):
+	size = colander.SchemaNode(colander.Integer(),
+		title="Connections per Redis",
+		description="The most connections this node opens to each of the table, stats and jobs Redis instances. The connections are shared by everything on the node that uses that instance.",
+		missing=4,
+		default=4)
+	health_check_interval = colander.SchemaNode(colander.Integer(),
+		title="Health check interval",
+		description="How often, in seconds, idle Redis connections are checked. Connections that don't respond are closed. 0 disables checks.",
+		missing=30,
+		default=30)
+	connect_timeout = colander.SchemaNode(colander.Float(),
+		title="Connect timeout",
+		description="How long, in seconds, to wait for a connection to Redis, or for a reply to a health check.",
+		missing=5.0,
+		default=5.0)
+	backoff_min = colander.SchemaNode(colander.Float(),
+		title="Minimum reconnect delay",
+		description="After failing to connect to Redis, don't try again for this many seconds. The delay doubles with each failure.",
+		missing=0.5,
+		default=0.5)
+	backoff_max = colander.SchemaNode(colander.Float(),
+		title="Maximum reconnect delay",
+		description="The longest delay, in seconds, between attempts to connect to Redis.",
+		missing=30.0,
+		default=30.0)
+
+	@staticmethod
+	def default():
+		return {
+			'size': 4,
+			'health_check_interval': 30,
+			'connect_timeout': 5.0,
+			'backoff_min': 0.5,
+			'backoff_max': 30.0
+		}
+
 class RedisSchema(StrictAboutExtraKeysColanderMappingSchema):
 	table = RedisConnectionSchema(default=RedisConnectionSchema.default_router_table(), missing=RedisConnectionSchema.default_router_table())
 	stats = RedisConnectionSchema(default=RedisConnectionSchema.default_router_stats(), missing=RedisConnectionSchema.default_router_stats())
 	slaveof = RedisConnectionSlaveSchema(default=RedisConnectionSlaveSchema.default(), missing=RedisConnectionSlaveSchema.default())
 	jobs = RedisConnectionSchema(default=RedisConnectionSchema.default_jobs(), missing=RedisConnectionSchema.default_jobs())
+	pool = RedisPoolSchema(default=RedisPoolSchema.default(), missing=RedisPoolSchema.default())
 
 	@staticmethod
 	def default():
@@ -423,7 +478,8 @@ class RedisSchema(StrictAboutExtraKeysColanderMappingSchema):
 			'table': RedisConnectionSchema.default_router_table(),
 			'stats': RedisConnectionSchema.default_router_stats(),
 			'slaveof': RedisConnectionSlaveSchema.default(),
-			'jobs': RedisConnectionSchema.default_jobs()
+			'jobs': RedisConnectionSchema.default_jobs(),
+			'pool': RedisPoolSchema.default()
 		}
 
 class MiscPortsSchema(StrictAboutExtraKeysColanderMappingSchema):
@@ -456,6 +512,89 @@ class MasterSchema(StrictAboutExtraKeysColanderMappingSchema):
 	def default():
 		return {'host': 'localhost', 'port': DEFAULT_API_PORT, 'isitme': False}
 
+class JobLimitsSchema(StrictAboutExtraKeysColanderMappingSchema):
+	max_running = colander.SchemaNode(colander.Integer(),
+		title="Maximum running jobs",
+		description="The maximum number of jobs that this node will run at once. Jobs that are ready to run above this limit wait until other jobs finish. Every running job counts, so a job that stays running until jobs it starts on this node have finished can block them, if there are no slots left; the built in jobs don't do this, as container and coordinate jobs add their subtrees and finish straight away. 0 means no limit.",
+		missing=0,
+		default=0)
+
+	reserved = colander.SchemaNode(colander.Integer(),
+		title="Reserved for priority jobs",
+		description="The number of the max_running slots that can only be used by jobs with a priority above zero. This keeps a lane open for jobs such as health checks when the node is busy. Jobs with a priority take a reserved slot while one is free, and only then one of the other slots, so they don't use up the slots other jobs can run in. Only applies if max_running is set, and must be less than max_running.",
+		missing=0,
+		default=0)
+
+	plugins = colander.SchemaNode(colander.Mapping(unknown='preserve'),
+		title="Per plugin limits",
+		description="A map of job plugin names to the maximum number of jobs using that plugin that this node will run at once.",
+		missing={},
+		default={})
+
+	priorities = colander.SchemaNode(colander.Mapping(unknown='preserve'),
+		title="Job priorities",
+		description="A map of job plugin names to priorities. When the node is busy, jobs with a higher priority start first. Jobs not listed have a priority of 0. Jobs with the same priority start in the order that they were added.",
+		missing=None,
+		default=None)
+
+	@staticmethod
+	def default_priorities():
+		return {
+			'paasmaker.job.cron': 10,
+			'paasmaker.job.health.root': 10,
+			'paasmaker.job.health.check': 10
+		}
+
+	@staticmethod
+	def default():
+		return {
+			'max_running': 0,
+			'reserved': 0,
+			'plugins': {},
+			'priorities': JobLimitsSchema.default_priorities()
+		}
+
+class JobLogsSchema(StrictAboutExtraKeysColanderMappingSchema):
+	max_open_files = colander.SchemaNode(colander.Integer(),
+		title="Maximum open job log files",
+		description="The maximum number of job log files that this node keeps open for writing at once. When more jobs are logging, the least recently written files are closed and reopened as needed. 0 means no limit.",
+		missing=128,
+		default=128)
+
+	flush_interval = colander.SchemaNode(colander.Integer(),
+		title="Job log flush interval",
+		description="How long, in milliseconds, job log entries are buffered before they are written to disk. Live log viewers see new entries after at most this long. 0 writes every entry immediately.",
+		missing=100,
+		default=100)
+
+	index_interval = colander.SchemaNode(colander.Integer(),
+		title="Job log index interval",
+		description="Job logs are indexed so that a line number or time can be found quickly. An index entry is recorded about every this many bytes of log. Smaller values make lookups faster but the indexes larger.",
+		missing=65536,
+		default=65536)
+
+	location_cache_size = colander.SchemaNode(colander.Integer(),
+		title="Job log location cache size",
+		description="On pacemakers, the number of jobs to remember the node of, so that their logs can be found without querying the database.",
+		missing=10000,
+		default=10000)
+
+	location_cache_ttl = colander.SchemaNode(colander.Integer(),
+		title="Job log node cache time",
+		description="On pacemakers, how long, in seconds, to remember the details and state of nodes that hold job logs. Changes to nodes made by this pacemaker are seen straight away; changes made by other pacemakers are seen after at most this long.",
+		missing=30,
+		default=30)
+
+	@staticmethod
+	def default():
+		return {
+			'max_open_files': 128,
+			'flush_interval': 100,
+			'index_interval': 65536,
+			'location_cache_size': 10000,
+			'location_cache_ttl': 30
+		}
+
 class ConfigurationSchema(StrictAboutExtraKeysColanderMappingSchema):
 	http_port = colander.SchemaNode(colander.Integer(),
 		title="HTTP Port",
@@ -568,6 +707,20 @@ class ConfigurationSchema(StrictAboutExtraKeysColanderMappingSchema):
 		missing=5000
 	)
 
+	job_limits = JobLimitsSchema(
+		title="Job concurrency limits",
+		description="Limits on how many jobs this node runs at once, and the order in which waiting jobs start when it is busy.",
+		default=JobLimitsSchema.default(),
+		missing=JobLimitsSchema.default()
+	)
+
+	job_logs = JobLogsSchema(
+		title="Job log files",
+		description="Options for how job log files are written.",
+		default=JobLogsSchema.default(),
+		missing=JobLogsSchema.default()
+	)
+
 	pacemaker = PacemakerSchema(
 		title="Pacemaker configuration",
 		description="The configuration options for the Pacemaker, if enabled.",
@@ -763,6 +916,13 @@ class Configuration(paasmaker.util.configurationhelper.ConfigurationHelper):
 		self.database_sessions_checkout_pending = 0
 
 		self.redis_scripts = {}
+		# Redis role name -> RedisPool. See _connect_redis().
+		self.redis_pools = {}
+
+		# Job ID -> node UUID, and node UUID -> (expiry time, Node),
+		# to find logs without the database. See locate_log().
+		self.log_locations = None
+		self.log_nodes = {}
 
 		# Debug flag handling.
 		self.debug = debug
@@ -803,6 +963,17 @@ class Configuration(paasmaker.util.configurationhelper.ConfigurationHelper):
 			if not 'keyfile' in self['ssl_options'] or not 'certfile' in self['ssl_options']:
 				raise InvalidConfigurationParameterException('keyfile and certfile must both be set if you enable listening on an SSL port. Set them inside the ``ssl_options`` mapping.')
 
+		# Fill in the default job priorities, unless they were supplied.
+		if self['job_limits']['priorities'] is None:
+			self['job_limits']['priorities'] = JobLimitsSchema.default_priorities()
+		for section in ['plugins', 'priorities']:
+			for plugin, value in self['job_limits'][section].iteritems():
+				if not isinstance(value, int):
+					raise InvalidConfigurationParameterException("Job limit %s for plugin %s must be an integer." % (section, plugin))
+		# Otherwise jobs without a priority could never start.
+		if self['job_limits']['max_running'] > 0 and self['job_limits']['reserved'] >= self['job_limits']['max_running']:
+			raise InvalidConfigurationParameterException("Job limit reserved must be less than max_running.")
+
 		# Convert the scratch directory into a fully qualified path.
 		self['scratch_directory'] = os.path.abspath(self['scratch_directory'])
 
@@ -1271,32 +1442,53 @@ class Configuration(paasmaker.util.configurationhelper.ConfigurationHelper):
 		fetcher = ThreadedDatabaseSessionFetcher(self.io_loop, real_callback, error_callback)
 		fetcher.work(self.session)
 
-	def _connect_redis(self, credentials, callback, error_callback):
+	def _connect_redis(self, name, credentials, callback, error_callback, dedicated=False):
 		"""
-		Internal function to connect to the given redis server, calling
+		Internal function to get a client for the given redis server, calling
 		the callback when it's ready with the client object.
 
+		Clients come from a pool for each role (``table``, ``stats``
+		or ``jobs``), and are shared with the rest of this node; see
+		``paasmaker.util.redispool.RedisPool``. So you must not disconnect
+		them, or subscribe with them. If you need to, ask for a
+		dedicated client instead, which you must disconnect when done.
+
 		You should not call this externally.
 
+		:arg str name: The role of the redis server.
 		:arg dict credentials: A dict containing three keys, ``host``,
 			``port``, and ``password``.
 		:arg callable callback: The callback to call when completed. The
 			callback is passed the client object, an instance of
 			``tornadoredis.Client``.
 		:arg callable error_callback: A callback called if an error occurs.
-		"""
-		client = TornadoRedisClient(
-			host=credentials['host'],
-			port=credentials['port'],
-			password=credentials['password'],
-			io_loop=self.io_loop
-		)
-		client.connect()
+		:arg bool dedicated: If true, return a new client that is not
+			shared with anything else.
+		"""
+		pool = self.redis_pools.get(name)
+		if pool is None or pool.host != credentials['host'] or pool.port != credentials['port']:
+			if pool is not None:
+				pool.close()
+			options = self['redis']['pool']
+			pool = paasmaker.util.redispool.RedisPool(
+				self.io_loop,
+				credentials['host'],
+				credentials['port'],
+				password=credentials['password'],
+				size=options['size'],
+				health_check_interval=options['health_check_interval'],
+				connect_timeout=options['connect_timeout'],
+				backoff_min=options['backoff_min'],
+				backoff_max=options['backoff_max']
+			)
+			self.redis_pools[name] = pool
 
-		# TODO: Handle where it failed.
-		callback(client)
+		if dedicated:
+			pool.dedicated(callback, error_callback)
+		else:
+			pool.get(callback, error_callback)
 
-	def _get_redis(self, name, credentials, callback, error_callback):
+	def _get_redis(self, name, credentials, callback, error_callback, dedicated=False):
 		"""
 		Internal helper to get a redis connection.
 		* Not a managed redis? Proceed to fetching a connection.
@@ -1308,7 +1500,7 @@ class Configuration(paasmaker.util.configurationhelper.ConfigurationHelper):
 		"""
 		if not credentials['managed']:
 			# It's not managed. Just attempt to connect to it.
-			self._connect_redis(credentials, callback, error_callback)
+			self._connect_redis(name, credentials, callback, error_callback, dedicated)
 		else:
 			# It's managed. Check it's state.
 			meta_key = "%s_%d" % (credentials['host'], credentials['port'])
@@ -1330,7 +1522,7 @@ class Configuration(paasmaker.util.configurationhelper.ConfigurationHelper):
 
 				# Play back all our callbacks.
 				for queued in meta['queue']:
-					self._connect_redis(queued[0], queued[1], queued[2])
+					self._connect_redis(name, *queued)
 
 				# Is this a router table, that's a slave of another?
 				if name == 'table':
@@ -1356,7 +1548,7 @@ class Configuration(paasmaker.util.configurationhelper.ConfigurationHelper):
 								logger.error("Exception:", exc_info=exception)
 
 						# It's a slave. Make it so.
-						self._connect_redis(credentials, got_redis, failed_redis)
+						self._connect_redis(name, credentials, got_redis, failed_redis)
 
 			def on_redis_startup_failure(message, exception=None):
 				error_message = "Failed to start managed redis for %s: %s" % (name, message)
@@ -1370,7 +1562,7 @@ class Configuration(paasmaker.util.configurationhelper.ConfigurationHelper):
 				# This is the first attempt to access it.
 				# Start up the service.
 				meta['state'] = 'STARTING'
-				meta['queue'].append((credentials, callback, error_callback))
+				meta['queue'].append((credentials, callback, error_callback, dedicated))
 
 				def redis_configured(message):
 					logger.debug("Starting redis for %s", name)
@@ -1398,43 +1590,58 @@ class Configuration(paasmaker.util.configurationhelper.ConfigurationHelper):
 
 			elif meta['state'] == 'STARTING':
 				# Queue up our callbacks.
-				meta['queue'].append((credentials, callback, error_callback))
+				meta['queue'].append((credentials, callback, error_callback, dedicated))
 			else:
 				# Must be started. Just connect.
 				if not meta['manager'].is_running():
 					meta['state'] = 'CREATE'
 					# Call this function again to go through.
-					self._get_redis(name, credentials, callback, error_callback)
+					self._get_redis(name, credentials, callback, error_callback, dedicated)
 				else:
-					self._connect_redis(credentials, callback, error_callback)
+					self._connect_redis(name, credentials, callback, error_callback, dedicated)
 
-	def get_router_table_redis(self, callback, error_callback):
+	def get_router_table_redis(self, callback, error_callback, dedicated=False):
 		"""
 		Get a redis client pointing to the router table Redis instance.
 
 		On router nodes, this will return a connection to the slave
 		redis. On pacemaker nodes, this will instead be the master.
 		This is dependant on the server configuration.
+
+		The client is shared with the rest of this node, so don't
+		disconnect it or subscribe with it. Pass ``dedicated=True``
+		to get a client of your own, which you must disconnect when
+		you're done with it.
 		"""
-		self._get_redis('table', self['redis']['table'], callback, error_callback)
+		self._get_redis('table', self['redis']['table'], callback, error_callback, dedicated)
 
-	def get_stats_redis(self, callback, error_callback):
+	def get_stats_redis(self, callback, error_callback, dedicated=False):
 		"""
 		Get a redis client pointing to the stats Redis instance.
 
 		For multi node setups, this will generally point to the same
 		instance of Redis, on a single host.
+
+		The client is shared with the rest of this node, so don't
+		disconnect it or subscribe with it. Pass ``dedicated=True``
+		to get a client of your own, which you must disconnect when
+		you're done with it.
 		"""
-		self._get_redis('stats', self['redis']['stats'], callback, error_callback)
+		self._get_redis('stats', self['redis']['stats'], callback, error_callback, dedicated)
 
-	def get_jobs_redis(self, callback, error_callback):
+	def get_jobs_redis(self, callback, error_callback, dedicated=False):
 		"""
 		Get a redis client pointing to the jobs Redis instance.
 
 		For multi node setups, this will generally point to the same
 		instance of Redis, on a single host.
+
+		The client is shared with the rest of this node, so don't
+		disconnect it or subscribe with it. Pass ``dedicated=True``
+		to get a client of your own, which you must disconnect when
+		you're done with it.
 		"""
-		self._get_redis('jobs', self['redis']['jobs'], callback, error_callback)
+		self._get_redis('jobs', self['redis']['jobs'], callback, error_callback, dedicated)
 
 	def shutdown_managed_redis(self, callback, error_callback):
 		"""
@@ -1442,8 +1649,12 @@ class Configuration(paasmaker.util.configurationhelper.ConfigurationHelper):
 		configured to shutdown on exit.
 
 		This has no action if no Redis instances have been configured
-		to shutdown on exit.
+		to shutdown on exit. Pooled Redis connections are closed
+		regardless.
 		"""
+		for pool in self.redis_pools.values():
+			pool.close()
+
 		if hasattr(self, 'redis_meta'):
 			iterator = self.redis_meta.iteritems()
 
@@ -1598,7 +1809,9 @@ class Configuration(paasmaker.util.configurationhelper.ConfigurationHelper):
 			the file exists before returning. This works
 			around some issues in unit tests, but should be
 			set to false if determining the existence of log
-			files.
+			files, or reading them. If the log has been
+			compressed, it's left alone; read it with
+			``paasmaker.util.compressedlog.open_log()``.
 		"""
 		# TODO: Make this safer, but maintain the job id's relating to their on disk
 		# filenames.
@@ -1616,7 +1829,7 @@ class Configuration(paasmaker.util.configurationhelper.ConfigurationHelper):
 		# trying to watch the file before anything's been written to it
 		# (shouldn't be an issue for production, but causes issues in
 		# unit tests with weird global log levels.)
-		if not os.path.exists(path) and create_if_missing:
+		if not paasmaker.util.compressedlog.log_exists(path) and create_if_missing:
 			fp = open(path, 'a')
 			fp.close()
 		return path
@@ -1627,8 +1840,9 @@ class Configuration(paasmaker.util.configurationhelper.ConfigurationHelper):
 
 		:arg str job_id: The job ID to dump.
 		"""
-		path = self.get_job_log_path(job_id)
-		fp = open(path, 'r')
+		path = self.get_job_log_path(job_id, create_if_missing=False)
+		pub.sendMessage('job.flush', job_id=job_id)
+		fp = paasmaker.util.compressedlog.open_log(path)
 		print fp.read()
 		fp.close()
 	def get_job_message_pub_topic(self, job_id):
@@ -1659,13 +1873,13 @@ class Configuration(paasmaker.util.configurationhelper.ConfigurationHelper):
 		:arg str job_id: The job ID to check for.
 		"""
 		path = self.get_job_log_path(job_id, create_if_missing=False)
-		return os.path.exists(path)
+		return paasmaker.util.compressedlog.log_exists(path)
 	def setup_job_watcher(self):
 		"""
 		Set up the job log watcher helper class.
 		"""
 		if not self.job_watcher:
-			self.job_watcher = paasmaker.util.joblogging.JobWatcher(self)
+			self.job_watcher = paasmaker.util.joblogging.JobWatcher.create(self)
 	def get_job_watcher(self):
 		"""
 		Get the job watcher instance.
@@ -1713,6 +1927,10 @@ class Configuration(paasmaker.util.configurationhelper.ConfigurationHelper):
 		  access to the database). The session attached to it will be closed,
 		  so you won't be able to follow references.
 
+		Which node has a log is cached, along with the node's details for
+		a short time (``job_logs.location_cache_ttl``), so most lookups
+		don't need a database session.
+
 		:arg str job_id: The job ID to search for (which could also be
 			an instance ID or node UUID).
 		:arg callable callback: The callback to call when the job is found.
@@ -1722,7 +1940,7 @@ class Configuration(paasmaker.util.configurationhelper.ConfigurationHelper):
 		# Try the easy case - does the log exist here?
 		if self.job_exists_locally(job_id) and not unittest_force_remote:
 			# Yep. Done.
-			callback(job_id, self.get_job_log_path(job_id))
+			callback(job_id, self.get_job_log_path(job_id, create_if_missing=False))
 			return
 
 		if not self.job_exists_locally(job_id) and not self.is_pacemaker():
@@ -1731,14 +1949,38 @@ class Configuration(paasmaker.util.configurationhelper.ConfigurationHelper):
 			# it does exist, in the expectation that it'll come through shortly.
 			# We assume you only got here if you're a pacemaker which should
 			# limit the number of invalid job requests.
-			callback(job_id, self.get_job_log_path(job_id))
+			callback(job_id, self.get_job_log_path(job_id, create_if_missing=False))
 			return
 
+		# Do we already know where it is?
+		if self.log_locations is None:
+			self.log_locations = paasmaker.util.LRUCache(self['job_logs']['location_cache_size'])
+		node_uuid = self.log_locations.get(job_id)
+		if node_uuid is not None and self.log_nodes.has_key(node_uuid):
+			expires, node = self.log_nodes[node_uuid]
+			if expires > time.time():
+				self._check_log_node(job_id, node, callback, error_callback)
+				return
+
 		def got_database_session(session):
+			def check_node(node):
+				# Helper function to check the given node and return.
+				session.close()
+				if node is not None:
+					self.remember_log_location(job_id, node.uuid, node)
+				self._check_log_node(job_id, node, callback, error_callback)
+
+			if node_uuid is not None:
+				# We know which node, but not it's current state.
+				node = session.query(
+					paasmaker.model.Node
+				).filter(
+					paasmaker.model.Node.uuid == node_uuid
+				).first()
+				check_node(node)
+				return
+
 			# Now move onto the synchronous tests.
-			# TODO: This queries the DB twice for each lookup, which
-			# can be expensive. Having said that, tailing a log isn't something
-			# that's done that often. Discuss.
 			# Is the job_id an instance log?
 			instance = session.query(
 				paasmaker.model.ApplicationInstance
@@ -1746,17 +1988,6 @@ class Configuration(paasmaker.util.configurationhelper.ConfigurationHelper):
 				paasmaker.model.ApplicationInstance.instance_id == job_id
 			).first()
 
-			def check_node(node):
-				# Helper function to check the given node and return.
-				session.close()
-				if node is None:
-					error_callback(job_id, "Can't find a node with this job on it.")
-					return
-				elif node.state == constants.NODE.ACTIVE:
-					callback(job_id, node)
-				else:
-					error_callback(job_id, "Node %s has the log file, but that node is down." % node.name)
-
 			if instance is not None:
 				# It's on the given remote node.
 				# If the node is working...
@@ -1779,6 +2010,7 @@ class Configuration(paasmaker.util.configurationhelper.ConfigurationHelper):
 			def on_got_job(data):
 				logger.debug("Got job metata for %s", job_id)
 				if not data.has_key(job_id):
+					session.close()
 					error_callback(job_id, "No such job %s." % job_id)
 				else:
 					# Locate the node that it's on.
@@ -1797,6 +2029,49 @@ class Configuration(paasmaker.util.configurationhelper.ConfigurationHelper):
 
 		self.get_database_session(got_database_session, error_callback)
 
+	def _check_log_node(self, job_id, node, callback, error_callback):
+		# Helper for locate_log(), to check that the node with
+		# the log is up before handing it back.
+		if node is None:
+			error_callback(job_id, "Can't find a node with this job on it.")
+		elif node.state == constants.NODE.ACTIVE:
+			callback(job_id, node)
+		else:
+			error_callback(job_id, "Node %s has the log file, but that node is down." % node.name)
+
+	def remember_log_location(self, job_id, node_uuid, node=None):
+		"""
+		Record which node has the log for the given job, so that
+		``locate_log()`` doesn't need to look it up. Jobs and instances
+		never move between nodes, so this doesn't expire; only the
+		node's details do.
+
+		:arg str job_id: The job ID (or instance ID).
+		:arg str node_uuid: The UUID of the node that has the log.
+		:arg Node|None node: The node, if you have it. It should be
+			detached from it's session.
+		"""
+		if self.log_locations is None:
+			self.log_locations = paasmaker.util.LRUCache(self['job_logs']['location_cache_size'])
+		self.log_locations[job_id] = node_uuid
+		if node is not None:
+			expires = time.time() + self['job_logs']['location_cache_ttl']
+			self.log_nodes[node_uuid] = (expires, node)
+
+	def forget_log_nodes(self, node_uuid=None):
+		"""
+		Forget the cached details of the given node, or all nodes,
+		so that ``locate_log()`` sees any changes to them. Call this
+		when changing nodes.
+
+		:arg str|None node_uuid: The UUID of the node, or None for
+			all nodes.
+		"""
+		if node_uuid is None:
+			self.log_nodes.clear()
+		elif self.log_nodes.has_key(node_uuid):
+			del self.log_nodes[node_uuid]
+
 	#
 	# IDENTITY HELPERS
 	#
@@ -1927,6 +2202,20 @@ master:
 		except InvalidConfigurationFormatException, ex:
 			self.assertTrue(True, "Configuration did not pass the schema or was invalid.")
 
+	def test_job_limits(self):
+		open(self.tempnam, 'w').write(self.minimum_config + "job_limits:\n  max_running: 1\n  reserved: 1\n")
+		config = Configuration()
+		try:
+			config.load_from_file([self.tempnam])
+			self.assertTrue(False, "Configuration reserved every running slot, but was considered valid.")
+		except InvalidConfigurationParameterException, ex:
+			self.assertTrue(True, "Configuration was rejected.")
+
+		open(self.tempnam, 'w').write(self.minimum_config + "job_limits:\n  max_running: 1\n")
+		config = Configuration()
+		config.load_from_file([self.tempnam])
+		self.assertEqual(config['job_limits']['reserved'], 0, "Slots were reserved by default.")
+
 	def test_simple_default(self):
 		open(self.tempnam, 'w').write(self.minimum_config)
 		config = Configuration()
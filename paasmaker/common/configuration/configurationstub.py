@@ -202,6 +202,11 @@ router:
         # This doesn't stop all leaks, but certainly helps.
         pub.unsubAll()
 
+        # Stop watching job logs, freeing the watcher's resources.
+        if self.job_watcher:
+          self.job_watcher.close()
+          self.job_watcher = None
+
         def finished_shutdown(message):
           # Remove files that we created.
           shutil.rmtree(self.params['scratch_dir'])
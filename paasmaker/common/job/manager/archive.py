@@ -0,0 +1,473 @@
+#
+# Paasmaker - Platform as a Service
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+
+import os
+import json
+import zlib
+import glob
+import time
+import sqlite3
+import logging
+import threading
+import functools
+import Queue
+import tempfile
+import shutil
+import unittest
+
+import paasmaker
+import tornado.stack_context
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Start a new segment file once the current one reaches this size.
+SEGMENT_SIZE = 16 * 1024 * 1024 # 16MB.
+# The number of decoded trees to keep in memory.
+ARCHIVE_CACHE_SIZE = 50
+
+class JobArchive(object):
+	"""
+	An on disk archive of finished job trees. This is where the Redis
+	job backend moves old jobs to, to keep the jobs Redis small.
+
+	Each tree is stored as a single zlib compressed JSON record,
+	appended to a segment file. Segment files are never rewritten;
+	once the current segment gets too large, a new one is started.
+	A SQLite index maps job IDs and root IDs to the location of their
+	record, and also holds the time of each tree. This means
+	that any archived job can be fetched by reading just the one record
+	it's in, and no files are scanned to answer queries.
+
+	When a tree is deleted, it's removed from the index. Once no trees
+	refer to a segment, the segment file is removed. As trees are
+	generally deleted oldest first, segments empty out in order.
+
+	The methods here block on disk, so on the IO loop, call them
+	with a ``JobArchiveWorker`` instead, which also makes sure that only
+	one thread uses the archive at a time.
+
+	Layout in the archive directory::
+
+		index.db            SQLite index.
+		segment-000001.dat  Compressed records.
+
+	:arg str path: The directory to store the archive in.
+	:arg int segment_size: The size at which to start a new segment.
+	"""
+
+	def __init__(self, path, segment_size=SEGMENT_SIZE):
+		self.path = path
+		self.segment_size = segment_size
+		self.cache = paasmaker.util.LRUCache(ARCHIVE_CACHE_SIZE)
+
+		self.lock = threading.Lock()
+		# The index is used from the JobArchiveWorker's thread.
+		self.db = sqlite3.connect(os.path.join(self.path, 'index.db'), check_same_thread=False)
+		self.db.executescript("""
+			CREATE TABLE IF NOT EXISTS trees (
+				root_id TEXT PRIMARY KEY,
+				segment INTEGER NOT NULL,
+				offset INTEGER NOT NULL,
+				length INTEGER NOT NULL,
+				time REAL NOT NULL
+			);
+			CREATE INDEX IF NOT EXISTS trees_time ON trees (time);
+			CREATE INDEX IF NOT EXISTS trees_segment ON trees (segment);
+			CREATE TABLE IF NOT EXISTS jobs (
+				job_id TEXT PRIMARY KEY,
+				root_id TEXT NOT NULL
+			);
+			CREATE INDEX IF NOT EXISTS jobs_root ON jobs (root_id);
+		""")
+		self.db.commit()
+
+		self.current_segment = self._find_current_segment()
+
+	def close(self):
+		"""
+		Close the index. The archive can't be used after this.
+		"""
+		self.db.close()
+
+	def _segment_path(self, segment):
+		return os.path.join(self.path, "segment-%06d.dat" % segment)
+
+	def _find_current_segment(self):
+		segments = glob.glob(os.path.join(self.path, "segment-*.dat"))
+		numbers = [int(os.path.basename(s)[8:-4]) for s in segments]
+		if len(numbers) == 0:
+			return 1
+		return max(numbers)
+
+	def store(self, root_id, tree, jobs, timestamp=None):
+		"""
+		Archive a whole job tree. If the tree is already archived,
+		it's replaced.
+
+		:arg str root_id: The root job ID of the tree.
+		:arg list tree: The list of job IDs in the tree, as
+			returned by ``get_tree()``.
+		:arg dict jobs: The job data, keyed by job ID, as returned
+			by ``get_jobs()``.
+		:arg float|None timestamp: The time of the root job. Defaults
+			to now.
+		"""
+		if timestamp is None:
+			timestamp = time.time()
+
+		record = zlib.compress(json.dumps({
+			'root_id': root_id,
+			'tree': list(tree),
+			'jobs': jobs
+		}))
+
+		segment_path = self._segment_path(self.current_segment)
+		if os.path.exists(segment_path) and os.path.getsize(segment_path) >= self.segment_size:
+			self.current_segment += 1
+			segment_path = self._segment_path(self.current_segment)
+
+		segment_fp = open(segment_path, 'ab')
+		# In append mode, the position is only defined after seeking to the end.
+		segment_fp.seek(0, os.SEEK_END)
+		offset = segment_fp.tell()
+		segment_fp.write(record)
+		segment_fp.close()
+
+		self._remove_from_index(root_id)
+		self.db.execute(
+			"INSERT INTO trees (root_id, segment, offset, length, time) VALUES (?, ?, ?, ?, ?)",
+			(root_id, self.current_segment, offset, len(record), timestamp)
+		)
+		self.db.executemany(
+			"INSERT OR REPLACE INTO jobs (job_id, root_id) VALUES (?, ?)",
+			[(job_id, root_id) for job_id in set(tree) | set([root_id])]
+		)
+		self.db.commit()
+
+		if root_id in self.cache:
+			del self.cache[root_id]
+
+	def _remove_from_index(self, root_id):
+		self.db.execute("DELETE FROM trees WHERE root_id = ?", (root_id,))
+		self.db.execute("DELETE FROM jobs WHERE root_id = ?", (root_id,))
+
+	def _read(self, root_id):
+		cached = self.cache.get(root_id)
+		if cached is not None:
+			return cached
+
+		row = self.db.execute(
+			"SELECT segment, offset, length FROM trees WHERE root_id = ?",
+			(root_id,)
+		).fetchone()
+
+		if row is None:
+			return None
+
+		segment, offset, length = row
+		segment_fp = open(self._segment_path(segment), 'rb')
+		segment_fp.seek(offset)
+		raw = segment_fp.read(length)
+		segment_fp.close()
+
+		record = json.loads(zlib.decompress(raw))
+		self.cache[root_id] = record
+		return record
+
+	def get_root(self, job_id):
+		"""
+		Return the root job ID for the given archived job,
+		or None if the job is not archived.
+		"""
+		row = self.db.execute(
+			"SELECT root_id FROM jobs WHERE job_id = ?",
+			(job_id,)
+		).fetchone()
+
+		if row is None:
+			return None
+		return str(row[0])
+
+	def has_tree(self, job_id):
+		"""
+		Check to see if the tree containing the given job is archived.
+		"""
+		return self.get_root(job_id) is not None
+
+	def get_tree(self, job_id):
+		"""
+		Return the list of job IDs in the tree that contains
+		the given job, or None if it's not archived.
+		"""
+		root_id = self.get_root(job_id)
+		if root_id is None:
+			return None
+		return self._read(root_id)['tree']
+
+	def get_tree_jobs(self, job_id):
+		"""
+		Return a dict of all the jobs in the tree that
+		contains the given job, or None if it's not archived.
+		"""
+		root_id = self.get_root(job_id)
+		if root_id is None:
+			return None
+		return self._read(root_id)['jobs']
+
+	def get_jobs(self, job_ids):
+		"""
+		Return a dict of the data for the given jobs, keyed by job
+		ID. Jobs that are not archived are not included. Each tree
+		involved is only read once.
+		"""
+		output = {}
+		roots = {}
+		for job_id in job_ids:
+			root_id = self.get_root(job_id)
+			if root_id is not None:
+				roots.setdefault(root_id, []).append(job_id)
+
+		for root_id, members in roots.iteritems():
+			record = self._read(root_id)
+			for job_id in members:
+				if record['jobs'].has_key(job_id):
+					output[job_id] = record['jobs'][job_id]
+
+		return output
+
+	def find_older_than(self, age, limit=None):
+		"""
+		Return a list of (root_id, time) tuples for archived trees
+		older than the given timestamp, oldest first.
+		"""
+		query = "SELECT root_id, time FROM trees WHERE time <= ? ORDER BY time ASC"
+		args = [age]
+		if limit is not None:
+			query += " LIMIT ?"
+			args.append(limit)
+
+		return [(str(row[0]), row[1]) for row in self.db.execute(query, args)]
+
+	def delete(self, job_id):
+		"""
+		Remove the tree containing the given job from the archive.
+		Segment files are removed once they no longer contain
+		any trees.
+		"""
+		root_id = self.get_root(job_id)
+		if root_id is None:
+			return
+
+		row = self.db.execute(
+			"SELECT segment FROM trees WHERE root_id = ?",
+			(root_id,)
+		).fetchone()
+
+		self._remove_from_index(root_id)
+		self.db.commit()
+		if root_id in self.cache:
+			del self.cache[root_id]
+
+		if row is not None:
+			segment = row[0]
+			remaining = self.db.execute(
+				"SELECT COUNT(*) FROM trees WHERE segment = ?",
+				(segment,)
+			).fetchone()[0]
+
+			if remaining == 0 and segment != self.current_segment:
+				logger.debug("Removing empty job archive segment %d.", segment)
+				os.unlink(self._segment_path(segment))
+
+	def import_legacy(self, limit=None):
+		"""
+		Import trees stored in the older archive format, which was
+		a pair of JSON files per tree, and remove those files.
+		Tags for those trees remain in Redis. Returns the number
+		of trees imported.
+
+		:arg int|None limit: The most trees to import in this call.
+			Call again to import the rest.
+		"""
+		imported = 0
+		for list_path in glob.glob(os.path.join(self.path, "*_list.json")):
+			if limit is not None and imported >= limit:
+				break
+
+			root_id = os.path.basename(list_path)[:-len("_list.json")]
+			tree_path = os.path.join(self.path, "%s.json" % root_id)
+			if not os.path.exists(tree_path):
+				continue
+
+			list_fp = open(list_path, 'r')
+			tree = json.loads(list_fp.read())
+			list_fp.close()
+			tree_fp = open(tree_path, 'r')
+			jobs = json.loads(tree_fp.read())
+			tree_fp.close()
+
+			self.store(root_id, tree, jobs, timestamp=os.path.getmtime(tree_path))
+			os.unlink(list_path)
+			os.unlink(tree_path)
+			imported += 1
+
+		if imported > 0:
+			logger.info("Imported %d jobs from the old archive format.", imported)
+
+		return imported
+
+class JobArchiveWorker(object):
+	"""
+	Call methods of a ``JobArchive`` on a single long lived thread,
+	one at a time, in the order they were requested. The callbacks
+	are called on the IO loop.
+
+	:arg IOLoop io_loop: The IO loop to call the callbacks on.
+	:arg JobArchive archive: The archive to use.
+	"""
+	def __init__(self, io_loop, archive):
+		self.io_loop = io_loop
+		self.archive = archive
+		self.queue = Queue.Queue()
+		self.thread = threading.Thread(target=self._run, name='JobArchiveWorker')
+		self.thread.daemon = True
+		self.thread.start()
+
+	def call(self, method, args, callback, error_callback):
+		"""
+		Queue up a call to the given method. The callback is called
+		with the method's return value. If the method raises an
+		exception, the error callback is called instead.
+
+		:arg str method: The name of the method to call.
+		:arg list args: The arguments for the method.
+		:arg callable callback: The callback for the result.
+		:arg callable error_callback: The error callback, with the
+			signature (message, exception).
+		"""
+		self.queue.put(
+			(
+				method,
+				args,
+				tornado.stack_context.wrap(callback),
+				tornado.stack_context.wrap(error_callback)
+			)
+		)
+
+	def stop(self):
+		"""
+		Stop the worker thread, once the calls already queued
+		have finished.
+		"""
+		self.queue.put(None)
+
+	def _run(self):
+		while True:
+			item = self.queue.get()
+			if item is None:
+				return
+
+			method, args, callback, error_callback = item
+			self.archive.lock.acquire()
+			try:
+				result = getattr(self.archive, method)(*args)
+				outcome = functools.partial(callback, result)
+			except Exception, ex:
+				outcome = functools.partial(error_callback, str(ex), ex)
+			finally:
+				self.archive.lock.release()
+
+			self._add_callback(outcome)
+
+	def _add_callback(self, callback):
+		try:
+			self.io_loop.add_callback(callback)
+		except ValueError, ex:
+			# The IO loop has been closed, which happens at the
+			# end of unit tests. There is nobody left to tell.
+			if str(ex) != "I/O operation on closed file":
+				raise ex
+
+class JobArchiveTest(unittest.TestCase):
+	def setUp(self):
+		self.path = tempfile.mkdtemp()
+		self.archive = JobArchive(self.path, segment_size=256)
+
+	def tearDown(self):
+		self.archive.close()
+		shutil.rmtree(self.path)
+
+	def _store(self, root_id, timestamp):
+		tree = [root_id, "%s_child" % root_id]
+		jobs = {}
+		for job_id in tree:
+			# Random padding, so the records don't compress too well.
+			jobs[job_id] = {'job_id': job_id, 'root_id': root_id, 'padding': os.urandom(200).encode('hex')}
+		self.archive.store(root_id, tree, jobs, timestamp)
+
+	def test_simple(self):
+		self._store('root1', 100)
+		self._store('root2', 200)
+
+		self.assertEquals(self.archive.get_root('root1_child'), 'root1', "Wrong root.")
+		self.assertEquals(self.archive.get_root('nope'), None, "Found a missing job.")
+		self.assertTrue(self.archive.has_tree('root2'), "Tree is not archived.")
+
+		self.assertEquals(set(self.archive.get_tree('root1_child')), set(['root1', 'root1_child']), "Wrong tree.")
+		self.assertEquals(len(self.archive.get_tree_jobs('root2')), 2, "Wrong number of jobs.")
+
+		jobs = self.archive.get_jobs(['root1_child', 'root2', 'nope'])
+		self.assertEquals(set(jobs.keys()), set(['root1_child', 'root2']), "Wrong jobs returned.")
+		self.assertEquals(jobs['root2']['root_id'], 'root2', "Wrong job data.")
+
+		older = self.archive.find_older_than(150)
+		self.assertEquals([t[0] for t in older], ['root1'], "Wrong old jobs.")
+
+	def test_segments(self):
+		# The records are larger than the segment size, so each
+		# one ends up in its own segment.
+		self._store('root1', 100)
+		self._store('root2', 200)
+		self._store('root3', 300)
+
+		segments = glob.glob(os.path.join(self.path, "segment-*.dat"))
+		self.assertEquals(len(segments), 3, "Segments were not rotated.")
+
+		# Reopen the archive, and make sure it can still read everything
+		# and continues with the last segment.
+		self.archive.close()
+		self.archive = JobArchive(self.path, segment_size=256)
+		self.assertEquals(self.archive.current_segment, 3, "Wrong current segment.")
+		self.assertEquals(len(self.archive.get_tree_jobs('root1')), 2, "Couldn't read after reopening.")
+
+		# Deleting a tree removes it's segment.
+		self.archive.delete('root1_child')
+		self.assertFalse(self.archive.has_tree('root1'), "Tree was not deleted.")
+		self.assertEquals(self.archive.get_tree_jobs('root1'), None, "Deleted tree still readable.")
+		self.assertNotIn('root1', [t[0] for t in self.archive.find_older_than(1000, limit=10)], "Deleted tree still indexed.")
+		segments = glob.glob(os.path.join(self.path, "segment-*.dat"))
+		self.assertEquals(len(segments), 2, "Empty segment was not removed.")
+
+		# The current segment is kept even if it's empty.
+		self.archive.delete('root3')
+		segments = glob.glob(os.path.join(self.path, "segment-*.dat"))
+		self.assertEquals(len(segments), 2, "Current segment was removed.")
+
+	def test_legacy(self):
+		list_fp = open(os.path.join(self.path, 'old_list.json'), 'w')
+		list_fp.write(json.dumps(['old']))
+		list_fp.close()
+		tree_fp = open(os.path.join(self.path, 'old.json'), 'w')
+		tree_fp.write(json.dumps({'old': {'job_id': 'old'}}))
+		tree_fp.close()
+
+		self.assertEquals(self.archive.import_legacy(limit=0), 0, "Imported past the limit.")
+		self.assertEquals(self.archive.import_legacy(), 1, "Didn't import the old tree.")
+		self.assertEquals(self.archive.get_tree('old'), ['old'], "Old tree was not imported.")
+		self.assertFalse(os.path.exists(os.path.join(self.path, 'old.json')), "Old file was not removed.")
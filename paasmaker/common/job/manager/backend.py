@@ -10,6 +10,8 @@
 # pub/sub messages by subscribing to job.status and sending it to
 # other nodes. This works in the current implementation because
 # the only backend is Redis, which supports Pub/Sub natively.
+# Ideally, messages only go to the nodes that have jobs in the
+# message's tree, and pacemakers, which need every message.
 # Other backends might not, which might mean they need a different
 # message broker (such as RabbitMQ).
 
@@ -95,6 +97,19 @@ class JobBackend(object):
 		"""
 		raise NotImplementedError("You must implement add_job().")
 
+	def add_tree(self, jobs, callback):
+		"""
+		Add a whole tree of jobs in one operation. jobs is a list of
+		dicts, ordered so that parents appear before their children.
+		Each dict has the keys ``node``, ``job_id``, ``parent_id`` and
+		``state``, optional ``tags`` and ``context`` keys, and any other
+		keys are stored as parameters for that job, as with add_job().
+		The first job may have a parent that already exists, in which
+		case the tree is grafted onto that job. Callback will be called
+		with no arguments once all the jobs are added.
+		"""
+		raise NotImplementedError("You must implement add_tree().")
+
 	def set_attrs(self, job_id, attrs, callback):
 		"""
 		Set the supplied attributes to the supplied value on the given
@@ -146,12 +161,30 @@ class JobBackend(object):
 		"""
 		raise NotImplementedError("You must implement find_by_tag().")
 
+	def find_by_tags(self, tags, callback, limit=50, cursor=None, state=None):
+		"""
+		Return a page of root jobs that have all of the given tags, most
+		recent first. Calls the callback with two arguments: a list of
+		job ids, and a cursor to pass back in to fetch the next page. The
+		cursor is None once there are no more jobs. The page may contain
+		fewer than limit jobs even if there are more to come, so keep
+		going until the cursor is None.
+
+		:arg str|list tags: The tag, or tags, that the jobs must have.
+		:arg callable callback: The callback to call with the results.
+		:arg int limit: The maximum number of jobs to return.
+		:arg str|None cursor: The cursor from the previous page.
+		:arg str|list|None state: If supplied, only return jobs whose
+			root job is in this state, or one of these states.
+		"""
+		raise NotImplementedError("You must implement find_by_tags().")
+
 	def find_older_than(self, age, callback, limit=None):
 		"""
 		Return a set of root jobs that are older than the given unix timestamp.
-		Call the callback with a list of job IDs that match. If possible, you
-		should sort the list so the most recent of those jobs appears first.
-		This is designed to clean up old jobs from the system.
+		Call the callback with a list of job IDs that match, sorted so the
+		oldest of those jobs appears first. With a limit, this returns the
+		oldest jobs. This is designed to clean up old jobs from the system.
 
 		:arg int age: The unix timestamp that the jobs should be older than.
 		:arg callable callback: The callback to call with the jobs.
@@ -159,24 +192,72 @@ class JobBackend(object):
 		"""
 		raise NotImplementedError("You must implement find_older_than().")
 
-	def get_ready_to_run(self, node, waiting_state, success_state, callback):
+	def get_ready_to_run(self, node, waiting_state, success_state, callback, limits=None, starting=[]):
 		"""
 		Return a set of jobs that are ready to run for the given node.
 		"Ready to run" is defined as jobs on the node who are currently in the
 		waiting state, and whose children are all in the supplied success state.
 		Call the callback with a set of jobs that match.
+
+		If limits is supplied, only return the jobs that can start without
+		going over those limits, taking into account the jobs already running
+		on the node. Jobs listed in starting are treated as running. The
+		limits are a dict in the same format as the ``job_limits``
+		configuration section.
 		"""
 		raise NotImplementedError("You must implement get_ready_to_run().")
 
+	def claim_jobs(self, node, job_ids, callback):
+		"""
+		Claim the given jobs on the given node for running. Each job that
+		is still ready to run is moved to the running state, in one
+		step. Jobs that are no longer ready to run are skipped.
+
+		Call the callback with a dict, keyed by job ID, for the jobs that
+		were claimed. Each value is a tuple of the job's metadata (as
+		returned by ``get_job()``) and the context for the job (as
+		returned by ``get_context()``).
+		"""
+		raise NotImplementedError("You must implement claim_jobs().")
+
 	def set_state_tree(self, job_id, from_state, to_state, callback, node=None):
 		"""
 		Set the entire tree that job_id is in to the supplied state. This is designed
 		to move a tree of jobs from 'NEW' to 'WAITING' state for execution. The backend should
 		do this blindly, so the caller must use with caution. The backend should also
 		locate the root job before starting this.
+
+		from_state can be a single state, a list of states, or None to change
+		jobs regardless of their current state. Backends should change the whole
+		tree atomically if possible. Call the callback with a set of the job ids
+		that were changed, so the caller can broadcast their new state.
 		"""
 		raise NotImplementedError("You must implement set_state_tree().")
 
+	def set_state_list(self, job_ids, from_state, to_state, callback, summary=None):
+		"""
+		Set the state of each of the given jobs, which can be in
+		different trees or on different nodes, to the supplied state.
+		Only jobs currently in from_state (a single state, or a list of
+		states) are changed, and the summary is stored on each of them.
+		Backends should change all the jobs atomically if possible.
+		Call the callback with a set of the job ids that were changed.
+		"""
+		raise NotImplementedError("You must implement set_state_list().")
+
+	def find_stuck_jobs(self, default_timeout, timeouts, callback, limit=100):
+		"""
+		Find jobs, on any node, that have been running for longer than
+		their timeout. The timeout for a job is looked up by plugin name
+		in the timeouts dict, and if not present, default_timeout is used.
+		All timeouts are in seconds, and a timeout of 0 means never.
+
+		Call the callback with a list of at most limit dicts, each with
+		the keys job_id, node, plugin, and started (a unix timestamp),
+		longest running first.
+		"""
+		raise NotImplementedError("You must implement find_stuck_jobs().")
+
 	def get_tree(self, job_id, callback, state=None, node=None):
 		"""
 		Get the entire tree for job_id. The root job should be resolved internally.
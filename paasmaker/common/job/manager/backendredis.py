@@ -16,6 +16,8 @@ import paasmaker
 from ...testhelpers import TestHelpers
 from paasmaker.common.core import constants
 from backend import JobBackend
+from archive import JobArchive, JobArchiveWorker
+import codec
 
 from pubsub import pub
 import tornado.testing
@@ -25,6 +27,25 @@ logger.addHandler(logging.NullHandler())
 
 MOVE_TO_DISK_CHECK_INTERVAL = 60000 # 60 seconds, in milliseconds.
 MOVE_TO_DISK_OLDER_THAN = 300 # 5 Minutes.
+# The number of trees to import from the old archive format at a time.
+IMPORT_LEGACY_BATCH = 20
+# The number of root jobs to convert to the current value encoding at a time.
+MIGRATE_ENCODING_BATCH = 100
+# The most jobs that a tag query examines for each job it returns. This
+# bounds the cost of a page when few jobs match the filters.
+FIND_BY_TAGS_SCAN_FACTOR = 20
+
+# Lua scripts used by the backend live alongside this file.
+# The library is prepended to every script when it's loaded.
+SCRIPT_PATH = os.path.normpath(os.path.dirname(__file__))
+SCRIPT_LIBRARY = 'jobs_common.lua'
+
+# The pub/sub channel that carries every job status message. Each node
+# also has it's own channel, this name followed by ":<NODE>", that only
+# carries messages for trees that the node is part of.
+JOB_STATUS_CHANNEL = 'job.status'
+# The keys that every job status message must have.
+JOB_STATUS_KEYS = ['job_id', 'state', 'source', 'summary', 'parent_id']
 
 class RedisJobBackend(JobBackend):
 	"""
@@ -39,9 +60,11 @@ class RedisJobBackend(JobBackend):
 	Key => Type
 		Description
 	<JOBID> => HASH
-		Hold the job information, such as state and attributes.
+		Hold the job information, such as state and attributes. Values
+		are encoded as described in the codec module.
 	<JOBID>:context => HASH
-		Holds the job context (JOBID is always the root job.)
+		Holds the job context (JOBID is always the root job.) Encoded
+		the same way as the job hash.
 	<JOBID>:parent => STRING
 		Quick way to locate the parent of a job. Can be None.
 	<JOBID>:root => STRING
@@ -56,11 +79,20 @@ class RedisJobBackend(JobBackend):
 		Set of all jobs under the root job.
 	<ROOTID>:tree:<STATE> => SET
 		Set of all jobs under the root job in the given state.
+	<ROOTID>:nodes => SET
+		Set of node UUIDs that have jobs in the tree. Job status messages
+		for the tree are sent to the channels of these nodes.
 	node:<NODE> => SET
 		Set of job IDs that are assigned to the given node.
 	node:<NODE>:<STATE> => SET
 		Set of job IDs that are assigned to the given node,
 		in the given state. This is a subset of node:<NODE>.
+	node:<NODE>:ready => SET
+		Set of job IDs on the given node that are WAITING and whose
+		children are all SUCCESS. Maintained by the state change scripts
+		as jobs change state, so finding ready jobs doesn't require
+		checking every waiting job. May contain stale entries, which
+		are removed when the set is read.
 	tag:<TAG> => ZSET
 		Set of job IDs that match the given tag. This is a sorted set so
 		we can quickly return the most recent jobs first. Note that only root jobs are
@@ -75,16 +107,36 @@ class RedisJobBackend(JobBackend):
 		A set of root jobs that have entered the completed state, sorted by their
 		timestamp. Used by a pacemaker to write the jobs out to disk after
 		they've completed.
+	jobs:encoding => STRING
+		The value encoding version that all jobs have been converted to.
+		Pacemakers convert older jobs in the background on startup.
+
+	On pacemakers, completed trees are moved from Redis into a
+	``JobArchive`` on disk. The root job, its root pointer, and the
+	tags and roots indexes stay in Redis, so that every node can
+	still find the tree. The lookup methods check the archive only
+	for jobs that are not in Redis.
 	"""
 
 	def setup(self, callback, error_callback):
 		self.setup_callback = callback
 		self.setup_steps = 2
 
+		# Check the ready to run index on the first evaluation after
+		# we connect, in case jobs were queued whilst we were away.
+		self.ready_index_checked = False
+
+		if not hasattr(self, 'archive'):
+			self.archive = None
+
 		# Set up a periodic to move completed jobs from Redis onto disk.
-		# This is a crude workaround to reduce the jobs Redis's memory usage.
+		# This is to reduce the jobs Redis's memory usage. The archive
+		# is indexed, so archived jobs can still be fetched quickly.
 		if self.configuration.is_pacemaker() and not hasattr(self, 'memory_free_periodic'):
 			self.disk_store_location = self.configuration.get_scratch_path_exists('job', 'archive')
+			self.archive = JobArchive(self.disk_store_location)
+			self.archive_worker = JobArchiveWorker(self.configuration.io_loop, self.archive)
+			self._import_legacy_archive()
 			self.memory_free_periodic = tornado.ioloop.PeriodicCallback(
 				self._check_move_jobs_to_disk,
 				MOVE_TO_DISK_CHECK_INTERVAL,
@@ -99,14 +151,16 @@ class RedisJobBackend(JobBackend):
 			self.redis = None
 		if not hasattr(self, 'pubsub_client'):
 			self.pubsub_client = None
+		if not hasattr(self, 'pubsub_channel'):
+			self.pubsub_channel = None
 
 		connection_required = False
 		if self.redis is None or not self.redis.connection.connected():
 			connection_required = True
-			self.configuration.get_jobs_redis(self.redis_ready, error_callback)
+			self.configuration.get_jobs_redis(self.redis_ready, error_callback, dedicated=True)
 		if self.pubsub_client is None or not self.pubsub_client.connection.connected():
 			connection_required = True
-			self.configuration.get_jobs_redis(self.pubsub_redis_ready, error_callback)
+			self.configuration.get_jobs_redis(self.pubsub_redis_ready, error_callback, dedicated=True)
 
 		if not connection_required:
 			# Just call the callback.
@@ -124,6 +178,7 @@ class RedisJobBackend(JobBackend):
 		def on_subscribed(result):
 			# Set up the listen handler.
 			self.pubsub_client.listen(self._on_job_status_message)
+			self.pubsub_channel = channel
 			# Listen to internally published messages.
 			# But don't do it on connection failure/reconnection.
 			if not self.pubsub_internal_subscribed:
@@ -133,12 +188,112 @@ class RedisJobBackend(JobBackend):
 			self.setup_steps -= 1
 			self.check_setup_complete()
 
-		self.pubsub_client.subscribe('job.status', on_subscribed)
+		channel = self._get_status_channel()
+		logger.debug("Subscribing to job status channel %s.", channel)
+		self.pubsub_client.subscribe(channel, on_subscribed)
+
+	def _get_status_channel(self):
+		# Pacemakers need to see every job status message, for the
+		# UI and streams. Other nodes only need messages for trees that
+		# they have jobs in. Until a node has a UUID, it can't have
+		# any jobs, but listen to everything to be safe.
+		node_uuid = self.configuration.get_node_uuid()
+		if self.configuration.is_pacemaker() or not node_uuid:
+			return JOB_STATUS_CHANNEL
+		else:
+			return "%s:%s" % (JOB_STATUS_CHANNEL, node_uuid)
+
+	def _check_status_channel(self):
+		# Switch channels if required - typically because this node
+		# has just been assigned a UUID.
+		if self.pubsub_channel is None:
+			# Not yet subscribed. The subscription will pick the right channel.
+			return
+
+		channel = self._get_status_channel()
+		if channel != self.pubsub_channel:
+			logger.info("Switching job status channel from %s to %s.", self.pubsub_channel, channel)
+			self.pubsub_client.subscribe(channel)
+			self.pubsub_client.unsubscribe(self.pubsub_channel)
+			self.pubsub_channel = channel
 
 	def check_setup_complete(self):
 		if self.setup_steps == 0:
+			if self.configuration.is_pacemaker() and not hasattr(self, 'encoding_migration_started'):
+				# Convert any jobs stored with an older encoding.
+				# This happens in the background; older values can
+				# still be read in the meantime.
+				self.encoding_migration_started = True
+				self.configuration.io_loop.add_callback(self._migrate_encoding)
 			self.setup_callback("Jobs backend Redis ready.")
 
+	def _migrate_encoding(self, callback=None, after=None, limit=MIGRATE_ENCODING_BATCH):
+		# Trees are converted in the order of the roots index, after
+		# the (time, root ID) of the last tree converted. Trees are only
+		# ever added to the end of that index, already in the current
+		# encoding, so removing trees whilst this runs can't make it
+		# skip any, as paging by position would.
+		def done():
+			if callback:
+				callback()
+
+		def on_batch_done(last):
+			# Move onto the next batch, letting other things run first.
+			def next_batch():
+				self._migrate_encoding(callback, last, limit)
+			self.configuration.io_loop.add_callback(next_batch)
+
+		def migrate_root(root_id, processor):
+			def on_migrated(count):
+				if count > 0:
+					logger.debug("Converted %d values for job tree %s.", count, root_id)
+				processor.next()
+
+			self._run_script('jobs_migrate_encoding.lua', [root_id], on_migrated)
+
+		def on_roots(roots):
+			# Trees with the same time as the last one converted come
+			# back again; skip the ones already done.
+			batch = [(score, root_id) for root_id, score in roots]
+			if after is not None:
+				batch = [root for root in batch if root > after]
+
+			if len(batch) == 0 and len(roots) == limit:
+				# More trees with the same time than fit in a batch.
+				self._migrate_encoding(callback, after, limit * 2)
+			elif len(batch) == 0:
+				logger.info("Job encoding is up to date.")
+				self.redis.set('jobs:encoding', codec.ENCODING_VERSION, lambda result: done())
+			else:
+				processor = paasmaker.util.CallbackProcessList(
+					[root[1] for root in batch],
+					migrate_root,
+					lambda: on_batch_done(batch[-1])
+				)
+				processor.start()
+
+		def on_version(version):
+			if version is not None and int(version) >= codec.ENCODING_VERSION:
+				done()
+			else:
+				start = "-inf"
+				if after is None:
+					logger.info("Converting jobs to encoding version %d.", codec.ENCODING_VERSION)
+				else:
+					start = repr(after[0])
+				self.redis.zrangebyscore("roots", start, "+inf", offset=0, limit=limit, with_scores=True, callback=on_roots)
+
+		self.redis.get('jobs:encoding', on_version)
+
+	def _import_legacy_archive(self):
+		# Import in batches, so that lookups queued behind
+		# the import don't have to wait for all of it.
+		def on_imported(imported):
+			if imported >= IMPORT_LEGACY_BATCH:
+				self.configuration.io_loop.add_callback(self._import_legacy_archive)
+
+		self._archive_call('import_legacy', [IMPORT_LEGACY_BATCH], on_imported, 0)
+
 	def ensure_connected(self):
 		reconnection_required = False
 
@@ -174,6 +329,7 @@ class RedisJobBackend(JobBackend):
 			self.setup(reconnect_success, reconnect_failed)
 		else:
 			logger.debug("Job manager is still connected.")
+			self._check_status_channel()
 
 	def shutdown(self, callback, error_callback):
 		if hasattr(self, 'redis') and self.redis is not None and self.redis.connection.connected():
@@ -181,6 +337,13 @@ class RedisJobBackend(JobBackend):
 		if hasattr(self, 'pubsub_client') and self.pubsub_client is not None and self.pubsub_client.connection.connected():
 			self.pubsub_client.connection.disconnect()
 
+		if getattr(self, 'archive_worker', None) is not None:
+			self.memory_free_periodic.stop()
+			del self.memory_free_periodic
+			self.archive_worker.stop()
+			self.archive_worker = None
+			self.archive = None
+
 		callback("Disconnected.")
 
 	def _on_job_status_message(self, message):
@@ -196,6 +359,11 @@ class RedisJobBackend(JobBackend):
 			logger.warning(str(ex))
 			return
 
+		if not isinstance(parsed, dict) or not all(parsed.has_key(key) for key in JOB_STATUS_KEYS):
+			logger.warning("Incomplete message received via pub/sub from the jobs Redis:")
+			logger.warning(str(message.body))
+			return
+
 		if parsed['source'] == self.configuration.get_node_uuid():
 			# It's a message from us. drop it.
 			logger.debug("Dropping status message %s because it originated from us.", str(message.body))
@@ -221,39 +389,83 @@ class RedisJobBackend(JobBackend):
 		encoded = json.dumps(body)
 		logger.debug("Sending job status message: %s", encoded)
 		try:
-			self.redis.publish('job.status', encoded)
+			# Send it to the full feed and to the nodes in the job's tree.
+			self._run_script(
+				'jobs_publish_status.lua',
+				[message.job_id, message.source, encoded, JOB_STATUS_CHANNEL],
+				lambda result: None
+			)
 		except ValueError, ex:
 			# TODO: React to this situation. It's caused by the redis connection being closed.
 			# TODO: This will bite later!
 			logger.error("Unable to send job status via Redis: ", exc_info=ex)
 
-	def _to_json(self, values):
-		out = {}
-		for key, value in values.iteritems():
-			out[key] = json.dumps(value, cls=paasmaker.util.jsonencoder.JsonEncoder)
-		return out
-
-	def _from_json(self, values):
-		result = {}
-		for key, value in values.iteritems():
-			if value:
-				result[key] = json.loads(value)
-			else:
-				result[key] = None
-		return result
+	def _run_script(self, script, args, callback):
+		"""
+		Run the named Lua script against the jobs Redis, loading it
+		first if this is the first time it's been used. Calls the callback
+		with the result of the script.
+		"""
+		def script_result(result):
+			if isinstance(result, paasmaker.thirdparty.tornadoredis.exceptions.ResponseError):
+				if result.message.startswith('NOSCRIPT'):
+					# Redis has forgotten the script - probably it was restarted.
+					# Load it again and retry.
+					logger.info("Jobs Redis does not have script %s. Reloading.", script)
+					self.configuration.redis_scripts.pop(script, None)
+					self._run_script(script, args, callback)
+					return
+				logger.error("Failed to run job script %s: %s", script, str(result))
+				raise result
+
+			callback(result)
+
+		if script not in self.configuration.redis_scripts:
+			def script_loaded(sha1):
+				if isinstance(sha1, paasmaker.thirdparty.tornadoredis.exceptions.ResponseError):
+					logger.error("Failed to load job script %s: %s", script, str(sha1))
+					raise sha1
+
+				# Store the SHA1 for later, and then run it.
+				self.configuration.redis_scripts[script] = sha1
+				self._run_script(script, args, callback)
+
+				# end of script_loaded()
+
+			body = ''
+			for filename in [SCRIPT_LIBRARY, script]:
+				script_fp = open(os.path.join(SCRIPT_PATH, filename), 'r')
+				body += script_fp.read()
+				script_fp.close()
+
+			self.redis.script_load(body, script_loaded)
+			return
+
+		self.redis.evalsha(
+			self.configuration.redis_scripts[script],
+			keys=[],
+			args=list(args),
+			callback=script_result
+		)
+
+	def _encode(self, values):
+		return codec.encode_record(values)
+
+	def _decode(self, values):
+		return codec.decode_record(values)
 
 	def store_context(self, job_id, context, callback):
 		def on_stored(result):
 			callback()
 
 		def on_found_root(root_id):
-			self.redis.hmset("%s:context" % root_id, self._to_json(context), on_stored)
+			self.redis.hmset("%s:context" % root_id, self._encode(context), on_stored)
 
 		self.get_root(job_id, on_found_root)
 
 	def get_context(self, job_id, callback):
 		def on_hgetall(values):
-			callback(self._from_json(values))
+			callback(self._decode(values))
 
 		def on_found_root(root_id):
 			self.redis.hgetall("%s:context" % root_id, on_hgetall)
@@ -270,8 +482,23 @@ class RedisJobBackend(JobBackend):
 
 		self.redis.get("%s:parent" % job_id, on_get)
 
+	def _archive_call(self, method, args, callback, default=None):
+		# The archive blocks on disk, so the worker calls it on its thread.
+		# If it fails, log why and carry on with the default result.
+		def on_error(message, exception=None):
+			logger.error("Unable to call %s() on the job archive: %s", method, message)
+			if exception:
+				logger.error("Exception:", exc_info=exception)
+			callback(default)
+
+		self.archive_worker.call(method, args, callback, on_error)
+
 	def get_root(self, job_id, callback):
 		def on_get(value):
+			if value is None and self.archive:
+				# It might be an archived job.
+				self._archive_call('get_root', [job_id], callback)
+				return
 			callback(value)
 
 		self.redis.get("%s:root" % job_id, on_get)
@@ -308,6 +535,56 @@ class RedisJobBackend(JobBackend):
 
 		self.redis.exists(job_id, on_exists)
 
+	def _pipeline_add_job(self, pipeline, node, job_id, parent_id, root_id, state, attrs):
+		# Queue up all the commands to insert a single job onto
+		# the supplied pipeline. The caller is responsible for
+		# executing the pipeline.
+		attrs['job_id'] = job_id
+		attrs['parent_id'] = parent_id
+		attrs['root_id'] = root_id
+		attrs['time'] = time.time()
+		attrs['node'] = node
+		attrs['state'] = state
+		values = self._encode(attrs)
+
+		# The core job.
+		pipeline.hmset(job_id, values)
+		# Insert it into the node state list.
+		pipeline.sadd("node:%s" % node, job_id)
+		# TODO: This will cause issues if the job already exists.
+		pipeline.sadd("node:%s:%s" % (node, state), job_id)
+		if state == constants.JOB.WAITING:
+			# It's not got any children yet, so it's ready to run. If children
+			# are added later, it's removed again when the ready set is read.
+			pipeline.sadd("node:%s:ready" % node, job_id)
+		# Handle parent related activities.
+		if parent_id:
+			# Set the parent ID mapping.
+			pipeline.set("%s:parent" % job_id, parent_id)
+			# Update the parent to have this as a child.
+			pipeline.sadd("%s:children" % parent_id, job_id)
+			# Update the parent's state map.
+			# TODO: This will cause issues if the job already exists.
+			pipeline.sadd("%s:children:%s" % (parent_id, state), job_id)
+
+		# And store the root ID.
+		pipeline.set("%s:root" % job_id, root_id)
+		# Store on the root job lists.
+		pipeline.sadd("%s:tree" % root_id, job_id)
+		# Make sure this node gets the status messages for this tree.
+		pipeline.sadd("%s:nodes" % root_id, node)
+		# TODO: This will cause issues if the job already exists.
+		pipeline.sadd("%s:tree:%s" % (root_id, state), job_id)
+		# Add the root job to the set of root jobs.
+		pipeline.zadd("roots", time.time(), root_id)
+
+	def _pipeline_tag_job(self, pipeline, root_id, tags):
+		# Tag the job in forward and reverse. Only ever
+		# call this with the root ID.
+		for tag in tags:
+			pipeline.zadd("tag:%s" % tag, time.time(), root_id)
+			pipeline.sadd("%s:tags" % root_id, tag)
+
 	def add_job(self, node, job_id, parent_id, callback, state, **kwargs):
 		# Make a note of the tags.
 		tags = []
@@ -326,41 +603,9 @@ class RedisJobBackend(JobBackend):
 				on_really_complete()
 
 		def on_found_root(root_id):
-			# Serialize all incoming values to JSON.
-			kwargs['job_id'] = job_id
-			kwargs['parent_id'] = parent_id
-			kwargs['root_id'] = root_id
-			kwargs['time'] = time.time()
-			kwargs['node'] = node
-			kwargs['state'] = state
-			values = self._to_json(kwargs)
-
 			# Now set up the transaction to insert it all.
 			pipeline = self.redis.pipeline(True)
-			# The core job.
-			pipeline.hmset(job_id, values)
-			# Insert it into the node state list.
-			pipeline.sadd("node:%s" % node, job_id)
-			# TODO: This will cause issues if the job already exists.
-			pipeline.sadd("node:%s:%s" % (node, state), job_id)
-			# Handle parent related activities.
-			if parent_id:
-				# Set the parent ID mapping.
-				pipeline.set("%s:parent" % job_id, parent_id)
-				# Update the parent to have this as a child.
-				pipeline.sadd("%s:children" % parent_id, job_id)
-				# Update the parent's state map.
-				# TODO: This will cause issues if the job already exists.
-				pipeline.sadd("%s:children:%s" % (parent_id, state), job_id)
-
-			# And store the root ID.
-			pipeline.set("%s:root" % job_id, root_id)
-			# Store on the root job lists.
-			pipeline.sadd("%s:tree" % root_id, job_id)
-			# TODO: This will cause issues if the job already exists.
-			pipeline.sadd("%s:tree:%s" % (root_id, state), job_id)
-			# Add the root job to the set of root jobs.
-			pipeline.zadd("roots", time.time(), root_id)
+			self._pipeline_add_job(pipeline, node, job_id, parent_id, root_id, state, kwargs)
 
 			# Execute the pipeline.
 			pipeline.execute(on_complete)
@@ -371,10 +616,63 @@ class RedisJobBackend(JobBackend):
 		else:
 			on_found_root(job_id)
 
+	def add_tree(self, jobs, callback):
+		if len(jobs) == 0:
+			callback()
+			return
+
+		def on_complete(result):
+			callback()
+
+		def on_found_root(root_id):
+			# Insert every job, the merged context, and all the tags
+			# in a single transaction.
+			pipeline = self.redis.pipeline(True)
+			context = {}
+			tags = []
+
+			for job in jobs:
+				attrs = dict(job)
+				node = attrs.pop('node')
+				job_id = attrs.pop('job_id')
+				parent_id = attrs.pop('parent_id')
+				state = attrs.pop('state')
+
+				# Contexts are all stored against the root job, so merge
+				# them in order; later jobs override earlier ones, just as
+				# if they were stored one at a time.
+				job_context = attrs.pop('context', None)
+				if job_context:
+					context.update(job_context)
+
+				job_tags = attrs.pop('tags', None)
+				if job_tags:
+					if isinstance(job_tags, basestring):
+						tags.append(job_tags)
+					else:
+						tags.extend(job_tags)
+
+				self._pipeline_add_job(pipeline, node, job_id, parent_id, root_id, state, attrs)
+
+			if len(context) > 0:
+				pipeline.hmset("%s:context" % root_id, self._encode(context))
+
+			self._pipeline_tag_job(pipeline, root_id, set(tags))
+
+			pipeline.execute(on_complete)
+
+		# The first job is the top of the tree. If it has a parent, the tree
+		# is being grafted onto an existing job, so find that job's root.
+		top = jobs[0]
+		if top['parent_id']:
+			self.get_root(top['parent_id'], on_found_root)
+		else:
+			on_found_root(top['job_id'])
+
 	def set_attrs(self, job_id, attrs, callback):
 		def on_complete(result):
 			# The last result is the whole job object.
-			job_data = self._from_json(result[-1])
+			job_data = self._decode(result[-1])
 
 			if not job_data['parent_id'] and job_data['state'] in constants.JOB_FINISHED_STATES:
 				# This was a root job, and it's finished. Add it to the list to prune.
@@ -384,30 +682,28 @@ class RedisJobBackend(JobBackend):
 
 			callback(job_data)
 
-		def on_got_current_state(job):
-			new_state = attrs['state']
-			# Now, start a transaction to update the appropriate maps.
-			pipeline = self.redis.pipeline(True)
-			# Remove from the old state sets and add to new ones.
-			pipeline.srem("node:%(node)s:%(state)s" % job, job_id)
-			pipeline.sadd("node:%s:%s" % (job['node'], new_state), job_id)
-			if job['parent_id']:
-				pipeline.srem("%(parent_id)s:children:%(state)s" % job, job_id)
-				pipeline.sadd("%s:children:%s" % (job['parent_id'], new_state), job_id)
-			pipeline.srem("%(root_id)s:tree:%(state)s" % job, job_id)
-			pipeline.sadd("%s:tree:%s" % (job['root_id'], new_state), job_id)
-			encoded = self._to_json(attrs)
-			pipeline.hmset(job_id, encoded)
-			pipeline.hgetall(job_id)
-			pipeline.execute(on_complete)
-
 		if attrs.has_key('state'):
-			# Update the state maps as well. To do this, we need to know
-			# what the current state is.
-			self.get_job(job_id, on_got_current_state)
+			# Update the state maps and the ready index as well. This is
+			# done by a script so it happens in a single atomic step.
+			def on_script_complete(result):
+				# The result is the job hash as a flat list.
+				job_data = self._decode(dict(zip(result[::2], result[1::2])))
+				callback(job_data)
+
+			finished = '0'
+			if attrs['state'] in constants.JOB_FINISHED_STATES:
+				finished = '1'
+
+			args = [job_id, attrs['state'], finished, str(time.time())]
+			for key, value in self._encode(attrs).iteritems():
+				if key != 'state':
+					args.append(key)
+					args.append(value)
+
+			self._run_script('jobs_set_state.lua', args, on_script_complete)
 		else:
 			# Just go ahead and update it.
-			encoded = self._to_json(attrs)
+			encoded = self._encode(attrs)
 			pipeline = self.redis.pipeline(True)
 			pipeline.hmset(job_id, encoded)
 			pipeline.hgetall(job_id)
@@ -415,7 +711,7 @@ class RedisJobBackend(JobBackend):
 
 	def get_attr(self, job_id, attr, callback):
 		def on_hmget(values):
-			decoded = self._from_json(values)
+			decoded = self._decode(values)
 			if decoded.has_key(attr):
 				callback(decoded[attr])
 			else:
@@ -425,33 +721,38 @@ class RedisJobBackend(JobBackend):
 
 	def get_job(self, job_id, callback):
 		def on_hgetall(values):
-			callback(self._from_json(values))
+			callback(self._decode(values))
 
 		self.redis.hgetall(job_id, on_hgetall)
 
 	def get_jobs(self, jobs, callback, root_id=None):
-		if root_id is not None:
-			# See if we can fetch from the on-disk cache.
-			list_path, tree_path = self._get_archive_paths(root_id)
-			if os.path.exists(tree_path):
-				logger.debug("Satisfying request for get_jobs() root id %s from file %s.", root_id, tree_path)
-				tree_fp = open(tree_path, 'r')
-				result = json.loads(tree_fp.read())
-				tree_fp.close()
-				callback(result)
-				return
+		# Jobs that aren't in Redis are looked up in the archive, so
+		# the root ID isn't needed to find archived trees.
+		job_list = list(jobs)
 
 		def on_bulk_hmget(values):
 			output = {}
-			for result in values:
-				decoded = self._from_json(result)
+			missing = []
+			for job_id, result in zip(job_list, values):
+				decoded = self._decode(result)
 				if decoded.has_key('job_id'):
 					# If it's missing this key, there is no such job.
 					output[decoded['job_id']] = decoded
-			callback(output)
+				else:
+					missing.append(job_id)
+
+			if len(missing) > 0 and self.archive:
+				# They might have been archived.
+				def on_archived(archived):
+					output.update(archived)
+					callback(output)
+
+				self._archive_call('get_jobs', [missing], on_archived, {})
+			else:
+				callback(output)
 
 		pipeline = self.redis.pipeline()
-		for job in jobs:
+		for job in job_list:
 			pipeline.hgetall(job)
 		pipeline.execute(on_bulk_hmget)
 
@@ -469,14 +770,30 @@ class RedisJobBackend(JobBackend):
 				tags = list(incoming_tag)
 
 			pipeline = self.redis.pipeline(True)
-			for tag in tags:
-				pipeline.zadd("tag:%s" % tag, time.time(), root_id)
-				pipeline.sadd("%s:tags" % root_id, tag)
+			self._pipeline_tag_job(pipeline, root_id, tags)
 			pipeline.execute(on_tagged)
 
 		self.get_root(job_id, on_found_root)
 
+	def _merge_archived(self, jobs, archived, limit, oldest_first=False):
+		# Merge (job_id, time) lists from Redis and the archive,
+		# most recent first unless asked otherwise, and return
+		# just the job IDs.
+		seen = set()
+		merged = []
+		for job_id, score in sorted(jobs + archived, key=lambda j: j[1], reverse=not oldest_first):
+			if job_id not in seen:
+				seen.add(job_id)
+				merged.append(job_id)
+
+		if limit:
+			merged = merged[:limit]
+
+		return merged
+
 	def find_by_tag(self, tag, callback, limit=None):
+		# Archived trees stay in the tag indexes, so this
+		# doesn't need to check the archive.
 		def on_zrevrangebyscore(jobs):
 			callback(jobs)
 
@@ -486,87 +803,273 @@ class RedisJobBackend(JobBackend):
 
 		self.redis.zrevrangebyscore("tag:%s" % tag, "+inf", "-inf", offset=offset, limit=limit, callback=on_zrevrangebyscore)
 
+	def find_by_tags(self, tags, callback, limit=50, cursor=None, state=None):
+		if isinstance(tags, basestring):
+			tags = [tags]
+		else:
+			tags = list(tags)
+
+		if state is None:
+			states = []
+		elif isinstance(state, basestring):
+			states = [state]
+		else:
+			states = list(state)
+
+		# The cursor is the score and ID of the last job examined.
+		cursor_score = ''
+		cursor_id = ''
+		if cursor:
+			cursor_score, cursor_id = cursor.split(':', 1)
+
+		# Archived trees stay in the tag indexes, and keep their root
+		# job for the state filter, so this doesn't need to check
+		# the archive.
+		def on_found(result):
+			found, next_score, next_id = result
+
+			next_cursor = None
+			if next_score:
+				next_cursor = "%s:%s" % (next_score, next_id)
+
+			callback(found[::2], next_cursor)
+
+		args = [limit, limit * FIND_BY_TAGS_SCAN_FACTOR, cursor_score, cursor_id, len(tags)]
+		args.extend(tags)
+		args.extend(states)
+		self._run_script('jobs_find_by_tags.lua', args, on_found)
+
 	def find_older_than(self, age, callback, limit=None):
-		def on_zrevrangebyscore(jobs):
-			callback(jobs)
+		# Oldest first, so that with a limit, the oldest are cleaned up first.
+		def on_zrangebyscore(jobs):
+			if self.archive:
+				# Archived trees stay in the roots index, but also check
+				# the archive, so trees that are missing from Redis are
+				# still found and cleaned up.
+				def on_archived(archived):
+					callback(self._merge_archived(jobs, archived, limit, oldest_first=True))
+
+				self._archive_call('find_older_than', [age, limit], on_archived, [])
+			else:
+				callback([job[0] for job in jobs])
 
 		offset = None
 		if limit is not None:
 			offset = 0
 
-		self.redis.zrevrangebyscore("roots", age, "-inf", offset=offset, limit=limit, callback=on_zrevrangebyscore)
-
-	def get_ready_to_run(self, node, waiting_state, success_state, callback):
-		def on_count_sets(sets):
-			# The passed result will have three values for each job.
-			# The first is the job id. The second is the number of children.
-			# And the third is the number of jobs in the given state.
-			output = set()
-			index = 0
-			while index < len(sets):
-				if sets[index + 1] == sets[index + 2]:
-					output.add(self._from_json(sets[index])['job_id'])
-				index += 3
-
-			callback(output)
-
-		def on_waiting_state(jobs):
-			# For each of the waiting jobs, check the length of the children
-			# jobs in the success state. If it matches the length of the children set,
-			# then this job is ready to run.
-			pipeline = self.redis.pipeline()
-			for job in jobs:
-				pipeline.hmget(job, ['job_id'])
-				pipeline.scard("%s:children" % job)
-				pipeline.scard("%s:children:%s" %(job, success_state))
-			pipeline.execute(on_count_sets)
+		self.redis.zrangebyscore("roots", "-inf", age, offset=offset, limit=limit, with_scores=True, callback=on_zrangebyscore)
+
+	def get_ready_to_run(self, node, waiting_state, success_state, callback, limits=None, starting=[]):
+		# NOTE: The ready index is maintained for the WAITING and SUCCESS
+		# states only, which is what the job manager uses.
+		def on_ready(jobs):
+			callback(set(jobs))
+
+		def on_ready_detail(result):
+			ready_detail, running_detail = result
+
+			ready = []
+			for i in range(0, len(ready_detail), 3):
+				ready.append(
+					(
+						ready_detail[i],
+						codec.decode_value(ready_detail[i + 1]),
+						codec.decode_value(ready_detail[i + 2]) or 0.0
+					)
+				)
+
+			running = [codec.decode_value(plugin) for plugin in running_detail[1::2]]
+
+			callback(self._apply_limits(ready, running, limits))
+
+		rebuild = '0'
+		if not self.ready_index_checked:
+			rebuild = '1'
+			self.ready_index_checked = True
+
+		if limits is None:
+			self._run_script('jobs_ready_to_run.lua', [node, rebuild, '0'], on_ready)
+		else:
+			args = [node, rebuild, '1']
+			args.extend(starting)
+			self._run_script('jobs_ready_to_run.lua', args, on_ready_detail)
+
+	def claim_jobs(self, node, job_ids, callback):
+		def on_claimed(result):
+			claimed = {}
+			for i in range(0, len(result), 3):
+				job = result[i + 1]
+				context = result[i + 2]
+				claimed[result[i]] = (
+					self._decode(dict(zip(job[::2], job[1::2]))),
+					self._decode(dict(zip(context[::2], context[1::2])))
+				)
+			callback(claimed)
+
+		if len(job_ids) == 0:
+			callback({})
+			return
 
-		# First step, get all the jobs on the node in the waiting state.
-		self.redis.smembers("node:%s:%s" % (node, waiting_state), on_waiting_state)
+		args = [node, str(time.time())]
+		args.extend(job_ids)
+		self._run_script('jobs_claim.lua', args, on_claimed)
+
+	def _apply_limits(self, ready, running, limits):
+		"""
+		Choose which of the ready jobs can start, given the plugins
+		of the jobs already running on the node.
+
+		Every running job counts towards ``max_running``, including
+		one that is waiting for jobs it started to finish. Jobs that
+		wait on their own subtree whilst running could take all the
+		slots and never finish; see ``JobLimitsSchema.max_running``.
+
+		Jobs with a priority take one of the ``reserved`` slots if
+		there is one free, and only then one of the general slots.
+
+		:arg list ready: A list of (job_id, plugin, time) tuples.
+		:arg list running: A list of plugins of the running jobs.
+		:arg dict limits: The limits, as per the ``job_limits``
+			configuration section.
+		"""
+		max_running = limits.get('max_running', 0)
+		reserved = limits.get('reserved', 0)
+		plugin_limits = limits.get('plugins', {})
+		priorities = limits.get('priorities') or {}
+
+		general = max_running - reserved
+
+		# The slots in use. Running priority jobs are counted
+		# against the reserved slots first, as they would have
+		# been when they started.
+		used_general = 0
+		used_reserved = 0
+		per_plugin = {}
+		for plugin in running:
+			per_plugin[plugin] = per_plugin.get(plugin, 0) + 1
+			if priorities.get(plugin, 0) > 0 and used_reserved < reserved:
+				used_reserved += 1
+			else:
+				used_general += 1
+
+		# Highest priority first, then oldest first.
+		ready = sorted(ready, key=lambda job: (-priorities.get(job[1], 0), job[2], job[0]))
+
+		chosen = set()
+		for job_id, plugin, added in ready:
+			if plugin in plugin_limits and per_plugin.get(plugin, 0) >= plugin_limits[plugin]:
+				continue
+
+			if max_running > 0:
+				# Jobs without a priority can't use the reserved slots.
+				if priorities.get(plugin, 0) > 0 and used_reserved < reserved:
+					used_reserved += 1
+				elif used_general < general:
+					used_general += 1
+				else:
+					continue
+
+			chosen.add(job_id)
+			per_plugin[plugin] = per_plugin.get(plugin, 0) + 1
+
+		return chosen
 
 	def set_state_tree(self, job_id, from_state, to_state, callback, node=None):
-		def on_found_tree(tree):
-			treecopy = set(tree)
-			# We're going to do this the slow way, calling each one in turn.
-			# TODO: Think about the transactional issues surrounding this.
-			def process_job(data):
-				try:
-					job = treecopy.pop()
-					self.set_attrs(job, {'state': to_state}, process_job)
-				except KeyError, ex:
-					# No more elements.
-					# We're done.
-					callback(tree)
-
-			# Kick off the process.
-			process_job(None)
+		def on_changed(changed):
+			callback(set(changed))
 
 		def on_found_root(root_id):
-			if not node:
-				# Get the whole root tree.
-				self.redis.smembers("%s:tree:%s" % (root_id, from_state), on_found_tree)
+			if not root_id:
+				# No such job, so nothing to change.
+				callback(set())
+				return
+
+			if from_state is None:
+				from_states = []
+			elif isinstance(from_state, basestring):
+				from_states = [from_state]
 			else:
-				# Get the ones for this node - that is the intersection
-				# between jobs on our node in that state and the jobs in
-				# that tree.
-				self.redis.sinter(["%s:tree:%s" % (root_id, from_state), "node:%s:%s" % (node, from_state)], on_found_tree)
+				from_states = list(from_state)
+
+			finished = '0'
+			if to_state in constants.JOB_FINISHED_STATES:
+				finished = '1'
+
+			args = [root_id, to_state, node or '', finished, str(time.time())]
+			args.extend(from_states)
+
+			# The script changes all the jobs and their indexes atomically,
+			# so other nodes never see a half updated tree.
+			self._run_script('jobs_set_state_tree.lua', args, on_changed)
 
 		self.get_root(job_id, on_found_root)
 
+	def set_state_list(self, job_ids, from_state, to_state, callback, summary=None):
+		def on_changed(changed):
+			callback(set(changed))
+
+		if len(job_ids) == 0:
+			callback(set())
+			return
+
+		if isinstance(from_state, basestring):
+			from_states = [from_state]
+		else:
+			from_states = list(from_state)
+
+		finished = '0'
+		if to_state in constants.JOB_FINISHED_STATES:
+			finished = '1'
+
+		args = [to_state, finished, str(time.time()), codec.encode_value(summary), len(from_states)]
+		args.extend(from_states)
+		args.extend(job_ids)
+		self._run_script('jobs_set_state_list.lua', args, on_changed)
+
+	def find_stuck_jobs(self, default_timeout, timeouts, callback, limit=100):
+		def on_found(result):
+			stuck = []
+			for i in range(0, len(result), 4):
+				stuck.append(
+					{
+						'job_id': result[i],
+						'node': result[i + 1],
+						'plugin': result[i + 2],
+						'started': float(result[i + 3])
+					}
+				)
+			callback(stuck)
+
+		args = [str(time.time()), default_timeout, limit]
+		for plugin, timeout in timeouts.iteritems():
+			args.append(plugin)
+			args.append(timeout)
+
+		self._run_script('jobs_find_stuck.lua', args, on_found)
+
 	def get_tree(self, job_id, callback, state=None, node=None):
-		# If we're not interested in the state/node filter,
-		# it's probably an old job, so check the on disk cache for this
-		# result.
-		if state is None and node is None:
-			list_path, tree_path = self._get_archive_paths(job_id)
-			if os.path.exists(list_path):
-				logger.debug("Satisfying request for get_tree() root id %s from file %s.", job_id, list_path)
-				list_fp = open(list_path, 'r')
-				result = json.loads(list_fp.read())
-				list_fp.close()
-				callback(result)
-				return
+		# If we're not interested in the state/node filter, and
+		# Redis doesn't have the tree, it might be archived.
+		if state is None and node is None and self.archive:
+			def on_tree(result):
+				if len(result) > 0:
+					callback(result)
+					return
+
+				def on_archived(archived):
+					if archived is not None:
+						logger.debug("Satisfying request for get_tree() job id %s from the archive.", job_id)
+						callback(archived)
+					else:
+						callback(result)
+
+				self._archive_call('get_tree', [job_id], on_archived)
+
+			self._get_tree(job_id, on_tree, state, node)
+		else:
+			self._get_tree(job_id, callback, state, node)
 
+	def _get_tree(self, job_id, callback, state, node):
 		# State Node Source
 		# None  None  [root tree] SET
 		# []    None  [root tree in states] UNION
@@ -612,67 +1115,34 @@ class RedisJobBackend(JobBackend):
 
 	def delete_tree(self, job_id, callback, delete_indexes=True):
 		def on_found_root(root_id):
-			def on_root_tags(root_tags):
-				def on_completed(result):
-					if delete_indexes:
-						# Remove on disk archived versions if we're deleting the indexes
-						# because this will be the last trace of the job.
-						disk_paths = self._get_archive_paths(root_id)
-						for path in disk_paths:
-							if os.path.exists(path):
-								logger.debug("Removing archived job file %s.", path)
-								os.unlink(path)
-
-					callback()
-					# end of on_completed()
-
-				def on_all_jobs(all_jobs):
-					# Start removing all entries.
-					pipeline = self.redis.pipeline(True)
-
-					for child_id, metadata in all_jobs.iteritems():
-						self.configuration.job_manager.clean_misc(child_id)
-						node_id = metadata['node']
-
-						pipeline.delete(child_id)
-						pipeline.delete("%s:context" % child_id)
-						pipeline.delete("%s:parent" % child_id)
-
-						if delete_indexes or (not delete_indexes and child_id != root_id):
-							# If we're deleting indexes, remote the root pointer.
-							# However, if we're not deleting indexes, leave the root
-							# pointer in place for the root job only.
-							pipeline.delete("%s:root" % child_id)
-
-						pipeline.delete("%s:children" % child_id)
-						pipeline.srem("node:%s" % node_id, child_id)
-						for state in constants.JOB.ALL:
-							pipeline.delete("%s:children:%s" % (child_id, state))
-							pipeline.srem("node:%s:%s" % (node_id, state), child_id)
-
-					if delete_indexes:
-						# Remove the tags and the root job from
-						# the index. This means it can no longer be found.
-						for tag in root_tags:
-							pipeline.zrem("tag:%s" % tag, root_id)
-
-						pipeline.zrem("roots", root_id)
-
-					# Remove from the completed set.
-					pipeline.zrem("completed", root_id)
-
-					pipeline.execute(on_completed)
-
-				def on_found_tree(tree):
-					# Find all metadata for the jobs.
-					self.get_jobs(tree, on_all_jobs)
-					# end of on_found_tree()
+			if not root_id:
+				# No such job, so nothing to delete.
+				callback()
+				return
 
-				self.get_tree(root_id, on_found_tree)
-				# end of on_root_tags()
+			def on_removed(removed):
+				for child_id in removed:
+					self.configuration.job_manager.clean_misc(child_id)
 
-			# Fetch the root node tags.
-			self.redis.smembers("%s:tags" % root_id, callback=on_root_tags)
+				if delete_indexes and self.archive:
+					# Remove the archived version as well, as this
+					# will be the last trace of the job.
+					self._archive_call('delete', [root_id], lambda result: callback())
+				else:
+					callback()
+				# end of on_removed()
+
+			# The script removes the jobs and all their index entries
+			# in one step, on the Redis server. If we're not deleting
+			# the indexes, the root job is kept too, so the tree can
+			# still be found once it's archived.
+			args = [root_id]
+			if delete_indexes:
+				args.append('0')
+			else:
+				args.append('1')
+			args.extend(constants.JOB.ALL)
+			self._run_script('jobs_delete_tree.lua', args, on_removed)
 			# end of on_found_root()
 
 		# Find the root of the job.
@@ -696,41 +1166,43 @@ class RedisJobBackend(JobBackend):
 		# Now fetch the intersection of those sets.
 		self.redis.sunion(sets, callback=got_node_jobs)
 
-	def _get_archive_paths(self, root_id):
-		# This is for the result of get_tree(), that is the list of jobs for a given
-		# tree.
-		tree_list_path = os.path.join(self.disk_store_location, "%s_list.json" % root_id)
-
-		# This is for the result of get_jobs(), that is the dict containing information
-		# about a given tree of jobs.
-		tree_set_path = os.path.join(self.disk_store_location, "%s.json" % root_id)
-
-		return (tree_list_path, tree_set_path)
-
 	def _archive_on_disk(self, root_id, callback):
-		logger.debug("Arching job with root %s to disk.", root_id)
-		tree_list_path, tree_set_path = self._get_archive_paths(root_id)
+		logger.debug("Archiving job with root %s to disk.", root_id)
 
 		def finished_deleting():
 			callback()
 			# end of finished_deleting()
 
-		def got_jobs(jobs):
-			logger.debug("Saving jobs dict to path %s.", tree_set_path)
-			body_fp = open(tree_set_path, 'w')
-			body_fp.write(json.dumps(jobs))
-			body_fp.close()
+		def got_tree(tree):
+			tree = list(tree)
 
-			# Remove it from Redis (but not the indexes)
-			self.delete_tree(root_id, finished_deleting, delete_indexes=False)
+			if len(tree) == 0:
+				# Nothing left to archive. Just make sure
+				# we don't try again.
+				self.redis.zrem("completed", root_id, lambda result: callback())
+				return
 
-			# end of got_jobs()
+			def got_jobs(jobs):
+				# Index it by the time of the root job, the same
+				# as the roots set. The tags stay in Redis, which
+				# answers all the tag queries.
+				timestamp = None
+				if jobs.has_key(root_id):
+					timestamp = jobs[root_id].get('time')
+
+				def stored(result):
+					# Remove it from Redis, but not the indexes.
+					self.delete_tree(root_id, finished_deleting, delete_indexes=False)
+
+				def failed(message, exception=None):
+					# Leave it in Redis, to try again next time.
+					logger.error("Unable to archive job %s: %s", root_id, message)
+					if exception:
+						logger.error("Exception:", exc_info=exception)
+					callback()
 
-		def got_tree(tree):
-			logger.debug("Saving jobs tree list to path %s.", tree_list_path)
-			list_fp = open(tree_list_path, 'w')
-			list_fp.write(json.dumps(list(tree)))
-			list_fp.close()
+				self.archive_worker.call('store', [root_id, tree, jobs, timestamp], stored, failed)
+				# end of got_jobs()
 
 			self.get_jobs(tree, got_jobs)
 			# end of got_tree()
@@ -1024,6 +1496,29 @@ class JobManagerBackendTest(tornado.testing.AsyncTestCase, TestHelpers):
 		self.assertIn('child2', jobs, "Child2 wasn't ready to run.")
 		self.assertIn('child1_1', jobs, "Child1_1 wasn't ready to run.")
 
+	def test_no_node(self):
+		# Jobs added before the node has a UUID have no node.
+		self.backend.add_job(None, 'root', None, self.stop, constants.JOB.NEW)
+		self.wait()
+		self.backend.add_job(None, 'child1', 'root', self.stop, constants.JOB.NEW)
+		self.wait()
+
+		self.backend.set_state_tree('root', constants.JOB.NEW, constants.JOB.WAITING, self.stop)
+		self.wait()
+		self.backend.set_attrs('child1', {'state': constants.JOB.SUCCESS}, self.stop)
+		job = self.wait()
+		self.assertEquals(job['state'], constants.JOB.SUCCESS, "State was not changed.")
+
+		self.backend.get_node_jobs(None, self.stop, state=constants.JOB.WAITING)
+		jobs = self.wait()
+		self.assertEquals(set(jobs), set(['root']), "Node index was not updated.")
+
+		self.backend.delete_tree('root', self.stop)
+		self.wait()
+		self.backend.get_node_jobs(None, self.stop)
+		jobs = self.wait()
+		self.assertEquals(len(jobs), 0, "Jobs were not removed from the node index.")
+
 	def test_tree_change_multinode(self):
 		self.backend.add_job('here', 'root', None, self.stop, constants.JOB.NEW)
 		self.wait()
@@ -1060,9 +1555,482 @@ class JobManagerBackendTest(tornado.testing.AsyncTestCase, TestHelpers):
 		tree = self.wait()
 		self.assertEquals(len(tree), 3, "Failed to fetch the tree.")
 
+	def test_tree_change_filtered(self):
+		self.backend.add_job('here', 'root', None, self.stop, constants.JOB.WAITING)
+		self.wait()
+		self.backend.add_job('here', 'child1', 'root', self.stop, constants.JOB.RUNNING)
+		self.wait()
+		self.backend.add_job('here', 'child2', 'root', self.stop, constants.JOB.SUCCESS)
+		self.wait()
+		self.backend.add_job('there', 'child1_1', 'child1', self.stop, constants.JOB.WAITING)
+		self.wait()
+
+		# Abort only the waiting and running jobs on 'here'.
+		self.backend.set_state_tree('child1', [constants.JOB.WAITING, constants.JOB.RUNNING], constants.JOB.ABORTED, self.stop, node='here')
+		changed = self.wait()
+		self.assertEquals(changed, set(['root', 'child1']), "Wrong jobs were changed.")
+
+		self.backend.get_children('root', self.stop, constants.JOB.ABORTED)
+		children = self.wait()
+		self.assertEquals(children, set(['child1']), "Child state sets were not updated.")
+
+		self.backend.get_node_jobs('here', self.stop, state=constants.JOB.RUNNING)
+		jobs = self.wait()
+		self.assertEquals(len(jobs), 0, "Node state sets were not updated.")
+
+		self.backend.get_job('child2', self.stop)
+		job = self.wait()
+		self.assertEquals(job['state'], constants.JOB.SUCCESS, "Job in another state was changed.")
+
+		# The root job finished, so it should be queued for archiving.
+		self.backend.redis.zrank('completed', 'root', self.stop)
+		rank = self.wait()
+		self.assertNotEquals(rank, None, "Root job was not marked as completed.")
+
+		# Now change everything that's left, regardless of state.
+		self.backend.set_state_tree('root', None, constants.JOB.ABORTED, self.stop)
+		changed = self.wait()
+		self.assertEquals(changed, set(['child2', 'child1_1']), "Wrong jobs were changed.")
+
+		self.backend.get_tree('root', self.stop, state=constants.JOB.ABORTED)
+		tree = self.wait()
+		self.assertEquals(len(tree), 4, "Not all jobs were changed.")
+
+		# Unknown jobs change nothing.
+		self.backend.set_state_tree('nope', None, constants.JOB.ABORTED, self.stop)
+		changed = self.wait()
+		self.assertEquals(len(changed), 0, "Changed jobs that don't exist.")
+
+	def test_ready_index(self):
+		# NOTE: This test is Redis backend specific.
+		self.backend.add_job('here', 'root', None, self.stop, constants.JOB.WAITING)
+		self.wait()
+
+		# With no children, it's ready straight away.
+		self.backend.get_ready_to_run('here', constants.JOB.WAITING, constants.JOB.SUCCESS, self.stop)
+		jobs = self.wait()
+		self.assertEquals(jobs, set(['root']), "Root should be ready.")
+
+		# Adding children makes it no longer ready.
+		self.backend.add_job('here', 'child1', 'root', self.stop, constants.JOB.NEW)
+		self.wait()
+		self.backend.add_job('there', 'child2', 'root', self.stop, constants.JOB.NEW)
+		self.wait()
+
+		self.backend.get_ready_to_run('here', constants.JOB.WAITING, constants.JOB.SUCCESS, self.stop)
+		jobs = self.wait()
+		self.assertEquals(len(jobs), 0, "Root should not be ready.")
+
+		self.backend.redis.smembers('node:here:ready', self.stop)
+		members = self.wait()
+		self.assertEquals(len(members), 0, "Stale entry was not removed from the ready set.")
+
+		# Each child becomes ready as it moves to waiting, on it's own node.
+		self.backend.set_state_tree('root', constants.JOB.NEW, constants.JOB.WAITING, self.stop)
+		self.wait()
+		self.backend.get_ready_to_run('there', constants.JOB.WAITING, constants.JOB.SUCCESS, self.stop)
+		jobs = self.wait()
+		self.assertEquals(jobs, set(['child2']), "Child2 should be ready.")
+
+		# Running jobs are no longer ready.
+		self.backend.set_attrs('child1', {'state': constants.JOB.RUNNING}, self.stop)
+		job = self.wait()
+		self.assertEquals(job['state'], constants.JOB.RUNNING, "Job data was not returned.")
+		self.backend.get_ready_to_run('here', constants.JOB.WAITING, constants.JOB.SUCCESS, self.stop)
+		jobs = self.wait()
+		self.assertEquals(len(jobs), 0, "Nothing should be ready.")
+
+		# The parent becomes ready only once the last child succeeds.
+		self.backend.set_attrs('child1', {'state': constants.JOB.SUCCESS, 'summary': 'Done.'}, self.stop)
+		job = self.wait()
+		self.assertEquals(job['summary'], 'Done.', "Other attributes were not stored.")
+		self.backend.get_ready_to_run('here', constants.JOB.WAITING, constants.JOB.SUCCESS, self.stop)
+		jobs = self.wait()
+		self.assertEquals(len(jobs), 0, "Root should not be ready yet.")
+
+		self.backend.set_attrs('child2', {'state': constants.JOB.SUCCESS}, self.stop)
+		self.wait()
+		self.backend.get_ready_to_run('here', constants.JOB.WAITING, constants.JOB.SUCCESS, self.stop)
+		jobs = self.wait()
+		self.assertEquals(jobs, set(['root']), "Root should now be ready.")
+
+		# Jobs missing from the index are found on the first check
+		# after connecting.
+		self.backend.redis.delete('node:here:ready', callback=self.stop)
+		self.wait()
+		self.backend.ready_index_checked = False
+		self.backend.get_ready_to_run('here', constants.JOB.WAITING, constants.JOB.SUCCESS, self.stop)
+		jobs = self.wait()
+		self.assertEquals(jobs, set(['root']), "Ready index was not rebuilt.")
+
+	def test_claim_jobs(self):
+		self.backend.add_job('here', 'root', None, self.stop, constants.JOB.WAITING, plugin='test', parameters={'a': 1})
+		self.wait()
+		self.backend.add_job('here', 'child1', 'root', self.stop, constants.JOB.WAITING, plugin='test')
+		self.wait()
+		self.backend.add_job('here', 'child2', 'root', self.stop, constants.JOB.WAITING, plugin='test')
+		self.wait()
+		self.backend.add_job('there', 'child3', 'root', self.stop, constants.JOB.WAITING, plugin='test')
+		self.wait()
+		self.backend.store_context('root', {'foo': 'bar'}, self.stop)
+		self.wait()
+
+		self.backend.set_attrs('child2', {'state': constants.JOB.ABORTED}, self.stop)
+		self.wait()
+
+		# Only the jobs that are ready, and on the node, are claimed.
+		self.backend.claim_jobs('here', ['root', 'child1', 'child2', 'child3', 'missing'], self.stop)
+		claimed = self.wait()
+		self.assertEquals(claimed.keys(), ['child1'], "Wrong jobs claimed.")
+
+		job, context = claimed['child1']
+		self.assertEquals(job['state'], constants.JOB.RUNNING, "Job was not marked as running.")
+		self.assertEquals(job['plugin'], 'test', "Job metadata was not returned.")
+		self.assertEquals(context, {'foo': 'bar'}, "Context was not returned.")
+
+		self.backend.get_node_jobs('here', self.stop, state=constants.JOB.RUNNING)
+		running = self.wait()
+		self.assertEquals(running, set(['child1']), "State index was not updated.")
+
+		# It can't be claimed twice.
+		self.backend.claim_jobs('here', ['child1'], self.stop)
+		claimed = self.wait()
+		self.assertEquals(claimed, {}, "Job was claimed twice.")
+
+		self.backend.claim_jobs('here', [], self.stop)
+		claimed = self.wait()
+		self.assertEquals(claimed, {}, "Claimed jobs from nothing.")
+
+	def test_stuck_jobs(self):
+		for job_id, plugin in [('slow', 'slow'), ('fast', 'fast'), ('other', 'other'), ('waiting', 'other')]:
+			self.backend.add_job('here', job_id, None, self.stop, constants.JOB.WAITING, plugin=plugin)
+			self.wait()
+
+		self.backend.claim_jobs('here', ['slow', 'fast', 'other'], self.stop)
+		self.wait()
+
+		self.backend.redis.zrange('running', 0, -1, False, self.stop)
+		running = self.wait()
+		self.assertEquals(set(running), set(['slow', 'fast', 'other']), "Running index was not updated.")
+
+		# Nothing has been running long enough yet.
+		self.backend.find_stuck_jobs(60, {'fast': 10}, self.stop)
+		stuck = self.wait()
+		self.assertEquals(stuck, [], "Jobs found stuck too early.")
+
+		# Pretend they started a while ago.
+		for job_id in running:
+			self.backend.redis.zadd('running', time.time() - 30, job_id, callback=self.stop)
+			self.wait()
+
+		self.backend.find_stuck_jobs(60, {'fast': 10}, self.stop)
+		stuck = self.wait()
+		self.assertEquals([job['job_id'] for job in stuck], ['fast'], "Per plugin timeout not applied.")
+		self.assertEquals(stuck[0]['node'], 'here', "Node not returned.")
+		self.assertEquals(stuck[0]['plugin'], 'fast', "Plugin not returned.")
+
+		self.backend.find_stuck_jobs(20, {'slow': 0}, self.stop)
+		stuck = self.wait()
+		self.assertEquals(set([job['job_id'] for job in stuck]), set(['fast', 'other']), "Default timeout not applied.")
+
+		# Fail them all in one go. Only running jobs are changed.
+		self.backend.set_state_list(['fast', 'other', 'waiting'], constants.JOB.RUNNING, constants.JOB.FAILED, self.stop, summary='Timed out.')
+		changed = self.wait()
+		self.assertEquals(changed, set(['fast', 'other']), "Wrong jobs changed.")
+
+		self.backend.get_job('fast', self.stop)
+		job = self.wait()
+		self.assertEquals(job['state'], constants.JOB.FAILED, "State was not changed.")
+		self.assertEquals(job['summary'], 'Timed out.', "Summary was not stored.")
+
+		self.backend.redis.zrange('running', 0, -1, False, self.stop)
+		running = self.wait()
+		self.assertEquals(running, ['slow'], "Finished jobs were not removed from the running index.")
+
+	def test_job_limits(self):
+		for job_id in ['deploy1', 'deploy2', 'deploy3']:
+			self.backend.add_job('here', job_id, None, self.stop, constants.JOB.WAITING, plugin='unpack')
+			self.wait()
+		self.backend.add_job('here', 'health', None, self.stop, constants.JOB.WAITING, plugin='health')
+		self.wait()
+
+		limits = {
+			'max_running': 3,
+			'reserved': 1,
+			'plugins': {},
+			'priorities': {'health': 10}
+		}
+
+		# The priority job takes the reserved slot, and the
+		# oldest jobs take the general slots.
+		self.backend.get_ready_to_run('here', constants.JOB.WAITING, constants.JOB.SUCCESS, self.stop, limits=limits)
+		jobs = self.wait()
+		self.assertEquals(jobs, set(['health', 'deploy1', 'deploy2']), "Wrong jobs chosen to run.")
+
+		# Jobs that are starting count towards the limit.
+		self.backend.get_ready_to_run('here', constants.JOB.WAITING, constants.JOB.SUCCESS, self.stop, limits=limits, starting=['deploy1', 'deploy2'])
+		jobs = self.wait()
+		self.assertEquals(jobs, set(['health']), "Starting jobs were not counted.")
+
+		# Once the reserved slot is in use, priority jobs
+		# can use the general slots too.
+		ready = [('deploy3', 'unpack', 1.0), ('health2', 'health', 2.0)]
+		chosen = self.backend._apply_limits(ready, ['health', 'unpack'], limits)
+		self.assertEquals(chosen, set(['health2']), "Priority job didn't use a general slot.")
+		chosen = self.backend._apply_limits(ready[:1], ['health', 'health'], limits)
+		self.assertEquals(chosen, set(['deploy3']), "Running priority jobs took too many general slots.")
+
+		# With a single slot, and none reserved, jobs without a
+		# priority still start once the slot is free.
+		single = {'max_running': 1, 'reserved': 0, 'plugins': {}, 'priorities': {'health': 10}}
+		ready = [('deploy1', 'unpack', 1.0), ('health', 'health', 2.0)]
+		chosen = self.backend._apply_limits(ready, [], single)
+		self.assertEquals(chosen, set(['health']), "Priority job was not chosen first.")
+		chosen = self.backend._apply_limits(ready[:1], [], single)
+		self.assertEquals(chosen, set(['deploy1']), "Job without a priority did not start.")
+		chosen = self.backend._apply_limits(ready[:1], ['health'], single)
+		self.assertEquals(chosen, set(), "Single slot was exceeded.")
+
+		# Limit a single plugin.
+		limits['max_running'] = 0
+		limits['plugins'] = {'unpack': 1}
+		self.backend.get_ready_to_run('here', constants.JOB.WAITING, constants.JOB.SUCCESS, self.stop, limits=limits)
+		jobs = self.wait()
+		self.assertEquals(jobs, set(['health', 'deploy1']), "Plugin limit was not applied.")
+
+		self.backend.set_attrs('deploy1', {'state': constants.JOB.RUNNING}, self.stop)
+		self.wait()
+		self.backend.get_ready_to_run('here', constants.JOB.WAITING, constants.JOB.SUCCESS, self.stop, limits=limits)
+		jobs = self.wait()
+		self.assertEquals(jobs, set(['health']), "Running jobs were not counted.")
+
+		# Without limits, everything is ready.
+		self.backend.get_ready_to_run('here', constants.JOB.WAITING, constants.JOB.SUCCESS, self.stop)
+		jobs = self.wait()
+		self.assertEquals(jobs, set(['health', 'deploy2', 'deploy3']), "Limits applied when not requested.")
+
+	def test_add_tree(self):
+		jobs = [
+			{'node': 'here', 'job_id': 'root', 'parent_id': None, 'state': constants.JOB.NEW, 'tags': ['foo'], 'context': {'a': 1}},
+			{'node': 'here', 'job_id': 'child1', 'parent_id': 'root', 'state': constants.JOB.NEW, 'title': 'Child 1'},
+			{'node': 'there', 'job_id': 'child1_1', 'parent_id': 'child1', 'state': constants.JOB.NEW, 'context': {'a': 2, 'b': 3}},
+			{'node': 'here', 'job_id': 'child2', 'parent_id': 'root', 'state': constants.JOB.NEW, 'tags': ['bar']}
+		]
+		self.backend.add_tree(jobs, self.stop)
+		self.wait()
+
+		self.backend.get_tree('child1_1', self.stop)
+		tree = self.wait()
+		self.assertEquals(len(tree), 4, "Failed to fetch the whole tree.")
+
+		self.backend.get_children('root', self.stop, constants.JOB.NEW)
+		children = self.wait()
+		self.assertEquals(children, set(['child1', 'child2']), "Children were not linked correctly.")
+
+		self.backend.get_root('child1_1', self.stop)
+		root = self.wait()
+		self.assertEquals(root, 'root', "Root is not root.")
+
+		self.backend.get_job('child1', self.stop)
+		job = self.wait()
+		self.assertEquals(job['title'], 'Child 1', "Job parameters were not stored.")
+		self.assertEquals(job['parent_id'], 'root', "Parent was not stored.")
+
+		self.backend.get_node_jobs('there', self.stop)
+		jobs = self.wait()
+		self.assertEquals(jobs, set(['child1_1']), "Node index was not updated.")
+
+		# Contexts are merged onto the root, in order.
+		self.backend.get_context('child2', self.stop)
+		context = self.wait()
+		self.assertEquals(context['a'], 2, "Context was not merged in order.")
+		self.assertEquals(context['b'], 3, "Context was not merged.")
+
+		# Tags from anywhere in the tree apply to the root.
+		for tag in ['foo', 'bar']:
+			self.backend.find_by_tag(tag, self.stop)
+			tagged_jobs = self.wait()
+			self.assertEquals(tagged_jobs, ['root'], "Root was not tagged.")
+
+		# Graft another tree onto an existing job.
+		jobs = [
+			{'node': 'here', 'job_id': 'child2_1', 'parent_id': 'child2', 'state': constants.JOB.NEW},
+			{'node': 'here', 'job_id': 'child2_1_1', 'parent_id': 'child2_1', 'state': constants.JOB.NEW}
+		]
+		self.backend.add_tree(jobs, self.stop)
+		self.wait()
+
+		self.backend.get_root('child2_1_1', self.stop)
+		root = self.wait()
+		self.assertEquals(root, 'root', "Grafted job has the wrong root.")
+
+		self.backend.get_tree('root', self.stop)
+		tree = self.wait()
+		self.assertEquals(len(tree), 6, "Grafted jobs are not in the tree.")
+
+	def test_find_by_tags(self):
+		for i in range(5):
+			tags = ['workspace:1']
+			if i % 2 == 0:
+				tags.append('application:%d' % i)
+				tags.append('even')
+			state = constants.JOB.NEW
+			if i == 4:
+				state = constants.JOB.SUCCESS
+			jobs = [
+				{'node': 'here', 'job_id': 'root%d' % i, 'parent_id': None, 'state': state, 'tags': tags}
+			]
+			self.backend.add_tree(jobs, self.stop)
+			self.wait()
+
+		self.backend.find_by_tags(['workspace:1'], self.on_tag_page, limit=10)
+		job_ids, cursor = self.wait()
+		self.assertEquals(len(job_ids), 5, "Wrong number of jobs returned.")
+		self.assertEquals(cursor, None, "Cursor returned for the last page.")
+
+		# Tags are intersected.
+		self.backend.find_by_tags(['workspace:1', 'even'], self.on_tag_page, limit=10)
+		job_ids, cursor = self.wait()
+		self.assertEquals(set(job_ids), set(['root0', 'root2', 'root4']), "Tags were not intersected.")
+
+		self.backend.find_by_tags(['even', 'application:2'], self.on_tag_page, limit=10)
+		job_ids, cursor = self.wait()
+		self.assertEquals(job_ids, ['root2'], "Tags were not intersected.")
+
+		# Filter by the state of the root job.
+		self.backend.find_by_tags(['even'], self.on_tag_page, limit=10, state=constants.JOB.SUCCESS)
+		job_ids, cursor = self.wait()
+		self.assertEquals(job_ids, ['root4'], "State was not filtered.")
+
+		# Page through them, two at a time.
+		seen = []
+		cursor = None
+		pages = 0
+		while True:
+			self.backend.find_by_tags(['workspace:1'], self.on_tag_page, limit=2, cursor=cursor)
+			job_ids, cursor = self.wait()
+			self.assertTrue(len(job_ids) <= 2, "Page is too large.")
+			seen.extend(job_ids)
+			pages += 1
+			if not cursor:
+				break
+
+		self.assertEquals(len(seen), 5, "Jobs were skipped or repeated while paging.")
+		self.assertEquals(set(seen), set(['root%d' % i for i in range(5)]), "Jobs were skipped while paging.")
+		self.assertTrue(pages >= 3, "Jobs were not paged.")
+
+	def test_status_routing(self):
+		jobs = [
+			{'node': 'here', 'job_id': 'root', 'parent_id': None, 'state': constants.JOB.NEW},
+			{'node': 'there', 'job_id': 'child1', 'parent_id': 'root', 'state': constants.JOB.NEW},
+			{'node': 'here', 'job_id': 'child2', 'parent_id': 'root', 'state': constants.JOB.NEW}
+		]
+		self.backend.add_tree(jobs, self.stop)
+		self.wait()
+
+		self.backend.redis.smembers('root:nodes', self.stop)
+		nodes = self.wait()
+		self.assertEquals(nodes, set(['here', 'there']), "Nodes in the tree were not recorded.")
+
+		# The message goes to every node except the one that sent it.
+		body = json.dumps(
+			{
+				'job_id': 'child1',
+				'state': constants.JOB.RUNNING,
+				'source': 'there',
+				'summary': None,
+				'parent_id': 'root'
+			}
+		)
+		self.backend._run_script(
+			'jobs_publish_status.lua',
+			['child1', 'there', body, JOB_STATUS_CHANNEL],
+			self.stop
+		)
+		sent = self.wait()
+		self.assertEquals(sent, 1, "Message was not sent to the other node.")
+
+		self.backend.delete_tree('root', self.stop)
+		self.wait()
+
+		self.backend.redis.exists('root:nodes', self.stop)
+		exists = self.wait()
+		self.assertFalse(exists, "Nodes set was not removed.")
+
+	def test_encoding_migration(self):
+		# NOTE: This test is Redis backend specific.
+		# Let the conversion started with the backend finish first,
+		# otherwise it can convert some of the jobs below and then
+		# mark the encoding as current after it's been cleared.
+		version = None
+		while version is None:
+			self.short_wait_hack()
+			self.backend.redis.get('jobs:encoding', self.stop)
+			version = self.wait()
+
+		self.backend.add_job('here', 'root', None, self.stop, constants.JOB.WAITING, title='Old job', parameters={'a': [1, 2]})
+		self.wait()
+		self.backend.add_job('here', 'child', 'root', self.stop, constants.JOB.NEW)
+		self.wait()
+		self.backend.add_job('here', 'root2', None, self.stop, constants.JOB.NEW)
+		self.wait()
+
+		# Rewrite the jobs as they would have been stored
+		# before the encoding was versioned.
+		for job_id in ['root', 'child', 'root2']:
+			self.backend.redis.hgetall(job_id, self.stop)
+			raw = self.wait()
+			legacy = {}
+			for key, value in codec.decode_record(raw).iteritems():
+				legacy[key] = json.dumps(value)
+			self.backend.redis.hmset(job_id, legacy, self.stop)
+			self.wait()
+
+		self.backend.redis.delete('jobs:encoding', callback=self.stop)
+		self.wait()
+
+		# Older values are still readable, including by the scripts.
+		self.backend.get_job('root', self.stop)
+		job = self.wait()
+		self.assertEquals(job['title'], 'Old job', "Couldn't read old job.")
+		self.assertEquals(job['parameters'], {'a': [1, 2]}, "Couldn't read old job.")
+
+		self.backend.set_attrs('child', {'state': constants.JOB.SUCCESS}, self.stop)
+		job = self.wait()
+		self.assertEquals(job['state'], constants.JOB.SUCCESS, "Couldn't change state of old job.")
+
+		self.backend.get_ready_to_run('here', constants.JOB.WAITING, constants.JOB.SUCCESS, self.stop)
+		ready = self.wait()
+		self.assertEquals(ready, set(['root']), "Old job was not ready to run.")
+
+		self.backend.get_job('root', self.stop)
+		before = self.wait()
+
+		# Now convert them, a tree at a time, so it has to page past
+		# the trees it's already done.
+		self.backend._migrate_encoding(self.stop, limit=1)
+		self.wait()
+
+		for job_id in ['root', 'child', 'root2']:
+			self.backend.redis.hgetall(job_id, self.stop)
+			raw = self.wait()
+			for key, value in raw.iteritems():
+				self.assertTrue(codec.is_current(value), "Value %s of %s was not converted." % (key, job_id))
+
+		self.backend.get_job('root', self.stop)
+		converted = self.wait()
+		self.assertEquals(converted, before, "Job changed when converted.")
+
+		self.backend.redis.get('jobs:encoding', self.stop)
+		version = self.wait()
+		self.assertEquals(int(version), codec.ENCODING_VERSION, "Encoding version not recorded.")
+
 	def on_job_status_update(self, message):
 		self.stop(message)
 
+	def on_tag_page(self, job_ids, cursor):
+		self.stop((job_ids, cursor))
+
 	def test_pubsub(self):
 		# Subscribe so we can catch the status update as it comes out.
 		nodeuuid = str(uuid.uuid4())
@@ -1115,10 +2083,7 @@ class JobManagerBackendTest(tornado.testing.AsyncTestCase, TestHelpers):
 		jobs_list = self.wait()
 
 		# Make sure the on disk archive doesn't exist.
-		list_path, store_path = self.backend._get_archive_paths(root_id)
-
-		self.assertFalse(os.path.exists(list_path), "Archive already exists?")
-		self.assertFalse(os.path.exists(store_path), "Archive already exists?")
+		self.assertFalse(self.backend.archive.has_tree(root_id), "Archive already exists?")
 
 		# Manually run an archive run. Setting the older_than make it go into
 		# the future.
@@ -1126,8 +2091,23 @@ class JobManagerBackendTest(tornado.testing.AsyncTestCase, TestHelpers):
 		self.wait()
 
 		# Now check that the archives do exist.
-		self.assertTrue(os.path.exists(list_path), "Archive doesn't exist.")
-		self.assertTrue(os.path.exists(store_path), "Archive doesn't exist.")
+		self.assertTrue(self.backend.archive.has_tree(root_id), "Archive doesn't exist.")
+
+		# And that the tree was removed from Redis.
+		self.backend.redis.exists('child1', self.stop)
+		exists = self.wait()
+		self.assertFalse(exists, "Job was not removed from Redis.")
+		# The root job and the indexes stay, so other nodes can find it.
+		self.backend.redis.exists('root', self.stop)
+		exists = self.wait()
+		self.assertTrue(exists, "Root job was removed from Redis.")
+		self.backend.redis.exists('tag:foo', self.stop)
+		exists = self.wait()
+		self.assertTrue(exists, "Tag index was removed from Redis.")
+		self.backend.find_by_tags(['foo'], self.on_tag_page, state=constants.JOB.SUCCESS)
+		tagged_jobs, cursor = self.wait()
+		self.assertEquals(tagged_jobs, [root_id], "Couldn't find archived job by tag and state.")
+		self.assertEquals(cursor, None, "Cursor returned for the last page.")
 
 		# Check that you can still fetch the job tree.
 		self.backend.get_tree(root_id, self.stop)
@@ -1142,6 +2122,30 @@ class JobManagerBackendTest(tornado.testing.AsyncTestCase, TestHelpers):
 
 		# print str(disk_jobs_detail)
 		self.assertTrue(isinstance(disk_jobs_detail, dict), "Returned object was not a dict.")
+		self.assertEquals(len(disk_jobs_detail), len(jobs_list), "Not all jobs were returned.")
+
+		# Archived jobs can be fetched by ID, without the root.
+		self.backend.get_jobs(['child1_1', 'root2'], self.stop)
+		mixed_jobs = self.wait()
+		self.assertEquals(set(mixed_jobs.keys()), set(['child1_1', 'root2']), "Archived and live jobs were not merged.")
+
+		self.backend.get_root('child1_1', self.stop)
+		archived_root = self.wait()
+		self.assertEquals(archived_root, root_id, "Root of archived job not found.")
+
+		# Live trees are fetched from Redis, without waiting on the archive.
+		self.backend.archive.lock.acquire()
+		try:
+			self.backend.get_tree('root2', self.stop)
+			live_tree = self.wait()
+		finally:
+			self.backend.archive.lock.release()
+		self.assertEquals(set(live_tree), set(['root2']), "Live tree was not fetched from Redis.")
+
+		# Old archived jobs are still found for cleanup.
+		self.backend.find_older_than(time.time() + 10, self.stop)
+		old_jobs = self.wait()
+		self.assertIn(root_id, old_jobs, "Archived job not found by age.")
 
 		# Try to find the job by tag. That should still exist.
 		self.backend.find_by_tag('foo', self.stop)
@@ -1156,4 +2160,8 @@ class JobManagerBackendTest(tornado.testing.AsyncTestCase, TestHelpers):
 		self.backend.find_by_tag('foo', self.stop)
 		tagged_jobs = self.wait()
 
-		self.assertEquals(len(tagged_jobs), 0, "Found job still when it should have been deleted.")
\ No newline at end of file
+		self.assertEquals(len(tagged_jobs), 0, "Found job still when it should have been deleted.")
+		self.assertFalse(self.backend.archive.has_tree(root_id), "Archive was not deleted.")
+		self.backend.redis.exists('root', self.stop)
+		exists = self.wait()
+		self.assertFalse(exists, "Root job was not removed from Redis.")
\ No newline at end of file
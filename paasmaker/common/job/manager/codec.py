@@ -0,0 +1,153 @@
+#
+# Paasmaker - Platform as a Service
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+
+import json
+import zlib
+import struct
+import unittest
+
+import paasmaker
+
+# The encoding used for job hash values in Redis. Each value starts
+# with a single type byte, that also identifies the encoding version.
+# Values written before this encoding existed are plain JSON, which
+# can never start with one of these bytes.
+#
+# Version 1 type bytes:
+# \x01 - A string, stored as raw UTF-8.
+# \x02 - None.
+# \x03 - Anything else, stored as compact JSON.
+# \x04 - A float, stored as a packed little endian double.
+# \x05 - Like \x03, but zlib compressed. Used for large values.
+#
+# NOTE: The Lua scripts decode the string and None types, so
+# they need to be updated if this changes. See jobs_common.lua.
+ENCODING_VERSION = 1
+
+TYPE_STRING = '\x01'
+TYPE_NONE = '\x02'
+TYPE_JSON = '\x03'
+TYPE_FLOAT = '\x04'
+TYPE_COMPRESSED_JSON = '\x05'
+
+VERSION_1_TYPES = set([TYPE_STRING, TYPE_NONE, TYPE_JSON, TYPE_FLOAT, TYPE_COMPRESSED_JSON])
+
+# JSON values longer than this are compressed.
+COMPRESS_THRESHOLD = 512
+
+def encode_value(value):
+	"""
+	Encode a single value for storage in a job hash.
+	"""
+	if isinstance(value, unicode):
+		return TYPE_STRING + value.encode('utf-8')
+	elif isinstance(value, str):
+		return TYPE_STRING + value
+	elif value is None:
+		return TYPE_NONE
+	elif isinstance(value, float):
+		return TYPE_FLOAT + struct.pack('<d', value)
+	else:
+		encoded = json.dumps(
+			value,
+			cls=paasmaker.util.jsonencoder.JsonEncoder,
+			separators=(',', ':')
+		)
+		if len(encoded) > COMPRESS_THRESHOLD:
+			return TYPE_COMPRESSED_JSON + zlib.compress(encoded)
+		return TYPE_JSON + encoded
+
+def decode_value(value):
+	"""
+	Decode a single value from a job hash. Handles both the current
+	encoding and the older plain JSON encoding.
+	"""
+	if not value:
+		return None
+
+	value_type = value[0]
+	if value_type == TYPE_STRING:
+		return value[1:].decode('utf-8')
+	elif value_type == TYPE_NONE:
+		return None
+	elif value_type == TYPE_JSON:
+		return json.loads(value[1:])
+	elif value_type == TYPE_FLOAT:
+		return struct.unpack('<d', value[1:])[0]
+	elif value_type == TYPE_COMPRESSED_JSON:
+		return json.loads(zlib.decompress(value[1:]))
+	else:
+		# Written before the encoding was versioned.
+		return json.loads(value)
+
+def is_current(value):
+	"""
+	Check if the encoded value uses the current encoding.
+	"""
+	return len(value) > 0 and value[0] in VERSION_1_TYPES
+
+def encode_record(values):
+	"""
+	Encode all the values of the given dict.
+	"""
+	out = {}
+	for key, value in values.iteritems():
+		out[key] = encode_value(value)
+	return out
+
+def decode_record(values):
+	"""
+	Decode all the values of the given dict.
+	"""
+	result = {}
+	for key, value in values.iteritems():
+		result[key] = decode_value(value)
+	return result
+
+class JobCodecTest(unittest.TestCase):
+	def test_round_trip(self):
+		values = {
+			'job_id': u'9b7f4b0c-7ed3-4e1b-9b8c-55b4e1d7c0a1',
+			'unicode': u'caf\xe9',
+			'parent_id': None,
+			'time': 1370000000.123456,
+			'count': 12,
+			'enabled': True,
+			'parameters': {'application_id': 1, 'names': ['a', 'b']},
+			'large': {'data': 'x' * (COMPRESS_THRESHOLD * 2)}
+		}
+
+		encoded = encode_record(values)
+		for key, value in encoded.iteritems():
+			self.assertTrue(is_current(value), "Value for %s is not in the current encoding." % key)
+
+		self.assertEquals(encoded['parent_id'], TYPE_NONE, "None is not compact.")
+		self.assertEquals(encoded['large'][0], TYPE_COMPRESSED_JSON, "Large value was not compressed.")
+		self.assertEquals(decode_record(encoded), values, "Values did not survive encoding.")
+
+		# Strings are stored as unicode, like JSON would return them.
+		self.assertTrue(isinstance(decode_value(encode_value('plain')), unicode), "String not decoded to unicode.")
+
+	def test_legacy(self):
+		legacy = {
+			'state': json.dumps('SUCCESS'),
+			'parent_id': json.dumps(None),
+			'time': json.dumps(1370000000.5),
+			'parameters': json.dumps({'a': 1}),
+			'empty': ''
+		}
+
+		for value in legacy.values():
+			self.assertFalse(is_current(value), "Legacy value detected as current.")
+
+		decoded = decode_record(legacy)
+		self.assertEquals(decoded['state'], 'SUCCESS', "Legacy string not decoded.")
+		self.assertEquals(decoded['parent_id'], None, "Legacy None not decoded.")
+		self.assertEquals(decoded['time'], 1370000000.5, "Legacy float not decoded.")
+		self.assertEquals(decoded['parameters'], {'a': 1}, "Legacy dict not decoded.")
+		self.assertEquals(decoded['empty'], None, "Empty value not decoded.")
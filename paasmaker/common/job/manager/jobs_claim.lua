@@ -0,0 +1,30 @@
+
+-- NOTES:
+-- Claims jobs on a node for running. Each job that is still ready to
+-- run is moved to the RUNNING state, and it's metadata and the context
+-- of it's tree are returned, all in one atomic step. Relies on
+-- jobs_common.lua.
+-- Jobs that are no longer ready (for example, they were aborted since
+-- they were found) are left alone.
+-- Returns {job_id, {job hash}, {context hash}, ...} for the claimed
+-- jobs, with the hashes as flat lists of keys and values.
+
+-- Assign the inputs to nicer names.
+local node = ARGV[1]
+local now = ARGV[2]
+
+local claimed = {}
+
+for i = 3, #ARGV do
+	local job_id = ARGV[i]
+	local job = load_job(job_id)
+	if job and job.node == node and is_ready(job_id, job) then
+		change_state(job_id, job, RUNNING, false, now)
+
+		table.insert(claimed, job_id)
+		table.insert(claimed, redis.call('hgetall', job_id))
+		table.insert(claimed, redis.call('hgetall', job.root_id .. ':context'))
+	end
+end
+
+return claimed
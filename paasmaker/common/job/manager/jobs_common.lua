@@ -0,0 +1,151 @@
+
+-- NOTES:
+-- Shared functions for the job backend scripts. The backend prepends
+-- this file to each jobs_*.lua script when it loads them into Redis,
+-- so anything defined here is available to all of them.
+-- Job hash values are stored in the encoding described in codec.py.
+
+-- These MUST match paasmaker.common.core.constants.JOB.
+local WAITING = 'WAITING'
+local RUNNING = 'RUNNING'
+local SUCCESS = 'SUCCESS'
+
+-- These MUST match the type bytes in codec.py.
+local TYPE_STRING = 1
+local TYPE_NONE = 2
+local TYPE_JSON = 3
+local LAST_TYPE = 5
+
+-- Decode a job hash value. Only strings and None are needed by the
+-- scripts. Values from before the encoding was versioned are JSON.
+local function decode_value(value)
+	local value_type = string.byte(value, 1)
+	local decoded
+	if value_type == TYPE_STRING then
+		return string.sub(value, 2)
+	elseif value_type == TYPE_NONE then
+		return nil
+	elseif value_type == TYPE_JSON then
+		decoded = cjson.decode(string.sub(value, 2))
+	else
+		decoded = cjson.decode(value)
+	end
+
+	if decoded == cjson.null then
+		return nil
+	end
+	return decoded
+end
+
+local function encode_string(value)
+	return string.char(TYPE_STRING) .. value
+end
+
+-- Load the fields of a job that the indexes depend on. Returns nil
+-- if the job doesn't exist.
+local function load_job(job_id)
+	local meta = redis.call('hmget', job_id, 'state', 'node', 'parent_id', 'root_id')
+	if not meta[1] or not meta[2] or not meta[4] then
+		return nil
+	end
+
+	local job = {
+		state = decode_value(meta[1]),
+		-- Jobs added without a node are indexed under 'None',
+		-- as that's what the backend writes for them.
+		node = decode_value(meta[2]) or 'None',
+		parent_id = nil,
+		root_id = decode_value(meta[4])
+	}
+
+	if meta[3] and meta[3] ~= '' then
+		job.parent_id = decode_value(meta[3])
+	end
+
+	return job
+end
+
+-- A job's outstanding dependencies are the children that are not yet
+-- successful. The children sets are updated in the same atomic step
+-- as the job state, so their cardinalities are always accurate counters.
+local function children_complete(job_id)
+	return redis.call('scard', job_id .. ':children') == redis.call('scard', job_id .. ':children:' .. SUCCESS)
+end
+
+-- Check if the job can be run right now.
+local function is_ready(job_id, job)
+	return job.state == WAITING and children_complete(job_id)
+end
+
+-- Add a job to it's node's ready set, noting the time that it became
+-- ready. Only call this when the job has just become ready. The time is
+-- a number, so it can be stored as JSON as is.
+local function mark_ready(job_id, node, now)
+	redis.call('sadd', 'node:' .. node .. ':ready', job_id)
+	redis.call('hset', job_id, 'ready_time', string.char(TYPE_JSON) .. now)
+end
+
+-- Update the ready set for a parent job after one of it's children
+-- has changed state.
+local function update_parent_ready(parent_id, now)
+	local parent = load_job(parent_id)
+	if parent then
+		if is_ready(parent_id, parent) then
+			mark_ready(parent_id, parent.node, now)
+		else
+			redis.call('srem', 'node:' .. parent.node .. ':ready', parent_id)
+		end
+	end
+end
+
+-- Change the state of a single job, already loaded with load_job(),
+-- keeping all the state index sets up to date. Returns true if the
+-- state was changed.
+local function change_state(job_id, job, to_state, finished, now)
+	local state = job.state
+	if state == to_state then
+		return false
+	end
+
+	-- Remove from the old state sets and add to new ones.
+	redis.call('srem', 'node:' .. job.node .. ':' .. state, job_id)
+	redis.call('sadd', 'node:' .. job.node .. ':' .. to_state, job_id)
+	if job.parent_id then
+		redis.call('srem', job.parent_id .. ':children:' .. state, job_id)
+		redis.call('sadd', job.parent_id .. ':children:' .. to_state, job_id)
+	end
+	redis.call('srem', job.root_id .. ':tree:' .. state, job_id)
+	redis.call('sadd', job.root_id .. ':tree:' .. to_state, job_id)
+	redis.call('hset', job_id, 'state', encode_string(to_state))
+	job.state = to_state
+
+	-- Maintain the index of when running jobs started.
+	if state == RUNNING then
+		redis.call('zrem', 'running', job_id)
+	end
+	if to_state == RUNNING then
+		redis.call('zadd', 'running', now, job_id)
+	end
+
+	-- Maintain the ready to run index for this job.
+	if state == WAITING then
+		redis.call('srem', 'node:' .. job.node .. ':ready', job_id)
+	end
+	if is_ready(job_id, job) then
+		mark_ready(job_id, job.node, now)
+	end
+
+	-- And for the parent, whose dependencies may now be satisfied.
+	if job.parent_id and (state == SUCCESS or to_state == SUCCESS) then
+		update_parent_ready(job.parent_id, now)
+	end
+
+	if finished and not job.parent_id then
+		-- A finished root job. Add it to the list to prune.
+		redis.call('zadd', 'completed', now, job_id)
+	end
+
+	return true
+end
+
+-- End of shared functions.
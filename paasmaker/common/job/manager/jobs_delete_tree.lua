@@ -0,0 +1,70 @@
+
+-- NOTES:
+-- Removes a whole tree of jobs, and every index entry that refers to
+-- them, in one atomic step. Relies on jobs_common.lua.
+-- If keep_root is '1', the root job, its root pointer, and the tag and
+-- roots indexes are kept, so the tree can still be found by every node
+-- after it's been archived. A later call without keep_root removes them.
+-- The remaining arguments are all the possible job states, so the
+-- per state sets can be removed without hard coding the states here.
+-- Returns a list of the job IDs that were removed.
+
+-- Assign the inputs to nicer names.
+local root_id = ARGV[1]
+local keep_root = ARGV[2] == '1'
+
+local states = {}
+for i = 3, #ARGV do
+	table.insert(states, ARGV[i])
+end
+
+local removed = {}
+
+for _, job_id in ipairs(redis.call('smembers', root_id .. ':tree')) do
+	local job = load_job(job_id)
+	if job then
+		-- The node indexes only contain the job in its current state.
+		local node_key = 'node:' .. job.node
+		redis.call('srem', node_key, job_id)
+		redis.call('srem', node_key .. ':' .. job.state, job_id)
+		redis.call('srem', node_key .. ':ready', job_id)
+	end
+	redis.call('zrem', 'running', job_id)
+
+	redis.call('del',
+		job_id .. ':context',
+		job_id .. ':parent',
+		job_id .. ':children'
+	)
+	if not (keep_root and job_id == root_id) then
+		redis.call('del', job_id, job_id .. ':root')
+	end
+	for _, state in ipairs(states) do
+		redis.call('del', job_id .. ':children:' .. state)
+	end
+
+	table.insert(removed, job_id)
+end
+
+if not keep_root then
+	-- Remove the root from the tag indexes. The root job itself is
+	-- removed here too, in case it was kept when the tree was archived.
+	for _, tag in ipairs(redis.call('smembers', root_id .. ':tags')) do
+		redis.call('zrem', 'tag:' .. tag, root_id)
+	end
+
+	redis.call('del', root_id, root_id .. ':root', root_id .. ':tags')
+	redis.call('zrem', 'roots', root_id)
+end
+
+redis.call('del',
+	root_id .. ':tree',
+	root_id .. ':nodes'
+)
+for _, state in ipairs(states) do
+	redis.call('del', root_id .. ':tree:' .. state)
+end
+
+redis.call('zrem', 'completed', root_id)
+
+return removed
@@ -0,0 +1,96 @@
+
+-- NOTES:
+-- Finds root jobs that have all the given tags, and optionally whose
+-- root job is in one of the given states, most recent first. Relies on
+-- jobs_common.lua.
+-- Results are paged with a cursor, which is the score and ID of the last
+-- job examined. Jobs with the same score are ordered by ID, in reverse,
+-- the same as ZREVRANGEBYSCORE does.
+-- At most max_scan jobs are examined in one call, so the cost of a call
+-- is bounded even if few jobs match. In that case, fewer than limit
+-- jobs may be returned, along with a cursor to continue from.
+-- Returns {{job_id, score, ...}, cursor_score, cursor_id}. The cursor
+-- values are empty strings once there are no more jobs to examine.
+
+-- Assign the inputs to nicer names.
+local limit = tonumber(ARGV[1])
+local max_scan = tonumber(ARGV[2])
+local cursor_score = ARGV[3]
+local cursor_id = ARGV[4]
+local tag_count = tonumber(ARGV[5])
+
+local tags = {}
+for i = 6, 5 + tag_count do
+	table.insert(tags, 'tag:' .. ARGV[i])
+end
+
+local states = {}
+local filter_states = false
+for i = 6 + tag_count, #ARGV do
+	states[ARGV[i]] = true
+	filter_states = true
+end
+
+local function matches(job_id)
+	-- The first tag set is the one being walked.
+	for i = 2, #tags do
+		if not redis.call('zscore', tags[i], job_id) then
+			return false
+		end
+	end
+
+	if filter_states then
+		local state = redis.call('hget', job_id, 'state')
+		if not state or not states[decode_value(state)] then
+			return false
+		end
+	end
+
+	return true
+end
+
+local max = '+inf'
+local cursor_number = nil
+if cursor_score ~= '' then
+	max = cursor_score
+	cursor_number = tonumber(cursor_score)
+end
+
+local found = {}
+local scanned = 0
+local offset = 0
+local last_score = ''
+local last_id = ''
+
+while #found < limit * 2 and scanned < max_scan do
+	local chunk = redis.call('zrevrangebyscore', tags[1], max, '-inf', 'WITHSCORES', 'LIMIT', offset, limit)
+	if #chunk == 0 then
+		-- Nothing more to examine.
+		return {found, '', ''}
+	end
+
+	for i = 1, #chunk, 2 do
+		local job_id = chunk[i]
+		local score = chunk[i + 1]
+		offset = offset + 1
+
+		-- Skip jobs at the cursor's score that were on a previous page.
+		local seen = cursor_number and tonumber(score) == cursor_number and job_id >= cursor_id
+		if not seen then
+			scanned = scanned + 1
+			last_score = score
+			last_id = job_id
+
+			if matches(job_id) then
+				table.insert(found, job_id)
+				table.insert(found, score)
+			end
+
+			if #found >= limit * 2 or scanned >= max_scan then
+				break
+			end
+		end
+	end
+end
+
+return {found, last_score, last_id}
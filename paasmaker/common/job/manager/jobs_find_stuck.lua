@@ -0,0 +1,66 @@
+
+-- NOTES:
+-- Finds jobs that have been running for longer than their timeout,
+-- using the index of when running jobs started. Relies on
+-- jobs_common.lua.
+-- The remaining arguments are pairs of plugin names and timeouts, for
+-- plugins that have a timeout other than the default. A timeout of 0
+-- means that the plugin never times out.
+-- Returns {job_id, node, plugin, started, ...} for at most limit jobs,
+-- longest running first.
+
+-- Assign the inputs to nicer names.
+local now = tonumber(ARGV[1])
+local default_timeout = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+
+local timeouts = {}
+-- Only jobs older than the shortest timeout need to be examined.
+local shortest = default_timeout
+for i = 4, #ARGV, 2 do
+	local timeout = tonumber(ARGV[i + 1])
+	timeouts[ARGV[i]] = timeout
+	if timeout > 0 and (shortest == 0 or timeout < shortest) then
+		shortest = timeout
+	end
+end
+
+if shortest == 0 then
+	-- Nothing can time out.
+	return {}
+end
+
+local stuck = {}
+local candidates = redis.call('zrangebyscore', 'running', '-inf', now - shortest, 'WITHSCORES')
+for i = 1, #candidates, 2 do
+	local job_id = candidates[i]
+	local started = tonumber(candidates[i + 1])
+	local values = redis.call('hmget', job_id, 'plugin', 'node')
+
+	local plugin = ''
+	if values[1] then
+		plugin = decode_value(values[1]) or ''
+	end
+	local node = ''
+	if values[2] then
+		node = decode_value(values[2]) or ''
+	end
+
+	local timeout = timeouts[plugin]
+	if timeout == nil then
+		timeout = default_timeout
+	end
+
+	if timeout > 0 and started <= now - timeout then
+		table.insert(stuck, job_id)
+		table.insert(stuck, node)
+		table.insert(stuck, plugin)
+		table.insert(stuck, candidates[i + 1])
+
+		if #stuck >= limit * 4 then
+			break
+		end
+	end
+end
+
+return stuck
@@ -0,0 +1,47 @@
+
+-- NOTES:
+-- Converts the values of every job in a tree, and the tree's context,
+-- from the older plain JSON encoding to the current encoding. Relies
+-- on jobs_common.lua. Values already in the current encoding are left
+-- alone, so this is safe to run more than once.
+-- Returns the number of values converted.
+
+-- Assign the inputs to nicer names.
+local root_id = ARGV[1]
+
+local function migrate_hash(key)
+	local raw = redis.call('hgetall', key)
+	local converted = {}
+	for i = 1, #raw, 2 do
+		local value = raw[i + 1]
+		local value_type = string.byte(value, 1)
+		if value_type and value_type > LAST_TYPE then
+			local decoded = cjson.decode(value)
+			if type(decoded) == 'string' then
+				table.insert(converted, raw[i])
+				table.insert(converted, encode_string(decoded))
+			elseif decoded == cjson.null then
+				table.insert(converted, raw[i])
+				table.insert(converted, string.char(TYPE_NONE))
+			else
+				-- Keep the original JSON, as re-encoding it here could
+				-- change it (for example, empty lists become objects).
+				table.insert(converted, raw[i])
+				table.insert(converted, string.char(TYPE_JSON) .. value)
+			end
+		end
+	end
+
+	if #converted > 0 then
+		redis.call('hmset', key, unpack(converted))
+	end
+
+	return #converted / 2
+end
+
+local count = migrate_hash(root_id .. ':context')
+for _, job_id in ipairs(redis.call('smembers', root_id .. ':tree')) do
+	count = count + migrate_hash(job_id)
+end
+
+return count
@@ -0,0 +1,31 @@
+
+-- NOTES:
+-- Publishes a job status message to the full job status feed, and to
+-- the channel of every node that has jobs in the tree
+-- that the job belongs to. The originating node is skipped, because
+-- it has already processed the message locally.
+-- Returns the number of node channels the message was sent to.
+
+-- Assign the inputs to nicer names.
+local job_id = ARGV[1]
+local source = ARGV[2]
+local message = ARGV[3]
+local channel = ARGV[4]
+
+-- The full feed, for pacemakers.
+redis.call('publish', channel, message)
+
+local root_id = redis.call('get', job_id .. ':root')
+if not root_id then
+	return 0
+end
+
+local sent = 0
+for _, node in ipairs(redis.call('smembers', root_id .. ':nodes')) do
+	if node ~= source then
+		redis.call('publish', channel .. ':' .. node, message)
+		sent = sent + 1
+	end
+end
+
+return sent
@@ -0,0 +1,75 @@
+
+-- NOTES:
+-- Returns the jobs on a node that are ready to run, from the ready set
+-- that change_state() maintains. Relies on jobs_common.lua.
+-- Jobs can be left in the ready set when children are added to them
+-- after they were marked ready, so every member is checked again here
+-- and stale entries are removed.
+-- If detail is set, the remaining arguments are jobs that the caller is
+-- starting, which are counted as running. It then returns
+-- {{job_id, plugin, time, ...}, {job_id, plugin, ...}} - the ready jobs,
+-- and the jobs running on the node, so the caller can apply its limits.
+-- The plugin and time values are still encoded.
+
+-- Assign the inputs to nicer names.
+local node = ARGV[1]
+local rebuild = ARGV[2] == '1'
+local detail = ARGV[3] == '1'
+
+local starting = {}
+for i = 4, #ARGV do
+	starting[ARGV[i]] = true
+end
+
+local ready_key = 'node:' .. node .. ':ready'
+
+if rebuild then
+	-- Add any waiting jobs that are missing from the ready set. This
+	-- handles jobs that were queued before the ready set existed.
+	for _, job_id in ipairs(redis.call('smembers', 'node:' .. node .. ':' .. WAITING)) do
+		if children_complete(job_id) then
+			redis.call('sadd', ready_key, job_id)
+		end
+	end
+end
+
+local ready = {}
+for _, job_id in ipairs(redis.call('smembers', ready_key)) do
+	local job = load_job(job_id)
+	if job and job.node == node and is_ready(job_id, job) then
+		if not starting[job_id] then
+			table.insert(ready, job_id)
+		end
+	else
+		redis.call('srem', ready_key, job_id)
+	end
+end
+
+if not detail then
+	return ready
+end
+
+local ready_detail = {}
+for _, job_id in ipairs(ready) do
+	local values = redis.call('hmget', job_id, 'plugin', 'time')
+	table.insert(ready_detail, job_id)
+	table.insert(ready_detail, values[1] or '')
+	table.insert(ready_detail, values[2] or '')
+end
+
+-- A job being started may have been marked as running already.
+local running = {}
+for _, job_id in ipairs(redis.call('smembers', 'node:' .. node .. ':' .. RUNNING)) do
+	running[job_id] = true
+end
+for job_id, _ in pairs(starting) do
+	running[job_id] = true
+end
+
+local running_detail = {}
+for job_id, _ in pairs(running) do
+	table.insert(running_detail, job_id)
+	table.insert(running_detail, redis.call('hget', job_id, 'plugin') or '')
+end
+
+return {ready_detail, running_detail}
@@ -0,0 +1,31 @@
+
+-- NOTES:
+-- Changes the state of a single job, along with any other attributes,
+-- in one atomic step. Relies on jobs_common.lua.
+-- Returns the complete job hash as a flat list of keys and values,
+-- or an empty list if the job doesn't exist.
+
+-- Assign the inputs to nicer names.
+local job_id = ARGV[1]
+local to_state = ARGV[2]
+local finished = ARGV[3] == '1'
+local now = ARGV[4]
+
+local job = load_job(job_id)
+if not job then
+	return {}
+end
+
+change_state(job_id, job, to_state, finished, now)
+
+-- Any remaining arguments are pairs of already encoded field names
+-- and values to store on the job.
+if #ARGV > 4 then
+	local fields = {}
+	for i = 5, #ARGV do
+		table.insert(fields, ARGV[i])
+	end
+	redis.call('hmset', job_id, unpack(fields))
+end
+
+return redis.call('hgetall', job_id)
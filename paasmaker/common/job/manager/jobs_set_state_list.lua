@@ -0,0 +1,31 @@
+
+-- NOTES:
+-- Changes the state of a list of jobs, that may be in different trees
+-- or on different nodes, in one atomic step. Relies on jobs_common.lua.
+-- Only jobs currently in one of the given from states are changed.
+-- The summary is already encoded, and is stored on each changed job.
+-- Returns a list of the job IDs that were changed.
+
+-- Assign the inputs to nicer names.
+local to_state = ARGV[1]
+local finished = ARGV[2] == '1'
+local now = ARGV[3]
+local summary = ARGV[4]
+local from_count = tonumber(ARGV[5])
+
+local from_states = {}
+for i = 6, 5 + from_count do
+	from_states[ARGV[i]] = true
+end
+
+local changed = {}
+for i = 6 + from_count, #ARGV do
+	local job_id = ARGV[i]
+	local job = load_job(job_id)
+	if job and from_states[job.state] and change_state(job_id, job, to_state, finished, now) then
+		redis.call('hset', job_id, 'summary', summary)
+		table.insert(changed, job_id)
+	end
+end
+
+return changed
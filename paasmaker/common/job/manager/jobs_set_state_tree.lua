@@ -0,0 +1,65 @@
+
+-- NOTES:
+-- Changes the state of a whole tree of jobs in one atomic step, keeping
+-- all the state index sets up to date. Relies on jobs_common.lua.
+-- Returns a list of the job IDs that were changed.
+
+-- Assign the inputs to nicer names.
+local root_id = ARGV[1]
+local to_state = ARGV[2]
+local node = ARGV[3]
+local finished = ARGV[4] == '1'
+local now = ARGV[5]
+
+-- Any remaining arguments are the states that jobs must currently
+-- be in to be changed. If none are supplied, all jobs are changed.
+local from_states = {}
+local from_lookup = {}
+for i = 6, #ARGV do
+	table.insert(from_states, ARGV[i])
+	from_lookup[ARGV[i]] = true
+end
+
+-- Locate the candidate jobs. Duplicates are fine; they're
+-- skipped below once they're in the target state.
+local candidates = {}
+local function collect(jobs)
+	for _, job_id in ipairs(jobs) do
+		table.insert(candidates, job_id)
+	end
+end
+
+if #from_states == 0 then
+	if node == '' then
+		collect(redis.call('smembers', root_id .. ':tree'))
+	else
+		collect(redis.call('sinter', root_id .. ':tree', 'node:' .. node))
+	end
+else
+	for _, state in ipairs(from_states) do
+		if node == '' then
+			collect(redis.call('smembers', root_id .. ':tree:' .. state))
+		else
+			collect(redis.call('sinter', root_id .. ':tree:' .. state, 'node:' .. node .. ':' .. state))
+		end
+	end
+end
+
+local changed = {}
+
+for _, job_id in ipairs(candidates) do
+	-- Skip jobs that have vanished from under us.
+	local job = load_job(job_id)
+	if job then
+		local eligible = true
+		if #from_states > 0 then
+			eligible = from_lookup[job.state] == true
+		end
+
+		if eligible and change_state(job_id, job, to_state, finished, now) then
+			table.insert(changed, job_id)
+		end
+	end
+end
+
+return changed
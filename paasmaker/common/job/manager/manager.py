@@ -9,6 +9,7 @@
 import logging
 import uuid
 import json
+import time
 
 import paasmaker
 from paasmaker.common.core import constants
@@ -22,6 +23,15 @@ from pubsub import pub
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
+# If an evaluation pass hasn't finished after this many seconds,
+# assume it's been lost (for example, the backend connection dropped
+# whilst it was running) and allow another one to start.
+EVALUATE_STALL_TIMEOUT = 60
+
+# The number of recent job status transitions to remember, to
+# filter out duplicate status messages.
+JOB_STATUS_FILTER_SIZE = 10000
+
 class JobManager(object):
 	def __init__(self, configuration):
 		logger.debug("Initialising JobManager.")
@@ -30,7 +40,21 @@ class JobManager(object):
 		self.runners = {}
 		self.in_startup = {}
 		self.abort_handlers = {}
-		self.double_process_filter = {}
+		self.double_process_filter = paasmaker.util.lrucache.LRUCache(JOB_STATUS_FILTER_SIZE)
+
+		# Evaluation passes are coalesced, so at most one is running
+		# and one more is waiting to run at any time.
+		self.evaluate_running = None
+		self.evaluate_pending = False
+		self.evaluate_stats = {
+			'requested': 0,
+			'merged': 0,
+			'passes': 0
+		}
+
+		# Per plugin execution metrics for jobs on this node.
+		self.metrics = {}
+		self.started_jobs = {}
 
 		logger.debug("Subscribing to job status updates.")
 		pub.subscribe(self.job_status, 'job.status')
@@ -132,6 +156,9 @@ class JobManager(object):
 		else:
 			resolved_node = self.configuration.get_node_uuid()
 
+		# So it's log can be found without looking the job up.
+		self.configuration.remember_log_location(job_id, resolved_node)
+
 		def on_context_stored():
 			# Send the NEW status around the cluster. In case something wants it.
 			self.configuration.send_job_status(job_id, constants.JOB.NEW, parent_id=parent)
@@ -169,52 +196,70 @@ class JobManager(object):
 		return JobSpecifier()
 
 	def add_tree(self, treespec, callback, parent=None):
-		self._add_tree_recurse(treespec, callback, parent)
-
-	def _add_tree_recurse(self, tree, callback, parent=None):
-		# Record a list of the children that we can destroy later.
-		child_list = list(tree.children)
-		child_list.reverse()
-
-		def on_root_added(root_id):
-			# Root has been added. Start popping off
-			# children and adding them.
-			tree.job_id = root_id
-
-			def pop_child():
-				try:
-					child = child_list.pop()
-
-					def child_done(child_id):
-						child.job_id = child_id
-						# Work on the next child.
-						pop_child()
-						# end of child_done()
-
-					self._add_tree_recurse(child, child_done, parent=root_id)
-
-				except IndexError, ex:
-					# No more children. We're finished.
-					callback(root_id)
-				# end of pop_child()
-
-			# Start processing children.
-			pop_child()
-			# End of on_root_added()
-
-		# Add the root job.
-		self.add_job(
-			tree.parameters['plugin'],
-			tree.parameters['parameters'],
-			tree.parameters['title'],
-			on_root_added,
-			parent=parent,
-			node=tree.parameters['node'],
-			context=tree.parameters['context'],
-			tags=tree.parameters['tags'],
-			abort_handler=tree.parameters['abort_handler']
+		"""
+		Add an entire tree of jobs, described by the supplied
+		``JobSpecifier``, to the system in one operation. Calls the
+		callback with the job id of the top of the tree. Each specifier
+		has it's ``job_id`` attribute set to the allocated job id.
+		"""
+		jobs = []
+		abort_handlers = []
+		self._flatten_tree(treespec, parent, jobs, abort_handlers)
+
+		logger.info("Adding tree of %d jobs, starting with '%s'", len(jobs), treespec.parameters['title'])
+
+		def on_tree_added():
+			# Send the NEW statuses around the cluster. In case something wants it.
+			for job in jobs:
+				self.configuration.send_job_status(job['job_id'], constants.JOB.NEW, parent_id=job['parent_id'])
+			logger.debug("Completed adding tree with root %s.", treespec.job_id)
+			callback(treespec.job_id)
+
+		self.backend.add_tree(jobs, on_tree_added)
+
+		# Make a note of any abort handlers.
+		for job_id in abort_handlers:
+			self.abort_handlers[job_id] = True
+
+	def _flatten_tree(self, tree, parent, jobs, abort_handlers):
+		# Allocate job IDs and build a flat list of jobs, with parents
+		# always appearing before their children.
+		parameters = tree.parameters
+		if not self.configuration.plugins.exists(parameters['plugin'], paasmaker.util.plugin.MODE.JOB):
+			raise ValueError("Plugin %s doesn't exist in the JOB mode." % parameters['plugin'])
+
+		tree.job_id = str(uuid.uuid4())
+		logger.debug("Allocated job id %s for '%s'", tree.job_id, parameters['title'])
+
+		# Figure out what node it belongs to. If supplied, use that one.
+		# Otherwise it's considered a local job.
+		node = parameters['node']
+		if not node:
+			node = self.configuration.get_node_uuid()
+
+		# So it's log can be found without looking the job up.
+		self.configuration.remember_log_location(tree.job_id, node)
+
+		jobs.append(
+			{
+				'node': node,
+				'job_id': tree.job_id,
+				'parent_id': parent,
+				'state': constants.JOB.NEW,
+				'plugin': parameters['plugin'],
+				'parameters': parameters['parameters'],
+				'title': parameters['title'],
+				'tags': parameters['tags'],
+				'context': parameters['context']
+			}
 		)
 
+		if parameters['abort_handler']:
+			abort_handlers.append(tree.job_id)
+
+		for child in tree.children:
+			self._flatten_tree(child, tree.job_id, jobs, abort_handlers)
+
 	def allow_execution(self, job_id, callback=None, notify_others=True):
 		"""
 		Allow the entire job tree given by job_id (which can be anywhere on the tree)
@@ -252,88 +297,224 @@ class JobManager(object):
 
 		process_job()
 
-	def _start_job(self, job_id):
+	def _start_jobs(self, job_ids):
 		# Prevent trying to start the same job twice (race conditions around
 		# waiting for callbacks cause this - it can be kicked off twice until
 		# the state is marked as running, so this stops that from happening.)
 		# NOTE: This works also because only the node that is assigned the job
 		# can act on or mutate the job.
-		if self.in_startup.has_key(job_id):
-			return
-		self.in_startup[job_id] = True
+		to_claim = []
+		for job_id in job_ids:
+			if not self.in_startup.has_key(job_id):
+				self.in_startup[job_id] = True
+				to_claim.append(job_id)
+
+		def start_one(job_id, job, context):
+			# Closure job to keep the job_id.
+			# This function handles an exception when a job raises an exception.
+			def handle_exception_job(exc_type, ex, traceback):
+				# Log what happened.
+				logging.error("Job %s failed with exception:", job_id, exc_info=True)
+				job_logger = self.configuration.get_job_logger(job_id)
+				job_logger.error("Job %s failed with exception:", job_id, exc_info=True)
+				# Abort the job with an error.
+				self.completed(job_id, constants.JOB.FAILED, None, "Exception thrown: " + str(ex))
+
+				# Absorb the exception.
+				return True
+
+			with tornado.stack_context.ExceptionStackContext(handle_exception_job):
+				# Now that we have the job metadata, we can try to instantiate the plugin.
+				job_logger = self.configuration.get_job_logger(job_id)
+				plugin = self.configuration.plugins.instantiate(
+					job['plugin'],
+					paasmaker.util.plugin.MODE.JOB,
+					job['parameters'],
+					job_logger
+				)
+				plugin.configure(self, job_id, job)
+
+				self.runners[job_id] = plugin
 
-		def on_context(context):
-			def on_running(result):
 				# Finally kick it off...
 				logger.debug("Finally kicking off job %s", job_id)
+				logger.debug("Context for job %s: %s", job_id, str(context))
+				self.configuration.send_job_status(job_id, constants.JOB.RUNNING)
+				plugin.start_job(context)
+
+		def on_claimed(claimed):
+			for job_id in to_claim:
+				# The backend now counts these jobs as running, or they
+				# weren't ready after all, so either way they no longer
+				# need to be tracked here.
+				del self.in_startup[job_id]
+
+				if not claimed.has_key(job_id):
+					logger.debug("Job %s was no longer ready to run.", job_id)
+					continue
+
+				job, context = claimed[job_id]
+				self._record_start(job_id, job)
+				start_one(job_id, job, context)
+
+		# Mark them all as running, and fetch what we need
+		# to start them, in one go.
+		logger.debug("Claiming %d jobs to start them.", len(to_claim))
+		self.backend.claim_jobs(
+			self.configuration.get_node_uuid(),
+			to_claim,
+			on_claimed
+		)
 
-				# Closure job to keep the job_id.
-				# This function handles an exception when a job raises an exception.
-				def handle_exception_job(exc_type, ex, traceback):
-					# Log what happened.
-					logging.error("Job %s failed with exception:", job_id, exc_info=True)
-					job_logger = self.configuration.get_job_logger(job_id)
-					job_logger.error("Job %s failed with exception:", job_id, exc_info=True)
-					# Abort the job with an error.
-					self.completed(job_id, constants.JOB.FAILED, None, "Exception thrown: " + str(ex))
-
-					# Absorb the exception.
-					return True
-
-				with tornado.stack_context.ExceptionStackContext(handle_exception_job):
-					self.configuration.send_job_status(job_id, constants.JOB.RUNNING)
-					self.runners[job_id].start_job(context)
-
-			# Now that we have the context, we can start the job off.
-			# Mark it as running and then get started.
-			# TODO: There might be race conditions here...
-			# But we've alieviated them above.
-			logger.debug("Got context for job %s", job_id)
-			logger.debug("Context for job %s: %s", job_id, str(context))
-			self.backend.set_attrs(job_id, {'state': constants.JOB.RUNNING}, on_running)
-
-		def on_job_metadata(job):
-			# Now that we have the job metadata, we can try to instantiate the plugin.
-			logger.debug("Got metadata for job %s", job_id)
-			job_logger = self.configuration.get_job_logger(job_id)
-			plugin = self.configuration.plugins.instantiate(
-				job['plugin'],
-				paasmaker.util.plugin.MODE.JOB,
-				job['parameters'],
-				job_logger
-			)
-			plugin.configure(self, job_id, job)
+	def evaluate(self):
+		"""
+		Evaluate our nodes jobs, and start the ones that are ready to execute.
 
-			self.runners[job_id] = plugin
+		The evaluation is scheduled on the IO loop rather than run
+		immediately. Requests are coalesced - if a pass is already waiting
+		to run, this request is merged into it, and if a pass is running,
+		one more pass is run once it completes. This means that many jobs
+		finishing at once only cause a handful of evaluation passes.
+		"""
+		self.evaluate_stats['requested'] += 1
 
-			# Now we need to fetch the context to start the job off.
-			self.backend.get_context(job_id, on_context)
+		if self.evaluate_pending:
+			# A pass is already going to run, and it will
+			# see whatever caused this request.
+			self.evaluate_stats['merged'] += 1
+			return
 
-		# Kick off the request to get the job data.
-		logger.debug("Fetching job data for %s to start it.", job_id)
-		self.backend.get_job(job_id, on_job_metadata)
+		self.evaluate_pending = True
 
-	def evaluate(self):
+		if self.evaluate_running is not None:
+			if time.time() - self.evaluate_running < EVALUATE_STALL_TIMEOUT:
+				# The pending pass is started once the running one finishes.
+				return
+			logger.warning("Job evaluation pass has not completed after %d seconds. Starting another.", EVALUATE_STALL_TIMEOUT)
+
+		self.configuration.io_loop.add_callback(self._evaluate_pass)
+
+	def get_evaluate_stats(self):
 		"""
-		Evaluate our nodes jobs, and start the ones that are ready to execute.
+		Return a dict of counters about job evaluation passes. ``requested``
+		is the number of times an evaluation was requested, ``passes`` is
+		the number of passes that actually ran, and ``merged`` is the number
+		of requests that were merged into another pass.
+		"""
+		return dict(self.evaluate_stats)
+
+	def get_status_filter_stats(self):
+		"""
+		Return a dict of counters for the duplicate job status
+		message filter. ``hits`` is the number of duplicate messages
+		that were dropped.
+		"""
+		return self.double_process_filter.stats()
+
+	def _get_plugin_metrics(self, plugin):
+		if not self.metrics.has_key(plugin):
+			self.metrics[plugin] = {
+				'queue_wait': paasmaker.util.Histogram(),
+				'run_time': paasmaker.util.Histogram(),
+				'outcomes': {}
+			}
+		return self.metrics[plugin]
+
+	def _record_start(self, job_id, job):
+		# Queue wait is from when the job was ready to run (or added,
+		# if it was ready straight away) until now.
+		now = time.time()
+		ready_time = job.get('ready_time') or job.get('time') or now
+		metrics = self._get_plugin_metrics(job['plugin'])
+		metrics['queue_wait'].add(max(0.0, now - ready_time))
+		self.started_jobs[job_id] = (job['plugin'], now)
+
+	def _record_finish(self, job_id, state):
+		if not self.started_jobs.has_key(job_id):
+			# Not started on this node, or already recorded.
+			return
+
+		plugin, started = self.started_jobs.pop(job_id)
+		metrics = self._get_plugin_metrics(plugin)
+		metrics['run_time'].add(time.time() - started)
+		metrics['outcomes'][state] = metrics['outcomes'].get(state, 0) + 1
+
+	def get_metrics(self):
 		"""
+		Return the execution metrics for jobs run on this node, since
+		it started. The result is a dict keyed by job plugin name, with
+		these keys for each plugin:
+
+		* **queue_wait**: A histogram of how long jobs waited between
+		  being ready to run and starting, in seconds.
+		* **run_time**: A histogram of how long jobs took to finish
+		  once started, in seconds.
+		* **outcomes**: A dict of the number of jobs that finished in
+		  each state.
+		* **running**: The number of jobs that are running right now.
+
+		The histograms are in the format returned by
+		``paasmaker.util.Histogram.flatten()``.
+		"""
+		result = {}
+		for plugin, metrics in self.metrics.iteritems():
+			result[plugin] = {
+				'queue_wait': metrics['queue_wait'].flatten(),
+				'run_time': metrics['run_time'].flatten(),
+				'outcomes': dict(metrics['outcomes']),
+				'running': 0
+			}
+
+		for plugin, started in self.started_jobs.values():
+			result[plugin]['running'] += 1
+
+		return result
+
+	def _evaluate_pass(self):
+		self.evaluate_pending = False
+		self.evaluate_stats['passes'] += 1
+		started = time.time()
+		self.evaluate_running = started
+
 		def on_ready_list(jobs):
 			logger.debug("Found %d jobs ready to run.", len(jobs))
-			for job in jobs:
-				logger.debug("Launching %s...", job)
-				self._start_job(job)
+			logger.debug("Launching %s...", ", ".join(jobs))
+			self._start_jobs(jobs)
+
+			if self.evaluate_running != started:
+				# This pass was considered stalled and another
+				# one has taken over.
+				return
+
+			self.evaluate_running = None
+			if self.evaluate_pending:
+				# Something changed whilst we were running.
+				self.configuration.io_loop.add_callback(self._evaluate_pass)
 
 		logger.debug("Fetching list of ready to run jobs.")
 		self.backend.get_ready_to_run(
 			self.configuration.get_node_uuid(),
 			constants.JOB.WAITING, # The state of jobs that can be started.
 			constants.JOB.SUCCESS, # The state that all child jobs have to be in to trigger starting.
-			on_ready_list
+			on_ready_list,
+			limits=self._get_limits(),
+			# Jobs that we're starting are not yet marked as running.
+			starting=self.in_startup.keys()
 		)
 
+	def _get_limits(self):
+		"""
+		Return the job concurrency limits for this node, or None if
+		there are no limits.
+		"""
+		limits = self.configuration['job_limits']
+		if limits['max_running'] > 0 or len(limits['plugins']) > 0:
+			return limits
+		return None
+
 	def completed(self, job_id, state, context, summary):
 		# Apparently this job has finished in some state.
-		def on_state_updated(job):
+		def on_state_updated(job, state=state, summary=summary):
 			# Remove the runner instance.
 			if self.runners.has_key(job_id):
 				del self.runners[job_id]
@@ -359,7 +540,9 @@ class JobManager(object):
 					on_state_updated
 				)
 			else:
-				on_state_updated(metadata)
+				# Publish the state it already had, rather than the
+				# state the runner finished in.
+				on_state_updated(metadata, metadata['state'], metadata.get('summary'))
 
 		def on_context_updated():
 			# Fetch the existing job metadata.
@@ -368,6 +551,8 @@ class JobManager(object):
 		logger.debug("Job %s reports state %s.", job_id, state)
 
 		if state in constants.JOB_FINISHED_STATES:
+			self._record_finish(job_id, state)
+
 			# Close off the log file. There is a fair chance that it
 			# won't be used again.
 			paasmaker.util.joblogging.JobLoggerAdapter.finished_job(job_id)
@@ -391,6 +576,12 @@ class JobManager(object):
 				self.configuration.send_job_status(job, constants.JOB.ABORTED, summary="Aborted due to a related job.")
 			logger.debug("Completed altering jobs.")
 
+			if self._get_limits() is not None:
+				# The failed job freed a slot, so jobs held back by the
+				# limits can start. This waits until the rest of the tree
+				# is aborted, so none of it is started.
+				self.evaluate()
+
 		def on_running(jobs):
 			logger.info("Found %d running jobs on our node that need to be aborted.", len(jobs))
 			# If we have matching runner instances, abort them.
@@ -405,6 +596,14 @@ class JobManager(object):
 				else:
 					logger.warn("Unable to find job %s that's supposed to be running. Ignoring.", job)
 
+			if self.runners.has_key(message.job_id) and message.job_id not in jobs:
+				# Another node has already moved this job on from RUNNING,
+				# such as a pacemaker failing it because it was stuck, but
+				# the runner is still going. Abort it, which also removes it.
+				logger.warning("Job %s is %s, but is still running here. Aborting it.", message.job_id, message.state)
+				runner = self.runners[message.job_id]
+				self.configuration.io_loop.add_callback(runner.abort_job)
+
 		# ABORT HANDLER HANDLING
 		def on_complete_tree(tree):
 			def on_job_metadata(job):
@@ -467,27 +666,22 @@ class JobManager(object):
 		)
 
 	def job_status(self, message):
-		# Extremely crude prevention for double processing messages.
-		# TODO: Make this much nicer.
-		# NOTE: This workaround is just a bandaid, and doesn't fix the
-		# real issue that there are multiple paths in handling jobs
-		# and related race conditions. However, for now, it will work.
-		if len(self.double_process_filter) > 1000:
-			# Reset it, to prevent it getting too large
-			# and using too much memory.
-			# TODO: Make this a LRU of some kind?
-			self.double_process_filter = {}
-
+		# Prevent double processing messages.
+		# NOTE: This doesn't fix the real issue that there are multiple
+		# paths in handling jobs and related race conditions. However,
+		# a job only enters each state once, so a job/state pair that
+		# we've already seen is a duplicate, no matter which path it
+		# came from. Only the most recent transitions are remembered.
 		double_key = "%s:%s" % (message.job_id, message.state)
-		if double_key in self.double_process_filter:
+		if self.double_process_filter.seen(double_key):
 			# Already seen this key/state combination.
 			return
-		self.double_process_filter[double_key] = True
 
 		if message.state in constants.JOB_SUCCESS_STATES or message.state == constants.JOB.WAITING:
 			# If the message is a success state, or waiting, go
-			# ahead and evaluate the jobs.
-			self.configuration.io_loop.add_callback(self.evaluate)
+			# ahead and evaluate the jobs. This is coalesced with
+			# any other evaluations that are pending.
+			self.evaluate()
 
 		if message.state in constants.JOB_ERROR_STATES:
 			# Something failed or was aborted.
@@ -511,41 +705,74 @@ class JobManager(object):
 		# Force abort this job. This is designed for Pacemakers to kill jobs
 		# on down nodes. The default handling won't touch this because the
 		# pacemaker node won't own the job.
-		def on_waiting_altered(waiting_jobs):
+		def on_altered(jobs):
 			# Now broadcast the status.
-			for job in waiting_jobs:
+			for job in jobs:
 				self.configuration.send_job_status(job, constants.JOB.ABORTED, summary="Aborted due to a related job.")
 
-			def on_running_altered(running_jobs):
-				for job in running_jobs:
-					self.configuration.send_job_status(job, constants.JOB.ABORTED, summary="Aborted due to a related job.")
-
-				callback(waiting_jobs.union(running_jobs))
+			callback(jobs)
 
-				# end of on_running_altered()
-
-			# Do the same for RUNNING.
-			logger.debug("Searching for WAITING jobs, and adjusting to aborted for tree %s.", job_id)
-			self.backend.set_state_tree(
-				job_id,
-				constants.JOB.RUNNING,
-				constants.JOB.ABORTED,
-				on_running_altered,
-				node=node
-			)
-
-			# end of on_waiting_altered()
+			# end of on_altered()
 
 		logger.debug("Force aborting jobs for node %s." % node)
-		logger.debug("Searching for WAITING jobs, and adjusting to aborted for tree %s.", job_id)
+		logger.debug("Searching for WAITING and RUNNING jobs, and adjusting to aborted for tree %s.", job_id)
 		self.backend.set_state_tree(
 			job_id,
-			constants.JOB.WAITING,
+			[constants.JOB.WAITING, constants.JOB.RUNNING],
 			constants.JOB.ABORTED,
-			on_waiting_altered,
+			on_altered,
 			node=node
 		)
 
+	def force_abort_jobs(self, job_ids, callback):
+		"""
+		Force abort the given jobs, which can be on any node, in one
+		go. Only jobs that are waiting or running are changed. This is
+		designed for Pacemakers to kill jobs on down nodes. Calls the
+		callback with the set of jobs that were aborted.
+		"""
+		self._force_state(
+			job_ids,
+			[constants.JOB.WAITING, constants.JOB.RUNNING],
+			constants.JOB.ABORTED,
+			"Aborted due to a related job.",
+			callback
+		)
+
+	def force_fail_jobs(self, job_ids, summary, callback):
+		"""
+		Force the given running jobs, which can be on any node, into the
+		failed state in one go. This is designed for Pacemakers to clean
+		up jobs that are stuck. The node running each job will then abort
+		it, and the rest of it's tree. Calls the callback with the set
+		of jobs that were failed.
+		"""
+		self._force_state(
+			job_ids,
+			constants.JOB.RUNNING,
+			constants.JOB.FAILED,
+			summary,
+			callback
+		)
+
+	def _force_state(self, job_ids, from_state, to_state, summary, callback):
+		def on_altered(jobs):
+			# Now broadcast the status, so the nodes involved
+			# can sort out the rest of the trees.
+			for job in jobs:
+				self.configuration.send_job_status(job, to_state, summary=summary)
+
+			callback(jobs)
+
+		self.backend.set_state_list(job_ids, from_state, to_state, on_altered, summary=summary)
+
+	def find_stuck_jobs(self, default_timeout, timeouts, callback, limit=100):
+		"""
+		Find jobs that have been running for longer than their timeout.
+		See ``JobBackend.find_stuck_jobs()`` for details.
+		"""
+		self.backend.find_stuck_jobs(default_timeout, timeouts, callback, limit=limit)
+
 	def debug_dump_job_tree(self, job_id, callback):
 		def on_job_full(jobs):
 			# Righto! Now we can sort and build this into a tree.
@@ -579,6 +806,13 @@ class JobManager(object):
 	def find_by_tag(self, tag, callback, limit=None):
 		self.backend.find_by_tag(tag, callback, limit=limit)
 
+	def find_by_tags(self, tags, callback, limit=50, cursor=None, state=None):
+		"""
+		Find a page of root jobs that have all the given tags. See
+		``JobBackend.find_by_tags()`` for details.
+		"""
+		self.backend.find_by_tags(tags, callback, limit=limit, cursor=cursor, state=state)
+
 	def find_older_than(self, age, callback, limit=None):
 		self.backend.find_older_than(age, callback, limit=limit)
 
@@ -909,6 +1143,33 @@ class JobManagerTest(tornado.testing.AsyncTestCase, TestHelpers):
 		result = self.get_state(job_id)
 		self.assertEquals(result, constants.JOB.FAILED, 'Test job was not a failure.')
 
+	def test_manager_limits_after_failure(self):
+		# With one running slot, the failing job goes first, and
+		# the other job waits for it.
+		self.configuration['job_limits'] = {
+			'max_running': 1,
+			'reserved': 0,
+			'plugins': {},
+			'priorities': {'paasmaker.job.failure': 1}
+		}
+
+		self.manager.add_job('paasmaker.job.failure', {}, "Example failing job.", self.stop)
+		failed_id = self.wait()
+		self.manager.add_job('paasmaker.job.success', {}, "Example waiting job.", self.stop)
+		waiting_id = self.wait()
+
+		self.manager.allow_execution_list([failed_id, waiting_id], callback=self.stop)
+		self.wait()
+
+		self.short_wait_hack()
+		self.short_wait_hack()
+
+		# The failure frees the slot, so the other job runs.
+		result = self.get_state(failed_id)
+		self.assertEquals(result, constants.JOB.FAILED, 'Test job was not a failure.')
+		result = self.get_state(waiting_id)
+		self.assertEquals(result, constants.JOB.SUCCESS, 'Waiting job did not run after the failure.')
+
 	def test_manager_success_tree(self):
 		# Test that a subtree processes correctly.
 		self.manager.add_job('paasmaker.job.success', {}, "Example root job.", self.stop)
@@ -1014,6 +1275,27 @@ class JobManagerTest(tornado.testing.AsyncTestCase, TestHelpers):
 		self.assertEquals(self.statuses[sub2_id].state, constants.JOB.ABORTED)
 		self.assertEquals(self.statuses[root_id].state, constants.JOB.ABORTED)
 
+	def test_manager_force_fail_running(self):
+		# A job that is still running when a pacemaker fails it.
+		self.manager.add_job('paasmaker.job.aborted', {}, "Example stuck job.", self.stop)
+		job_id = self.wait()
+
+		self.manager.allow_execution(job_id, callback=self.stop)
+		self.wait()
+		self.short_wait_hack()
+		self.assertIn(job_id, self.manager.runners, "Job is not running.")
+
+		self.manager.force_fail_jobs([job_id], "Timed out.", self.stop)
+		failed = self.wait()
+		self.assertEquals(failed, set([job_id]), "Job was not failed.")
+		self.short_wait_hack()
+
+		# The runner was aborted and removed, and the job stays failed.
+		self.assertNotIn(job_id, self.manager.runners, "Runner was not removed.")
+		result = self.get_state(job_id)
+		self.assertEquals(result, constants.JOB.FAILED, 'Job did not stay failed.')
+		self.assertEquals(self.statuses[job_id].state, constants.JOB.FAILED, "Wrong state was broadcast.")
+
 	def test_manager_exception_callback(self):
 		# Set up a simple exception job.
 		self.manager.add_job('paasmaker.job.exceptioncallback', {}, "Example job.", self.stop)
@@ -1097,6 +1379,71 @@ class JobManagerTest(tornado.testing.AsyncTestCase, TestHelpers):
 		self.assertEquals(result, constants.JOB.FAILED, 'Test job did not fail.')
 		self.assertNotEquals(ABORT_HANDLER_RESPONSE, None, 'Abort handler did not run.')
 
+	def test_manager_evaluate_coalesced(self):
+		# Let anything already in flight settle.
+		self.short_wait_hack()
+		before = self.manager.get_evaluate_stats()
+
+		# A burst of evaluation requests should only run once.
+		for i in range(10):
+			self.manager.evaluate()
+
+		self.short_wait_hack()
+
+		after = self.manager.get_evaluate_stats()
+		self.assertEquals(after['requested'] - before['requested'], 10, "Requests were not counted.")
+		self.assertEquals(after['passes'] - before['passes'], 1, "Requests were not coalesced.")
+		self.assertEquals(after['merged'] - before['merged'], 9, "Merged requests were not counted.")
+
+		# Requests made whilst a pass is running trigger exactly one more pass.
+		self.manager._evaluate_pass()
+		self.assertTrue(self.manager.evaluate_running is not None, "Pass was not marked as running.")
+		self.manager.evaluate()
+		self.manager.evaluate()
+		self.short_wait_hack()
+
+		final = self.manager.get_evaluate_stats()
+		self.assertEquals(final['passes'] - after['passes'], 2, "Pending pass did not run once.")
+		self.assertEquals(self.manager.evaluate_running, None, "Pass did not finish.")
+
+	def test_manager_metrics(self):
+		self.manager.add_job('paasmaker.job.success', {}, "Example job.", self.stop)
+		success_id = self.wait()
+		self.manager.add_job('paasmaker.job.failure', {}, "Example job.", self.stop)
+		failure_id = self.wait()
+
+		self.manager.allow_execution_list([success_id, failure_id], callback=self.stop)
+		self.wait()
+
+		self.short_wait_hack()
+
+		metrics = self.manager.get_metrics()
+		self.assertTrue(metrics.has_key('paasmaker.job.success'), "Missing metrics for plugin.")
+		success = metrics['paasmaker.job.success']
+		self.assertEquals(success['queue_wait']['count'], 1, "Queue wait was not recorded.")
+		self.assertEquals(success['run_time']['count'], 1, "Run time was not recorded.")
+		self.assertEquals(success['outcomes'], {constants.JOB.SUCCESS: 1}, "Outcome was not recorded.")
+		self.assertEquals(success['running'], 0, "Job still marked as running.")
+
+		failure = metrics['paasmaker.job.failure']
+		self.assertEquals(failure['outcomes'], {constants.JOB.FAILED: 1}, "Outcome was not recorded.")
+
+	def test_manager_status_filter(self):
+		before = self.manager.get_status_filter_stats()
+
+		self.configuration.send_job_status('filtered', constants.JOB.RUNNING)
+		self.configuration.send_job_status('filtered', constants.JOB.RUNNING)
+		self.configuration.send_job_status('filtered', constants.JOB.SUCCESS)
+
+		after = self.manager.get_status_filter_stats()
+		self.assertEquals(after['hits'] - before['hits'], 1, "Duplicate message was not filtered.")
+		self.assertEquals(after['misses'] - before['misses'], 2, "New messages were not counted.")
+
+		# The SUCCESS status starts an evaluation. Let it finish
+		# before the test ends and the Redis goes away.
+		self.short_wait_hack()
+		self.assertEquals(self.manager.evaluate_running, None, "Evaluation did not finish.")
+
 	def test_manager_no_job(self):
 		self.manager.get_jobs(['nope'], self.stop)
 		job_data = self.wait()
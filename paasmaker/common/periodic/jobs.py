@@ -19,10 +19,24 @@ class JobsCleanerConfigurationSchema(colander.MappingSchema):
 		description="Maximum age for a job. Default to 7 days. After that time, the job is purged from the system.",
 		default=86400 * 7,
 		missing=86400 * 7)
+	batch_size = colander.SchemaNode(colander.Integer(),
+		title="Batch size",
+		description="The number of old jobs to fetch at a time.",
+		default=100,
+		missing=100)
+	time_budget = colander.SchemaNode(colander.Float(),
+		title="Time budget",
+		description="The maximum number of seconds to spend cleaning up in each run. Any jobs left over are cleaned up in the next run.",
+		default=10.0,
+		missing=10.0)
 
 class JobsCleaner(BasePeriodic):
 	"""
 	A plugin to remove old job entries from the jobs Redis.
+
+	Each tree is removed in a single step on the Redis server. To avoid
+	loading the jobs Redis in bursts, each run stops once its time
+	budget is used up, and the next run carries on from there.
 	"""
 
 	OPTIONS_SCHEMA = JobsCleanerConfigurationSchema()
@@ -36,13 +50,18 @@ class JobsCleaner(BasePeriodic):
 		self.callback = callback
 		self.error_callback = error_callback
 		self.cleaned_jobs = 0
+		self.deadline = time.time() + self.options['time_budget']
 
 		self._fetch_old_jobs()
 
 	def _fetch_old_jobs(self):
 		# Fetch a list of jobs older than the threshold.
 		oldest_age = time.time() - self.options['max_age']
-		self.configuration.job_manager.find_older_than(oldest_age, self._old_jobs_list, limit=20)
+		self.configuration.job_manager.find_older_than(
+			oldest_age,
+			self._old_jobs_list,
+			limit=self.options['batch_size']
+		)
 
 	def _old_jobs_list(self, jobs):
 		if len(jobs) == 0:
@@ -50,15 +69,22 @@ class JobsCleaner(BasePeriodic):
 			self.logger.info("Completed cleaning up %d jobs.", self.cleaned_jobs)
 			self.callback("Cleaned up %d jobs." % self.cleaned_jobs)
 		else:
-			# Start processing them.
+			# Start processing them. The list is oldest first,
+			# so the oldest are removed first.
 			self.logger.info("Found %d old jobs, working on those.", len(jobs))
 			self.old_jobs = jobs
 			self._clean_job()
 
 	def _clean_job(self):
+		if time.time() > self.deadline:
+			# Out of time. Leave the rest for the next run.
+			self.logger.info("Cleaned up %d jobs, stopping as the time budget is used up.", self.cleaned_jobs)
+			self.callback("Cleaned up %d jobs (time budget used up)." % self.cleaned_jobs)
+			return
+
 		# Find a job to clean.
 		try:
-			job_id = self.old_jobs.pop()
+			job_id = self.old_jobs.pop(0)
 
 			self.logger.debug("Removing %s." % job_id)
 			self.cleaned_jobs += 1
@@ -143,4 +169,62 @@ class JobsCleanerTest(BasePeriodicTest):
 		self.configuration.job_manager.find_older_than(time.time() + 10, self.stop)
 		jobs = self.wait()
 
-		self.assertEquals(len(jobs), 0, "Job still present.")
\ No newline at end of file
+		self.assertEquals(len(jobs), 0, "Job still present.")
+
+	def test_time_budget(self):
+		job_ids = []
+		for i in range(3):
+			self.configuration.job_manager.add_job('paasmaker.job.container', {}, "Example job.", self.stop)
+			job_ids.append(self.wait())
+			self.short_wait_hack(length=0.01)
+
+		# The oldest jobs are found first.
+		self.configuration.job_manager.find_older_than(time.time() + 10, self.stop, limit=2)
+		self.assertEquals(self.wait(), job_ids[:2], "Didn't find the oldest jobs first.")
+
+		# With no time budget, it should stop before removing any jobs.
+		self.configuration.plugins.register(
+			'paasmaker.periodic.jobs',
+			'paasmaker.common.periodic.jobs.JobsCleaner',
+			{'max_age': -10, 'time_budget': -1},
+			'Log Cleanup Plugin'
+		)
+
+		plugin = self.configuration.plugins.instantiate(
+			'paasmaker.periodic.jobs',
+			paasmaker.util.plugin.MODE.PERIODIC
+		)
+
+		plugin.on_interval(self.success_callback, self.failure_callback)
+		self.wait()
+
+		self.assertTrue(self.success)
+		self.assertIn(" 0 ", self.message)
+		self.assertIn("time budget", self.message)
+
+		self.configuration.job_manager.find_older_than(time.time() + 10, self.stop)
+		jobs = self.wait()
+		self.assertEquals(len(jobs), 3, "Jobs were removed.")
+
+		# With a normal budget, they're all removed.
+		self.configuration.plugins.register(
+			'paasmaker.periodic.jobs',
+			'paasmaker.common.periodic.jobs.JobsCleaner',
+			{'max_age': -10},
+			'Log Cleanup Plugin'
+		)
+
+		plugin = self.configuration.plugins.instantiate(
+			'paasmaker.periodic.jobs',
+			paasmaker.util.plugin.MODE.PERIODIC
+		)
+
+		plugin.on_interval(self.success_callback, self.failure_callback)
+		self.wait()
+
+		self.assertTrue(self.success)
+		self.assertIn(" 3 ", self.message)
+
+		self.configuration.job_manager.find_older_than(time.time() + 10, self.stop)
+		jobs = self.wait()
+		self.assertEquals(len(jobs), 0, "Jobs still present.")
@@ -9,6 +9,7 @@
 import os
 import glob
 import uuid
+import re
 import time
 import logging
 
@@ -17,94 +18,390 @@ from base import BasePeriodic, BasePeriodicTest
 
 import colander
 
+# Where each log directory's cleanup got up to, so the next run
+# carries on from there. Log directory -> (shard, last file checked
+# in it, or None if the shard was finished).
+_cleaner_progress = {}
+# Likewise for compressing logs. Log directory -> last shard finished.
+_compressor_progress = {}
+
+# Logs, compressed logs, and rotated segments of instance logs.
+LOG_FILE_RE = re.compile(r'\.log(\.\d+)?(\.gz)?$')
+
 class LogsCleanerConfigurationSchema(colander.MappingSchema):
 	max_age = colander.SchemaNode(colander.Integer(),
 		title="Maximum log age",
 		description="Maximum age for a log file. After this age, it is deleted. In seconds. Default 7 days.",
 		default=86400 * 7,
 		missing=86400 * 7)
+	max_files = colander.SchemaNode(colander.Integer(),
+		title="Maximum files per run",
+		description="The maximum number of log files to remove in each run. Any left over are removed in the next run.",
+		default=10000,
+		missing=10000)
+	time_budget = colander.SchemaNode(colander.Float(),
+		title="Time budget",
+		description="The maximum number of seconds to spend cleaning up in each run. The next run carries on from where this one stopped.",
+		default=60.0,
+		missing=60.0)
+
+class CleanLogDirectoryThread(paasmaker.util.threadcallback.ThreadCallback):
+	"""
+	Remove old logs, and their line indexes, from one of the log
+	directories. Line indexes whose logs have gone are removed too.
+	This is done on another thread, as on large directories and some
+	filesystems, listing and unlinking can block for a while.
+
+	Files are checked in name order, starting after ``resume_after``
+	if given. The callback is called with the number of files
+	removed, and the name of the last file checked if it stopped
+	before the end of the directory, or None if it got to the end.
+	"""
+	def _work(self, path, older_than, deadline, max_files, resume_after=None):
+		removed = 0
+		last_checked = resume_after or ''
+		compressed_suffix = paasmaker.util.compressedlog.COMPRESSED_SUFFIX
+		index_suffix = paasmaker.util.logindex.INDEX_SUFFIX
+
+		for filename in sorted(os.listdir(path)):
+			if filename <= last_checked:
+				continue
+			is_index = filename.endswith(index_suffix)
+			if not is_index and not LOG_FILE_RE.search(filename):
+				continue
+			if removed >= max_files or time.time() > deadline:
+				self._callback(removed, last_checked)
+				return
+
+			last_checked = filename
+			this_file = os.path.join(path, filename)
+
+			if is_index:
+				# Only remove it if it's log has gone.
+				if not paasmaker.util.compressedlog.log_exists(this_file[:-len(index_suffix)]):
+					try:
+						os.unlink(this_file)
+						removed += 1
+					except OSError, ex:
+						# Removed along with it's log.
+						pass
+				continue
+
+			try:
+				information = os.stat(this_file)
+			except OSError, ex:
+				# Removed since we listed it.
+				continue
+
+			if information.st_mtime < older_than:
+				# Along with it's line index, if it has one.
+				log_path = this_file
+				if log_path.endswith(compressed_suffix):
+					log_path = log_path[:-len(compressed_suffix)]
+				paasmaker.util.LogIndex(log_path).remove()
+				os.unlink(this_file)
+				removed += 1
+
+		self._callback(removed, None)
 
 class LogsCleaner(BasePeriodic):
 	"""
 	A plugin to remove log files once they reach a certain age.
+
+	Logs are stored in directories named after the first characters
+	of their job IDs. Each run works through these directories in
+	order, one at a time on another thread, until its time budget or
+	file limit is used up. The next run carries on from there, even
+	part way through a directory, so every log is checked over a
+	number of runs.
 	"""
 	OPTIONS_SCHEMA = LogsCleanerConfigurationSchema()
 	API_VERSION = "0.9.0"
 
 	def on_interval(self, callback, error_callback):
-		# Start by making a list of directories at the top level.
-		self.paths = glob.glob(os.path.join(self.configuration.get_flat('log_directory'), '*'))
+		self.log_directory = self.configuration.get_flat('log_directory')
+
+		# Start by making a list of directories at the top level,
+		# starting after the last one we finished.
+		paths = sorted(glob.glob(os.path.join(self.log_directory, '*')))
+		paths = [path for path in paths if os.path.isdir(path)]
+		last, resume_after = _cleaner_progress.get(self.log_directory, (None, None))
+		if last is not None:
+			if resume_after is None:
+				# Finished that one; start with the next.
+				after = [path for path in paths if path > last]
+				before = [path for path in paths if path <= last]
+			else:
+				# Carry on part way through it.
+				after = [path for path in paths if path >= last]
+				before = [path for path in paths if path < last]
+			paths = after + before
+		self.paths = paths
+		self.resume_path = last
+		self.resume_after = resume_after
 
 		# Process them one by one.
 		self.callback = callback
 		self.error_callback = error_callback
 		self.removed_files = 0
+		self.deadline = time.time() + self.options['time_budget']
 
 		self.older_than = int(time.time()) - self.options['max_age']
 
 		self.logger.info("Starting cleanup process.")
 		self._fetch_directory()
 
-	def _fetch_directory(self):
-		try:
-			this_dir = self.paths.pop()
-
-			self._process_directory(this_dir)
-		except IndexError, ex:
-			# No more to process.
+	def _finish(self, reason=None):
+		if reason:
+			self.logger.info("Removed %d log files, stopping as the %s.", self.removed_files, reason)
+			self.callback("Removed %d log files (%s)." % (self.removed_files, reason))
+		else:
 			self.logger.info("Completed cleanup process. Removed %d log files.", self.removed_files)
 			self.callback("Removed %d log files." % self.removed_files)
 
-	def _process_directory(self, path):
-		self.directory_contents = glob.glob(
-			os.path.join(path, '*.log')
+	def _fetch_directory(self):
+		if len(self.paths) == 0:
+			# No more to process.
+			self._finish()
+			return
+
+		if time.time() > self.deadline:
+			self._finish("time budget is used up")
+			return
+
+		if self.removed_files >= self.options['max_files']:
+			self._finish("file limit is reached")
+			return
+
+		this_dir = self.paths.pop(0)
+		resume_after = None
+		if this_dir == self.resume_path:
+			resume_after = self.resume_after
+
+		def on_cleaned(removed, last_checked):
+			self.removed_files += removed
+			_cleaner_progress[self.log_directory] = (this_dir, last_checked)
+			self._fetch_directory()
+
+		def on_error(message, exception=None):
+			# Move onto the next directory anyway.
+			self.logger.error("Failed to clean up %s: %s", this_dir, message)
+			if exception:
+				self.logger.error("Exception:", exc_info=exception)
+			self._fetch_directory()
+
+		cleaner = CleanLogDirectoryThread(
+			self.configuration.io_loop,
+			on_cleaned,
+			on_error
+		)
+		cleaner.work(
+			this_dir,
+			self.older_than,
+			self.deadline,
+			self.options['max_files'] - self.removed_files,
+			resume_after=resume_after
 		)
 
-		self._fetch_file()
+class LogsCompressorConfigurationSchema(colander.MappingSchema):
+	min_age = colander.SchemaNode(colander.Integer(),
+		title="Minimum log age",
+		description="Only compress logs that haven't been written to for this long. In seconds. Default 1 hour.",
+		default=3600,
+		missing=3600)
+	min_size = colander.SchemaNode(colander.Integer(),
+		title="Minimum log size",
+		description="Don't compress logs smaller than this, as there is little to gain. In bytes.",
+		default=16384,
+		missing=16384)
+	batch_size = colander.SchemaNode(colander.Integer(),
+		title="Batch size",
+		description="The number of logs to look up the jobs for at a time.",
+		default=100,
+		missing=100)
+	time_budget = colander.SchemaNode(colander.Float(),
+		title="Time budget",
+		description="The maximum number of seconds to spend compressing logs in each run. Any logs left over are compressed in the next run.",
+		default=60.0,
+		missing=60.0)
+
+class FindCompressibleLogsThread(paasmaker.util.threadcallback.ThreadCallback):
+	"""
+	Find the logs in one of the log directories that are old and big
+	enough to be worth compressing. This is done on another thread,
+	for the same reasons as ``CleanLogDirectoryThread``.
 
-	def _fetch_file(self):
-		try:
-			this_file = self.directory_contents.pop()
-
-			information = os.stat(this_file)
-
-			if information.st_mtime < self.older_than:
-				# This file should be removed.
-
-				# Check the file size. If it's over a 1MB
-				# delete it using a subprocess and rm. Why?
-				# Because unlink() will block, and on large
-				# log files and certain filesystems, this
-				# could hang up the process for a while.
-				if information.st_size > 1024 * 1024:
-					self.logger.info("Removing %s via subprocess", this_file)
-					def on_rm_finished(code):
-						# Move onto the next file.
-						self.removed_files += 1
-						self.configuration.io_loop.add_callback(self._fetch_file)
-
-					# TODO: This won't work on Windows.
-					process = paasmaker.util.popen.Popen(
-						['rm', this_file],
-						io_loop=self.configuration.io_loop,
-						on_exit=on_rm_finished
-					)
-				else:
-					self.logger.info("Removing %s", this_file)
-					os.unlink(this_file)
-					self.removed_files += 1
-					# Process the next file on the IO loop.
-					self.configuration.io_loop.add_callback(self._fetch_file)
-			else:
-				# Nope. Move on.
-				self.configuration.io_loop.add_callback(self._fetch_file)
+	The callback is called with a list of the paths of the logs.
+	"""
+	def _work(self, path, older_than, min_size):
+		candidates = []
+		for log_path in glob.glob(os.path.join(path, '*.log')):
+			try:
+				information = os.stat(log_path)
+			except OSError, ex:
+				# Removed since we listed it.
+				continue
+			if information.st_mtime < older_than and information.st_size >= min_size:
+				candidates.append(log_path)
+
+		self._callback(candidates)
+
+class LogsCompressor(BasePeriodic):
+	"""
+	A plugin to compress the logs of finished jobs, to save disk space.
+	Compressed logs are still read transparently everywhere that logs
+	are read; see ``paasmaker.util.compressedlog``.
+
+	Only the logs of jobs that have finished, or that the job manager
+	no longer knows about, are compressed. Logs of instances running
+	on this node are left alone, as they are still being written to.
+	Like ``LogsCleaner``, each run works through the log directories
+	in order, finding and then compressing logs on another thread,
+	until its time budget is used up. The next run carries on from
+	there.
+	"""
+	OPTIONS_SCHEMA = LogsCompressorConfigurationSchema()
+	API_VERSION = "0.9.0"
 
-		except IndexError, ex:
-			# No more to process.
-			self.configuration.io_loop.add_callback(self._fetch_directory)
+	def on_interval(self, callback, error_callback):
+		self.callback = callback
+		self.error_callback = error_callback
+		self.compressed_files = 0
+		self.deadline = time.time() + self.options['time_budget']
+		self.older_than = time.time() - self.options['min_age']
+		self.log_directory = self.configuration.get_flat('log_directory')
+
+		# Work through the directories, starting after the last
+		# one we finished.
+		paths = sorted(glob.glob(os.path.join(self.log_directory, '*')))
+		paths = [path for path in paths if os.path.isdir(path)]
+		last = _compressor_progress.get(self.log_directory)
+		if last is not None:
+			after = [path for path in paths if path > last]
+			before = [path for path in paths if path <= last]
+			paths = after + before
+		self.paths = paths
+		self.this_dir = None
+		self.candidates = []
 
-	def _handle_file(self, file):
-		self.configuration.io_loop.add_callback(self._fetch_file)
+		self._fetch_directory()
+
+	def _fetch_directory(self):
+		if self.this_dir is not None:
+			# Finished the last one.
+			_compressor_progress[self.log_directory] = self.this_dir
+			self.this_dir = None
+
+		if len(self.paths) == 0:
+			self._finish()
+			return
+
+		if time.time() > self.deadline:
+			self._finish("time budget used up")
+			return
+
+		this_dir = self.paths.pop(0)
+		node_uuid = self.configuration.get_node_uuid()
+
+		def on_found(candidates):
+			self.this_dir = this_dir
+			for log_path in candidates:
+				job_id = self._job_id(log_path)
+				if job_id == node_uuid:
+					# The node's own log, which is always in use.
+					continue
+				if self.configuration.is_heart() and self.configuration.instances.has_instance(job_id):
+					continue
+				self.candidates.append(log_path)
+
+			self.logger.debug("Found %d logs that could be compressed in %s.", len(self.candidates), this_dir)
+			self._fetch_batch()
+
+		def on_error(message, exception=None):
+			# Move onto the next directory anyway.
+			self.logger.error("Failed to find logs to compress in %s: %s", this_dir, message)
+			if exception:
+				self.logger.error("Exception:", exc_info=exception)
+			self._fetch_directory()
+
+		finder = FindCompressibleLogsThread(
+			self.configuration.io_loop,
+			on_found,
+			on_error
+		)
+		finder.work(this_dir, self.older_than, self.options['min_size'])
+
+	def _job_id(self, log_path):
+		# Logs are stored as <first two characters>/<rest of the ID>.log.
+		directory, filename = os.path.split(log_path)
+		return os.path.basename(directory) + filename[:-len('.log')]
+
+	def _finish(self, reason=None):
+		message = "Compressed %d log files." % self.compressed_files
+		if reason:
+			message = "Compressed %d log files (%s)." % (self.compressed_files, reason)
+		self.logger.info(message)
+		self.callback(message)
+
+	def _fetch_batch(self):
+		if len(self.candidates) == 0:
+			# Onto the next directory.
+			self._fetch_directory()
+			return
+
+		if time.time() > self.deadline:
+			self._finish("time budget used up")
+			return
+
+		batch = self.candidates[:self.options['batch_size']]
+		self.candidates = self.candidates[self.options['batch_size']:]
+		batch_ids = dict([(self._job_id(log_path), log_path) for log_path in batch])
+
+		def on_jobs(jobs):
+			self.batch = []
+			for job_id, log_path in batch_ids.iteritems():
+				if jobs.has_key(job_id) and jobs[job_id]['state'] not in paasmaker.common.core.constants.JOB_FINISHED_STATES:
+					# Still running, or waiting to run.
+					continue
+				self.batch.append(log_path)
+
+			self._compress_file()
+
+		self.configuration.job_manager.get_jobs(batch_ids.keys(), on_jobs)
+
+	def _compress_file(self):
+		if time.time() > self.deadline:
+			self._finish("time budget used up")
+			return
+
+		try:
+			log_path = self.batch.pop()
+		except IndexError, ex:
+			# Done with this batch.
+			self.configuration.io_loop.add_callback(self._fetch_batch)
+			return
+
+		def on_compressed(compressed):
+			if compressed:
+				self.logger.debug("Compressed %s.", log_path)
+				self.compressed_files += 1
+			else:
+				self.logger.debug("%s changed whilst compressing it, skipping.", log_path)
+			self._compress_file()
+
+		def on_error(message, exception=None):
+			# Skip this one; it's not fatal to the run.
+			self.logger.error("Failed to compress %s: %s", log_path, message)
+			if exception:
+				self.logger.error("Exception:", exc_info=exception)
+			self._compress_file()
+
+		compressor = paasmaker.util.CompressLogThread(
+			self.configuration.io_loop,
+			on_compressed,
+			on_error
+		)
+		compressor.compress(log_path)
 
 class LogsCleanerTest(BasePeriodicTest):
 	def setUp(self):
@@ -164,4 +461,183 @@ class LogsCleanerTest(BasePeriodicTest):
 		self.wait()
 
 		self.assertTrue(self.success)
-		self.assertIn(" 11 ", self.message, "Wrong message returned.")
\ No newline at end of file
+		self.assertIn(" 11 ", self.message, "Wrong message returned.")
+		# Compressed logs are cleaned up too.
+		job_id = str(uuid.uuid4())
+		job_logger = self.configuration.get_job_logger(job_id)
+		job_logger.error(test_string)
+		job_logger.finished()
+		log_path = self.configuration.get_job_log_path(job_id, create_if_missing=False)
+		paasmaker.util.compressedlog.compress_log(log_path)
+		os.utime(log_path + '.gz', (expected_age, expected_age))
+
+		plugin.on_interval(self.success_callback, self.failure_callback)
+		self.wait()
+
+		self.assertTrue(self.success)
+		self.assertIn(" 1 ", self.message, "Wrong message returned.")
+		self.assertFalse(paasmaker.util.compressedlog.log_exists(log_path), "Compressed log was not removed.")
+
+		# Line indexes of logs that have gone are removed, whatever their age.
+		orphan_path = log_path + paasmaker.util.logindex.INDEX_SUFFIX
+		open(orphan_path, 'wb').close()
+
+		plugin.on_interval(self.success_callback, self.failure_callback)
+		self.wait()
+
+		self.assertTrue(self.success)
+		self.assertIn(" 1 ", self.message, "Wrong message returned.")
+		self.assertFalse(os.path.exists(orphan_path), "Orphaned line index was not removed.")
+
+	def test_resume(self):
+		# A directory that can't be finished in one run is carried
+		# on with from where the last run stopped.
+		path = os.path.join(self.configuration.get_flat('log_directory'), 'aa')
+		if not os.path.exists(path):
+			os.makedirs(path)
+		expected_age = time.time() - (86400 * 8)
+		for i in range(6):
+			log_path = os.path.join(path, "%d.log" % i)
+			open(log_path, 'wb').close()
+			if i % 2 == 0:
+				os.utime(log_path, (expected_age, expected_age))
+
+		older_than = int(time.time()) - 86400 * 7
+		def cleaned(removed, last_checked):
+			self.stop((removed, last_checked))
+		cleaner = CleanLogDirectoryThread(self.io_loop, cleaned, self.failure_callback)
+		cleaner.work(path, older_than, time.time() + 60, 1)
+		removed, last_checked = self.wait()
+		self.assertEquals(removed, 1, "Wrong number of files removed.")
+		self.assertEquals(last_checked, "0.log", "Wrong resume point.")
+
+		# Out of time, so nothing more is checked.
+		cleaner = CleanLogDirectoryThread(self.io_loop, cleaned, self.failure_callback)
+		cleaner.work(path, older_than, time.time() - 1, 10, resume_after=last_checked)
+		removed, last_checked = self.wait()
+		self.assertEquals(removed, 0, "Files were removed.")
+		self.assertEquals(last_checked, "0.log", "Wrong resume point.")
+
+		cleaner = CleanLogDirectoryThread(self.io_loop, cleaned, self.failure_callback)
+		cleaner.work(path, older_than, time.time() + 60, 1, resume_after=last_checked)
+		removed, last_checked = self.wait()
+		self.assertEquals(removed, 1, "Wrong number of files removed.")
+		self.assertEquals(last_checked, "2.log", "Did not carry on from the resume point.")
+
+		cleaner = CleanLogDirectoryThread(self.io_loop, cleaned, self.failure_callback)
+		cleaner.work(path, older_than, time.time() + 60, 10, resume_after=last_checked)
+		removed, last_checked = self.wait()
+		self.assertEquals(removed, 1, "Wrong number of files removed.")
+		self.assertEquals(last_checked, None, "Did not finish the directory.")
+		self.assertEquals(sorted(os.listdir(path)), ["1.log", "3.log", "5.log"], "Wrong files left.")
+
+	def test_budget(self):
+		expected_age = time.time() - (86400 * 8)
+		for i in range(11):
+			job_id = str(uuid.uuid4())
+			job_logger = self.configuration.get_job_logger(job_id)
+			job_logger.error("Test")
+			job_logger.finished()
+			log_path = self.configuration.get_job_log_path(job_id, create_if_missing=False)
+			os.utime(log_path, (expected_age, expected_age))
+
+		self.configuration.plugins.register(
+			'paasmaker.periodic.logslimited',
+			'paasmaker.common.periodic.logs.LogsCleaner',
+			{'max_files': 4},
+			'Log Cleanup Plugin'
+		)
+		plugin = self.configuration.plugins.instantiate(
+			'paasmaker.periodic.logslimited',
+			paasmaker.util.plugin.MODE.PERIODIC
+		)
+
+		# Each run removes up to the limit, and the next carries on.
+		for expected in [" 4 ", " 4 ", " 3 ", " 0 "]:
+			plugin.on_interval(self.success_callback, self.failure_callback)
+			self.wait()
+
+			self.assertTrue(self.success)
+			self.assertIn(expected, self.message, "Wrong message returned.")
+
+class LogsCompressorTest(BasePeriodicTest):
+	def setUp(self):
+		super(LogsCompressorTest, self).setUp()
+
+		self.configuration.plugins.register(
+			'paasmaker.periodic.logcompress',
+			'paasmaker.common.periodic.logs.LogsCompressor',
+			{},
+			'Log Compression Plugin'
+		)
+
+		self.logger = logging.getLogger('job')
+		self.logger.propagate = False
+		self.logger.handlers = []
+
+		paasmaker.util.joblogging.JobLoggerAdapter.setup_joblogger(self.configuration)
+
+		self.configuration.startup_job_manager(self.stop, self.stop)
+		self.wait()
+
+	def _make_log(self, job_id, lines):
+		job_logger = self.configuration.get_job_logger(job_id)
+		for i in range(lines):
+			job_logger.info("Line %d of the log for this job." % i)
+		job_logger.finished()
+
+		log_path = self.configuration.get_job_log_path(job_id, create_if_missing=False)
+		expected_age = time.time() - 7200
+		os.utime(log_path, (expected_age, expected_age))
+		return log_path
+
+	def test_simple(self):
+		# A job that is still waiting to run, a finished job,
+		# a job the manager doesn't know about, and a small log.
+		self.configuration.job_manager.add_job('paasmaker.job.container', {}, "Example job.", self.stop)
+		waiting_id = self.wait()
+		self.configuration.job_manager.add_job('paasmaker.job.container', {}, "Example job.", self.stop)
+		finished_id = self.wait()
+		# Aborting only moves on jobs that are waiting or running,
+		# so mark it as finished directly.
+		self.configuration.job_manager.backend.set_attrs(
+			finished_id,
+			{'state': paasmaker.common.core.constants.JOB.ABORTED},
+			self.stop
+		)
+		self.wait()
+
+		waiting_path = self._make_log(waiting_id, 1000)
+		finished_path = self._make_log(finished_id, 1000)
+		unknown_path = self._make_log(str(uuid.uuid4()), 1000)
+		small_path = self._make_log(str(uuid.uuid4()), 1)
+		contents = open(finished_path, 'rb').read()
+
+		plugin = self.configuration.plugins.instantiate(
+			'paasmaker.periodic.logcompress',
+			paasmaker.util.plugin.MODE.PERIODIC
+		)
+
+		plugin.on_interval(self.success_callback, self.failure_callback)
+		self.wait()
+
+		self.assertTrue(self.success)
+		self.assertIn(" 2 ", self.message, "Wrong message returned.")
+
+		self.assertTrue(os.path.exists(waiting_path), "Log of a waiting job was compressed.")
+		self.assertTrue(os.path.exists(small_path), "Small log was compressed.")
+		self.assertFalse(os.path.exists(finished_path), "Log of a finished job was not compressed.")
+		self.assertFalse(os.path.exists(unknown_path), "Log of an unknown job was not compressed.")
+		self.assertTrue(_compressor_progress.has_key(self.configuration.get_flat('log_directory')), "Progress was not recorded.")
+
+		# And it can still be read.
+		fp = paasmaker.util.compressedlog.open_log(finished_path)
+		self.assertEquals(fp.read(), contents, "Compressed log differs.")
+		fp.close()
+
+		# Nothing left to do on the next run.
+		plugin.on_interval(self.success_callback, self.failure_callback)
+		self.wait()
+
+		self.assertTrue(self.success)
+		self.assertIn(" 0 ", self.message, "Wrong message returned.")
@@ -102,6 +102,11 @@ class DefaultStats(BaseStats):
 		# to wait to collect this data.
 		existing_stats['cpus'] = tornado.process.cpu_count()
 
+		# How hard the job manager is working. Shows how many
+		# evaluation requests were merged into other passes.
+		existing_stats['job_evaluations'] = self.configuration.job_manager.get_evaluate_stats()
+		existing_stats['job_status_filter'] = self.configuration.job_manager.get_status_filter_stats()
+
 		callback(existing_stats)
 
 	def _linux_memory(self):
@@ -225,3 +230,4 @@ class DefaultStatsTest(BaseStatsTest):
 		self.assertTrue(stats.has_key('cpus'), "Missing number of CPUs value.")
 		self.assertTrue(stats['cpus'] > 0, "Weird number of CPUs (how is your computer working?!)")
 		self.assertTrue(stats['load'] > 0, "Load average seems unusually low.")
+		self.assertTrue(stats.has_key('job_evaluations'), "Missing job evaluation counters.")
@@ -9,7 +9,9 @@
 import logging
 import json
 import unittest
-import os
+import re
+import time
+import uuid
 
 import paasmaker
 from paasmaker.common.controller.base import BaseController, BaseControllerTest
@@ -23,6 +25,9 @@ import colander
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
+# The number of jobs to show on each page of a job list.
+JOB_LIST_PAGE_SIZE = 50
+
 class JobListController(BaseController):
 	AUTH_METHODS = [BaseController.SUPER, BaseController.USER]
 
@@ -164,7 +169,6 @@ class JobListController(BaseController):
 		self.add_data_template('ret', ret)
 		self.add_data_template('ret_name', ret_name)
 
-		# TODO: Paginate...
 		# TODO: Unit test.
 		def on_more_data(jobdata):
 			for key, meta in jobdata.iteritems():
@@ -183,13 +187,36 @@ class JobListController(BaseController):
 			self.add_data('jobs', job_ids)
 			self.configuration.job_manager.get_jobs(job_ids, on_more_data)
 
+		def on_found_page(job_ids, next_cursor):
+			# The client passes this back to get the next page.
+			self.add_data('next_cursor', next_cursor)
+			on_found_jobs(job_ids)
+
 		def on_found_tree(tree):
 			self.add_data('detail', tree)
 			on_found_jobs(job_list)
 
 		if tag:
-			# Search by tag.
-			self.configuration.job_manager.find_by_tag(tag, on_found_jobs, limit=50)
+			# Search by tag, one page at a time.
+			cursor = None
+			if self.raw_params.has_key('cursor'):
+				cursor = self.raw_params['cursor']
+				if ':' not in cursor:
+					raise tornado.web.HTTPError(400, "Invalid cursor.")
+
+			state = None
+			if self.raw_params.has_key('state'):
+				state = self.raw_params['state']
+				if state not in constants.JOB.ALL:
+					raise tornado.web.HTTPError(400, "Invalid job state.")
+
+			self.configuration.job_manager.find_by_tags(
+				tag,
+				on_found_page,
+				limit=JOB_LIST_PAGE_SIZE,
+				cursor=cursor,
+				state=state
+			)
 		else:
 			# Use the single given ID. Attach the current state to this
 			# page as well...
@@ -255,9 +282,11 @@ class JobLogController(BaseController):
 				logger.info("Found job log %s locally.", job_id)
 
 				log_file = self.configuration.get_job_log_path(job_id, create_if_missing=False)
+				# Write out any buffered entries first.
+				pub.sendMessage('job.flush', job_id=job_id)
 
-				if os.path.exists(log_file):
-					log_fp = open(log_file, 'r')
+				if paasmaker.util.compressedlog.log_exists(log_file):
+					log_fp = paasmaker.util.compressedlog.open_log(log_file)
 					self.set_header('Content-Type', 'text/plain')
 					self.write(log_fp.read())
 					log_fp.close()
@@ -298,4 +327,254 @@ class JobLogController(BaseController):
 	def get_routes(configuration):
 		routes = []
 		routes.append((r"/job/log/([-a-fA-F0-9]+)", JobLogController, configuration))
-		return routes
\ No newline at end of file
+		return routes
+
+class JobLogSearchSchema(colander.MappingSchema):
+	pattern = colander.SchemaNode(colander.String(),
+		title="Pattern",
+		description="The text to search for.",
+		validator=colander.Length(min=1, max=paasmaker.util.logsearch.MAX_PATTERN_LENGTH))
+	regex = colander.SchemaNode(colander.Boolean(),
+		title="Regular expression",
+		description="If true, the pattern is a regular expression rather than plain text.",
+		missing=False,
+		default=False)
+	ignore_case = colander.SchemaNode(colander.Boolean(),
+		title="Ignore case",
+		description="If true, match regardless of case.",
+		missing=False,
+		default=False)
+	max_matches = colander.SchemaNode(colander.Integer(),
+		title="Maximum matches",
+		description="Stop searching after finding this many lines.",
+		missing=paasmaker.util.logsearch.DEFAULT_MAX_MATCHES,
+		default=paasmaker.util.logsearch.DEFAULT_MAX_MATCHES,
+		validator=colander.Range(min=1, max=10000))
+	time_limit = colander.SchemaNode(colander.Float(),
+		title="Time limit",
+		description="Stop searching after this many seconds.",
+		missing=paasmaker.util.logsearch.DEFAULT_TIME_LIMIT,
+		default=paasmaker.util.logsearch.DEFAULT_TIME_LIMIT,
+		validator=colander.Range(min=0.1, max=60))
+
+class JobLogSearchController(BaseController):
+	AUTH_METHODS = [BaseController.SUPER, BaseController.USER, BaseController.NODE]
+
+	def post(self, job_id):
+		# TODO: Attempt to tie this to a workspace for permissions
+		# purposes, as for JobLogController.
+		self.validate_data(JobLogSearchSchema())
+
+		# The search is done on the node that has the log, so
+		# only the matching lines cross the network.
+		def found_log(result_job_id, result):
+			if isinstance(result, basestring):
+				self._search_local(job_id, result)
+			elif isinstance(result, paasmaker.model.Node):
+				self._search_remote(job_id, result)
+
+		def unable_to_find_log(error_job_id, error_message):
+			raise tornado.web.HTTPError(404, "No such log.")
+
+		self.configuration.locate_log(
+			job_id,
+			found_log,
+			unable_to_find_log
+		)
+
+	def _search_local(self, job_id, log_file):
+		logger.info("Searching job log %s locally.", job_id)
+
+		try:
+			pattern = paasmaker.util.logsearch.compile_pattern(
+				self.params['pattern'],
+				regex=self.params['regex'],
+				ignore_case=self.params['ignore_case']
+			)
+		except re.error, ex:
+			self.add_error("Invalid regular expression: %s" % str(ex))
+			raise tornado.web.HTTPError(400, "Invalid regular expression.")
+
+		# Write out any buffered entries first.
+		pub.sendMessage('job.flush', job_id=job_id)
+
+		def searched(result):
+			self.add_data('job_id', job_id)
+			self.add_data('matches', result['matches'])
+			self.add_data('truncated', result['truncated'])
+			self.add_data('reason', result['reason'])
+			self.add_data('searched', result['searched'])
+			self.render("api/apionly.html")
+
+		def search_failed(message, exception=None):
+			self.add_error(message)
+			self.write_error(500)
+
+		search = paasmaker.util.logsearch.LogSearch(
+			self.configuration.io_loop,
+			searched,
+			search_failed
+		)
+		search.search(
+			log_file,
+			pattern,
+			max_matches=self.params['max_matches'],
+			time_limit=self.params['time_limit'],
+			# Regular expressions can take far longer than the time
+			# limit, so run those where they can be stopped.
+			isolate=self.params['regex']
+		)
+
+	def _search_remote(self, job_id, node):
+		def got_result(response):
+			self.add_errors(response.errors)
+			for key, value in response.data.iteritems():
+				self.add_data(key, value)
+			if response.success:
+				self.render("api/apionly.html")
+			else:
+				self.write_error(500)
+
+		request = paasmaker.common.api.job.JobLogSearchAPIRequest(self.configuration)
+		request.set_target(node)
+		request.set_auth(self.configuration.get_flat('node_token'))
+		request.set_job(job_id)
+		request.set_pattern(
+			self.params['pattern'],
+			regex=self.params['regex'],
+			ignore_case=self.params['ignore_case']
+		)
+		request.set_limits(self.params['max_matches'], self.params['time_limit'])
+		# Give up on the node before our own client gives up on us,
+		# so the client gets the reason.
+		request.send(
+			got_result,
+			request_timeout=self.params['time_limit'] + paasmaker.common.api.job.SEARCH_TIMEOUT_MARGIN / 2
+		)
+
+	@staticmethod
+	def get_routes(configuration):
+		routes = []
+		routes.append((r"/job/log/([-a-fA-F0-9]+)/search", JobLogSearchController, configuration))
+		return routes
+
+class JobMetricsController(BaseController):
+	AUTH_METHODS = [BaseController.SUPER, BaseController.USER, BaseController.NODE]
+
+	def get(self):
+		# Users need permission to see these. The other
+		# authentication methods can see them regardless.
+		if self.user:
+			self.require_permission(constants.PERMISSION.SYSTEM_OVERVIEW)
+
+		self.add_data('node', self.configuration.get_node_uuid())
+		self.add_data('metrics', self.configuration.job_manager.get_metrics())
+		self.render("api/apionly.html")
+
+	@staticmethod
+	def get_routes(configuration):
+		routes = []
+		routes.append((r"/job/metrics", JobMetricsController, configuration))
+		return routes
+
+class JobMetricsControllerTest(BaseControllerTest):
+	config_modules = ['pacemaker']
+
+	def get_app(self):
+		self.late_init_configuration(self.io_loop)
+		routes = JobMetricsController.get_routes({'configuration': self.configuration})
+		application = tornado.web.Application(routes, **self.configuration.get_tornado_configuration())
+		return application
+
+	def test_metrics(self):
+		self.configuration.job_manager._record_start('job', {'plugin': 'paasmaker.job.test', 'time': time.time()})
+		self.configuration.job_manager._record_finish('job', constants.JOB.SUCCESS)
+
+		request = paasmaker.common.api.job.JobMetricsAPIRequest(self.configuration)
+		request.send(self.stop)
+		response = self.wait()
+
+		self.failIf(not response.success)
+		self.assertEquals(len(response.errors), 0, "There were errors.")
+		self.assertTrue(response.data['metrics'].has_key('paasmaker.job.test'), "Missing plugin metrics.")
+		metrics = response.data['metrics']['paasmaker.job.test']
+		self.assertEquals(metrics['run_time']['count'], 1, "Run time was not recorded.")
+		self.assertEquals(metrics['outcomes'], {constants.JOB.SUCCESS: 1}, "Outcome was not recorded.")
+
+class JobLogSearchControllerTest(BaseControllerTest):
+	config_modules = ['pacemaker']
+
+	def get_app(self):
+		self.late_init_configuration(self.io_loop)
+		routes = JobLogSearchController.get_routes({'configuration': self.configuration})
+		application = tornado.web.Application(routes, **self.configuration.get_tornado_configuration())
+		return application
+
+	def test_search(self):
+		job_id = str(uuid.uuid4())
+		log_file = self.configuration.get_job_log_path(job_id)
+		log_fp = open(log_file, 'w')
+		for i in range(100):
+			if i % 10 == 0:
+				log_fp.write("ERROR Failed at %d\n" % i)
+			else:
+				log_fp.write("INFO Working at %d\n" % i)
+		log_fp.close()
+
+		request = paasmaker.common.api.job.JobLogSearchAPIRequest(self.configuration)
+		request.set_superkey_auth()
+		request.set_job(job_id)
+		request.set_pattern("error", ignore_case=True)
+		request.send(self.stop)
+		response = self.wait()
+
+		self.failIf(not response.success)
+		self.assertEquals(len(response.errors), 0, "There were errors.")
+		self.assertEquals(len(response.data['matches']), 10, "Wrong number of matches.")
+		self.assertEquals(response.data['matches'][2]['line'], "ERROR Failed at 20", "Wrong line.")
+		self.assertFalse(response.data['truncated'], "Search was truncated.")
+
+		request = paasmaker.common.api.job.JobLogSearchAPIRequest(self.configuration)
+		request.set_superkey_auth()
+		request.set_job(job_id)
+		request.set_pattern("Working")
+		request.set_limits(5, 10)
+		request.send(self.stop)
+		response = self.wait()
+
+		self.failIf(not response.success)
+		self.assertEquals(len(response.data['matches']), 5, "Wrong number of matches.")
+		self.assertTrue(response.data['truncated'], "Search was not truncated.")
+		self.assertEquals(response.data['reason'], 'max_matches', "Wrong reason.")
+
+		# Regular expressions are searched in another process.
+		request = paasmaker.common.api.job.JobLogSearchAPIRequest(self.configuration)
+		request.set_superkey_auth()
+		request.set_job(job_id)
+		request.set_pattern(r"^ERROR Failed at [5-9]0$", regex=True)
+		request.send(self.stop)
+		response = self.wait()
+
+		self.failIf(not response.success)
+		self.assertEquals(len(response.data['matches']), 5, "Wrong number of matches.")
+
+		# Very long patterns are rejected.
+		request = paasmaker.common.api.job.JobLogSearchAPIRequest(self.configuration)
+		request.set_superkey_auth()
+		request.set_job(job_id)
+		request.set_pattern("x" * (paasmaker.util.logsearch.MAX_PATTERN_LENGTH + 1))
+		request.send(self.stop)
+		response = self.wait()
+
+		self.failIf(response.success)
+
+		# Invalid regular expressions are rejected.
+		request = paasmaker.common.api.job.JobLogSearchAPIRequest(self.configuration)
+		request.set_superkey_auth()
+		request.set_job(job_id)
+		request.set_pattern("(unclosed", regex=True)
+		request.send(self.stop)
+		response = self.wait()
+
+		self.failIf(response.success)
+		self.assertIn("Invalid regular expression", response.errors[0])
@@ -160,6 +160,8 @@ class NodeRegisterController(BaseController):
 	def _finished_response(self):
 		# Commit any changes to the database.
 		self.session.commit()
+		# And make sure logs on it are found with it's new details.
+		self.configuration.forget_log_nodes(self.node.uuid)
 		# Add a list of job IDs.
 		self.add_data('jobs', self.node_adjustment_jobs)
 		if len(self.node_adjustment_jobs) > 0:
@@ -13,6 +13,9 @@ import unittest
 import uuid
 import socket
 import base64
+import zlib
+import tempfile
+import collections
 
 import paasmaker
 from ...common.controller.base import BaseControllerTest
@@ -25,9 +28,304 @@ import tornadio2
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
-# Send back log lines in batches of this size (bytes).
-BLOCK_READ = 8192
+# Send back log lines in frames of about this size (bytes). Frames end
+# on a line boundary, unless a single line is longer than a frame.
+LOG_FRAME_SIZE = 65536
+# Send at most this much of a log to a client before checking that it's
+# keeping up, so a slow client can't make us buffer the whole log.
+LOG_WINDOW_SIZE = LOG_FRAME_SIZE * 4
+# How long to wait (seconds) before sending more to a busy client.
+LOG_BACKOFF = 0.25
+# Frames smaller than this are not compressed, even if asked.
+LOG_COMPRESS_THRESHOLD = 1024
 MAX_LOG_SIZE = 102400 # Don't send back more logs than this size.
+# How much of a remote log to hold for a client that isn't keeping up.
+MAX_REMOTE_LOG_QUEUE = LOG_WINDOW_SIZE * 16
+# When the supervisor rotates an instance log, the previous part is
+# left uncompressed with this suffix, so we can finish sending it.
+ROTATED_SUFFIX = '.1'
+
+def read_log_frame(fp, frame_size=LOG_FRAME_SIZE):
+	"""
+	Read the next frame of a log file from the file's current position.
+	The frame is cut back to the end of the last complete line in
+	it, and the file position is left at the end of the frame.
+
+	A frame that reaches the end of the file is returned whole, even if
+	the last line is incomplete, as that is all there is so far. Returns
+	an empty string at the end of the file.
+
+	:arg file fp: The log file, open for reading.
+	:arg int frame_size: The maximum frame size, in bytes.
+	"""
+	data = fp.read(frame_size)
+	if len(data) == frame_size:
+		end = data.rfind('\n')
+		if end != -1 and end + 1 < len(data):
+			fp.seek(end + 1 - len(data), os.SEEK_CUR)
+			data = data[:end + 1]
+	return data
+
+def find_line_start(fp, position):
+	"""
+	Find the start of the first line at or after the given position
+	of a log file, so reading from the result doesn't start halfway
+	through a line.
+
+	:arg file fp: The log file, open for reading.
+	:arg int position: The position to start looking from.
+	"""
+	if position == 0:
+		return 0
+	fp.seek(position - 1)
+	while True:
+		data = fp.read(LOG_FRAME_SIZE)
+		if not data:
+			# No more lines.
+			return fp.tell()
+		end = data.find('\n')
+		if end != -1:
+			return fp.tell() - len(data) + end + 1
+
+class RemoteLogFanIn(object):
+	"""
+	Shares log streams from remote nodes between all the stream
+	connections on this node.
+
+	There is at most one connection to each remote node, and each
+	log is subscribed to on it once, no matter how many local
+	connections are watching it. Frames that arrive are passed to each
+	local subscriber from its own cursor, so a subscriber never sees
+	lines twice, and one that joins late is caught up from the most
+	recent frames if they cover where it wants to start. Otherwise,
+	the remote stream is restarted from that position, and the other
+	subscribers skip the part they've already seen.
+
+	Remote nodes send ``log.start`` with the position they're
+	streaming from each time a stream (re)starts, which is how
+	subscribers asking for a line number or time find their cursor.
+
+	Frames are queued on each subscriber's cursor, and the subscriber
+	sends them on as its client keeps up, the same as local logs.
+
+	:arg Configuration configuration: The configuration object.
+	"""
+	def __init__(self, configuration):
+		self.configuration = configuration
+		# Node UUID -> {'connection': LogStreamAPIRequest, 'jobs': set of job IDs}
+		self.nodes = {}
+		# Job ID -> {'node': node UUID, 'subscribers': {connection: cursor},
+		# 'start': position the stream started from, 'position': end of the
+		# last frame, 'frames': deque of recent (start, end, lines),
+		# 'buffered': bytes in frames, 'complete': frames go back to start}
+		self.jobs = {}
+
+	def subscribe(self, subscriber, job_id, node, position=0, compress=False, line=None, timestamp=None):
+		"""
+		Subscribe a local stream connection to a log on a remote node.
+		The subscriber's ``handle_remote_lines()`` is called with
+		frames as they arrive.
+
+		:arg StreamConnection subscriber: The local connection.
+		:arg str job_id: The job ID of the log.
+		:arg Node node: The node that has the log.
+		:arg int position: The position to stream from.
+		:arg bool compress: If the subscriber wants compressed frames.
+		:arg int|None line: Stream from this line number instead.
+		:arg float|None timestamp: Stream from this time instead.
+		"""
+		cursor = {
+			'position': position,
+			'compress': compress,
+			'retry': None,
+			# (frame, position) tuples waiting to be sent to the client.
+			'pending': collections.deque(),
+			'pending_size': 0
+		}
+		seek = line is not None or timestamp is not None
+		if seek:
+			# Find out where the remote end starts streaming from.
+			cursor['position'] = None
+
+		if not self.jobs.has_key(job_id):
+			self.jobs[job_id] = {
+				'node': node.uuid,
+				'subscribers': {},
+				'start': None,
+				'position': None,
+				'frames': collections.deque(),
+				'buffered': 0,
+				'complete': True
+			}
+			self._get_node(node)['jobs'].add(job_id)
+		else:
+			logger.debug("Sharing existing stream of %s from %s.", job_id, node.uuid)
+
+		job = self.jobs[job_id]
+		if job['subscribers'].has_key(subscriber):
+			self._drop_cursor(job['subscribers'][subscriber])
+		job['subscribers'][subscriber] = cursor
+
+		if not seek and self._catch_up(job_id, job, subscriber, cursor):
+			# What we have covers it, so just follow along.
+			return
+
+		logger.debug("(Re)starting stream of %s from %s.", job_id, node.uuid)
+		self.nodes[job['node']]['connection'].subscribe(
+			job_id,
+			position=position,
+			compress=True,
+			line=line,
+			timestamp=timestamp
+		)
+
+	def unsubscribe(self, subscriber, job_id):
+		"""
+		Unsubscribe a local stream connection from a remote log.
+		Once nobody is watching it, the remote log is unsubscribed
+		from, and once nothing is being watched on a node, the
+		connection to it is closed.
+
+		:arg StreamConnection subscriber: The local connection.
+		:arg str job_id: The job ID of the log.
+		"""
+		if not self.jobs.has_key(job_id):
+			return
+		job = self.jobs[job_id]
+		if job['subscribers'].has_key(subscriber):
+			self._drop_cursor(job['subscribers'][subscriber])
+			del job['subscribers'][subscriber]
+		if len(job['subscribers']) > 0:
+			return
+
+		del self.jobs[job_id]
+		node = self.nodes[job['node']]
+		node['jobs'].discard(job_id)
+		if len(node['jobs']) > 0:
+			node['connection'].unsubscribe(job_id)
+		else:
+			logger.info("No more logs being watched on %s, closing connection.", job['node'])
+			del self.nodes[job['node']]
+			node['connection'].close()
+
+	def remove_subscriber(self, subscriber):
+		"""
+		Unsubscribe a local stream connection from all the remote
+		logs it's watching.
+
+		:arg StreamConnection subscriber: The local connection.
+		"""
+		for job_id, job in self.jobs.items():
+			if job['subscribers'].has_key(subscriber):
+				self.unsubscribe(subscriber, job_id)
+
+	def _drop_cursor(self, cursor):
+		# Stop waiting to send queued frames to a subscriber
+		# that has gone away.
+		if cursor['retry']:
+			self.configuration.io_loop.remove_timeout(cursor['retry'])
+			cursor['retry'] = None
+		cursor['pending'].clear()
+		cursor['pending_size'] = 0
+
+	def _get_node(self, node):
+		if self.nodes.has_key(node.uuid):
+			return self.nodes[node.uuid]
+
+		# TODO: Test connection errors and handling of those errors.
+		# Although we're already filtered to active instances,
+		# so that will help a lot.
+		logger.info("Creating connection to node %s", node.uuid)
+		remote = paasmaker.common.api.log.LogStreamAPIRequest(self.configuration)
+		remote.set_target(node)
+		remote.set_start_callback(self._remote_start)
+		remote.set_lines_callback(self._remote_lines)
+		remote.set_zerosize_callback(self._remote_zerosize)
+		remote.set_cantfind_callback(self._remote_cantfind)
+		remote.connect()
+
+		self.nodes[node.uuid] = {
+			'connection': remote,
+			'jobs': set()
+		}
+		return self.nodes[node.uuid]
+
+	def _catch_up(self, job_id, job, subscriber, cursor):
+		# Send the subscriber any recent frames after its position.
+		# Returns False if they don't go back far enough.
+		position = cursor['position']
+		if job['complete'] and job['start'] is not None and position >= job['start']:
+			pass
+		elif len(job['frames']) > 0 and position >= job['frames'][0][0]:
+			pass
+		else:
+			return False
+
+		for start, end, lines in job['frames']:
+			self._deliver(job_id, subscriber, cursor, start, end, lines)
+		return True
+
+	def _deliver(self, job_id, subscriber, cursor, start, end, lines):
+		if cursor['position'] is None or end <= cursor['position']:
+			# Waiting for the stream to start, or seen it already.
+			return
+
+		offset = start
+		unseen = []
+		for line in lines:
+			if offset >= cursor['position']:
+				unseen.append(line)
+			offset += len(line)
+
+		cursor['position'] = end
+		if len(unseen) > 0:
+			subscriber.handle_remote_lines(job_id, ''.join(unseen), cursor)
+
+	def _remote_start(self, job_id, position):
+		if not self.jobs.has_key(job_id):
+			return
+		job = self.jobs[job_id]
+		job['start'] = position
+		job['position'] = position
+		job['frames'].clear()
+		job['buffered'] = 0
+		job['complete'] = True
+		for cursor in job['subscribers'].values():
+			if cursor['position'] is None:
+				cursor['position'] = position
+
+	def _remote_lines(self, job_id, lines, position):
+		if not self.jobs.has_key(job_id):
+			return
+		logger.debug("Got %d lines from remote for %s.", len(lines), job_id)
+		job = self.jobs[job_id]
+
+		# Work in bytes, as positions are byte offsets.
+		lines = [line.encode('utf-8') if isinstance(line, unicode) else line for line in lines]
+		size = sum([len(line) for line in lines])
+		start = position - size
+
+		# Keep enough recent frames to catch up new subscribers.
+		job['frames'].append((start, position, lines))
+		job['buffered'] += size
+		job['position'] = position
+		while job['buffered'] > MAX_LOG_SIZE and len(job['frames']) > 1:
+			dropped = job['frames'].popleft()
+			job['buffered'] -= dropped[1] - dropped[0]
+			job['complete'] = False
+
+		for subscriber, cursor in job['subscribers'].items():
+			self._deliver(job_id, subscriber, cursor, start, position, lines)
+
+	def _remote_zerosize(self, job_id):
+		if self.jobs.has_key(job_id):
+			for subscriber in self.jobs[job_id]['subscribers'].keys():
+				subscriber.emit('log.zerosize', job_id)
+
+	def _remote_cantfind(self, job_id, message):
+		if self.jobs.has_key(job_id):
+			for subscriber in self.jobs[job_id]['subscribers'].keys():
+				subscriber.emit('log.cantfind', job_id, message)
 
 # TODO: Add hooks so that plugins can also use this connection.
 # TODO: Service tunnelling is not efficient because it has to base64 the data
@@ -129,11 +427,17 @@ class StreamConnection(tornadio2.SocketConnection):
 		self.job_listening = False
 
 		# Log setup.
-		self.log_last_positions = {}
+		# Job ID -> {'position': next byte to send, 'compress': bool, 'retry': timeout,
+		# 'inode': inode of the log when we last read it, 'rotated': True
+		# whilst sending the rest of the log from before it was rotated}
+		self.log_cursors = {}
 		self.log_subscribed = {}
 		self.log_job_watcher = self.configuration.get_job_watcher()
-		self.log_remote_connections = {}
-		self.log_remote_subscriptions = {}
+		# Remote logs are shared between all connections on this node.
+		# Another hack, storing it on the socket.io router.
+		if not hasattr(self.session.server, 'remote_logs'):
+			self.session.server.remote_logs = RemoteLogFanIn(self.configuration)
+		self.log_remote = self.session.server.remote_logs
 
 		# Router setup.
 		self.router_stats_queue = []
@@ -164,9 +468,10 @@ class StreamConnection(tornadio2.SocketConnection):
 		for job_id in self.log_subscribed:
 			self.log_job_watcher.remove_watch(job_id)
 			pub.unsubscribe(self.log_message_update, self.configuration.get_job_message_pub_topic(job_id))
-		logger.debug("Closing %d remote connections.", len(self.log_remote_connections))
-		for remote_uuid, remote_data in self.log_remote_connections.iteritems():
-			remote_data['connection'].close()
+		for job_id in self.log_cursors.keys():
+			self._remove_log_cursor(job_id)
+		logger.debug("Unsubscribing remote subscriptions.")
+		self.log_remote.remove_subscriber(self)
 		logger.debug("Closing complete.")
 
 		# Clean up router stats.
@@ -299,13 +604,22 @@ class StreamConnection(tornadio2.SocketConnection):
 		pubsub receiver for new log messages.
 		"""
 		logger.debug("New job data for %s, forwarding to client.", job_id)
-		self.send_job_log(job_id, self.log_last_positions[job_id])
+		self.send_job_log(job_id)
 
 	@tornadio2.event('log.subscribe')
-	def log_subscribe(self, job_id, position=0, unittest_force_remote=False):
+	def log_subscribe(self, job_id, position=0, unittest_force_remote=False, compress=False, line=None, timestamp=None):
 		"""
 		Subscribe to the given log, sending back data for that log as it's
 		available.
+
+		If ``compress`` is true, larger frames are sent as ``log.compressed``
+		events, with the lines zlib compressed and base64 encoded, instead of
+		as ``log.lines`` events.
+
+		Instead of a byte position, the log can be streamed from a
+		``line`` number (negative numbers count back from the end), or from
+		the first line logged at or after a unix ``timestamp``. These are
+		found using the log's index.
 		"""
 		logger.info("Handling subscribe request for %s", job_id)
 
@@ -322,22 +636,58 @@ class StreamConnection(tornadio2.SocketConnection):
 			if isinstance(result, basestring):
 				logger.info("Found job log %s locally.", job_id)
 
-				read_position = position
+				# Make sure anything we've logged is on disk.
+				pub.sendMessage('job.flush', job_id=job_id)
+
+				def start_stream(read_position):
+					# It's the path to the log.
+					# Step 1: Feed since when they last saw.
+					self._remove_log_cursor(job_id)
+					self.log_cursors[job_id] = {
+						'position': read_position,
+						'compress': compress,
+						'retry': None,
+						'inode': None,
+						'rotated': False
+					}
+					self.emit('log.start', job_id, read_position)
+					self.send_job_log(job_id)
+					# Step 2: subscribe for future updates.
+					pub.subscribe(self.log_message_update, self.configuration.get_job_message_pub_topic(job_id))
+					if not self.log_subscribed.has_key(job_id):
+						self.log_job_watcher.add_watch(job_id)
+					self.log_subscribed[job_id] = True
+
+				def seek_failed(message, exception=None):
+					self.emit('log.cantfind', job_id, message)
+
+				if line is not None or timestamp is not None:
+					# Look up where to start in the log's index. This
+					# might need to build the index, so is done on
+					# another thread.
+					seek = paasmaker.util.LogIndexSeek(
+						self.configuration.io_loop,
+						start_stream,
+						seek_failed
+					)
+					seek.seek(
+						result,
+						line=None if line is None else int(line),
+						timestamp=None if timestamp is None else float(timestamp),
+						interval=self.configuration['job_logs']['index_interval']
+					)
+				else:
+					read_position = position
 
-				log_size = os.path.getsize(result)
-				if log_size > MAX_LOG_SIZE:
-					# Don't send back any more than MAX_LOG_SIZE of the file.
-					# Yes, this will potentially chop log lines in half.
-					# TODO: Make it not chop log lines in half.
-					read_position = log_size - MAX_LOG_SIZE
+					log_size = paasmaker.util.compressedlog.log_size(result)
+					if log_size - read_position > MAX_LOG_SIZE:
+						# Don't send back any more than MAX_LOG_SIZE of the file,
+						# starting at the beginning of a line.
+						fp = paasmaker.util.compressedlog.open_log(result)
+						read_position = find_line_start(fp, log_size - MAX_LOG_SIZE)
+						fp.close()
 
-				# It's the path to the log.
-				# Step 1: Feed since when they last saw.
-				self.send_job_log(job_id, read_position)
-				# Step 2: subscribe for future updates.
-				pub.subscribe(self.log_message_update, self.configuration.get_job_message_pub_topic(job_id))
-				self.log_job_watcher.add_watch(job_id)
-				self.log_subscribed[job_id] = True
+					start_stream(read_position)
 
 			elif isinstance(result, paasmaker.model.Node):
 				# It's a remote node containing the log.
@@ -346,7 +696,10 @@ class StreamConnection(tornadio2.SocketConnection):
 					job_id,
 					position,
 					result,
-					unittest_force_remote=unittest_force_remote
+					unittest_force_remote=unittest_force_remote,
+					compress=compress,
+					line=line,
+					timestamp=timestamp
 				)
 
 		def unable_to_find_log(error_job_id, error_message):
@@ -361,62 +714,86 @@ class StreamConnection(tornadio2.SocketConnection):
 			unittest_force_remote=unittest_force_remote
 		)
 
-	def handle_remote_subscribe(self, job_id, position, node, unittest_force_remote=False):
+	def handle_remote_subscribe(self, job_id, position, node, unittest_force_remote=False, compress=False, line=None, timestamp=None):
 		"""
 		Helper function to handle fetching logs from a remote system via websocket.
+		The stream from the remote node is shared with any other
+		connections watching the same log; see ``RemoteLogFanIn``.
 		"""
 		if not unittest_force_remote and node.uuid == self.configuration.get_node_uuid():
 			# Prevent us from connecting to ourselves...
 			self.emit('log.zerosize', job_id)
 			return
 
-		if self.log_remote_subscriptions.has_key(node.uuid):
-			logger.debug("Using existing connection to %s", node.uuid)
-			# We have an existing connection. Reuse that.
-			remote = self.log_remote_subscriptions[node.uuid]['connection']
-			remote.subscribe(job_id)
-			if not self.log_remote_subscriptions.has_key(job_id):
-				# Don't increase the refcount if we subscribe multiple times.
-				self.log_remote_subscriptions[node.uuid]['refcount'] += 1
-			self.log_remote_subscriptions[job_id] = node.uuid
-		else:
-			# No existing connection. Make one.
-			logger.info("Creating connection to node %s", node.uuid)
-
-			def remote_error(remote_job_id, error):
-				self.emit('log.cantfind', remote_job_id, error)
-
-			def remote_zerosize(job_id):
-				self.emit('log.zerosize', job_id)
-
-			# Now we try to connect to it.
-			# TODO: Test connection errors and handling of those errors.
-			# Although we're already filtered to active instances,
-			# so that will help a lot.
-			logger.debug("Starting connection to %s", str(node))
-			remote = paasmaker.common.api.log.LogStreamAPIRequest(self.configuration)
-			remote.set_target(node)
-			remote.set_lines_callback(self.handle_remote_lines)
-			remote.set_zerosize_callback(remote_zerosize)
-			remote.set_cantfind_callback(remote_error)
-
-			remote.subscribe(job_id, position=position)
-			remote.connect()
-
-			self.log_remote_connections[node.uuid] = {
-				'connection': remote,
-				'refcount': 1
-			}
+		self.log_remote.subscribe(
+			self,
+			job_id,
+			node,
+			position=position,
+			compress=compress,
+			line=line,
+			timestamp=timestamp
+		)
+
+	def handle_remote_lines(self, job_id, frame, cursor):
+		"""
+		Receiver for log entries from a remote system, called
+		by ``RemoteLogFanIn`` with the lines this connection hasn't
+		seen yet.
+
+		The lines are queued on the cursor, and sent as the client
+		keeps up, like ``send_job_log()``. If the client falls more
+		than ``MAX_REMOTE_LOG_QUEUE`` behind, the oldest queued lines are
+		dropped, as if it had subscribed from there.
+		"""
+		cursor['pending'].append((frame, cursor['position']))
+		cursor['pending_size'] += len(frame)
+		while cursor['pending_size'] > MAX_REMOTE_LOG_QUEUE and len(cursor['pending']) > 1:
+			dropped, position = cursor['pending'].popleft()
+			cursor['pending_size'] -= len(dropped)
+			logger.debug("Client is too far behind on %s, dropping %d bytes.", job_id, len(dropped))
 
-			self.log_remote_subscriptions[job_id] = node.uuid
-			logger.debug("Now waiting for connection to %s", str(node))
+		self.send_remote_log(job_id, cursor)
 
-	def handle_remote_lines(self, job_id, lines, position):
+	def send_remote_log(self, job_id, cursor):
 		"""
-		pubsub receiver for log entries from a remote system.
+		Helper function to send the queued lines of a remote
+		log. If the client isn't keeping up with what has already
+		been sent, or there is more than ``LOG_WINDOW_SIZE`` queued,
+		the rest is sent a little later.
+
+		:arg str job_id: The job ID.
+		:arg dict cursor: The cursor from ``RemoteLogFanIn``.
 		"""
-		logger.debug("Got %d lines from remote for %s.", len(lines), job_id)
-		self.emit('log.lines', job_id, lines, position)
+		if cursor['retry']:
+			# We're already waiting for the client to catch up.
+			return
+
+		if self._log_transport_busy():
+			logger.debug("Client is busy, holding remote logs for %s.", job_id)
+			self._retry_remote_log(job_id, cursor)
+			return
+
+		sent = 0
+		while sent < LOG_WINDOW_SIZE and len(cursor['pending']) > 0:
+			frame, position = cursor['pending'].popleft()
+			cursor['pending_size'] -= len(frame)
+			sent += len(frame)
+			self._emit_log_frame(job_id, frame, position, cursor['compress'])
+
+		if len(cursor['pending']) > 0:
+			# Send the rest once this has been delivered.
+			self._retry_remote_log(job_id, cursor)
+
+	def _retry_remote_log(self, job_id, cursor):
+		def retry():
+			cursor['retry'] = None
+			self.send_remote_log(job_id, cursor)
+
+		cursor['retry'] = self.configuration.io_loop.add_timeout(
+			time.time() + LOG_BACKOFF,
+			retry
+		)
 
 	@tornadio2.event('log.unsubscribe')
 	def log_unsubscribe(self, job_id):
@@ -429,46 +806,183 @@ class StreamConnection(tornadio2.SocketConnection):
 			self.log_job_watcher.remove_watch(job_id)
 			pub.unsubscribe(self.log_message_update, self.configuration.get_job_message_pub_topic(job_id))
 			del self.log_subscribed[job_id]
+			self._remove_log_cursor(job_id)
 			logger.debug("Unsubscribed local follow for %s", job_id)
-		if self.log_remote_subscriptions.has_key(job_id):
-			nodeuuid = self.log_remote_subscriptions[job_id]
-			del self.log_remote_subscriptions[job_id]
-			logger.debug("Ref count for %s is %d", job_id, self.log_remote_connections[nodeuuid]['refcount'])
-			self.log_remote_connections[nodeuuid]['refcount'] -= 1
-			if self.log_remote_connections[nodeuuid]['refcount'] < 1:
-				logger.info("Refcount for %s dropped to zero, closing connection.", nodeuuid)
-				remote = self.log_remote_connections[nodeuuid]['connection']
-				del self.log_remote_connections[nodeuuid]
-				remote.close()
-
-	def send_job_log(self, job_id, last_position=0):
+		self.log_remote.unsubscribe(self, job_id)
+
+	def send_job_log(self, job_id, last_position=None):
 		"""
 		Helper function to send the local log from the given
 		position onwards.
 
+		The log is sent in line aligned frames. If the client
+		isn't keeping up with what has already been sent, or
+		there is more than ``LOG_WINDOW_SIZE`` to send, the rest
+		is sent a little later, from where this left off. If the
+		log was rotated since the last call, the rest of the
+		rotated log is sent first, in the same way.
+
 		:arg str job_id: The job ID.
-		:arg int last_position: The position to stream from.
+		:arg int|None last_position: The position to stream from.
+			If None, streams from where the last call left off.
 		"""
+		if not self.log_cursors.has_key(job_id):
+			self.log_cursors[job_id] = {'position': 0, 'compress': False, 'retry': None, 'inode': None, 'rotated': False}
+		cursor = self.log_cursors[job_id]
+		if last_position is not None:
+			cursor['position'] = last_position
+
+		if cursor['retry']:
+			# We're already waiting for the client to catch up,
+			# and will send this when it does.
+			return
+
 		log_file = self.configuration.get_job_log_path(job_id, create_if_missing=False)
-		if not os.path.exists(log_file) or os.path.getsize(log_file) == 0:
+		if not cursor['rotated']:
+			self._check_log_rotated(job_id, log_file, cursor)
+		if not cursor['rotated'] and paasmaker.util.compressedlog.log_size(log_file) == 0:
 			# Report the zero size.
 			# TODO: Unit test this.
 			logger.debug("Sending zero size for %s", job_id)
 			self.emit('log.zerosize', job_id)
+			return
+
+		if self._log_transport_busy():
+			logger.debug("Client is busy, holding logs for %s.", job_id)
+			self._retry_job_log(job_id)
+			return
+
+		logger.debug("Sending logs from %s, position %d", job_id, cursor['position'])
+		sent = 0
+		if cursor['rotated']:
+			sent = self._send_rotated_log(job_id, log_file, cursor)
+
+		if not cursor['rotated'] and sent < LOG_WINDOW_SIZE:
+			if paasmaker.util.compressedlog.log_size(log_file) > 0:
+				fp = paasmaker.util.compressedlog.open_log(log_file)
+				self._send_log_frames(job_id, fp, cursor, LOG_WINDOW_SIZE - sent)
+				fp.close()
+
+		more = cursor['rotated'] or cursor['position'] < paasmaker.util.compressedlog.log_size(log_file)
+
+		if more:
+			# Send the rest once this has been delivered.
+			self._retry_job_log(job_id)
+
+	def _send_log_frames(self, job_id, fp, cursor, limit):
+		# Send frames from the cursor's position until limit bytes
+		# are sent, or the end of the file. Returns the number of
+		# bytes sent.
+		fp.seek(cursor['position'])
+		sent = 0
+		while sent < limit:
+			frame_size = min(LOG_FRAME_SIZE, limit - sent)
+			frame = read_log_frame(fp, frame_size)
+			if len(frame) == 0:
+				break
+			if frame_size < LOG_FRAME_SIZE and len(frame) == frame_size and not frame.endswith('\n'):
+				# The next line doesn't fit in what's left of the
+				# limit. Send it next time, rather than split it.
+				fp.seek(cursor['position'])
+				break
+			sent += len(frame)
+			cursor['position'] = fp.tell()
+			self._emit_log_frame(job_id, frame, cursor['position'], cursor['compress'])
+		return sent
+
+	def _send_rotated_log(self, job_id, log_file, cursor):
+		# Send the next window of the rotated log. Once it's all
+		# sent, or if it's gone, carry on from the start of the new
+		# log. Returns the number of bytes sent.
+		sent = 0
+		finished = True
+		try:
+			fp = open(log_file + ROTATED_SUFFIX, 'rb')
+		except IOError, ex:
+			fp = None
+
+		if fp is not None and os.fstat(fp.fileno()).st_ino == cursor['inode']:
+			sent = self._send_log_frames(job_id, fp, cursor, LOG_WINDOW_SIZE)
+			finished = cursor['position'] >= os.fstat(fp.fileno()).st_size
 		else:
-			logger.debug("Sending logs from %s, position %d", job_id, last_position)
-			fp = open(log_file, 'rb')
-			if last_position > 0:
-				fp.seek(last_position)
-			lines = ['Dummy line']
-			while len(lines) > 0:
-				lines = fp.readlines(BLOCK_READ)
-				if len(lines) > 0:
-					self.emit('log.lines', job_id, lines, fp.tell())
-
-			self.log_last_positions[job_id] = fp.tell()
+			logger.debug("Rotated log for %s has gone, skipping the rest of it.", job_id)
+
+		if fp is not None:
 			fp.close()
 
+		if finished:
+			cursor['rotated'] = False
+			cursor['position'] = 0
+			cursor['inode'] = self._log_inode(log_file)
+
+		return sent
+
+	def _log_inode(self, path):
+		try:
+			return os.stat(path).st_ino
+		except OSError, ex:
+			# Not there, or only compressed.
+			return None
+
+	def _check_log_rotated(self, job_id, log_file, cursor):
+		# If the log was rotated since we last read it, the rest of the
+		# old log is sent before carrying on from the start of the new
+		# one. Rotation keeps the old log's inode, so that's how we
+		# recognise it.
+		inode = self._log_inode(log_file)
+		previous = cursor['inode']
+		cursor['inode'] = inode
+		if previous is None or inode == previous:
+			return
+
+		if self._log_inode(log_file + ROTATED_SUFFIX) != previous:
+			return
+
+		logger.debug("Log for %s was rotated, sending the rest of the old log.", job_id)
+		cursor['rotated'] = True
+		cursor['inode'] = previous
+
+	def _emit_log_frame(self, job_id, frame, position, compress):
+		if compress and len(frame) >= LOG_COMPRESS_THRESHOLD:
+			self.emit(
+				'log.compressed',
+				job_id,
+				base64.b64encode(zlib.compress(frame)),
+				position
+			)
+		else:
+			self.emit('log.lines', job_id, frame.splitlines(True), position)
+
+	def _log_transport_busy(self):
+		# Check if messages we've already sent are still waiting to
+		# go to the client. Polling transports queue them on the
+		# session until the client next polls; websockets buffer
+		# them in the stream until the socket can take them.
+		if len(getattr(self.session, 'send_queue', [])) > 0:
+			return True
+		handler = getattr(self.session, 'handler', None)
+		stream = getattr(handler, 'stream', None)
+		if stream is not None and not stream.closed() and stream.writing():
+			return True
+		return False
+
+	def _retry_job_log(self, job_id):
+		def retry():
+			if self.log_cursors.has_key(job_id):
+				self.log_cursors[job_id]['retry'] = None
+				self.send_job_log(job_id)
+
+		self.log_cursors[job_id]['retry'] = self.configuration.io_loop.add_timeout(
+			time.time() + LOG_BACKOFF,
+			retry
+		)
+
+	def _remove_log_cursor(self, job_id):
+		if self.log_cursors.has_key(job_id):
+			if self.log_cursors[job_id]['retry']:
+				self.configuration.io_loop.remove_timeout(self.log_cursors[job_id]['retry'])
+			del self.log_cursors[job_id]
+
 	#
 	# ROUTER STATS HANDLING
 	#
@@ -845,6 +1359,7 @@ class StreamConnectionTest(BaseControllerTest):
 		)
 		# Hack to store the configuration on the socket.io router.
 		socketio_router.configuration = self.configuration
+		self.socketio_router = socketio_router
 
 		application_settings = self.configuration.get_tornado_configuration()
 		application = tornado.web.Application(
@@ -979,6 +1494,10 @@ class StreamConnectionTest(BaseControllerTest):
 
 		self.assertEquals(number_lines, len(lines), "Didn't download the expected number of lines.")
 
+		# Where the log is is now cached, so the next lookup won't need the database.
+		self.assertEquals(self.configuration.log_locations.get(job_id), nodeuuid, "Job location was not cached.")
+		self.assertTrue(self.configuration.log_nodes.has_key(nodeuuid), "Node was not cached.")
+
 		# Unsubscribe, send more logs, then try again.
 		self.client.unsubscribe(job_id)
 
@@ -996,6 +1515,150 @@ class StreamConnectionTest(BaseControllerTest):
 		self.client.close()
 		self.short_wait_hack()
 
+	def test_locate_log_cache(self):
+		def found(job_id, result):
+			self.stop(result)
+
+		def not_found(job_id, message):
+			self.stop(message)
+
+		# Count the database sessions that lookups use.
+		sessions = []
+		get_database_session = self.configuration.get_database_session
+		def counted_session(callback, error_callback):
+			sessions.append(True)
+			get_database_session(callback, error_callback)
+		self.configuration.get_database_session = counted_session
+
+		nodeuuid = str(uuid.uuid4())
+		node = paasmaker.model.Node('test', 'localhost', 12345, nodeuuid, constants.NODE.ACTIVE)
+		self.configuration.get_database_session(self.stop, None)
+		session = self.wait()
+		session.add(node)
+		session.commit()
+		del sessions[:]
+
+		# The job manager records where jobs are, but not the node's details,
+		# so the first lookup fetches the node.
+		job_id = str(uuid.uuid4())
+		self.configuration.remember_log_location(job_id, nodeuuid)
+		self.configuration.locate_log(job_id, found, not_found)
+		result = self.wait()
+		self.assertEquals(result.uuid, nodeuuid, "Didn't find the node.")
+		self.assertEquals(len(sessions), 1, "Didn't look up the node.")
+
+		# Now it's cached, so the database isn't needed.
+		self.configuration.locate_log(job_id, found, not_found)
+		result = self.wait()
+		self.assertEquals(result.uuid, nodeuuid, "Didn't find the node.")
+		self.assertEquals(len(sessions), 1, "Used the database for a cached lookup.")
+
+		# Once the node's details expire, they're fetched again, once.
+		expires, cached_node = self.configuration.log_nodes[nodeuuid]
+		self.configuration.log_nodes[nodeuuid] = (time.time() - 1, cached_node)
+		self.configuration.locate_log(job_id, found, not_found)
+		result = self.wait()
+		self.assertEquals(result.uuid, nodeuuid, "Didn't find the node.")
+		self.assertEquals(len(sessions), 2, "Didn't refresh the node just once.")
+		self.assertTrue(self.configuration.log_nodes[nodeuuid][0] > time.time(), "Didn't cache the refreshed node.")
+
+		# Jobs added as a tree are recorded too, so finding their
+		# logs doesn't need the database either.
+		root = self.manager.get_specifier()
+		root.set_job('paasmaker.job.success', {}, "Example root job.", node=nodeuuid)
+		child = root.add_child()
+		child.set_job('paasmaker.job.success', {}, "Example child job.", node=nodeuuid)
+		self.manager.add_tree(root, self.stop)
+		self.wait()
+		self.configuration.locate_log(child.job_id, found, not_found)
+		result = self.wait()
+		self.assertEquals(result.uuid, nodeuuid, "Didn't find the node for a tree job.")
+		self.assertEquals(len(sessions), 2, "Used the database to find a tree job.")
+
+		# When the node goes down, it's forgotten, and the lookup reports it.
+		node.state = constants.NODE.DOWN
+		session.add(node)
+		session.commit()
+		session.close()
+		self.configuration.forget_log_nodes(nodeuuid)
+		self.configuration.locate_log(job_id, found, not_found)
+		result = self.wait()
+		self.assertIn("is down", result, "Didn't report the node was down.")
+
+		# The locations are limited to the cache size.
+		self.configuration['job_logs']['location_cache_size'] = 2
+		self.configuration.log_locations = None
+		job_ids = [str(uuid.uuid4()) for i in range(3)]
+		for remember_id in job_ids:
+			self.configuration.remember_log_location(remember_id, nodeuuid)
+		self.assertEquals(len(self.configuration.log_locations), 2, "Cache grew beyond it's size.")
+		self.assertEquals(self.configuration.log_locations.get(job_ids[0]), None, "Oldest location was kept.")
+		self.assertEquals(self.configuration.log_locations.get(job_ids[2]), nodeuuid, "Newest location was dropped.")
+
+	def test_shared_remote(self):
+		nodeuuid = str(uuid.uuid4())
+		self.configuration.set_node_uuid(nodeuuid)
+		node = paasmaker.model.Node('test', 'localhost', self.get_http_port(), nodeuuid, constants.NODE.ACTIVE)
+		self.configuration.get_database_session(self.stop, None)
+		session = self.wait()
+		session.add(node)
+		session.commit()
+
+		self.manager.add_job('paasmaker.job.success', {}, "Example root job.", self.stop)
+		job_id = self.wait()
+
+		log = self.configuration.get_job_logger(job_id)
+		for i in range(10):
+			log.info("Log message %d", i)
+
+		received = {'first': [], 'second': []}
+		def lines_for(name):
+			def got_lines(job_id, lines, position):
+				received[name].extend(lines)
+				self.stop()
+			return got_lines
+
+		def wait_for(name, count):
+			while len(received[name]) < count:
+				self.wait()
+
+		first = paasmaker.common.api.log.LogStreamAPIRequest(self.configuration)
+		first.set_lines_callback(lines_for('first'))
+		first.subscribe(job_id, 0, True)
+		first.connect()
+		wait_for('first', 10)
+
+		# The second subscriber is caught up from what the first
+		# has already received, without another remote stream.
+		self.client = paasmaker.common.api.log.LogStreamAPIRequest(self.configuration)
+		self.client.set_lines_callback(lines_for('second'))
+		self.client.subscribe(job_id, 0, True)
+		self.client.connect()
+		wait_for('second', 10)
+
+		remote_logs = self.socketio_router.remote_logs
+		self.assertEquals(len(remote_logs.nodes), 1, "Wrong number of remote connections.")
+		self.assertEquals(len(remote_logs.jobs[job_id]['subscribers']), 2, "Wrong number of subscribers.")
+
+		# New lines go to both, once each.
+		log.info("Another additional log entry.")
+		wait_for('first', 11)
+		wait_for('second', 11)
+		self.short_wait_hack()
+
+		self.assertEquals(len(received['first']), 11, "First subscriber got the wrong lines.")
+		self.assertEquals(received['first'], received['second'], "Subscribers got different lines.")
+
+		# The remote stream stays open until the last one leaves.
+		first.close()
+		self.short_wait_hack()
+		self.assertEquals(len(remote_logs.nodes), 1, "Remote connection was closed.")
+
+		self.client.unsubscribe(job_id)
+		self.short_wait_hack()
+		self.assertEquals(len(remote_logs.nodes), 0, "Remote connection was not closed.")
+		self.assertEquals(len(remote_logs.jobs), 0, "Remote subscription was not removed.")
+
 	def test_remote_instance_log(self):
 		instance_type = self.create_sample_application(
 			self.configuration,
@@ -1134,6 +1797,215 @@ class StreamConnectionTest(BaseControllerTest):
 
 		self.assertEquals(2, len(lines), "Didn't download the expected number of lines.")
 
+	def test_get_large_log(self):
+		# Log more than MAX_LOG_SIZE, so only the end is sent.
+		job_id = str(uuid.uuid4())
+		log = self.configuration.get_job_logger(job_id)
+		for i in range(3000):
+			log.info("Log message number %d, which pads the line out a little further.", i)
+		pub.sendMessage('job.flush', job_id=job_id)
+
+		log_size = os.path.getsize(self.configuration.get_job_log_path(job_id))
+		self.assertTrue(log_size > MAX_LOG_SIZE, "Test log is too small.")
+
+		received = []
+		def got_lines(job_id, lines, position):
+			received.extend(lines)
+			if position == log_size:
+				self.stop(position)
+
+		remote_request = paasmaker.common.api.log.LogStreamAPIRequest(self.configuration)
+		remote_request.set_superkey_auth()
+		remote_request.set_lines_callback(got_lines)
+		remote_request.subscribe(job_id, compress=True)
+		remote_request.connect()
+
+		self.wait()
+
+		# Every line came through whole, ending with the last line.
+		self.assertTrue(len("".join(received)) <= MAX_LOG_SIZE, "Sent more than MAX_LOG_SIZE.")
+		self.assertIn("number 2999,", received[-1], "Didn't end with the last line.")
+		for line in received:
+			self.assertTrue(line.endswith("\n"), "Line was not complete.")
+			self.assertIn(" INFO Log message number ", line, "Line was not complete.")
+
+		remote_request.close()
+
+	def test_get_compressed_log(self):
+		# Streaming a compressed log reads it without decompressing it.
+		job_id = str(uuid.uuid4())
+		log = self.configuration.get_job_logger(job_id)
+		for i in range(10):
+			log.info("Log message %d", i)
+		log.finished()
+		log_file = self.configuration.get_job_log_path(job_id, create_if_missing=False)
+		paasmaker.util.compressedlog.compress_log(log_file)
+		log_size = paasmaker.util.compressedlog.log_size(log_file)
+
+		received = []
+		def got_lines(job_id, lines, position):
+			received.extend(lines)
+			if position == log_size:
+				self.stop(position)
+
+		remote_request = paasmaker.common.api.log.LogStreamAPIRequest(self.configuration)
+		remote_request.set_superkey_auth()
+		remote_request.set_lines_callback(got_lines)
+		remote_request.subscribe(job_id)
+		remote_request.connect()
+
+		self.wait()
+
+		self.assertEquals(len(received), 10, "Didn't download the expected number of lines.")
+		self.assertTrue(os.path.exists(paasmaker.util.compressedlog.compressed_path(log_file)), "Compressed log was removed.")
+		self.assertFalse(os.path.exists(log_file), "Log was decompressed.")
+
+		remote_request.close()
+
+	def test_get_log_from_line(self):
+		job_id = str(uuid.uuid4())
+		log = self.configuration.get_job_logger(job_id)
+		for i in range(20):
+			log.info("Log message %d", i)
+
+		def got_lines(job_id, lines, position):
+			self.stop(lines)
+
+		remote_request = paasmaker.common.api.log.LogStreamAPIRequest(self.configuration)
+		remote_request.set_superkey_auth()
+		remote_request.set_lines_callback(got_lines)
+		# The last five lines.
+		remote_request.subscribe(job_id, line=-5)
+		remote_request.connect()
+
+		lines = self.wait()
+		self.assertEquals(len(lines), 5, "Didn't download the expected number of lines.")
+		self.assertIn("Log message 15", lines[0], "Didn't start at the right line.")
+
+		# And from a time, which is all of them.
+		remote_request.unsubscribe(job_id)
+		remote_request.subscribe(job_id, timestamp=time.time() - 60)
+
+		lines = self.wait()
+		self.assertEquals(len(lines), 20, "Didn't download the expected number of lines.")
+
+		remote_request.close()
+
+	def test_read_log_frame(self):
+		fp = tempfile.TemporaryFile()
+		fp.write("one\ntwo\nthree\nfour")
+		fp.seek(0)
+
+		# Frames are cut back to the end of a line.
+		self.assertEquals(read_log_frame(fp, 10), "one\ntwo\n")
+		self.assertEquals(read_log_frame(fp, 10), "three\n")
+		# Except at the end of the file.
+		self.assertEquals(read_log_frame(fp, 10), "four")
+		self.assertEquals(read_log_frame(fp, 10), "")
+
+		# Lines longer than a frame are split.
+		fp.seek(0)
+		self.assertEquals(read_log_frame(fp, 2), "on")
+
+		self.assertEquals(find_line_start(fp, 0), 0)
+		self.assertEquals(find_line_start(fp, 2), 4)
+		self.assertEquals(find_line_start(fp, 4), 4)
+		self.assertEquals(find_line_start(fp, 15), 18)
+		fp.close()
+
+	def test_remote_log_backpressure(self):
+		# Remote lines wait for the client to catch up, like local ones.
+		class FakeSession(object):
+			send_queue = []
+
+		connection = StreamConnection.__new__(StreamConnection)
+		connection.configuration = self.configuration
+		connection.session = FakeSession()
+		emitted = []
+		def emit(job_id, frame, position, compress):
+			# Like the real transports, what's sent waits on the
+			# session until the client takes it.
+			emitted.append((frame, position))
+			connection.session.send_queue.append(frame)
+		connection._emit_log_frame = emit
+
+		cursor = {'position': 0, 'compress': False, 'retry': None, 'pending': collections.deque(), 'pending_size': 0}
+		connection.session.send_queue = ['busy']
+		cursor['position'] = 4
+		connection.handle_remote_lines('job', "one\n", cursor)
+		self.assertEquals(emitted, [], "Sent lines to a busy client.")
+		self.assertTrue(cursor['retry'], "Did not retry later.")
+
+		# Once it's caught up, the queued lines are sent in order.
+		connection.session.send_queue = []
+		self.short_wait_hack(length=LOG_BACKOFF * 2)
+		self.assertEquals(emitted, [("one\n", 4)], "Did not send the queued lines.")
+
+		# More than a window is sent over several goes, each
+		# once the client has taken the last one.
+		connection.session.send_queue = []
+		del emitted[:]
+		frame = "x" * (LOG_FRAME_SIZE - 1) + "\n"
+		count = (LOG_WINDOW_SIZE / LOG_FRAME_SIZE) * 2
+		for i in range(count):
+			cursor['position'] += len(frame)
+			connection.handle_remote_lines('job', frame, cursor)
+		self.assertEquals(len(emitted), 1, "Sent lines to a busy client.")
+
+		goes = 0
+		while len(emitted) < count and goes < count:
+			before = len(emitted)
+			connection.session.send_queue = []
+			self.short_wait_hack(length=LOG_BACKOFF * 2)
+			sent = sum([len(sent_frame) for sent_frame, position in emitted[before:]])
+			self.assertTrue(sent <= LOG_WINDOW_SIZE, "Sent more than a window at once.")
+			goes += 1
+		self.assertTrue(goes > 1, "Did not send over several goes.")
+		self.assertEquals(len(emitted), count, "Did not send all the lines.")
+		self.assertEquals(emitted[-1][1], cursor['position'], "Wrong final position.")
+		self.assertEquals(cursor['pending_size'], 0, "Lines were left queued.")
+
+	def test_rotated_log(self):
+		# The rest of a rotated log is paged out before the new log.
+		job_id = str(uuid.uuid4())
+		log_file = self.configuration.get_job_log_path(job_id)
+		new = "After rotation.\n"
+
+		connection = StreamConnection.__new__(StreamConnection)
+		connection.configuration = self.configuration
+		connection.session = object()
+		connection.log_cursors = {}
+		emitted = []
+		def emit(job_id, frame, position, compress):
+			emitted.append(frame)
+			if position == len(new):
+				self.stop()
+		connection._emit_log_frame = emit
+
+		start = "Before rotation.\n"
+		fp = open(log_file, 'wb')
+		fp.write(start)
+		fp.close()
+		connection.send_job_log(job_id, 0)
+		self.assertEquals("".join(emitted), start, "Did not send the log.")
+
+		line = "x" * 99 + "\n"
+		rest = line * ((LOG_WINDOW_SIZE * 3) / len(line))
+		fp = open(log_file, 'ab')
+		fp.write(rest)
+		fp.close()
+		os.rename(log_file, log_file + ROTATED_SUFFIX)
+		fp = open(log_file, 'wb')
+		fp.write(new)
+		fp.close()
+
+		del emitted[:]
+		connection.send_job_log(job_id)
+		self.assertTrue(len("".join(emitted)) <= LOG_WINDOW_SIZE, "Sent more than a window at once.")
+		self.wait()
+		self.assertEquals("".join(emitted), rest + new, "Did not send all of both logs in order.")
+		self.assertFalse(connection.log_cursors[job_id]['rotated'], "Still sending the rotated log.")
+
 	def test_job_stream(self):
 		# Test the websocket version.
 		self._test_job_stream(False)
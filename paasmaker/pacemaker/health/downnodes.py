@@ -115,6 +115,10 @@ class DownNodesHealthCheck(BaseHealthCheck):
 			if bad_nodes_count > 0 or altered_instance_count > 0:
 				session.commit()
 
+			if bad_nodes_count > 0:
+				# Don't hand out these nodes for logs any more.
+				self.configuration.forget_log_nodes()
+
 			self.return_context = {
 				'bad_nodes': bad_nodes_count,
 				'down_instances': altered_instance_count
@@ -7,6 +7,7 @@
 #
 
 import uuid
+import time
 import datetime
 
 import paasmaker
@@ -17,7 +18,21 @@ from base import BaseHealthCheck, BaseHealthCheckTest
 import colander
 
 class StuckJobsHealthCheckParametersSchema(colander.MappingSchema):
-	pass
+	default_timeout = colander.SchemaNode(colander.Integer(),
+		title="Default job timeout",
+		description="The number of seconds that a job can be running for before it's considered stuck and marked as failed. Some jobs legitimately run for a long time, so by default only plugins listed in timeouts can time out. 0 means jobs never time out.",
+		default=0,
+		missing=0)
+	timeouts = colander.SchemaNode(colander.Mapping(unknown='preserve'),
+		title="Per plugin job timeouts",
+		description="A map of job plugin names to timeouts in seconds, for plugins that need a timeout other than the default. 0 means jobs using that plugin never time out.",
+		default={},
+		missing={})
+	limit = colander.SchemaNode(colander.Integer(),
+		title="Maximum jobs per check",
+		description="The maximum number of stuck jobs to mark as failed in each check. Any more are handled by the next check.",
+		default=500,
+		missing=500)
 
 class StuckJobsHealthCheck(BaseHealthCheck):
 	MODES = {
@@ -26,8 +41,9 @@ class StuckJobsHealthCheck(BaseHealthCheck):
 	API_VERSION = "0.9.0"
 
 	def check(self, parent_job_id, callback, error_callback):
-		# Find jobs that are on nodes that are down.
-		# Abort the trees to allow other jobs or systems to kick in.
+		# Find jobs that are on nodes that are down, and jobs
+		# on any node that have been running for too long.
+		# Abort or fail the trees to allow other jobs or systems to kick in.
 		def got_session(session):
 			self.session = session
 
@@ -41,7 +57,9 @@ class StuckJobsHealthCheck(BaseHealthCheck):
 			self.error_callback = error_callback
 
 			self.down_nodes_count = len(self.down_nodes)
+			self.down_node_jobs = set()
 			self.cancelled_jobs = 0
+			self.timed_out_jobs = 0
 
 			self.logger.info("Checking %d down nodes.", self.down_nodes_count)
 
@@ -56,13 +74,11 @@ class StuckJobsHealthCheck(BaseHealthCheck):
 			self._process_down_node(node)
 
 		except IndexError, ex:
-			# No more to work on.
+			# No more to work on. Abort all the jobs found in one go.
 			self.session.close()
-			self.callback(
-				{
-					'cancelled_jobs': self.cancelled_jobs
-				},
-				"Checked %d down nodes, cancelled %d jobs." % (self.down_nodes_count, self.cancelled_jobs)
+			self.configuration.job_manager.force_abort_jobs(
+				list(self.down_node_jobs),
+				self._aborted_down_node_jobs
 			)
 
 	def _process_down_node(self, node):
@@ -70,30 +86,9 @@ class StuckJobsHealthCheck(BaseHealthCheck):
 		def got_stuck_jobs(jobs):
 			if len(jobs) > 0:
 				self.logger.warning("Found %d stuck jobs on node %s. Aborting those jobs.", len(jobs), node.name)
+				self.down_node_jobs.update(jobs)
 
-				def fetch_job():
-					try:
-						def force_abort_complete(result):
-							# Next job.
-							self.configuration.io_loop.add_callback(fetch_job)
-							# end of force_abort_complete()
-
-						job = jobs.pop()
-
-						self.cancelled_jobs += 1
-
-						self.configuration.job_manager.force_abort(job, node.uuid, force_abort_complete)
-
-					except KeyError, ex:
-						# No more jobs.
-						self.configuration.io_loop.add_callback(self._fetch_down_node)
-
-					# end of fetch_job()
-
-				fetch_job()
-			else:
-				# No stuck jobs. Excellent!
-				self.configuration.io_loop.add_callback(self._fetch_down_node)
+			self.configuration.io_loop.add_callback(self._fetch_down_node)
 
 			# end of got_stuck_jobs()
 
@@ -103,6 +98,48 @@ class StuckJobsHealthCheck(BaseHealthCheck):
 			state=[constants.JOB.WAITING, constants.JOB.RUNNING]
 		)
 
+	def _aborted_down_node_jobs(self, jobs):
+		self.cancelled_jobs = len(jobs)
+
+		# Now look for jobs that have been running too long.
+		self.configuration.job_manager.find_stuck_jobs(
+			self.parameters['default_timeout'],
+			self.parameters['timeouts'],
+			self._found_timed_out_jobs,
+			limit=self.parameters['limit']
+		)
+
+	def _found_timed_out_jobs(self, stuck):
+		def failed_jobs(jobs):
+			self.timed_out_jobs = len(jobs)
+			self.callback(
+				{
+					'cancelled_jobs': self.cancelled_jobs,
+					'timed_out_jobs': self.timed_out_jobs
+				},
+				"Checked %d down nodes, cancelled %d jobs, and failed %d jobs that timed out." % (
+					self.down_nodes_count,
+					self.cancelled_jobs,
+					self.timed_out_jobs
+				)
+			)
+
+		now = time.time()
+		for job in stuck:
+			self.logger.warning(
+				"Job %s (%s) on node %s has been running for %d seconds. Marking it as failed.",
+				job['job_id'],
+				job['plugin'],
+				job['node'],
+				now - job['started']
+			)
+
+		self.configuration.job_manager.force_fail_jobs(
+			[job['job_id'] for job in stuck],
+			"Timed out.",
+			failed_jobs
+		)
+
 class StuckJobsHealthCheckTest(BaseHealthCheckTest):
 
 	def setUp(self):
@@ -155,7 +192,7 @@ class StuckJobsHealthCheckTest(BaseHealthCheckTest):
 		self.wait()
 
 		self.assertTrue(self.success, "Should have succeeded.")
-		self.assertEquals(len(self.context), 1, "Should not have emitted context.")
+		self.assertEquals(len(self.context), 2, "Should have emitted the cancelled and timed out counts.")
 		self.assertIn(" 1 down", self.message, "Message should have mentioned nodes.")
 		self.assertEquals(self.context['cancelled_jobs'], 0, "Should not have cancelled any jobs.")
 
@@ -193,3 +230,65 @@ class StuckJobsHealthCheckTest(BaseHealthCheckTest):
 		state = self.wait()
 
 		self.assertEquals(state, constants.JOB.ABORTED, "State was not aborted.")
+
+		# Now a job on a node that is up, that has been running for too long.
+		self.configuration.job_manager.add_job(
+			'paasmaker.job.container',
+			{},
+			"Example job.",
+			self.stop,
+			node=up_node.uuid
+		)
+		job_id = self.wait()
+		self.configuration.job_manager.backend.set_attrs(job_id, {'state': constants.JOB.RUNNING}, self.stop)
+		self.wait()
+
+		health = self.registry.instantiate(
+			'paasmaker.health.stuckjobs',
+			paasmaker.util.plugin.MODE.HEALTH_CHECK,
+			{'default_timeout': 60}
+		)
+
+		# It's not stuck yet.
+		health.check(
+			None,
+			self.success_callback,
+			self.failure_callback
+		)
+		self.wait()
+		self.assertEquals(self.context['timed_out_jobs'], 0, "Should not have failed any jobs.")
+
+		# Pretend that it started a while ago.
+		self.configuration.job_manager.backend.redis.zadd('running', time.time() - 120, job_id, callback=self.stop)
+		self.wait()
+
+		# Without a timeout, jobs never time out.
+		untimed = self.registry.instantiate(
+			'paasmaker.health.stuckjobs',
+			paasmaker.util.plugin.MODE.HEALTH_CHECK,
+			{}
+		)
+		untimed.check(
+			None,
+			self.success_callback,
+			self.failure_callback
+		)
+		self.wait()
+		self.assertEquals(self.context['timed_out_jobs'], 0, "Should not have failed any jobs.")
+
+		health.check(
+			None,
+			self.success_callback,
+			self.failure_callback
+		)
+		self.wait()
+		self.assertTrue(self.success, "Should have succeeded.")
+		self.assertEquals(self.context['timed_out_jobs'], 1, "Should have failed one job.")
+
+		self.configuration.job_manager.get_job_state(job_id, self.stop)
+		state = self.wait()
+		self.assertEquals(state, constants.JOB.FAILED, "State was not failed.")
+
+		# The FAILED status sets off the failure handling, which aborts
+		# the rest of the tree. Let that finish before the Redis goes away.
+		self.short_wait_hack()
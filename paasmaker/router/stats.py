@@ -283,7 +283,7 @@ class StatsLogReader(object):
 		logger.info("Completed writing stats to redis.")
 		self.fp.close()
 		self.reading = False
-		self.redis.disconnect()
+		self.redis = None
 		self.callback("Completed reading file.")
 
 class StatsLogPeriodicManager(object):
@@ -431,9 +431,10 @@ class ApplicationStats(object):
 
 	def close(self):
 		"""
-		Close the attached Redis connection and any other resources.
+		Release the attached Redis connection and any other resources.
+		The connection is shared, so it stays open for other users.
 		"""
-		self.redis.disconnect()
+		self.redis = None
 
 	def permission_required_for(self, name, input_id, session):
 		"""
@@ -337,4 +337,4 @@
  * see: http://github.com/jrburke/requirejs for details
  */
 
-(function(e,t){function P(e){var t=e.length,n=b.type(e);return b.isWindow(e)?!1:1===e.nodeType&&t?!0:"array"===n||"function"!==n&&(0===t||"number"==typeof t&&t>0&&t-1 in e)}function B(e){var t=H[e]={};return b.each(e.match(E)||[],function(e,n){t[n]=!0}),t}function I(e,n,r,i){if(b.acceptData(e)){var s,o,u=b.expando,a="string"==typeof n,f=e.nodeType,c=f?b.cache:e,h=f?e[u]:e[u]&&u;if(h&&c[h]&&(i||c[h].data)||!a||r!==t)return h||(f?e[u]=h=l.pop()||b.guid++:h=u),c[h]||(c[h]={},f||(c[h].toJSON=b.noop)),("object"==typeof n||"function"==typeof n)&&(i?c[h]=b.extend(c[h],n):c[h].data=b.extend(c[h].data,n)),s=c[h],i||(s.data||(s.data={}),s=s.data),r!==t&&(s[b.camelCase(n)]=r),a?(o=s[n],null==o&&(o=s[b.camelCase(n)])):o=s,o}}function q(e,t,n){if(b.acceptData(e)){var r,i,s,o=e.nodeType,u=o?b.cache:e,a=o?e[b.expando]:b.expando;if(u[a]){if(t&&(s=n?u[a]:u[a].data)){b.isArray(t)?t=t.concat(b.map(t,b.camelCase)):t in s?t=[t]:(t=b.camelCase(t),t=t in s?[t]:t.split(" "));for(r=0,i=t.length;i>r;r++)delete s[t[r]];if(!(n?U:b.isEmptyObject)(s))return}(n||(delete u[a].data,U(u[a])))&&(o?b.cleanData([e],!0):b.support.deleteExpando||u!=u.window?delete u[a]:u[a]=null)}}}function R(e,n,r){if(r===t&&1===e.nodeType){var i="data-"+n.replace(F,"-$1").toLowerCase();if(r=e.getAttribute(i),"string"==typeof r){try{r="true"===r?!0:"false"===r?!1:"null"===r?null:+r+""===r?+r:j.test(r)?b.parseJSON(r):r}catch(s){}b.data(e,n,r)}else r=t}return r}function U(e){var t;for(t in e)if(("data"!==t||!b.isEmptyObject(e[t]))&&"toJSON"!==t)return!1;return!0}function it(){return!0}function st(){return!1}function ct(e,t){do e=e[t];while(e&&1!==e.nodeType);return e}function ht(e,t,n){if(t=t||0,b.isFunction(t))return b.grep(e,function(e,r){var i=!!t.call(e,r,e);return i===n});if(t.nodeType)return b.grep(e,function(e){return e===t===n});if("string"==typeof t){var r=b.grep(e,function(e){return 1===e.nodeType});if(at.test(t))return b.filter(t,r,!n);t=b.filter(t,r)}return b.grep(e,function(e){return b.inArray(e,t)>=0===n})}function pt(e){var t=dt.split("|"),n=e.createDocumentFragment();if(n.createElement)while(t.length)n.createElement(t.pop());return n}function Mt(e,t){return e.getElementsByTagName(t)[0]||e.appendChild(e.ownerDocument.createElement(t))}function _t(e){var t=e.getAttributeNode("type");return e.type=(t&&t.specified)+"/"+e.type,e}function Dt(e){var t=Ct.exec(e.type);return t?e.type=t[1]:e.removeAttribute("type"),e}function Pt(e,t){var n,r=0;for(;null!=(n=e[r]);r++)b._data(n,"globalEval",!t||b._data(t[r],"globalEval"))}function Ht(e,t){if(1===t.nodeType&&b.hasData(e)){var n,r,i,s=b._data(e),o=b._data(t,s),u=s.events;if(u){delete o.handle,o.events={};for(n in u)for(r=0,i=u[n].length;i>r;r++)b.event.add(t,n,u[n][r])}o.data&&(o.data=b.extend({},o.data))}}function Bt(e,t){var n,r,i;if(1===t.nodeType){if(n=t.nodeName.toLowerCase(),!b.support.noCloneEvent&&t[b.expando]){i=b._data(t);for(r in i.events)b.removeEvent(t,r,i.handle);t.removeAttribute(b.expando)}"script"===n&&t.text!==e.text?(_t(t).text=e.text,Dt(t)):"object"===n?(t.parentNode&&(t.outerHTML=e.outerHTML),b.support.html5Clone&&e.innerHTML&&!b.trim(t.innerHTML)&&(t.innerHTML=e.innerHTML)):"input"===n&&xt.test(e.type)?(t.defaultChecked=t.checked=e.checked,t.value!==e.value&&(t.value=e.value)):"option"===n?t.defaultSelected=t.selected=e.defaultSelected:("input"===n||"textarea"===n)&&(t.defaultValue=e.defaultValue)}}function jt(e,n){var r,s,o=0,u=typeof e.getElementsByTagName!==i?e.getElementsByTagName(n||"*"):typeof e.querySelectorAll!==i?e.querySelectorAll(n||"*"):t;if(!u)for(u=[],r=e.childNodes||e;null!=(s=r[o]);o++)!n||b.nodeName(s,n)?u.push(s):b.merge(u,jt(s,n));return n===t||n&&b.nodeName(e,n)?b.merge([e],u):u}function Ft(e){xt.test(e.type)&&(e.defaultChecked=e.checked)}function tn(e,t){if(t in e)return t;var n=t.charAt(0).toUpperCase()+t.slice(1),r=t,i=en.length;while(i--)if(t=en[i]+n,t in e)return t;return r}function nn(e,t){return e=t||e,"none"===b.css(e,"display")||!b.contains(e.ownerDocument,e)}function rn(e,t){var n,r,i,s=[],o=0,u=e.length;for(;u>o;o++)r=e[o],r.style&&(s[o]=b._data(r,"olddisplay"),n=r.style.display,t?(s[o]||"none"!==n||(r.style.display=""),""===r.style.display&&nn(r)&&(s[o]=b._data(r,"olddisplay",an(r.nodeName)))):s[o]||(i=nn(r),(n&&"none"!==n||!i)&&b._data(r,"olddisplay",i?n:b.css(r,"display"))));for(o=0;u>o;o++)r=e[o],r.style&&(t&&"none"!==r.style.display&&""!==r.style.display||(r.style.display=t?s[o]||"":"none"));return e}function sn(e,t,n){var r=$t.exec(t);return r?Math.max(0,r[1]-(n||0))+(r[2]||"px"):t}function on(e,t,n,r,i){var s=n===(r?"border":"content")?4:"width"===t?1:0,o=0;for(;4>s;s+=2)"margin"===n&&(o+=b.css(e,n+Zt[s],!0,i)),r?("content"===n&&(o-=b.css(e,"padding"+Zt[s],!0,i)),"margin"!==n&&(o-=b.css(e,"border"+Zt[s]+"Width",!0,i))):(o+=b.css(e,"padding"+Zt[s],!0,i),"padding"!==n&&(o+=b.css(e,"border"+Zt[s]+"Width",!0,i)));return o}function un(e,t,n){var r=!0,i="width"===t?e.offsetWidth:e.offsetHeight,s=qt(e),o=b.support.boxSizing&&"border-box"===b.css(e,"boxSizing",!1,s);if(0>=i||null==i){if(i=Rt(e,t,s),(0>i||null==i)&&(i=e.style[t]),Jt.test(i))return i;r=o&&(b.support.boxSizingReliable||i===e.style[t]),i=parseFloat(i)||0}return i+on(e,t,n||(o?"border":"content"),r,s)+"px"}function an(e){var t=s,n=Qt[e];return n||(n=fn(e,t),"none"!==n&&n||(It=(It||b("<iframe frameborder='0' width='0' height='0'/>").css("cssText","display:block !important")).appendTo(t.documentElement),t=(It[0].contentWindow||It[0].contentDocument).document,t.write("<!doctype html><html><body>"),t.close(),n=fn(e,t),It.detach()),Qt[e]=n),n}function fn(e,t){var n=b(t.createElement(e)).appendTo(t.body),r=b.css(n[0],"display");return n.remove(),r}function vn(e,t,n,r){var i;if(b.isArray(t))b.each(t,function(t,i){n||cn.test(e)?r(e,i):vn(e+"["+("object"==typeof i?t:"")+"]",i,n,r)});else if(n||"object"!==b.type(t))r(e,t);else for(i in t)vn(e+"["+i+"]",t[i],n,r)}function _n(e){return function(t,n){"string"!=typeof t&&(n=t,t="*");var r,i=0,s=t.toLowerCase().match(E)||[];if(b.isFunction(n))while(r=s[i++])"+"===r[0]?(r=r.slice(1)||"*",(e[r]=e[r]||[]).unshift(n)):(e[r]=e[r]||[]).push(n)}}function Dn(e,n,r,i){function u(a){var f;return s[a]=!0,b.each(e[a]||[],function(e,a){var l=a(n,r,i);return"string"!=typeof l||o||s[l]?o?!(f=l):t:(n.dataTypes.unshift(l),u(l),!1)}),f}var s={},o=e===An;return u(n.dataTypes[0])||!s["*"]&&u("*")}function Pn(e,n){var r,i,s=b.ajaxSettings.flatOptions||{};for(i in n)n[i]!==t&&((s[i]?e:r||(r={}))[i]=n[i]);return r&&b.extend(!0,e,r),e}function Hn(e,n,r){var i,s,o,u,a=e.contents,f=e.dataTypes,l=e.responseFields;for(u in l)u in r&&(n[l[u]]=r[u]);while("*"===f[0])f.shift(),s===t&&(s=e.mimeType||n.getResponseHeader("Content-Type"));if(s)for(u in a)if(a[u]&&a[u].test(s)){f.unshift(u);break}if(f[0]in r)o=f[0];else{for(u in r){if(!f[0]||e.converters[u+" "+f[0]]){o=u;break}i||(i=u)}o=o||i}return o?(o!==f[0]&&f.unshift(o),r[o]):t}function Bn(e,t){var n,r,i,s,o={},u=0,a=e.dataTypes.slice(),f=a[0];if(e.dataFilter&&(t=e.dataFilter(t,e.dataType)),a[1])for(i in e.converters)o[i.toLowerCase()]=e.converters[i];for(;r=a[++u];)if("*"!==r){if("*"!==f&&f!==r){if(i=o[f+" "+r]||o["* "+r],!i)for(n in o)if(s=n.split(" "),s[1]===r&&(i=o[f+" "+s[0]]||o["* "+s[0]])){i===!0?i=o[n]:o[n]!==!0&&(r=s[0],a.splice(u--,0,r));break}if(i!==!0)if(i&&e["throws"])t=i(t);else try{t=i(t)}catch(l){return{state:"parsererror",error:i?l:"No conversion from "+f+" to "+r}}}f=r}return{state:"success",data:t}}function zn(){try{return new e.XMLHttpRequest}catch(t){}}function Wn(){try{return new e.ActiveXObject("Microsoft.XMLHTTP")}catch(t){}}function Yn(){return setTimeout(function(){Xn=t}),Xn=b.now()}function Zn(e,t){b.each(t,function(t,n){var r=(Gn[t]||[]).concat(Gn["*"]),i=0,s=r.length;for(;s>i;i++)if(r[i].call(e,t,n))return})}function er(e,t,n){var r,i,s=0,o=Qn.length,u=b.Deferred().always(function(){delete a.elem}),a=function(){if(i)return!1;var t=Xn||Yn(),n=Math.max(0,f.startTime+f.duration-t),r=n/f.duration||0,s=1-r,o=0,a=f.tweens.length;for(;a>o;o++)f.tweens[o].run(s);return u.notifyWith(e,[f,s,n]),1>s&&a?n:(u.resolveWith(e,[f]),!1)},f=u.promise({elem:e,props:b.extend({},t),opts:b.extend(!0,{specialEasing:{}},n),originalProperties:t,originalOptions:n,startTime:Xn||Yn(),duration:n.duration,tweens:[],createTween:function(t,n){var r=b.Tween(e,f.opts,t,n,f.opts.specialEasing[t]||f.opts.easing);return f.tweens.push(r),r},stop:function(t){var n=0,r=t?f.tweens.length:0;if(i)return this;for(i=!0;r>n;n++)f.tweens[n].run(1);return t?u.resolveWith(e,[f,t]):u.rejectWith(e,[f,t]),this}}),l=f.props;for(tr(l,f.opts.specialEasing);o>s;s++)if(r=Qn[s].call(f,e,l,f.opts))return r;return Zn(f,l),b.isFunction(f.opts.start)&&f.opts.start.call(e,f),b.fx.timer(b.extend(a,{elem:e,anim:f,queue:f.opts.queue})),f.progress(f.opts.progress).done(f.opts.done,f.opts.complete).fail(f.opts.fail).always(f.opts.always)}function tr(e,t){var n,r,i,s,o;for(i in e)if(r=b.camelCase(i),s=t[r],n=e[i],b.isArray(n)&&(s=n[1],n=e[i]=n[0]),i!==r&&(e[r]=n,delete e[i]),o=b.cssHooks[r],o&&"expand"in o){n=o.expand(n),delete e[r];for(i in n)i in e||(e[i]=n[i],t[i]=s)}else t[r]=s}function nr(e,t,n){var r,i,s,o,u,a,f,l,c,h=this,p=e.style,d={},v=[],m=e.nodeType&&nn(e);n.queue||(l=b._queueHooks(e,"fx"),null==l.unqueued&&(l.unqueued=0,c=l.empty.fire,l.empty.fire=function(){l.unqueued||c()}),l.unqueued++,h.always(function(){h.always(function(){l.unqueued--,b.queue(e,"fx").length||l.empty.fire()})})),1===e.nodeType&&("height"in t||"width"in t)&&(n.overflow=[p.overflow,p.overflowX,p.overflowY],"inline"===b.css(e,"display")&&"none"===b.css(e,"float")&&(b.support.inlineBlockNeedsLayout&&"inline"!==an(e.nodeName)?p.zoom=1:p.display="inline-block")),n.overflow&&(p.overflow="hidden",b.support.shrinkWrapBlocks||h.always(function(){p.overflow=n.overflow[0],p.overflowX=n.overflow[1],p.overflowY=n.overflow[2]}));for(i in t)if(o=t[i],$n.exec(o)){if(delete t[i],a=a||"toggle"===o,o===(m?"hide":"show"))continue;v.push(i)}if(s=v.length){u=b._data(e,"fxshow")||b._data(e,"fxshow",{}),"hidden"in u&&(m=u.hidden),a&&(u.hidden=!m),m?b(e).show():h.done(function(){b(e).hide()}),h.done(function(){var t;b._removeData(e,"fxshow");for(t in d)b.style(e,t,d[t])});for(i=0;s>i;i++)r=v[i],f=h.createTween(r,m?u[r]:0),d[r]=u[r]||b.style(e,r),r in u||(u[r]=f.start,m&&(f.end=f.start,f.start="width"===r||"height"===r?1:0))}}function rr(e,t,n,r,i){return new rr.prototype.init(e,t,n,r,i)}function ir(e,t){var n,r={height:e},i=0;for(t=t?1:0;4>i;i+=2-t)n=Zt[i],r["margin"+n]=r["padding"+n]=e;return t&&(r.opacity=r.width=e),r}function sr(e){return b.isWindow(e)?e:9===e.nodeType?e.defaultView||e.parentWindow:!1}var n,r,i=typeof t,s=e.document,o=e.location,u=e.jQuery,a=e.$,f={},l=[],c="1.9.1",h=l.concat,p=l.push,d=l.slice,v=l.indexOf,m=f.toString,g=f.hasOwnProperty,y=c.trim,b=function(e,t){return new b.fn.init(e,t,r)},w=/[+-]?(?:\d*\.|)\d+(?:[eE][+-]?\d+|)/.source,E=/\S+/g,S=/^[\s\uFEFF\xA0]+|[\s\uFEFF\xA0]+$/g,x=/^(?:(<[\w\W]+>)[^>]*|#([\w-]*))$/,T=/^<(\w+)\s*\/?>(?:<\/\1>|)$/,N=/^[\],:{}\s]*$/,C=/(?:^|:|,)(?:\s*\[)+/g,k=/\\(?:["\\\/bfnrt]|u[\da-fA-F]{4})/g,L=/"[^"\\\r\n]*"|true|false|null|-?(?:\d+\.|)\d+(?:[eE][+-]?\d+|)/g,A=/^-ms-/,O=/-([\da-z])/gi,M=function(e,t){return t.toUpperCase()},_=function(e){(s.addEventListener||"load"===e.type||"complete"===s.readyState)&&(D(),b.ready())},D=function(){s.addEventListener?(s.removeEventListener("DOMContentLoaded",_,!1),e.removeEventListener("load",_,!1)):(s.detachEvent("onreadystatechange",_),e.detachEvent("onload",_))};b.fn=b.prototype={jquery:c,constructor:b,init:function(e,n,r){var i,o;if(!e)return this;if("string"==typeof e){if(i="<"===e.charAt(0)&&">"===e.charAt(e.length-1)&&e.length>=3?[null,e,null]:x.exec(e),!i||!i[1]&&n)return!n||n.jquery?(n||r).find(e):this.constructor(n).find(e);if(i[1]){if(n=n instanceof b?n[0]:n,b.merge(this,b.parseHTML(i[1],n&&n.nodeType?n.ownerDocument||n:s,!0)),T.test(i[1])&&b.isPlainObject(n))for(i in n)b.isFunction(this[i])?this[i](n[i]):this.attr(i,n[i]);return this}if(o=s.getElementById(i[2]),o&&o.parentNode){if(o.id!==i[2])return r.find(e);this.length=1,this[0]=o}return this.context=s,this.selector=e,this}return e.nodeType?(this.context=this[0]=e,this.length=1,this):b.isFunction(e)?r.ready(e):(e.selector!==t&&(this.selector=e.selector,this.context=e.context),b.makeArray(e,this))},selector:"",length:0,size:function(){return this.length},toArray:function(){return d.call(this)},get:function(e){return null==e?this.toArray():0>e?this[this.length+e]:this[e]},pushStack:function(e){var t=b.merge(this.constructor(),e);return t.prevObject=this,t.context=this.context,t},each:function(e,t){return b.each(this,e,t)},ready:function(e){return b.ready.promise().done(e),this},slice:function(){return this.pushStack(d.apply(this,arguments))},first:function(){return this.eq(0)},last:function(){return this.eq(-1)},eq:function(e){var t=this.length,n=+e+(0>e?t:0);return this.pushStack(n>=0&&t>n?[this[n]]:[])},map:function(e){return this.pushStack(b.map(this,function(t,n){return e.call(t,n,t)}))},end:function(){return this.prevObject||this.constructor(null)},push:p,sort:[].sort,splice:[].splice},b.fn.init.prototype=b.fn,b.extend=b.fn.extend=function(){var e,n,r,i,s,o,u=arguments[0]||{},a=1,f=arguments.length,l=!1;for("boolean"==typeof u&&(l=u,u=arguments[1]||{},a=2),"object"==typeof u||b.isFunction(u)||(u={}),f===a&&(u=this,--a);f>a;a++)if(null!=(s=arguments[a]))for(i in s)e=u[i],r=s[i],u!==r&&(l&&r&&(b.isPlainObject(r)||(n=b.isArray(r)))?(n?(n=!1,o=e&&b.isArray(e)?e:[]):o=e&&b.isPlainObject(e)?e:{},u[i]=b.extend(l,o,r)):r!==t&&(u[i]=r));return u},b.extend({noConflict:function(t){return e.$===b&&(e.$=a),t&&e.jQuery===b&&(e.jQuery=u),b},isReady:!1,readyWait:1,holdReady:function(e){e?b.readyWait++:b.ready(!0)},ready:function(e){if(e===!0?!--b.readyWait:!b.isReady){if(!s.body)return setTimeout(b.ready);b.isReady=!0,e!==!0&&--b.readyWait>0||(n.resolveWith(s,[b]),b.fn.trigger&&b(s).trigger("ready").off("ready"))}},isFunction:function(e){return"function"===b.type(e)},isArray:Array.isArray||function(e){return"array"===b.type(e)},isWindow:function(e){return null!=e&&e==e.window},isNumeric:function(e){return!isNaN(parseFloat(e))&&isFinite(e)},type:function(e){return null==e?e+"":"object"==typeof e||"function"==typeof e?f[m.call(e)]||"object":typeof e},isPlainObject:function(e){if(!e||"object"!==b.type(e)||e.nodeType||b.isWindow(e))return!1;try{if(e.constructor&&!g.call(e,"constructor")&&!g.call(e.constructor.prototype,"isPrototypeOf"))return!1}catch(n){return!1}var r;for(r in e);return r===t||g.call(e,r)},isEmptyObject:function(e){var t;for(t in e)return!1;return!0},error:function(e){throw Error(e)},parseHTML:function(e,t,n){if(!e||"string"!=typeof e)return null;"boolean"==typeof t&&(n=t,t=!1),t=t||s;var r=T.exec(e),i=!n&&[];return r?[t.createElement(r[1])]:(r=b.buildFragment([e],t,i),i&&b(i).remove(),b.merge([],r.childNodes))},parseJSON:function(n){return e.JSON&&e.JSON.parse?e.JSON.parse(n):null===n?n:"string"==typeof n&&(n=b.trim(n),n&&N.test(n.replace(k,"@").replace(L,"]").replace(C,"")))?Function("return "+n)():(b.error("Invalid JSON: "+n),t)},parseXML:function(n){var r,i;if(!n||"string"!=typeof n)return null;try{e.DOMParser?(i=new DOMParser,r=i.parseFromString(n,"text/xml")):(r=new ActiveXObject("Microsoft.XMLDOM"),r.async="false",r.loadXML(n))}catch(s){r=t}return r&&r.documentElement&&!r.getElementsByTagName("parsererror").length||b.error("Invalid XML: "+n),r},noop:function(){},globalEval:function(t){t&&b.trim(t)&&(e.execScript||function(t){e.eval.call(e,t)})(t)},camelCase:function(e){return e.replace(A,"ms-").replace(O,M)},nodeName:function(e,t){return e.nodeName&&e.nodeName.toLowerCase()===t.toLowerCase()},each:function(e,t,n){var r,i=0,s=e.length,o=P(e);if(n){if(o){for(;s>i;i++)if(r=t.apply(e[i],n),r===!1)break}else for(i in e)if(r=t.apply(e[i],n),r===!1)break}else if(o){for(;s>i;i++)if(r=t.call(e[i],i,e[i]),r===!1)break}else for(i in e)if(r=t.call(e[i],i,e[i]),r===!1)break;return e},trim:y&&!y.call("﻿ ")?function(e){return null==e?"":y.call(e)}:function(e){return null==e?"":(e+"").replace(S,"")},makeArray:function(e,t){var n=t||[];return null!=e&&(P(Object(e))?b.merge(n,"string"==typeof e?[e]:e):p.call(n,e)),n},inArray:function(e,t,n){var r;if(t){if(v)return v.call(t,e,n);for(r=t.length,n=n?0>n?Math.max(0,r+n):n:0;r>n;n++)if(n in t&&t[n]===e)return n}return-1},merge:function(e,n){var r=n.length,i=e.length,s=0;if("number"==typeof r)for(;r>s;s++)e[i++]=n[s];else while(n[s]!==t)e[i++]=n[s++];return e.length=i,e},grep:function(e,t,n){var r,i=[],s=0,o=e.length;for(n=!!n;o>s;s++)r=!!t(e[s],s),n!==r&&i.push(e[s]);return i},map:function(e,t,n){var r,i=0,s=e.length,o=P(e),u=[];if(o)for(;s>i;i++)r=t(e[i],i,n),null!=r&&(u[u.length]=r);else for(i in e)r=t(e[i],i,n),null!=r&&(u[u.length]=r);return h.apply([],u)},guid:1,proxy:function(e,n){var r,i,s;return"string"==typeof n&&(s=e[n],n=e,e=s),b.isFunction(e)?(r=d.call(arguments,2),i=function(){return e.apply(n||this,r.concat(d.call(arguments)))},i.guid=e.guid=e.guid||b.guid++,i):t},access:function(e,n,r,i,s,o,u){var a=0,f=e.length,l=null==r;if("object"===b.type(r)){s=!0;for(a in r)b.access(e,n,a,r[a],!0,o,u)}else if(i!==t&&(s=!0,b.isFunction(i)||(u=!0),l&&(u?(n.call(e,i),n=null):(l=n,n=function(e,t,n){return l.call(b(e),n)})),n))for(;f>a;a++)n(e[a],r,u?i:i.call(e[a],a,n(e[a],r)));return s?e:l?n.call(e):f?n(e[0],r):o},now:function(){return(new Date).getTime()}}),b.ready.promise=function(t){if(!n)if(n=b.Deferred(),"complete"===s.readyState)setTimeout(b.ready);else if(s.addEventListener)s.addEventListener("DOMContentLoaded",_,!1),e.addEventListener("load",_,!1);else{s.attachEvent("onreadystatechange",_),e.attachEvent("onload",_);var r=!1;try{r=null==e.frameElement&&s.documentElement}catch(i){}r&&r.doScroll&&function o(){if(!b.isReady){try{r.doScroll("left")}catch(e){return setTimeout(o,50)}D(),b.ready()}}()}return n.promise(t)},b.each("Boolean Number String Function Array Date RegExp Object Error".split(" "),function(e,t){f["[object "+t+"]"]=t.toLowerCase()}),r=b(s);var H={};b.Callbacks=function(e){e="string"==typeof e?H[e]||B(e):b.extend({},e);var n,r,i,s,o,u,a=[],f=!e.once&&[],l=function(t){for(r=e.memory&&t,i=!0,o=u||0,u=0,s=a.length,n=!0;a&&s>o;o++)if(a[o].apply(t[0],t[1])===!1&&e.stopOnFalse){r=!1;break}n=!1,a&&(f?f.length&&l(f.shift()):r?a=[]:c.disable())},c={add:function(){if(a){var t=a.length;(function i(t){b.each(t,function(t,n){var r=b.type(n);"function"===r?e.unique&&c.has(n)||a.push(n):n&&n.length&&"string"!==r&&i(n)})})(arguments),n?s=a.length:r&&(u=t,l(r))}return this},remove:function(){return a&&b.each(arguments,function(e,t){var r;while((r=b.inArray(t,a,r))>-1)a.splice(r,1),n&&(s>=r&&s--,o>=r&&o--)}),this},has:function(e){return e?b.inArray(e,a)>-1:!!a&&!!a.length},empty:function(){return a=[],this},disable:function(){return a=f=r=t,this},disabled:function(){return!a},lock:function(){return f=t,r||c.disable(),this},locked:function(){return!f},fireWith:function(e,t){return t=t||[],t=[e,t.slice?t.slice():t],!a||i&&!f||(n?f.push(t):l(t)),this},fire:function(){return c.fireWith(this,arguments),this},fired:function(){return!!i}};return c},b.extend({Deferred:function(e){var t=[["resolve","done",b.Callbacks("once memory"),"resolved"],["reject","fail",b.Callbacks("once memory"),"rejected"],["notify","progress",b.Callbacks("memory")]],n="pending",r={state:function(){return n},always:function(){return i.done(arguments).fail(arguments),this},then:function(){var e=arguments;return b.Deferred(function(n){b.each(t,function(t,s){var o=s[0],u=b.isFunction(e[t])&&e[t];i[s[1]](function(){var e=u&&u.apply(this,arguments);e&&b.isFunction(e.promise)?e.promise().done(n.resolve).fail(n.reject).progress(n.notify):n[o+"With"](this===r?n.promise():this,u?[e]:arguments)})}),e=null}).promise()},promise:function(e){return null!=e?b.extend(e,r):r}},i={};return r.pipe=r.then,b.each(t,function(e,s){var o=s[2],u=s[3];r[s[1]]=o.add,u&&o.add(function(){n=u},t[1^e][2].disable,t[2][2].lock),i[s[0]]=function(){return i[s[0]+"With"](this===i?r:this,arguments),this},i[s[0]+"With"]=o.fireWith}),r.promise(i),e&&e.call(i,i),i},when:function(e){var t=0,n=d.call(arguments),r=n.length,i=1!==r||e&&b.isFunction(e.promise)?r:0,s=1===i?e:b.Deferred(),o=function(e,t,n){return function(r){t[e]=this,n[e]=arguments.length>1?d.call(arguments):r,n===u?s.notifyWith(t,n):--i||s.resolveWith(t,n)}},u,a,f;if(r>1)for(u=Array(r),a=Array(r),f=Array(r);r>t;t++)n[t]&&b.isFunction(n[t].promise)?n[t].promise().done(o(t,f,n)).fail(s.reject).progress(o(t,a,u)):--i;return i||s.resolveWith(f,n),s.promise()}}),b.support=function(){var t,n,r,o,u,a,f,l,c,h,p=s.createElement("div");if(p.setAttribute("className","t"),p.innerHTML="  <link/><table></table><a href='/a'>a</a><input type='checkbox'/>",n=p.getElementsByTagName("*"),r=p.getElementsByTagName("a")[0],!n||!r||!n.length)return{};u=s.createElement("select"),f=u.appendChild(s.createElement("option")),o=p.getElementsByTagName("input")[0],r.style.cssText="top:1px;float:left;opacity:.5",t={getSetAttribute:"t"!==p.className,leadingWhitespace:3===p.firstChild.nodeType,tbody:!p.getElementsByTagName("tbody").length,htmlSerialize:!!p.getElementsByTagName("link").length,style:/top/.test(r.getAttribute("style")),hrefNormalized:"/a"===r.getAttribute("href"),opacity:/^0.5/.test(r.style.opacity),cssFloat:!!r.style.cssFloat,checkOn:!!o.value,optSelected:f.selected,enctype:!!s.createElement("form").enctype,html5Clone:"<:nav></:nav>"!==s.createElement("nav").cloneNode(!0).outerHTML,boxModel:"CSS1Compat"===s.compatMode,deleteExpando:!0,noCloneEvent:!0,inlineBlockNeedsLayout:!1,shrinkWrapBlocks:!1,reliableMarginRight:!0,boxSizingReliable:!0,pixelPosition:!1},o.checked=!0,t.noCloneChecked=o.cloneNode(!0).checked,u.disabled=!0,t.optDisabled=!f.disabled;try{delete p.test}catch(d){t.deleteExpando=!1}o=s.createElement("input"),o.setAttribute("value",""),t.input=""===o.getAttribute("value"),o.value="t",o.setAttribute("type","radio"),t.radioValue="t"===o.value,o.setAttribute("checked","t"),o.setAttribute("name","t"),a=s.createDocumentFragment(),a.appendChild(o),t.appendChecked=o.checked,t.checkClone=a.cloneNode(!0).cloneNode(!0).lastChild.checked,p.attachEvent&&(p.attachEvent("onclick",function(){t.noCloneEvent=!1}),p.cloneNode(!0).click());for(h in{submit:!0,change:!0,focusin:!0})p.setAttribute(l="on"+h,"t"),t[h+"Bubbles"]=l in e||p.attributes[l].expando===!1;return p.style.backgroundClip="content-box",p.cloneNode(!0).style.backgroundClip="",t.clearCloneStyle="content-box"===p.style.backgroundClip,b(function(){var n,r,o,u="padding:0;margin:0;border:0;display:block;box-sizing:content-box;-moz-box-sizing:content-box;-webkit-box-sizing:content-box;",a=s.getElementsByTagName("body")[0];a&&(n=s.createElement("div"),n.style.cssText="border:0;width:0;height:0;position:absolute;top:0;left:-9999px;margin-top:1px",a.appendChild(n).appendChild(p),p.innerHTML="<table><tr><td></td><td>t</td></tr></table>",o=p.getElementsByTagName("td"),o[0].style.cssText="padding:0;margin:0;border:0;display:none",c=0===o[0].offsetHeight,o[0].style.display="",o[1].style.display="none",t.reliableHiddenOffsets=c&&0===o[0].offsetHeight,p.innerHTML="",p.style.cssText="box-sizing:border-box;-moz-box-sizing:border-box;-webkit-box-sizing:border-box;padding:1px;border:1px;display:block;width:4px;margin-top:1%;position:absolute;top:1%;",t.boxSizing=4===p.offsetWidth,t.doesNotIncludeMarginInBodyOffset=1!==a.offsetTop,e.getComputedStyle&&(t.pixelPosition="1%"!==(e.getComputedStyle(p,null)||{}).top,t.boxSizingReliable="4px"===(e.getComputedStyle(p,null)||{width:"4px"}).width,r=p.appendChild(s.createElement("div")),r.style.cssText=p.style.cssText=u,r.style.marginRight=r.style.width="0",p.style.width="1px",t.reliableMarginRight=!parseFloat((e.getComputedStyle(r,null)||{}).marginRight)),typeof p.style.zoom!==i&&(p.innerHTML="",p.style.cssText=u+"width:1px;padding:1px;display:inline;zoom:1",t.inlineBlockNeedsLayout=3===p.offsetWidth,p.style.display="block",p.innerHTML="<div></div>",p.firstChild.style.width="5px",t.shrinkWrapBlocks=3!==p.offsetWidth,t.inlineBlockNeedsLayout&&(a.style.zoom=1)),a.removeChild(n),n=p=o=r=null)}),n=u=a=f=r=o=null,t}();var j=/(?:\{[\s\S]*\}|\[[\s\S]*\])$/,F=/([A-Z])/g;b.extend({cache:{},expando:"jQuery"+(c+Math.random()).replace(/\D/g,""),noData:{embed:!0,object:"clsid:D27CDB6E-AE6D-11cf-96B8-444553540000",applet:!0},hasData:function(e){return e=e.nodeType?b.cache[e[b.expando]]:e[b.expando],!!e&&!U(e)},data:function(e,t,n){return I(e,t,n)},removeData:function(e,t){return q(e,t)},_data:function(e,t,n){return I(e,t,n,!0)},_removeData:function(e,t){return q(e,t,!0)},acceptData:function(e){if(e.nodeType&&1!==e.nodeType&&9!==e.nodeType)return!1;var t=e.nodeName&&b.noData[e.nodeName.toLowerCase()];return!t||t!==!0&&e.getAttribute("classid")===t}}),b.fn.extend({data:function(e,n){var r,i,s=this[0],o=0,u=null;if(e===t){if(this.length&&(u=b.data(s),1===s.nodeType&&!b._data(s,"parsedAttrs"))){for(r=s.attributes;r.length>o;o++)i=r[o].name,i.indexOf("data-")||(i=b.camelCase(i.slice(5)),R(s,i,u[i]));b._data(s,"parsedAttrs",!0)}return u}return"object"==typeof e?this.each(function(){b.data(this,e)}):b.access(this,function(n){return n===t?s?R(s,e,b.data(s,e)):null:(this.each(function(){b.data(this,e,n)}),t)},null,n,arguments.length>1,null,!0)},removeData:function(e){return this.each(function(){b.removeData(this,e)})}}),b.extend({queue:function(e,n,r){var i;return e?(n=(n||"fx")+"queue",i=b._data(e,n),r&&(!i||b.isArray(r)?i=b._data(e,n,b.makeArray(r)):i.push(r)),i||[]):t},dequeue:function(e,t){t=t||"fx";var n=b.queue(e,t),r=n.length,i=n.shift(),s=b._queueHooks(e,t),o=function(){b.dequeue(e,t)};"inprogress"===i&&(i=n.shift(),r--),s.cur=i,i&&("fx"===t&&n.unshift("inprogress"),delete s.stop,i.call(e,o,s)),!r&&s&&s.empty.fire()},_queueHooks:function(e,t){var n=t+"queueHooks";return b._data(e,n)||b._data(e,n,{empty:b.Callbacks("once memory").add(function(){b._removeData(e,t+"queue"),b._removeData(e,n)})})}}),b.fn.extend({queue:function(e,n){var r=2;return"string"!=typeof e&&(n=e,e="fx",r--),r>arguments.length?b.queue(this[0],e):n===t?this:this.each(function(){var t=b.queue(this,e,n);b._queueHooks(this,e),"fx"===e&&"inprogress"!==t[0]&&b.dequeue(this,e)})},dequeue:function(e){return this.each(function(){b.dequeue(this,e)})},delay:function(e,t){return e=b.fx?b.fx.speeds[e]||e:e,t=t||"fx",this.queue(t,function(t,n){var r=setTimeout(t,e);n.stop=function(){clearTimeout(r)}})},clearQueue:function(e){return this.queue(e||"fx",[])},promise:function(e,n){var r,i=1,s=b.Deferred(),o=this,u=this.length,a=function(){--i||s.resolveWith(o,[o])};"string"!=typeof e&&(n=e,e=t),e=e||"fx";while(u--)r=b._data(o[u],e+"queueHooks"),r&&r.empty&&(i++,r.empty.add(a));return a(),s.promise(n)}});var z,W,X=/[\t\r\n]/g,V=/\r/g,$=/^(?:input|select|textarea|button|object)$/i,J=/^(?:a|area)$/i,K=/^(?:checked|selected|autofocus|autoplay|async|controls|defer|disabled|hidden|loop|multiple|open|readonly|required|scoped)$/i,Q=/^(?:checked|selected)$/i,G=b.support.getSetAttribute,Y=b.support.input;b.fn.extend({attr:function(e,t){return b.access(this,b.attr,e,t,arguments.length>1)},removeAttr:function(e){return this.each(function(){b.removeAttr(this,e)})},prop:function(e,t){return b.access(this,b.prop,e,t,arguments.length>1)},removeProp:function(e){return e=b.propFix[e]||e,this.each(function(){try{this[e]=t,delete this[e]}catch(n){}})},addClass:function(e){var t,n,r,i,s,o=0,u=this.length,a="string"==typeof e&&e;if(b.isFunction(e))return this.each(function(t){b(this).addClass(e.call(this,t,this.className))});if(a)for(t=(e||"").match(E)||[];u>o;o++)if(n=this[o],r=1===n.nodeType&&(n.className?(" "+n.className+" ").replace(X," "):" ")){s=0;while(i=t[s++])0>r.indexOf(" "+i+" ")&&(r+=i+" ");n.className=b.trim(r)}return this},removeClass:function(e){var t,n,r,i,s,o=0,u=this.length,a=0===arguments.length||"string"==typeof e&&e;if(b.isFunction(e))return this.each(function(t){b(this).removeClass(e.call(this,t,this.className))});if(a)for(t=(e||"").match(E)||[];u>o;o++)if(n=this[o],r=1===n.nodeType&&(n.className?(" "+n.className+" ").replace(X," "):"")){s=0;while(i=t[s++])while(r.indexOf(" "+i+" ")>=0)r=r.replace(" "+i+" "," ");n.className=e?b.trim(r):""}return this},toggleClass:function(e,t){var n=typeof e,r="boolean"==typeof t;return b.isFunction(e)?this.each(function(n){b(this).toggleClass(e.call(this,n,this.className,t),t)}):this.each(function(){if("string"===n){var s,o=0,u=b(this),a=t,f=e.match(E)||[];while(s=f[o++])a=r?a:!u.hasClass(s),u[a?"addClass":"removeClass"](s)}else(n===i||"boolean"===n)&&(this.className&&b._data(this,"__className__",this.className),this.className=this.className||e===!1?"":b._data(this,"__className__")||"")})},hasClass:function(e){var t=" "+e+" ",n=0,r=this.length;for(;r>n;n++)if(1===this[n].nodeType&&(" "+this[n].className+" ").replace(X," ").indexOf(t)>=0)return!0;return!1},val:function(e){var n,r,i,s=this[0];if(arguments.length)return i=b.isFunction(e),this.each(function(n){var s,o=b(this);1===this.nodeType&&(s=i?e.call(this,n,o.val()):e,null==s?s="":"number"==typeof s?s+="":b.isArray(s)&&(s=b.map(s,function(e){return null==e?"":e+""})),r=b.valHooks[this.type]||b.valHooks[this.nodeName.toLowerCase()],r&&"set"in r&&r.set(this,s,"value")!==t||(this.value=s))});if(s)return r=b.valHooks[s.type]||b.valHooks[s.nodeName.toLowerCase()],r&&"get"in r&&(n=r.get(s,"value"))!==t?n:(n=s.value,"string"==typeof n?n.replace(V,""):null==n?"":n)}}),b.extend({valHooks:{option:{get:function(e){var t=e.attributes.value;return!t||t.specified?e.value:e.text}},select:{get:function(e){var t,n,r=e.options,i=e.selectedIndex,s="select-one"===e.type||0>i,o=s?null:[],u=s?i+1:r.length,a=0>i?u:s?i:0;for(;u>a;a++)if(n=r[a],!(!n.selected&&a!==i||(b.support.optDisabled?n.disabled:null!==n.getAttribute("disabled"))||n.parentNode.disabled&&b.nodeName(n.parentNode,"optgroup"))){if(t=b(n).val(),s)return t;o.push(t)}return o},set:function(e,t){var n=b.makeArray(t);return b(e).find("option").each(function(){this.selected=b.inArray(b(this).val(),n)>=0}),n.length||(e.selectedIndex=-1),n}}},attr:function(e,n,r){var s,o,u,a=e.nodeType;if(e&&3!==a&&8!==a&&2!==a)return typeof e.getAttribute===i?b.prop(e,n,r):(o=1!==a||!b.isXMLDoc(e),o&&(n=n.toLowerCase(),s=b.attrHooks[n]||(K.test(n)?W:z)),r===t?s&&o&&"get"in s&&null!==(u=s.get(e,n))?u:(typeof e.getAttribute!==i&&(u=e.getAttribute(n)),null==u?t:u):null!==r?s&&o&&"set"in s&&(u=s.set(e,r,n))!==t?u:(e.setAttribute(n,r+""),r):(b.removeAttr(e,n),t))},removeAttr:function(e,t){var n,r,i=0,s=t&&t.match(E);if(s&&1===e.nodeType)while(n=s[i++])r=b.propFix[n]||n,K.test(n)?!G&&Q.test(n)?e[b.camelCase("default-"+n)]=e[r]=!1:e[r]=!1:b.attr(e,n,""),e.removeAttribute(G?n:r)},attrHooks:{type:{set:function(e,t){if(!b.support.radioValue&&"radio"===t&&b.nodeName(e,"input")){var n=e.value;return e.setAttribute("type",t),n&&(e.value=n),t}}}},propFix:{tabindex:"tabIndex",readonly:"readOnly","for":"htmlFor","class":"className",maxlength:"maxLength",cellspacing:"cellSpacing",cellpadding:"cellPadding",rowspan:"rowSpan",colspan:"colSpan",usemap:"useMap",frameborder:"frameBorder",contenteditable:"contentEditable"},prop:function(e,n,r){var i,s,o,u=e.nodeType;if(e&&3!==u&&8!==u&&2!==u)return o=1!==u||!b.isXMLDoc(e),o&&(n=b.propFix[n]||n,s=b.propHooks[n]),r!==t?s&&"set"in s&&(i=s.set(e,r,n))!==t?i:e[n]=r:s&&"get"in s&&null!==(i=s.get(e,n))?i:e[n]},propHooks:{tabIndex:{get:function(e){var n=e.getAttributeNode("tabindex");return n&&n.specified?parseInt(n.value,10):$.test(e.nodeName)||J.test(e.nodeName)&&e.href?0:t}}}}),W={get:function(e,n){var r=b.prop(e,n),i="boolean"==typeof r&&e.getAttribute(n),s="boolean"==typeof r?Y&&G?null!=i:Q.test(n)?e[b.camelCase("default-"+n)]:!!i:e.getAttributeNode(n);return s&&s.value!==!1?n.toLowerCase():t},set:function(e,t,n){return t===!1?b.removeAttr(e,n):Y&&G||!Q.test(n)?e.setAttribute(!G&&b.propFix[n]||n,n):e[b.camelCase("default-"+n)]=e[n]=!0,n}},Y&&G||(b.attrHooks.value={get:function(e,n){var r=e.getAttributeNode(n);return b.nodeName(e,"input")?e.defaultValue:r&&r.specified?r.value:t},set:function(e,n,r){return b.nodeName(e,"input")?(e.defaultValue=n,t):z&&z.set(e,n,r)}}),G||(z=b.valHooks.button={get:function(e,n){var r=e.getAttributeNode(n);return r&&("id"===n||"name"===n||"coords"===n?""!==r.value:r.specified)?r.value:t},set:function(e,n,r){var i=e.getAttributeNode(r);return i||e.setAttributeNode(i=e.ownerDocument.createAttribute(r)),i.value=n+="","value"===r||n===e.getAttribute(r)?n:t}},b.attrHooks.contenteditable={get:z.get,set:function(e,t,n){z.set(e,""===t?!1:t,n)}},b.each(["width","height"],function(e,n){b.attrHooks[n]=b.extend(b.attrHooks[n],{set:function(e,r){return""===r?(e.setAttribute(n,"auto"),r):t}})})),b.support.hrefNormalized||(b.each(["href","src","width","height"],function(e,n){b.attrHooks[n]=b.extend(b.attrHooks[n],{get:function(e){var r=e.getAttribute(n,2);return null==r?t:r}})}),b.each(["href","src"],function(e,t){b.propHooks[t]={get:function(e){return e.getAttribute(t,4)}}})),b.support.style||(b.attrHooks.style={get:function(e){return e.style.cssText||t},set:function(e,t){return e.style.cssText=t+""}}),b.support.optSelected||(b.propHooks.selected=b.extend(b.propHooks.selected,{get:function(e){var t=e.parentNode;return t&&(t.selectedIndex,t.parentNode&&t.parentNode.selectedIndex),null}})),b.support.enctype||(b.propFix.enctype="encoding"),b.support.checkOn||b.each(["radio","checkbox"],function(){b.valHooks[this]={get:function(e){return null===e.getAttribute("value")?"on":e.value}}}),b.each(["radio","checkbox"],function(){b.valHooks[this]=b.extend(b.valHooks[this],{set:function(e,n){return b.isArray(n)?e.checked=b.inArray(b(e).val(),n)>=0:t}})});var Z=/^(?:input|select|textarea)$/i,et=/^key/,tt=/^(?:mouse|contextmenu)|click/,nt=/^(?:focusinfocus|focusoutblur)$/,rt=/^([^.]*)(?:\.(.+)|)$/;b.event={global:{},add:function(e,n,r,s,o){var u,a,f,l,c,h,p,d,v,m,g,y=b._data(e);if(y){r.handler&&(l=r,r=l.handler,o=l.selector),r.guid||(r.guid=b.guid++),(a=y.events)||(a=y.events={}),(h=y.handle)||(h=y.handle=function(e){return typeof b===i||e&&b.event.triggered===e.type?t:b.event.dispatch.apply(h.elem,arguments)},h.elem=e),n=(n||"").match(E)||[""],f=n.length;while(f--)u=rt.exec(n[f])||[],v=g=u[1],m=(u[2]||"").split(".").sort(),c=b.event.special[v]||{},v=(o?c.delegateType:c.bindType)||v,c=b.event.special[v]||{},p=b.extend({type:v,origType:g,data:s,handler:r,guid:r.guid,selector:o,needsContext:o&&b.expr.match.needsContext.test(o),namespace:m.join(".")},l),(d=a[v])||(d=a[v]=[],d.delegateCount=0,c.setup&&c.setup.call(e,s,m,h)!==!1||(e.addEventListener?e.addEventListener(v,h,!1):e.attachEvent&&e.attachEvent("on"+v,h))),c.add&&(c.add.call(e,p),p.handler.guid||(p.handler.guid=r.guid)),o?d.splice(d.delegateCount++,0,p):d.push(p),b.event.global[v]=!0;e=null}},remove:function(e,t,n,r,i){var s,o,u,a,f,l,c,h,p,d,v,m=b.hasData(e)&&b._data(e);if(m&&(l=m.events)){t=(t||"").match(E)||[""],f=t.length;while(f--)if(u=rt.exec(t[f])||[],p=v=u[1],d=(u[2]||"").split(".").sort(),p){c=b.event.special[p]||{},p=(r?c.delegateType:c.bindType)||p,h=l[p]||[],u=u[2]&&RegExp("(^|\\.)"+d.join("\\.(?:.*\\.|)")+"(\\.|$)"),a=s=h.length;while(s--)o=h[s],!i&&v!==o.origType||n&&n.guid!==o.guid||u&&!u.test(o.namespace)||r&&r!==o.selector&&("**"!==r||!o.selector)||(h.splice(s,1),o.selector&&h.delegateCount--,c.remove&&c.remove.call(e,o));a&&!h.length&&(c.teardown&&c.teardown.call(e,d,m.handle)!==!1||b.removeEvent(e,p,m.handle),delete l[p])}else for(p in l)b.event.remove(e,p+t[f],n,r,!0);b.isEmptyObject(l)&&(delete m.handle,b._removeData(e,"events"))}},trigger:function(n,r,i,o){var u,a,f,l,c,h,p,d=[i||s],v=g.call(n,"type")?n.type:n,m=g.call(n,"namespace")?n.namespace.split("."):[];if(f=h=i=i||s,3!==i.nodeType&&8!==i.nodeType&&!nt.test(v+b.event.triggered)&&(v.indexOf(".")>=0&&(m=v.split("."),v=m.shift(),m.sort()),a=0>v.indexOf(":")&&"on"+v,n=n[b.expando]?n:new b.Event(v,"object"==typeof n&&n),n.isTrigger=!0,n.namespace=m.join("."),n.namespace_re=n.namespace?RegExp("(^|\\.)"+m.join("\\.(?:.*\\.|)")+"(\\.|$)"):null,n.result=t,n.target||(n.target=i),r=null==r?[n]:b.makeArray(r,[n]),c=b.event.special[v]||{},o||!c.trigger||c.trigger.apply(i,r)!==!1)){if(!o&&!c.noBubble&&!b.isWindow(i)){for(l=c.delegateType||v,nt.test(l+v)||(f=f.parentNode);f;f=f.parentNode)d.push(f),h=f;h===(i.ownerDocument||s)&&d.push(h.defaultView||h.parentWindow||e)}p=0;while((f=d[p++])&&!n.isPropagationStopped())n.type=p>1?l:c.bindType||v,u=(b._data(f,"events")||{})[n.type]&&b._data(f,"handle"),u&&u.apply(f,r),u=a&&f[a],u&&b.acceptData(f)&&u.apply&&u.apply(f,r)===!1&&n.preventDefault();if(n.type=v,!(o||n.isDefaultPrevented()||c._default&&c._default.apply(i.ownerDocument,r)!==!1||"click"===v&&b.nodeName(i,"a")||!b.acceptData(i)||!a||!i[v]||b.isWindow(i))){h=i[a],h&&(i[a]=null),b.event.triggered=v;try{i[v]()}catch(y){}b.event.triggered=t,h&&(i[a]=h)}return n.result}},dispatch:function(e){e=b.event.fix(e);var n,r,i,s,o,u=[],a=d.call(arguments),f=(b._data(this,"events")||{})[e.type]||[],l=b.event.special[e.type]||{};if(a[0]=e,e.delegateTarget=this,!l.preDispatch||l.preDispatch.call(this,e)!==!1){u=b.event.handlers.call(this,e,f),n=0;while((s=u[n++])&&!e.isPropagationStopped()){e.currentTarget=s.elem,o=0;while((i=s.handlers[o++])&&!e.isImmediatePropagationStopped())(!e.namespace_re||e.namespace_re.test(i.namespace))&&(e.handleObj=i,e.data=i.data,r=((b.event.special[i.origType]||{}).handle||i.handler).apply(s.elem,a),r!==t&&(e.result=r)===!1&&(e.preventDefault(),e.stopPropagation()))}return l.postDispatch&&l.postDispatch.call(this,e),e.result}},handlers:function(e,n){var r,i,s,o,u=[],a=n.delegateCount,f=e.target;if(a&&f.nodeType&&(!e.button||"click"!==e.type))for(;f!=this;f=f.parentNode||this)if(1===f.nodeType&&(f.disabled!==!0||"click"!==e.type)){for(s=[],o=0;a>o;o++)i=n[o],r=i.selector+" ",s[r]===t&&(s[r]=i.needsContext?b(r,this).index(f)>=0:b.find(r,this,null,[f]).length),s[r]&&s.push(i);s.length&&u.push({elem:f,handlers:s})}return n.length>a&&u.push({elem:this,handlers:n.slice(a)}),u},fix:function(e){if(e[b.expando])return e;var t,n,r,i=e.type,o=e,u=this.fixHooks[i];u||(this.fixHooks[i]=u=tt.test(i)?this.mouseHooks:et.test(i)?this.keyHooks:{}),r=u.props?this.props.concat(u.props):this.props,e=new b.Event(o),t=r.length;while(t--)n=r[t],e[n]=o[n];return e.target||(e.target=o.srcElement||s),3===e.target.nodeType&&(e.target=e.target.parentNode),e.metaKey=!!e.metaKey,u.filter?u.filter(e,o):e},props:"altKey bubbles cancelable ctrlKey currentTarget eventPhase metaKey relatedTarget shiftKey target timeStamp view which".split(" "),fixHooks:{},keyHooks:{props:"char charCode key keyCode".split(" "),filter:function(e,t){return null==e.which&&(e.which=null!=t.charCode?t.charCode:t.keyCode),e}},mouseHooks:{props:"button buttons clientX clientY fromElement offsetX offsetY pageX pageY screenX screenY toElement".split(" "),filter:function(e,n){var r,i,o,u=n.button,a=n.fromElement;return null==e.pageX&&null!=n.clientX&&(i=e.target.ownerDocument||s,o=i.documentElement,r=i.body,e.pageX=n.clientX+(o&&o.scrollLeft||r&&r.scrollLeft||0)-(o&&o.clientLeft||r&&r.clientLeft||0),e.pageY=n.clientY+(o&&o.scrollTop||r&&r.scrollTop||0)-(o&&o.clientTop||r&&r.clientTop||0)),!e.relatedTarget&&a&&(e.relatedTarget=a===e.target?n.toElement:a),e.which||u===t||(e.which=1&u?1:2&u?3:4&u?2:0),e}},special:{load:{noBubble:!0},click:{trigger:function(){return b.nodeName(this,"input")&&"checkbox"===this.type&&this.click?(this.click(),!1):t}},focus:{trigger:function(){if(this!==s.activeElement&&this.focus)try{return this.focus(),!1}catch(e){}},delegateType:"focusin"},blur:{trigger:function(){return this===s.activeElement&&this.blur?(this.blur(),!1):t},delegateType:"focusout"},beforeunload:{postDispatch:function(e){e.result!==t&&(e.originalEvent.returnValue=e.result)}}},simulate:function(e,t,n,r){var i=b.extend(new b.Event,n,{type:e,isSimulated:!0,originalEvent:{}});r?b.event.trigger(i,null,t):b.event.dispatch.call(t,i),i.isDefaultPrevented()&&n.preventDefault()}},b.removeEvent=s.removeEventListener?function(e,t,n){e.removeEventListener&&e.removeEventListener(t,n,!1)}:function(e,t,n){var r="on"+t;e.detachEvent&&(typeof e[r]===i&&(e[r]=null),e.detachEvent(r,n))},b.Event=function(e,n){return this instanceof b.Event?(e&&e.type?(this.originalEvent=e,this.type=e.type,this.isDefaultPrevented=e.defaultPrevented||e.returnValue===!1||e.getPreventDefault&&e.getPreventDefault()?it:st):this.type=e,n&&b.extend(this,n),this.timeStamp=e&&e.timeStamp||b.now(),this[b.expando]=!0,t):new b.Event(e,n)},b.Event.prototype={isDefaultPrevented:st,isPropagationStopped:st,isImmediatePropagationStopped:st,preventDefault:function(){var e=this.originalEvent;this.isDefaultPrevented=it,e&&(e.preventDefault?e.preventDefault():e.returnValue=!1)},stopPropagation:function(){var e=this.originalEvent;this.isPropagationStopped=it,e&&(e.stopPropagation&&e.stopPropagation(),e.cancelBubble=!0)},stopImmediatePropagation:function(){this.isImmediatePropagationStopped=it,this.stopPropagation()}},b.each({mouseenter:"mouseover",mouseleave:"mouseout"},function(e,t){b.event.special[e]={delegateType:t,bindType:t,handle:function(e){var n,r=this,i=e.relatedTarget,s=e.handleObj;return(!i||i!==r&&!b.contains(r,i))&&(e.type=s.origType,n=s.handler.apply(this,arguments),e.type=t),n}}}),b.support.submitBubbles||(b.event.special.submit={setup:function(){return b.nodeName(this,"form")?!1:(b.event.add(this,"click._submit keypress._submit",function(e){var n=e.target,r=b.nodeName(n,"input")||b.nodeName(n,"button")?n.form:t;r&&!b._data(r,"submitBubbles")&&(b.event.add(r,"submit._submit",function(e){e._submit_bubble=!0}),b._data(r,"submitBubbles",!0))}),t)},postDispatch:function(e){e._submit_bubble&&(delete e._submit_bubble,this.parentNode&&!e.isTrigger&&b.event.simulate("submit",this.parentNode,e,!0))},teardown:function(){return b.nodeName(this,"form")?!1:(b.event.remove(this,"._submit"),t)}}),b.support.changeBubbles||(b.event.special.change={setup:function(){return Z.test(this.nodeName)?(("checkbox"===this.type||"radio"===this.type)&&(b.event.add(this,"propertychange._change",function(e){"checked"===e.originalEvent.propertyName&&(this._just_changed=!0)}),b.event.add(this,"click._change",function(e){this._just_changed&&!e.isTrigger&&(this._just_changed=!1),b.event.simulate("change",this,e,!0)})),!1):(b.event.add(this,"beforeactivate._change",function(e){var t=e.target;Z.test(t.nodeName)&&!b._data(t,"changeBubbles")&&(b.event.add(t,"change._change",function(e){!this.parentNode||e.isSimulated||e.isTrigger||b.event.simulate("change",this.parentNode,e,!0)}),b._data(t,"changeBubbles",!0))}),t)},handle:function(e){var n=e.target;return this!==n||e.isSimulated||e.isTrigger||"radio"!==n.type&&"checkbox"!==n.type?e.handleObj.handler.apply(this,arguments):t},teardown:function(){return b.event.remove(this,"._change"),!Z.test(this.nodeName)}}),b.support.focusinBubbles||b.each({focus:"focusin",blur:"focusout"},function(e,t){var n=0,r=function(e){b.event.simulate(t,e.target,b.event.fix(e),!0)};b.event.special[t]={setup:function(){0===n++&&s.addEventListener(e,r,!0)},teardown:function(){0===--n&&s.removeEventListener(e,r,!0)}}}),b.fn.extend({on:function(e,n,r,i,s){var o,u;if("object"==typeof e){"string"!=typeof n&&(r=r||n,n=t);for(o in e)this.on(o,n,r,e[o],s);return this}if(null==r&&null==i?(i=n,r=n=t):null==i&&("string"==typeof n?(i=r,r=t):(i=r,r=n,n=t)),i===!1)i=st;else if(!i)return this;return 1===s&&(u=i,i=function(e){return b().off(e),u.apply(this,arguments)},i.guid=u.guid||(u.guid=b.guid++)),this.each(function(){b.event.add(this,e,i,r,n)})},one:function(e,t,n,r){return this.on(e,t,n,r,1)},off:function(e,n,r){var i,s;if(e&&e.preventDefault&&e.handleObj)return i=e.handleObj,b(e.delegateTarget).off(i.namespace?i.origType+"."+i.namespace:i.origType,i.selector,i.handler),this;if("object"==typeof e){for(s in e)this.off(s,n,e[s]);return this}return(n===!1||"function"==typeof n)&&(r=n,n=t),r===!1&&(r=st),this.each(function(){b.event.remove(this,e,r,n)})},bind:function(e,t,n){return this.on(e,null,t,n)},unbind:function(e,t){return this.off(e,null,t)},delegate:function(e,t,n,r){return this.on(t,e,n,r)},undelegate:function(e,t,n){return 1===arguments.length?this.off(e,"**"):this.off(t,e||"**",n)},trigger:function(e,t){return this.each(function(){b.event.trigger(e,t,this)})},triggerHandler:function(e,n){var r=this[0];return r?b.event.trigger(e,n,r,!0):t}}),function(e,t){function rt(e){return J.test(e+"")}function it(){var e,t=[];return e=function(n,r){return t.push(n+=" ")>i.cacheLength&&delete e[t.shift()],e[n]=r}}function st(e){return e[w]=!0,e}function ot(e){var t=c.createElement("div");try{return e(t)}catch(n){return!1}finally{t=null}}function ut(e,t,n,r){var i,s,o,u,a,f,h,v,m,y;if((t?t.ownerDocument||t:E)!==c&&l(t),t=t||c,n=n||[],!e||"string"!=typeof e)return n;if(1!==(u=t.nodeType)&&9!==u)return[];if(!p&&!r){if(i=K.exec(e))if(o=i[1]){if(9===u){if(s=t.getElementById(o),!s||!s.parentNode)return n;if(s.id===o)return n.push(s),n}else if(t.ownerDocument&&(s=t.ownerDocument.getElementById(o))&&g(t,s)&&s.id===o)return n.push(s),n}else{if(i[2])return _.apply(n,D.call(t.getElementsByTagName(e),0)),n;if((o=i[3])&&S.getByClassName&&t.getElementsByClassName)return _.apply(n,D.call(t.getElementsByClassName(o),0)),n}if(S.qsa&&!d.test(e)){if(h=!0,v=w,m=t,y=9===u&&e,1===u&&"object"!==t.nodeName.toLowerCase()){f=ht(e),(h=t.getAttribute("id"))?v=h.replace(Y,"\\$&"):t.setAttribute("id",v),v="[id='"+v+"'] ",a=f.length;while(a--)f[a]=v+pt(f[a]);m=$.test(e)&&t.parentNode||t,y=f.join(",")}if(y)try{return _.apply(n,D.call(m.querySelectorAll(y),0)),n}catch(b){}finally{h||t.removeAttribute("id")}}}return Et(e.replace(R,"$1"),t,n,r)}function at(e,t){var n=t&&e,r=n&&(~t.sourceIndex||A)-(~e.sourceIndex||A);if(r)return r;if(n)while(n=n.nextSibling)if(n===t)return-1;return e?1:-1}function ft(e){return function(t){var n=t.nodeName.toLowerCase();return"input"===n&&t.type===e}}function lt(e){return function(t){var n=t.nodeName.toLowerCase();return("input"===n||"button"===n)&&t.type===e}}function ct(e){return st(function(t){return t=+t,st(function(n,r){var i,s=e([],n.length,t),o=s.length;while(o--)n[i=s[o]]&&(n[i]=!(r[i]=n[i]))})})}function ht(e,t){var n,r,s,o,u,a,f,l=C[e+" "];if(l)return t?0:l.slice(0);u=e,a=[],f=i.preFilter;while(u){(!n||(r=U.exec(u)))&&(r&&(u=u.slice(r[0].length)||u),a.push(s=[])),n=!1,(r=z.exec(u))&&(n=r.shift(),s.push({value:n,type:r[0].replace(R," ")}),u=u.slice(n.length));for(o in i.filter)!(r=V[o].exec(u))||f[o]&&!(r=f[o](r))||(n=r.shift(),s.push({value:n,type:o,matches:r}),u=u.slice(n.length));if(!n)break}return t?u.length:u?ut.error(e):C(e,a).slice(0)}function pt(e){var t=0,n=e.length,r="";for(;n>t;t++)r+=e[t].value;return r}function dt(e,t,n){var i=t.dir,s=n&&"parentNode"===i,o=T++;return t.first?function(t,n,r){while(t=t[i])if(1===t.nodeType||s)return e(t,n,r)}:function(t,n,u){var a,f,l,c=x+" "+o;if(u){while(t=t[i])if((1===t.nodeType||s)&&e(t,n,u))return!0}else while(t=t[i])if(1===t.nodeType||s)if(l=t[w]||(t[w]={}),(f=l[i])&&f[0]===c){if((a=f[1])===!0||a===r)return a===!0}else if(f=l[i]=[c],f[1]=e(t,n,u)||r,f[1]===!0)return!0}}function vt(e){return e.length>1?function(t,n,r){var i=e.length;while(i--)if(!e[i](t,n,r))return!1;return!0}:e[0]}function mt(e,t,n,r,i){var s,o=[],u=0,a=e.length,f=null!=t;for(;a>u;u++)(s=e[u])&&(!n||n(s,r,i))&&(o.push(s),f&&t.push(u));return o}function gt(e,t,n,r,i,s){return r&&!r[w]&&(r=gt(r)),i&&!i[w]&&(i=gt(i,s)),st(function(s,o,u,a){var f,l,c,h=[],p=[],d=o.length,v=s||wt(t||"*",u.nodeType?[u]:u,[]),m=!e||!s&&t?v:mt(v,h,e,u,a),g=n?i||(s?e:d||r)?[]:o:m;if(n&&n(m,g,u,a),r){f=mt(g,p),r(f,[],u,a),l=f.length;while(l--)(c=f[l])&&(g[p[l]]=!(m[p[l]]=c))}if(s){if(i||e){if(i){f=[],l=g.length;while(l--)(c=g[l])&&f.push(m[l]=c);i(null,g=[],f,a)}l=g.length;while(l--)(c=g[l])&&(f=i?P.call(s,c):h[l])>-1&&(s[f]=!(o[f]=c))}}else g=mt(g===o?g.splice(d,g.length):g),i?i(null,o,g,a):_.apply(o,g)})}function yt(e){var t,n,r,s=e.length,o=i.relative[e[0].type],u=o||i.relative[" "],a=o?1:0,l=dt(function(e){return e===t},u,!0),c=dt(function(e){return P.call(t,e)>-1},u,!0),h=[function(e,n,r){return!o&&(r||n!==f)||((t=n).nodeType?l(e,n,r):c(e,n,r))}];for(;s>a;a++)if(n=i.relative[e[a].type])h=[dt(vt(h),n)];else{if(n=i.filter[e[a].type].apply(null,e[a].matches),n[w]){for(r=++a;s>r;r++)if(i.relative[e[r].type])break;return gt(a>1&&vt(h),a>1&&pt(e.slice(0,a-1)).replace(R,"$1"),n,r>a&&yt(e.slice(a,r)),s>r&&yt(e=e.slice(r)),s>r&&pt(e))}h.push(n)}return vt(h)}function bt(e,t){var n=0,s=t.length>0,o=e.length>0,u=function(u,a,l,h,p){var d,v,m,g=[],y=0,b="0",w=u&&[],E=null!=p,S=f,T=u||o&&i.find.TAG("*",p&&a.parentNode||a),N=x+=null==S?1:Math.random()||.1;for(E&&(f=a!==c&&a,r=n);null!=(d=T[b]);b++){if(o&&d){v=0;while(m=e[v++])if(m(d,a,l)){h.push(d);break}E&&(x=N,r=++n)}s&&((d=!m&&d)&&y--,u&&w.push(d))}if(y+=b,s&&b!==y){v=0;while(m=t[v++])m(w,g,a,l);if(u){if(y>0)while(b--)w[b]||g[b]||(g[b]=M.call(h));g=mt(g)}_.apply(h,g),E&&!u&&g.length>0&&y+t.length>1&&ut.uniqueSort(h)}return E&&(x=N,f=S),w};return s?st(u):u}function wt(e,t,n){var r=0,i=t.length;for(;i>r;r++)ut(e,t[r],n);return n}function Et(e,t,n,r){var s,o,a,f,l,c=ht(e);if(!r&&1===c.length){if(o=c[0]=c[0].slice(0),o.length>2&&"ID"===(a=o[0]).type&&9===t.nodeType&&!p&&i.relative[o[1].type]){if(t=i.find.ID(a.matches[0].replace(et,tt),t)[0],!t)return n;e=e.slice(o.shift().value.length)}s=V.needsContext.test(e)?0:o.length;while(s--){if(a=o[s],i.relative[f=a.type])break;if((l=i.find[f])&&(r=l(a.matches[0].replace(et,tt),$.test(o[0].type)&&t.parentNode||t))){if(o.splice(s,1),e=r.length&&pt(o),!e)return _.apply(n,D.call(r,0)),n;break}}}return u(e,c)(r,t,p,n,$.test(e)),n}function St(){}var n,r,i,s,o,u,a,f,l,c,h,p,d,v,m,g,y,w="sizzle"+ -(new Date),E=e.document,S={},x=0,T=0,N=it(),C=it(),k=it(),L=typeof t,A=1<<31,O=[],M=O.pop,_=O.push,D=O.slice,P=O.indexOf||function(e){var t=0,n=this.length;for(;n>t;t++)if(this[t]===e)return t;return-1},H="[\\x20\\t\\r\\n\\f]",B="(?:\\\\.|[\\w-]|[^\\x00-\\xa0])+",j=B.replace("w","w#"),F="([*^$|!~]?=)",I="\\["+H+"*("+B+")"+H+"*(?:"+F+H+"*(?:(['\"])((?:\\\\.|[^\\\\])*?)\\3|("+j+")|)|)"+H+"*\\]",q=":("+B+")(?:\\(((['\"])((?:\\\\.|[^\\\\])*?)\\3|((?:\\\\.|[^\\\\()[\\]]|"+I.replace(3,8)+")*)|.*)\\)|)",R=RegExp("^"+H+"+|((?:^|[^\\\\])(?:\\\\.)*)"+H+"+$","g"),U=RegExp("^"+H+"*,"+H+"*"),z=RegExp("^"+H+"*([\\x20\\t\\r\\n\\f>+~])"+H+"*"),W=RegExp(q),X=RegExp("^"+j+"$"),V={ID:RegExp("^#("+B+")"),CLASS:RegExp("^\\.("+B+")"),NAME:RegExp("^\\[name=['\"]?("+B+")['\"]?\\]"),TAG:RegExp("^("+B.replace("w","w*")+")"),ATTR:RegExp("^"+I),PSEUDO:RegExp("^"+q),CHILD:RegExp("^:(only|first|last|nth|nth-last)-(child|of-type)(?:\\("+H+"*(even|odd|(([+-]|)(\\d*)n|)"+H+"*(?:([+-]|)"+H+"*(\\d+)|))"+H+"*\\)|)","i"),needsContext:RegExp("^"+H+"*[>+~]|:(even|odd|eq|gt|lt|nth|first|last)(?:\\("+H+"*((?:-\\d)?\\d*)"+H+"*\\)|)(?=[^-]|$)","i")},$=/[\x20\t\r\n\f]*[+~]/,J=/^[^{]+\{\s*\[native code/,K=/^(?:#([\w-]+)|(\w+)|\.([\w-]+))$/,Q=/^(?:input|select|textarea|button)$/i,G=/^h\d$/i,Y=/'|\\/g,Z=/\=[\x20\t\r\n\f]*([^'"\]]*)[\x20\t\r\n\f]*\]/g,et=/\\([\da-fA-F]{1,6}[\x20\t\r\n\f]?|.)/g,tt=function(e,t){var n="0x"+t-65536;return n!==n?t:0>n?String.fromCharCode(n+65536):String.fromCharCode(55296|n>>10,56320|1023&n)};try{D.call(E.documentElement.childNodes,0)[0].nodeType}catch(nt){D=function(e){var t,n=[];while(t=this[e++])n.push(t);return n}}o=ut.isXML=function(e){var t=e&&(e.ownerDocument||e).documentElement;return t?"HTML"!==t.nodeName:!1},l=ut.setDocument=function(e){var n=e?e.ownerDocument||e:E;return n!==c&&9===n.nodeType&&n.documentElement?(c=n,h=n.documentElement,p=o(n),S.tagNameNoComments=ot(function(e){return e.appendChild(n.createComment("")),!e.getElementsByTagName("*").length}),S.attributes=ot(function(e){e.innerHTML="<select></select>";var t=typeof e.lastChild.getAttribute("multiple");return"boolean"!==t&&"string"!==t}),S.getByClassName=ot(function(e){return e.innerHTML="<div class='hidden e'></div><div class='hidden'></div>",e.getElementsByClassName&&e.getElementsByClassName("e").length?(e.lastChild.className="e",2===e.getElementsByClassName("e").length):!1}),S.getByName=ot(function(e){e.id=w+0,e.innerHTML="<a name='"+w+"'></a><div name='"+w+"'></div>",h.insertBefore(e,h.firstChild);var t=n.getElementsByName&&n.getElementsByName(w).length===2+n.getElementsByName(w+0).length;return S.getIdNotName=!n.getElementById(w),h.removeChild(e),t}),i.attrHandle=ot(function(e){return e.innerHTML="<a href='#'></a>",e.firstChild&&typeof e.firstChild.getAttribute!==L&&"#"===e.firstChild.getAttribute("href")})?{}:{href:function(e){return e.getAttribute("href",2)},type:function(e){return e.getAttribute("type")}},S.getIdNotName?(i.find.ID=function(e,t){if(typeof t.getElementById!==L&&!p){var n=t.getElementById(e);return n&&n.parentNode?[n]:[]}},i.filter.ID=function(e){var t=e.replace(et,tt);return function(e){return e.getAttribute("id")===t}}):(i.find.ID=function(e,n){if(typeof n.getElementById!==L&&!p){var r=n.getElementById(e);return r?r.id===e||typeof r.getAttributeNode!==L&&r.getAttributeNode("id").value===e?[r]:t:[]}},i.filter.ID=function(e){var t=e.replace(et,tt);return function(e){var n=typeof e.getAttributeNode!==L&&e.getAttributeNode("id");return n&&n.value===t}}),i.find.TAG=S.tagNameNoComments?function(e,n){return typeof n.getElementsByTagName!==L?n.getElementsByTagName(e):t}:function(e,t){var n,r=[],i=0,s=t.getElementsByTagName(e);if("*"===e){while(n=s[i++])1===n.nodeType&&r.push(n);return r}return s},i.find.NAME=S.getByName&&function(e,n){return typeof n.getElementsByName!==L?n.getElementsByName(name):t},i.find.CLASS=S.getByClassName&&function(e,n){return typeof n.getElementsByClassName===L||p?t:n.getElementsByClassName(e)},v=[],d=[":focus"],(S.qsa=rt(n.querySelectorAll))&&(ot(function(e){e.innerHTML="<select><option selected=''></option></select>",e.querySelectorAll("[selected]").length||d.push("\\["+H+"*(?:checked|disabled|ismap|multiple|readonly|selected|value)"),e.querySelectorAll(":checked").length||d.push(":checked")}),ot(function(e){e.innerHTML="<input type='hidden' i=''/>",e.querySelectorAll("[i^='']").length&&d.push("[*^$]="+H+"*(?:\"\"|'')"),e.querySelectorAll(":enabled").length||d.push(":enabled",":disabled"),e.querySelectorAll("*,:x"),d.push(",.*:")})),(S.matchesSelector=rt(m=h.matchesSelector||h.mozMatchesSelector||h.webkitMatchesSelector||h.oMatchesSelector||h.msMatchesSelector))&&ot(function(e){S.disconnectedMatch=m.call(e,"div"),m.call(e,"[s!='']:x"),v.push("!=",q)}),d=RegExp(d.join("|")),v=RegExp(v.join("|")),g=rt(h.contains)||h.compareDocumentPosition?function(e,t){var n=9===e.nodeType?e.documentElement:e,r=t&&t.parentNode;return e===r||!!r&&1===r.nodeType&&!!(n.contains?n.contains(r):e.compareDocumentPosition&&16&e.compareDocumentPosition(r))}:function(e,t){if(t)while(t=t.parentNode)if(t===e)return!0;return!1},y=h.compareDocumentPosition?function(e,t){var r;return e===t?(a=!0,0):(r=t.compareDocumentPosition&&e.compareDocumentPosition&&e.compareDocumentPosition(t))?1&r||e.parentNode&&11===e.parentNode.nodeType?e===n||g(E,e)?-1:t===n||g(E,t)?1:0:4&r?-1:1:e.compareDocumentPosition?-1:1}:function(e,t){var r,i=0,s=e.parentNode,o=t.parentNode,u=[e],f=[t];if(e===t)return a=!0,0;if(!s||!o)return e===n?-1:t===n?1:s?-1:o?1:0;if(s===o)return at(e,t);r=e;while(r=r.parentNode)u.unshift(r);r=t;while(r=r.parentNode)f.unshift(r);while(u[i]===f[i])i++;return i?at(u[i],f[i]):u[i]===E?-1:f[i]===E?1:0},a=!1,[0,0].sort(y),S.detectDuplicates=a,c):c},ut.matches=function(e,t){return ut(e,null,null,t)},ut.matchesSelector=function(e,t){if((e.ownerDocument||e)!==c&&l(e),t=t.replace(Z,"='$1']"),!(!S.matchesSelector||p||v&&v.test(t)||d.test(t)))try{var n=m.call(e,t);if(n||S.disconnectedMatch||e.document&&11!==e.document.nodeType)return n}catch(r){}return ut(t,c,null,[e]).length>0},ut.contains=function(e,t){return(e.ownerDocument||e)!==c&&l(e),g(e,t)},ut.attr=function(e,t){var n;return(e.ownerDocument||e)!==c&&l(e),p||(t=t.toLowerCase()),(n=i.attrHandle[t])?n(e):p||S.attributes?e.getAttribute(t):((n=e.getAttributeNode(t))||e.getAttribute(t))&&e[t]===!0?t:n&&n.specified?n.value:null},ut.error=function(e){throw Error("Syntax error, unrecognized expression: "+e)},ut.uniqueSort=function(e){var t,n=[],r=1,i=0;if(a=!S.detectDuplicates,e.sort(y),a){for(;t=e[r];r++)t===e[r-1]&&(i=n.push(r));while(i--)e.splice(n[i],1)}return e},s=ut.getText=function(e){var t,n="",r=0,i=e.nodeType;if(i){if(1===i||9===i||11===i){if("string"==typeof e.textContent)return e.textContent;for(e=e.firstChild;e;e=e.nextSibling)n+=s(e)}else if(3===i||4===i)return e.nodeValue}else for(;t=e[r];r++)n+=s(t);return n},i=ut.selectors={cacheLength:50,createPseudo:st,match:V,find:{},relative:{">":{dir:"parentNode",first:!0}," ":{dir:"parentNode"},"+":{dir:"previousSibling",first:!0},"~":{dir:"previousSibling"}},preFilter:{ATTR:function(e){return e[1]=e[1].replace(et,tt),e[3]=(e[4]||e[5]||"").replace(et,tt),"~="===e[2]&&(e[3]=" "+e[3]+" "),e.slice(0,4)},CHILD:function(e){return e[1]=e[1].toLowerCase(),"nth"===e[1].slice(0,3)?(e[3]||ut.error(e[0]),e[4]=+(e[4]?e[5]+(e[6]||1):2*("even"===e[3]||"odd"===e[3])),e[5]=+(e[7]+e[8]||"odd"===e[3])):e[3]&&ut.error(e[0]),e},PSEUDO:function(e){var t,n=!e[5]&&e[2];return V.CHILD.test(e[0])?null:(e[4]?e[2]=e[4]:n&&W.test(n)&&(t=ht(n,!0))&&(t=n.indexOf(")",n.length-t)-n.length)&&(e[0]=e[0].slice(0,t),e[2]=n.slice(0,t)),e.slice(0,3))}},filter:{TAG:function(e){return"*"===e?function(){return!0}:(e=e.replace(et,tt).toLowerCase(),function(t){return t.nodeName&&t.nodeName.toLowerCase()===e})},CLASS:function(e){var t=N[e+" "];return t||(t=RegExp("(^|"+H+")"+e+"("+H+"|$)"))&&N(e,function(e){return t.test(e.className||typeof e.getAttribute!==L&&e.getAttribute("class")||"")})},ATTR:function(e,t,n){return function(r){var i=ut.attr(r,e);return null==i?"!="===t:t?(i+="","="===t?i===n:"!="===t?i!==n:"^="===t?n&&0===i.indexOf(n):"*="===t?n&&i.indexOf(n)>-1:"$="===t?n&&i.slice(-n.length)===n:"~="===t?(" "+i+" ").indexOf(n)>-1:"|="===t?i===n||i.slice(0,n.length+1)===n+"-":!1):!0}},CHILD:function(e,t,n,r,i){var s="nth"!==e.slice(0,3),o="last"!==e.slice(-4),u="of-type"===t;return 1===r&&0===i?function(e){return!!e.parentNode}:function(t,n,a){var f,l,c,h,p,d,v=s!==o?"nextSibling":"previousSibling",m=t.parentNode,g=u&&t.nodeName.toLowerCase(),y=!a&&!u;if(m){if(s){while(v){c=t;while(c=c[v])if(u?c.nodeName.toLowerCase()===g:1===c.nodeType)return!1;d=v="only"===e&&!d&&"nextSibling"}return!0}if(d=[o?m.firstChild:m.lastChild],o&&y){l=m[w]||(m[w]={}),f=l[e]||[],p=f[0]===x&&f[1],h=f[0]===x&&f[2],c=p&&m.childNodes[p];while(c=++p&&c&&c[v]||(h=p=0)||d.pop())if(1===c.nodeType&&++h&&c===t){l[e]=[x,p,h];break}}else if(y&&(f=(t[w]||(t[w]={}))[e])&&f[0]===x)h=f[1];else while(c=++p&&c&&c[v]||(h=p=0)||d.pop())if((u?c.nodeName.toLowerCase()===g:1===c.nodeType)&&++h&&(y&&((c[w]||(c[w]={}))[e]=[x,h]),c===t))break;return h-=i,h===r||0===h%r&&h/r>=0}}},PSEUDO:function(e,t){var n,r=i.pseudos[e]||i.setFilters[e.toLowerCase()]||ut.error("unsupported pseudo: "+e);return r[w]?r(t):r.length>1?(n=[e,e,"",t],i.setFilters.hasOwnProperty(e.toLowerCase())?st(function(e,n){var i,s=r(e,t),o=s.length;while(o--)i=P.call(e,s[o]),e[i]=!(n[i]=s[o])}):function(e){return r(e,0,n)}):r}},pseudos:{not:st(function(e){var t=[],n=[],r=u(e.replace(R,"$1"));return r[w]?st(function(e,t,n,i){var s,o=r(e,null,i,[]),u=e.length;while(u--)(s=o[u])&&(e[u]=!(t[u]=s))}):function(e,i,s){return t[0]=e,r(t,null,s,n),!n.pop()}}),has:st(function(e){return function(t){return ut(e,t).length>0}}),contains:st(function(e){return function(t){return(t.textContent||t.innerText||s(t)).indexOf(e)>-1}}),lang:st(function(e){return X.test(e||"")||ut.error("unsupported lang: "+e),e=e.replace(et,tt).toLowerCase(),function(t){var n;do if(n=p?t.getAttribute("xml:lang")||t.getAttribute("lang"):t.lang)return n=n.toLowerCase(),n===e||0===n.indexOf(e+"-");while((t=t.parentNode)&&1===t.nodeType);return!1}}),target:function(t){var n=e.location&&e.location.hash;return n&&n.slice(1)===t.id},root:function(e){return e===h},focus:function(e){return e===c.activeElement&&(!c.hasFocus||c.hasFocus())&&!!(e.type||e.href||~e.tabIndex)},enabled:function(e){return e.disabled===!1},disabled:function(e){return e.disabled===!0},checked:function(e){var t=e.nodeName.toLowerCase();return"input"===t&&!!e.checked||"option"===t&&!!e.selected},selected:function(e){return e.parentNode&&e.parentNode.selectedIndex,e.selected===!0},empty:function(e){for(e=e.firstChild;e;e=e.nextSibling)if(e.nodeName>"@"||3===e.nodeType||4===e.nodeType)return!1;return!0},parent:function(e){return!i.pseudos.empty(e)},header:function(e){return G.test(e.nodeName)},input:function(e){return Q.test(e.nodeName)},button:function(e){var t=e.nodeName.toLowerCase();return"input"===t&&"button"===e.type||"button"===t},text:function(e){var t;return"input"===e.nodeName.toLowerCase()&&"text"===e.type&&(null==(t=e.getAttribute("type"))||t.toLowerCase()===e.type)},first:ct(function(){return[0]}),last:ct(function(e,t){return[t-1]}),eq:ct(function(e,t,n){return[0>n?n+t:n]}),even:ct(function(e,t){var n=0;for(;t>n;n+=2)e.push(n);return e}),odd:ct(function(e,t){var n=1;for(;t>n;n+=2)e.push(n);return e}),lt:ct(function(e,t,n){var r=0>n?n+t:n;for(;--r>=0;)e.push(r);return e}),gt:ct(function(e,t,n){var r=0>n?n+t:n;for(;t>++r;)e.push(r);return e})}};for(n in{radio:!0,checkbox:!0,file:!0,password:!0,image:!0})i.pseudos[n]=ft(n);for(n in{submit:!0,reset:!0})i.pseudos[n]=lt(n);u=ut.compile=function(e,t){var n,r=[],i=[],s=k[e+" "];if(!s){t||(t=ht(e)),n=t.length;while(n--)s=yt(t[n]),s[w]?r.push(s):i.push(s);s=k(e,bt(i,r))}return s},i.pseudos.nth=i.pseudos.eq,i.filters=St.prototype=i.pseudos,i.setFilters=new St,l(),ut.attr=b.attr,b.find=ut,b.expr=ut.selectors,b.expr[":"]=b.expr.pseudos,b.unique=ut.uniqueSort,b.text=ut.getText,b.isXMLDoc=ut.isXML,b.contains=ut.contains}(e);var ot=/Until$/,ut=/^(?:parents|prev(?:Until|All))/,at=/^.[^:#\[\.,]*$/,ft=b.expr.match.needsContext,lt={children:!0,contents:!0,next:!0,prev:!0};b.fn.extend({find:function(e){var t,n,r,i=this.length;if("string"!=typeof e)return r=this,this.pushStack(b(e).filter(function(){for(t=0;i>t;t++)if(b.contains(r[t],this))return!0}));for(n=[],t=0;i>t;t++)b.find(e,this[t],n);return n=this.pushStack(i>1?b.unique(n):n),n.selector=(this.selector?this.selector+" ":"")+e,n},has:function(e){var t,n=b(e,this),r=n.length;return this.filter(function(){for(t=0;r>t;t++)if(b.contains(this,n[t]))return!0})},not:function(e){return this.pushStack(ht(this,e,!1))},filter:function(e){return this.pushStack(ht(this,e,!0))},is:function(e){return!!e&&("string"==typeof e?ft.test(e)?b(e,this.context).index(this[0])>=0:b.filter(e,this).length>0:this.filter(e).length>0)},closest:function(e,t){var n,r=0,i=this.length,s=[],o=ft.test(e)||"string"!=typeof e?b(e,t||this.context):0;for(;i>r;r++){n=this[r];while(n&&n.ownerDocument&&n!==t&&11!==n.nodeType){if(o?o.index(n)>-1:b.find.matchesSelector(n,e)){s.push(n);break}n=n.parentNode}}return this.pushStack(s.length>1?b.unique(s):s)},index:function(e){return e?"string"==typeof e?b.inArray(this[0],b(e)):b.inArray(e.jquery?e[0]:e,this):this[0]&&this[0].parentNode?this.first().prevAll().length:-1},add:function(e,t){var n="string"==typeof e?b(e,t):b.makeArray(e&&e.nodeType?[e]:e),r=b.merge(this.get(),n);return this.pushStack(b.unique(r))},addBack:function(e){return this.add(null==e?this.prevObject:this.prevObject.filter(e))}}),b.fn.andSelf=b.fn.addBack,b.each({parent:function(e){var t=e.parentNode;return t&&11!==t.nodeType?t:null},parents:function(e){return b.dir(e,"parentNode")},parentsUntil:function(e,t,n){return b.dir(e,"parentNode",n)},next:function(e){return ct(e,"nextSibling")},prev:function(e){return ct(e,"previousSibling")},nextAll:function(e){return b.dir(e,"nextSibling")},prevAll:function(e){return b.dir(e,"previousSibling")},nextUntil:function(e,t,n){return b.dir(e,"nextSibling",n)},prevUntil:function(e,t,n){return b.dir(e,"previousSibling",n)},siblings:function(e){return b.sibling((e.parentNode||{}).firstChild,e)},children:function(e){return b.sibling(e.firstChild)},contents:function(e){return b.nodeName(e,"iframe")?e.contentDocument||e.contentWindow.document:b.merge([],e.childNodes)}},function(e,t){b.fn[e]=function(n,r){var i=b.map(this,t,n);return ot.test(e)||(r=n),r&&"string"==typeof r&&(i=b.filter(r,i)),i=this.length>1&&!lt[e]?b.unique(i):i,this.length>1&&ut.test(e)&&(i=i.reverse()),this.pushStack(i)}}),b.extend({filter:function(e,t,n){return n&&(e=":not("+e+")"),1===t.length?b.find.matchesSelector(t[0],e)?[t[0]]:[]:b.find.matches(e,t)},dir:function(e,n,r){var i=[],s=e[n];while(s&&9!==s.nodeType&&(r===t||1!==s.nodeType||!b(s).is(r)))1===s.nodeType&&i.push(s),s=s[n];return i},sibling:function(e,t){var n=[];for(;e;e=e.nextSibling)1===e.nodeType&&e!==t&&n.push(e);return n}});var dt="abbr|article|aside|audio|bdi|canvas|data|datalist|details|figcaption|figure|footer|header|hgroup|mark|meter|nav|output|progress|section|summary|time|video",vt=/ jQuery\d+="(?:null|\d+)"/g,mt=RegExp("<(?:"+dt+")[\\s/>]","i"),gt=/^\s+/,yt=/<(?!area|br|col|embed|hr|img|input|link|meta|param)(([\w:]+)[^>]*)\/>/gi,bt=/<([\w:]+)/,wt=/<tbody/i,Et=/<|&#?\w+;/,St=/<(?:script|style|link)/i,xt=/^(?:checkbox|radio)$/i,Tt=/checked\s*(?:[^=]|=\s*.checked.)/i,Nt=/^$|\/(?:java|ecma)script/i,Ct=/^true\/(.*)/,kt=/^\s*<!(?:\[CDATA\[|--)|(?:\]\]|--)>\s*$/g,Lt={option:[1,"<select multiple='multiple'>","</select>"],legend:[1,"<fieldset>","</fieldset>"],area:[1,"<map>","</map>"],param:[1,"<object>","</object>"],thead:[1,"<table>","</table>"],tr:[2,"<table><tbody>","</tbody></table>"],col:[2,"<table><tbody></tbody><colgroup>","</colgroup></table>"],td:[3,"<table><tbody><tr>","</tr></tbody></table>"],_default:b.support.htmlSerialize?[0,"",""]:[1,"X<div>","</div>"]},At=pt(s),Ot=At.appendChild(s.createElement("div"));Lt.optgroup=Lt.option,Lt.tbody=Lt.tfoot=Lt.colgroup=Lt.caption=Lt.thead,Lt.th=Lt.td,b.fn.extend({text:function(e){return b.access(this,function(e){return e===t?b.text(this):this.empty().append((this[0]&&this[0].ownerDocument||s).createTextNode(e))},null,e,arguments.length)},wrapAll:function(e){if(b.isFunction(e))return this.each(function(t){b(this).wrapAll(e.call(this,t))});if(this[0]){var t=b(e,this[0].ownerDocument).eq(0).clone(!0);this[0].parentNode&&t.insertBefore(this[0]),t.map(function(){var e=this;while(e.firstChild&&1===e.firstChild.nodeType)e=e.firstChild;return e}).append(this)}return this},wrapInner:function(e){return b.isFunction(e)?this.each(function(t){b(this).wrapInner(e.call(this,t))}):this.each(function(){var t=b(this),n=t.contents();n.length?n.wrapAll(e):t.append(e)})},wrap:function(e){var t=b.isFunction(e);return this.each(function(n){b(this).wrapAll(t?e.call(this,n):e)})},unwrap:function(){return this.parent().each(function(){b.nodeName(this,"body")||b(this).replaceWith(this.childNodes)}).end()},append:function(){return this.domManip(arguments,!0,function(e){(1===this.nodeType||11===this.nodeType||9===this.nodeType)&&this.appendChild(e)})},prepend:function(){return this.domManip(arguments,!0,function(e){(1===this.nodeType||11===this.nodeType||9===this.nodeType)&&this.insertBefore(e,this.firstChild)})},before:function(){return this.domManip(arguments,!1,function(e){this.parentNode&&this.parentNode.insertBefore(e,this)})},after:function(){return this.domManip(arguments,!1,function(e){this.parentNode&&this.parentNode.insertBefore(e,this.nextSibling)})},remove:function(e,t){var n,r=0;for(;null!=(n=this[r]);r++)(!e||b.filter(e,[n]).length>0)&&(t||1!==n.nodeType||b.cleanData(jt(n)),n.parentNode&&(t&&b.contains(n.ownerDocument,n)&&Pt(jt(n,"script")),n.parentNode.removeChild(n)));return this},empty:function(){var e,t=0;for(;null!=(e=this[t]);t++){1===e.nodeType&&b.cleanData(jt(e,!1));while(e.firstChild)e.removeChild(e.firstChild);e.options&&b.nodeName(e,"select")&&(e.options.length=0)}return this},clone:function(e,t){return e=null==e?!1:e,t=null==t?e:t,this.map(function(){return b.clone(this,e,t)})},html:function(e){return b.access(this,function(e){var n=this[0]||{},r=0,i=this.length;if(e===t)return 1===n.nodeType?n.innerHTML.replace(vt,""):t;if(!("string"!=typeof e||St.test(e)||!b.support.htmlSerialize&&mt.test(e)||!b.support.leadingWhitespace&&gt.test(e)||Lt[(bt.exec(e)||["",""])[1].toLowerCase()])){e=e.replace(yt,"<$1></$2>");try{for(;i>r;r++)n=this[r]||{},1===n.nodeType&&(b.cleanData(jt(n,!1)),n.innerHTML=e);n=0}catch(s){}}n&&this.empty().append(e)},null,e,arguments.length)},replaceWith:function(e){var t=b.isFunction(e);return t||"string"==typeof e||(e=b(e).not(this).detach()),this.domManip([e],!0,function(e){var t=this.nextSibling,n=this.parentNode;n&&(b(this).remove(),n.insertBefore(e,t))})},detach:function(e){return this.remove(e,!0)},domManip:function(e,n,r){e=h.apply([],e);var i,s,o,u,a,f,l=0,c=this.length,p=this,d=c-1,v=e[0],m=b.isFunction(v);if(m||!(1>=c||"string"!=typeof v||b.support.checkClone)&&Tt.test(v))return this.each(function(i){var s=p.eq(i);m&&(e[0]=v.call(this,i,n?s.html():t)),s.domManip(e,n,r)});if(c&&(f=b.buildFragment(e,this[0].ownerDocument,!1,this),i=f.firstChild,1===f.childNodes.length&&(f=i),i)){for(n=n&&b.nodeName(i,"tr"),u=b.map(jt(f,"script"),_t),o=u.length;c>l;l++)s=f,l!==d&&(s=b.clone(s,!0,!0),o&&b.merge(u,jt(s,"script"))),r.call(n&&b.nodeName(this[l],"table")?Mt(this[l],"tbody"):this[l],s,l);if(o)for(a=u[u.length-1].ownerDocument,b.map(u,Dt),l=0;o>l;l++)s=u[l],Nt.test(s.type||"")&&!b._data(s,"globalEval")&&b.contains(a,s)&&(s.src?b.ajax({url:s.src,type:"GET",dataType:"script",async:!1,global:!1,"throws":!0}):b.globalEval((s.text||s.textContent||s.innerHTML||"").replace(kt,"")));f=i=null}return this}}),b.each({appendTo:"append",prependTo:"prepend",insertBefore:"before",insertAfter:"after",replaceAll:"replaceWith"},function(e,t){b.fn[e]=function(e){var n,r=0,i=[],s=b(e),o=s.length-1;for(;o>=r;r++)n=r===o?this:this.clone(!0),b(s[r])[t](n),p.apply(i,n.get());return this.pushStack(i)}}),b.extend({clone:function(e,t,n){var r,i,s,o,u,a=b.contains(e.ownerDocument,e);if(b.support.html5Clone||b.isXMLDoc(e)||!mt.test("<"+e.nodeName+">")?s=e.cloneNode(!0):(Ot.innerHTML=e.outerHTML,Ot.removeChild(s=Ot.firstChild)),!(b.support.noCloneEvent&&b.support.noCloneChecked||1!==e.nodeType&&11!==e.nodeType||b.isXMLDoc(e)))for(r=jt(s),u=jt(e),o=0;null!=(i=u[o]);++o)r[o]&&Bt(i,r[o]);if(t)if(n)for(u=u||jt(e),r=r||jt(s),o=0;null!=(i=u[o]);o++)Ht(i,r[o]);else Ht(e,s);return r=jt(s,"script"),r.length>0&&Pt(r,!a&&jt(e,"script")),r=u=i=null,s},buildFragment:function(e,t,n,r){var i,s,o,u,a,f,l,c=e.length,h=pt(t),p=[],d=0;for(;c>d;d++)if(s=e[d],s||0===s)if("object"===b.type(s))b.merge(p,s.nodeType?[s]:s);else if(Et.test(s)){u=u||h.appendChild(t.createElement("div")),a=(bt.exec(s)||["",""])[1].toLowerCase(),l=Lt[a]||Lt._default,u.innerHTML=l[1]+s.replace(yt,"<$1></$2>")+l[2],i=l[0];while(i--)u=u.lastChild;if(!b.support.leadingWhitespace&&gt.test(s)&&p.push(t.createTextNode(gt.exec(s)[0])),!b.support.tbody){s="table"!==a||wt.test(s)?"<table>"!==l[1]||wt.test(s)?0:u:u.firstChild,i=s&&s.childNodes.length;while(i--)b.nodeName(f=s.childNodes[i],"tbody")&&!f.childNodes.length&&s.removeChild(f)}b.merge(p,u.childNodes),u.textContent="";while(u.firstChild)u.removeChild(u.firstChild);u=h.lastChild}else p.push(t.createTextNode(s));u&&h.removeChild(u),b.support.appendChecked||b.grep(jt(p,"input"),Ft),d=0;while(s=p[d++])if((!r||-1===b.inArray(s,r))&&(o=b.contains(s.ownerDocument,s),u=jt(h.appendChild(s),"script"),o&&Pt(u),n)){i=0;while(s=u[i++])Nt.test(s.type||"")&&n.push(s)}return u=null,h},cleanData:function(e,t){var n,r,s,o,u=0,a=b.expando,f=b.cache,c=b.support.deleteExpando,h=b.event.special;for(;null!=(n=e[u]);u++)if((t||b.acceptData(n))&&(s=n[a],o=s&&f[s])){if(o.events)for(r in o.events)h[r]?b.event.remove(n,r):b.removeEvent(n,r,o.handle);f[s]&&(delete f[s],c?delete n[a]:typeof n.removeAttribute!==i?n.removeAttribute(a):n[a]=null,l.push(s))}}});var It,qt,Rt,Ut=/alpha\([^)]*\)/i,zt=/opacity\s*=\s*([^)]*)/,Wt=/^(top|right|bottom|left)$/,Xt=/^(none|table(?!-c[ea]).+)/,Vt=/^margin/,$t=RegExp("^("+w+")(.*)$","i"),Jt=RegExp("^("+w+")(?!px)[a-z%]+$","i"),Kt=RegExp("^([+-])=("+w+")","i"),Qt={BODY:"block"},Gt={position:"absolute",visibility:"hidden",display:"block"},Yt={letterSpacing:0,fontWeight:400},Zt=["Top","Right","Bottom","Left"],en=["Webkit","O","Moz","ms"];b.fn.extend({css:function(e,n){return b.access(this,function(e,n,r){var i,s,o={},u=0;if(b.isArray(n)){for(s=qt(e),i=n.length;i>u;u++)o[n[u]]=b.css(e,n[u],!1,s);return o}return r!==t?b.style(e,n,r):b.css(e,n)},e,n,arguments.length>1)},show:function(){return rn(this,!0)},hide:function(){return rn(this)},toggle:function(e){var t="boolean"==typeof e;return this.each(function(){(t?e:nn(this))?b(this).show():b(this).hide()})}}),b.extend({cssHooks:{opacity:{get:function(e,t){if(t){var n=Rt(e,"opacity");return""===n?"1":n}}}},cssNumber:{columnCount:!0,fillOpacity:!0,fontWeight:!0,lineHeight:!0,opacity:!0,orphans:!0,widows:!0,zIndex:!0,zoom:!0},cssProps:{"float":b.support.cssFloat?"cssFloat":"styleFloat"},style:function(e,n,r,i){if(e&&3!==e.nodeType&&8!==e.nodeType&&e.style){var s,o,u,a=b.camelCase(n),f=e.style;if(n=b.cssProps[a]||(b.cssProps[a]=tn(f,a)),u=b.cssHooks[n]||b.cssHooks[a],r===t)return u&&"get"in u&&(s=u.get(e,!1,i))!==t?s:f[n];if(o=typeof r,"string"===o&&(s=Kt.exec(r))&&(r=(s[1]+1)*s[2]+parseFloat(b.css(e,n)),o="number"),!(null==r||"number"===o&&isNaN(r)||("number"!==o||b.cssNumber[a]||(r+="px"),b.support.clearCloneStyle||""!==r||0!==n.indexOf("background")||(f[n]="inherit"),u&&"set"in u&&(r=u.set(e,r,i))===t)))try{f[n]=r}catch(l){}}},css:function(e,n,r,i){var s,o,u,a=b.camelCase(n);return n=b.cssProps[a]||(b.cssProps[a]=tn(e.style,a)),u=b.cssHooks[n]||b.cssHooks[a],u&&"get"in u&&(o=u.get(e,!0,r)),o===t&&(o=Rt(e,n,i)),"normal"===o&&n in Yt&&(o=Yt[n]),""===r||r?(s=parseFloat(o),r===!0||b.isNumeric(s)?s||0:o):o},swap:function(e,t,n,r){var i,s,o={};for(s in t)o[s]=e.style[s],e.style[s]=t[s];i=n.apply(e,r||[]);for(s in t)e.style[s]=o[s];return i}}),e.getComputedStyle?(qt=function(t){return e.getComputedStyle(t,null)},Rt=function(e,n,r){var i,s,o,u=r||qt(e),a=u?u.getPropertyValue(n)||u[n]:t,f=e.style;return u&&(""!==a||b.contains(e.ownerDocument,e)||(a=b.style(e,n)),Jt.test(a)&&Vt.test(n)&&(i=f.width,s=f.minWidth,o=f.maxWidth,f.minWidth=f.maxWidth=f.width=a,a=u.width,f.width=i,f.minWidth=s,f.maxWidth=o)),a}):s.documentElement.currentStyle&&(qt=function(e){return e.currentStyle},Rt=function(e,n,r){var i,s,o,u=r||qt(e),a=u?u[n]:t,f=e.style;return null==a&&f&&f[n]&&(a=f[n]),Jt.test(a)&&!Wt.test(n)&&(i=f.left,s=e.runtimeStyle,o=s&&s.left,o&&(s.left=e.currentStyle.left),f.left="fontSize"===n?"1em":a,a=f.pixelLeft+"px",f.left=i,o&&(s.left=o)),""===a?"auto":a}),b.each(["height","width"],function(e,n){b.cssHooks[n]={get:function(e,r,i){return r?0===e.offsetWidth&&Xt.test(b.css(e,"display"))?b.swap(e,Gt,function(){return un(e,n,i)}):un(e,n,i):t},set:function(e,t,r){var i=r&&qt(e);return sn(e,t,r?on(e,n,r,b.support.boxSizing&&"border-box"===b.css(e,"boxSizing",!1,i),i):0)}}}),b.support.opacity||(b.cssHooks.opacity={get:function(e,t){return zt.test((t&&e.currentStyle?e.currentStyle.filter:e.style.filter)||"")?.01*parseFloat(RegExp.$1)+"":t?"1":""},set:function(e,t){var n=e.style,r=e.currentStyle,i=b.isNumeric(t)?"alpha(opacity="+100*t+")":"",s=r&&r.filter||n.filter||"";n.zoom=1,(t>=1||""===t)&&""===b.trim(s.replace(Ut,""))&&n.removeAttribute&&(n.removeAttribute("filter"),""===t||r&&!r.filter)||(n.filter=Ut.test(s)?s.replace(Ut,i):s+" "+i)}}),b(function(){b.support.reliableMarginRight||(b.cssHooks.marginRight={get:function(e,n){return n?b.swap(e,{display:"inline-block"},Rt,[e,"marginRight"]):t}}),!b.support.pixelPosition&&b.fn.position&&b.each(["top","left"],function(e,n){b.cssHooks[n]={get:function(e,r){return r?(r=Rt(e,n),Jt.test(r)?b(e).position()[n]+"px":r):t}}})}),b.expr&&b.expr.filters&&(b.expr.filters.hidden=function(e){return 0>=e.offsetWidth&&0>=e.offsetHeight||!b.support.reliableHiddenOffsets&&"none"===(e.style&&e.style.display||b.css(e,"display"))},b.expr.filters.visible=function(e){return!b.expr.filters.hidden(e)}),b.each({margin:"",padding:"",border:"Width"},function(e,t){b.cssHooks[e+t]={expand:function(n){var r=0,i={},s="string"==typeof n?n.split(" "):[n];for(;4>r;r++)i[e+Zt[r]+t]=s[r]||s[r-2]||s[0];return i}},Vt.test(e)||(b.cssHooks[e+t].set=sn)});var ln=/%20/g,cn=/\[\]$/,hn=/\r?\n/g,pn=/^(?:submit|button|image|reset|file)$/i,dn=/^(?:input|select|textarea|keygen)/i;b.fn.extend({serialize:function(){return b.param(this.serializeArray())},serializeArray:function(){return this.map(function(){var e=b.prop(this,"elements");return e?b.makeArray(e):this}).filter(function(){var e=this.type;return this.name&&!b(this).is(":disabled")&&dn.test(this.nodeName)&&!pn.test(e)&&(this.checked||!xt.test(e))}).map(function(e,t){var n=b(this).val();return null==n?null:b.isArray(n)?b.map(n,function(e){return{name:t.name,value:e.replace(hn,"\r\n")}}):{name:t.name,value:n.replace(hn,"\r\n")}}).get()}}),b.param=function(e,n){var r,i=[],s=function(e,t){t=b.isFunction(t)?t():null==t?"":t,i[i.length]=encodeURIComponent(e)+"="+encodeURIComponent(t)};if(n===t&&(n=b.ajaxSettings&&b.ajaxSettings.traditional),b.isArray(e)||e.jquery&&!b.isPlainObject(e))b.each(e,function(){s(this.name,this.value)});else for(r in e)vn(r,e[r],n,s);return i.join("&").replace(ln,"+")},b.each("blur focus focusin focusout load resize scroll unload click dblclick mousedown mouseup mousemove mouseover mouseout mouseenter mouseleave change select submit keydown keypress keyup error contextmenu".split(" "),function(e,t){b.fn[t]=function(e,n){return arguments.length>0?this.on(t,null,e,n):this.trigger(t)}}),b.fn.hover=function(e,t){return this.mouseenter(e).mouseleave(t||e)};var mn,gn,yn=b.now(),bn=/\?/,wn=/#.*$/,En=/([?&])_=[^&]*/,Sn=/^(.*?):[ \t]*([^\r\n]*)\r?$/gm,xn=/^(?:about|app|app-storage|.+-extension|file|res|widget):$/,Tn=/^(?:GET|HEAD)$/,Nn=/^\/\//,Cn=/^([\w.+-]+:)(?:\/\/([^\/?#:]*)(?::(\d+)|)|)/,kn=b.fn.load,Ln={},An={},On="*/".concat("*");try{gn=o.href}catch(Mn){gn=s.createElement("a"),gn.href="",gn=gn.href}mn=Cn.exec(gn.toLowerCase())||[],b.fn.load=function(e,n,r){if("string"!=typeof e&&kn)return kn.apply(this,arguments);var i,s,o,u=this,a=e.indexOf(" ");return a>=0&&(i=e.slice(a,e.length),e=e.slice(0,a)),b.isFunction(n)?(r=n,n=t):n&&"object"==typeof n&&(o="POST"),u.length>0&&b.ajax({url:e,type:o,dataType:"html",data:n}).done(function(e){s=arguments,u.html(i?b("<div>").append(b.parseHTML(e)).find(i):e)}).complete(r&&function(e,t){u.each(r,s||[e.responseText,t,e])}),this},b.each(["ajaxStart","ajaxStop","ajaxComplete","ajaxError","ajaxSuccess","ajaxSend"],function(e,t){b.fn[t]=function(e){return this.on(t,e)}}),b.each(["get","post"],function(e,n){b[n]=function(e,r,i,s){return b.isFunction(r)&&(s=s||i,i=r,r=t),b.ajax({url:e,type:n,dataType:s,data:r,success:i})}}),b.extend({active:0,lastModified:{},etag:{},ajaxSettings:{url:gn,type:"GET",isLocal:xn.test(mn[1]),global:!0,processData:!0,async:!0,contentType:"application/x-www-form-urlencoded; charset=UTF-8",accepts:{"*":On,text:"text/plain",html:"text/html",xml:"application/xml, text/xml",json:"application/json, text/javascript"},contents:{xml:/xml/,html:/html/,json:/json/},responseFields:{xml:"responseXML",text:"responseText"},converters:{"* text":e.String,"text html":!0,"text json":b.parseJSON,"text xml":b.parseXML},flatOptions:{url:!0,context:!0}},ajaxSetup:function(e,t){return t?Pn(Pn(e,b.ajaxSettings),t):Pn(b.ajaxSettings,e)},ajaxPrefilter:_n(Ln),ajaxTransport:_n(An),ajax:function(e,n){function N(e,n,r,i){var l,g,y,E,S,T=n;2!==w&&(w=2,u&&clearTimeout(u),f=t,o=i||"",x.readyState=e>0?4:0,r&&(E=Hn(c,x,r)),e>=200&&300>e||304===e?(c.ifModified&&(S=x.getResponseHeader("Last-Modified"),S&&(b.lastModified[s]=S),S=x.getResponseHeader("etag"),S&&(b.etag[s]=S)),204===e?(l=!0,T="nocontent"):304===e?(l=!0,T="notmodified"):(l=Bn(c,E),T=l.state,g=l.data,y=l.error,l=!y)):(y=T,(e||!T)&&(T="error",0>e&&(e=0))),x.status=e,x.statusText=(n||T)+"",l?d.resolveWith(h,[g,T,x]):d.rejectWith(h,[x,T,y]),x.statusCode(m),m=t,a&&p.trigger(l?"ajaxSuccess":"ajaxError",[x,c,l?g:y]),v.fireWith(h,[x,T]),a&&(p.trigger("ajaxComplete",[x,c]),--b.active||b.event.trigger("ajaxStop")))}"object"==typeof e&&(n=e,e=t),n=n||{};var r,i,s,o,u,a,f,l,c=b.ajaxSetup({},n),h=c.context||c,p=c.context&&(h.nodeType||h.jquery)?b(h):b.event,d=b.Deferred(),v=b.Callbacks("once memory"),m=c.statusCode||{},g={},y={},w=0,S="canceled",x={readyState:0,getResponseHeader:function(e){var t;if(2===w){if(!l){l={};while(t=Sn.exec(o))l[t[1].toLowerCase()]=t[2]}t=l[e.toLowerCase()]}return null==t?null:t},getAllResponseHeaders:function(){return 2===w?o:null},setRequestHeader:function(e,t){var n=e.toLowerCase();return w||(e=y[n]=y[n]||e,g[e]=t),this},overrideMimeType:function(e){return w||(c.mimeType=e),this},statusCode:function(e){var t;if(e)if(2>w)for(t in e)m[t]=[m[t],e[t]];else x.always(e[x.status]);return this},abort:function(e){var t=e||S;return f&&f.abort(t),N(0,t),this}};if(d.promise(x).complete=v.add,x.success=x.done,x.error=x.fail,c.url=((e||c.url||gn)+"").replace(wn,"").replace(Nn,mn[1]+"//"),c.type=n.method||n.type||c.method||c.type,c.dataTypes=b.trim(c.dataType||"*").toLowerCase().match(E)||[""],null==c.crossDomain&&(r=Cn.exec(c.url.toLowerCase()),c.crossDomain=!(!r||r[1]===mn[1]&&r[2]===mn[2]&&(r[3]||("http:"===r[1]?80:443))==(mn[3]||("http:"===mn[1]?80:443)))),c.data&&c.processData&&"string"!=typeof c.data&&(c.data=b.param(c.data,c.traditional)),Dn(Ln,c,n,x),2===w)return x;a=c.global,a&&0===b.active++&&b.event.trigger("ajaxStart"),c.type=c.type.toUpperCase(),c.hasContent=!Tn.test(c.type),s=c.url,c.hasContent||(c.data&&(s=c.url+=(bn.test(s)?"&":"?")+c.data,delete c.data),c.cache===!1&&(c.url=En.test(s)?s.replace(En,"$1_="+yn++):s+(bn.test(s)?"&":"?")+"_="+yn++)),c.ifModified&&(b.lastModified[s]&&x.setRequestHeader("If-Modified-Since",b.lastModified[s]),b.etag[s]&&x.setRequestHeader("If-None-Match",b.etag[s])),(c.data&&c.hasContent&&c.contentType!==!1||n.contentType)&&x.setRequestHeader("Content-Type",c.contentType),x.setRequestHeader("Accept",c.dataTypes[0]&&c.accepts[c.dataTypes[0]]?c.accepts[c.dataTypes[0]]+("*"!==c.dataTypes[0]?", "+On+"; q=0.01":""):c.accepts["*"]);for(i in c.headers)x.setRequestHeader(i,c.headers[i]);if(!c.beforeSend||c.beforeSend.call(h,x,c)!==!1&&2!==w){S="abort";for(i in{success:1,error:1,complete:1})x[i](c[i]);if(f=Dn(An,c,n,x)){x.readyState=1,a&&p.trigger("ajaxSend",[x,c]),c.async&&c.timeout>0&&(u=setTimeout(function(){x.abort("timeout")},c.timeout));try{w=1,f.send(g,N)}catch(T){if(!(2>w))throw T;N(-1,T)}}else N(-1,"No Transport");return x}return x.abort()},getScript:function(e,n){return b.get(e,t,n,"script")},getJSON:function(e,t,n){return b.get(e,t,n,"json")}}),b.ajaxSetup({accepts:{script:"text/javascript, application/javascript, application/ecmascript, application/x-ecmascript"},contents:{script:/(?:java|ecma)script/},converters:{"text script":function(e){return b.globalEval(e),e}}}),b.ajaxPrefilter("script",function(e){e.cache===t&&(e.cache=!1),e.crossDomain&&(e.type="GET",e.global=!1)}),b.ajaxTransport("script",function(e){if(e.crossDomain){var n,r=s.head||b("head")[0]||s.documentElement;return{send:function(t,i){n=s.createElement("script"),n.async=!0,e.scriptCharset&&(n.charset=e.scriptCharset),n.src=e.url,n.onload=n.onreadystatechange=function(e,t){(t||!n.readyState||/loaded|complete/.test(n.readyState))&&(n.onload=n.onreadystatechange=null,n.parentNode&&n.parentNode.removeChild(n),n=null,t||i(200,"success"))},r.insertBefore(n,r.firstChild)},abort:function(){n&&n.onload(t,!0)}}}});var jn=[],Fn=/(=)\?(?=&|$)|\?\?/;b.ajaxSetup({jsonp:"callback",jsonpCallback:function(){var e=jn.pop()||b.expando+"_"+yn++;return this[e]=!0,e}}),b.ajaxPrefilter("json jsonp",function(n,r,i){var s,o,u,a=n.jsonp!==!1&&(Fn.test(n.url)?"url":"string"==typeof n.data&&!(n.contentType||"").indexOf("application/x-www-form-urlencoded")&&Fn.test(n.data)&&"data");return a||"jsonp"===n.dataTypes[0]?(s=n.jsonpCallback=b.isFunction(n.jsonpCallback)?n.jsonpCallback():n.jsonpCallback,a?n[a]=n[a].replace(Fn,"$1"+s):n.jsonp!==!1&&(n.url+=(bn.test(n.url)?"&":"?")+n.jsonp+"="+s),n.converters["script json"]=function(){return u||b.error(s+" was not called"),u[0]},n.dataTypes[0]="json",o=e[s],e[s]=function(){u=arguments},i.always(function(){e[s]=o,n[s]&&(n.jsonpCallback=r.jsonpCallback,jn.push(s)),u&&b.isFunction(o)&&o(u[0]),u=o=t}),"script"):t});var In,qn,Rn=0,Un=e.ActiveXObject&&function(){var e;for(e in In)In[e](t,!0)};b.ajaxSettings.xhr=e.ActiveXObject?function(){return!this.isLocal&&zn()||Wn()}:zn,qn=b.ajaxSettings.xhr(),b.support.cors=!!qn&&"withCredentials"in qn,qn=b.support.ajax=!!qn,qn&&b.ajaxTransport(function(n){if(!n.crossDomain||b.support.cors){var r;return{send:function(i,s){var o,u,a=n.xhr();if(n.username?a.open(n.type,n.url,n.async,n.username,n.password):a.open(n.type,n.url,n.async),n.xhrFields)for(u in n.xhrFields)a[u]=n.xhrFields[u];n.mimeType&&a.overrideMimeType&&a.overrideMimeType(n.mimeType),n.crossDomain||i["X-Requested-With"]||(i["X-Requested-With"]="XMLHttpRequest");try{for(u in i)a.setRequestHeader(u,i[u])}catch(f){}a.send(n.hasContent&&n.data||null),r=function(e,i){var u,f,l,c;try{if(r&&(i||4===a.readyState))if(r=t,o&&(a.onreadystatechange=b.noop,Un&&delete In[o]),i)4!==a.readyState&&a.abort();else{c={},u=a.status,f=a.getAllResponseHeaders(),"string"==typeof a.responseText&&(c.text=a.responseText);try{l=a.statusText}catch(h){l=""}u||!n.isLocal||n.crossDomain?1223===u&&(u=204):u=c.text?200:404}}catch(p){i||s(-1,p)}c&&s(u,l,c,f)},n.async?4===a.readyState?setTimeout(r):(o=++Rn,Un&&(In||(In={},b(e).unload(Un)),In[o]=r),a.onreadystatechange=r):r()},abort:function(){r&&r(t,!0)}}}});var Xn,Vn,$n=/^(?:toggle|show|hide)$/,Jn=RegExp("^(?:([+-])=|)("+w+")([a-z%]*)$","i"),Kn=/queueHooks$/,Qn=[nr],Gn={"*":[function(e,t){var n,r,i=this.createTween(e,t),s=Jn.exec(t),o=i.cur(),u=+o||0,a=1,f=20;if(s){if(n=+s[2],r=s[3]||(b.cssNumber[e]?"":"px"),"px"!==r&&u){u=b.css(i.elem,e,!0)||n||1;do a=a||".5",u/=a,b.style(i.elem,e,u+r);while(a!==(a=i.cur()/o)&&1!==a&&--f)}i.unit=r,i.start=u,i.end=s[1]?u+(s[1]+1)*n:n}return i}]};b.Animation=b.extend(er,{tweener:function(e,t){b.isFunction(e)?(t=e,e=["*"]):e=e.split(" ");var n,r=0,i=e.length;for(;i>r;r++)n=e[r],Gn[n]=Gn[n]||[],Gn[n].unshift(t)},prefilter:function(e,t){t?Qn.unshift(e):Qn.push(e)}}),b.Tween=rr,rr.prototype={constructor:rr,init:function(e,t,n,r,i,s){this.elem=e,this.prop=n,this.easing=i||"swing",this.options=t,this.start=this.now=this.cur(),this.end=r,this.unit=s||(b.cssNumber[n]?"":"px")},cur:function(){var e=rr.propHooks[this.prop];return e&&e.get?e.get(this):rr.propHooks._default.get(this)},run:function(e){var t,n=rr.propHooks[this.prop];return this.pos=t=this.options.duration?b.easing[this.easing](e,this.options.duration*e,0,1,this.options.duration):e,this.now=(this.end-this.start)*t+this.start,this.options.step&&this.options.step.call(this.elem,this.now,this),n&&n.set?n.set(this):rr.propHooks._default.set(this),this}},rr.prototype.init.prototype=rr.prototype,rr.propHooks={_default:{get:function(e){var t;return null==e.elem[e.prop]||e.elem.style&&null!=e.elem.style[e.prop]?(t=b.css(e.elem,e.prop,""),t&&"auto"!==t?t:0):e.elem[e.prop]},set:function(e){b.fx.step[e.prop]?b.fx.step[e.prop](e):e.elem.style&&(null!=e.elem.style[b.cssProps[e.prop]]||b.cssHooks[e.prop])?b.style(e.elem,e.prop,e.now+e.unit):e.elem[e.prop]=e.now}}},rr.propHooks.scrollTop=rr.propHooks.scrollLeft={set:function(e){e.elem.nodeType&&e.elem.parentNode&&(e.elem[e.prop]=e.now)}},b.each(["toggle","show","hide"],function(e,t){var n=b.fn[t];b.fn[t]=function(e,r,i){return null==e||"boolean"==typeof e?n.apply(this,arguments):this.animate(ir(t,!0),e,r,i)}}),b.fn.extend({fadeTo:function(e,t,n,r){return this.filter(nn).css("opacity",0).show().end().animate({opacity:t},e,n,r)},animate:function(e,t,n,r){var i=b.isEmptyObject(e),s=b.speed(t,n,r),o=function(){var t=er(this,b.extend({},e),s);o.finish=function(){t.stop(!0)},(i||b._data(this,"finish"))&&t.stop(!0)};return o.finish=o,i||s.queue===!1?this.each(o):this.queue(s.queue,o)},stop:function(e,n,r){var i=function(e){var t=e.stop;delete e.stop,t(r)};return"string"!=typeof e&&(r=n,n=e,e=t),n&&e!==!1&&this.queue(e||"fx",[]),this.each(function(){var t=!0,n=null!=e&&e+"queueHooks",s=b.timers,o=b._data(this);if(n)o[n]&&o[n].stop&&i(o[n]);else for(n in o)o[n]&&o[n].stop&&Kn.test(n)&&i(o[n]);for(n=s.length;n--;)s[n].elem!==this||null!=e&&s[n].queue!==e||(s[n].anim.stop(r),t=!1,s.splice(n,1));(t||!r)&&b.dequeue(this,e)})},finish:function(e){return e!==!1&&(e=e||"fx"),this.each(function(){var t,n=b._data(this),r=n[e+"queue"],i=n[e+"queueHooks"],s=b.timers,o=r?r.length:0;for(n.finish=!0,b.queue(this,e,[]),i&&i.cur&&i.cur.finish&&i.cur.finish.call(this),t=s.length;t--;)s[t].elem===this&&s[t].queue===e&&(s[t].anim.stop(!0),s.splice(t,1));for(t=0;o>t;t++)r[t]&&r[t].finish&&r[t].finish.call(this);delete n.finish})}}),b.each({slideDown:ir("show"),slideUp:ir("hide"),slideToggle:ir("toggle"),fadeIn:{opacity:"show"},fadeOut:{opacity:"hide"},fadeToggle:{opacity:"toggle"}},function(e,t){b.fn[e]=function(e,n,r){return this.animate(t,e,n,r)}}),b.speed=function(e,t,n){var r=e&&"object"==typeof e?b.extend({},e):{complete:n||!n&&t||b.isFunction(e)&&e,duration:e,easing:n&&t||t&&!b.isFunction(t)&&t};return r.duration=b.fx.off?0:"number"==typeof r.duration?r.duration:r.duration in b.fx.speeds?b.fx.speeds[r.duration]:b.fx.speeds._default,(null==r.queue||r.queue===!0)&&(r.queue="fx"),r.old=r.complete,r.complete=function(){b.isFunction(r.old)&&r.old.call(this),r.queue&&b.dequeue(this,r.queue)},r},b.easing={linear:function(e){return e},swing:function(e){return.5-Math.cos(e*Math.PI)/2}},b.timers=[],b.fx=rr.prototype.init,b.fx.tick=function(){var e,n=b.timers,r=0;for(Xn=b.now();n.length>r;r++)e=n[r],e()||n[r]!==e||n.splice(r--,1);n.length||b.fx.stop(),Xn=t},b.fx.timer=function(e){e()&&b.timers.push(e)&&b.fx.start()},b.fx.interval=13,b.fx.start=function(){Vn||(Vn=setInterval(b.fx.tick,b.fx.interval))},b.fx.stop=function(){clearInterval(Vn),Vn=null},b.fx.speeds={slow:600,fast:200,_default:400},b.fx.step={},b.expr&&b.expr.filters&&(b.expr.filters.animated=function(e){return b.grep(b.timers,function(t){return e===t.elem}).length}),b.fn.offset=function(e){if(arguments.length)return e===t?this:this.each(function(t){b.offset.setOffset(this,e,t)});var n,r,s={top:0,left:0},o=this[0],u=o&&o.ownerDocument;if(u)return n=u.documentElement,b.contains(n,o)?(typeof o.getBoundingClientRect!==i&&(s=o.getBoundingClientRect()),r=sr(u),{top:s.top+(r.pageYOffset||n.scrollTop)-(n.clientTop||0),left:s.left+(r.pageXOffset||n.scrollLeft)-(n.clientLeft||0)}):s},b.offset={setOffset:function(e,t,n){var r=b.css(e,"position");"static"===r&&(e.style.position="relative");var i=b(e),s=i.offset(),o=b.css(e,"top"),u=b.css(e,"left"),a=("absolute"===r||"fixed"===r)&&b.inArray("auto",[o,u])>-1,f={},l={},c,h;a?(l=i.position(),c=l.top,h=l.left):(c=parseFloat(o)||0,h=parseFloat(u)||0),b.isFunction(t)&&(t=t.call(e,n,s)),null!=t.top&&(f.top=t.top-s.top+c),null!=t.left&&(f.left=t.left-s.left+h),"using"in t?t.using.call(e,f):i.css(f)}},b.fn.extend({position:function(){if(this[0]){var e,t,n={top:0,left:0},r=this[0];return"fixed"===b.css(r,"position")?t=r.getBoundingClientRect():(e=this.offsetParent(),t=this.offset(),b.nodeName(e[0],"html")||(n=e.offset()),n.top+=b.css(e[0],"borderTopWidth",!0),n.left+=b.css(e[0],"borderLeftWidth",!0)),{top:t.top-n.top-b.css(r,"marginTop",!0),left:t.left-n.left-b.css(r,"marginLeft",!0)}}},offsetParent:function(){return this.map(function(){var e=this.offsetParent||s.documentElement;while(e&&!b.nodeName(e,"html")&&"static"===b.css(e,"position"))e=e.offsetParent;return e||s.documentElement})}}),b.each({scrollLeft:"pageXOffset",scrollTop:"pageYOffset"},function(e,n){var r=/Y/.test(n);b.fn[e]=function(i){return b.access(this,function(e,i,s){var o=sr(e);return s===t?o?n in o?o[n]:o.document.documentElement[i]:e[i]:(o?o.scrollTo(r?b(o).scrollLeft():s,r?s:b(o).scrollTop()):e[i]=s,t)},e,i,arguments.length,null)}}),b.each({Height:"height",Width:"width"},function(e,n){b.each({padding:"inner"+e,content:n,"":"outer"+e},function(r,i){b.fn[i]=function(i,s){var o=arguments.length&&(r||"boolean"!=typeof i),u=r||(i===!0||s===!0?"margin":"border");return b.access(this,function(n,r,i){var s;return b.isWindow(n)?n.document.documentElement["client"+e]:9===n.nodeType?(s=n.documentElement,Math.max(n.body["scroll"+e],s["scroll"+e],n.body["offset"+e],s["offset"+e],s["client"+e])):i===t?b.css(n,r,u):b.style(n,r,i,u)},n,o?i:t,o,null)}})}),e.jQuery=e.$=b,"function"==typeof define&&define.amd&&define.amd.jQuery&&define("jquery",[],function(){return b})})(window),!function(e){e(function(){e.support.transition=function(){var e=function(){var e=document.createElement("bootstrap"),t={WebkitTransition:"webkitTransitionEnd",MozTransition:"transitionend",OTransition:"oTransitionEnd otransitionend",transition:"transitionend"},n;for(n in t)if(e.style[n]!==undefined)return t[n]}();return e&&{end:e}}()})}(window.jQuery),!function(e){var t='[data-dismiss="alert"]',n=function(n){e(n).on("click",t,this.close)};n.prototype.close=function(t){function s(){i.trigger("closed").remove()}var n=e(this),r=n.attr("data-target"),i;r||(r=n.attr("href"),r=r&&r.replace(/.*(?=#[^\s]*$)/,"")),i=e(r),t&&t.preventDefault(),i.length||(i=n.hasClass("alert")?n:n.parent()),i.trigger(t=e.Event("close"));if(t.isDefaultPrevented())return;i.removeClass("in"),e.support.transition&&i.hasClass("fade")?i.on(e.support.transition.end,s):s()},e.fn.alert=function(t){return this.each(function(){var r=e(this),i=r.data("alert");i||r.data("alert",i=new n(this)),typeof t=="string"&&i[t].call(r)})},e.fn.alert.Constructor=n,e(document).on("click.alert.data-api",t,n.prototype.close)}(window.jQuery),!function(e){var t=function(t,n){this.$element=e(t),this.options=e.extend({},e.fn.button.defaults,n)};t.prototype.setState=function(e){var t="disabled",n=this.$element,r=n.data(),i=n.is("input")?"val":"html";e+="Text",r.resetText||n.data("resetText",n[i]()),n[i](r[e]||this.options[e]),setTimeout(function(){e=="loadingText"?n.addClass(t).attr(t,t):n.removeClass(t).removeAttr(t)},0)},t.prototype.toggle=function(){var e=this.$element.closest('[data-toggle="buttons-radio"]');e&&e.find(".active").removeClass("active"),this.$element.toggleClass("active")},e.fn.button=function(n){return this.each(function(){var r=e(this),i=r.data("button"),s=typeof n=="object"&&n;i||r.data("button",i=new t(this,s)),n=="toggle"?i.toggle():n&&i.setState(n)})},e.fn.button.defaults={loadingText:"loading..."},e.fn.button.Constructor=t,e(document).on("click.button.data-api","[data-toggle^=button]",function(t){var n=e(t.target);n.hasClass("btn")||(n=n.closest(".btn")),n.button("toggle")})}(window.jQuery),!function(e){var t=function(t,n){this.$element=e(t),this.options=n,this.options.slide&&this.slide(this.options.slide),this.options.pause=="hover"&&this.$element.on("mouseenter",e.proxy(this.pause,this)).on("mouseleave",e.proxy(this.cycle,this))};t.prototype={cycle:function(t){return t||(this.paused=!1),this.options.interval&&!this.paused&&(this.interval=setInterval(e.proxy(this.next,this),this.options.interval)),this},to:function(t){var n=this.$element.find(".item.active"),r=n.parent().children(),i=r.index(n),s=this;if(t>r.length-1||t<0)return;return this.sliding?this.$element.one("slid",function(){s.to(t)}):i==t?this.pause().cycle():this.slide(t>i?"next":"prev",e(r[t]))},pause:function(t){return t||(this.paused=!0),this.$element.find(".next, .prev").length&&e.support.transition.end&&(this.$element.trigger(e.support.transition.end),this.cycle()),clearInterval(this.interval),this.interval=null,this},next:function(){if(this.sliding)return;return this.slide("next")},prev:function(){if(this.sliding)return;return this.slide("prev")},slide:function(t,n){var r=this.$element.find(".item.active"),i=n||r[t](),s=this.interval,o=t=="next"?"left":"right",u=t=="next"?"first":"last",a=this,f;this.sliding=!0,s&&this.pause(),i=i.length?i:this.$element.find(".item")[u](),f=e.Event("slide",{relatedTarget:i[0]});if(i.hasClass("active"))return;if(e.support.transition&&this.$element.hasClass("slide")){this.$element.trigger(f);if(f.isDefaultPrevented())return;i.addClass(t),i[0].offsetWidth,r.addClass(o),i.addClass(o),this.$element.one(e.support.transition.end,function(){i.removeClass([t,o].join(" ")).addClass("active"),r.removeClass(["active",o].join(" ")),a.sliding=!1,setTimeout(function(){a.$element.trigger("slid")},0)})}else{this.$element.trigger(f);if(f.isDefaultPrevented())return;r.removeClass("active"),i.addClass("active"),this.sliding=!1,this.$element.trigger("slid")}return s&&this.cycle(),this}},e.fn.carousel=function(n){return this.each(function(){var r=e(this),i=r.data("carousel"),s=e.extend({},e.fn.carousel.defaults,typeof n=="object"&&n),o=typeof n=="string"?n:s.slide;i||r.data("carousel",i=new t(this,s)),typeof n=="number"?i.to(n):o?i[o]():s.interval&&i.cycle()})},e.fn.carousel.defaults={interval:5e3,pause:"hover"},e.fn.carousel.Constructor=t,e(document).on("click.carousel.data-api","[data-slide]",function(t){var n=e(this),r,i=e(n.attr("data-target")||(r=n.attr("href"))&&r.replace(/.*(?=#[^\s]+$)/,"")),s=e.extend({},i.data(),n.data());i.carousel(s),t.preventDefault()})}(window.jQuery),!function(e){var t=function(t,n){this.$element=e(t),this.options=e.extend({},e.fn.collapse.defaults,n),this.options.parent&&(this.$parent=e(this.options.parent)),this.options.toggle&&this.toggle()};t.prototype={constructor:t,dimension:function(){var e=this.$element.hasClass("width");return e?"width":"height"},show:function(){var t,n,r,i;if(this.transitioning)return;t=this.dimension(),n=e.camelCase(["scroll",t].join("-")),r=this.$parent&&this.$parent.find("> .accordion-group > .in");if(r&&r.length){i=r.data("collapse");if(i&&i.transitioning)return;r.collapse("hide"),i||r.data("collapse",null)}this.$element[t](0),this.transition("addClass",e.Event("show"),"shown"),e.support.transition&&this.$element[t](this.$element[0][n])},hide:function(){var t;if(this.transitioning)return;t=this.dimension(),this.reset(this.$element[t]()),this.transition("removeClass",e.Event("hide"),"hidden"),this.$element[t](0)},reset:function(e){var t=this.dimension();return this.$element.removeClass("collapse")[t](e||"auto")[0].offsetWidth,this.$element[e!==null?"addClass":"removeClass"]("collapse"),this},transition:function(t,n,r){var i=this,s=function(){n.type=="show"&&i.reset(),i.transitioning=0,i.$element.trigger(r)};this.$element.trigger(n);if(n.isDefaultPrevented())return;this.transitioning=1,this.$element[t]("in"),e.support.transition&&this.$element.hasClass("collapse")?this.$element.one(e.support.transition.end,s):s()},toggle:function(){this[this.$element.hasClass("in")?"hide":"show"]()}},e.fn.collapse=function(n){return this.each(function(){var r=e(this),i=r.data("collapse"),s=typeof n=="object"&&n;i||r.data("collapse",i=new t(this,s)),typeof n=="string"&&i[n]()})},e.fn.collapse.defaults={toggle:!0},e.fn.collapse.Constructor=t,e(document).on("click.collapse.data-api","[data-toggle=collapse]",function(t){var n=e(this),r,i=n.attr("data-target")||t.preventDefault()||(r=n.attr("href"))&&r.replace(/.*(?=#[^\s]+$)/,""),s=e(i).data("collapse")?"toggle":n.data();n[e(i).hasClass("in")?"addClass":"removeClass"]("collapsed"),e(i).collapse(s)})}(window.jQuery),!function(e){function r(){e(t).each(function(){i(e(this)).removeClass("open")})}function i(t){var n=t.attr("data-target"),r;return n||(n=t.attr("href"),n=n&&/#/.test(n)&&n.replace(/.*(?=#[^\s]*$)/,"")),r=e(n),r.length||(r=t.parent()),r}var t="[data-toggle=dropdown]",n=function(t){var n=e(t).on("click.dropdown.data-api",this.toggle);e("html").on("click.dropdown.data-api",function(){n.parent().removeClass("open")})};n.prototype={constructor:n,toggle:function(t){var n=e(this),s,o;if(n.is(".disabled, :disabled"))return;return s=i(n),o=s.hasClass("open"),r(),o||(s.toggleClass("open"),n.focus()),!1},keydown:function(t){var n,r,s,o,u,a;if(!/(38|40|27)/.test(t.keyCode))return;n=e(this),t.preventDefault(),t.stopPropagation();if(n.is(".disabled, :disabled"))return;o=i(n),u=o.hasClass("open");if(!u||u&&t.keyCode==27)return n.click();r=e("[role=menu] li:not(.divider) a",o);if(!r.length)return;a=r.index(r.filter(":focus")),t.keyCode==38&&a>0&&a--,t.keyCode==40&&a<r.length-1&&a++,~a||(a=0),r.eq(a).focus()}},e.fn.dropdown=function(t){return this.each(function(){var r=e(this),i=r.data("dropdown");i||r.data("dropdown",i=new n(this)),typeof t=="string"&&i[t].call(r)})},e.fn.dropdown.Constructor=n,e(document).on("click.dropdown.data-api touchstart.dropdown.data-api",r).on("click.dropdown touchstart.dropdown.data-api",".dropdown form",function(e){e.stopPropagation()}).on("click.dropdown.data-api touchstart.dropdown.data-api",t,n.prototype.toggle).on("keydown.dropdown.data-api touchstart.dropdown.data-api",t+", [role=menu]",n.prototype.keydown)}(window.jQuery),!function(e){var t=function(t,n){this.options=n,this.$element=e(t).delegate('[data-dismiss="modal"]',"click.dismiss.modal",e.proxy(this.hide,this)),this.options.remote&&this.$element.find(".modal-body").load(this.options.remote)};t.prototype={constructor:t,toggle:function(){return this[this.isShown?"hide":"show"]()},show:function(){var t=this,n=e.Event("show");this.$element.trigger(n);if(this.isShown||n.isDefaultPrevented())return;this.isShown=!0,this.escape(),this.backdrop(function(){var n=e.support.transition&&t.$element.hasClass("fade");t.$element.parent().length||t.$element.appendTo(document.body),t.$element.show(),n&&t.$element[0].offsetWidth,t.$element.addClass("in").attr("aria-hidden",!1),t.enforceFocus(),n?t.$element.one(e.support.transition.end,function(){t.$element.focus().trigger("shown")}):t.$element.focus().trigger("shown")})},hide:function(t){t&&t.preventDefault();var n=this;t=e.Event("hide"),this.$element.trigger(t);if(!this.isShown||t.isDefaultPrevented())return;this.isShown=!1,this.escape(),e(document).off("focusin.modal"),this.$element.removeClass("in").attr("aria-hidden",!0),e.support.transition&&this.$element.hasClass("fade")?this.hideWithTransition():this.hideModal()},enforceFocus:function(){var t=this;e(document).on("focusin.modal",function(e){t.$element[0]!==e.target&&!t.$element.has(e.target).length&&t.$element.focus()})},escape:function(){var e=this;this.isShown&&this.options.keyboard?this.$element.on("keyup.dismiss.modal",function(t){t.which==27&&e.hide()}):this.isShown||this.$element.off("keyup.dismiss.modal")},hideWithTransition:function(){var t=this,n=setTimeout(function(){t.$element.off(e.support.transition.end),t.hideModal()},500);this.$element.one(e.support.transition.end,function(){clearTimeout(n),t.hideModal()})},hideModal:function(e){this.$element.hide().trigger("hidden"),this.backdrop()},removeBackdrop:function(){this.$backdrop.remove(),this.$backdrop=null},backdrop:function(t){var n=this,r=this.$element.hasClass("fade")?"fade":"";if(this.isShown&&this.options.backdrop){var i=e.support.transition&&r;this.$backdrop=e('<div class="modal-backdrop '+r+'" />').appendTo(document.body),this.$backdrop.click(this.options.backdrop=="static"?e.proxy(this.$element[0].focus,this.$element[0]):e.proxy(this.hide,this)),i&&this.$backdrop[0].offsetWidth,this.$backdrop.addClass("in"),i?this.$backdrop.one(e.support.transition.end,t):t()}else!this.isShown&&this.$backdrop?(this.$backdrop.removeClass("in"),e.support.transition&&this.$element.hasClass("fade")?this.$backdrop.one(e.support.transition.end,e.proxy(this.removeBackdrop,this)):this.removeBackdrop()):t&&t()}},e.fn.modal=function(n){return this.each(function(){var r=e(this),i=r.data("modal"),s=e.extend({},e.fn.modal.defaults,r.data(),typeof n=="object"&&n);i||r.data("modal",i=new t(this,s)),typeof n=="string"?i[n]():s.show&&i.show()})},e.fn.modal.defaults={backdrop:!0,keyboard:!0,show:!0},e.fn.modal.Constructor=t,e(document).on("click.modal.data-api",'[data-toggle="modal"]',function(t){var n=e(this),r=n.attr("href"),i=e(n.attr("data-target")||r&&r.replace(/.*(?=#[^\s]+$)/,"")),s=i.data("modal")?"toggle":e.extend({remote:!/#/.test(r)&&r},i.data(),n.data());t.preventDefault(),i.modal(s).one("hide",function(){n.focus()})})}(window.jQuery),!function(e){var t=function(e,t){this.init("tooltip",e,t)};t.prototype={constructor:t,init:function(t,n,r){var i,s;this.type=t,this.$element=e(n),this.options=this.getOptions(r),this.enabled=!0,this.options.trigger=="click"?this.$element.on("click."+this.type,this.options.selector,e.proxy(this.toggle,this)):this.options.trigger!="manual"&&(i=this.options.trigger=="hover"?"mouseenter":"focus",s=this.options.trigger=="hover"?"mouseleave":"blur",this.$element.on(i+"."+this.type,this.options.selector,e.proxy(this.enter,this)),this.$element.on(s+"."+this.type,this.options.selector,e.proxy(this.leave,this))),this.options.selector?this._options=e.extend({},this.options,{trigger:"manual",selector:""}):this.fixTitle()},getOptions:function(t){return t=e.extend({},e.fn[this.type].defaults,t,this.$element.data()),t.delay&&typeof t.delay=="number"&&(t.delay={show:t.delay,hide:t.delay}),t},enter:function(t){var n=e(t.currentTarget)[this.type](this._options).data(this.type);if(!n.options.delay||!n.options.delay.show)return n.show();clearTimeout(this.timeout),n.hoverState="in",this.timeout=setTimeout(function(){n.hoverState=="in"&&n.show()},n.options.delay.show)},leave:function(t){var n=e(t.currentTarget)[this.type](this._options).data(this.type);this.timeout&&clearTimeout(this.timeout);if(!n.options.delay||!n.options.delay.hide)return n.hide();n.hoverState="out",this.timeout=setTimeout(function(){n.hoverState=="out"&&n.hide()},n.options.delay.hide)},show:function(){var e,t,n,r,i,s,o;if(this.hasContent()&&this.enabled){e=this.tip(),this.setContent(),this.options.animation&&e.addClass("fade"),s=typeof this.options.placement=="function"?this.options.placement.call(this,e[0],this.$element[0]):this.options.placement,t=/in/.test(s),e.detach().css({top:0,left:0,display:"block"}).insertAfter(this.$element),n=this.getPosition(t),r=e[0].offsetWidth,i=e[0].offsetHeight;switch(t?s.split(" ")[1]:s){case"bottom":o={top:n.top+n.height,left:n.left+n.width/2-r/2};break;case"top":o={top:n.top-i,left:n.left+n.width/2-r/2};break;case"left":o={top:n.top+n.height/2-i/2,left:n.left-r};break;case"right":o={top:n.top+n.height/2-i/2,left:n.left+n.width}}e.offset(o).addClass(s).addClass("in")}},setContent:function(){var e=this.tip(),t=this.getTitle();e.find(".tooltip-inner")[this.options.html?"html":"text"](t),e.removeClass("fade in top bottom left right")},hide:function(){function r(){var t=setTimeout(function(){n.off(e.support.transition.end).detach()},500);n.one(e.support.transition.end,function(){clearTimeout(t),n.detach()})}var t=this,n=this.tip();return n.removeClass("in"),e.support.transition&&this.$tip.hasClass("fade")?r():n.detach(),this},fixTitle:function(){var e=this.$element;(e.attr("title")||typeof e.attr("data-original-title")!="string")&&e.attr("data-original-title",e.attr("title")||"").removeAttr("title")},hasContent:function(){return this.getTitle()},getPosition:function(t){return e.extend({},t?{top:0,left:0}:this.$element.offset(),{width:this.$element[0].offsetWidth,height:this.$element[0].offsetHeight})},getTitle:function(){var e,t=this.$element,n=this.options;return e=t.attr("data-original-title")||(typeof n.title=="function"?n.title.call(t[0]):n.title),e},tip:function(){return this.$tip=this.$tip||e(this.options.template)},validate:function(){this.$element[0].parentNode||(this.hide(),this.$element=null,this.options=null)},enable:function(){this.enabled=!0},disable:function(){this.enabled=!1},toggleEnabled:function(){this.enabled=!this.enabled},toggle:function(t){var n=e(t.currentTarget)[this.type](this._options).data(this.type);n[n.tip().hasClass("in")?"hide":"show"]()},destroy:function(){this.hide().$element.off("."+this.type).removeData(this.type)}},e.fn.tooltip=function(n){return this.each(function(){var r=e(this),i=r.data("tooltip"),s=typeof n=="object"&&n;i||r.data("tooltip",i=new t(this,s)),typeof n=="string"&&i[n]()})},e.fn.tooltip.Constructor=t,e.fn.tooltip.defaults={animation:!0,placement:"top",selector:!1,template:'<div class="tooltip"><div class="tooltip-arrow"></div><div class="tooltip-inner"></div></div>',trigger:"hover",title:"",delay:0,html:!1}}(window.jQuery),!function(e){var t=function(e,t){this.init("popover",e,t)};t.prototype=e.extend({},e.fn.tooltip.Constructor.prototype,{constructor:t,setContent:function(){var e=this.tip(),t=this.getTitle(),n=this.getContent();e.find(".popover-title")[this.options.html?"html":"text"](t),e.find(".popover-content > *")[this.options.html?"html":"text"](n),e.removeClass("fade top bottom left right in")},hasContent:function(){return this.getTitle()||this.getContent()},getContent:function(){var e,t=this.$element,n=this.options;return e=t.attr("data-content")||(typeof n.content=="function"?n.content.call(t[0]):n.content),e},tip:function(){return this.$tip||(this.$tip=e(this.options.template)),this.$tip},destroy:function(){this.hide().$element.off("."+this.type).removeData(this.type)}}),e.fn.popover=function(n){return this.each(function(){var r=e(this),i=r.data("popover"),s=typeof n=="object"&&n;i||r.data("popover",i=new t(this,s)),typeof n=="string"&&i[n]()})},e.fn.popover.Constructor=t,e.fn.popover.defaults=e.extend({},e.fn.tooltip.defaults,{placement:"right",trigger:"click",content:"",template:'<div class="popover"><div class="arrow"></div><div class="popover-inner"><h3 class="popover-title"></h3><div class="popover-content"><p></p></div></div></div>'})}(window.jQuery),!function(e){function t(t,n){var r=e.proxy(this.process,this),i=e(t).is("body")?e(window):e(t),s;this.options=e.extend({},e.fn.scrollspy.defaults,n),this.$scrollElement=i.on("scroll.scroll-spy.data-api",r),this.selector=(this.options.target||(s=e(t).attr("href"))&&s.replace(/.*(?=#[^\s]+$)/,"")||"")+" .nav li > a",this.$body=e("body"),this.refresh(),this.process()}t.prototype={constructor:t,refresh:function(){var t=this,n;this.offsets=e([]),this.targets=e([]),n=this.$body.find(this.selector).map(function(){var t=e(this),n=t.data("target")||t.attr("href"),r=/^#\w/.test(n)&&e(n);return r&&r.length&&[[r.position().top,n]]||null}).sort(function(e,t){return e[0]-t[0]}).each(function(){t.offsets.push(this[0]),t.targets.push(this[1])})},process:function(){var e=this.$scrollElement.scrollTop()+this.options.offset,t=this.$scrollElement[0].scrollHeight||this.$body[0].scrollHeight,n=t-this.$scrollElement.height(),r=this.offsets,i=this.targets,s=this.activeTarget,o;if(e>=n)return s!=(o=i.last()[0])&&this.activate(o);for(o=r.length;o--;)s!=i[o]&&e>=r[o]&&(!r[o+1]||e<=r[o+1])&&this.activate(i[o])},activate:function(t){var n,r;this.activeTarget=t,e(this.selector).parent(".active").removeClass("active"),r=this.selector+'[data-target="'+t+'"],'+this.selector+'[href="'+t+'"]',n=e(r).parent("li").addClass("active"),n.parent(".dropdown-menu").length&&(n=n.closest("li.dropdown").addClass("active")),n.trigger("activate")}},e.fn.scrollspy=function(n){return this.each(function(){var r=e(this),i=r.data("scrollspy"),s=typeof n=="object"&&n;i||r.data("scrollspy",i=new t(this,s)),typeof n=="string"&&i[n]()})},e.fn.scrollspy.Constructor=t,e.fn.scrollspy.defaults={offset:10},e(window).on("load",function(){e('[data-spy="scroll"]').each(function(){var t=e(this);t.scrollspy(t.data())})})}(window.jQuery),!function(e){var t=function(t){this.element=e(t)};t.prototype={constructor:t,show:function(){var t=this.element,n=t.closest("ul:not(.dropdown-menu)"),r=t.attr("data-target"),i,s,o;r||(r=t.attr("href"),r=r&&r.replace(/.*(?=#[^\s]*$)/,""));if(t.parent("li").hasClass("active"))return;i=n.find(".active:last a")[0],o=e.Event("show",{relatedTarget:i}),t.trigger(o);if(o.isDefaultPrevented())return;s=e(r),this.activate(t.parent("li"),n),this.activate(s,s.parent(),function(){t.trigger({type:"shown",relatedTarget:i})})},activate:function(t,n,r){function o(){i.removeClass("active").find("> .dropdown-menu > .active").removeClass("active"),t.addClass("active"),s?(t[0].offsetWidth,t.addClass("in")):t.removeClass("fade"),t.parent(".dropdown-menu")&&t.closest("li.dropdown").addClass("active"),r&&r()}var i=n.find("> .active"),s=r&&e.support.transition&&i.hasClass("fade");s?i.one(e.support.transition.end,o):o(),i.removeClass("in")}},e.fn.tab=function(n){return this.each(function(){var r=e(this),i=r.data("tab");i||r.data("tab",i=new t(this)),typeof n=="string"&&i[n]()})},e.fn.tab.Constructor=t,e(document).on("click.tab.data-api",'[data-toggle="tab"], [data-toggle="pill"]',function(t){t.preventDefault(),e(this).tab("show")})}(window.jQuery),!function(e){var t=function(t,n){this.$element=e(t),this.options=e.extend({},e.fn.typeahead.defaults,n),this.matcher=this.options.matcher||this.matcher,this.sorter=this.options.sorter||this.sorter,this.highlighter=this.options.highlighter||this.highlighter,this.updater=this.options.updater||this.updater,this.$menu=e(this.options.menu).appendTo("body"),this.source=this.options.source,this.shown=!1,this.listen()};t.prototype={constructor:t,select:function(){var e=this.$menu.find(".active").attr("data-value");return this.$element.val(this.updater(e)).change(),this.hide()},updater:function(e){return e},show:function(){var t=e.extend({},this.$element.offset(),{height:this.$element[0].offsetHeight});return this.$menu.css({top:t.top+t.height,left:t.left}),this.$menu.show(),this.shown=!0,this},hide:function(){return this.$menu.hide(),this.shown=!1,this},lookup:function(t){var n;return this.query=this.$element.val(),!this.query||this.query.length<this.options.minLength?this.shown?this.hide():this:(n=e.isFunction(this.source)?this.source(this.query,e.proxy(this.process,this)):this.source,n?this.process(n):this)},process:function(t){var n=this;return t=e.grep(t,function(e){return n.matcher(e)}),t=this.sorter(t),t.length?this.render(t.slice(0,this.options.items)).show():this.shown?this.hide():this},matcher:function(e){return~e.toLowerCase().indexOf(this.query.toLowerCase())},sorter:function(e){var t=[],n=[],r=[],i;while(i=e.shift())i.toLowerCase().indexOf(this.query.toLowerCase())?~i.indexOf(this.query)?n.push(i):r.push(i):t.push(i);return t.concat(n,r)},highlighter:function(e){var t=this.query.replace(/[\-\[\]{}()*+?.,\\\^$|#\s]/g,"\\$&");return e.replace(new RegExp("("+t+")","ig"),function(e,t){return"<strong>"+t+"</strong>"})},render:function(t){var n=this;return t=e(t).map(function(t,r){return t=e(n.options.item).attr("data-value",r),t.find("a").html(n.highlighter(r)),t[0]}),t.first().addClass("active"),this.$menu.html(t),this},next:function(t){var n=this.$menu.find(".active").removeClass("active"),r=n.next();r.length||(r=e(this.$menu.find("li")[0])),r.addClass("active")},prev:function(e){var t=this.$menu.find(".active").removeClass("active"),n=t.prev();n.length||(n=this.$menu.find("li").last()),n.addClass("active")},listen:function(){this.$element.on("blur",e.proxy(this.blur,this)).on("keypress",e.proxy(this.keypress,this)).on("keyup",e.proxy(this.keyup,this)),this.eventSupported("keydown")&&this.$element.on("keydown",e.proxy(this.keydown,this)),this.$menu.on("click",e.proxy(this.click,this)).on("mouseenter","li",e.proxy(this.mouseenter,this))},eventSupported:function(e){var t=e in this.$element;return t||(this.$element.setAttribute(e,"return;"),t=typeof this.$element[e]=="function"),t},move:function(e){if(!this.shown)return;switch(e.keyCode){case 9:case 13:case 27:e.preventDefault();break;case 38:e.preventDefault(),this.prev();break;case 40:e.preventDefault(),this.next()}e.stopPropagation()},keydown:function(t){this.suppressKeyPressRepeat=!~e.inArray(t.keyCode,[40,38,9,13,27]),this.move(t)},keypress:function(e){if(this.suppressKeyPressRepeat)return;this.move(e)},keyup:function(e){switch(e.keyCode){case 40:case 38:case 16:case 17:case 18:break;case 9:case 13:if(!this.shown)return;this.select();break;case 27:if(!this.shown)return;this.hide();break;default:this.lookup()}e.stopPropagation(),e.preventDefault()},blur:function(e){var t=this;setTimeout(function(){t.hide()},150)},click:function(e){e.stopPropagation(),e.preventDefault(),this.select()},mouseenter:function(t){this.$menu.find(".active").removeClass("active"),e(t.currentTarget).addClass("active")}},e.fn.typeahead=function(n){return this.each(function(){var r=e(this),i=r.data("typeahead"),s=typeof n=="object"&&n;i||r.data("typeahead",i=new t(this,s)),typeof n=="string"&&i[n]()})},e.fn.typeahead.defaults={source:[],items:8,menu:'<ul class="typeahead dropdown-menu"></ul>',item:'<li><a href="#"></a></li>',minLength:1},e.fn.typeahead.Constructor=t,e(document).on("focus.typeahead.data-api",'[data-provide="typeahead"]',function(t){var n=e(this);if(n.data("typeahead"))return;t.preventDefault(),n.typeahead(n.data())})}(window.jQuery),!function(e){var t=function(t,n){this.options=e.extend({},e.fn.affix.defaults,n),this.$window=e(window).on("scroll.affix.data-api",e.proxy(this.checkPosition,this)).on("click.affix.data-api",e.proxy(function(){setTimeout(e.proxy(this.checkPosition,this),1)},this)),this.$element=e(t),this.checkPosition()};t.prototype.checkPosition=function(){if(!this.$element.is(":visible"))return;var t=e(document).height(),n=this.$window.scrollTop(),r=this.$element.offset(),i=this.options.offset,s=i.bottom,o=i.top,u="affix affix-top affix-bottom",a;typeof i!="object"&&(s=o=i),typeof o=="function"&&(o=i.top()),typeof s=="function"&&(s=i.bottom()),a=this.unpin!=null&&n+this.unpin<=r.top?!1:s!=null&&r.top+this.$element.height()>=t-s?"bottom":o!=null&&n<=o?"top":!1;if(this.affixed===a)return;this.affixed=a,this.unpin=a=="bottom"?r.top-n:null,this.$element.removeClass(u).addClass("affix"+(a?"-"+a:""))},e.fn.affix=function(n){return this.each(function(){var r=e(this),i=r.data("affix"),s=typeof n=="object"&&n;i||r.data("affix",i=new t(this,s)),typeof n=="string"&&i[n]()})},e.fn.affix.Constructor=t,e.fn.affix.defaults={offset:0},e(window).on("load",function(){e('[data-spy="affix"]').each(function(){var t=e(this),n=t.data();n.offset=n.offset||{},n.offsetBottom&&(n.offset.bottom=n.offsetBottom),n.offsetTop&&(n.offset.top=n.offsetTop),t.affix(n)})})}(window.jQuery),define("jquery.bootstrap",function(){}),function(e){e.color={},e.color.make=function(t,n,r,i){var s={};return s.r=t||0,s.g=n||0,s.b=r||0,s.a=i!=null?i:1,s.add=function(e,t){for(var n=0;n<e.length;++n)s[e.charAt(n)]+=t;return s.normalize()},s.scale=function(e,t){for(var n=0;n<e.length;++n)s[e.charAt(n)]*=t;return s.normalize()},s.toString=function(){return s.a>=1?"rgb("+[s.r,s.g,s.b].join(",")+")":"rgba("+[s.r,s.g,s.b,s.a].join(",")+")"},s.normalize=function(){function e(e,t,n){return t<e?e:t>n?n:t}return s.r=e(0,parseInt(s.r),255),s.g=e(0,parseInt(s.g),255),s.b=e(0,parseInt(s.b),255),s.a=e(0,s.a,1),s},s.clone=function(){return e.color.make(s.r,s.b,s.g,s.a)},s.normalize()},e.color.extract=function(t,n){var r;do{r=t.css(n).toLowerCase();if(r!=""&&r!="transparent")break;t=t.parent()}while(!e.nodeName(t.get(0),"body"));return r=="rgba(0, 0, 0, 0)"&&(r="transparent"),e.color.parse(r)},e.color.parse=function(n){var r,i=e.color.make;if(r=/rgb\(\s*([0-9]{1,3})\s*,\s*([0-9]{1,3})\s*,\s*([0-9]{1,3})\s*\)/.exec(n))return i(parseInt(r[1],10),parseInt(r[2],10),parseInt(r[3],10));if(r=/rgba\(\s*([0-9]{1,3})\s*,\s*([0-9]{1,3})\s*,\s*([0-9]{1,3})\s*,\s*([0-9]+(?:\.[0-9]+)?)\s*\)/.exec(n))return i(parseInt(r[1],10),parseInt(r[2],10),parseInt(r[3],10),parseFloat(r[4]));if(r=/rgb\(\s*([0-9]+(?:\.[0-9]+)?)\%\s*,\s*([0-9]+(?:\.[0-9]+)?)\%\s*,\s*([0-9]+(?:\.[0-9]+)?)\%\s*\)/.exec(n))return i(parseFloat(r[1])*2.55,parseFloat(r[2])*2.55,parseFloat(r[3])*2.55);if(r=/rgba\(\s*([0-9]+(?:\.[0-9]+)?)\%\s*,\s*([0-9]+(?:\.[0-9]+)?)\%\s*,\s*([0-9]+(?:\.[0-9]+)?)\%\s*,\s*([0-9]+(?:\.[0-9]+)?)\s*\)/.exec(n))return i(parseFloat(r[1])*2.55,parseFloat(r[2])*2.55,parseFloat(r[3])*2.55,parseFloat(r[4]));if(r=/#([a-fA-F0-9]{2})([a-fA-F0-9]{2})([a-fA-F0-9]{2})/.exec(n))return i(parseInt(r[1],16),parseInt(r[2],16),parseInt(r[3],16));if(r=/#([a-fA-F0-9])([a-fA-F0-9])([a-fA-F0-9])/.exec(n))return i(parseInt(r[1]+r[1],16),parseInt(r[2]+r[2],16),parseInt(r[3]+r[3],16));var s=e.trim(n).toLowerCase();return s=="transparent"?i(255,255,255,0):(r=t[s]||[0,0,0],i(r[0],r[1],r[2]))};var t={aqua:[0,255,255],azure:[240,255,255],beige:[245,245,220],black:[0,0,0],blue:[0,0,255],brown:[165,42,42],cyan:[0,255,255],darkblue:[0,0,139],darkcyan:[0,139,139],darkgrey:[169,169,169],darkgreen:[0,100,0],darkkhaki:[189,183,107],darkmagenta:[139,0,139],darkolivegreen:[85,107,47],darkorange:[255,140,0],darkorchid:[153,50,204],darkred:[139,0,0],darksalmon:[233,150,122],darkviolet:[148,0,211],fuchsia:[255,0,255],gold:[255,215,0],green:[0,128,0],indigo:[75,0,130],khaki:[240,230,140],lightblue:[173,216,230],lightcyan:[224,255,255],lightgreen:[144,238,144],lightgrey:[211,211,211],lightpink:[255,182,193],lightyellow:[255,255,224],lime:[0,255,0],magenta:[255,0,255],maroon:[128,0,0],navy:[0,0,128],olive:[128,128,0],orange:[255,165,0],pink:[255,192,203],purple:[128,0,128],violet:[128,0,128],red:[255,0,0],silver:[192,192,192],white:[255,255,255],yellow:[255,255,0]}}(jQuery),function(e){function t(t,r,s,o){function x(e,t){t=[S].concat(t);for(var n=0;n<e.length;++n)e[n].apply(this,t)}function T(){for(var t=0;t<o.length;++t){var n=o[t];n.init(S),n.options&&e.extend(!0,a,n.options)}}function N(t){var n;e.extend(!0,a,t),a.xaxis.color==null&&(a.xaxis.color=a.grid.color),a.yaxis.color==null&&(a.yaxis.color=a.grid.color),a.xaxis.tickColor==null&&(a.xaxis.tickColor=a.grid.tickColor),a.yaxis.tickColor==null&&(a.yaxis.tickColor=a.grid.tickColor),a.grid.borderColor==null&&(a.grid.borderColor=a.grid.color),a.grid.tickColor==null&&(a.grid.tickColor=e.color.parse(a.grid.color).scale("a",.22).toString());for(n=0;n<Math.max(1,a.xaxes.length);++n)a.xaxes[n]=e.extend(!0,{},a.xaxis,a.xaxes[n]);for(n=0;n<Math.max(1,a.yaxes.length);++n)a.yaxes[n]=e.extend(!0,{},a.yaxis,a.yaxes[n]);a.xaxis.noTicks&&a.xaxis.ticks==null&&(a.xaxis.ticks=a.xaxis.noTicks),a.yaxis.noTicks&&a.yaxis.ticks==null&&(a.yaxis.ticks=a.yaxis.noTicks),a.x2axis&&(a.xaxes[1]=e.extend(!0,{},a.xaxis,a.x2axis),a.xaxes[1].position="top"),a.y2axis&&(a.yaxes[1]=e.extend(!0,{},a.yaxis,a.y2axis),a.yaxes[1].position="right"),a.grid.coloredAreas&&(a.grid.markings=a.grid.coloredAreas),a.grid.coloredAreasColor&&(a.grid.markingsColor=a.grid.coloredAreasColor),a.lines&&e.extend(!0,a.series.lines,a.lines),a.points&&e.extend(!0,a.series.points,a.points),a.bars&&e.extend(!0,a.series.bars,a.bars),a.shadowSize!=null&&(a.series.shadowSize=a.shadowSize);for(n=0;n<a.xaxes.length;++n)_(d,n+1).options=a.xaxes[n];for(n=0;n<a.yaxes.length;++n)_(v,n+1).options=a.yaxes[n];for(var r in E)a.hooks[r]&&a.hooks[r].length&&(E[r]=E[r].concat(a.hooks[r]));x(E.processOptions,[a])}function C(e){u=k(e),D(),P()}function k(t){var n=[];for(var r=0;r<t.length;++r){var i=e.extend(!0,{},a.series);t[r].data!=null?(i.data=t[r].data,delete t[r].data,e.extend(!0,i,t[r]),t[r].data=i.data):i.data=t[r],n.push(i)}return n}function L(e,t){var n=e[t+"axis"];return typeof n=="object"&&(n=n.n),typeof n!="number"&&(n=1),n}function A(){return e.grep(d.concat(v),function(e){return e})}function O(e){var t={},n,r;for(n=0;n<d.length;++n)r=d[n],r&&r.used&&(t["x"+r.n]=r.c2p(e.left));for(n=0;n<v.length;++n)r=v[n],r&&r.used&&(t["y"+r.n]=r.c2p(e.top));return t.x1!==undefined&&(t.x=t.x1),t.y1!==undefined&&(t.y=t.y1),t}function M(e){var t={},n,r,i;for(n=0;n<d.length;++n){r=d[n];if(r&&r.used){i="x"+r.n,e[i]==null&&r.n==1&&(i="x");if(e[i]!=null){t.left=r.p2c(e[i]);break}}}for(n=0;n<v.length;++n){r=v[n];if(r&&r.used){i="y"+r.n,e[i]==null&&r.n==1&&(i="y");if(e[i]!=null){t.top=r.p2c(e[i]);break}}}return t}function _(t,n){return t[n-1]||(t[n-1]={n:n,direction:t==d?"x":"y",options:e.extend(!0,{},t==d?a.xaxis:a.yaxis)}),t[n-1]}function D(){var t,n=u.length,r=[],i=[];for(t=0;t<u.length;++t){var s=u[t].color;s!=null&&(--n,typeof s=="number"?i.push(s):r.push(e.color.parse(u[t].color)))}for(t=0;t<i.length;++t)n=Math.max(n,i[t]+1);var o=[],f=0;t=0;while(o.length<n){var l;a.colors.length==t?l=e.color.make(100,100,100):l=e.color.parse(a.colors[t]);var c=f%2==1?-1:1;l.scale("rgb",1+c*Math.ceil(f/2)*.2),o.push(l),++t,t>=a.colors.length&&(t=0,++f)}var h=0,p;for(t=0;t<u.length;++t){p=u[t],p.color==null?(p.color=o[h].toString(),++h):typeof p.color=="number"&&(p.color=o[p.color].toString());if(p.lines.show==null){var m,g=!0;for(m in p)if(p[m]&&p[m].show){g=!1;break}g&&(p.lines.show=!0)}p.xaxis=_(d,L(p,"x")),p.yaxis=_(v,L(p,"y"))}}function P(){function b(e,t,n){t<e.datamin&&t!=-r&&(e.datamin=t),n>e.datamax&&n!=r&&(e.datamax=n)}var t=Number.POSITIVE_INFINITY,n=Number.NEGATIVE_INFINITY,r=Number.MAX_VALUE,i,s,o,a,f,l,c,h,p,d,v,m,g,y;e.each(A(),function(e,r){r.datamin=t,r.datamax=n,r.used=!1});for(i=0;i<u.length;++i)l=u[i],l.datapoints={points:[]},x(E.processRawData,[l,l.data,l.datapoints]);for(i=0;i<u.length;++i){l=u[i];var w=l.data,S=l.datapoints.format;if(!S){S=[],S.push({x:!0,number:!0,required:!0}),S.push({y:!0,number:!0,required:!0});if(l.bars.show||l.lines.show&&l.lines.fill)S.push({y:!0,number:!0,required:!1,defaultValue:0}),l.bars.horizontal&&(delete S[S.length-1].y,S[S.length-1].x=!0);l.datapoints.format=S}if(l.datapoints.pointsize!=null)continue;l.datapoints.pointsize=S.length,h=l.datapoints.pointsize,c=l.datapoints.points,insertSteps=l.lines.show&&l.lines.steps,l.xaxis.used=l.yaxis.used=!0;for(s=o=0;s<w.length;++s,o+=h){y=w[s];var T=y==null;if(!T)for(a=0;a<h;++a)m=y[a],g=S[a],g&&(g.number&&m!=null&&(m=+m,isNaN(m)?m=null:m==Infinity?m=r:m==-Infinity&&(m=-r)),m==null&&(g.required&&(T=!0),g.defaultValue!=null&&(m=g.defaultValue))),c[o+a]=m;if(T)for(a=0;a<h;++a)m=c[o+a],m!=null&&(g=S[a],g.x&&b(l.xaxis,m,m),g.y&&b(l.yaxis,m,m)),c[o+a]=null;else if(insertSteps&&o>0&&c[o-h]!=null&&c[o-h]!=c[o]&&c[o-h+1]!=c[o+1]){for(a=0;a<h;++a)c[o+h+a]=c[o+a];c[o+1]=c[o-h+1],o+=h}}}for(i=0;i<u.length;++i)l=u[i],x(E.processDatapoints,[l,l.datapoints]);for(i=0;i<u.length;++i){l=u[i],c=l.datapoints.points,h=l.datapoints.pointsize;var N=t,C=t,k=n,L=n;for(s=0;s<c.length;s+=h){if(c[s]==null)continue;for(a=0;a<h;++a){m=c[s+a],g=S[a];if(!g||m==r||m==-r)continue;g.x&&(m<N&&(N=m),m>k&&(k=m)),g.y&&(m<C&&(C=m),m>L&&(L=m))}}if(l.bars.show){var O=l.bars.align=="left"?0:-l.bars.barWidth/2;l.bars.horizontal?(C+=O,L+=O+l.bars.barWidth):(N+=O,k+=O+l.bars.barWidth)}b(l.xaxis,N,k),b(l.yaxis,C,L)}e.each(A(),function(e,r){r.datamin==t&&(r.datamin=null),r.datamax==n&&(r.datamax=null)})}function H(n,r){var i=document.createElement("canvas");return i.className=r,i.width=g,i.height=y,n||e(i).css({position:"absolute",left:0,top:0}),e(i).appendTo(t),i.getContext||(i=window.G_vmlCanvasManager.initElement(i)),i.getContext("2d").save(),i}function B(){g=t.width(),y=t.height();if(g<=0||y<=0)throw"Invalid dimensions for plot, width = "+g+", height = "+y}function j(e){e.width!=g&&(e.width=g),e.height!=y&&(e.height=y);var t=e.getContext("2d");t.restore(),t.save()}function F(){var n,r=t.children("canvas.base"),i=t.children("canvas.overlay");r.length==0||i==0?(t.html(""),t.css({padding:0}),t.css("position")=="static"&&t.css("position","relative"),B(),f=H(!0,"base"),l=H(!1,"overlay"),n=!1):(f=r.get(0),l=i.get(0),n=!0),h=f.getContext("2d"),p=l.getContext("2d"),c=e([l,f]),n&&(t.data("plot").shutdown(),S.resize(),p.clearRect(0,0,g,y),c.unbind(),t.children().not([f,l]).remove()),t.data("plot",S)}function I(){a.grid.hoverable&&(c.mousemove(ht),c.mouseleave(pt)),a.grid.clickable&&c.click(dt),x(E.bindEvents,[c])}function q(){lt&&clearTimeout(lt),c.unbind("mousemove",ht),c.unbind("mouseleave",pt),c.unbind("click",dt),x(E.shutdown,[c])}function R(e){function t(e){return e}var n,r,i=e.options.transform||t,s=e.options.inverseTransform;e.direction=="x"?(n=e.scale=b/Math.abs(i(e.max)-i(e.min)),r=Math.min(i(e.max),i(e.min))):(n=e.scale=w/Math.abs(i(e.max)-i(e.min)),n=-n,r=Math.max(i(e.max),i(e.min))),i==t?e.p2c=function(e){return(e-r)*n}:e.p2c=function(e){return(i(e)-r)*n},s?e.c2p=function(e){return s(r+e/n)}:e.c2p=function(e){return r+e/n}}function U(n){function c(r,i){return e('<div style="position:absolute;top:-10000px;'+i+'font-size:smaller">'+'<div class="'+n.direction+"Axis "+n.direction+n.n+'Axis">'+r.join("")+"</div></div>").appendTo(t)}var r=n.options,i,s=n.ticks||[],o=[],u,a=r.labelWidth,f=r.labelHeight,l;if(n.direction=="x"){a==null&&(a=Math.floor(g/(s.length>0?s.length:1)));if(f==null){o=[];for(i=0;i<s.length;++i)u=s[i].label,u&&o.push('<div class="tickLabel" style="float:left;width:'+a+'px">'+u+"</div>");o.length>0&&(o.push('<div style="clear:left"></div>'),l=c(o,"width:10000px;"),f=l.height(),l.remove())}}else if(a==null||f==null){for(i=0;i<s.length;++i)u=s[i].label,u&&o.push('<div class="tickLabel">'+u+"</div>");o.length>0&&(l=c(o,""),a==null&&(a=l.children().width()),f==null&&(f=l.find("div.tickLabel").height()),l.remove())}a==null&&(a=0),f==null&&(f=0),n.labelWidth=a,n.labelHeight=f}function z(t){var n=t.labelWidth,r=t.labelHeight,i=t.options.position,s=t.options.tickLength,o=a.grid.axisMargin,u=a.grid.labelMargin,f=t.direction=="x"?d:v,l,c=e.grep(f,function(e){return e&&e.options.position==i&&e.reserveSpace});e.inArray(t,c)==c.length-1&&(o=0),s==null&&(s="full");var h=e.grep(f,function(e){return e&&e.reserveSpace}),p=e.inArray(t,h)==0;!p&&s=="full"&&(s=5),isNaN(+s)||(u+=+s),t.direction=="x"?(r+=u,i=="bottom"?(m.bottom+=r+o,t.box={top:y-m.bottom,height:r}):(t.box={top:m.top+o,height:r},m.top+=r+o)):(n+=u,i=="left"?(t.box={left:m.left+o,width:n},m.left+=n+o):(m.right+=n+o,t.box={left:g-m.right,width:n})),t.position=i,t.tickLength=s,t.box.padding=u,t.innermost=p}function W(e){e.direction=="x"?(e.box.left=m.left,e.box.width=b):(e.box.top=m.top,e.box.height=w)}function X(){var t,n=A();e.each(n,function(e,t){t.show=t.options.show,t.show==null&&(t.show=t.used),t.reserveSpace=t.show||t.options.reserveSpace,V(t)}),allocatedAxes=e.grep(n,function(e){return e.reserveSpace}),m.left=m.right=m.top=m.bottom=0;if(a.grid.show){e.each(allocatedAxes,function(e,t){J(t),K(t),Q(t,t.ticks),U(t)});for(t=allocatedAxes.length-1;t>=0;--t)z(allocatedAxes[t]);var r=a.grid.minBorderMargin;if(r==null){r=0;for(t=0;t<u.length;++t)r=Math.max(r,u[t].points.radius+u[t].points.lineWidth/2)}for(var i in m)m[i]+=a.grid.borderWidth,m[i]=Math.max(r,m[i])}b=g-m.left-m.right,w=y-m.bottom-m.top,e.each(n,function(e,t){R(t)}),a.grid.show&&(e.each(allocatedAxes,function(e,t){W(t)}),tt()),at()}function V(e){var t=e.options,n=+(t.min!=null?t.min:e.datamin),r=+(t.max!=null?t.max:e.datamax),i=r-n;if(i==0){var s=r==0?1:.01;t.min==null&&(n-=s);if(t.max==null||t.min!=null)r+=s}else{var o=t.autoscaleMargin;o!=null&&(t.min==null&&(n-=i*o,n<0&&e.datamin!=null&&e.datamin>=0&&(n=0)),t.max==null&&(r+=i*o,r>0&&e.datamax!=null&&e.datamax<=0&&(r=0)))}e.min=n,e.max=r}function J(t){var r=t.options,i;typeof r.ticks=="number"&&r.ticks>0?i=r.ticks:i=.3*Math.sqrt(t.direction=="x"?g:y);var s=(t.max-t.min)/i,o,u,a,f,l,c,h;if(r.mode=="time"){var p={second:1e3,minute:6e4,hour:36e5,day:864e5,month:2592e6,year:525949.2*60*1e3},m=[[1,"second"],[2,"second"],[5,"second"],[10,"second"],[30,"second"],[1,"minute"],[2,"minute"],[5,"minute"],[10,"minute"],[30,"minute"],[1,"hour"],[2,"hour"],[4,"hour"],[8,"hour"],[12,"hour"],[1,"day"],[2,"day"],[3,"day"],[.25,"month"],[.5,"month"],[1,"month"],[2,"month"],[3,"month"],[6,"month"],[1,"year"]],b=0;r.minTickSize!=null&&(typeof r.tickSize=="number"?b=r.tickSize:b=r.minTickSize[0]*p[r.minTickSize[1]]);for(var l=0;l<m.length-1;++l)if(s<(m[l][0]*p[m[l][1]]+m[l+1][0]*p[m[l+1][1]])/2&&m[l][0]*p[m[l][1]]>=b)break;o=m[l][0],a=m[l][1],a=="year"&&(c=Math.pow(10,Math.floor(Math.log(s/p.year)/Math.LN10)),h=s/p.year/c,h<1.5?o=1:h<3?o=2:h<7.5?o=5:o=10,o*=c),t.tickSize=r.tickSize||[o,a],u=function(e){var t=[],r=e.tickSize[0],i=e.tickSize[1],s=new Date(e.min),o=r*p[i];i=="second"&&s.setUTCSeconds(n(s.getUTCSeconds(),r)),i=="minute"&&s.setUTCMinutes(n(s.getUTCMinutes(),r)),i=="hour"&&s.setUTCHours(n(s.getUTCHours(),r)),i=="month"&&s.setUTCMonth(n(s.getUTCMonth(),r)),i=="year"&&s.setUTCFullYear(n(s.getUTCFullYear(),r)),s.setUTCMilliseconds(0),o>=p.minute&&s.setUTCSeconds(0),o>=p.hour&&s.setUTCMinutes(0),o>=p.day&&s.setUTCHours(0),o>=p.day*4&&s.setUTCDate(1),o>=p.year&&s.setUTCMonth(0);var u=0,a=Number.NaN,f;do{f=a,a=s.getTime(),t.push(a);if(i=="month")if(r<1){s.setUTCDate(1);var l=s.getTime();s.setUTCMonth(s.getUTCMonth()+1);var c=s.getTime();s.setTime(a+u*p.hour+(c-l)*r),u=s.getUTCHours(),s.setUTCHours(0)}else s.setUTCMonth(s.getUTCMonth()+r);else i=="year"?s.setUTCFullYear(s.getUTCFullYear()+r):s.setTime(a+o)}while(a<e.max&&a!=f);return t},f=function(t,n){var i=new Date(t);if(r.timeformat!=null)return e.plot.formatDate(i,r.timeformat,r.monthNames);var s=n.tickSize[0]*p[n.tickSize[1]],o=n.max-n.min,u=r.twelveHourClock?" %p":"";return s<p.minute?fmt="%h:%M:%S"+u:s<p.day?o<2*p.day?fmt="%h:%M"+u:fmt="%b %d %h:%M"+u:s<p.month?fmt="%b %d":s<p.year?o<p.year?fmt="%b":fmt="%b %y":fmt="%y",e.plot.formatDate(i,fmt,r.monthNames)}}else{var w=r.tickDecimals,E=-Math.floor(Math.log(s)/Math.LN10);w!=null&&E>w&&(E=w),c=Math.pow(10,-E),h=s/c,h<1.5?o=1:h<3?(o=2,h>2.25&&(w==null||E+1<=w)&&(o=2.5,++E)):h<7.5?o=5:o=10,o*=c,r.minTickSize!=null&&o<r.minTickSize&&(o=r.minTickSize),t.tickDecimals=Math.max(0,w!=null?w:E),t.tickSize=r.tickSize||o,u=function(e){var t=[],r=n(e.min,e.tickSize),i=0,s=Number.NaN,o;do o=s,s=r+i*e.tickSize,t.push(s),++i;while(s<e.max&&s!=o);return t},f=function(e,t){return e.toFixed(t.tickDecimals)}}if(r.alignTicksWithAxis!=null){var S=(t.direction=="x"?d:v)[r.alignTicksWithAxis-1];if(S&&S.used&&S!=t){var x=u(t);x.length>0&&(r.min==null&&(t.min=Math.min(t.min,x[0])),r.max==null&&x.length>1&&(t.max=Math.max(t.max,x[x.length-1]))),u=function(e){var t=[],n,r;for(r=0;r<S.ticks.length;++r)n=(S.ticks[r].v-S.min)/(S.max-S.min),n=e.min+n*(e.max-e.min),t.push(n);return t};if(t.mode!="time"&&r.tickDecimals==null){var T=Math.max(0,-Math.floor(Math.log(s)/Math.LN10)+1),N=u(t);N.length>1&&/\..*0$/.test((N[1]-N[0]).toFixed(T))||(t.tickDecimals=T)}}}t.tickGenerator=u,e.isFunction(r.tickFormatter)?t.tickFormatter=function(e,t){return""+r.tickFormatter(e,t)}:t.tickFormatter=f}function K(t){var n=t.options.ticks,r=[];n==null||typeof n=="number"&&n>0?r=t.tickGenerator(t):n&&(e.isFunction(n)?r=n({min:t.min,max:t.max}):r=n);var i,s;t.ticks=[];for(i=0;i<r.length;++i){var o=null,u=r[i];typeof u=="object"?(s=+u[0],u.length>1&&(o=u[1])):s=+u,o==null&&(o=t.tickFormatter(s,t)),isNaN(s)||t.ticks.push({v:s,label:o})}}function Q(e,t){e.options.autoscaleMargin&&t.length>0&&(e.options.min==null&&(e.min=Math.min(e.min,t[0].v)),e.options.max==null&&t.length>1&&(e.max=Math.max(e.max,t[t.length-1].v)))}function G(){h.clearRect(0,0,g,y);var e=a.grid;e.show&&e.backgroundColor&&Z(),e.show&&!e.aboveData&&et();for(var t=0;t<u.length;++t)x(E.drawSeries,[h,u[t]]),nt(u[t]);x(E.draw,[h]),e.show&&e.aboveData&&et()}function Y(e,t){var n,r,s,o,u=A();for(i=0;i<u.length;++i){n=u[i];if(n.direction==t){o=t+n.n+"axis",!e[o]&&n.n==1&&(o=t+"axis");if(e[o]){r=e[o].from,s=e[o].to;break}}}e[o]||(n=t=="x"?d[0]:v[0],r=e[t+"1"],s=e[t+"2"]);if(r!=null&&s!=null&&r>s){var a=r;r=s,s=a}return{from:r,to:s,axis:n}}function Z(){h.save(),h.translate(m.left,m.top),h.fillStyle=xt(a.grid.backgroundColor,w,0,"rgba(255, 255, 255, 0)"),h.fillRect(0,0,b,w),h.restore()}function et(){var t;h.save(),h.translate(m.left,m.top);var n=a.grid.markings;if(n){if(e.isFunction(n)){var r=S.getAxes();r.xmin=r.xaxis.min,r.xmax=r.xaxis.max,r.ymin=r.yaxis.min,r.ymax=r.yaxis.max,n=n(r)}for(t=0;t<n.length;++t){var i=n[t],s=Y(i,"x"),o=Y(i,"y");s.from==null&&(s.from=s.axis.min),s.to==null&&(s.to=s.axis.max),o.from==null&&(o.from=o.axis.min),o.to==null&&(o.to=o.axis.max);if(s.to<s.axis.min||s.from>s.axis.max||o.to<o.axis.min||o.from>o.axis.max)continue;s.from=Math.max(s.from,s.axis.min),s.to=Math.min(s.to,s.axis.max),o.from=Math.max(o.from,o.axis.min),o.to=Math.min(o.to,o.axis.max);if(s.from==s.to&&o.from==o.to)continue;s.from=s.axis.p2c(s.from),s.to=s.axis.p2c(s.to),o.from=o.axis.p2c(o.from),o.to=o.axis.p2c(o.to),s.from==s.to||o.from==o.to?(h.beginPath(),h.strokeStyle=i.color||a.grid.markingsColor,h.lineWidth=i.lineWidth||a.grid.markingsLineWidth,h.moveTo(s.from,o.from),h.lineTo(s.to,o.to),h.stroke()):(h.fillStyle=i.color||a.grid.markingsColor,h.fillRect(s.from,o.to,s.to-s.from,o.from-o.to))}}var r=A(),u=a.grid.borderWidth;for(var f=0;f<r.length;++f){var l=r[f],c=l.box,p=l.tickLength,d,v,g,y;if(!l.show||l.ticks.length==0)continue;h.strokeStyle=l.options.tickColor||e.color.parse(l.options.color).scale("a",.22).toString(),h.lineWidth=1,l.direction=="x"?(d=0,p=="full"?v=l.position=="top"?0:w:v=c.top-m.top+(l.position=="top"?c.height:0)):(v=0,p=="full"?d=l.position=="left"?0:b:d=c.left-m.left+(l.position=="left"?c.width:0)),l.innermost||(h.beginPath(),g=y=0,l.direction=="x"?g=b:y=w,h.lineWidth==1&&(d=Math.floor(d)+.5,v=Math.floor(v)+.5),h.moveTo(d,v),h.lineTo(d+g,v+y),h.stroke()),h.beginPath();for(t=0;t<l.ticks.length;++t){var E=l.ticks[t].v;g=y=0;if(E<l.min||E>l.max||p=="full"&&u>0&&(E==l.min||E==l.max))continue;l.direction=="x"?(d=l.p2c(E),y=p=="full"?-w:p,l.position=="top"&&(y=-y)):(v=l.p2c(E),g=p=="full"?-b:p,l.position=="left"&&(g=-g)),h.lineWidth==1&&(l.direction=="x"?d=Math.floor(d)+.5:v=Math.floor(v)+.5),h.moveTo(d,v),h.lineTo(d+g,v+y)}h.stroke()}u&&(h.lineWidth=u,h.strokeStyle=a.grid.borderColor,h.strokeRect(-u/2,-u/2,b+u,w+u)),h.restore()}function tt(){t.find(".tickLabels").remove();var e=['<div class="tickLabels" style="font-size:smaller">'],n=A();for(var r=0;r<n.length;++r){var i=n[r],s=i.box;if(!i.show)continue;e.push('<div class="'+i.direction+"Axis "+i.direction+i.n+'Axis" style="color:'+i.options.color+'">');for(var o=0;o<i.ticks.length;++o){var u=i.ticks[o];if(!u.label||u.v<i.min||u.v>i.max)continue;var a={},f;i.direction=="x"?(f="center",a.left=Math.round(m.left+i.p2c(u.v)-i.labelWidth/2),i.position=="bottom"?a.top=s.top+s.padding:a.bottom=y-(s.top+s.height-s.padding)):(a.top=Math.round(m.top+i.p2c(u.v)-i.labelHeight/2),i.position=="left"?(a.right=g-(s.left+s.width-s.padding),f="right"):(a.left=s.left+s.padding,f="left")),a.width=i.labelWidth;var l=["position:absolute","text-align:"+f];for(var c in a)l.push(c+":"+a[c]+"px");e.push('<div class="tickLabel" style="'+l.join(";")+'">'+u.label+"</div>")}e.push("</div>")}e.push("</div>"),t.append(e.join(""))}function nt(e){e.lines.show&&rt(e),e.bars.show&&ot(e),e.points.show&&it(e)}function rt(e){function t(e,t,n,r,i){var s=e.points,o=e.pointsize,u=null,a=null;h.beginPath();for(var f=o;f<s.length;f+=o){var l=s[f-o],c=s[f-o+1],p=s[f],d=s[f+1];if(l==null||p==null)continue;if(c<=d&&c<i.min){if(d<i.min)continue;l=(i.min-c)/(d-c)*(p-l)+l,c=i.min}else if(d<=c&&d<i.min){if(c<i.min)continue;p=(i.min-c)/(d-c)*(p-l)+l,d=i.min}if(c>=d&&c>i.max){if(d>i.max)continue;l=(i.max-c)/(d-c)*(p-l)+l,c=i.max}else if(d>=c&&d>i.max){if(c>i.max)continue;p=(i.max-c)/(d-c)*(p-l)+l,d=i.max}if(l<=p&&l<r.min){if(p<r.min)continue;c=(r.min-l)/(p-l)*(d-c)+c,l=r.min}else if(p<=l&&p<r.min){if(l<r.min)continue;d=(r.min-l)/(p-l)*(d-c)+c,p=r.min}if(l>=p&&l>r.max){if(p>r.max)continue;c=(r.max-l)/(p-l)*(d-c)+c,l=r.max}else if(p>=l&&p>r.max){if(l>r.max)continue;d=(r.max-l)/(p-l)*(d-c)+c,p=r.max}(l!=u||c!=a)&&h.moveTo(r.p2c(l)+t,i.p2c(c)+n),u=p,a=d,h.lineTo(r.p2c(p)+t,i.p2c(d)+n)}h.stroke()}function n(e,t,n){var r=e.points,i=e.pointsize,s=Math.min(Math.max(0,n.min),n.max),o=0,u,a=!1,f=1,l=0,c=0;for(;;){if(i>0&&o>r.length+i)break;o+=i;var p=r[o-i],d=r[o-i+f],v=r[o],m=r[o+f];if(a){if(i>0&&p!=null&&v==null){c=o,i=-i,f=2;continue}if(i<0&&o==l+i){h.fill(),a=!1,i=-i,f=1,o=l=c+i;continue}}if(p==null||v==null)continue;if(p<=v&&p<t.min){if(v<t.min)continue;d=(t.min-p)/(v-p)*(m-d)+d,p=t.min}else if(v<=p&&v<t.min){if(p<t.min)continue;m=(t.min-p)/(v-p)*(m-d)+d,v=t.min}if(p>=v&&p>t.max){if(v>t.max)continue;d=(t.max-p)/(v-p)*(m-d)+d,p=t.max}else if(v>=p&&v>t.max){if(p>t.max)continue;m=(t.max-p)/(v-p)*(m-d)+d,v=t.max}a||(h.beginPath(),h.moveTo(t.p2c(p),n.p2c(s)),a=!0);if(d>=n.max&&m>=n.max){h.lineTo(t.p2c(p),n.p2c(n.max)),h.lineTo(t.p2c(v),n.p2c(n.max));continue}if(d<=n.min&&m<=n.min){h.lineTo(t.p2c(p),n.p2c(n.min)),h.lineTo(t.p2c(v),n.p2c(n.min));continue}var g=p,y=v;d<=m&&d<n.min&&m>=n.min?(p=(n.min-d)/(m-d)*(v-p)+p,d=n.min):m<=d&&m<n.min&&d>=n.min&&(v=(n.min-d)/(m-d)*(v-p)+p,m=n.min),d>=m&&d>n.max&&m<=n.max?(p=(n.max-d)/(m-d)*(v-p)+p,d=n.max):m>=d&&m>n.max&&d<=n.max&&(v=(n.max-d)/(m-d)*(v-p)+p,m=n.max),p!=g&&h.lineTo(t.p2c(g),n.p2c(d)),h.lineTo(t.p2c(p),n.p2c(d)),h.lineTo(t.p2c(v),n.p2c(m)),v!=y&&(h.lineTo(t.p2c(v),n.p2c(m)),h.lineTo(t.p2c(y),n.p2c(m)))}}h.save(),h.translate(m.left,m.top),h.lineJoin="round";var r=e.lines.lineWidth,i=e.shadowSize;if(r>0&&i>0){h.lineWidth=i,h.strokeStyle="rgba(0,0,0,0.1)";var s=Math.PI/18;t(e.datapoints,Math.sin(s)*(r/2+i/2),Math.cos(s)*(r/2+i/2),e.xaxis,e.yaxis),h.lineWidth=i/2,t(e.datapoints,Math.sin(s)*(r/2+i/4),Math.cos(s)*(r/2+i/4),e.xaxis,e.yaxis)}h.lineWidth=r,h.strokeStyle=e.color;var o=ut(e.lines,e.color,0,w);o&&(h.fillStyle=o,n(e.datapoints,e.xaxis,e.yaxis)),r>0&&t(e.datapoints,0,0,e.xaxis,e.yaxis),h.restore()}function it(e){function t(e,t,n,r,i,s,o,u){var a=e.points,f=e.pointsize;for(var l=0;l<a.length;l+=f){var c=a[l],p=a[l+1];if(c==null||c<s.min||c>s.max||p<o.min||p>o.max)continue;h.beginPath(),c=s.p2c(c),p=o.p2c(p)+r,u=="circle"?h.arc(c,p,t,0,i?Math.PI:Math.PI*2,!1):u(h,c,p,t,i),h.closePath(),n&&(h.fillStyle=n,h.fill()),h.stroke()}}h.save(),h.translate(m.left,m.top);var n=e.points.lineWidth,r=e.shadowSize,i=e.points.radius,s=e.points.symbol;if(n>0&&r>0){var o=r/2;h.lineWidth=o,h.strokeStyle="rgba(0,0,0,0.1)",t(e.datapoints,i,null,o+o/2,!0,e.xaxis,e.yaxis,s),h.strokeStyle="rgba(0,0,0,0.2)",t(e.datapoints,i,null,o/2,!0,e.xaxis,e.yaxis,s)}h.lineWidth=n,h.strokeStyle=e.color,t(e.datapoints,i,ut(e.points,e.color),0,!1,e.xaxis,e.yaxis,s),h.restore()}function st(e,t,n,r,i,s,o,u,a,f,l,c){var h,p,d,v,m,g,y,b,w;l?(b=g=y=!0,m=!1,h=n,p=e,v=t+r,d=t+i,p<h&&(w=p,p=h,h=w,m=!0,g=!1)):(m=g=y=!0,b=!1,h=e+r,p=e+i,d=n,v=t,v<d&&(w=v,v=d,d=w,b=!0,y=!1));if(p<u.min||h>u.max||v<a.min||d>a.max)return;h<u.min&&(h=u.min,m=!1),p>u.max&&(p=u.max,g=!1),d<a.min&&(d=a.min,b=!1),v>a.max&&(v=a.max,y=!1),h=u.p2c(h),d=a.p2c(d),p=u.p2c(p),v=a.p2c(v),o&&(f.beginPath(),f.moveTo(h,d),f.lineTo(h,v),f.lineTo(p,v),f.lineTo(p,d),f.fillStyle=o(d,v),f.fill()),c>0&&(m||g||y||b)&&(f.beginPath(),f.moveTo(h,d+s),m?f.lineTo(h,v+s):f.moveTo(h,v+s),y?f.lineTo(p,v+s):f.moveTo(p,v+s),g?f.lineTo(p,d+s):f.moveTo(p,d+s),b?f.lineTo(h,d+s):f.moveTo(h,d+s),f.stroke())}function ot(e){function t(t,n,r,i,s,o,u){var a=t.points,f=t.pointsize;for(var l=0;l<a.length;l+=f){if(a[l]==null)continue;st(a[l],a[l+1],a[l+2],n,r,i,s,o,u,h,e.bars.horizontal,e.bars.lineWidth)}}h.save(),h.translate(m.left,m.top),h.lineWidth=e.bars.lineWidth,h.strokeStyle=e.color;var n=e.bars.align=="left"?0:-e.bars.barWidth/2,r=e.bars.fill?function(t,n){return ut(e.bars,e.color,t,n)}:null;t(e.datapoints,n,n+e.bars.barWidth,0,r,e.xaxis,e.yaxis),h.restore()}function ut(t,n,r,i){var s=t.fill;if(!s)return null;if(t.fillColor)return xt(t.fillColor,r,i,n);var o=e.color.parse(n);return o.a=typeof s=="number"?s:.4,o.normalize(),o.toString()}function at(){t.find(".legend").remove();if(!a.legend.show)return;var n=[],r=!1,i=a.legend.labelFormatter,s,o;for(var f=0;f<u.length;++f){s=u[f],o=s.label;if(!o)continue;f%a.legend.noColumns==0&&(r&&n.push("</tr>"),n.push("<tr>"),r=!0),i&&(o=i(o,s)),n.push('<td class="legendColorBox"><div style="border:1px solid '+a.legend.labelBoxBorderColor+';padding:1px"><div style="width:4px;height:0;border:5px solid '+s.color+';overflow:hidden"></div></div></td>'+'<td class="legendLabel">'+o+"</td>")}r&&n.push("</tr>");if(n.length==0)return;var l='<table style="font-size:smaller;color:'+a.grid.color+'">'+n.join("")+"</table>";if(a.legend.container!=null)e(a.legend.container).html(l);else{var c="",h=a.legend.position,p=a.legend.margin;p[0]==null&&(p=[p,p]),h.charAt(0)=="n"?c+="top:"+(p[1]+m.top)+"px;":h.charAt(0)=="s"&&(c+="bottom:"+(p[1]+m.bottom)+"px;"),h.charAt(1)=="e"?c+="right:"+(p[0]+m.right)+"px;":h.charAt(1)=="w"&&(c+="left:"+(p[0]+m.left)+"px;");var d=e('<div class="legend">'+l.replace('style="','style="position:absolute;'+c+";")+"</div>").appendTo(t);if(a.legend.backgroundOpacity!=0){var v=a.legend.backgroundColor;v==null&&(v=a.grid.backgroundColor,v&&typeof v=="string"?v=e.color.parse(v):v=e.color.extract(d,"background-color"),v.a=1,v=v.toString());var g=d.children();e('<div style="position:absolute;width:'+g.width()+"px;height:"+g.height()+"px;"+c+"background-color:"+v+';"> </div>').prependTo(d).css("opacity",a.legend.backgroundOpacity)}}}function ct(e,t,n){var r=a.grid.mouseActiveRadius,i=r*r+1,s=null,o=!1,f,l;for(f=u.length-1;f>=0;--f){if(!n(u[f]))continue;var c=u[f],h=c.xaxis,p=c.yaxis,d=c.datapoints.points,v=c.datapoints.pointsize,m=h.c2p(e),g=p.c2p(t),y=r/h.scale,b=r/p.scale;h.options.inverseTransform&&(y=Number.MAX_VALUE),p.options.inverseTransform&&(b=Number.MAX_VALUE);if(c.lines.show||c.points.show)for(l=0;l<d.length;l+=v){var w=d[l],E=d[l+1];if(w==null)continue;if(w-m>y||w-m<-y||E-g>b||E-g<-b)continue;var S=Math.abs(h.p2c(w)-e),x=Math.abs(p.p2c(E)-t),T=S*S+x*x;T<i&&(i=T,s=[f,l/v])}if(c.bars.show&&!s){var N=c.bars.align=="left"?0:-c.bars.barWidth/2,C=N+c.bars.barWidth;for(l=0;l<d.length;l+=v){var w=d[l],E=d[l+1],k=d[l+2];if(w==null)continue;if(u[f].bars.horizontal?m<=Math.max(k,w)&&m>=Math.min(k,w)&&g>=E+N&&g<=E+C:m>=w+N&&m<=w+C&&g>=Math.min(k,E)&&g<=Math.max(k,E))s=[f,l/v]}}}return s?(f=s[0],l=s[1],v=u[f].datapoints.pointsize,{datapoint:u[f].datapoints.points.slice(l*v,(l+1)*v),dataIndex:l,series:u[f],seriesIndex:f}):null}function ht(e){a.grid.hoverable&&vt("plothover",e,function(e){return e["hoverable"]!=0})}function pt(e){a.grid.hoverable&&vt("plothover",e,function(e){return!1})}function dt(e){vt("plotclick",e,function(e){return e["clickable"]!=0})}function vt(e,n,r){var i=c.offset(),s=n.pageX-i.left-m.left,o=n.pageY-i.top-m.top,u=O({left:s,top:o});u.pageX=n.pageX,u.pageY=n.pageY;var f=ct(s,o,r);f&&(f.pageX=parseInt(f.series.xaxis.p2c(f.datapoint[0])+i.left+m.left),f.pageY=parseInt(f.series.yaxis.p2c(f.datapoint[1])+i.top+m.top));if(a.grid.autoHighlight){for(var l=0;l<ft.length;++l){var h=ft[l];h.auto==e&&(!f||h.series!=f.series||h.point[0]!=f.datapoint[0]||h.point[1]!=f.datapoint[1])&&bt(h.series,h.point)}f&&yt(f.series,f.datapoint,e)}t.trigger(e,[u,f])}function mt(){lt||(lt=setTimeout(gt,30))}function gt(){lt=null,p.save(),p.clearRect(0,0,g,y),p.translate(m.left,m.top);var e,t;for(e=0;e<ft.length;++e)t=ft[e],t.series.bars.show?St(t.series,t.point):Et(t.series,t.point);p.restore(),x(E.drawOverlay,[p])}function yt(e,t,n){typeof e=="number"&&(e=u[e]);if(typeof t=="number"){var r=e.datapoints.pointsize;t=e.datapoints.points.slice(r*t,r*(t+1))}var i=wt(e,t);i==-1?(ft.push({series:e,point:t,auto:n}),mt()):n||(ft[i].auto=!1)}function bt(e,t){e==null&&t==null&&(ft=[],mt()),typeof e=="number"&&(e=u[e]),typeof t=="number"&&(t=e.data[t]);var n=wt(e,t);n!=-1&&(ft.splice(n,1),mt())}function wt(e,t){for(var n=0;n<ft.length;++n){var r=ft[n];if(r.series==e&&r.point[0]==t[0]&&r.point[1]==t[1])return n}return-1}function Et(t,n){var r=n[0],i=n[1],s=t.xaxis,o=t.yaxis;if(r<s.min||r>s.max||i<o.min||i>o.max)return;var u=t.points.radius+t.points.lineWidth/2;p.lineWidth=u,p.strokeStyle=e.color.parse(t.color).scale("a",.5).toString();var a=1.5*u,r=s.p2c(r),i=o.p2c(i);p.beginPath(),t.points.symbol=="circle"?p.arc(r,i,a,0,2*Math.PI,!1):t.points.symbol(p,r,i,a,!1),p.closePath(),p.stroke()}function St(t,n){p.lineWidth=t.bars.lineWidth,p.strokeStyle=e.color.parse(t.color).scale("a",.5).toString();var r=e.color.parse(t.color).scale("a",.5).toString(),i=t.bars.align=="left"?0:-t.bars.barWidth/2;st(n[0],n[1],n[2]||0,i,i+t.bars.barWidth,0,function(){return r},t.xaxis,t.yaxis,p,t.bars.horizontal,t.bars.lineWidth)}function xt(t,n,r,i){if(typeof t=="string")return t;var s=h.createLinearGradient(0,r,0,n);for(var o=0,u=t.colors.length;o<u;++o){var a=t.colors[o];if(typeof a!="string"){var f=e.color.parse(i);a.brightness!=null&&(f=f.scale("rgb",a.brightness)),a.opacity!=null&&(f.a*=a.opacity),a=f.toString()}s.addColorStop(o/(u-1),a)}return s}var u=[],a={colors:["#edc240","#afd8f8","#cb4b4b","#4da74d","#9440ed"],legend:{show:!0,noColumns:1,labelFormatter:null,labelBoxBorderColor:"#ccc",container:null,position:"ne",margin:5,backgroundColor:null,backgroundOpacity:.85},xaxis:{show:null,position:"bottom",mode:null,color:null,tickColor:null,transform:null,inverseTransform:null,min:null,max:null,autoscaleMargin:null,ticks:null,tickFormatter:null,labelWidth:null,labelHeight:null,reserveSpace:null,tickLength:null,alignTicksWithAxis:null,tickDecimals:null,tickSize:null,minTickSize:null,monthNames:null,timeformat:null,twelveHourClock:!1},yaxis:{autoscaleMargin:.02,position:"left"},xaxes:[],yaxes:[],series:{points:{show:!1,radius:3,lineWidth:2,fill:!0,fillColor:"#ffffff",symbol:"circle"},lines:{lineWidth:2,fill:!1,fillColor:null,steps:!1},bars:{show:!1,lineWidth:2,barWidth:1,fill:!0,fillColor:null,align:"left",horizontal:!1},shadowSize:3},grid:{show:!0,aboveData:!1,color:"#545454",backgroundColor:null,borderColor:null,tickColor:null,labelMargin:5,axisMargin:8,borderWidth:2,minBorderMargin:null,markings:null,markingsColor:"#f4f4f4",markingsLineWidth:2,clickable:!1,hoverable:!1,autoHighlight:!0,mouseActiveRadius:10},hooks:{}},f=null,l=null,c=null,h=null,p=null,d=[],v=[],m={left:0,right:0,top:0,bottom:0},g=0,y=0,b=0,w=0,E={processOptions:[],processRawData:[],processDatapoints:[],drawSeries:[],draw:[],bindEvents:[],drawOverlay:[],shutdown:[]},S=this;S.setData=C,S.setupGrid=X,S.draw=G,S.getPlaceholder=function(){return t},S.getCanvas=function(){return f},S.getPlotOffset=function(){return m},S.width=function(){return b},S.height=function(){return w},S.offset=function(){var e=c.offset();return e.left+=m.left,e.top+=m.top,e},S.getData=function(){return u},S.getAxes=function(){var t={},n;return e.each(d.concat(v),function(e,n){n&&(t[n.direction+(n.n!=1?n.n:"")+"axis"]=n)}),t},S.getXAxes=function(){return d},S.getYAxes=function(){return v},S.c2p=O,S.p2c=M,S.getOptions=function(){return a},S.highlight=yt,S.unhighlight=bt,S.triggerRedrawOverlay=mt,S.pointOffset=function(e){return{left:parseInt(d[L(e,"x")-1].p2c(+e.x)+m.left),top:parseInt(v[L(e,"y")-1].p2c(+e.y)+m.top)}},S.shutdown=q,S.resize=function(){B(),j(f),j(l)},S.hooks=E,T(S),N(s),F(),C(r),X(),G(),I();var ft=[],lt=null}function n(e,t){return t*Math.floor(e/t)}e.plot=function(n,r,i){var s=new t(e(n),r,i,e.plot.plugins);return s},e.plot.version="0.7",e.plot.plugins=[],e.plot.formatDate=function(e,t,n){var r=function(e){return e=""+e,e.length==1?"0"+e:e},i=[],s=!1,o=!1,u=e.getUTCHours(),a=u<12;n==null&&(n=["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"]),t.search(/%p|%P/)!=-1&&(u>12?u-=12:u==0&&(u=12));for(var f=0;f<t.length;++f){var l=t.charAt(f);if(s){switch(l){case"h":l=""+u;break;case"H":l=r(u);break;case"M":l=r(e.getUTCMinutes());break;case"S":l=r(e.getUTCSeconds());break;case"d":l=""+e.getUTCDate();break;case"m":l=""+(e.getUTCMonth()+1);break;case"y":l=""+e.getUTCFullYear();break;case"b":l=""+n[e.getUTCMonth()];break;case"p":l=a?"am":"pm";break;case"P":l=a?"AM":"PM";break;case"0":l="",o=!0}l&&o&&(l=r(l),o=!1),i.push(l),o||(s=!1)}else l=="%"?s=!0:i.push(l)}return i.join("")}}(jQuery),define("flot",function(){}),function(e){function t(t){function g(e,t){t.series.pie.show&&(t.grid.show=!1,t.series.pie.label.show=="auto"&&(t.legend.show?t.series.pie.label.show=!1:t.series.pie.label.show=!0),t.series.pie.radius=="auto"&&(t.series.pie.label.show?t.series.pie.radius=.75:t.series.pie.radius=1),t.series.pie.tilt>1&&(t.series.pie.tilt=1),t.series.pie.tilt<0&&(t.series.pie.tilt=0),e.hooks.processDatapoints.push(S),e.hooks.drawOverlay.push(j),e.hooks.draw.push(k))}function b(e,t){var n=e.getOptions();n.series.pie.show&&n.grid.hoverable&&t.unbind("mousemove").mousemove(M),n.series.pie.show&&n.grid.clickable&&t.unbind("click").click(_)}function w(e){function n(e,r){r||(r=0);for(var i=0;i<e.length;++i){for(var s=0;s<r;s++)t+="	";typeof e[i]=="object"?(t+=""+i+":\n",n(e[i],r+1)):t+=""+i+": "+e[i]+"\n"}}var t="";n(e),alert(t)}function E(e){for(var t=0;t<e.length;++t){var n=parseFloat(e[t].data[0][1]);n&&(f+=n)}}function S(t,i,o,u){d||(d=!0,r=t.getCanvas(),s=e(r).parent(),n=t.getOptions(),t.setData(C(t.getData())))}function T(){p=s.children().filter(".legend").children().width(),o=Math.min(r.width,r.height/n.series.pie.tilt)/2,a=r.height/2+n.series.pie.offset.top,u=r.width/2,n.series.pie.offset.left=="auto"?n.legend.position.match("w")?u+=p/2:u-=p/2:u+=n.series.pie.offset.left,u<o?u=o:u>r.width-o&&(u=r.width-o)}function N(e){for(var t=0;t<e.length;++t)if(typeof e[t].data=="number")e[t].data=[[1,e[t].data]];else if(typeof e[t].data=="undefined"||typeof e[t].data[0]=="undefined")typeof e[t].data!="undefined"&&typeof e[t].data.label!="undefined"&&(e[t].label=e[t].data.label),e[t].data=[[1,0]];return e}function C(e){e=N(e),E(e);var t=0,r=0,i=n.series.pie.combine.color,s=[];for(var o=0;o<e.length;++o)e[o].data[0][1]=parseFloat(e[o].data[0][1]),e[o].data[0][1]||(e[o].data[0][1]=0),e[o].data[0][1]/f<=n.series.pie.combine.threshold?(t+=e[o].data[0][1],r++,i||(i=e[o].color)):s.push({data:[[1,e[o].data[0][1]]],color:e[o].color,label:e[o].label,angle:e[o].data[0][1]*Math.PI*2/f,percent:e[o].data[0][1]/f*100});return r>0&&s.push({data:[[1,t]],color:i,label:n.series.pie.combine.label,angle:t*Math.PI*2/f,percent:t/f*100}),s}function k(t,i){function d(){ctx.clearRect(0,0,r.width,r.height),s.children().filter(".pieLabel, .pieLabelBackground").remove()}function v(){var e=5,t=15,i=10,s=.02;if(n.series.pie.radius>1)var f=n.series.pie.radius;else var f=o*n.series.pie.radius;if(f>=r.width/2-e||f*n.series.pie.tilt>=r.height/2-t||f<=i)return;ctx.save(),ctx.translate(e,t),ctx.globalAlpha=s,ctx.fillStyle="#000",ctx.translate(u,a),ctx.scale(1,n.series.pie.tilt);for(var l=1;l<=i;l++)ctx.beginPath(),ctx.arc(0,0,f,0,Math.PI*2,!1),ctx.fill(),f-=l;ctx.restore()}function m(){function h(n,r,s){if(n<=0)return;s?ctx.fillStyle=r:(ctx.strokeStyle=r,ctx.lineJoin="round"),ctx.beginPath(),Math.abs(n-Math.PI*2)>1e-9?ctx.moveTo(0,0):e.browser.msie&&(n-=1e-4),ctx.arc(0,0,t,i,i+n,!1),ctx.closePath(),i+=n,s?ctx.fill():ctx.stroke()}function p(){function h(t,o,f){if(t.data[0][1]==0)return;var c=n.legend.labelFormatter,h,p=n.series.pie.label.formatter;c?h=c(t.label,t):h=t.label,p&&(h=p(h,t));var d=(o+t.angle+o)/2,v=u+Math.round(Math.cos(d)*i),m=a+Math.round(Math.sin(d)*i)*n.series.pie.tilt,g='<span class="pieLabel" id="pieLabel'+f+'" style="position:absolute;top:'+m+"px;left:"+v+'px;">'+h+"</span>";s.append(g);var y=s.children("#pieLabel"+f),b=m-y.height()/2,w=v-y.width()/2;y.css("top",b),y.css("left",w);if(0-b>0||0-w>0||r.height-(b+y.height())<0||r.width-(w+y.width())<0)l=!0;if(n.series.pie.label.background.opacity!=0){var E=n.series.pie.label.background.color;E==null&&(E=t.color);var S="top:"+b+"px;left:"+w+"px;";e('<div class="pieLabelBackground" style="position:absolute;width:'+y.width()+"px;height:"+y.height()+"px;"+S+"background-color:"+E+';"> </div>').insertBefore(y).css("opacity",n.series.pie.label.background.opacity)}}var t=startAngle;if(n.series.pie.label.radius>1)var i=n.series.pie.label.radius;else var i=o*n.series.pie.label.radius;for(var c=0;c<f.length;++c)f[c].percent>=n.series.pie.label.threshold*100&&h(f[c],t,c),t+=f[c].angle}startAngle=Math.PI*n.series.pie.startAngle;if(n.series.pie.radius>1)var t=n.series.pie.radius;else var t=o*n.series.pie.radius;ctx.save(),ctx.translate(u,a),ctx.scale(1,n.series.pie.tilt),ctx.save();var i=startAngle;for(var c=0;c<f.length;++c)f[c].startAngle=i,h(f[c].angle,f[c].color,!0);ctx.restore(),ctx.save(),ctx.lineWidth=n.series.pie.stroke.width,i=startAngle;for(var c=0;c<f.length;++c)h(f[c].angle,n.series.pie.stroke.color,!1);ctx.restore(),L(ctx),n.series.pie.label.show&&p(),ctx.restore()}if(!s)return;ctx=i,T();var f=t.getData(),p=0;while(l&&p<c)l=!1,p>0&&(o*=h),p+=1,d(),n.series.pie.tilt<=.8&&v(),m();p>=c&&(d(),s.prepend('<div class="error">Could not draw pie with labels contained inside canvas</div>')),t.setSeries&&t.insertLegend&&(t.setSeries(f),t.insertLegend())}function L(e){n.series.pie.innerRadius>0&&(e.save(),innerRadius=n.series.pie.innerRadius>1?n.series.pie.innerRadius:o*n.series.pie.innerRadius,e.globalCompositeOperation="destination-out",e.beginPath(),e.fillStyle=n.series.pie.stroke.color,e.arc(0,0,innerRadius,0,Math.PI*2,!1),e.fill(),e.closePath(),e.restore(),e.save(),e.beginPath(),e.strokeStyle=n.series.pie.stroke.color,e.arc(0,0,innerRadius,0,Math.PI*2,!1),e.stroke(),e.closePath(),e.restore())}function A(e,t){for(var n=!1,r=-1,i=e.length,s=i-1;++r<i;s=r)(e[r][1]<=t[1]&&t[1]<e[s][1]||e[s][1]<=t[1]&&t[1]<e[r][1])&&t[0]<(e[s][0]-e[r][0])*(t[1]-e[r][1])/(e[s][1]-e[r][1])+e[r][0]&&(n=!n);return n}function O(e,n){var r=t.getData(),i=t.getOptions(),s=i.series.pie.radius>1?i.series.pie.radius:o*i.series.pie.radius;for(var f=0;f<r.length;++f){var l=r[f];if(l.pie.show){ctx.save(),ctx.beginPath(),ctx.moveTo(0,0),ctx.arc(0,0,s,l.startAngle,l.startAngle+l.angle,!1),ctx.closePath(),x=e-u,y=n-a;if(ctx.isPointInPath){if(ctx.isPointInPath(e-u,n-a))return ctx.restore(),{datapoint:[l.percent,l.data],dataIndex:0,series:l,seriesIndex:f}}else{p1X=s*Math.cos(l.startAngle),p1Y=s*Math.sin(l.startAngle),p2X=s*Math.cos(l.startAngle+l.angle/4),p2Y=s*Math.sin(l.startAngle+l.angle/4),p3X=s*Math.cos(l.startAngle+l.angle/2),p3Y=s*Math.sin(l.startAngle+l.angle/2),p4X=s*Math.cos(l.startAngle+l.angle/1.5),p4Y=s*Math.sin(l.startAngle+l.angle/1.5),p5X=s*Math.cos(l.startAngle+l.angle),p5Y=s*Math.sin(l.startAngle+l.angle),arrPoly=[[0,0],[p1X,p1Y],[p2X,p2Y],[p3X,p3Y],[p4X,p4Y],[p5X,p5Y]],arrPoint=[x,y];if(A(arrPoly,arrPoint))return ctx.restore(),{datapoint:[l.percent,l.data],dataIndex:0,series:l,seriesIndex:f}}ctx.restore()}}return null}function M(e){D("plothover",e)}function _(e){D("plotclick",e)}function D(e,r){var i=t.offset(),o=parseInt(r.pageX-i.left),u=parseInt(r.pageY-i.top),a=O(o,u);if(n.grid.autoHighlight)for(var f=0;f<m.length;++f){var l=m[f];l.auto==e&&(!a||l.series!=a.series)&&H(l.series)}a&&P(a.series,e);var c={pageX:r.pageX,pageY:r.pageY};s.trigger(e,[c,a])}function P(e,n){typeof e=="number"&&(e=series[e]);var r=B(e);r==-1?(m.push({series:e,auto:n}),t.triggerRedrawOverlay()):n||(m[r].auto=!1)}function H(e){e==null&&(m=[],t.triggerRedrawOverlay()),typeof e=="number"&&(e=series[e]);var n=B(e);n!=-1&&(m.splice(n,1),t.triggerRedrawOverlay())}function B(e){for(var t=0;t<m.length;++t){var n=m[t];if(n.series==e)return t}return-1}function j(e,t){function s(e){if(e.angle<0)return;t.fillStyle="rgba(255, 255, 255, "+n.series.pie.highlight.opacity+")",t.beginPath(),Math.abs(e.angle-Math.PI*2)>1e-9&&t.moveTo(0,0),t.arc(0,0,r,e.startAngle,e.startAngle+e.angle,!1),t.closePath(),t.fill()}var n=e.getOptions(),r=n.series.pie.radius>1?n.series.pie.radius:o*n.series.pie.radius;t.save(),t.translate(u,a),t.scale(1,n.series.pie.tilt);for(i=0;i<m.length;++i)s(m[i].series);L(t),t.restore()}var r=null,s=null,o=null,u=null,a=null,f=0,l=!0,c=10,h=.95,p=0,d=!1,v=!1,m=[];t.hooks.processOptions.push(g),t.hooks.bindEvents.push(b)}var n={series:{pie:{show:!1,radius:"auto",innerRadius:0,startAngle:1.5,tilt:1,offset:{top:0,left:"auto"},stroke:{color:"#FFF",width:1},label:{show:"auto",formatter:function(e,t){return'<div style="font-size:x-small;text-align:center;padding:2px;color:'+t.color+';">'+e+"<br/>"+Math.round(t.percent)+"%</div>"},radius:1,background:{color:null,opacity:0},threshold:0},combine:{threshold:-1,color:null,label:"Other"},highlight:{opacity:.5}}}};e.plot.plugins.push({init:t,options:n,name:"pie",version:"1.0"})}(jQuery),define("flot.pie",function(){}),function(e){function r(n,r,a){return t=a||{},t.target_el=n,typeof r=="string"?o(r):u(r),e.extend(this,{getObject:s,getJSON:i,setObject:u,setJSON:o}),this}function i(){return JSON.stringify(n)}function s(){return n}function o(e){u(JSON.parse(e))}function u(e){e!==null&&(n=e,N())}function a(e){return Object.prototype.toString.call(e)=="[object Object]"}function f(e){return Object.prototype.toString.call(e)=="[object Array]"}function l(e){return Object.prototype.toString.call(e)=="[object Boolean]"}function c(e){return Object.prototype.toString.call(e)=="[object Number]"}function h(e){return Object.prototype.toString.call(e)=="[object String]"}function p(e,t,n){var r=arguments.length==2;if(t.indexOf(".")>-1){var i=e,s=0,o=t.split(".");for(var u=o.length;s<u-1;s++)i=i[o[s]];r?delete i[o[u-1]]:i[o[u-1]]=n}else r?delete e[t]:e[t]=n;return e}function d(e,t,n){if(t.indexOf(".")>-1){var r=e,i=0,s=t.split(".");for(var o=s.length;i<o-1;i++)r=r[s[i]];r[n]=r[s[o-1]],delete r[s[o-1]]}else n&&(e[n]=e[t]),delete e[t];return e}function v(e,t,n){t=t.split(".");var r=0;while(r<t.length)if((e=e[t[r++]])==undefined)return n;return e}function m(e,t,r){var i=e,s=0,o=v(n,t);while(typeof o[i]!="undefined")s++,i=e+" "+s;var u=(t?t+".":"")+i;p(n,u,r),N(),y(u),g(t)}function g(n){path_bits=n.match(/(.+)\.([^\.]+)/),path_bits&&path_bits[1]&&path_bits[2]&&e('div[data-path="'+path_bits[1]+'"]'+'[data-key="'+path_bits[2]+'"]',t.target_el).addClass("expanded")}function y(r){t.change.apply(this,[n,r]),t.valueField&&e(t.valueField).val(this.getJSON())}function b(n,r){n.preventDefault(),n.stopPropagation();var i=e(n.target);i.hasClass("expander")&&i.parent().toggleClass("expanded"),i.hasClass("add-property")&&m(t.newSingleKey||"NewKey",r,""),i.hasClass("add-group")&&m(t.newGroupKey||"NewGroupKey",r,{})}function w(t){var r=e(t.target).parent().data("path"),i=e(t.target).next().val(),s=e(t.target).val(),o=e(t.target).attr("title");d(n,(r?r+".":"")+o,s),N(),y((r?r+".":"")+s)}function E(t){var r=e(t.target).prev().val(),i=e(t.target).parent(),s=i.data("path"),o=e(t.target).val()||"null",u=(s?s+".":"")+r;p(n,u,o),N(),y(u)}function S(e,t){var n="null";a(t)?n="object":f(t)?n="array":l(t)?n="boolean":h(t)?n="string":c(t)&&(n="number"),e.removeClass("object array boolean string number null"),e.addClass(n)}function x(t,n){if(t.children(".expander").length==0){var r=e("<span>",{"class":n||"expander"});t.prepend(r)}}function T(n,r,i){i=i||"",r.children(".item").remove();var s=Object.keys(n);s.sort(),e.each(s,function(s,o){var u={};u.item=e("<div>",{"class":"item","data-path":i,"data-key":o}),u.property=e(t.propertyElement||"<input>",{"class":"property"}),u.property.val(o).attr("title",o),u.property.change(w);if(a(n[o])||f(n[o])){var l=Object.keys(n[o]).length;l+=l==1?" item":" items",x(u.item),u.value=e(t.groupElement||"<span>",{"class":"value-group"}),u.value.append('<span class="value-group-count">'+l+"</span>",e(t.buttonElement||'<button class="add-property">Add item</button>'),e(t.buttonElement||'<button class="add-group">Add group</button>'))}else u.value=e(t.valueElement||"<input>",{"class":"value",value:n[o],title:n[o]}),u.value.change(E);var c=t.drawproperty.apply(this,[t,n,r,i,o]);if(c)for(var h in c)u[h]=c[h];(a(n[o])||f(n[o]))&&u.item.bind("click",function(e){b(e,(i?i+".":"")+o,t)}),u.item.append(u.property,u.value),r.append(u.item),S(u.item,n[o]),(a(n[o])||f(n[o]))&&T(n[o],u.item,(i?i+".":"")+o)})}function N(){var r=[];e(".expanded",t.target_el).each(function(t,n){r.push([e(n).data("path"),e(n).data("key")])}),T(n,t.target_el),e.each(r,function(n,r){e('div[data-path="'+r[0]+'"]'+'[data-key="'+r[1]+'"]',t.target_el).addClass("expanded")})}var t,n;e.fn.jsonEditor=function(t,n){var i=n||{},s=function(){};return i.change||(i.change=s),i.drawproperty||(i.drawproperty=s),this.length>1?this.each(function(){e(this).jsonEditor(t,n)}):r(e(this),t,i)}}(jQuery),Object.keys||(Object.keys=function(){var e=Object.prototype.hasOwnProperty,t=!{toString:null}.propertyIsEnumerable("toString"),n=["toString","toLocaleString","valueOf","hasOwnProperty","isPrototypeOf","propertyIsEnumerable","constructor"],r=n.length;return function(i){if(typeof i!="object"&&typeof i!="function"||i===null)throw new TypeError("Object.keys called on non-object");var s=[];for(var o in i)e.call(i,o)&&s.push(o);if(t)for(var u=0;u<r;u++)e.call(i,n[u])&&s.push(n[u]);return s}}()),define("jsoneditor",function(){}),function(){var e=this,t=e._,n={},r=Array.prototype,i=Object.prototype,s=Function.prototype,o=r.push,u=r.slice,a=r.concat,f=i.toString,l=i.hasOwnProperty,c=r.forEach,h=r.map,p=r.reduce,d=r.reduceRight,v=r.filter,m=r.every,g=r.some,y=r.indexOf,b=r.lastIndexOf,w=Array.isArray,E=Object.keys,S=s.bind,x=function(e){if(e instanceof x)return e;if(!(this instanceof x))return new x(e);this._wrapped=e};typeof exports!="undefined"?(typeof module!="undefined"&&module.exports&&(exports=module.exports=x),exports._=x):e._=x,x.VERSION="1.4.4";var T=x.each=x.forEach=function(e,t,r){if(e==null)return;if(c&&e.forEach===c)e.forEach(t,r);else if(e.length===+e.length){for(var i=0,s=e.length;i<s;i++)if(t.call(r,e[i],i,e)===n)return}else for(var o in e)if(x.has(e,o)&&t.call(r,e[o],o,e)===n)return};x.map=x.collect=function(e,t,n){var r=[];return e==null?r:h&&e.map===h?e.map(t,n):(T(e,function(e,i,s){r[r.length]=t.call(n,e,i,s)}),r)};var N="Reduce of empty array with no initial value";x.reduce=x.foldl=x.inject=function(e,t,n,r){var i=arguments.length>2;e==null&&(e=[]);if(p&&e.reduce===p)return r&&(t=x.bind(t,r)),i?e.reduce(t,n):e.reduce(t);T(e,function(e,s,o){i?n=t.call(r,n,e,s,o):(n=e,i=!0)});if(!i)throw new TypeError(N);return n},x.reduceRight=x.foldr=function(e,t,n,r){var i=arguments.length>2;e==null&&(e=[]);if(d&&e.reduceRight===d)return r&&(t=x.bind(t,r)),i?e.reduceRight(t,n):e.reduceRight(t);var s=e.length;if(s!==+s){var o=x.keys(e);s=o.length}T(e,function(u,a,f){a=o?o[--s]:--s,i?n=t.call(r,n,e[a],a,f):(n=e[a],i=!0)});if(!i)throw new TypeError(N);return n},x.find=x.detect=function(e,t,n){var r;return C(e,function(e,i,s){if(t.call(n,e,i,s))return r=e,!0}),r},x.filter=x.select=function(e,t,n){var r=[];return e==null?r:v&&e.filter===v?e.filter(t,n):(T(e,function(e,i,s){t.call(n,e,i,s)&&(r[r.length]=e)}),r)},x.reject=function(e,t,n){return x.filter(e,function(e,r,i){return!t.call(n,e,r,i)},n)},x.every=x.all=function(e,t,r){t||(t=x.identity);var i=!0;return e==null?i:m&&e.every===m?e.every(t,r):(T(e,function(e,s,o){if(!(i=i&&t.call(r,e,s,o)))return n}),!!i)};var C=x.some=x.any=function(e,t,r){t||(t=x.identity);var i=!1;return e==null?i:g&&e.some===g?e.some(t,r):(T(e,function(e,s,o){if(i||(i=t.call(r,e,s,o)))return n}),!!i)};x.contains=x.include=function(e,t){return e==null?!1:y&&e.indexOf===y?e.indexOf(t)!=-1:C(e,function(e){return e===t})},x.invoke=function(e,t){var n=u.call(arguments,2),r=x.isFunction(t);return x.map(e,function(e){return(r?t:e[t]).apply(e,n)})},x.pluck=function(e,t){return x.map(e,function(e){return e[t]})},x.where=function(e,t,n){return x.isEmpty(t)?n?null:[]:x[n?"find":"filter"](e,function(e){for(var n in t)if(t[n]!==e[n])return!1;return!0})},x.findWhere=function(e,t){return x.where(e,t,!0)},x.max=function(e,t,n){if(!t&&x.isArray(e)&&e[0]===+e[0]&&e.length<65535)return Math.max.apply(Math,e);if(!t&&x.isEmpty(e))return-Infinity;var r={computed:-Infinity,value:-Infinity};return T(e,function(e,i,s){var o=t?t.call(n,e,i,s):e;o>=r.computed&&(r={value:e,computed:o})}),r.value},x.min=function(e,t,n){if(!t&&x.isArray(e)&&e[0]===+e[0]&&e.length<65535)return Math.min.apply(Math,e);if(!t&&x.isEmpty(e))return Infinity;var r={computed:Infinity,value:Infinity};return T(e,function(e,i,s){var o=t?t.call(n,e,i,s):e;o<r.computed&&(r={value:e,computed:o})}),r.value},x.shuffle=function(e){var t,n=0,r=[];return T(e,function(e){t=x.random(n++),r[n-1]=r[t],r[t]=e}),r};var k=function(e){return x.isFunction(e)?e:function(t){return t[e]}};x.sortBy=function(e,t,n){var r=k(t);return x.pluck(x.map(e,function(e,t,i){return{value:e,index:t,criteria:r.call(n,e,t,i)}}).sort(function(e,t){var n=e.criteria,r=t.criteria;if(n!==r){if(n>r||n===void 0)return 1;if(n<r||r===void 0)return-1}return e.index<t.index?-1:1}),"value")};var L=function(e,t,n,r){var i={},s=k(t||x.identity);return T(e,function(t,o){var u=s.call(n,t,o,e);r(i,u,t)}),i};x.groupBy=function(e,t,n){return L(e,t,n,function(e,t,n){(x.has(e,t)?e[t]:e[t]=[]).push(n)})},x.countBy=function(e,t,n){return L(e,t,n,function(e,t){x.has(e,t)||(e[t]=0),e[t]++})},x.sortedIndex=function(e,t,n,r){n=n==null?x.identity:k(n);var i=n.call(r,t),s=0,o=e.length;while(s<o){var u=s+o>>>1;n.call(r,e[u])<i?s=u+1:o=u}return s},x.toArray=function(e){return e?x.isArray(e)?u.call(e):e.length===+e.length?x.map(e,x.identity):x.values(e):[]},x.size=function(e){return e==null?0:e.length===+e.length?e.length:x.keys(e).length},x.first=x.head=x.take=function(e,t,n){return e==null?void 0:t!=null&&!n?u.call(e,0,t):e[0]},x.initial=function(e,t,n){return u.call(e,0,e.length-(t==null||n?1:t))},x.last=function(e,t,n){return e==null?void 0:t!=null&&!n?u.call(e,Math.max(e.length-t,0)):e[e.length-1]},x.rest=x.tail=x.drop=function(e,t,n){return u.call(e,t==null||n?1:t)},x.compact=function(e){return x.filter(e,x.identity)};var A=function(e,t,n){return T(e,function(e){x.isArray(e)?t?o.apply(n,e):A(e,t,n):n.push(e)}),n};x.flatten=function(e,t){return A(e,t,[])},x.without=function(e){return x.difference(e,u.call(arguments,1))},x.uniq=x.unique=function(e,t,n,r){x.isFunction(t)&&(r=n,n=t,t=!1);var i=n?x.map(e,n,r):e,s=[],o=[];return T(i,function(n,r){if(t?!r||o[o.length-1]!==n:!x.contains(o,n))o.push(n),s.push(e[r])}),s},x.union=function(){return x.uniq(a.apply(r,arguments))},x.intersection=function(e){var t=u.call(arguments,1);return x.filter(x.uniq(e),function(e){return x.every(t,function(t){return x.indexOf(t,e)>=0})})},x.difference=function(e){var t=a.apply(r,u.call(arguments,1));return x.filter(e,function(e){return!x.contains(t,e)})},x.zip=function(){var e=u.call(arguments),t=x.max(x.pluck(e,"length")),n=new Array(t);for(var r=0;r<t;r++)n[r]=x.pluck(e,""+r);return n},x.object=function(e,t){if(e==null)return{};var n={};for(var r=0,i=e.length;r<i;r++)t?n[e[r]]=t[r]:n[e[r][0]]=e[r][1];return n},x.indexOf=function(e,t,n){if(e==null)return-1;var r=0,i=e.length;if(n){if(typeof n!="number")return r=x.sortedIndex(e,t),e[r]===t?r:-1;r=n<0?Math.max(0,i+n):n}if(y&&e.indexOf===y)return e.indexOf(t,n);for(;r<i;r++)if(e[r]===t)return r;return-1},x.lastIndexOf=function(e,t,n){if(e==null)return-1;var r=n!=null;if(b&&e.lastIndexOf===b)return r?e.lastIndexOf(t,n):e.lastIndexOf(t);var i=r?n:e.length;while(i--)if(e[i]===t)return i;return-1},x.range=function(e,t,n){arguments.length<=1&&(t=e||0,e=0),n=arguments[2]||1;var r=Math.max(Math.ceil((t-e)/n),0),i=0,s=new Array(r);while(i<r)s[i++]=e,e+=n;return s},x.bind=function(e,t){if(e.bind===S&&S)return S.apply(e,u.call(arguments,1));var n=u.call(arguments,2);return function(){return e.apply(t,n.concat(u.call(arguments)))}},x.partial=function(e){var t=u.call(arguments,1);return function(){return e.apply(this,t.concat(u.call(arguments)))}},x.bindAll=function(e){var t=u.call(arguments,1);return t.length===0&&(t=x.functions(e)),T(t,function(t){e[t]=x.bind(e[t],e)}),e},x.memoize=function(e,t){var n={};return t||(t=x.identity),function(){var r=t.apply(this,arguments);return x.has(n,r)?n[r]:n[r]=e.apply(this,arguments)}},x.delay=function(e,t){var n=u.call(arguments,2);return setTimeout(function(){return e.apply(null,n)},t)},x.defer=function(e){return x.delay.apply(x,[e,1].concat(u.call(arguments,1)))},x.throttle=function(e,t){var n,r,i,s,o=0,u=function(){o=new Date,i=null,s=e.apply(n,r)};return function(){var a=new Date,f=t-(a-o);return n=this,r=arguments,f<=0?(clearTimeout(i),i=null,o=a,s=e.apply(n,r)):i||(i=setTimeout(u,f)),s}},x.debounce=function(e,t,n){var r,i;return function(){var s=this,o=arguments,u=function(){r=null,n||(i=e.apply(s,o))},a=n&&!r;return clearTimeout(r),r=setTimeout(u,t),a&&(i=e.apply(s,o)),i}},x.once=function(e){var t=!1,n;return function(){return t?n:(t=!0,n=e.apply(this,arguments),e=null,n)}},x.wrap=function(e,t){return function(){var n=[e];return o.apply(n,arguments),t.apply(this,n)}},x.compose=function(){var e=arguments;return function(){var t=arguments;for(var n=e.length-1;n>=0;n--)t=[e[n].apply(this,t)];return t[0]}},x.after=function(e,t){return e<=0?t():function(){if(--e<1)return t.apply(this,arguments)}},x.keys=E||function(e){if(e!==Object(e))throw new TypeError("Invalid object");var t=[];for(var n in e)x.has(e,n)&&(t[t.length]=n);return t},x.values=function(e){var t=[];for(var n in e)x.has(e,n)&&t.push(e[n]);return t},x.pairs=function(e){var t=[];for(var n in e)x.has(e,n)&&t.push([n,e[n]]);return t},x.invert=function(e){var t={};for(var n in e)x.has(e,n)&&(t[e[n]]=n);return t},x.functions=x.methods=function(e){var t=[];for(var n in e)x.isFunction(e[n])&&t.push(n);return t.sort()},x.extend=function(e){return T(u.call(arguments,1),function(t){if(t)for(var n in t)e[n]=t[n]}),e},x.pick=function(e){var t={},n=a.apply(r,u.call(arguments,1));return T(n,function(n){n in e&&(t[n]=e[n])}),t},x.omit=function(e){var t={},n=a.apply(r,u.call(arguments,1));for(var i in e)x.contains(n,i)||(t[i]=e[i]);return t},x.defaults=function(e){return T(u.call(arguments,1),function(t){if(t)for(var n in t)e[n]==null&&(e[n]=t[n])}),e},x.clone=function(e){return x.isObject(e)?x.isArray(e)?e.slice():x.extend({},e):e},x.tap=function(e,t){return t(e),e};var O=function(e,t,n,r){if(e===t)return e!==0||1/e==1/t;if(e==null||t==null)return e===t;e instanceof x&&(e=e._wrapped),t instanceof x&&(t=t._wrapped);var i=f.call(e);if(i!=f.call(t))return!1;switch(i){case"[object String]":return e==String(t);case"[object Number]":return e!=+e?t!=+t:e==0?1/e==1/t:e==+t;case"[object Date]":case"[object Boolean]":return+e==+t;case"[object RegExp]":return e.source==t.source&&e.global==t.global&&e.multiline==t.multiline&&e.ignoreCase==t.ignoreCase}if(typeof e!="object"||typeof t!="object")return!1;var s=n.length;while(s--)if(n[s]==e)return r[s]==t;n.push(e),r.push(t);var o=0,u=!0;if(i=="[object Array]"){o=e.length,u=o==t.length;if(u)while(o--)if(!(u=O(e[o],t[o],n,r)))break}else{var a=e.constructor,l=t.constructor;if(a!==l&&!(x.isFunction(a)&&a instanceof a&&x.isFunction(l)&&l instanceof l))return!1;for(var c in e)if(x.has(e,c)){o++;if(!(u=x.has(t,c)&&O(e[c],t[c],n,r)))break}if(u){for(c in t)if(x.has(t,c)&&!(o--))break;u=!o}}return n.pop(),r.pop(),u};x.isEqual=function(e,t){return O(e,t,[],[])},x.isEmpty=function(e){if(e==null)return!0;if(x.isArray(e)||x.isString(e))return e.length===0;for(var t in e)if(x.has(e,t))return!1;return!0},x.isElement=function(e){return!!e&&e.nodeType===1},x.isArray=w||function(e){return f.call(e)=="[object Array]"},x.isObject=function(e){return e===Object(e)},T(["Arguments","Function","String","Number","Date","RegExp"],function(e){x["is"+e]=function(t){return f.call(t)=="[object "+e+"]"}}),x.isArguments(arguments)||(x.isArguments=function(e){return!!e&&!!x.has(e,"callee")}),typeof /./!="function"&&(x.isFunction=function(e){return typeof e=="function"}),x.isFinite=function(e){return isFinite(e)&&!isNaN(parseFloat(e))},x.isNaN=function(e){return x.isNumber(e)&&e!=+e},x.isBoolean=function(e){return e===!0||e===!1||f.call(e)=="[object Boolean]"},x.isNull=function(e){return e===null},x.isUndefined=function(e){return e===void 0},x.has=function(e,t){return l.call(e,t)},x.noConflict=function(){return e._=t,this},x.identity=function(e){return e},x.times=function(e,t,n){var r=Array(e);for(var i=0;i<e;i++)r[i]=t.call(n,i);return r},x.random=function(e,t){return t==null&&(t=e,e=0),e+Math.floor(Math.random()*(t-e+1))};var M={escape:{"&":"&amp;","<":"&lt;",">":"&gt;",'"':"&quot;","'":"&#x27;","/":"&#x2F;"}};M.unescape=x.invert(M.escape);var _={escape:new RegExp("["+x.keys(M.escape).join("")+"]","g"),unescape:new RegExp("("+x.keys(M.unescape).join("|")+")","g")};x.each(["escape","unescape"],function(e){x[e]=function(t){return t==null?"":(""+t).replace(_[e],function(t){return M[e][t]})}}),x.result=function(e,t){if(e==null)return null;var n=e[t];return x.isFunction(n)?n.call(e):n},x.mixin=function(e){T(x.functions(e),function(t){var n=x[t]=e[t];x.prototype[t]=function(){var e=[this._wrapped];return o.apply(e,arguments),j.call(this,n.apply(x,e))}})};var D=0;x.uniqueId=function(e){var t=++D+"";return e?e+t:t},x.templateSettings={evaluate:/<%([\s\S]+?)%>/g,interpolate:/<%=([\s\S]+?)%>/g,escape:/<%-([\s\S]+?)%>/g};var P=/(.)^/,H={"'":"'","\\":"\\","\r":"r","\n":"n","	":"t","\u2028":"u2028","\u2029":"u2029"},B=/\\|'|\r|\n|\t|\u2028|\u2029/g;x.template=function(e,t,n){var r;n=x.defaults({},n,x.templateSettings);var i=new RegExp([(n.escape||P).source,(n.interpolate||P).source,(n.evaluate||P).source].join("|")+"|$","g"),s=0,o="__p+='";e.replace(i,function(t,n,r,i,u){return o+=e.slice(s,u).replace(B,function(e){return"\\"+H[e]}),n&&(o+="'+\n((__t=("+n+"))==null?'':_.escape(__t))+\n'"),r&&(o+="'+\n((__t=("+r+"))==null?'':__t)+\n'"),i&&(o+="';\n"+i+"\n__p+='"),s=u+t.length,t}),o+="';\n",n.variable||(o="with(obj||{}){\n"+o+"}\n"),o="var __t,__p='',__j=Array.prototype.join,print=function(){__p+=__j.call(arguments,'');};\n"+o+"return __p;\n";try{r=new Function(n.variable||"obj","_",o)}catch(u){throw u.source=o,u}if(t)return r(t,x);var a=function(e){return r.call(this,e,x)};return a.source="function("+(n.variable||"obj")+"){\n"+o+"}",a},x.chain=function(e){return x(e).chain()};var j=function(e){return this._chain?x(e).chain():e};x.mixin(x),T(["pop","push","reverse","shift","sort","splice","unshift"],function(e){var t=r[e];x.prototype[e]=function(){var n=this._wrapped;return t.apply(n,arguments),(e=="shift"||e=="splice")&&n.length===0&&delete n[0],j.call(this,n)}}),T(["concat","join","slice"],function(e){var t=r[e];x.prototype[e]=function(){return j.call(this,t.apply(this._wrapped,arguments))}}),x.extend(x.prototype,{chain:function(){return this._chain=!0,this},value:function(){return this._wrapped}}),typeof define=="function"&&define.amd&&define("underscore",[],function(){return x})}.call(this),function(e,t){typeof exports!="undefined"?t(e,exports,require("underscore")):typeof define=="function"&&define.amd?define("backbone",["underscore","jquery","exports"],function(n,r,i){e.Backbone=t(e,i,n,r)}):e.Backbone=t(e,{},e._,e.jQuery||e.Zepto||e.ender||e.$)}(this,function(e,t,n,r){var i=e.Backbone,s=[],o=s.push,u=s.slice,a=s.splice;t.VERSION="1.0.0",t.$=r,t.noConflict=function(){return e.Backbone=i,this},t.emulateHTTP=!1,t.emulateJSON=!1;var f=t.Events={on:function(e,t,n){if(!c(this,"on",e,[t,n])||!t)return this;this._events||(this._events={});var r=this._events[e]||(this._events[e]=[]);return r.push({callback:t,context:n,ctx:n||this}),this},once:function(e,t,r){if(!c(this,"once",e,[t,r])||!t)return this;var i=this,s=n.once(function(){i.off(e,s),t.apply(this,arguments)});return s._callback=t,this.on(e,s,r)},off:function(e,t,r){var i,s,o,u,a,f,l,h;if(!this._events||!c(this,"off",e,[t,r]))return this;if(!e&&!t&&!r)return this._events={},this;u=e?[e]:n.keys(this._events);for(a=0,f=u.length;a<f;a++){e=u[a];if(o=this._events[e]){this._events[e]=i=[];if(t||r)for(l=0,h=o.length;l<h;l++)s=o[l],(t&&t!==s.callback&&t!==s.callback._callback||r&&r!==s.context)&&i.push(s);i.length||delete this._events[e]}}return this},trigger:function(e){if(!this._events)return this;var t=u.call(arguments,1);if(!c(this,"trigger",e,t))return this;var n=this._events[e],r=this._events.all;return n&&h(n,t),r&&h(r,arguments),this},stopListening:function(e,t,n){var r=this._listeners;if(!r)return this;var i=!t&&!n;typeof t=="object"&&(n=this),e&&((r={})[e._listenerId]=e);for(var s in r)r[s].off(t,n,this),i&&delete this._listeners[s];return this}},l=/\s+/,c=function(e,t,n,r){if(!n)return!0;if(typeof n=="object"){for(var i in n)e[t].apply(e,[i,n[i]].concat(r));return!1}if(l.test(n)){var s=n.split(l);for(var o=0,u=s.length;o<u;o++)e[t].apply(e,[s[o]].concat(r));return!1}return!0},h=function(e,t){var n,r=-1,i=e.length,s=t[0],o=t[1],u=t[2];switch(t.length){case 0:while(++r<i)(n=e[r]).callback.call(n.ctx);return;case 1:while(++r<i)(n=e[r]).callback.call(n.ctx,s);return;case 2:while(++r<i)(n=e[r]).callback.call(n.ctx,s,o);return;case 3:while(++r<i)(n=e[r]).callback.call(n.ctx,s,o,u);return;default:while(++r<i)(n=e[r]).callback.apply(n.ctx,t)}},p={listenTo:"on",listenToOnce:"once"};n.each(p,function(e,t){f[t]=function(t,r,i){var s=this._listeners||(this._listeners={}),o=t._listenerId||(t._listenerId=n.uniqueId("l"));return s[o]=t,typeof r=="object"&&(i=this),t[e](r,i,this),this}}),f.bind=f.on,f.unbind=f.off,n.extend(t,f);var d=t.Model=function(e,t){var r,i=e||{};t||(t={}),this.cid=n.uniqueId("c"),this.attributes={},n.extend(this,n.pick(t,v)),t.parse&&(i=this.parse(i,t)||{});if(r=n.result(this,"defaults"))i=n.defaults({},i,r);this.set(i,t),this.changed={},this.initialize.apply(this,arguments)},v=["url","urlRoot","collection"];n.extend(d.prototype,f,{changed:null,validationError:null,idAttribute:"id",initialize:function(){},toJSON:function(e){return n.clone(this.attributes)},sync:function(){return t.sync.apply(this,arguments)},get:function(e){return this.attributes[e]},escape:function(e){return n.escape(this.get(e))},has:function(e){return this.get(e)!=null},set:function(e,t,r){var i,s,o,u,a,f,l,c;if(e==null)return this;typeof e=="object"?(s=e,r=t):(s={})[e]=t,r||(r={});if(!this._validate(s,r))return!1;o=r.unset,a=r.silent,u=[],f=this._changing,this._changing=!0,f||(this._previousAttributes=n.clone(this.attributes),this.changed={}),c=this.attributes,l=this._previousAttributes,this.idAttribute in s&&(this.id=s[this.idAttribute]);for(i in s)t=s[i],n.isEqual(c[i],t)||u.push(i),n.isEqual(l[i],t)?delete this.changed[i]:this.changed[i]=t,o?delete c[i]:c[i]=t;if(!a){u.length&&(this._pending=!0);for(var h=0,p=u.length;h<p;h++)this.trigger("change:"+u[h],this,c[u[h]],r)}if(f)return this;if(!a)while(this._pending)this._pending=!1,this.trigger("change",this,r);return this._pending=!1,this._changing=!1,this},unset:function(e,t){return this.set(e,void 0,n.extend({},t,{unset:!0}))},clear:function(e){var t={};for(var r in this.attributes)t[r]=void 0;return this.set(t,n.extend({},e,{unset:!0}))},hasChanged:function(e){return e==null?!n.isEmpty(this.changed):n.has(this.changed,e)},changedAttributes:function(e){if(!e)return this.hasChanged()?n.clone(this.changed):!1;var t,r=!1,i=this._changing?this._previousAttributes:this.attributes;for(var s in e){if(n.isEqual(i[s],t=e[s]))continue;(r||(r={}))[s]=t}return r},previous:function(e){return e==null||!this._previousAttributes?null:this._previousAttributes[e]},previousAttributes:function(){return n.clone(this._previousAttributes)},fetch:function(e){e=e?n.clone(e):{},e.parse===void 0&&(e.parse=!0);var t=this,r=e.success;return e.success=function(n){if(!t.set(t.parse(n,e),e))return!1;r&&r(t,n,e),t.trigger("sync",t,n,e)},F(this,e),this.sync("read",this,e)},save:function(e,t,r){var i,s,o,u=this.attributes;e==null||typeof e=="object"?(i=e,r=t):(i={})[e]=t;if(i&&(!r||!r.wait)&&!this.set(i,r))return!1;r=n.extend({validate:!0},r);if(!this._validate(i,r))return!1;i&&r.wait&&(this.attributes=n.extend({},u,i)),r.parse===void 0&&(r.parse=!0);var a=this,f=r.success;return r.success=function(e){a.attributes=u;var t=a.parse(e,r);r.wait&&(t=n.extend(i||{},t));if(n.isObject(t)&&!a.set(t,r))return!1;f&&f(a,e,r),a.trigger("sync",a,e,r)},F(this,r),s=this.isNew()?"create":r.patch?"patch":"update",s==="patch"&&(r.attrs=i),o=this.sync(s,this,r),i&&r.wait&&(this.attributes=u),o},destroy:function(e){e=e?n.clone(e):{};var t=this,r=e.success,i=function(){t.trigger("destroy",t,t.collection,e)};e.success=function(n){(e.wait||t.isNew())&&i(),r&&r(t,n,e),t.isNew()||t.trigger("sync",t,n,e)};if(this.isNew())return e.success(),!1;F(this,e);var s=this.sync("delete",this,e);return e.wait||i(),s},url:function(){var e=n.result(this,"urlRoot")||n.result(this.collection,"url")||j();return this.isNew()?e:e+(e.charAt(e.length-1)==="/"?"":"/")+encodeURIComponent(this.id)},parse:function(e,t){return e},clone:function(){return new this.constructor(this.attributes)},isNew:function(){return this.id==null},isValid:function(e){return this._validate({},n.extend(e||{},{validate:!0}))},_validate:function(e,t){if(!t.validate||!this.validate)return!0;e=n.extend({},this.attributes,e);var r=this.validationError=this.validate(e,t)||null;return r?(this.trigger("invalid",this,r,n.extend(t||{},{validationError:r})),!1):!0}});var m=["keys","values","pairs","invert","pick","omit"];n.each(m,function(e){d.prototype[e]=function(){var t=u.call(arguments);return t.unshift(this.attributes),n[e].apply(n,t)}});var g=t.Collection=function(e,t){t||(t={}),t.url&&(this.url=t.url),t.model&&(this.model=t.model),t.comparator!==void 0&&(this.comparator=t.comparator),this._reset(),this.initialize.apply(this,arguments),e&&this.reset(e,n.extend({silent:!0},t))},y={add:!0,remove:!0,merge:!0},b={add:!0,merge:!1,remove:!1};n.extend(g.prototype,f,{model:d,initialize:function(){},toJSON:function(e){return this.map(function(t){return t.toJSON(e)})},sync:function(){return t.sync.apply(this,arguments)},add:function(e,t){return this.set(e,n.defaults(t||{},b))},remove:function(e,t){e=n.isArray(e)?e.slice():[e],t||(t={});var r,i,s,o;for(r=0,i=e.length;r<i;r++){o=this.get(e[r]);if(!o)continue;delete this._byId[o.id],delete this._byId[o.cid],s=this.indexOf(o),this.models.splice(s,1),this.length--,t.silent||(t.index=s,o.trigger("remove",o,this,t)),this._removeReference(o)}return this},set:function(e,t){t=n.defaults(t||{},y),t.parse&&(e=this.parse(e,t)),n.isArray(e)||(e=e?[e]:[]);var r,i,s,u,f,l,c=t.at,h=this.comparator&&c==null&&t.sort!==!1,p=n.isString(this.comparator)?this.comparator:null,d=[],v=[],m={};for(r=0,i=e.length;r<i;r++){if(!(s=this._prepareModel(e[r],t)))continue;(f=this.get(s))?(t.remove&&(m[f.cid]=!0),t.merge&&(f.set(s.attributes,t),h&&!l&&f.hasChanged(p)&&(l=!0))):t.add&&(d.push(s),s.on("all",this._onModelEvent,this),this._byId[s.cid]=s,s.id!=null&&(this._byId[s.id]=s))}if(t.remove){for(r=0,i=this.length;r<i;++r)m[(s=this.models[r]).cid]||v.push(s);v.length&&this.remove(v,t)}d.length&&(h&&(l=!0),this.length+=d.length,c!=null?a.apply(this.models,[c,0].concat(d)):o.apply(this.models,d)),l&&this.sort({silent:!0});if(t.silent)return this;for(r=0,i=d.length;r<i;r++)(s=d[r]).trigger("add",s,this,t);return l&&this.trigger("sort",this,t),this},reset:function(e,t){t||(t={});for(var r=0,i=this.models.length;r<i;r++)this._removeReference(this.models[r]);return t.previousModels=this.models,this._reset(),this.add(e,n.extend({silent:!0},t)),t.silent||this.trigger("reset",this,t),this},push:function(e,t){return e=this._prepareModel(e,t),this.add(e,n.extend({at:this.length},t)),e},pop:function(e){var t=this.at(this.length-1);return this.remove(t,e),t},unshift:function(e,t){return e=this._prepareModel(e,t),this.add(e,n.extend({at:0},t)),e},shift:function(e){var t=this.at(0);return this.remove(t,e),t},slice:function(e,t){return this.models.slice(e,t)},get:function(e){return e==null?void 0:this._byId[e.id!=null?e.id:e.cid||e]},at:function(e){return this.models[e]},where:function(e,t){return n.isEmpty(e)?t?void 0:[]:this[t?"find":"filter"](function(t){for(var n in e)if(e[n]!==t.get(n))return!1;return!0})},findWhere:function(e){return this.where(e,!0)},sort:function(e){if(!this.comparator)throw new Error("Cannot sort a set without a comparator");return e||(e={}),n.isString(this.comparator)||this.comparator.length===1?this.models=this.sortBy(this.comparator,this):this.models.sort(n.bind(this.comparator,this)),e.silent||this.trigger("sort",this,e),this},sortedIndex:function(e,t,r){t||(t=this.comparator);var i=n.isFunction(t)?t:function(e){return e.get(t)};return n.sortedIndex(this.models,e,i,r)},pluck:function(e){return n.invoke(this.models,"get",e)},fetch:function(e){e=e?n.clone(e):{},e.parse===void 0&&(e.parse=!0);var t=e.success,r=this;return e.success=function(n){var i=e.reset?"reset":"set";r[i](n,e),t&&t(r,n,e),r.trigger("sync",r,n,e)},F(this,e),this.sync("read",this,e)},create:function(e,t){t=t?n.clone(t):{};if(!(e=this._prepareModel(e,t)))return!1;t.wait||this.add(e,t);var r=this,i=t.success;return t.success=function(n){t.wait&&r.add(e,t),i&&i(e,n,t)},e.save(null,t),e},parse:function(e,t){return e},clone:function(){return new this.constructor(this.models)},_reset:function(){this.length=0,this.models=[],this._byId={}},_prepareModel:function(e,t){if(e instanceof d)return e.collection||(e.collection=this),e;t||(t={}),t.collection=this;var n=new this.model(e,t);return n._validate(e,t)?n:(this.trigger("invalid",this,e,t),!1)},_removeReference:function(e){this===e.collection&&delete e.collection,e.off("all",this._onModelEvent,this)},_onModelEvent:function(e,t,n,r){if((e==="add"||e==="remove")&&n!==this)return;e==="destroy"&&this.remove(t,r),t&&e==="change:"+t.idAttribute&&(delete this._byId[t.previous(t.idAttribute)],t.id!=null&&(this._byId[t.id]=t)),this.trigger.apply(this,arguments)}});var w=["forEach","each","map","collect","reduce","foldl","inject","reduceRight","foldr","find","detect","filter","select","reject","every","all","some","any","include","contains","invoke","max","min","toArray","size","first","head","take","initial","rest","tail","drop","last","without","indexOf","shuffle","lastIndexOf","isEmpty","chain"];n.each(w,function(e){g.prototype[e]=function(){var t=u.call(arguments);return t.unshift(this.models),n[e].apply(n,t)}});var E=["groupBy","countBy","sortBy"];n.each(E,function(e){g.prototype[e]=function(t,r){var i=n.isFunction(t)?t:function(e){return e.get(t)};return n[e](this.models,i,r)}});var S=t.View=function(e){this.cid=n.uniqueId("view"),this._configure(e||{}),this._ensureElement(),this.initialize.apply(this,arguments),this.delegateEvents()},x=/^(\S+)\s*(.*)$/,T=["model","collection","el","id","attributes","className","tagName","events"];n.extend(S.prototype,f,{tagName:"div",$:function(e){return this.$el.find(e)},initialize:function(){},render:function(){return this},remove:function(){return this.$el.remove(),this.stopListening(),this},setElement:function(e,n){return this.$el&&this.undelegateEvents(),this.$el=e instanceof t.$?e:t.$(e),this.el=this.$el[0],n!==!1&&this.delegateEvents(),this},delegateEvents:function(e){if(!e&&!(e=n.result(this,"events")))return this;this.undelegateEvents();for(var t in e){var r=e[t];n.isFunction(r)||(r=this[e[t]]);if(!r)continue;var i=t.match(x),s=i[1],o=i[2];r=n.bind(r,this),s+=".delegateEvents"+this.cid,o===""?this.$el.on(s,r):this.$el.on(s,o,r)}return this},undelegateEvents:function(){return this.$el.off(".delegateEvents"+this.cid),this},_configure:function(e){this.options&&(e=n.extend({},n.result(this,"options"),e)),n.extend(this,n.pick(e,T)),this.options=e},_ensureElement:function(){if(!this.el){var e=n.extend({},n.result(this,"attributes"));this.id&&(e.id=n.result(this,"id")),this.className&&(e["class"]=n.result(this,"className"));var r=t.$("<"+n.result(this,"tagName")+">").attr(e);this.setElement(r,!1)}else this.setElement(n.result(this,"el"),!1)}}),t.sync=function(e,r,i){var s=N[e];n.defaults(i||(i={}),{emulateHTTP:t.emulateHTTP,emulateJSON:t.emulateJSON});var o={type:s,dataType:"json"};i.url||(o.url=n.result(r,"url")||j()),i.data==null&&r&&(e==="create"||e==="update"||e==="patch")&&(o.contentType="application/json",o.data=JSON.stringify(i.attrs||r.toJSON(i))),i.emulateJSON&&(o.contentType="application/x-www-form-urlencoded",o.data=o.data?{model:o.data}:{});if(i.emulateHTTP&&(s==="PUT"||s==="DELETE"||s==="PATCH")){o.type="POST",i.emulateJSON&&(o.data._method=s);var u=i.beforeSend;i.beforeSend=function(e){e.setRequestHeader("X-HTTP-Method-Override",s);if(u)return u.apply(this,arguments)}}o.type!=="GET"&&!i.emulateJSON&&(o.processData=!1),o.type==="PATCH"&&window.ActiveXObject&&(!window.external||!window.external.msActiveXFilteringEnabled)&&(o.xhr=function(){return new ActiveXObject("Microsoft.XMLHTTP")});var a=i.xhr=t.ajax(n.extend(o,i));return r.trigger("request",r,a,i),a};var N={create:"POST",update:"PUT",patch:"PATCH","delete":"DELETE",read:"GET"};t.ajax=function(){return t.$.ajax.apply(t.$,arguments)};var C=t.Router=function(e){e||(e={}),e.routes&&(this.routes=e.routes),this._bindRoutes(),this.initialize.apply(this,arguments)},k=/\((.*?)\)/g,L=/(\(\?)?:\w+/g,A=/\*\w+/g,O=/[\-{}\[\]+?.,\\\^$|#\s]/g;n.extend(C.prototype,f,{initialize:function(){},route:function(e,r,i){n.isRegExp(e)||(e=this._routeToRegExp(e)),n.isFunction(r)&&(i=r,r=""),i||(i=this[r]);var s=this;return t.history.route(e,function(n){var o=s._extractParameters(e,n);i&&i.apply(s,o),s.trigger.apply(s,["route:"+r].concat(o)),s.trigger("route",r,o),t.history.trigger("route",s,r,o)}),this},navigate:function(e,n){return t.history.navigate(e,n),this},_bindRoutes:function(){if(!this.routes)return;this.routes=n.result(this,"routes");var e,t=n.keys(this.routes);while((e=t.pop())!=null)this.route(e,this.routes[e])},_routeToRegExp:function(e){return e=e.replace(O,"\\$&").replace(k,"(?:$1)?").replace(L,function(e,t){return t?e:"([^/]+)"}).replace(A,"(.*?)"),new RegExp("^"+e+"$")},_extractParameters:function(e,t){var r=e.exec(t).slice(1);return n.map(r,function(e){return e?decodeURIComponent(e):null})}});var M=t.History=function(){this.handlers=[],n.bindAll(this,"checkUrl"),typeof window!="undefined"&&(this.location=window.location,this.history=window.history)},_=/^[#\/]|\s+$/g,D=/^\/+|\/+$/g,P=/msie [\w.]+/,H=/\/$/;M.started=!1,n.extend(M.prototype,f,{interval:50,getHash:function(e){var t=(e||this).location.href.match(/#(.*)$/);return t?t[1]:""},getFragment:function(e,t){if(e==null)if(this._hasPushState||!this._wantsHashChange||t){e=this.location.pathname;var n=this.root.replace(H,"");e.indexOf(n)||(e=e.substr(n.length))}else e=this.getHash();return e.replace(_,"")},start:function(e){if(M.started)throw new Error("Backbone.history has already been started");M.started=!0,this.options=n.extend({},{root:"/"},this.options,e),this.root=this.options.root,this._wantsHashChange=this.options.hashChange!==!1,this._wantsPushState=!!this.options.pushState,this._hasPushState=!!(this.options.pushState&&this.history&&this.history.pushState);var r=this.getFragment(),i=document.documentMode,s=P.exec(navigator.userAgent.toLowerCase())&&(!i||i<=7);this.root=("/"+this.root+"/").replace(D,"/"),s&&this._wantsHashChange&&(this.iframe=t.$('<iframe src="javascript:0" tabindex="-1" />').hide().appendTo("body")[0].contentWindow,this.navigate(r)),this._hasPushState?t.$(window).on("popstate",this.checkUrl):this._wantsHashChange&&"onhashchange"in window&&!s?t.$(window).on("hashchange",this.checkUrl):this._wantsHashChange&&(this._checkUrlInterval=setInterval(this.checkUrl,this.interval)),this.fragment=r;var o=this.location,u=o.pathname.replace(/[^\/]$/,"$&/")===this.root;if(this._wantsHashChange&&this._wantsPushState&&!this._hasPushState&&!u)return this.fragment=this.getFragment(null,!0),this.location.replace(this.root+this.location.search+"#"+this.fragment),!0;this._wantsPushState&&this._hasPushState&&u&&o.hash&&(this.fragment=this.getHash().replace(_,""),this.history.replaceState({},document.title,this.root+this.fragment+o.search));if(!this.options.silent)return this.loadUrl()},stop:function(){t.$(window).off("popstate",this.checkUrl).off("hashchange",this.checkUrl),clearInterval(this._checkUrlInterval),M.started=!1},route:function(e,t){this.handlers.unshift({route:e,callback:t})},checkUrl:function(e){var t=this.getFragment();t===this.fragment&&this.iframe&&(t=this.getFragment(this.getHash(this.iframe)));if(t===this.fragment)return!1;this.iframe&&this.navigate(t),this.loadUrl()||this.loadUrl(this.getHash())},loadUrl:function(e){var t=this.fragment=this.getFragment(e),r=n.any(this.handlers,function(e){if(e.route.test(t))return e.callback(t),!0});return r},navigate:function(e,t){if(!M.started)return!1;if(!t||t===!0)t={trigger:t};e=this.getFragment(e||"");if(this.fragment===e)return;this.fragment=e;var n=this.root+e;if(this._hasPushState)this.history[t.replace?"replaceState":"pushState"]({},document.title,n);else{if(!this._wantsHashChange)return this.location.assign(n);this._updateHash(this.location,e,t.replace),this.iframe&&e!==this.getFragment(this.getHash(this.iframe))&&(t.replace||this.iframe.document.open().close(),this._updateHash(this.iframe.location,e,t.replace))}t.trigger&&this.loadUrl(e)},_updateHash:function(e,t,n){if(n){var r=e.href.replace(/(javascript:|#).*$/,"");e.replace(r+"#"+t)}else e.hash="#"+t}}),t.history=new M;var B=function(e,t){var r=this,i;e&&n.has(e,"constructor")?i=e.constructor:i=function(){return r.apply(this,arguments)},n.extend(i,r,t);var s=function(){this.constructor=i};return s.prototype=r.prototype,i.prototype=new s,e&&n.extend(i.prototype,e),i.__super__=r.prototype,i};d.extend=g.extend=C.extend=S.extend=M.extend=B;var j=function(){throw new Error('A "url" property or function must be specified')},F=function(e,t){var n=t.error;t.error=function(r){n&&n(e,r,t),e.trigger("error",e,r,t)}};return t});var io="undefined"==typeof module?{}:module.exports;(function(){(function(e,t){var n=e;n.version="0.9.11",n.protocol=1,n.transports=[],n.j=[],n.sockets={},n.connect=function(e,r){var i=n.util.parseUri(e),s,o;t&&t.location&&(i.protocol=i.protocol||t.location.protocol.slice(0,-1),i.host=i.host||(t.document?t.document.domain:t.location.hostname),i.port=i.port||t.location.port),s=n.util.uniqueUri(i);var u={host:i.host,secure:"https"==i.protocol,port:i.port||("https"==i.protocol?443:80),query:i.query||""};n.util.merge(u,r);if(u["force new connection"]||!n.sockets[s])o=new n.Socket(u);return!u["force new connection"]&&o&&(n.sockets[s]=o),o=o||n.sockets[s],o.of(i.path.length>1?i.path:"")}})("object"==typeof module?module.exports:this.io={},this),function(e,t){var n=e.util={},r=/^(?:(?![^:@]+:[^:@\/]*@)([^:\/?#.]+):)?(?:\/\/)?((?:(([^:@]*)(?::([^:@]*))?)?@)?([^:\/?#]*)(?::(\d*))?)(((\/(?:[^?#](?![^?#\/]*\.[^?#\/.]+(?:[?#]|$)))*\/?)?([^?#\/]*))(?:\?([^#]*))?(?:#(.*))?)/,i=["source","protocol","authority","userInfo","user","password","host","port","relative","path","directory","file","query","anchor"];n.parseUri=function(e){var t=r.exec(e||""),n={},s=14;while(s--)n[i[s]]=t[s]||"";return n},n.uniqueUri=function(e){var n=e.protocol,r=e.host,i=e.port;return"document"in t?(r=r||document.domain,i=i||(n=="https"&&document.location.protocol!=="https:"?443:document.location.port)):(r=r||"localhost",!i&&n=="https"&&(i=443)),(n||"http")+"://"+r+":"+(i||80)},n.query=function(e,t){var r=n.chunkQuery(e||""),i=[];n.merge(r,n.chunkQuery(t||""));for(var s in r)r.hasOwnProperty(s)&&i.push(s+"="+r[s]);return i.length?"?"+i.join("&"):""},n.chunkQuery=function(e){var t={},n=e.split("&"),r=0,i=n.length,s;for(;r<i;++r)s=n[r].split("="),s[0]&&(t[s[0]]=s[1]);return t};var s=!1;n.load=function(e){if("document"in t&&document.readyState==="complete"||s)return e();n.on(t,"load",e,!1)},n.on=function(e,t,n,r){e.attachEvent?e.attachEvent("on"+t,n):e.addEventListener&&e.addEventListener(t,n,r)},n.request=function(e){if(e&&"undefined"!=typeof XDomainRequest&&!n.ua.hasCORS)return new XDomainRequest;if("undefined"!=typeof XMLHttpRequest&&(!e||n.ua.hasCORS))return new XMLHttpRequest;if(!e)try{return new(window[["Active"].concat("Object").join("X")])("Microsoft.XMLHTTP")}catch(t){}return null},"undefined"!=typeof window&&n.load(function(){s=!0}),n.defer=function(e){if(!n.ua.webkit||"undefined"!=typeof importScripts)return e();n.load(function(){setTimeout(e,100)})},n.merge=function(t,r,i,s){var o=s||[],u=typeof i=="undefined"?2:i,a;for(a in r)r.hasOwnProperty(a)&&n.indexOf(o,a)<0&&(typeof t[a]!="object"||!u?(t[a]=r[a],o.push(r[a])):n.merge(t[a],r[a],u-1,o));return t},n.mixin=function(e,t){n.merge(e.prototype,t.prototype)},n.inherit=function(e,t){function n(){}n.prototype=t.prototype,e.prototype=new n},n.isArray=Array.isArray||function(e){return Object.prototype.toString.call(e)==="[object Array]"},n.intersect=function(e,t){var r=[],i=e.length>t.length?e:t,s=e.length>t.length?t:e;for(var o=0,u=s.length;o<u;o++)~n.indexOf(i,s[o])&&r.push(s[o]);return r},n.indexOf=function(e,t,n){for(var r=e.length,n=n<0?n+r<0?0:n+r:n||0;n<r&&e[n]!==t;n++);return r<=n?-1:n},n.toArray=function(e){var t=[];for(var n=0,r=e.length;n<r;n++)t.push(e[n]);return t},n.ua={},n.ua.hasCORS="undefined"!=typeof XMLHttpRequest&&function(){try{var e=new XMLHttpRequest}catch(t){return!1}return e.withCredentials!=undefined}(),n.ua.webkit="undefined"!=typeof navigator&&/webkit/i.test(navigator.userAgent),n.ua.iDevice="undefined"!=typeof navigator&&/iPad|iPhone|iPod/i.test(navigator.userAgent)}("undefined"!=typeof io?io:module.exports,this),function(e,t){function n(){}e.EventEmitter=n,n.prototype.on=function(e,n){return this.$events||(this.$events={}),this.$events[e]?t.util.isArray(this.$events[e])?this.$events[e].push(n):this.$events[e]=[this.$events[e],n]:this.$events[e]=n,this},n.prototype.addListener=n.prototype.on,n.prototype.once=function(e,t){function r(){n.removeListener(e,r),t.apply(this,arguments)}var n=this;return r.listener=t,this.on(e,r),this},n.prototype.removeListener=function(e,n){if(this.$events&&this.$events[e]){var r=this.$events[e];if(t.util.isArray(r)){var i=-1;for(var s=0,o=r.length;s<o;s++)if(r[s]===n||r[s].listener&&r[s].listener===n){i=s;break}if(i<0)return this;r.splice(i,1),r.length||delete this.$events[e]}else(r===n||r.listener&&r.listener===n)&&delete this.$events[e]}return this},n.prototype.removeAllListeners=function(e){return e===undefined?(this.$events={},this):(this.$events&&this.$events[e]&&(this.$events[e]=null),this)},n.prototype.listeners=function(e){return this.$events||(this.$events={}),this.$events[e]||(this.$events[e]=[]),t.util.isArray(this.$events[e])||(this.$events[e]=[this.$events[e]]),this.$events[e]},n.prototype.emit=function(e){if(!this.$events)return!1;var n=this.$events[e];if(!n)return!1;var r=Array.prototype.slice.call(arguments,1);if("function"==typeof n)n.apply(this,r);else{if(!t.util.isArray(n))return!1;var i=n.slice();for(var s=0,o=i.length;s<o;s++)i[s].apply(this,r)}return!0}}("undefined"!=typeof io?io:module.exports,"undefined"!=typeof io?io:module.parent.exports),function(exports,nativeJSON){function f(e){return e<10?"0"+e:e}function date(e,t){return isFinite(e.valueOf())?e.getUTCFullYear()+"-"+f(e.getUTCMonth()+1)+"-"+f(e.getUTCDate())+"T"+f(e.getUTCHours())+":"+f(e.getUTCMinutes())+":"+f(e.getUTCSeconds())+"Z":null}function quote(e){return escapable.lastIndex=0,escapable.test(e)?'"'+e.replace(escapable,function(e){var t=meta[e];return typeof t=="string"?t:"\\u"+("0000"+e.charCodeAt(0).toString(16)).slice(-4)})+'"':'"'+e+'"'}function str(e,t){var n,r,i,s,o=gap,u,a=t[e];a instanceof Date&&(a=date(e)),typeof rep=="function"&&(a=rep.call(t,e,a));switch(typeof a){case"string":return quote(a);case"number":return isFinite(a)?String(a):"null";case"boolean":case"null":return String(a);case"object":if(!a)return"null";gap+=indent,u=[];if(Object.prototype.toString.apply(a)==="[object Array]"){s=a.length;for(n=0;n<s;n+=1)u[n]=str(n,a)||"null";return i=u.length===0?"[]":gap?"[\n"+gap+u.join(",\n"+gap)+"\n"+o+"]":"["+u.join(",")+"]",gap=o,i}if(rep&&typeof rep=="object"){s=rep.length;for(n=0;n<s;n+=1)typeof rep[n]=="string"&&(r=rep[n],i=str(r,a),i&&u.push(quote(r)+(gap?": ":":")+i))}else for(r in a)Object.prototype.hasOwnProperty.call(a,r)&&(i=str(r,a),i&&u.push(quote(r)+(gap?": ":":")+i));return i=u.length===0?"{}":gap?"{\n"+gap+u.join(",\n"+gap)+"\n"+o+"}":"{"+u.join(",")+"}",gap=o,i}}if(nativeJSON&&nativeJSON.parse)return exports.JSON={parse:nativeJSON.parse,stringify:nativeJSON.stringify};var JSON=exports.JSON={},cx=/[\u0000\u00ad\u0600-\u0604\u070f\u17b4\u17b5\u200c-\u200f\u2028-\u202f\u2060-\u206f\ufeff\ufff0-\uffff]/g,escapable=/[\\\"\x00-\x1f\x7f-\x9f\u00ad\u0600-\u0604\u070f\u17b4\u17b5\u200c-\u200f\u2028-\u202f\u2060-\u206f\ufeff\ufff0-\uffff]/g,gap,indent,meta={"\b":"\\b","	":"\\t","\n":"\\n","\f":"\\f","\r":"\\r",'"':'\\"',"\\":"\\\\"},rep;JSON.stringify=function(e,t,n){var r;gap="",indent="";if(typeof n=="number")for(r=0;r<n;r+=1)indent+=" ";else typeof n=="string"&&(indent=n);rep=t;if(!t||typeof t=="function"||typeof t=="object"&&typeof t.length=="number")return str("",{"":e});throw new Error("JSON.stringify")},JSON.parse=function(text,reviver){function walk(e,t){var n,r,i=e[t];if(i&&typeof i=="object")for(n in i)Object.prototype.hasOwnProperty.call(i,n)&&(r=walk(i,n),r!==undefined?i[n]=r:delete i[n]);return reviver.call(e,t,i)}var j;text=String(text),cx.lastIndex=0,cx.test(text)&&(text=text.replace(cx,function(e){return"\\u"+("0000"+e.charCodeAt(0).toString(16)).slice(-4)}));if(/^[\],:{}\s]*$/.test(text.replace(/\\(?:["\\\/bfnrt]|u[0-9a-fA-F]{4})/g,"@").replace(/"[^"\\\n\r]*"|true|false|null|-?\d+(?:\.\d*)?(?:[eE][+\-]?\d+)?/g,"]").replace(/(?:^|:|,)(?:\s*\[)+/g,"")))return j=eval("("+text+")"),typeof reviver=="function"?walk({"":j},""):j;throw new SyntaxError("JSON.parse")}}("undefined"!=typeof io?io:module.exports,typeof JSON!="undefined"?JSON:undefined),function(e,t){var n=e.parser={},r=n.packets=["disconnect","connect","heartbeat","message","json","event","ack","error","noop"],i=n.reasons=["transport not supported","client not handshaken","unauthorized"],s=n.advice=["reconnect"],o=t.JSON,u=t.util.indexOf;n.encodePacket=function(e){var t=u(r,e.type),n=e.id||"",a=e.endpoint||"",f=e.ack,l=null;switch(e.type){case"error":var c=e.reason?u(i,e.reason):"",h=e.advice?u(s,e.advice):"";if(c!==""||h!=="")l=c+(h!==""?"+"+h:"");break;case"message":e.data!==""&&(l=e.data);break;case"event":var p={name:e.name};e.args&&e.args.length&&(p.args=e.args),l=o.stringify(p);break;case"json":l=o.stringify(e.data);break;case"connect":e.qs&&(l=e.qs);break;case"ack":l=e.ackId+(e.args&&e.args.length?"+"+o.stringify(e.args):"")}var d=[t,n+(f=="data"?"+":""),a];return l!==null&&l!==undefined&&d.push(l),d.join(":")},n.encodePayload=function(e){var t="";if(e.length==1)return e[0];for(var n=0,r=e.length;n<r;n++){var i=e[n];t+="�"+i.length+"�"+e[n]}return t};var a=/([^:]+):([0-9]+)?(\+)?:([^:]+)?:?([\s\S]*)?/;n.decodePacket=function(e){var t=e.match(a);if(!t)return{};var n=t[2]||"",e=t[5]||"",u={type:r[t[1]],endpoint:t[4]||""};n&&(u.id=n,t[3]?u.ack="data":u.ack=!0);switch(u.type){case"error":var t=e.split("+");u.reason=i[t[0]]||"",u.advice=s[t[1]]||"";break;case"message":u.data=e||"";break;case"event":try{var f=o.parse(e);u.name=f.name,u.args=f.args}catch(l){}u.args=u.args||[];break;case"json":try{u.data=o.parse(e)}catch(l){}break;case"connect":u.qs=e||"";break;case"ack":var t=e.match(/^([0-9]+)(\+)?(.*)/);if(t){u.ackId=t[1],u.args=[];if(t[3])try{u.args=t[3]?o.parse(t[3]):[]}catch(l){}}break;case"disconnect":case"heartbeat":}return u},n.decodePayload=function(e){if(e.charAt(0)=="�"){var t=[];for(var r=1,i="";r<e.length;r++)e.charAt(r)=="�"?(t.push(n.decodePacket(e.substr(r+1).substr(0,i))),r+=Number(i)+1,i=""):i+=e.charAt(r);return t}return[n.decodePacket(e)]}}("undefined"!=typeof io?io:module.exports,"undefined"!=typeof io?io:module.parent.exports),function(e,t){function n(e,t){this.socket=e,this.sessid=t}e.Transport=n,t.util.mixin(n,t.EventEmitter),n.prototype.heartbeats=function(){return!0},n.prototype.onData=function(e){this.clearCloseTimeout(),(this.socket.connected||this.socket.connecting||this.socket.reconnecting)&&this.setCloseTimeout();if(e!==""){var n=t.parser.decodePayload(e);if(n&&n.length)for(var r=0,i=n.length;r<i;r++)this.onPacket(n[r])}return this},n.prototype.onPacket=function(e){return this.socket.setHeartbeatTimeout(),e.type=="heartbeat"?this.onHeartbeat():(e.type=="connect"&&e.endpoint==""&&this.onConnect(),e.type=="error"&&e.advice=="reconnect"&&(this.isOpen=!1),this.socket.onPacket(e),this)},n.prototype.setCloseTimeout=function(){if(!this.closeTimeout){var e=this;this.closeTimeout=setTimeout(function(){e.onDisconnect()},this.socket.closeTimeout)}},n.prototype.onDisconnect=function(){return this.isOpen&&this.close(),this.clearTimeouts(),this.socket.onDisconnect(),this},n.prototype.onConnect=function(){return this.socket.onConnect(),this},n.prototype.clearCloseTimeout=function(){this.closeTimeout&&(clearTimeout(this.closeTimeout),this.closeTimeout=null)},n.prototype.clearTimeouts=function(){this.clearCloseTimeout(),this.reopenTimeout&&clearTimeout(this.reopenTimeout)},n.prototype.packet=function(e){this.send(t.parser.encodePacket(e))},n.prototype.onHeartbeat=function(e){this.packet({type:"heartbeat"})},n.prototype.onOpen=function(){this.isOpen=!0,this.clearCloseTimeout(),this.socket.onOpen()},n.prototype.onClose=function(){var e=this;this.isOpen=!1,this.socket.onClose(),this.onDisconnect()},n.prototype.prepareUrl=function(){var e=this.socket.options;return this.scheme()+"://"+e.host+":"+e.port+"/"+e.resource+"/"+t.protocol+"/"+this.name+"/"+this.sessid},n.prototype.ready=function(e,t){t.call(this)}}("undefined"!=typeof io?io:module.exports,"undefined"!=typeof io?io:module.parent.exports),function(e,t,n){function r(e){this.options={port:80,secure:!1,document:"document"in n?document:!1,resource:"socket.io",transports:t.transports,"connect timeout":1e4,"try multiple transports":!0,reconnect:!0,"reconnection delay":500,"reconnection limit":Infinity,"reopen delay":3e3,"max reconnection attempts":10,"sync disconnect on unload":!1,"auto connect":!0,"flash policy port":10843,manualFlush:!1},t.util.merge(this.options,e),this.connected=!1,this.open=!1,this.connecting=!1,this.reconnecting=!1,this.namespaces={},this.buffer=[],this.doBuffer=!1;if(this.options["sync disconnect on unload"]&&(!this.isXDomain()||t.util.ua.hasCORS)){var r=this;t.util.on(n,"beforeunload",function(){r.disconnectSync()},!1)}this.options["auto connect"]&&this.connect()}function i(){}e.Socket=r,t.util.mixin(r,t.EventEmitter),r.prototype.of=function(e){return this.namespaces[e]||(this.namespaces[e]=new t.SocketNamespace(this,e),e!==""&&this.namespaces[e].packet({type:"connect"})),this.namespaces[e]},r.prototype.publish=function(){this.emit.apply(this,arguments);var e;for(var t in this.namespaces)this.namespaces.hasOwnProperty(t)&&(e=this.of(t),e.$emit.apply(e,arguments))},r.prototype.handshake=function(e){function s(t){t instanceof Error?(n.connecting=!1,n.onError(t.message)):e.apply(null,t.split(":"))}var n=this,r=this.options,o=["http"+(r.secure?"s":"")+":/",r.host+":"+r.port,r.resource,t.protocol,t.util.query(this.options.query,"t="+ +(new Date))].join("/");if(this.isXDomain()&&!t.util.ua.hasCORS){var u=document.getElementsByTagName("script")[0],a=document.createElement("script");a.src=o+"&jsonp="+t.j.length,u.parentNode.insertBefore(a,u),t.j.push(function(e){s(e),a.parentNode.removeChild(a)})}else{var f=t.util.request();f.open("GET",o,!0),this.isXDomain()&&(f.withCredentials=!0),f.onreadystatechange=function(){f.readyState==4&&(f.onreadystatechange=i,f.status==200?s(f.responseText):f.status==403?n.onError(f.responseText):(n.connecting=!1,!n.reconnecting&&n.onError(f.responseText)))},f.send(null)}},r.prototype.getTransport=function(e){var n=e||this.transports,r;for(var i=0,s;s=n[i];i++)if(t.Transport[s]&&t.Transport[s].check(this)&&(!this.isXDomain()||t.Transport[s].xdomainCheck(this)))return new t.Transport[s](this,this.sessionid);return null},r.prototype.connect=function(e){if(this.connecting)return this;var n=this;return n.connecting=!0,this.handshake(function(r,i,s,o){function u(e){n.transport&&n.transport.clearTimeouts(),n.transport=n.getTransport(e);if(!n.transport)return n.publish("connect_failed");n.transport.ready(n,function(){n.connecting=!0,n.publish("connecting",n.transport.name),n.transport.open(),n.options["connect timeout"]&&(n.handleReconnectionFunction=function(){if(!n.connected){n.connecting=!1;if(n.options["try multiple transports"]){var e=n.transports;while(e.length>0&&e.splice(0,1)[0]!=n.transport.name);e.length?u(e):n.publish("connect_failed")}}},n.connectTimeoutTimer=setTimeout(n.handleReconnectionFunction,n.options["connect timeout"]))})}n.sessionid=r,n.closeTimeout=s*1e3,n.heartbeatTimeout=i*1e3,n.transports||(n.transports=n.origTransports=o?t.util.intersect(o.split(","),n.options.transports):n.options.transports),n.setHeartbeatTimeout(),u(n.transports),n.once("connect",function(){clearTimeout(n.connectTimeoutTimer),e&&typeof e=="function"&&e()})}),this},r.prototype.setHeartbeatTimeout=function(){clearTimeout(this.heartbeatTimeoutTimer);if(this.transport&&!this.transport.heartbeats())return;var e=this;this.heartbeatTimeoutTimer=setTimeout(function(){e.transport.onClose()},this.heartbeatTimeout)},r.prototype.packet=function(e){return this.connected&&!this.doBuffer?this.transport.packet(e):this.buffer.push(e),this},r.prototype.setBuffer=function(e){this.doBuffer=e,!e&&this.connected&&this.buffer.length&&(this.options.manualFlush||this.flushBuffer())},r.prototype.flushBuffer=function(){this.transport.payload(this.buffer),this.buffer=[]},r.prototype.disconnect=function(){if(this.connected||this.connecting)this.open&&this.of("").packet({type:"disconnect"}),this.onDisconnect("booted");return this},r.prototype.disconnectSync=function(){var e=t.util.request(),n=["http"+(this.options.secure?"s":"")+":/",this.options.host+":"+this.options.port,this.options.resource,t.protocol,"",this.sessionid].join("/")+"/?disconnect=1";e.open("GET",n,!1),e.send(null),this.onDisconnect("booted")},r.prototype.isXDomain=function(){var e=n.location.port||("https:"==n.location.protocol?443:80);return this.options.host!==n.location.hostname||this.options.port!=e},r.prototype.onConnect=function(){this.connected||(this.connected=!0,this.connecting=!1,this.doBuffer||this.setBuffer(!1),this.emit("connect"))},r.prototype.onOpen=function(){this.open=!0},r.prototype.onClose=function(){this.open=!1,clearTimeout(this.heartbeatTimeoutTimer)},r.prototype.onPacket=function(e){this.of(e.endpoint).onPacket(e)},r.prototype.onError=function(e){e&&e.advice&&e.advice==="reconnect"&&(this.connected||this.connecting)&&(this.disconnect(),this.options.reconnect&&this.reconnect()),this.publish("error",e&&e.reason?e.reason:e)},r.prototype.onDisconnect=function(e){var t=this.connected,n=this.connecting;this.connected=!1,this.connecting=!1,this.open=!1;if(t||n)this.transport.close(),this.transport.clearTimeouts(),t&&(this.publish("disconnect",e),"booted"!=e&&this.options.reconnect&&!this.reconnecting&&this.reconnect())},r.prototype.reconnect=function(){function i(){if(e.connected){for(var t in e.namespaces)e.namespaces.hasOwnProperty(t)&&""!==t&&e.namespaces[t].packet({type:"connect"});e.publish("reconnect",e.transport.name,e.reconnectionAttempts)}clearTimeout(e.reconnectionTimer),e.removeListener("connect_failed",s),e.removeListener("connect",s),e.reconnecting=!1,delete e.reconnectionAttempts,delete e.reconnectionDelay,delete e.reconnectionTimer,delete e.redoTransports,e.options["try multiple transports"]=n}function s(){if(!e.reconnecting)return;if(e.connected)return i();if(e.connecting&&e.reconnecting)return e.reconnectionTimer=setTimeout(s,1e3);e.reconnectionAttempts++>=t?e.redoTransports?(e.publish("reconnect_failed"),i()):(e.on("connect_failed",s),e.options["try multiple transports"]=!0,e.transports=e.origTransports,e.transport=e.getTransport(),e.redoTransports=!0,e.connect()):(e.reconnectionDelay<r&&(e.reconnectionDelay*=2),e.connect(),e.publish("reconnecting",e.reconnectionDelay,e.reconnectionAttempts),e.reconnectionTimer=setTimeout(s,e.reconnectionDelay))}this.reconnecting=!0,this.reconnectionAttempts=0,this.reconnectionDelay=this.options["reconnection delay"];var e=this,t=this.options["max reconnection attempts"],n=this.options["try multiple transports"],r=this.options["reconnection limit"];this.options["try multiple transports"]=!1,this.reconnectionTimer=setTimeout(s,this.reconnectionDelay),this.on("connect",s)}}("undefined"!=typeof io?io:module.exports,"undefined"!=typeof io?io:module.parent.exports,this),function(e,t){function n(e,t){this.socket=e,this.name=t||"",this.flags={},this.json=new r(this,"json"),this.ackPackets=0,this.acks={}}function r(e,t){this.namespace=e,this.name=t}e.SocketNamespace=n,t.util.mixin(n,t.EventEmitter),n.prototype.$emit=t.EventEmitter.prototype.emit,n.prototype.of=function(){return this.socket.of.apply(this.socket,arguments)},n.prototype.packet=function(e){return e.endpoint=this.name,this.socket.packet(e),this.flags={},this},n.prototype.send=function(e,t){var n={type:this.flags.json?"json":"message",data:e};return"function"==typeof t&&(n.id=++this.ackPackets,n.ack=!0,this.acks[n.id]=t),this.packet(n)},n.prototype.emit=function(e){var t=Array.prototype.slice.call(arguments,1),n=t[t.length-1],r={type:"event",name:e};return"function"==typeof n&&(r.id=++this.ackPackets,r.ack="data",this.acks[r.id]=n,t=t.slice(0,t.length-1)),r.args=t,this.packet(r)},n.prototype.disconnect=function(){return this.name===""?this.socket.disconnect():(this.packet({type:"disconnect"}),this.$emit("disconnect")),this},n.prototype.onPacket=function(e){function r(){n.packet({type:"ack",args:t.util.toArray(arguments),ackId:e.id})}var n=this;switch(e.type){case"connect":this.$emit("connect");break;case"disconnect":this.name===""?this.socket.onDisconnect(e.reason||"booted"):this.$emit("disconnect",e.reason);break;case"message":case"json":var i=["message",e.data];e.ack=="data"?i.push(r):e.ack&&this.packet({type:"ack",ackId:e.id}),this.$emit.apply(this,i);break;case"event":var i=[e.name].concat(e.args);e.ack=="data"&&i.push(r),this.$emit.apply(this,i);break;case"ack":this.acks[e.ackId]&&(this.acks[e.ackId].apply(this,e.args),delete this.acks[e.ackId]);break;case"error":e.advice?this.socket.onError(e):e.reason=="unauthorized"?this.$emit("connect_failed",e.reason):this.$emit("error",e.reason)}},r.prototype.send=function(){this.namespace.flags[this.name]=!0,this.namespace.send.apply(this.namespace,arguments)},r.prototype.emit=function(){this.namespace.flags[this.name]=!0,this.namespace.emit.apply(this.namespace,arguments)}}("undefined"!=typeof io?io:module.exports,"undefined"!=typeof io?io:module.parent.exports),function(e,t,n){function r(e){t.Transport.apply(this,arguments)}e.websocket=r,t.util.inherit(r,t.Transport),r.prototype.name="websocket",r.prototype.open=function(){var e=t.util.query(this.socket.options.query),r=this,i;return i||(i=n.MozWebSocket||n.WebSocket),this.websocket=new i(this.prepareUrl()+e),this.websocket.onopen=function(){r.onOpen(),r.socket.setBuffer(!1)},this.websocket.onmessage=function(e){r.onData(e.data)},this.websocket.onclose=function(){r.onClose(),r.socket.setBuffer(!0)},this.websocket.onerror=function(e){r.onError(e)},this},t.util.ua.iDevice?r.prototype.send=function(e){var t=this;return setTimeout(function(){t.websocket.send(e)},0),this}:r.prototype.send=function(e){return this.websocket.send(e),this},r.prototype.payload=function(e){for(var t=0,n=e.length;t<n;t++)this.packet(e[t]);return this},r.prototype.close=function(){return this.websocket.close(),this},r.prototype.onError=function(e){this.socket.onError(e);var t=this;setTimeout(function(){t.socket.handleReconnectionFunction()},10)},r.prototype.scheme=function(){return this.socket.options.secure?"wss":"ws"},r.check=function(){return"WebSocket"in n&&!("__addTask"in WebSocket)||"MozWebSocket"in n},r.xdomainCheck=function(){return!0},t.transports.push("websocket")}("undefined"!=typeof io?io.Transport:module.exports,"undefined"!=typeof io?io:module.parent.exports,this),function(e,t){function n(){t.Transport.websocket.apply(this,arguments)}e.flashsocket=n,t.util.inherit(n,t.Transport.websocket),n.prototype.name="flashsocket",n.prototype.open=function(){var e=this,n=arguments;return WebSocket.__addTask(function(){t.Transport.websocket.prototype.open.apply(e,n)}),this},n.prototype.send=function(){var e=this,n=arguments;return WebSocket.__addTask(function(){t.Transport.websocket.prototype.send.apply(e,n)}),this},n.prototype.close=function(){return WebSocket.__tasks.length=0,t.Transport.websocket.prototype.close.call(this),this},n.prototype.ready=function(e,r){function i(){var t=e.options,i=t["flash policy port"],o=["http"+(t.secure?"s":"")+":/",t.host+":"+t.port,t.resource,"static/flashsocket","WebSocketMain"+(e.isXDomain()?"Insecure":"")+".swf"];n.loaded||(typeof WEB_SOCKET_SWF_LOCATION=="undefined"&&(WEB_SOCKET_SWF_LOCATION=o.join("/")),i!==843&&WebSocket.loadFlashPolicyFile("xmlsocket://"+t.host+":"+i),WebSocket.__initialize(),n.loaded=!0),r.call(s)}var s=this;if(document.body)return i();t.util.load(i)},n.check=function(){return typeof WebSocket!="undefined"&&"__initialize"in WebSocket&&!!swfobject?swfobject.getFlashPlayerVersion().major>=10:!1},n.xdomainCheck=function(){return!0},typeof window!="undefined"&&(WEB_SOCKET_DISABLE_AUTO_INITIALIZATION=!0),t.transports.push("flashsocket")}("undefined"!=typeof io?io.Transport:module.exports,"undefined"!=typeof io?io:module.parent.exports);if("undefined"!=typeof window)var swfobject=function(){function C(){if(b)return;try{var e=a.getElementsByTagName("body")[0].appendChild(U("span"));e.parentNode.removeChild(e)}catch(t){return}b=!0;var n=c.length;for(var r=0;r<n;r++)c[r]()}function k(e){b?e():c[c.length]=e}function L(t){if(typeof u.addEventListener!=e)u.addEventListener("load",t,!1);else if(typeof a.addEventListener!=e)a.addEventListener("load",t,!1);else if(typeof u.attachEvent!=e)z(u,"onload",t);else if(typeof u.onload=="function"){var n=u.onload;u.onload=function(){n(),t()}}else u.onload=t}function A(){l?O():M()}function O(){var n=a.getElementsByTagName("body")[0],r=U(t);r.setAttribute("type",i);var s=n.appendChild(r);if(s){var o=0;(function(){if(typeof s.GetVariable!=e){var t=s.GetVariable("$version");t&&(t=t.split(" ")[1].split(","),T.pv=[parseInt(t[0],10),parseInt(t[1],10),parseInt(t[2],10)])}else if(o<10){o++,setTimeout(arguments.callee,10);return}n.removeChild(r),s=null,M()})()}else M()}function M(){var t=h.length;if(t>0)for(var n=0;n<t;n++){var r=h[n].id,i=h[n].callbackFn,s={success:!1,id:r};if(T.pv[0]>0){var o=R(r);if(o)if(W(h[n].swfVersion)&&!(T.wk&&T.wk<312))V(r,!0),i&&(s.success=!0,s.ref=_(r),i(s));else if(h[n].expressInstall&&D()){var u={};u.data=h[n].expressInstall,u.width=o.getAttribute("width")||"0",u.height=o.getAttribute("height")||"0",o.getAttribute("class")&&(u.styleclass=o.getAttribute("class")),o.getAttribute("align")&&(u.align=o.getAttribute("align"));var a={},f=o.getElementsByTagName("param"),l=f.length;for(var c=0;c<l;c++)f[c].getAttribute("name").toLowerCase()!="movie"&&(a[f[c].getAttribute("name")]=f[c].getAttribute("value"));P(u,a,r,i)}else H(o),i&&i(s)}else{V(r,!0);if(i){var p=_(r);p&&typeof p.SetVariable!=e&&(s.success=!0,s.ref=p),i(s)}}}}function _(n){var r=null,i=R(n);if(i&&i.nodeName=="OBJECT")if(typeof i.SetVariable!=e)r=i;else{var s=i.getElementsByTagName(t)[0];s&&(r=s)}return r}function D(){return!w&&W("6.0.65")&&(T.win||T.mac)&&!(T.wk&&T.wk<312)}function P(t,n,r,i){w=!0,g=i||null,y={success:!1,id:r};var o=R(r);if(o){o.nodeName=="OBJECT"?(v=B(o),m=null):(v=o,m=r),t.id=s;if(typeof t.width==e||!/%$/.test(t.width)&&parseInt(t.width,10)<310)t.width="310";if(typeof t.height==e||!/%$/.test(t.height)&&parseInt(t.height,10)<137)t.height="137";a.title=a.title.slice(0,47)+" - Flash Player Installation";var f=T.ie&&T.win?["Active"].concat("").join("X"):"PlugIn",l="MMredirectURL="+u.location.toString().replace(/&/g,"%26")+"&MMplayerType="+f+"&MMdoctitle="+a.title;typeof n.flashvars!=e?n.flashvars+="&"+l:n.flashvars=l;if(T.ie&&T.win&&o.readyState!=4){var c=U("div");r+="SWFObjectNew",c.setAttribute("id",r),o.parentNode.insertBefore(c,o),o.style.display="none",function(){o.readyState==4?o.parentNode.removeChild(o):setTimeout(arguments.callee,10)}()}j(t,n,r)}}function H(e){if(T.ie&&T.win&&e.readyState!=4){var t=U("div");e.parentNode.insertBefore(t,e),t.parentNode.replaceChild(B(e),t),e.style.display="none",function(){e.readyState==4?e.parentNode.removeChild(e):setTimeout(arguments.callee,10)}()}else e.parentNode.replaceChild(B(e),e)}function B(e){var n=U("div");if(T.win&&T.ie)n.innerHTML=e.innerHTML;else{var r=e.getElementsByTagName(t)[0];if(r){var i=r.childNodes;if(i){var s=i.length;for(var o=0;o<s;o++)(i[o].nodeType!=1||i[o].nodeName!="PARAM")&&i[o].nodeType!=8&&n.appendChild(i[o].cloneNode(!0))}}}return n}function j(n,r,s){var o,u=R(s);if(T.wk&&T.wk<312)return o;if(u){typeof n.id==e&&(n.id=s);if(T.ie&&T.win){var a="";for(var f in n)n[f]!=Object.prototype[f]&&(f.toLowerCase()=="data"?r.movie=n[f]:f.toLowerCase()=="styleclass"?a+=' class="'+n[f]+'"':f.toLowerCase()!="classid"&&(a+=" "+f+'="'+n[f]+'"'));var l="";for(var c in r)r[c]!=Object.prototype[c]&&(l+='<param name="'+c+'" value="'+r[c]+'" />');u.outerHTML='<object classid="clsid:D27CDB6E-AE6D-11cf-96B8-444553540000"'+a+">"+l+"</object>",p[p.length]=n.id,o=R(n.id)}else{var h=U(t);h.setAttribute("type",i);for(var d in n)n[d]!=Object.prototype[d]&&(d.toLowerCase()=="styleclass"?h.setAttribute("class",n[d]):d.toLowerCase()!="classid"&&h.setAttribute(d,n[d]));for(var v in r)r[v]!=Object.prototype[v]&&v.toLowerCase()!="movie"&&F(h,v,r[v]);u.parentNode.replaceChild(h,u),o=h}}return o}function F(e,t,n){var r=U("param");r.setAttribute("name",t),r.setAttribute("value",n),e.appendChild(r)}function I(e){var t=R(e);t&&t.nodeName=="OBJECT"&&(T.ie&&T.win?(t.style.display="none",function(){t.readyState==4?q(e):setTimeout(arguments.callee,10)}()):t.parentNode.removeChild(t))}function q(e){var t=R(e);if(t){for(var n in t)typeof t[n]=="function"&&(t[n]=null);t.parentNode.removeChild(t)}}function R(e){var t=null;try{t=a.getElementById(e)}catch(n){}return t}function U(e){return a.createElement(e)}function z(e,t,n){e.attachEvent(t,n),d[d.length]=[e,t,n]}function W(e){var t=T.pv,n=e.split(".");return n[0]=parseInt(n[0],10),n[1]=parseInt(n[1],10)||0,n[2]=parseInt(n[2],10)||0,t[0]>n[0]||t[0]==n[0]&&t[1]>n[1]||t[0]==n[0]&&t[1]==n[1]&&t[2]>=n[2]?!0:!1}function X(n,r,i,s){if(T.ie&&T.mac)return;var o=a.getElementsByTagName("head")[0];if(!o)return;var u=i&&typeof i=="string"?i:"screen";s&&(E=null,S=null);if(!E||S!=u){var f=U("style");f.setAttribute("type","text/css"),f.setAttribute("media",u),E=o.appendChild(f),T.ie&&T.win&&typeof a.styleSheets!=e&&a.styleSheets.length>0&&(E=a.styleSheets[a.styleSheets.length-1]),S=u}T.ie&&T.win?E&&typeof E.addRule==t&&E.addRule(n,r):E&&typeof a.createTextNode!=e&&E.appendChild(a.createTextNode(n+" {"+r+"}"))}function V(e,t){if(!x)return;var n=t?"visible":"hidden";b&&R(e)?R(e).style.visibility=n:X("#"+e,"visibility:"+n)}function $(t){var n=/[\\\"<>\.;]/,r=n.exec(t)!=null;return r&&typeof encodeURIComponent!=e?encodeURIComponent(t):t}var e="undefined",t="object",n="Shockwave Flash",r="ShockwaveFlash.ShockwaveFlash",i="application/x-shockwave-flash",s="SWFObjectExprInst",o="onreadystatechange",u=window,a=document,f=navigator,l=!1,c=[A],h=[],p=[],d=[],v,m,g,y,b=!1,w=!1,E,S,x=!0,T=function(){var s=typeof a.getElementById!=e&&typeof a.getElementsByTagName!=e&&typeof a.createElement!=e,o=f.userAgent.toLowerCase(),c=f.platform.toLowerCase(),h=c?/win/.test(c):/win/.test(o),p=c?/mac/.test(c):/mac/.test(o),d=/webkit/.test(o)?parseFloat(o.replace(/^.*webkit\/(\d+(\.\d+)?).*$/,"$1")):!1,v=!1,m=[0,0,0],g=null;if(typeof f.plugins!=e&&typeof f.plugins[n]==t)g=f.plugins[n].description,g&&(typeof f.mimeTypes==e||!f.mimeTypes[i]||!!f.mimeTypes[i].enabledPlugin)&&(l=!0,v=!1,g=g.replace(/^.*\s+(\S+\s+\S+$)/,"$1"),m[0]=parseInt(g.replace(/^(.*)\..*$/,"$1"),10),m[1]=parseInt(g.replace(/^.*\.(.*)\s.*$/,"$1"),10),m[2]=/[a-zA-Z]/.test(g)?parseInt(g.replace(/^.*[a-zA-Z]+(.*)$/,"$1"),10):0);else if(typeof u[["Active"].concat("Object").join("X")]!=e)try{var y=new(window[["Active"].concat("Object").join("X")])(r);y&&(g=y.GetVariable("$version"),g&&(v=!0,g=g.split(" ")[1].split(","),m=[parseInt(g[0],10),parseInt(g[1],10),parseInt(g[2],10)]))}catch(b){}return{w3:s,pv:m,wk:d,ie:v,win:h,mac:p}}(),N=function(){if(!T.w3)return;(typeof a.readyState!=e&&a.readyState=="complete"||typeof a.readyState==e&&(a.getElementsByTagName("body")[0]||a.body))&&C(),b||(typeof a.addEventListener!=e&&a.addEventListener("DOMContentLoaded",C,!1),T.ie&&T.win&&(a.attachEvent(o,function(){a.readyState=="complete"&&(a.detachEvent(o,arguments.callee),C())}),u==top&&function(){if(b)return;try{a.documentElement.doScroll("left")}catch(e){setTimeout(arguments.callee,0);return}C()}()),T.wk&&function(){if(b)return;if(!/loaded|complete/.test(a.readyState)){setTimeout(arguments.callee,0);return}C()}(),L(C))}(),J=function(){T.ie&&T.win&&window.attachEvent("onunload",function(){var e=d.length;for(var t=0;t<e;t++)d[t][0].detachEvent(d[t][1],d[t][2]);var n=p.length;for(var r=0;r<n;r++)I(p[r]);for(var i in T)T[i]=null;T=null;for(var s in swfobject)swfobject[s]=null;swfobject=null})}();return{registerObject:function(e,t,n,r){if(T.w3&&e&&t){var i={};i.id=e,i.swfVersion=t,i.expressInstall=n,i.callbackFn=r,h[h.length]=i,V(e,!1)}else r&&r({success:!1,id:e})},getObjectById:function(e){if(T.w3)return _(e)},embedSWF:function(n,r,i,s,o,u,a,f,l,c){var h={success:!1,id:r};T.w3&&!(T.wk&&T.wk<312)&&n&&r&&i&&s&&o?(V(r,!1),k(function(){i+="",s+="";var p={};if(l&&typeof l===t)for(var d in l)p[d]=l[d];p.data=n,p.width=i,p.height=s;var v={};if(f&&typeof f===t)for(var m in f)v[m]=f[m];if(a&&typeof a===t)for(var g in a)typeof v.flashvars!=e?v.flashvars+="&"+g+"="+a[g]:v.flashvars=g+"="+a[g];if(W(o)){var y=j(p,v,r);p.id==r&&V(r,!0),h.success=!0,h.ref=y}else{if(u&&D()){p.data=u,P(p,v,r,c);return}V(r,!0)}c&&c(h)})):c&&c(h)},switchOffAutoHideShow:function(){x=!1},ua:T,getFlashPlayerVersion:function(){return{major:T.pv[0],minor:T.pv[1],release:T.pv[2]}},hasFlashPlayerVersion:W,createSWF:function(e,t,n){return T.w3?j(e,t,n):undefined},showExpressInstall:function(e,t,n,r){T.w3&&D()&&P(e,t,n,r)},removeSWF:function(e){T.w3&&I(e)},createCSS:function(e,t,n,r){T.w3&&X(e,t,n,r)},addDomLoadEvent:k,addLoadEvent:L,getQueryParamValue:function(e){var t=a.location.search||a.location.hash;if(t){/\?/.test(t)&&(t=t.split("?")[1]);if(e==null)return $(t);var n=t.split("&");for(var r=0;r<n.length;r++)if(n[r].substring(0,n[r].indexOf("="))==e)return $(n[r].substring(n[r].indexOf("=")+1))}return""},expressInstallCallback:function(){if(w){var e=R(s);e&&v&&(e.parentNode.replaceChild(v,e),m&&(V(m,!0),T.ie&&T.win&&(v.style.display="block")),g&&g(y)),w=!1}}}}();(function(){if("undefined"==typeof window||window.WebSocket)return;var e=window.console;if(!e||!e.log||!e.error)e={log:function(){},error:function(){}};if(!swfobject.hasFlashPlayerVersion("10.0.0")){e.error("Flash Player >= 10.0.0 is required.");return}location.protocol=="file:"&&e.error("WARNING: web-socket-js doesn't work in file:///... URL unless you set Flash Security Settings properly. Open the page via Web server i.e. http://..."),WebSocket=function(e,t,n,r,i){var s=this;s.__id=WebSocket.__nextId++,WebSocket.__instances[s.__id]=s,s.readyState=WebSocket.CONNECTING,s.bufferedAmount=0,s.__events={},t?typeof t=="string"&&(t=[t]):t=[],setTimeout(function(){WebSocket.__addTask(function(){WebSocket.__flash.create(s.__id,e,t,n||null,r||0,i||null)})},0)},WebSocket.prototype.send=function(e){if(this.readyState==WebSocket.CONNECTING)throw"INVALID_STATE_ERR: Web Socket connection has not been established";var t=WebSocket.__flash.send(this.__id,encodeURIComponent(e));return t<0?!0:(this.bufferedAmount+=t,!1)},WebSocket.prototype.close=function(){if(this.readyState==WebSocket.CLOSED||this.readyState==WebSocket.CLOSING)return;this.readyState=WebSocket.CLOSING,WebSocket.__flash.close(this.__id)},WebSocket.prototype.addEventListener=function(e,t,n){e in this.__events||(this.__events[e]=[]),this.__events[e].push(t)},WebSocket.prototype.removeEventListener=function(e,t,n){if(!(e in this.__events))return;var r=this.__events[e];for(var i=r.length-1;i>=0;--i)if(r[i]===t){r.splice(i,1);break}},WebSocket.prototype.dispatchEvent=function(e){var t=this.__events[e.type]||[];for(var n=0;n<t.length;++n)t[n](e);var r=this["on"+e.type];r&&r(e)},WebSocket.prototype.__handleEvent=function(e){"readyState"in e&&(this.readyState=e.readyState),"protocol"in e&&(this.protocol=e.protocol);var t;if(e.type=="open"||e.type=="error")t=this.__createSimpleEvent(e.type);else if(e.type=="close")t=this.__createSimpleEvent("close");else{if(e.type!="message")throw"unknown event type: "+e.type;var n=decodeURIComponent(e.message);t=this.__createMessageEvent("message",n)}this.dispatchEvent(t)},WebSocket.prototype.__createSimpleEvent=function(e){if(document.createEvent&&window.Event){var t=document.createEvent("Event");return t.initEvent(e,!1,!1),t}return{type:e,bubbles:!1,cancelable:!1}},WebSocket.prototype.__createMessageEvent=function(e,t){if(document.createEvent&&window.MessageEvent&&!window.opera){var n=document.createEvent("MessageEvent");return n.initMessageEvent("message",!1,!1,t,null,null,window,null),n}return{type:e,data:t,bubbles:!1,cancelable:!1}},WebSocket.CONNECTING=0,WebSocket.OPEN=1,WebSocket.CLOSING=2,WebSocket.CLOSED=3,WebSocket.__flash=null,WebSocket.__instances={},WebSocket.__tasks=[],WebSocket.__nextId=0,WebSocket.loadFlashPolicyFile=function(e){WebSocket.__addTask(function(){WebSocket.__flash.loadManualPolicyFile(e)})},WebSocket.__initialize=function(){if(WebSocket.__flash)return;WebSocket.__swfLocation&&(window.WEB_SOCKET_SWF_LOCATION=WebSocket.__swfLocation);if(!window.WEB_SOCKET_SWF_LOCATION){e.error("[WebSocket] set WEB_SOCKET_SWF_LOCATION to location of WebSocketMain.swf");return}var t=document.createElement("div");t.id="webSocketContainer",t.style.position="absolute",WebSocket.__isFlashLite()?(t.style.left="0px",t.style.top="0px"):(t.style.left="-100px",t.style.top="-100px");var n=document.createElement("div");n.id="webSocketFlash",t.appendChild(n),document.body.appendChild(t),swfobject.embedSWF(WEB_SOCKET_SWF_LOCATION,"webSocketFlash","1","1","10.0.0",null,null,{hasPriority:!0,swliveconnect:!0,allowScriptAccess:"always"},null,function(t){t.success||e.error("[WebSocket] swfobject.embedSWF failed")})},WebSocket.__onFlashInitialized=function(){setTimeout(function(){WebSocket.__flash=document.getElementById("webSocketFlash"),WebSocket.__flash.setCallerUrl(location.href),WebSocket.__flash.setDebug(!!window.WEB_SOCKET_DEBUG);for(var e=0;e<WebSocket.__tasks.length;++e)WebSocket.__tasks[e]();WebSocket.__tasks=[]},0)},WebSocket.__onFlashEvent=function(){return setTimeout(function(){try{var t=WebSocket.__flash.receiveEvents();for(var n=0;n<t.length;++n)WebSocket.__instances[t[n].webSocketId].__handleEvent(t[n])}catch(r){e.error(r)}},0),!0},WebSocket.__log=function(t){e.log(decodeURIComponent(t))},WebSocket.__error=function(t){e.error(decodeURIComponent(t))},WebSocket.__addTask=function(e){WebSocket.__flash?e():WebSocket.__tasks.push(e)},WebSocket.__isFlashLite=function(){if(!window.navigator||!window.navigator.mimeTypes)return!1;var e=window.navigator.mimeTypes["application/x-shockwave-flash"];return!e||!e.enabledPlugin||!e.enabledPlugin.filename?!1:e.enabledPlugin.filename.match(/flashlite/i)?!0:!1},window.WEB_SOCKET_DISABLE_AUTO_INITIALIZATION||(window.addEventListener?window.addEventListener("load",function(){WebSocket.__initialize()},!1):window.attachEvent("onload",function(){WebSocket.__initialize()}))})(),function(e,t,n){function r(e){if(!e)return;t.Transport.apply(this,arguments),this.sendBuffer=[]}function i(){}e.XHR=r,t.util.inherit(r,t.Transport),r.prototype.open=function(){return this.socket.setBuffer(!1),this.onOpen(),this.get(),this.setCloseTimeout(),this},r.prototype.payload=function(e){var n=[];for(var r=0,i=e.length;r<i;r++)n.push(t.parser.encodePacket(e[r]));this.send(t.parser.encodePayload(n))},r.prototype.send=function(e){return this.post(e),this},r.prototype.post=function(e){function r(){this.readyState==4&&(this.onreadystatechange=i,t.posting=!1,this.status==200?t.socket.setBuffer(!1):t.onClose())}function s(){this.onload=i,t.socket.setBuffer(!1)}var t=this;this.socket.setBuffer(!0),this.sendXHR=this.request("POST"),n.XDomainRequest&&this.sendXHR instanceof XDomainRequest?this.sendXHR.onload=this.sendXHR.onerror=s:this.sendXHR.onreadystatechange=r,this.sendXHR.send(e)},r.prototype.close=function(){return this.onClose(),this},r.prototype.request=function(e){var n=t.util.request(this.socket.isXDomain()),r=t.util.query(this.socket.options.query,"t="+ +(new Date));n.open(e||"GET",this.prepareUrl()+r,!0);if(e=="POST")try{n.setRequestHeader?n.setRequestHeader("Content-type","text/plain;charset=UTF-8"):n.contentType="text/plain"}catch(i){}return n},r.prototype.scheme=function(){return this.socket.options.secure?"https":"http"},r.check=function(e,r){try{var i=t.util.request(r),s=n.XDomainRequest&&i instanceof XDomainRequest,o=e&&e.options&&e.options.secure?"https:":"http:",u=n.location&&o!=n.location.protocol;if(i&&(!s||!u))return!0}catch(a){}return!1},r.xdomainCheck=function(e){return r.check(e,!0)}}("undefined"!=typeof io?io.Transport:module.exports,"undefined"!=typeof io?io:module.parent.exports,this),function(e,t){function n(e){t.Transport.XHR.apply(this,arguments)}e.htmlfile=n,t.util.inherit(n,t.Transport.XHR),n.prototype.name="htmlfile",n.prototype.get=function(){this.doc=new(window[["Active"].concat("Object").join("X")])("htmlfile"),this.doc.open(),this.doc.write("<html></html>"),this.doc.close(),this.doc.parentWindow.s=this;var e=this.doc.createElement("div");e.className="socketio",this.doc.body.appendChild(e),this.iframe=this.doc.createElement("iframe"),e.appendChild(this.iframe);var n=this,r=t.util.query(this.socket.options.query,"t="+ +(new Date));this.iframe.src=this.prepareUrl()+r,t.util.on(window,"unload",function(){n.destroy()})},n.prototype._=function(e,t){this.onData(e);try{var n=t.getElementsByTagName("script")[0];n.parentNode.removeChild(n)}catch(r){}},n.prototype.destroy=function(){if(this.iframe){try{this.iframe.src="about:blank"}catch(e){}this.doc=null,this.iframe.parentNode.removeChild(this.iframe),this.iframe=null,CollectGarbage()}},n.prototype.close=function(){return this.destroy(),t.Transport.XHR.prototype.close.call(this)},n.check=function(e){if(typeof window!="undefined"&&["Active"].concat("Object").join("X")in window)try{var n=new(window[["Active"].concat("Object").join("X")])("htmlfile");return n&&t.Transport.XHR.check(e)}catch(r){}return!1},n.xdomainCheck=function(){return!1},t.transports.push("htmlfile")}("undefined"!=typeof io?io.Transport:module.exports,"undefined"!=typeof io?io:module.parent.exports),function(e,t,n){function r(){t.Transport.XHR.apply(this,arguments)}function i(){}e["xhr-polling"]=r,t.util.inherit(r,t.Transport.XHR),t.util.merge(r,t.Transport.XHR),r.prototype.name="xhr-polling",r.prototype.heartbeats=function(){return!1},r.prototype.open=function(){var e=this;return t.Transport.XHR.prototype.open.call(e),!1},r.prototype.get=function(){function t(){this.readyState==4&&(this.onreadystatechange=i,this.status==200?(e.onData(this.responseText),e.get()):e.onClose())}function r(){this.onload=i,this.onerror=i,e.retryCounter=1,e.onData(this.responseText),e.get()}function s(){e.retryCounter++,!e.retryCounter||e.retryCounter>3?e.onClose():e.get()}if(!this.isOpen)return;var e=this;this.xhr=this.request(),n.XDomainRequest&&this.xhr instanceof XDomainRequest?(this.xhr.onload=r,this.xhr.onerror=s):this.xhr.onreadystatechange=t,this.xhr.send(null)},r.prototype.onClose=function(){t.Transport.XHR.prototype.onClose.call(this);if(this.xhr){this.xhr.onreadystatechange=this.xhr.onload=this.xhr.onerror=i;try{this.xhr.abort()}catch(e){}this.xhr=null}},r.prototype.ready=function(e,n){var r=this;t.util.defer(function(){n.call(r)})},t.transports.push("xhr-polling")}("undefined"!=typeof io?io.Transport:module.exports,"undefined"!=typeof io?io:module.parent.exports,this),function(e,t,n){function i(e){t.Transport["xhr-polling"].apply(this,arguments),this.index=t.j.length;var n=this;t.j.push(function(e){n._(e)})}var r=n.document&&"MozAppearance"in n.document.documentElement.style;e["jsonp-polling"]=i,t.util.inherit(i,t.Transport["xhr-polling"]),i.prototype.name="jsonp-polling",i.prototype.post=function(e){function a(){f(),n.socket.setBuffer(!1)}function f(){n.iframe&&n.form.removeChild(n.iframe);try{u=document.createElement('<iframe name="'+n.iframeId+'">')}catch(e){u=document.createElement("iframe"),u.name=n.iframeId}u.id=n.iframeId,n.form.appendChild(u),n.iframe=u}var n=this,r=t.util.query(this.socket.options.query,"t="+ +(new Date)+"&i="+this.index);if(!this.form){var i=document.createElement("form"),s=document.createElement("textarea"),o=this.iframeId="socketio_iframe_"+this.index,u;i.className="socketio",i.style.position="absolute",i.style.top="0px",i.style.left="0px",i.style.display="none",i.target=o,i.method="POST",i.setAttribute("accept-charset","utf-8"),s.name="d",i.appendChild(s),document.body.appendChild(i),this.form=i,this.area=s}this.form.action=this.prepareUrl()+r,f(),this.area.value=t.JSON.stringify(e);try{this.form.submit()}catch(l){}this.iframe.attachEvent?u.onreadystatechange=function(){n.iframe.readyState=="complete"&&a()}:this.iframe.onload=a,this.socket.setBuffer(!0)},i.prototype.get=function(){var e=this,n=document.createElement("script"),i=t.util.query(this.socket.options.query,"t="+ +(new Date)+"&i="+this.index);this.script&&(this.script.parentNode.removeChild(this.script),this.script=null),n.async=!0,n.src=this.prepareUrl()+i,n.onerror=function(){e.onClose()};var s=document.getElementsByTagName("script")[0];s.parentNode.insertBefore(n,s),this.script=n,r&&setTimeout(function(){var e=document.createElement("iframe");document.body.appendChild(e),document.body.removeChild(e)},100)},i.prototype._=function(e){return this.onData(e),this.isOpen&&this.get(),this},i.prototype.ready=function(e,n){var i=this;if(!r)return n.call(this);t.util.load(function(){n.call(i)})},i.check=function(){return"document"in n},i.xdomainCheck=function(){return!0},t.transports.push("jsonp-polling")}("undefined"!=typeof io?io.Transport:module.exports,"undefined"!=typeof io?io:module.parent.exports,this),typeof define=="function"&&define.amd&&define("socketio",[],function(){return io})})(),function(e){function t(e,t){return function(n){return a(e.call(this,n),t)}}function n(e){return function(t){return this.lang().ordinal(e.call(this,t))}}function r(){}function i(e){o(this,e)}function s(e){var t=this._data={},n=e.years||e.year||e.y||0,r=e.months||e.month||e.M||0,i=e.weeks||e.week||e.w||0,s=e.days||e.day||e.d||0,o=e.hours||e.hour||e.h||0,a=e.minutes||e.minute||e.m||0,f=e.seconds||e.second||e.s||0,l=e.milliseconds||e.millisecond||e.ms||0;this._milliseconds=l+f*1e3+a*6e4+o*36e5,this._days=s+i*7,this._months=r+n*12,t.milliseconds=l%1e3,f+=u(l/1e3),t.seconds=f%60,a+=u(f/60),t.minutes=a%60,o+=u(a/60),t.hours=o%24,s+=u(o/24),s+=i*7,t.days=s%30,r+=u(s/30),t.months=r%12,n+=u(r/12),t.years=n}function o(e,t){for(var n in t)t.hasOwnProperty(n)&&(e[n]=t[n]);return e}function u(e){return e<0?Math.ceil(e):Math.floor(e)}function a(e,t){var n=e+"";while(n.length<t)n="0"+n;return n}function f(e,t,n){var r=t._milliseconds,i=t._days,s=t._months,o;r&&e._d.setTime(+e+r*n),i&&e.date(e.date()+i*n),s&&(o=e.date(),e.date(1).month(e.month()+s*n).date(Math.min(o,e.daysInMonth())))}function l(e){return Object.prototype.toString.call(e)==="[object Array]"}function c(e,t){var n=Math.min(e.length,t.length),r=Math.abs(e.length-t.length),i=0,s;for(s=0;s<n;s++)~~e[s]!==~~t[s]&&i++;return i+r}function h(e,t){return t.abbr=e,H[e]||(H[e]=new r),H[e].set(t),H[e]}function p(e){return e?(!H[e]&&B&&require("./lang/"+e),H[e]):M.fn._lang}function d(e){return e.match(/\[.*\]/)?e.replace(/^\[|\]$/g,""):e.replace(/\\/g,"")}function v(e){var t=e.match(F),n,r;for(n=0,r=t.length;n<r;n++)st[t[n]]?t[n]=st[t[n]]:t[n]=d(t[n]);return function(i){var s="";for(n=0;n<r;n++)s+=typeof t[n].call=="function"?t[n].call(i,e):t[n];return s}}function m(e,t){function n(t){return e.lang().longDateFormat(t)||t}var r=5;while(r--&&I.test(t))t=t.replace(I,n);return nt[t]||(nt[t]=v(t)),nt[t](e)}function g(e){switch(e){case"DDDD":return z;case"YYYY":return W;case"YYYYY":return X;case"S":case"SS":case"SSS":case"DDD":return U;case"MMM":case"MMMM":case"dd":case"ddd":case"dddd":case"a":case"A":return V;case"X":return K;case"Z":case"ZZ":return $;case"T":return J;case"MM":case"DD":case"YY":case"HH":case"hh":case"mm":case"ss":case"M":case"D":case"d":case"H":case"h":case"m":case"s":return R;default:return new RegExp(e.replace("\\",""))}}function y(e,t,n){var r,i,s=n._a;switch(e){case"M":case"MM":s[1]=t==null?0:~~t-1;break;case"MMM":case"MMMM":r=p(n._l).monthsParse(t),r!=null?s[1]=r:n._isValid=!1;break;case"D":case"DD":case"DDD":case"DDDD":t!=null&&(s[2]=~~t);break;case"YY":s[0]=~~t+(~~t>68?1900:2e3);break;case"YYYY":case"YYYYY":s[0]=~~t;break;case"a":case"A":n._isPm=(t+"").toLowerCase()==="pm";break;case"H":case"HH":case"h":case"hh":s[3]=~~t;break;case"m":case"mm":s[4]=~~t;break;case"s":case"ss":s[5]=~~t;break;case"S":case"SS":case"SSS":s[6]=~~(("0."+t)*1e3);break;case"X":n._d=new Date(parseFloat(t)*1e3);break;case"Z":case"ZZ":n._useUTC=!0,r=(t+"").match(Z),r&&r[1]&&(n._tzh=~~r[1]),r&&r[2]&&(n._tzm=~~r[2]),r&&r[0]==="+"&&(n._tzh=-n._tzh,n._tzm=-n._tzm)}t==null&&(n._isValid=!1)}function b(e){var t,n,r=[];if(e._d)return;for(t=0;t<7;t++)e._a[t]=r[t]=e._a[t]==null?t===2?1:0:e._a[t];r[3]+=e._tzh||0,r[4]+=e._tzm||0,n=new Date(0),e._useUTC?(n.setUTCFullYear(r[0],r[1],r[2]),n.setUTCHours(r[3],r[4],r[5],r[6])):(n.setFullYear(r[0],r[1],r[2]),n.setHours(r[3],r[4],r[5],r[6])),e._d=n}function w(e){var t=e._f.match(F),n=e._i,r,i;e._a=[];for(r=0;r<t.length;r++)i=(g(t[r]).exec(n)||[])[0],i&&(n=n.slice(n.indexOf(i)+i.length)),st[t[r]]&&y(t[r],i,e);e._isPm&&e._a[3]<12&&(e._a[3]+=12),e._isPm===!1&&e._a[3]===12&&(e._a[3]=0),b(e)}function E(e){var t,n,r,s=99,u,a,f;while(e._f.length){t=o({},e),t._f=e._f.pop(),w(t),n=new i(t);if(n.isValid()){r=n;break}f=c(t._a,n.toArray()),f<s&&(s=f,r=n)}o(e,r)}function S(e){var t,n=e._i;if(Q.exec(n)){e._f="YYYY-MM-DDT";for(t=0;t<4;t++)if(Y[t][1].exec(n)){e._f+=Y[t][0];break}$.exec(n)&&(e._f+=" Z"),w(e)}else e._d=new Date(n)}function x(t){var n=t._i,r=j.exec(n);n===e?t._d=new Date:r?t._d=new Date(+r[1]):typeof n=="string"?S(t):l(n)?(t._a=n.slice(0),b(t)):t._d=n instanceof Date?new Date(+n):new Date(n)}function T(e,t,n,r,i){return i.relativeTime(t||1,!!n,e,r)}function N(e,t,n){var r=D(Math.abs(e)/1e3),i=D(r/60),s=D(i/60),o=D(s/24),u=D(o/365),a=r<45&&["s",r]||i===1&&["m"]||i<45&&["mm",i]||s===1&&["h"]||s<22&&["hh",s]||o===1&&["d"]||o<=25&&["dd",o]||o<=45&&["M"]||o<345&&["MM",D(o/30)]||u===1&&["y"]||["yy",u];return a[2]=t,a[3]=e>0,a[4]=n,T.apply({},a)}function C(e,t,n){var r=n-t,i=n-e.day();return i>r&&(i-=7),i<r-7&&(i+=7),Math.ceil(M(e).add("d",i).dayOfYear()/7)}function k(e){var t=e._i,n=e._f;return t===null||t===""?null:(typeof t=="string"&&(e._i=t=p().preparse(t)),M.isMoment(t)?(e=o({},t),e._d=new Date(+t._d)):n?l(n)?E(e):w(e):x(e),new i(e))}function L(e,t){M.fn[e]=M.fn[e+"s"]=function(e){var n=this._isUTC?"UTC":"";return e!=null?(this._d["set"+n+t](e),this):this._d["get"+n+t]()}}function A(e){M.duration.fn[e]=function(){return this._data[e]}}function O(e,t){M.duration.fn["as"+e]=function(){return+this/t}}var M,_="2.0.0",D=Math.round,P,H={},B=typeof module!="undefined"&&module.exports,j=/^\/?Date\((\-?\d+)/i,F=/(\[[^\[]*\])|(\\)?(Mo|MM?M?M?|Do|DDDo|DD?D?D?|ddd?d?|do?|w[o|w]?|W[o|W]?|YYYYY|YYYY|YY|a|A|hh?|HH?|mm?|ss?|SS?S?|X|zz?|ZZ?|.)/g,I=/(\[[^\[]*\])|(\\)?(LT|LL?L?L?|l{1,4})/g,q=/([0-9a-zA-Z\u00A0-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF]+)/gi,R=/\d\d?/,U=/\d{1,3}/,z=/\d{3}/,W=/\d{1,4}/,X=/[+\-]?\d{1,6}/,V=/[0-9]*[a-z\u00A0-\u05FF\u0700-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF]+|[\u0600-\u06FF]+\s*?[\u0600-\u06FF]+/i,$=/Z|[\+\-]\d\d:?\d\d/i,J=/T/i,K=/[\+\-]?\d+(\.\d{1,3})?/,Q=/^\s*\d{4}-\d\d-\d\d((T| )(\d\d(:\d\d(:\d\d(\.\d\d?\d?)?)?)?)?([\+\-]\d\d:?\d\d)?)?/,G="YYYY-MM-DDTHH:mm:ssZ",Y=[["HH:mm:ss.S",/(T| )\d\d:\d\d:\d\d\.\d{1,3}/],["HH:mm:ss",/(T| )\d\d:\d\d:\d\d/],["HH:mm",/(T| )\d\d:\d\d/],["HH",/(T| )\d\d/]],Z=/([\+\-]|\d\d)/gi,et="Month|Date|Hours|Minutes|Seconds|Milliseconds".split("|"),tt={Milliseconds:1,Seconds:1e3,Minutes:6e4,Hours:36e5,Days:864e5,Months:2592e6,Years:31536e6},nt={},rt="DDD w W M D d".split(" "),it="M D H h m s w W".split(" "),st={M:function(){return this.month()+1},MMM:function(e){return this.lang().monthsShort(this,e)},MMMM:function(e){return this.lang().months(this,e)},D:function(){return this.date()},DDD:function(){return this.dayOfYear()},d:function(){return this.day()},dd:function(e){return this.lang().weekdaysMin(this,e)},ddd:function(e){return this.lang().weekdaysShort(this,e)},dddd:function(e){return this.lang().weekdays(this,e)},w:function(){return this.week()},W:function(){return this.isoWeek()},YY:function(){return a(this.year()%100,2)},YYYY:function(){return a(this.year(),4)},YYYYY:function(){return a(this.year(),5)},a:function(){return this.lang().meridiem(this.hours(),this.minutes(),!0)},A:function(){return this.lang().meridiem(this.hours(),this.minutes(),!1)},H:function(){return this.hours()},h:function(){return this.hours()%12||12},m:function(){return this.minutes()},s:function(){return this.seconds()},S:function(){return~~(this.milliseconds()/100)},SS:function(){return a(~~(this.milliseconds()/10),2)},SSS:function(){return a(this.milliseconds(),3)},Z:function(){var e=-this.zone(),t="+";return e<0&&(e=-e,t="-"),t+a(~~(e/60),2)+":"+a(~~e%60,2)},ZZ:function(){var e=-this.zone(),t="+";return e<0&&(e=-e,t="-"),t+a(~~(10*e/6),4)},X:function(){return this.unix()}};while(rt.length)P=rt.pop(),st[P+"o"]=n(st[P]);while(it.length)P=it.pop(),st[P+P]=t(st[P],2);st.DDDD=t(st.DDD,3),r.prototype={set:function(e){var t,n;for(n in e)t=e[n],typeof t=="function"?this[n]=t:this["_"+n]=t},_months:"January_February_March_April_May_June_July_August_September_October_November_December".split("_"),months:function(e){return this._months[e.month()]},_monthsShort:"Jan_Feb_Mar_Apr_May_Jun_Jul_Aug_Sep_Oct_Nov_Dec".split("_"),monthsShort:function(e){return this._monthsShort[e.month()]},monthsParse:function(e){var t,n,r,i;this._monthsParse||(this._monthsParse=[]);for(t=0;t<12;t++){this._monthsParse[t]||(n=M([2e3,t]),r="^"+this.months(n,"")+"|^"+this.monthsShort(n,""),this._monthsParse[t]=new RegExp(r.replace(".",""),"i"));if(this._monthsParse[t].test(e))return t}},_weekdays:"Sunday_Monday_Tuesday_Wednesday_Thursday_Friday_Saturday".split("_"),weekdays:function(e){return this._weekdays[e.day()]},_weekdaysShort:"Sun_Mon_Tue_Wed_Thu_Fri_Sat".split("_"),weekdaysShort:function(e){return this._weekdaysShort[e.day()]},_weekdaysMin:"Su_Mo_Tu_We_Th_Fr_Sa".split("_"),weekdaysMin:function(e){return this._weekdaysMin[e.day()]},_longDateFormat:{LT:"h:mm A",L:"MM/DD/YYYY",LL:"MMMM D YYYY",LLL:"MMMM D YYYY LT",LLLL:"dddd, MMMM D YYYY LT"},longDateFormat:function(e){var t=this._longDateFormat[e];return!t&&this._longDateFormat[e.toUpperCase()]&&(t=this._longDateFormat[e.toUpperCase()].replace(/MMMM|MM|DD|dddd/g,function(e){return e.slice(1)}),this._longDateFormat[e]=t),t},meridiem:function(e,t,n){return e>11?n?"pm":"PM":n?"am":"AM"},_calendar:{sameDay:"[Today at] LT",nextDay:"[Tomorrow at] LT",nextWeek:"dddd [at] LT",lastDay:"[Yesterday at] LT",lastWeek:"[last] dddd [at] LT",sameElse:"L"},calendar:function(e,t){var n=this._calendar[e];return typeof n=="function"?n.apply(t):n},_relativeTime:{future:"in %s",past:"%s ago",s:"a few seconds",m:"a minute",mm:"%d minutes",h:"an hour",hh:"%d hours",d:"a day",dd:"%d days",M:"a month",MM:"%d months",y:"a year",yy:"%d years"},relativeTime:function(e,t,n,r){var i=this._relativeTime[n];return typeof i=="function"?i(e,t,n,r):i.replace(/%d/i,e)},pastFuture:function(e,t){var n=this._relativeTime[e>0?"future":"past"];return typeof n=="function"?n(t):n.replace(/%s/i,t)},ordinal:function(e){return this._ordinal.replace("%d",e)},_ordinal:"%d",preparse:function(e){return e},postformat:function(e){return e},week:function(e){return C(e,this._week.dow,this._week.doy)},_week:{dow:0,doy:6}},M=function(e,t,n){return k({_i:e,_f:t,_l:n,_isUTC:!1})},M.utc=function(e,t,n){return k({_useUTC:!0,_isUTC:!0,_l:n,_i:e,_f:t})},M.unix=function(e){return M(e*1e3)},M.duration=function(e,t){var n=M.isDuration(e),r=typeof e=="number",i=n?e._data:r?{}:e,o;return r&&(t?i[t]=e:i.milliseconds=e),o=new s(i),n&&e.hasOwnProperty("_lang")&&(o._lang=e._lang),o},M.version=_,M.defaultFormat=G,M.lang=function(e,t){var n;if(!e)return M.fn._lang._abbr;t?h(e,t):H[e]||p(e),M.duration.fn._lang=M.fn._lang=p(e)},M.langData=function(e){return e&&e._lang&&e._lang._abbr&&(e=e._lang._abbr),p(e)},M.isMoment=function(e){return e instanceof i},M.isDuration=function(e){return e instanceof s},M.fn=i.prototype={clone:function(){return M(this)},valueOf:function(){return+this._d},unix:function(){return Math.floor(+this._d/1e3)},toString:function(){return this.format("ddd MMM DD YYYY HH:mm:ss [GMT]ZZ")},toDate:function(){return this._d},toJSON:function(){return M.utc(this).format("YYYY-MM-DD[T]HH:mm:ss.SSS[Z]")},toArray:function(){var e=this;return[e.year(),e.month(),e.date(),e.hours(),e.minutes(),e.seconds(),e.milliseconds()]},isValid:function(){return this._isValid==null&&(this._a?this._isValid=!c(this._a,(this._isUTC?M.utc(this._a):M(this._a)).toArray()):this._isValid=!isNaN(this._d.getTime())),!!this._isValid},utc:function(){return this._isUTC=!0,this},local:function(){return this._isUTC=!1,this},format:function(e){var t=m(this,e||M.defaultFormat);return this.lang().postformat(t)},add:function(e,t){var n;return typeof e=="string"?n=M.duration(+t,e):n=M.duration(e,t),f(this,n,1),this},subtract:function(e,t){var n;return typeof e=="string"?n=M.duration(+t,e):n=M.duration(e,t),f(this,n,-1),this},diff:function(e,t,n){var r=this._isUTC?M(e).utc():M(e).local(),i=(this.zone()-r.zone())*6e4,s,o;return t&&(t=t.replace(/s$/,"")),t==="year"||t==="month"?(s=(this.daysInMonth()+r.daysInMonth())*432e5,o=(this.year()-r.year())*12+(this.month()-r.month()),o+=(this-M(this).startOf("month")-(r-M(r).startOf("month")))/s,t==="year"&&(o/=12)):(s=this-r-i,o=t==="second"?s/1e3:t==="minute"?s/6e4:t==="hour"?s/36e5:t==="day"?s/864e5:t==="week"?s/6048e5:s),n?o:u(o)},from:function(e,t){return M.duration(this.diff(e)).lang(this.lang()._abbr).humanize(!t)},fromNow:function(e){return this.from(M(),e)},calendar:function(){var e=this.diff(M().startOf("day"),"days",!0),t=e<-6?"sameElse":e<-1?"lastWeek":e<0?"lastDay":e<1?"sameDay":e<2?"nextDay":e<7?"nextWeek":"sameElse";return this.format(this.lang().calendar(t,this))},isLeapYear:function(){var e=this.year();return e%4===0&&e%100!==0||e%400===0},isDST:function(){return this.zone()<M([this.year()]).zone()||this.zone()<M([this.year(),5]).zone()},day:function(e){var t=this._isUTC?this._d.getUTCDay():this._d.getDay();return e==null?t:this.add({d:e-t})},startOf:function(e){e=e.replace(/s$/,"");switch(e){case"year":this.month(0);case"month":this.date(1);case"week":case"day":this.hours(0);case"hour":this.minutes(0);case"minute":this.seconds(0);case"second":this.milliseconds(0)}return e==="week"&&this.day(0),this},endOf:function(e){return this.startOf(e).add(e.replace(/s?$/,"s"),1).subtract("ms",1)},isAfter:function(e,t){return t=typeof t!="undefined"?t:"millisecond",+this.clone().startOf(t)>+M(e).startOf(t)},isBefore:function(e,t){return t=typeof t!="undefined"?t:"millisecond",+this.clone().startOf(t)<+M(e).startOf(t)},isSame:function(e,t){return t=typeof t!="undefined"?t:"millisecond",+this.clone().startOf(t)===+M(e).startOf(t)},zone:function(){return this._isUTC?0:this._d.getTimezoneOffset()},daysInMonth:function(){return M.utc([this.year(),this.month()+1,0]).date()},dayOfYear:function(e){var t=D((M(this).startOf("day")-M(this).startOf("year"))/864e5)+1;return e==null?t:this.add("d",e-t)},isoWeek:function(e){var t=C(this,1,4);return e==null?t:this.add("d",(e-t)*7)},week:function(e){var t=this.lang().week(this);return e==null?t:this.add("d",(e-t)*7)},lang:function(t){return t===e?this._lang:(this._lang=p(t),this)}};for(P=0;P<et.length;P++)L(et[P].toLowerCase().replace(/s$/,""),et[P]);L("year","FullYear"),M.fn.days=M.fn.day,M.fn.weeks=M.fn.week,M.fn.isoWeeks=M.fn.isoWeek,M.duration.fn=s.prototype={weeks:function(){return u(this.days()/7)},valueOf:function(){return this._milliseconds+this._days*864e5+this._months*2592e6},humanize:function(e){var t=+this,n=N(t,!e,this.lang());return e&&(n=this.lang().pastFuture(t,n)),this.lang().postformat(n)},lang:M.fn.lang};for(P in tt)tt.hasOwnProperty(P)&&(O(P,tt[P]),A(P.toLowerCase()));O("Weeks",6048e5),M.lang("en",{ordinal:function(e){var t=e%10,n=~~(e%100/10)===1?"th":t===1?"st":t===2?"nd":t===3?"rd":"th";return e+n}}),B&&(module.exports=M),typeof ender=="undefined"&&(this.moment=M),typeof define=="function"&&define.amd&&define("moment",[],function(){return M})}.call(this),define("models/version",["underscore","backbone"],function(e,t){var n=t.Model.extend({defaults:{version:0},url:function(){return"/version/"+this.id+"?format=json"},parse:function(e){if(e.data){var t=e.data.version;return t.application=e.data.application,t.workspace=e.data.workspace,t}return e},canRegister:function(e){return e.hasPermission("APPLICATION_DEPLOY",this.attributes.workspace.id)&&this.attributes.state=="PREPARED"},canStart:function(e){return e.hasPermission("APPLICATION_DEPLOY",this.attributes.workspace.id)&&(this.attributes.state=="READY"||this.attributes.state=="PREPARED")},canStop:function(e){return e.hasPermission("APPLICATION_DEPLOY",this.attributes.workspace.id)&&this.attributes.state=="RUNNING"},canDeregister:function(e){return e.hasPermission("APPLICATION_DEPLOY",this.attributes.workspace.id)&&this.attributes.state=="READY"},canMakeCurrent:function(e){return e.hasPermission("APPLICATION_DEPLOY",this.attributes.workspace.id)&&this.attributes.state=="RUNNING"&&!this.attributes.is_current},canDelete:function(e){return e.hasPermission("APPLICATION_DEPLOY",this.attributes.workspace.id)&&(this.attributes.state=="PREPARED"||this.attributes.state=="NEW")&&!this.attributes.is_current}});return n}),define("collections/versions",["underscore","backbone","models/version"],function(e,t,n){var r=t.Collection.extend({model:n,parse:function(e){return e.data.versions},healthClasses:{OK:{badge:"badge-success",icon:"icon-ok"},WARNING:{badge:"badge-warning",icon:"icon-warning-sign"},ERROR:{badge:"badge-important",icon:"icon-ban-circle"}},comparator:function(e){return-e.get("version")}});return r}),define("models/application",["underscore","backbone","collections/versions"],function(e,t,n){var r=t.Model.extend({defaults:{name:"none"},initialize:function(){this.versions=new n,this.versions.url="/application/"+this.id+"?format=json"},url:function(){return"/application/"+this.id+"?format=json"},parse:function(e){if(e.data){var t=e.data.application;return t.versions=e.data.versions,t.workspace=e.data.workspace,t.instance_counts=e.data.instance_counts,t}return e}});return r}),define("collections/applications",["underscore","backbone","models/application"],function(e,t,n){var r=t.Collection.extend({model:n,healthClasses:{OK:{badge:"badge-success",icon:"icon-ok"},WARNING:{badge:"badge-warning",icon:"icon-warning-sign"},ERROR:{badge:"badge-important",icon:"icon-ban-circle"}},parse:function(e){return e.data?e.data.applications:e},comparator:function(e){return e.get("name")}});return r}),define("models/workspace",["underscore","backbone","collections/applications"],function(e,t,n){var r=t.Model.extend({defaults:{name:"",stub:"",tags:{}},initialize:function(){this.applications=new n,this.applications.url="/workspace/"+this.id+"/applications?format=json"},url:function(){return this.id?"/workspace/"+this.id+"?format=json":"/workspace/create?format=json"},parse:function(e){return e.data?e.data.workspace:e}});return r}),define("collections/workspaces",["underscore","backbone","models/workspace"],function(e,t,n){var r=t.Collection.extend({model:n,url:"/workspace/list?format=json",parse:function(e){return e.data.workspaces},comparator:function(e){return e.get("name")}});return r}),define("util",["jquery","underscore","backbone","moment"],function(e,t,n,r){var i={};return i.dateFormats={pacemaker:"YYYY-MM-DD_HH:mm:ss.______ Z",word:"MMMM Do YYYY, HH:mm:ss Z"},i.parseDate=function(e){return r(e+" +0000",i.dateFormats.pacemaker)},i.shrinkUuids=function(t){e("code.uuid-shrink",t).each(function(t,n){n=e(n),n.text(n.attr("title").substr(0,8)),n.on("click",i.shrinkClickHandler)})},i.shrinkClickHandler=function(t){var n=e(t.target);n.text().length>8?n.text(n.attr("title").substr(0,8)):n.text(n.attr("title"))},i.number_format=function(e,t,n,r){e=(e+"").replace(/[^0-9+\-Ee.]/g,"");var i=isFinite(+e)?+e:0,s=isFinite(+t)?Math.abs(t):0,o=typeof r=="undefined"?",":r,u=typeof n=="undefined"?".":n,a="",f=function(e,t){var n=Math.pow(10,t);return""+Math.round(e*n)/n};return a=(s?f(i,s):""+Math.round(i)).split("."),a[0].length>3&&(a[0]=a[0].replace(/\B(?=(?:\d{3})+(?!\d))/g,o)),(a[1]||"").length<s&&(a[1]=a[1]||"",a[1]+=(new Array(s-a[1].length+1)).join("0")),a.join(u)},i}),define("models/instance",["underscore","backbone","util"],function(e,t,n){var r=t.Model.extend({defaults:{name:"none",uuid:"none"}});return r}),define("collections/instances",["underscore","backbone","models/instance"],function(e,t,n){var r=t.Collection.extend({model:n,parse:function(e){return e.data.instances}});return r}),define("models/node",["underscore","backbone","util","collections/instances"],function(e,t,n,r){var i=t.Model.extend({initialize:function(){this.instances=new r,this.instances.url="/node/"+this.id+"/instances?format=json"},defaults:{name:"none",uuid:"none"},url:function(){return"/node/"+this.id+"?format=json"},parse:function(e){return e.data?e.data.node:e},uptimeString:function(e){e||(e=n.parseDate(this.attributes.start_time));var t=moment().diff(e,"seconds"),r="";if(t>86400){var i=Math.floor(t/86400);r+=i+(i==1?" day, ":" days, "),t%=86400}if(t>3600){var s=Math.floor(t/3600);r+=s+(s==1?" hour, ":" hours, "),t%=3600}if(t>60){var o=Math.floor(t/60);r+=o+(o==1?" minute, ":" minutes, "),t%=60}return r+=t+(t==1?" second":" seconds"),r},runtimeSummary:function(){var e=[];if(this.attributes.tags.runtimes&&Object.keys(this.attributes.tags.runtimes).length>0)for(var t in this.attributes.tags.runtimes)e.push({name:t,versions:this.attributes.tags.runtimes[t].join(", ")});return e}});return i}),define("collections/nodes",["underscore","backbone","models/node"],function(e,t,n){var r=t.Collection.extend({model:n,url:"/node/list?format=json",parse:function(e){return e.data.nodes},stateClasses:{ACTIVE:{badge:"badge-success",icon:"icon-ok"},STOPPED:{badge:"badge-warning",icon:"icon-warning-sign"},INACTIVE:{badge:"badge-warning",icon:"icon-warning-sign"},DOWN:{badge:"badge-important",icon:"icon-ban-circle"}}});return r}),define("models/user",["underscore","backbone","util"],function(e,t,n){var r=t.Model.extend({defaults:{name:"",login:"",email:"",enabled:!0,password:""},url:function(){return this.id?"/user/"+this.id+"?format=json":"/user/create?format=json"},parse:function(e){return e.data?e.data.user:e}});return r}),define("collections/users",["underscore","backbone","models/user"],function(e,t,n){var r=t.Collection.extend({model:n,url:"/user/list?format=json",parse:function(e){return e.data.users}});return r}),define("models/role",["underscore","backbone","util"],function(e,t,n){var r=t.Model.extend({defaults:{name:"",permissions:[]},url:function(){return this.id?"/role/"+this.id+"?format=json":"/role/create?format=json"},parse:function(e){return e.data?e.data.role:e}});return r}),define("collections/roles",["underscore","backbone","models/role"],function(e,t,n){var r=t.Collection.extend({model:n,url:"/role/list?format=json",parse:function(e){return e.data.roles}});return r}),define("models/roleallocation",["underscore","backbone","util"],function(e,t,n){var r=t.Model.extend({defaults:{workspace_id:null,user_id:null,role_id:null},url:function(){return this.id?"/role/allocation/unassign?format=json":"/role/allocation/assign?format=json"}});return r}),define("collections/roleallocations",["underscore","backbone","models/roleallocation"],function(e,t,n){var r=t.Collection.extend({model:n,url:"/role/allocation/list?format=json",parse:function(e){return e.data.allocations}});return r}),define("models/usermeta",["underscore","backbone","util"],function(e,t,n){var r=t.Model.extend({defaults:{expanded_workspaces:[],expanded_applications:[]},url:"/profile/userdata?format=json",parse:function(e){return e.data?e.data.userdata:e},isWorkspaceExpanded:function(t){return this.attributes.expanded_workspaces||(this.attributes.expanded_workspaces=[]),e.indexOf(this.attributes.expanded_workspaces,t)!=-1},isApplicationExpanded:function(t){return this.attributes.expanded_applications||(this.attributes.expanded_applications=[]),e.indexOf(this.attributes.expanded_applications,t)!=-1},markWorkspaceExpanded:function(e){this.isWorkspaceExpanded(e)||(this.attributes.expanded_workspaces.push(e),this.saveUpdates())},markApplicationExpanded:function(e){this.isApplicationExpanded(e)||(this.attributes.expanded_applications.push(e),this.saveUpdates())},markWorkspaceCollapsed:function(e){this.isWorkspaceExpanded(e)&&(this.unexpand_workspace||(this.unexpand_workspace=[]),this.unexpand_workspace.push(e),this.saveUpdates())},markApplicationCollapsed:function(e){this.isApplicationExpanded(e)&&(this.unexpand_application||(this.unexpand_application=[]),this.unexpand_application.push(e),this.saveUpdates())},saveUpdates:function(){var t={};t.expanded_workspaces=this.attributes.expanded_workspaces,t.expanded_applications=this.attributes.expanded_applications;var n=this;this.fetch({success:function(r,i,s){r.attributes.expanded_workspaces||(r.attributes.expanded_workspaces=[]),r.attributes.expanded_applications||(r.attributes.expanded_applications=[]),n.unexpand_workspace||(n.unexpand_workspace=[]),n.unexpand_application||(n.unexpand_application=[]);var o=e.union(t.expanded_workspaces,r.attributes.expanded_workspaces);o=e.difference(o,n.unexpand_workspace);var u=e.union(t.expanded_applications,r.attributes.expanded_applications);u=e.difference(u,n.unexpand_application),n.save({userdata:{expanded_workspaces:o,expanded_applications:u}})}})}});return r}),define("context",["jquery","underscore","backbone","socketio","moment","collections/workspaces","collections/nodes","collections/users","collections/roles","collections/roleallocations","collections/applications","collections/versions","models/usermeta"],function(e,t,n,r,i,s,o,u,a,f,l,c,h){var p={};return p.dispatcher=t.clone(n.Events),p.workspaces=new s,p.applications=new l,p.versions=new c,p.nodes=new o,p.users=new u,p.roles=new a,p.roleallocations=new f,p.navigate=function(e){p.router.navigate(e,{trigger:!0})},p.hasPermission=function(e,t,n){n||(n=permissions);var r=[];t&&r.push(""+t+"_"+e),r.push("None_"+e);for(var i=0;i<r.length;i++)if(n[r[i]])return!0;return!1},p.initialize=function(){p.workspaces.reset(workspaces),p.usermeta=new h(usermeta)},p.loadPlugin=function(t,n,r){var i="plugin/"+t+"/script";require([i],function(r){var i=function(){n&&n(r)};if(!r._called_name){var s="/plugin/"+t+"/stylesheet.css";e("head").append('<link href="'+s+'" rel="stylesheet">'),r._called_name=t,r._resource_path="/plugin/"+t+"/",r.initialize(r._called_name,r._resource_path,i)}else i()},r)},p.getScmListSimple=function(t,n,r){var i="/scm/list/repos?plugin="+t;e.ajax({url:i,dataType:"json",success:function(e){e.error&&e.error.length>0?r({},e):n(e.data.repositories)},error:r})},p}),function(){function v(e,t,n){n=a;var r="__p+='"+e.replace(h,function(e){return"\\"+l[e]}).replace(n.escape||f,function(e,t){return"'+_.escape("+d(t)+")+'"}).replace(n.interpolate||f,function(e,t){return"'+("+d(t)+")+'"}).replace(n.evaluate||f,function(e,t){return"';"+d(t)+";__p+='"})+"';";n.variable||(r="with(obj||{}){"+r+"}"),r="var __p='';var print=function(){__p+=Array.prototype.join.call(arguments, '')};"+r+"return __p;";var i=new Function(n.variable||"obj","_",r);if(t)return i(t,_);var s=function(e){return i.call(this,e,_)};return s.source="function("+(n.variable||"obj")+"){"+r+"}",s}var e=["Msxml2.XMLHTTP","Microsoft.XMLHTTP","Msxml2.XMLHTTP.4.0"],t=/^\s*<\?xml(\s)+version=[\'\"](\d)*.(\d)*[\'\"](\s)*\?>/im,n=/<body[^>]*>\s*([\s\S]+)\s*<\/body>/im,r=typeof location!="undefined"&&location.href,i=r&&location.protocol&&location.protocol.replace(/\:/,""),s=r&&location.hostname,o=r&&(location.port||undefined),u=[],a={evaluate:/\{\{%(.+?)\}\}/g,interpolate:/\{\{=(.+?)\}\}/g,escape:/\{\{[^=%](.+?)\}\}/g},f=/.^/,l={"\\":"\\","'":"'",r:"\r",n:"\n",t:"	",u2028:"\u2028",u2029:"\u2029"};for(var c in l)l[l[c]]=c;var h=/\\|'|\r|\n|\t|\u2028|\u2029/g,p=/\\(\\|'|r|n|t|u2028|u2029)/g,d=function(e){return e.replace(p,function(e,t){return l[t]})};define("tpl",[],function(){var a,f,l;return typeof window!="undefined"&&window.navigator&&window.document?f=function(e,t){var n=a.createXhr();n.open("GET",e,!0),n.onreadystatechange=function(e){n.readyState===4&&t(n.responseText)},n.send(null)}:typeof process!="undefined"&&process.versions&&!!process.versions.node?(l=require.nodeRequire("fs"),f=function(e,t){t(l.readFileSync(e,"utf8"))}):typeof Packages!="undefined"&&(f=function(e,t){var n="utf-8",r=new java.io.File(e),i=java.lang.System.getProperty("line.separator"),s=new java.io.BufferedReader(new java.io.InputStreamReader(new java.io.FileInputStream(r),n)),o,u,a="";try{o=new java.lang.StringBuffer,u=s.readLine(),u&&u.length()&&u.charAt(0)===65279&&(u=u.substring(1)),o.append(u);while((u=s.readLine())!==null)o.append(i),o.append(u);a=String(o.toString())}finally{s.close()}t(a)}),a={version:"1.0.0",strip:function(e){if(e){e=e.replace(t,"");var r=e.match(n);r&&(e=r[1])}else e="";return e},jsEscape:function(e){return e.replace(/(['\\])/g,"\\$1").replace(/[\f]/g,"\\f").replace(/[\b]/g,"\\b").replace(/[\n]/g,"\\n").replace(/[\t]/g,"\\t").replace(/[\r]/g,"\\r")},createXhr:function(){var t,n,r;if(typeof XMLHttpRequest!="undefined")return new XMLHttpRequest;for(n=0;n<3;n++){r=e[n];try{t=new ActiveXObject(r)}catch(i){}if(t){e=[r];break}}if(!t)throw new Error("createXhr(): XMLHttpRequest not available");return t},get:f,parseName:function(e){var t=!1,n=e.indexOf("."),r=e.substring(0,n),i=e.substring(n+1,e.length);return n=i.indexOf("!"),n!==-1&&(t=i.substring(n+1,i.length),t=t==="strip",i=i.substring(0,n)),{moduleName:r,ext:i,strip:t}},xdRegExp:/^((\w+)\:)?\/\/([^\/\\]+)/,useXhr:function(e,t,n,r){var i=a.xdRegExp.exec(e),s,o,u;return i?(s=i[2],o=i[3],o=o.split(":"),u=o[1],o=o[0],(!s||s===t)&&(!o||o===n)&&(!u&&!o||u===r)):!0},finishLoad:function(e,t,n,r,i){n=t?a.strip(n):n;var s=v(n),o=s.source;i.isBuild&&i.inlineText&&(u[e]=o),r(s)},load:function(e,t,n,u){var f=a.parseName(e),l=f.moduleName+"."+f.ext,c=t.toUrl(l),h=u&&u.text&&u.text.useXhr||a.useXhr;!r||h(c,i,s,o)?a.get(c,function(t){a.finishLoad(e,f.strip,t,n,u)}):t([l],function(e){a.finishLoad(f.moduleName+"."+f.ext,f.strip,e,n,u)})},write:function(e,t,n,r){if(t in u){var i=u[t];n('define("'+e+"!"+t+'", function() { return '+i+"; });\n")}},writeFile:function(e,t,n,r,i){var s=a.parseName(t),o=s.moduleName+"."+s.ext,u=n.toUrl(s.moduleName+"."+s.ext)+".js";a.load(o,n,function(t){var n=function(e){return r(u,e)};n.asModule=function(e,t){return r.asModule(e,u,t)},a.write(e,o,n,i)},i)}},a})}(),define("tpl!templates/layout/breadcrumb.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+="";for(var i=0;i<crumbs.length;i++){__p+="\n	";var isLast=crumbs.length-1==i;__p+="\n	<li>\n		",isLast||(__p+='<a href="'+_.escape(crumbs[i].href)+'">'),__p+=""+_.escape(crumbs[i].title)+"",isLast||(__p+='</a>\n		<span class="divider">&middot;</span>'),__p+="\n	</li>\n"}__p+=""}return __p}}),define("models/service",["underscore","backbone"],function(e,t){var n=t.Model.extend({defaults:{name:""},parse:function(e){if(e.data){var t=e.data.service;return t.workspace=e.data.workspace,t.application=e.data.application,t}return e}});return n}),define("tpl!templates/layout/loadingerror.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+='<div class="area-controls">\n	<span class="loading" style="display: none;">\n		<img src="/static/img/load-inline.gif" width="16" height="11" alt="Loading..." />\n	</span>\n</div>\n<div class="alert alert-error" style="display: none;">\n</div>';return __p}}),define("bases",["jquery","underscore","backbone","context","tpl!templates/layout/loadingerror.html"],function(e,t,n,r,i){var s={};return s.errorLoadingHtml=i(),s.BaseView=n.View.extend({navigateAway:function(t){t.which!=2?(t.preventDefault(),r.navigate(e(t.currentTarget).attr("href"))):t.stopPropagation()},startLoadingInline:function(){this.$(".loading").show(),this.$(".error").hide()},startLoadingFull:function(){var t=e('<div class="loading-overlay"><img src="/static/img/spinner32.gif" alt=""></div>');this.$el.append(t),t.animate({opacity:.8})},doneLoading:function(){this.$(".loading").hide(),this.$(".loading-overlay").remove()},loadingError:function(n,r,i){function f(n){try{var r=JSON.parse(n);u=e("<ul></ul>"),r.data&&r.data.input_errors?t.each(r.data.input_errors,function(t,n,r){var i=e("<li></li>");i.text(n+": "+t),u.append(i)}):r.errors&&t.each(r.errors,function(t,n,r){var i=e("<li></li>");i.text(t),u.append(i)})}catch(i){o=e("<pre></pre>"),o.text(n)}}this.doneLoading(),this.$(".alert").show();var s=e("<strong></strong>"),o="",u="",a="";r.status&&(a+=r.status+" "),n.status&&(a+=n.status+" "),r.statusText&&(a+=r.statusText+" "),n.statusText&&(a+=n.statusText+" "),a.length>0&&s.text(a),r.responseText&&f(r.responseText),n.responseText&&f(n.responseText),r.errors&&(u=e("<ul></ul>"),t.each(r.errors,function(t,n,r){var i=e("<li></li>");i.text(t),u.append(i)})),this.$(".alert").empty(),this.$(".alert").append(s),this.$(".alert").append(o),this.$(".alert").append(u)},destroy:function(){this.undelegateEvents()}}),s}),define("tpl!templates/node/list.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+='\n<h1>Nodes</h1>\n\n<div class="node-list clearfix">\n	';for(var i=0;i<nodes.length;i++){__p+="\n		";var node=nodes[i];__p+='\n		<div class="node tile">\n			<div class="title">\n				<span class="state">\n					<span class="badge '+_.escape(stateClasses[node.attributes.state].badge)+'" title="State: '+_.escape(node.attributes.state)+'"><i class="'+_.escape(stateClasses[node.attributes.state].icon)+' icon-white"></i></span>\n				</span>\n				',context.hasPermission("NODE_DETAIL_VIEW")&&(__p+='\n					<a href="/node/'+_.escape(node.attributes.id)+'">\n				'),__p+="\n\n				"+_.escape(node.attributes.name)+"\n\n				",context.hasPermission("NODE_DETAIL_VIEW")&&(__p+="\n					</a>\n				"),__p+='\n			</div>\n			<div class="body">\n				',node.attributes.pacemaker&&(__p+='\n					<i class="icon-calendar"></i> Pacemaker\n				'),__p+="\n				",node.attributes.heart&&(__p+='\n					<i class="icon-heart"></i> Heart\n				'),__p+="\n				",node.attributes.router&&(__p+='\n					<i class="icon-random"></i> Router\n				'),__p+="\n				<br />\n				<strong>Uptime:</strong> "+_.escape(node.uptimeString())+"\n				<br />\n				<strong>Last report:</strong> "+_.escape(node.attributes.updated_age.toFixed(2))+" seconds ago\n				<br />\n				<strong>Score:</strong> "+_.escape(node.attributes.score.toFixed(2))+"\n			</div>\n		</div>\n	"}__p+="\n</div>"}return __p}}),define("views/node/list",["jquery","underscore","backbone","context","bases","tpl!templates/node/list.html"],function(e,t,n,r,i,s){var o=i.BaseView.extend({initialize:function(){this.collection.on("request",this.startLoadingFull,this),this.collection.on("sync",this.render,this),this.$el.html(s({nodes:[],context:r}))},destroy:function(){this.collection.off("request",this.startLoadingFull,this),this.collection.off("sync",this.render,this),this.undelegateEvents()},render:function(){return this.doneLoading(),this.$el.html(s({nodes:this.collection.models,context:r,stateClasses:this.collection.stateClasses})),this},events:{"click a":"navigateAway"}});return o}),define("tpl!templates/workspace/sidebar.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+='\n<ul class="nav nav-list workspace-sidebar-list">\n	<li class="nav-header">Workspaces</li>\n	',context.hasPermission("WORKSPACE_EDIT")&&(__p+='\n		<li class="divider"></li>\n		<li class="create-workspace"><a href="/workspace/create" class="virtual"><i class="icon-plus"></i> Create workspace</a></li>\n	'),__p+="\n</ul>";return __p}}),define("tpl!templates/workspace/sidebar-entry.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+='<li class="workspace workspace-'+_.escape(workspace.attributes.id)+'">\n	',context.hasPermission("WORKSPACE_VIEW")&&(__p+='<a href="/workspace/'+_.escape(workspace.attributes.id)+'/applications" class="virtual">'),__p+='<span class="workspace-title">'+_.escape(workspace.attributes.name)+"</span>",context.hasPermission("WORKSPACE_VIEW")&&(__p+="</a>"),__p+='\n	<a href="#" class="expand-applications" data-workspace="'+_.escape(workspace.attributes.id)+'"><i class="icon-chevron-down"></i></a>\n	<ul class="nav nav-list applications" style="display: none;">\n		<li><img src="/static/img/load-inline.gif" width="16" height="11" alt="Loading..." /></li>\n	</ul>\n</li>';return __p}}),define("tpl!templates/workspace/application-sidebar-entry.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+='<li class="application application-'+_.escape(application.attributes.id)+'">\n	<a href="/application/'+_.escape(application.attributes.id)+'" class="virtual">\n		<span class="state">\n			<span class="badge '+_.escape(healthClasses[application.attributes.health].badge)+'" title="Health: '+_.escape(application.attributes.health)+'">\n				<i class="'+_.escape(healthClasses[application.attributes.health].icon)+' icon-white"></i>\n			</span>\n		</span>\n		'+_.escape(application.attributes.name)+'\n	</a>\n	<a href="#" class="expand-versions" data-workspace="'+_.escape(workspace_id)+'" data-application="'+_.escape(application.attributes.id)+'"><i class="icon-chevron-down"></i></a>\n	<ul class="nav nav-list versions" style="display: none;">\n		<li><img src="/static/img/load-inline.gif" width="16" height="11" alt="Loading..." /></li>\n	</ul>\n</li>';return __p}}),define("tpl!templates/workspace/version-sidebar-entry.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+='<li class="version version-'+_.escape(version.id)+'">\n	<a href="/version/'+_.escape(version.id)+'" class="virtual">\n		Version '+_.escape(version.attributes.version)+"\n		",version.attributes.is_current&&(__p+='\n			<i class="icon-star"></i>\n		'),__p+="\n		",version.attributes.state=="RUNNING"&&(__p+='\n			<i class="icon-play"></i>\n		'),__p+="\n	</a>\n</li>";return __p}}),define("views/workspace/sidebar",["jquery","underscore","backbone","context","bases","tpl!templates/workspace/sidebar.html","tpl!templates/workspace/sidebar-entry.html","tpl!templates/workspace/application-sidebar-entry.html","tpl!templates/workspace/version-sidebar-entry.html"],function(e,t,n,r,i,s,o,u,a){var f=i.BaseView.extend({initialize:function(){this.$el.html(i.errorLoadingHtml+s({workspaces:[],context:r})),this.$(".area-controls").append(e('<a href="#" class="refresh"><i class="icon-refresh"></i></a>')),this.activeItem="";var t=this;this.collection.each(function(e,n,r){t.addWorkspace(e)}),this.collection.on("request",this.startLoadingInline,this),this.collection.on("sync",this.render,this),this.collection.on("add",this.addWorkspace,this),this.collection.on("change",this.changeWorkspace,this),this.collection.on("remove",this.removeWorkspace,this),this.collection.on("error",this.loadingError,this)},setActive:function(e){this.activeItem=e,this.$("li").removeClass("active"),e!=""&&this.$("li."+e).addClass("active")},resetActive:function(){this.setActive(this.activeItem)},addWorkspace:function(e){var t='<li class="divider"></li>'+o({workspace:e,context:r}),n=this.$(".workspace-sidebar-list .workspace:last");n.length==0&&(n=this.$(".workspace-sidebar-list .nav-header")),n.after(t);var i=e.id,s=this;e.applications.on("request",this.startLoadingInline,this),e.applications.on("sync",function(e,t,n){n.workspace_id=i,e.collection&&(e=e.collection),s.renderApplications(e,t,n)}),this.delegateEvents(),r.usermeta.isWorkspaceExpanded(e.id)&&this.expandApplications(e.id)},changeWorkspace:function(e,t){var n=this.$(".workspace-"+e.id+" .workspace-title");n.text(e.attributes.name)},removeWorkspace:function(e,t,n){this.$(".workspace-"+e.id).remove()},render:function(){this.doneLoading()},events:{"click a.refresh":"refreshList","click a.virtual":"navigateAway","click a.expand-applications":"expandApplicationsClick","click a.expand-versions":"expandVersionsClick"},refreshList:function(e){this.collection.fetch(),e.preventDefault()},expandApplicationsClick:function(t){t.preventDefault();var n=e(t.currentTarget),i=n.data("workspace"),s=e(".applications",n.parent());s.is(":visible")?(s.slideUp(),r.usermeta.markWorkspaceCollapsed(i),e("i",n).attr("class","icon-chevron-down")):(s.slideDown(),this.expandApplications(i),r.usermeta.markWorkspaceExpanded(i),e("i",n).attr("class","icon-chevron-up"))},expandApplications:function(e){var t=this.collection.get(e);t.applications.fetch({workspace_id:e})},renderApplications:function(t,n,i){this.doneLoading();var s=this.$(".workspace-"+i.workspace_id+" .applications"),o=e('<ul class="nav nav-list applications"></ul>');r.hasPermission("APPLICATION_CREATE",i.workspace_id)&&o.append('<li class="create-application-'+i.workspace_id+'"><a class="virtual" href="/workspace/'+i.workspace_id+'/applications/new"><i class="icon-plus"></i> Create Application</a>'),t.each(function(n,s,a){o.append(u({application:n,context:r,workspace_id:i.workspace_id,healthClasses:t.healthClasses}));var f=this.$(".application-"+n.id+" ul.versions"),l=f.is(":visible"),c=e("li",f);l&&c.length>1&&(e(".application-"+n.id+" ul.versions",o).html(f.clone()),e(".application-"+n.id+" ul.versions",o).show())}),t.length==0&&o.append("<li>No applications</li>"),s.replaceWith(o),this.delegateEvents(),this.resetActive();var a=this;t.each(function(e,t,n){r.usermeta.isApplicationExpanded(e.id)&&a.expandVersions(i.workspace_id,e.id)})},expandVersionsClick:function(t){t.preventDefault();var n=e(t.currentTarget),i=n.data("workspace"),s=n.data("application"),o=e(".versions",n.parent());o.is(":visible")?(o.slideUp(),e("i",n).attr("class","icon-chevron-down"),r.usermeta.markApplicationCollapsed(s)):(o.slideDown(),this.expandVersions(i,s),r.usermeta.markApplicationExpanded(s),e("i",n).attr("class","icon-chevron-up"))},expandVersions:function(e,t){var n=this.collection.get(e),r=n.applications.get(t);r.versions.on("sync",this.renderVersions,this),r.versions.fetch({application_id:t,workspace_id:e})},renderVersions:function(t,n,i){var s=this.$(".application-"+i.application_id+" .versions"),o=e('<ul class="nav nav-list versions"></ul>');r.hasPermission("APPLICATION_CREATE",i.workspace_id)&&o.append('<li class="create-version-'+i.application_id+'"><a class="virtual" href="/application/'+i.application_id+'/newversion"><i class="icon-plus"></i> Create New Version</a>'),t.each(function(e,t,n){o.append(a({version:e,context:r}))}),t.length==0&&o.append("<li>No versions</li>"),o.append('<li class="divider"></li>'),s.replaceWith(o),this.delegateEvents(),this.resetActive()}});return f}),define("tpl!templates/node/sidebar.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+='<ul class="nav nav-list node-sidebar-list">\n	<li class="nav-header">Nodes</li>\n</ul>\n';return __p}}),define("tpl!templates/node/sidebar-entry.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+="",context.hasPermission("NODE_DETAIL_VIEW")&&(__p+='\n	<a href="/node/'+_.escape(node.attributes.id)+'">\n'),__p+='\n<div class="title">\n	<span class="state">\n		<span class="badge '+_.escape(stateClasses[node.attributes.state].badge)+'" title="State: '+_.escape(node.attributes.state)+'"><i class="'+_.escape(stateClasses[node.attributes.state].icon)+' icon-white"></i></span>\n	</span>\n	<span class="name">'+_.escape(node.attributes.name)+'</span>\n</div>\n<div class="details">\n	Score: '+_.escape(node.attributes.score.toFixed(2))+", Last heard: "+_.escape(node.attributes.updated_age.toFixed(2))+"s\n	",node.attributes.pacemaker&&(__p+='\n		<i class="icon-calendar" title="Pacemaker"></i>\n	'),__p+="\n	",node.attributes.heart&&(__p+='\n		<i class="icon-heart" title="Heart"></i>\n	'),__p+="\n	",node.attributes.router&&(__p+='\n		<i class="icon-random" title="Router"></i>\n	'),__p+="\n</div>\n",context.hasPermission("NODE_DETAIL_VIEW")&&(__p+="\n	</a>\n"),__p+="";return __p}}),define("views/node/sidebar-entry",["jquery","underscore","backbone","context","bases","tpl!templates/node/sidebar-entry.html"],function(e,t,n,r,i,s){var o=i.BaseView.extend({initialize:function(){this.model.on("change",this.render,this),this.render()},render:function(){this.$el.html(s({context:r,node:this.model,stateClasses:r.nodes.stateClasses})),this.model.attributes.active?this.$el.addClass("active"):this.$el.removeClass("active")},events:{"click a":"navigateAway"}});return o}),define("views/node/sidebar",["jquery","underscore","backbone","context","bases","tpl!templates/node/sidebar.html","views/node/sidebar-entry"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){this.$el.html(i.errorLoadingHtml+s({nodes:[],context:r})),this.$(".area-controls").append(e('<a href="#" class="refresh"><i class="icon-refresh"></i></a>')),this.collection.on("request",this.startLoadingInline,this),this.collection.on("sync",this.render,this),this.collection.on("add",this.addNode,this),this.collection.on("error",this.loadingError,this),this.startLoadingInline()},addNode:function(t){var n=e('<li class="node node-'+t.attributes.id+'"></li>');this.$(".nav-list").append(n);var r=new o({el:n,model:t})},render:function(){this.doneLoading()},events:{"click a.refresh":"refreshList"},refreshList:function(e){this.collection.fetch(),e.preventDefault()}});return u}),define("tpl!templates/node/detail.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+="<h1>\n	Node "+_.escape(node.attributes.name)+'\n</h1>\n\n<div class="row-fluid">\n	<div class="span6">\n		<ul class="node-details" style="clear: left;">\n			<li><strong>Roles:</strong>\n			',node.attributes.pacemaker&&(__p+='\n				<i class="icon-calendar"></i> Pacemaker\n			'),__p+="\n			",node.attributes.heart&&(__p+='\n				<i class="icon-heart"></i> Heart\n			'),__p+="\n			",node.attributes.router&&(__p+='\n				<i class="icon-random"></i> Router\n			'),__p+="\n			</li>\n			<li><strong>UUID:</strong> <code>"+_.escape(node.attributes.uuid)+"</code></li>\n			<li><strong>Route:</strong> "+_.escape(node.attributes.route)+":"+_.escape(node.attributes.apiport)+"</li>\n			<li><strong>State:</strong> "+_.escape(node.attributes.state)+'</li>\n			<li title="Started at '+_.escape(node.attributes.start_time)+'"><strong>Uptime:</strong> '+_.escape(node.uptimeString())+'</li>\n			<li title="'+_.escape(node.attributes.updated_age.toFixed(2))+'"><strong>Last report:</strong> '+_.escape(node.attributes.updated_age.toFixed(2))+" seconds ago</li>\n			<li><strong>Score:</strong> "+_.escape(node.attributes.score.toFixed(2))+'</li>\n		</ul>\n	</div>\n	<div class="span6">\n		<div class="node-chart node-disk">\n			<div class="chart"></div><div class="legend"></div>\n		</div>\n		<div class="node-chart node-memory">\n			<div class="chart"></div><div class="legend"></div>\n		</div>\n	</div>\n</div>\n\n';var runtimes=node.runtimeSummary();__p+="\n";if(runtimes.length>0){__p+='\n	<h3>Runtimes</h3>\n	<div class="runtimes-list tile-box clearfix">\n		';for(var i=0;i<runtimes.length;i++){__p+="\n			";var runtime=runtimes[i];__p+='\n			<div class="runtime tile">\n				<div class="title">\n					<strong>'+_.escape(runtime.name)+'</strong>\n				</div>\n				<div class="body">\n					Versions: '+_.escape(runtime.versions)+"\n				</div>\n			</div>\n		"}__p+="\n	</div>\n\n	<hr/>\n"}__p+='\n\n<div class="row-fluid">\n	<div class="span6">\n		<h3>Tags</h3>\n		<pre>'+_.escape(JSON.stringify(node.attributes.tags,undefined,4))+'</pre>\n	</div>\n	<div class="span6">\n		<h3>Stats</h3>\n		<pre>'+_.escape(JSON.stringify(node.attributes.stats,undefined,4))+'</pre>\n	</div>\n</div>\n\n<hr>\n\n<h2 class="node-instances">Instances</h2>\n<div class="instances-list tile-box clearfix">\n</div>'}return __p}}),define("tpl!templates/node/instances.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+="\n";for(var i=0;i<instances.length;i++){__p+="\n	";var instance=instances[i];__p+='\n	<div class="instance tile">\n		<div class="title-multilink">\n			<strong>\n				<a href="/application/'+_.escape(instance.attributes.application.id)+'">'+_.escape(instance.attributes.application.name)+'</a>,\n				<a href="/version/'+_.escape(instance.attributes.version.id)+'">version '+_.escape(instance.attributes.version.version)+'</a>\n			</strong>\n		</div>\n		<div class="body">\n			<strong>State:</strong> '+_.escape(instance.attributes.state)+'\n			<br />\n			<code class="uuid-shrink" title="'+_.escape(instance.attributes.instance_id)+'">'+_.escape(instance.attributes.instance_id.substr(0,8))+'</code>\n			<br />\n			<strong>Log:</strong> <a href="/node/'+_.escape(instance.attributes.node_id)+"/log/"+_.escape(instance.attributes.instance_id)+'">View</a>\n		</div>\n	</div>\n'}__p+=""}return __p}}),define("views/node/instances",["jquery","underscore","backbone","context","bases","util","tpl!templates/node/instances.html"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){this.collection.on("request",this.startLoadingFull,this),this.collection.on("sync",this.render,this),this.$el.html(o({instances:this.collection.models,context:r})),this.startLoadingFull()},destroy:function(){this.collection.off("request",this.startLoadingFull,this),this.collection.off("sync",this.render,this),this.undelegateEvents()},render:function(){return this.doneLoading(),this.$el.html(o({instances:this.collection.models,context:r})),s.shrinkUuids(this.$el),this}});return u}),define("views/node/detail",["jquery","underscore","backbone","context","bases","util","tpl!templates/node/detail.html","views/node/instances"],function(e,t,n,r,i,s,o,u){var a=i.BaseView.extend({initialize:function(){this.model?(this.model.on("change",this.render,this),this.render()):this.startLoadingFull()},destroy:function(){this.model&&this.model.off("change",this.render,this),this.nodeInstancesView&&this.nodeInstancesView.destroy(),this.undelegateEvents()},render:function(){return this.$el.html(o({context:r,node:this.model})),s.shrinkUuids(this.$el),this.model.attributes.stats.disk_total&&this.model.attributes.stats.disk_free&&e.plot(this.$(".node-disk .chart"),[{label:"Disk used",color:"darkviolet",data:this.model.attributes.stats.disk_total-this.model.attributes.stats.disk_free},{label:"Disk free",color:"lightblue",data:this.model.attributes.stats.disk_free}],{series:{pie:{show:!0}},legend:{container:this.$(".node-disk .legend")}}),this.model.attributes.stats.mem_total&&this.model.attributes.stats.mem_adjusted_free&&e.plot(this.$(".node-memory .chart"),[{label:"Memory used",color:"darksalmon",data:this.model.attributes.stats.mem_total-this.model.attributes.stats.mem_adjusted_free},{label:"Memory free",color:"lightblue",data:this.model.attributes.stats.mem_adjusted_free}],{series:{pie:{show:!0}},legend:{container:this.$(".node-memory .legend")}}),this.nodeInstancesView=new u({collection:this.model.instances,el:this.$(".instances-list")}),this.model.instances.fetch(),this},events:{"click a":"navigateAway"}});return a}),define("tpl!templates/administration/sidebar.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+='<ul class="nav nav-list node-sidebar-list">\n	<li class="nav-header">Administration</li>\n	';for(var i=0;i<administrations.length;i++){__p+="\n		";var administration=administrations[i];__p+="\n		<li ",administration.attributes.active&&(__p+='class="active"'),__p+='>\n			<a href="'+_.escape(administration.attributes.path)+'">\n				'+_.escape(administration.attributes.name)+"\n			</a>\n		</li>\n	"}__p+="\n</ul>\n"}return __p}}),define("views/administration/sidebar",["jquery","underscore","backbone","context","bases","tpl!templates/administration/sidebar.html"],function(e,t,n,r,i,s){var o=i.BaseView.extend({initialize:function(){this.collection.on("change",this.render,this),this.render()},render:function(){this.$el.html(s({administrations:this.collection.models,context:r}))},events:{"click a":"navigateAway"}});return o}),define("tpl!templates/administration/profile.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+='<h1>Your profile</h1>\n\n<p class="lead">Your API key is <code>'+_.escape(apikey)+"</code>.</p>";return __p}}),define("views/administration/profile",["jquery","underscore","backbone","context","bases","util","tpl!templates/administration/profile.html"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){this.$el.html(o({context:r,apikey:"loading"})),this.startLoadingFull()},render:function(e){return this.$el.html(o({context:r,apikey:e})),this}});return u}),define("tpl!templates/administration/list.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+='<div class="administration-list tile-box">\n	';for(var i=0;i<administrations.length;i++){__p+="\n		";var administration=administrations[i];__p+='\n		<div class="administration tile">\n			<div class="title">\n				<a href="'+_.escape(administration.attributes.path)+'">\n					'+_.escape(administration.attributes.name)+"\n				</a>\n			</div>\n		</div>\n	"}__p+="\n</div>\n"}return __p}}),define("views/administration/list",["jquery","underscore","backbone","context","bases","tpl!templates/administration/list.html"],function(e,t,n,r,i,s){var o=i.BaseView.extend({initialize:function(){this.render()},render:function(){this.$el.html(s({administrations:this.collection.models,context:r}))},events:{"click a":"navigateAway"}});return o}),define("tpl!templates/administration/user-list.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+='\n<h1>Users</h1>\n\n<div class="btn-group btn-group-header">\n	',context.hasPermission("USER_EDIT")&&(__p+='\n		<a class="btn" href="/user/create"><i class="icon-plus"></i> Create User</a>\n	'),__p+='\n</div>\n\n<div class="user-list clearfix">\n	';for(var i=0;i<users.length;i++){__p+="\n		";var user=users[i];__p+='\n		<div class="user tile">\n			<div class="title">\n				',context.hasPermission("USER_EDIT")&&(__p+='\n					<a href="/user/'+_.escape(user.attributes.id)+'">\n				'),__p+="\n\n				"+_.escape(user.attributes.name)+" ("+_.escape(user.attributes.login)+")\n\n				",context.hasPermission("USER_EDIT")&&(__p+="\n					</a>\n				"),__p+='\n			</div>\n			<div class="body">\n				<strong>Method:</strong> '+_.escape(user.attributes.auth_source)+"\n				<br />\n				<strong>Enabled:</strong> "+_.escape(user.attributes.enabled?"Enabled":"Disabled")+"\n			</div>\n		</div>\n	"}__p+="\n</div>"}return __p}}),define("views/administration/user-list",["jquery","underscore","backbone","context","bases","tpl!templates/administration/user-list.html"],function(e,t,n,r,i,s){var o=i.BaseView.extend({initialize:function(){this.collection.on("request",this.startLoadingFull,this),this.collection.on("sync",this.render,this),this.$el.html(s({users:[],context:r}))},destroy:function(){this.collection.off("request",this.startLoadingFull,this),this.collection.off("sync",this.render,this),this.undelegateEvents()},render:function(){return this.doneLoading(),this.$el.html(i.errorLoadingHtml+s({users:this.collection.models,context:r})),this},events:{"click a":"navigateAway"}});return o}),define("views/layout/genericloading",["jquery","underscore","backbone","context","bases"],function(e,t,n,r,i){var s=i.BaseView.extend({initialize:function(){this.render()},render:function(){this.$el.html(i.errorLoadingHtml+"<h1>Loading...</h1>"),this.startLoadingFull()},loadingError:function(e,t,n){this.$("h1").remove(),i.BaseView.prototype.loadingError.apply(this,[e,t,n])}});return s}),define("tpl!templates/administration/user-edit.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+="\n<h1>",newUser?__p+="Create user":__p+="Edit user",__p+='</h1>\n\n<form method="POST" class="form-horizontal">\n	<div class="control-group">\n		<label class="control-label" for="name">Name:</label>\n		<div class="controls">\n			<input name="name" id="name" type="text" value="'+_.escape(user.attributes.name)+'" />\n		</div>\n	</div>\n\n	<div class="control-group">\n		<label class="control-label" for="login">Login:</label>\n		<div class="controls">\n			<input name="login" id="login" type="text" value="'+_.escape(user.attributes.login)+'" />\n		</div>\n	</div>\n\n	<div class="control-group">\n		<label class="control-label" for="email">Email address:</label>\n		<div class="controls">\n			<input name="email" id="email" type="email" value="'+_.escape(user.attributes.email)+'" />\n		</div>\n	</div>\n\n	<div class="control-group">\n		<label class="control-label" for="password">Password:</label>\n		<div class="controls">\n			<input name="password" id="password" type="password" value="" />\n		</div>\n	</div>\n\n	<div class="control-group">\n		<div class="controls">\n			<label for="enabled" class="checkbox">\n				<input name="enabled" id="enabled" type="checkbox" ',user.attributes.enabled&&(__p+='checked="checked"'),__p+=' />\n				Enabled\n			</label>\n		</div>\n	</div>\n\n	<div class="control-group">\n		<div class="controls">\n			<button type="submit" class="btn">Submit</button>\n		</div>\n	</div>\n</form>';return __p}}),define("views/administration/user-edit",["jquery","underscore","backbone","context","bases","tpl!templates/administration/user-edit.html","models/user"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){this.model?this.newUser=!1:(this.newUser=!0,this.model=new o),this.render()},render:function(){return this.$el.html(i.errorLoadingHtml+s({user:this.model,context:r,newUser:this.newUser})),this},saveModel:function(e){e.preventDefault(),this.startLoadingFull(),this.model.save({name:this.$("#name").val(),login:this.$("#login").val(),email:this.$("#email").val(),enabled:this.$("#enabled").is(":checked"),password:this.$("#password").val()},{success:t.bind(this.saveOk,this),error:t.bind(this.loadingError,this)})},saveOk:function(){r.navigate("/user/list")},events:{"click button":"saveModel"}});return u}),define("tpl!templates/administration/role-list.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+='\n<h1>Roles</h1>\n\n<div class="btn-group btn-group-header">\n	',context.hasPermission("ROLE_EDIT")&&(__p+='\n		<a class="btn" href="/role/create"><i class="icon-plus"></i> Create Role</a>\n	'),__p+='\n</div>\n\n<div class="role-list clearfix">\n	';for(var i=0;i<roles.length;i++){__p+="\n		";var role=roles[i];__p+='\n		<div class="role tile">\n			<div class="title">\n				',context.hasPermission("ROLE_EDIT")&&(__p+='\n					<a href="/role/'+_.escape(role.attributes.id)+'">\n				'),__p+="\n\n				"+_.escape(role.attributes.name)+"\n\n				",context.hasPermission("ROLE_EDIT")&&(__p+="\n					</a>\n				"),__p+='\n			</div>\n			<div class="body">\n				'+_.escape(role.attributes.permissions.length)+" permissions\n			</div>\n		</div>\n	"}__p+="\n</div>"}return __p}}),define("views/administration/role-list",["jquery","underscore","backbone","context","bases","tpl!templates/administration/role-list.html"],function(e,t,n,r,i,s){var o=i.BaseView.extend({initialize:function(){this.collection.on("request",this.startLoadingFull,this),this.collection.on("sync",this.render,this),this.$el.html(s({roles:[],context:r}))},destroy:function(){this.collection.off("request",this.startLoadingFull,this),this.collection.off("sync",this.render,this),this.undelegateEvents()},render:function(){return this.doneLoading(),this.$el.html(i.errorLoadingHtml+s({roles:this.collection.models,context:r})),this},events:{"click a":"navigateAway"}});return o}),define("tpl!templates/administration/role-edit.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+="\n<h1>",newRole?__p+="Create role":__p+="Edit role",__p+='</h1>\n\n<form method="POST" class="form-horizontal">\n	<div class="control-group">\n		<label class="control-label" for="name">Name:</label>\n		<div class="controls">\n			<input name="name" id="name" type="text" value="'+_.escape(role.attributes.name)+'" />\n		</div>\n	</div>\n\n	<div class="control-group">\n		<label class="control-label">Permissions</label>\n		<div class="controls">\n			';for(var i=0;i<availablePermissions.length;i++){__p+="\n				";var permission=availablePermissions[i];__p+='\n				<label class="checkbox">\n					<input type="checkbox" name="'+_.escape(permission)+'" ',_.indexOf(role.attributes.permissions,permission)!=-1&&(__p+='checked="checked"'),__p+=' value="'+_.escape(permission)+'" />\n					'+_.escape(permission)+"\n				</label>\n			"}__p+='\n		</div>\n	</div>\n\n	<div class="control-group">\n		<div class="controls">\n			<button type="submit" class="btn">Submit</button>\n		</div>\n	</div>\n</form>'}return __p}}),define("views/administration/role-edit",["jquery","underscore","backbone","context","bases","tpl!templates/administration/role-edit.html","models/role"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){this.model?this.newRole=!1:(this.newRole=!0,this.model=new o),this.render()},render:function(){return this.$el.html(i.errorLoadingHtml+s({role:this.model,context:r,newRole:this.newRole,availablePermissions:available_permissions,_:t})),this},saveModel:function(e){e.preventDefault(),this.startLoadingFull();var n=[];for(var r=0;r<available_permissions.length;r++)this.$("input[name="+available_permissions[r]+"]").is(":checked")&&n.push(available_permissions[r]);this.model.save({name:this.$("#name").val(),permissions:n},{success:t.bind(this.saveOk,this),error:t.bind(this.loadingError,this)})},saveOk:function(){r.navigate("/role/list")},events:{"click button":"saveModel"}});return u}),define("tpl!templates/administration/role-allocation-list.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+='\n<h1>Role Allocations</h1>\n\n<div class="btn-group btn-group-header">\n	',context.hasPermission("ROLE_ASSIGN")&&(__p+='\n		<a class="btn" href="/role/allocation/assign"><i class="icon-plus"></i> Assign Role</a>\n	'),__p+='\n</div>\n\n<div class="role-allocation-list clearfix">\n	';for(var i=0;i<allocations.length;i++){__p+="\n		";var allocation=allocations[i];__p+='\n		<div class="role-allocation tile">\n			<div class="title-multilink">\n				Allocation ID '+_.escape(allocation.attributes.id)+' <button class="btn btn-mini btn-danger remove" href="#" data-allocation="'+_.escape(allocation.attributes.id)+'">Remove</button>\n			</div>\n			<div class="body">\n				<strong>Role:</strong> <a href="/role/'+_.escape(allocation.attributes.role.id)+'">'+_.escape(allocation.attributes.role.name)+'</a>\n				<br />\n				<strong>User:</strong> <a href="/user/'+_.escape(allocation.attributes.user.id)+'">'+_.escape(allocation.attributes.user.name)+" ("+_.escape(allocation.attributes.user.login)+")</a>\n				<br />\n				<strong>Workspace:</strong>\n				",allocation.attributes.workspace?__p+='\n					<a href="/workspace/'+_.escape(allocation.attributes.workspace.id)+'">'+_.escape(allocation.attributes.workspace.name)+"</a>\n				":__p+="\n					All workspaces\n				",__p+="\n				</strong>\n			</div>\n		</div>\n	"}__p+="\n</div>"}return __p}}),define("views/administration/role-allocation-list",["jquery","underscore","backbone","context","bases","tpl!templates/administration/role-allocation-list.html"],function(e,t,n,r,i,s){var o=i.BaseView.extend({initialize:function(){this.collection.on("request",this.startLoadingFull,this),this.collection.on("sync",this.render,this),this.$el.html(s({allocations:[],context:r}))},destroy:function(){this.collection.off("request",this.startLoadingFull,this),this.collection.off("sync",this.render,this),this.undelegateEvents()},render:function(){return this.doneLoading(),this.$el.html(i.errorLoadingHtml+s({allocations:this.collection.models,context:r})),this},events:{"click button.remove":"removeAllocation","click a":"navigateAway"},removeAllocation:function(n){n.preventDefault();var r=e(n.currentTarget),i=r.data("allocation"),s=this;e.ajax("/role/allocation/unassign?format=json",{type:"POST",data:JSON.stringify({data:{allocation_id:i}}),dataType:"json",success:function(){s.startLoadingFull(),s.collection.fetch()},error:t.bind(this.loadingError,this)}),this.startLoadingInline()}});return o}),define("tpl!templates/administration/role-allocation-assign.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+='\n<h1>Assign Role</h1>\n\n<form method="POST" class="form-horizontal">\n	<div class="control-group">\n		<label class="control-label" for="user_id">User:</label>\n		<div class="controls">\n			<select name="user_id" id="user_id"></select>\n		</div>\n	</div>\n\n	<div class="control-group">\n		<label class="control-label" for="role_id">Role:</label>\n		<div class="controls">\n			<select name="role_id" id="role_id"></select>\n		</div>\n	</div>\n\n	<div class="control-group">\n		<label class="control-label" for="workspace_id">Workspace:</label>\n		<div class="controls">\n			<select name="workspace_id" id="workspace_id">\n				<option value="">-- Global</option>\n			</select>\n		</div>\n	</div>\n\n	<div class="control-group">\n		<div class="controls">\n			<button type="submit" class="btn">Submit</button>\n		<div>\n	</div>\n</form>';return __p}}),define("views/administration/role-allocation-assign",["jquery","underscore","backbone","context","bases","tpl!templates/administration/role-allocation-assign.html","models/roleallocation"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){r.roles.on("sync",this.renderRoles,this),r.workspaces.on("sync",this.renderWorkspaces,this),r.users.on("sync",this.renderUsers,this),this.$el.html(i.errorLoadingHtml+s({context:r})),this.renderRoles(r.roles),this.renderWorkspaces(r.workspaces),this.renderUsers(r.users)},destroy:function(){r.roles.off("sync",this.renderRoles,this),r.workspaces.off("sync",this.renderWorkspaces,this),r.users.off("sync",this.renderUsers,this),this.undelegateEvents()},renderRoles:function(e,t,n){this.renderSelect(e,this.$("#role_id"))},renderWorkspaces:function(t,n,r){var i=this.$("#workspace_id");this.renderSelect(t,i),i.prepend(e('<option value="">-- Global</option>'))},renderUsers:function(e,t,n){this.renderSelect(e,this.$("#user_id"))},renderSelect:function(t,n){n.empty(),t.each(function(t,r,i){var s=e("<option></option>");s.attr("value",t.attributes.id),s.text(t.attributes.name),n.append(s)})},saveModel:function(e){e.preventDefault(),this.startLoadingFull();var n=new o;n.save({user_id:this.$("#user_id").val(),role_id:this.$("#role_id").val(),workspace_id:this.$("#workspace_id").val()},{success:t.bind(this.saveOk,this),error:t.bind(this.loadingError,this)})},saveOk:function(){r.navigate("/role/allocation/list")},events:{"click button":"saveModel"}});return u}),define("tpl!templates/widget/joblist.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+="\n<h1>"+_.escape(title)+"</h1>\n\n";for(var i=0;i<jobs.length;i++){__p+="\n	";var jobId=jobs[i];__p+="\n	";var jobMeta=job_detail[jobId];__p+='\n	<div class="job well well-small" data-jobid="'+_.escape(jobId)+'">\n		',jobMeta?__p+='\n			<img src="/static/img/load-inline.gif" width="16" height="11" alt="Loading..." /> Job \''+_.escape(jobMeta.title)+"' in state "+_.escape(jobMeta.state)+"\n		":__p+='\n			<img src="/static/img/load-inline.gif" width="16" height="11" alt="Loading..." /> Loading...\n		',__p+="\n	</div>\n"}__p+=""}return __p}}),define("tpl!templates/widget/jobblock.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+='<div class="title title-'+_.escape(job.job_id)+'">\n	<span class="icon label label-'+_.escape(statusClassMap[job.state])+'">\n		<i class="'+_.escape(statusIconMap[job.state])+' icon-white"></i>\n	</span>\n	<span class="title"><a href="#" class="viewlog" data-jobid="'+_.escape(job.job_id)+'">'+_.escape(job.title)+'</a></span>\n	<span class="area-controls">\n		',isRoot&&!isFinished&&(__p+='<a href="#" class="abort btn"><i class="icon-off"></i>Abort</a>'),__p+='\n	</span>\n</div>\n<div class="particulars particulars-'+_.escape(job.job_id)+' clearfix">\n	<div class="summary summary-'+_.escape(job.state)+'">',job.summary&&(__p+=""+_.escape(job.summary)+""),__p+='</div>\n	<div class="log">\n		<pre data-jobid="'+_.escape(job.job_id)+'">Loading...</pre>\n	</div>\n</div>\n<div class="children children-'+_.escape(job.job_id)+' clearfix">\n</div>';return __p}}),define("views/widget/logviewer",["jquery","underscore","backbone","context","bases"],function(e,t,n,r,i){var s=[["DEBUG","label",new RegExp("\\d\\sDEBUG\\s","g")],["INFO","label label-info",new RegExp("\\d\\sINFO\\s","g")],["WARNING","label label-warning",new RegExp("\\d\\sWARNING\\s","g")],["ERROR","label label-important",new RegExp("\\d\\sERROR\\s","g")],["CRITICAL","label label-important",new RegExp("\\d\\sCRITICAL\\s","g")]],o=i.BaseView.extend({initialize:function(){this.linesBinder=t.bind(this.onLines,this),this.zeroBinder=t.bind(this.onZeroSize,this),this.cantFindBinder=t.bind(this.onCantFind,this),this.jobId=this.$el.data("jobid"),r.streamSocket.on("log.lines",this.linesBinder),r.streamSocket.on("log.zerosize",this.zeroBinder),r.streamSocket.on("log.cantfind",this.cantFindBinder),this.isReading=!1},isScrolledToBottom:function(){var e=this.$el.scrollHeight,t=this.$el.scrollTop+this.$el.innerHeight();return e==t},onLines:function(e,t,n){if(this.jobId!=e)return;this.$el.hasClass("data")||this.$el.empty();if(this.isScrolledToBottom())var r=!0;this.$el.data("position",n),this.$el.addClass("data"),this.$el.append(this.formatLogLines(t)),r&&(this.$el.scrollTop=this.$el.scrollHeight)},onZeroSize:function(e){if(this.jobId!=e)return;this.$el.text("This log is currently empty."),this.$el.removeClass("data")},onCantFind:function(e,t){if(this.jobId!=e)return;this.$el.text(t),this.$el.removeClass("data")},start:function(){if(!this.isReading){var e=this.$el.data("position");e||(e=0),r.streamSocket.emit("log.subscribe",this.jobId,e),this.isReading=!0}},pause:function(){this.isReading&&(r.streamSocket.emit("log.unsubscribe",this.jobId),this.isReading=!1)},destroy:function(){this.isReading&&r.streamSocket.emit("log.unsubscribe",this.jobId),r.streamSocket.removeListener("log.lines",this.linesBinder),r.streamSocket.removeListener("log.zerosize",this.zeroBinder),r.streamSocket.removeListener("log.cantfind",this.cantFindBinder)},formatLogLines:function(e){var n=e.join("");n=t.escape(n);for(var r=0;r<s.length;r++)n=n.replace(s[r][2],' <span class="'+s[r][1]+'">'+s[r][0]+"</span> ");return n}});return o}),define("views/widget/jobblock",["jquery","underscore","backbone","context","bases","tpl!templates/widget/jobblock.html","views/widget/logviewer"],function(e,t,n,r,i,s,o){var u={FAILED:"important",ABORTED:"warning",SUCCESS:"success",WAITING:"info",RUNNING:"primary"},a={FAILED:"icon-remove",ABORTED:"icon-ban-circle",SUCCESS:"icon-ok",WAITING:"icon-time",RUNNING:"icon-loading",NEW:"icon-certificate"},f=["SUCCESS","FAILED","ABORTED"],l=i.BaseView.extend({initialize:function(){this.myJobs={},this.myJobs[this.options.job_id]=!0,this.logViewers={},this.temporarilyOrphanedChildren=[],this.gotJobTreeBinder=t.bind(this.gotJobTree,this),r.streamSocket.on("job.tree",this.gotJobTreeBinder),this.gotJobStatusBinder=t.bind(this.gotJobStatus,this),r.streamSocket.on("job.status",this.gotJobStatusBinder),this.gotNewJobBinder=t.bind(this.gotNewJob,this),r.streamSocket.on("job.new",this.gotNewJobBinder),r.streamSocket.emit("job.subscribe",this.options.job_id)},events:{"click a.viewlog":"viewLog","click a.abort":"abortJob"},render:function(){this.$el.html(i.errorLoadingHtml),this.$el.append(this.renderRecurse(this.jobTree,!0))},renderRecurse:function(n,r){var i=t.indexOf(f,n.state)!=-1,o=e(s({job:n,statusClassMap:u,statusIconMap:a,finishedStates:f,isFinished:i,isRoot:r}));this.myJobs[n.job_id]=!0;if(n.children){var l=e(o[4]);n.children.sort(function(e,t){return e.time-t.time});for(var c=0;c<n.children.length;c++){var h=e('<div class="job clearfix"></div>'),p=this.renderRecurse(n.children[c]);h.html(p),l.append(h)}}return o},gotJobTree:function(e,t){if(!this.myJobs[e])return;this.jobTree=t,this.render()},gotNewJob:function(e){this.myJobs[e.root_id]&&this.addNewChild(e)},addNewChild:function(t){var n=e(".children-"+t.parent_id,this.$el);if(n.length==0)this.temporarilyOrphanedChildren.push(t);else if(this.$(".title-"+t.job_id).length==0){var r=e('<div class="job clearfix"></div>');r.html(this.renderRecurse(t)),n.append(r)}},gotJobStatus:function(n,r){!this.myJobs[n]&&this.myJobs[r.root_id]&&this.addNewChild(r);if(!this.myJobs[n])return;if(this.temporarilyOrphanedChildren.length>0){var i=this.temporarilyOrphanedChildren;this.temporarilyOrphanedChildren=[];for(var s=0;s<i.length;s++)this.addNewChild(i[s])}var o=e(".title-"+n,this.$el);if(o.length){var l=e("span.icon",o),c=e(".label i",o);l.attr("class","icon label label-"+u[r.state]),c.attr("class","icon-white "+a[r.state])}var h=t.indexOf(f,r.state)!=-1;n==this.options.job_id&&h&&(e(".abort",this.$el).remove(),this.options.finishedCallback&&this.options.finishedCallback(this.options.job_id,r.state));if(h&&r.state!="SUCCESS"){var p=e(".particulars-"+n+" .summary",this.$el);p.text(r.summary),p.attr("class","summary summary-"+r.state)}},viewLog:function(t){t.preventDefault();var n=e(t.currentTarget),r=n.data("jobid"),i=this.$(".particulars-"+r+" .log");i.is(":visible")?(i.slideUp(),this.logViewers[r]&&this.logViewers[r].pause()):(i.slideDown(),this.logViewers[r]||(this.logViewers[r]=new o({el:e("pre",i)})),this.logViewers[r].start())},abortJob:function(n){n.preventDefault(),this.startLoadingInline();var r=this;e.ajax({url:"/job/abort/"+this.options.job_id+"?format=json",dataType:"json",success:function(e){r.doneLoading()},error:t.bind(this.loadingError,this)})},destroy:function(){r.streamSocket.removeListener("job.tree",this.gotJobTreeBinder),r.streamSocket.removeListener("job.status",this.gotJobStatusBinder),r.streamSocket.removeListener("job.new",this.gotNewJobBinder),t.each(this.myJobs,function(e,t,n){r.streamSocket.emit("job.unsubscribe",t)}),t.each(this.logViewers,function(e,t,n){e.destroy()})}});return l}),define("views/widget/genericjobslist",["jquery","underscore","backbone","context","bases","tpl!templates/widget/joblist.html","views/widget/jobblock"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){this.$el.html(i.errorLoadingHtml+"<h1>Loading...</h1>"),this.startLoadingFull(),this.myJobs={},this.views=[],e.ajax({url:this.options.url,dataType:"json",success:t.bind(this.gotJobList,this),error:t.bind(this.loadingError,this)})},gotJobList:function(e){this.doneLoading(),this.jobs=e.data.jobs,this.job_detail=e.data.job_detail,this.render()},render:function(){this.$el.html(s({jobs:this.jobs,job_detail:this.job_detail,title:this.options.title,context:r,_:t}));var n=this;this.$(".job").each(function(t,r){var i=e(r),s=i.data("jobid"),u=new o({job_id:s,el:i});n.views.push(u)}),this.jobs.length==0&&this.$el.append('<p class="lead">No jobs found.</p>')},loadingError:function(e,t,n){this.$("h1").remove(),i.BaseView.prototype.loadingError.apply(this,[e,t,n])},destroy:function(){for(var e=0;e<this.views.length;e++)this.views[e].destroy()}});return u}),define("tpl!templates/administration/router-dump.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+="<h1>Router Table dump</h1>\n\n<p>Serial number "+_.escape(table.serial)+'.</p>\n\n<div class="router-dump">\n	';for(var i=0;i<table.table.length;i++){__p+="\n		";var entry=table.table[i];__p+='\n		<div class="tile">\n			<div class="title">\n				<a target="_blank" href="http://'+_.escape(entry.hostname)+""+_.escape(table.frontend_domain_postfix)+'">\n					'+_.escape(entry.hostname)+'\n				</a>\n			</div>\n			<div class="body">\n				<a href="#" class="instances">'+_.escape(entry.instances.length)+" instance",entry.instances.length!=1&&(__p+="s"),__p+='</a>,\n				<a href="#" class="nodes">'+_.escape(entry.nodes.length)+" node",entry.nodes.length!=1&&(__p+="s"),__p+='</a>,\n				<a href="#" class="routes">'+_.escape(entry.routes.length)+" route",entry.routes.length!=1&&(__p+="s"),__p+='</a>\n\n				<div class="instances" style="display: none;">\n					<strong>Instances:</strong><br />\n					';for(var j=0;j<entry.instances.length;j++)__p+='\n						<code class="uuid-shrink" title="'+_.escape(entry.instances[j].instance_id)+'">'+_.escape(entry.instances[j].instance_id)+"</code>, "+_.escape(entry.instances[j].state)+"",j<entry.instances.length-1&&(__p+="<br />"),__p+="\n					";__p+="\n					",entry.instances.length==0&&(__p+="No instances"),__p+='\n				</div>\n				<div class="nodes" style="display: none;">\n					<strong>Nodes:</strong><br />\n					';for(var j=0;j<entry.nodes.length;j++)__p+='\n						<code class="uuid-shrink" title="'+_.escape(entry.nodes[j].uuid)+'">'+_.escape(entry.nodes[j].uuid)+"</code>, "+_.escape(entry.nodes[j].state)+"",j<entry.nodes.length-1&&(__p+="<br />"),__p+="\n					";__p+="\n					",entry.nodes.length==0&&(__p+="No nodes"),__p+='\n				</div>\n				<div class="routes" style="display: none;">\n					<strong>Routes:</strong><br />\n					';for(var j=0;j<entry.routes.length;j++)__p+="\n						"+_.escape(entry.routes[j])+"",j<entry.routes.length-1&&(__p+="<br />"),__p+="\n					";__p+="\n					",entry.routes.length==0&&(__p+="No routes"),__p+="\n				</div>\n			</div>\n		</div>\n	"}__p+="\n</div>"}return __p}}),define("views/administration/router-dump",["jquery","underscore","backbone","context","bases","util","tpl!templates/administration/router-dump.html"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){this.$el.html(i.errorLoadingHtml+"<h1>Loading...</h1>"),this.startLoadingFull()},dataReady:function(e){this.doneLoading(),this.routerTable=e.data,this.render()},render:function(){this.$el.html(o({context:r,table:this.routerTable})),s.shrinkUuids(this.$el)},events:{"click a.instances":"expandInstances","click a.nodes":"expandNodes","click a.routes":"expandRoutes"},expandInstances:function(t){t.preventDefault();var n=e(t.currentTarget),r=e("div.instances",n.parent());r.slideToggle()},expandNodes:function(t){t.preventDefault();var n=e(t.currentTarget),r=e("div.nodes",n.parent());r.slideToggle()},expandRoutes:function(t){t.preventDefault();var n=e(t.currentTarget),r=e("div.routes",n.parent());r.slideToggle()}});return u}),define("tpl!templates/administration/configuration-dump.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+="<h1>Configuration dump</h1>\n\n<pre>\n"+_.escape(JSON.stringify(configuration.configuration,null,4))+"\n</pre>";return __p}}),define("views/administration/configuration-dump",["jquery","underscore","backbone","context","bases","util","tpl!templates/administration/configuration-dump.html"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){this.$el.html(i.errorLoadingHtml+"<h1>Loading...</h1>"),this.startLoadingFull()},dataReady:function(e){this.doneLoading(),this.configuration=e.data,this.render()},render:function(){this.$el.html(o({context:r,configuration:this.configuration}))}});return u}),define("tpl!templates/administration/plugin-dump.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+='<h1>Plugins</h1>\n\n<table class="table table-striped table-bordered">\n	<thead>\n		<tr>\n			<th>Plugin</th>\n			<th>Symbolic Name</th>\n			<th>Configuration</th>\n			<th>Available Modes</th>\n		</tr>\n	</thead>\n	<tbody>\n	',_.each(plugins.plugins,function(e,t,n){__p+="\n		<tr>\n			<td><strong>"+_.escape(e.title)+"</strong></td>\n			<td>"+_.escape(e.name)+"</td>\n			<td>\n				",e.options&&(__p+="\n					<pre>"+_.escape(JSON.stringify(e.options,null,2))+"</pre>\n				"),__p+="\n			</td>\n			<td><ul>\n				",_.each(e.modes,function(e,t,n){__p+="\n					<li>"+_.escape(e)+"</li>\n				"}),__p+="\n			</ul></td>\n		</tr>\n	"}),__p+="\n	</tbody>\n</table>";return __p}}),define("views/administration/plugin-dump",["jquery","underscore","backbone","context","bases","util","tpl!templates/administration/plugin-dump.html"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){this.$el.html(i.errorLoadingHtml+"<h1>Loading...</h1>"),this.startLoadingFull()},dataReady:function(e){this.doneLoading(),this.plugins=e.data,this.render()},render:function(){this.$el.html(o({context:r,plugins:this.plugins,_:t}))},events:{"click a.configuration":"expandConfiguration"},expandConfiguration:function(t){t.preventDefault();var n=e(t.currentTarget),r=e("pre.configuration",n.parent());r.slideToggle()}});return u}),define("tpl!templates/workspace/list.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+='\n<h1>Workspaces</h1>\n\n<div class="workspace-list clearfix">\n	';for(var i=0;i<workspaces.length;i++){__p+="\n		";var workspace=workspaces[i];__p+='\n		<div class="workspace tile">\n			<div class="title">\n				<a href="/workspace/'+_.escape(workspace.attributes.id)+'/applications" class="virtual">'+_.escape(workspace.attributes.name)+"</a>\n			</div>\n		</div>\n	"}__p+="\n</div>"}return __p}}),define("views/workspace/list",["jquery","underscore","backbone","context","bases","tpl!templates/workspace/list.html"],function(e,t,n,r,i,s){var o=i.BaseView.extend({initialize:function(){this.collection.on("request",this.startLoadingFull,this),this.collection.on("sync",this.render,this),this.$el.html(s({workspaces:[],context:r}))},destroy:function(){this.collection.off("request",this.startLoadingFull,this),this.collection.off("sync",this.render,this),this.undelegateEvents()},render:function(){return this.doneLoading(),this.$el.html(s({workspaces:this.collection.models,context:r})),this},events:{"click a.virtual":"navigateAway"}});return o}),define("tpl!templates/application/list.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+="\n<h1>Workspace: "+_.escape(workspace.attributes.name)+'</h1>\n\n<div class="btn-toolbar">\n	',context.hasPermission("WORKSPACE_EDIT",workspace.id)&&(__p+='\n		<div class="btn-group btn-group-header">\n			<a class="btn virtual" href="/workspace/'+_.escape(workspace.id)+'"><i class="icon-edit"></i> Edit Workspace</a>\n		</div>\n	'),__p+="\n	",context.hasPermission("WORKSPACE_DELETE",workspace.id)&&workspace.attributes.can_delete&&(__p+='\n		<div class="btn-group btn-group-header">\n			<a class="btn btn-danger delete" href="/workspace/'+_.escape(workspace.id)+'/delete"><i class="icon-trash icon-white"></i> Delete Workspace</a>\n		</div>\n	'),__p+="\n	",context.hasPermission("APPLICATION_CREATE",workspace.id)&&(__p+='\n		<div class="btn-group btn-group-header">\n			<a class="btn virtual" href="/workspace/'+_.escape(workspace.id)+'/applications/new"><i class="icon-plus"></i> Create Application</a>\n		</div>\n	'),__p+='\n	<div class="btn-group btn-group-header">\n		<a class="btn virtual" href="/job/list/workspace/'+_.escape(workspace.id)+'">All Jobs</a>\n		<a class="btn virtual" href="/job/list/workspace/'+_.escape(workspace.id)+'?sub=cron">Cron Jobs</a>\n	</div>\n</div>\n\n<div class="deleteConfirm well well-small" style="display: none;">\n	<p>Are you sure you want to delete this workspace? This can not be undone.</p>\n	<button class="realDelete btn btn-danger">Delete</button> <button class="noDelete btn">Cancel</button>\n</div>\n\n<h2>Statistics</h2>\n\n<div class="graph-list clearfix">\n	<div class="tile graph-requests">\n		<span class="graph-title">Requests by type</span>\n		<div class="graph-tile-inner">\n			Loading...\n		</div>\n	</div>\n	<div class="tile graph-bytes">\n		<span class="graph-title">Bytes Transferred</span>\n		<div class="graph-tile-inner">\n			Loading...\n		</div>\n	</div>\n</div>\n\n<h2>Applications</h2>\n\n<div class="application-list clearfix">\n	';for(var i=0;i<applications.length;i++){__p+="\n		";var application=applications[i];__p+='\n		<div class="application tile">\n			<div class="title title-status">\n				<span class="state">\n					<span class="badge '+_.escape(healthClasses[application.attributes.health].badge)+'" title="Health: '+_.escape(application.attributes.health)+'">\n						<i class="'+_.escape(healthClasses[application.attributes.health].icon)+' icon-white"></i>\n					</span>\n				</span>\n				<a class="virtual" href="/application/'+_.escape(application.attributes.id)+'">'+_.escape(application.attributes.name)+"</a>\n			</div>\n		</div>\n	"}__p+="\n</div>\n\n",applications.length==0&&(__p+='\n	<p>There are no applications in this workspace. <a href="/workspace/'+_.escape(workspace.id)+'/applications/new" class="virtual">Create one.</a></p>\n'),__p+=""}return __p}}),define("views/widget/routergraph",["jquery","underscore","backbone","context","bases"],function(e,t,n,r,i){var s=function(e){var t=[],n=1,r=0,i=[1,2.5,10,25,100,250],s=1,o=["","kb","Mb","Gb","Tb"];while(e.max>Math.pow(1024,n)*i[r]*s)s++,s>3&&(s=1,r++),r>=i.length&&(s=1,r=0,n++);for(var u=0,a=0;a<e.max;u++)a=u*Math.pow(1024,n)*i[r],t.push([a,a/Math.pow(1024,n)+o[n]]);return t},o={requests:{socket_request:["requests"],flot_options:{series:{color:"#edc240",shadowSize:1,bars:{show:!0,fill:!0,barWidth:1e3}},yaxis:{min:0},xaxis:{mode:"time",minTickSize:[30,"second"]}}},bytes:{socket_request:["bytes"],flot_options:{series:{color:"#cb4b4b",shadowSize:1,bars:{show:!0,fill:!0,barWidth:1e3}},yaxis:{min:0,ticks:s},xaxis:{mode:"time",minTickSize:[15,"second"]}}},time:{socket_request:["time"],flot_options:{series:{color:"#afd8f8",shadowSize:1,lines:{show:!0}},yaxis:{min:0},xaxis:{mode:"time",minTickSize:[15,"second"]}}},requests_by_code:{socket_request:["1xx","2xx","3xx","4xx","5xx"],legend:{"1xx":"1xx Informational","2xx":"2xx Successful","3xx":"3xx Redirection","4xx":"4xx Client Error","5xx":"5xx Server Error"},colours:{"1xx":"#3333e0","2xx":"#66e000","3xx":"#dada00","4xx":"#ff9966","5xx":"#a90000"},flot_options:{yaxis:{min:0},xaxis:{mode:"time",minTickSize:[15,"second"]},legend:{position:"sw",sorted:!0}}}},u=i.BaseView.extend({initialize:function(){this.timeout=null,this.graphOptions=o[this.options.graphType],this.statCategory=this.options.category,this.statInputId=this.options.input_id,this.updateBinder=t.bind(this.onData,this),this.errorBinder=t.bind(this.onError,this),r.streamSocket.on("router.history.update",this.updateBinder),r.streamSocket.on("router.history.error",this.errorBinder),this.plot=e.plot(this.$el,[],this.graphOptions.flot_options),this.plot.setupGrid(),this.awaitingUpdate=!1,this.requestUpdate()},destroy:function(){r.streamSocket.removeListener("router.history.update",this.updateBinder),r.streamSocket.removeListener("router.history.error",this.errorBinder),this.timeout&&clearTimeout(this.timeout)},requestUpdate:function(){if(!this.awaitingUpdate){var e=new Date;r.streamSocket.emit("router.history.update",this.statCategory,this.statInputId,this.graphOptions.socket_request,e.getTime()/1e3-60),this.awaitingUpdate=!0}},onData:function(n,r,i,s,u){if(n==this.statCategory&&r==this.statInputId){this.awaitingUpdate=!1;var a={};e(".graph-error",this.$el.parent()).remove();for(var f in u){if(o[this.options.graphType].socket_request.indexOf(f)===-1)return!1;for(var f in u)a[f]=this.processTimeSeries(i,s,u[f])}this.showGraph(a),this.timeout=setTimeout(t.bind(this.requestUpdate,this),1e3)}},onError:function(n,r,i){if(r==this.statCategory&&i==this.statInputId){this.awaitingUpdate=!1;var s=e(".graph-error",this.$el.parent());s.length==0&&(s=e('<div class="graph-error"></div>'),container.parent().append(s)),s.text("Graph error: "+n),this.timeout=setTimeout(t.bind(this.requestUpdate,this),5e3)}},processTimeSeries:function(e,t,n){var r=Math.floor(e),i=0,s=[];while(r<Math.floor(t)+1){var o=n[i]||[null,0];!o[0]||o[0]>r?s.push([r*1e3,0]):(s.push([o[0]*1e3,o[1]]),i++),r++}return n[i]&&s.push([n[i][0]*1e3,n[i][1]]),s},formatDatasetForFlot:function(e){var t=[];for(var n in e){var r={};r.data=e[n],this.graphOptions.legend&&(r.label=this.graphOptions.legend[n]),this.graphOptions.colours&&(r.color=this.graphOptions.colours[n]),t.push(r)}return t},showGraph:function(e){this.plot.setData(this.formatDatasetForFlot(e)),this.plot.setupGrid(),this.plot.draw()}});return u}),define("views/application/list",["jquery","underscore","backbone","context","bases","tpl!templates/application/list.html","views/widget/routergraph"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){this.collection.on("request",this.startLoadingFull,this),this.collection.on("sync",this.render,this),this.$el.html(s({workspace:this.options.workspace,applications:[],context:r,healthClasses:this.collection.healthClasses})),this.views=[]},destroy:function(){t.each(this.views,function(e,t,n){e.destroy()}),this.collection.off("request",this.startLoadingFull,this),this.collection.off("sync",this.render,this),this.undelegateEvents()},render:function(){return this.doneLoading(),this.$el.html(s({workspace:this.options.workspace,applications:this.collection.models,context:r,healthClasses:this.collection.healthClasses})),this.views.push(new o({graphType:"requests_by_code",category:"workspace",input_id:this.options.workspace.id,el:this.$(".graph-requests .graph-tile-inner")})),this.views.push(new o({graphType:"bytes",category:"workspace",input_id:this.options.workspace.id,el:this.$(".graph-bytes .graph-tile-inner")})),this},events:{"click a.virtual":"navigateAway","click a.delete":"deleteConfirm","click button.realDelete":"realDelete","click button.noDelete":"deleteCancel"},deleteConfirm:function(e){e.preventDefault(),this.$(".deleteConfirm").slideDown()},deleteCancel:function(e){e.preventDefault(),this.$(".deleteConfirm").slideUp()},realDelete:function(n){n.preventDefault();var i=this;this.startLoadingFull();var s="/workspace/"+this.options.workspace.id+"/delete?format=json";e.ajax({url:s,type:"POST",dataType:"json",success:function(e){i.doneLoading(),r.navigate("/workspace/list")},error:t.bind(this.loadingError,this)})}});return u}),define("tpl!templates/widget/routerstats.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+="";if(error)__p+='\n<div class="alert alert-error">'+_.escape(error)+"</div>\n";else{__p+="\n	";for(var i=0;i<data.primary.length;i++){__p+="\n		";var stat=data.primary[i];__p+='\n		<div class="stats-row clearfix">\n			<span class="title">'+_.escape(stat.title)+':</span>\n			<span class="value">'+_.escape(stat.value)+"\n				",stat.unit&&(__p+='<span class="unit">'+_.escape(stat.unit)+"</span>"),__p+="\n				",stat.diff&&(__p+=' | <span class="diff">'+_.escape(stat.diff)+"/s</span>"),__p+="\n			</span>\n		</div>\n	"}__p+="\n"}__p+=""}return __p}}),define("views/widget/routerstats",["jquery","underscore","backbone","context","bases","util","tpl!templates/widget/routerstats.html"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){this.statCategory=this.options.category,this.statInputId=this.options.input_id,this.updateBinder=t.bind(this.onData,this),this.errorBinder=t.bind(this.onError,this),r.streamSocket.on("router.stats.update",this.updateBinder),r.streamSocket.on("router.stats.error",this.errorBinder),this.errorMessage=null,this.data=null,this.awaitingUpdate=!1,this.requestUpdate()},destroy:function(){r.streamSocket.removeListener("router.stats.update",this.updateBinder),r.streamSocket.removeListener("router.stats.error",this.errorBinder),this.timeout&&clearTimeout(this.timeout)},requestUpdate:function(){this.awaitingUpdate||(r.streamSocket.emit("router.stats.update",this.options.category,this.options.input_id),this.awaitingUpdate=!0)},onData:function(e,n,r){if(e==this.options.category&&n==this.options.input_id){this.awaitingUpdate=!1;var i=[{title:"Requests",value:s.number_format(r.requests),diff:this.calculateDifference("requests",r)},{title:"Bytes",value:s.number_format(r.bytes),diff:this.calculateDifference("bytes",r)},{title:"Average Time",value:s.number_format(r.time_average),unit:"ms",diff:""}],o=[{title:"1xx Requests",value:r["1xx"],diff:""},{title:"2xx Requests",value:r["2xx"],diff:""},{title:"3xx Requests",value:r["3xx"],diff:""},{title:"4xx Requests",value:r["4xx"],diff:""},{title:"5xx Requests",value:r["5xx"],diff:""},{title:"NGINX time Average",value:s.number_format(r.nginxtime_average),diff:""}];this.data={primary:i,secondary:o},this.lastNumbers=r,this.render(),this.timeout=setTimeout(t.bind(this.requestUpdate,this),1e3)}},onError:function(e,n,r){n==this.options.category&&r==this.options.input_id&&(this.awaitingUpdate=!1,this.errorMessage=e,this.data=null,this.render(),this.timeout=setTimeout(t.bind(this.requestUpdate,this),5e3))},render:function(){this.$el.html(o({data:this.data,error:this.errorMessage}))},calculateDifference:function(e,t){if(this.lastNumbers){var n=t[e]-this.lastNumbers[e],r=t.as_at-this.lastNumbers.as_at;return" "+s.number_format(n/r)}return""}});return u}),define("tpl!templates/application/detail.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+="\n<h1>Application "+_.escape(application.attributes.name)+'</h1>\n\n<div class="row-fluid">\n	<div class="span8">\n		<div class="btn-toolbar">\n			',context.hasPermission("APPLICATION_CREATE",application.workspace_id)&&(__p+='\n				<div class="btn-group btn-group-header">\n					<a class="btn virtual" href="/application/'+_.escape(application.id)+'/newversion"><i class="icon-plus"></i> Create new version</a>\n				</div>\n			'),__p+='\n			<div class="btn-group btn-group-header">\n				<a class="btn virtual" href="/job/list/application/'+_.escape(application.id)+'">All Jobs</a>\n				',context.hasPermission("SERVICE_VIEW",application.workspace_id)&&(__p+='\n					<a class="btn virtual" href="/application/'+_.escape(application.id)+'/services">Services</a>\n				'),__p+='\n				<a class="btn virtual" href="/job/list/application/'+_.escape(application.id)+'?sub=cron">Crons</a>\n			</div>\n			',context.hasPermission("APPLICATION_DELETE")&&application.attributes.can_delete&&(__p+='\n				<div class="btn-group btn-group-header">\n					<a class="btn btn-danger deleteApplication"><i class="icon-trash icon-white"></i> Delete Application</a>\n				</div>\n			'),__p+='\n		</div>\n\n		<p class="lead">Health: '+_.escape(application.attributes.health)+'</p>\n	</div>\n	<div class="span4">\n		<div class="well well-small router-stats">Loading router stats...</div>\n	</div>\n</div>\n\n<div class="deleteConfirm well well-small" style="display: none;">\n	<p>Are you sure you want to delete this application? All services and their data will be deleted. This can not be undone.</p>\n	<button class="realDelete btn btn-danger">Delete</button> <button class="noDelete btn">Cancel</button>\n</div>\n\n<div class="version-list clearfix">\n	';for(var i=0;i<application.attributes.versions.length;i++){__p+="\n		";var version=new VersionModel(application.attributes.versions[i]);__p+="\n		",version.attributes.workspace={id:application.attributes.workspace_id},__p+='\n		<div class="version tile">\n			<div class="title title-status">\n				',version.attributes.is_current&&(__p+="<strong>"),__p+='\n				<a href="/version/'+_.escape(version.id)+'" class="virtual">Version '+_.escape(version.attributes.version)+" ",version.attributes.state=="RUNNING"&&(__p+='<i class="icon-play"></i>'),__p+="",version.attributes.is_current&&(__p+='<i class="icon-star"></i>'),__p+="</a>\n				",version.attributes.is_current&&(__p+="</strong>"),__p+='\n			</div>\n			<div class="body">\n				<strong>State:</strong>\n\n					'+_.escape(version.attributes.state)+",\n					",version.attributes.is_current?__p+="\n						Current Version\n					":__p+="\n						Not current\n					",__p+="\n				<br />\n				<strong>Health:</strong> "+_.escape(version.attributes.health.overall)+"\n				<br />\n				";var actions=[];__p+="\n				",version.canRegister(context)&&(__p+="\n					",actions.push('<a class="btn btn-success btn-mini register" data-version="'+_.escape(version.id)+'">Register</a>'),__p+="\n				"),__p+="\n				",version.canStart(context)&&(__p+="\n					",actions.push('<a class="btn btn-success btn-mini start" data-version="'+_.escape(version.id)+'">Start</a>'),__p+="\n				"),__p+="\n				",version.canStop(context)&&(__p+="\n					",actions.push('<a class="btn btn-danger btn-mini stop" data-version="'+_.escape(version.id)+'">Stop</a>'),__p+="\n				"),__p+="\n				",version.canDeregister(context)&&(__p+="\n					",actions.push('<a class="btn btn-warning btn-mini deregister" data-version="'+_.escape(version.id)+'">Deregister</a>'),__p+="\n				"),__p+="\n				",version.canMakeCurrent(context)&&(__p+="\n					",actions.push('<a class="btn btn-info btn-mini makecurrent" data-version="'+_.escape(version.id)+'">Make Current</a>'),__p+="\n				"),__p+="\n				",version.canDelete(context)&&(__p+="\n					",actions.push('<a class="btn btn-danger btn-mini deleteVersion" data-version="'+_.escape(version.id)+'">Delete</a>'),__p+="\n				"),__p+='\n\n				<div class="btn-group">\n					'+actions.join(" &middot; ")+"\n				</div>\n			</div>\n		</div>\n	"}__p+="\n</div>"}return __p}}),define("views/application/detail",["jquery","underscore","backbone","context","bases","views/widget/routerstats","tpl!templates/application/detail.html","models/version"],function(e,t,n,r,i,s,o,u){var a=i.BaseView.extend({initialize:function(){this.model.on("request",this.startLoadingInline,this),this.model.on("change",this.render,this),this.model.versions.on("request",this.startLoadingInline,this),this.model.versions.on("change",this.render,this),this.model.versions.on("sync",this.render,this),this.$el.html(o({application:this.model,context:r,VersionModel:u})),this.routerStats=null},destroy:function(){this.model.off("request",this.startLoadingFull,this),this.model.off("change",this.render,this),this.model.versions.off("request",this.startLoadingInline,this),this.model.versions.off("change",this.render,this),this.model.versions.off("sync",this.render,this),this.routerStats&&this.routerStats.destroy(),this.undelegateEvents()},render:function(){return this.doneLoading(),this.$el.html(o({application:this.model,context:r,VersionModel:u})),this.routerStats&&this.routerStats.destroy(),this.routerStats=new s({el:this.$(".router-stats"),category:"application",input_id:this.model.id}),this},events:{"click a.virtual":"navigateAway","click a.deleteApplication":"deleteConfirm","click button.realDelete":"realDelete","click button.noDelete":"deleteCancel","click a.start":"startVersion","click a.register":"registerVersion","click a.stop":"stopVersion","click a.deregister":"deregisterVersion","click a.makecurrent":"makeCurrentVersion","click a.deleteVersion":"deleteVersion"},deleteConfirm:function(e){e.preventDefault(),this.$(".deleteConfirm").slideDown()},deleteCancel:function(e){e.preventDefault(),this.$(".deleteConfirm").slideUp()},realDelete:function(n){n.preventDefault();var i=this;this.startLoadingFull();var s="/application/"+this.model.id+"/delete?format=json";e.ajax({url:s,type:"POST",dataType:"json",success:function(e){i.doneLoading(),r.navigate("/application/"+i.model.id+"/delete/"+e.data.job_id)},error:t.bind(this.loadingError,this)})},makeJobRequest:function(n,i){var s=this;this.startLoadingFull();var o="/version/"+i+"/"+n+"?format=json";e.ajax({url:o,type:"POST",dataType:"json",success:function(e){s.doneLoading(),r.navigate("/version/"+i+"/"+n+"/"+e.data.job_id)},error:t.bind(this.loadingError,this)})},startVersion:function(t){t.preventDefault(),this.makeJobRequest("start",e(t.currentTarget).data("version"))},registerVersion:function(t){t.preventDefault(),this.makeJobRequest("register",e(t.currentTarget).data("version"))},stopVersion:function(t){t.preventDefault(),this.makeJobRequest("stop",e(t.currentTarget).data("version"))},deregisterVersion:function(t){t.preventDefault(),this.makeJobRequest("deregister",e(t.currentTarget).data("version"))},makeCurrentVersion:function(t){t.preventDefault(),this.makeJobRequest("setcurrent",e(t.currentTarget).data("version"))},deleteVersion:function(n){n.preventDefault(),this.startLoadingFull();var i=this;e.ajax({url:"/version/"+e(n.currentTarget).data("version")+"/delete?format=json",type:"POST",dataType:"json",success:function(e){i.doneLoading();var t=r.workspaces.get(i.model.attributes.workspace.id);t.fetch();var n=t.applications.get(i.model.attributes.application_id);n.fetch(),n.versions.fetch(),r.navigate("/application/"+i.model.attributes.application_id)},error:t.bind(this.loadingError,this)})}});return a}),define("tpl!templates/version/detail.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+="\n<h1>Version "+_.escape(version.attributes.version)+" of "+_.escape(version.attributes.application.name)+'</h1>\n\n<div class="row-fluid">\n	<div class="span8">\n		<div class="btn-toolbar">\n			<div class="btn-group btn-group-header">\n				<a class="btn virtual" href="/job/list/version/'+_.escape(version.id)+'">All Jobs</a>\n				<a class="btn virtual" href="/job/list/version/'+_.escape(version.id)+'?sub=cron">Crons</a>\n			</div>\n			',context.hasPermission("APPLICATION_VIEW_MANIFEST",version.attributes.workspace.id)&&(__p+='\n				<div class="btn-group btn-group-header">\n					<a class="btn virtual" href="/version/'+_.escape(version.id)+'/manifest">View Manifest</a>\n				</div>\n			'),__p+='\n			<div class="btn-group btn-group-header">\n				',version.canRegister(context)&&(__p+='\n					<a class="btn btn-success register">Register</a>\n				'),__p+="\n				",version.canStart(context)&&(__p+='\n					<a class="btn btn-success start">Start</a>\n				'),__p+="\n				",version.canStop(context)&&(__p+='\n					<a class="btn btn-danger stop">Stop</a>\n				'),__p+="\n				",version.canDeregister(context)&&(__p+='\n					<a class="btn btn-warning deregister">Deregister</a>\n				'),__p+="\n				",version.canMakeCurrent(context)&&(__p+='\n					<a class="btn btn-info makecurrent">Make Current</a>\n				'),__p+="\n				",version.canDelete(context)&&(__p+='\n					<a class="btn btn-danger delete">Delete</a>\n				'),__p+="\n			</div>\n		</div>\n\n		<ul>\n			<li>\n				",version.attributes.is_current?__p+='\n					<i class="icon-star"></i> Current\n				':__p+='\n					<i class="icon-minus"></i> Not current\n				',__p+="\n			</li>\n			<li><b>State:</b> "+_.escape(version.attributes.state)+"</li>\n			<li>\n				<b>Health:</b> "+_.escape(version.attributes.health.overall)+"\n				",version.attributes.health.overall!="OK"&&(__p+="\n					<ul>\n						",_.each(version.attributes.health.types,function(e,t,n){__p+="\n							<li><strong>"+_.escape(t)+"</strong>: "+_.escape(e.message)+"</li>\n						"}),__p+="\n					</ul>\n				"),__p+="\n			</li>\n			<li><b>SCM:</b> "+_.escape(version.attributes.scm_name)+"</li>\n			",version.attributes.scm_parameters.formatted_location?__p+="\n				<li><b>Original source location:</b> "+_.escape(version.attributes.scm_parameters.formatted_location)+"</li>\n			":(__p+="\n				",version.attributes.scm_parameters.location&&(__p+="\n					<li><b>Original source location:</b> "+_.escape(version.attributes.scm_parameters.location)+"</li>\n				"),__p+="\n			"),__p+="\n			",version.attributes.source_package_type&&version.attributes.source_package_type=="devdirectory"&&(__p+="\n				<li><b>Package type:</b> "+_.escape(version.attributes.source_package_type)+"</li>\n			"),__p+='\n		</ul>\n\n	</div>\n	<div class="span4">\n		<div class="well well-small router-stats">Loading router stats...</div>\n	</div>\n</div>\n';return __p}}),define("tpl!templates/version/instances.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+="\n",_.each(instanceTypes,function(e,t,n){__p+="\n	<h2>Instance type: "+_.escape(t)+'</h2>\n\n	<div class="row-fluid">\n		<div class="span6">\n			<ul>\n				<li><strong>Exclusive:</strong> '+_.escape(e.instance_type.exclusive)+"</li>\n				<li><strong>Standalone:</strong> "+_.escape(e.instance_type.standalone)+"</li>\n				<li>\n					<strong>Runtime:</strong>\n					"+_.escape(e.instance_type.runtime_name)+",\n					"+_.escape(e.instance_type.runtime_version)+"\n				</li>\n				<li>\n					",context.hasPermission("APPLICATION_DEPLOY",version.attributes.workspace.id)?__p+='\n						<form method="POST" class="form-inline">\n							<input type="hidden" name="instance_type_id" value="'+_.escape(e.instance_type.id)+'" />\n							<label for="quantity"><strong>Quantity:</strong></label>\n							<input type="text" name="quantity" id="quantity" size="3" class="quantity input-small" value="'+_.escape(e.instance_type.quantity)+'" style="width: 20px;" />\n							<button class="btn changeQuantity">Change</button>\n						</form>\n					':__p+='\n						<strong>Quantity:</strong> <span class="quantity">'+_.escape(e.instance_type.quantity)+"</span></li>\n					",__p+='\n			</ul>\n		</div>\n		<div class="span6">\n			';if(!e.instance_type.standalone){__p+='\n			<ul>\n				<li>\n					<a href="http://'+_.escape(e.instance_type.version_url)+""+_.escape(frontend_domain_postfix)+'" target="_blank">\n						'+_.escape(e.instance_type.version_url)+"\n					</a>\n				</li>\n				";for(var r=0;r<e.instance_type.hostnames.length;r++){__p+="\n					";var i=e.instance_type.hostnames[r];__p+="\n					<li>\n						",is_current&&(__p+='\n							<a href="http://'+_.escape(i)+""+_.escape(frontend_domain_postfix)+'" target="_blank">\n						'),__p+="\n							"+_.escape(i)+"\n						",is_current&&(__p+="\n							</a>\n						"),__p+="\n					</li>\n				"}__p+="\n			</ul>\n			"}__p+='\n		</div>\n	</div>\n\n	<div class="instances tile-box clearfix">\n		';for(var r=0;r<e.instances.length;r++){__p+="\n			";var s=e.instances[r];__p+='\n			<div class="instance tile">\n				<div class="title">\n					<code class="uuid-shrink" title="'+_.escape(s.instance_id)+'">'+_.escape(s.instance_id.substr(0,8))+'</code>\n				</div>\n				<div class="body">\n					<strong>State:</strong> '+_.escape(s.state)+"\n					<br />\n					<strong>Node:</strong>\n					",context.hasPermission("NODE_DETAIL_VIEW")&&(__p+='\n						<a href="/node/'+_.escape(s.node_id)+'">\n					'),__p+="\n						"+_.escape(s.node_name)+"\n					",context.hasPermission("NODE_DETAIL_VIEW")&&(__p+="\n						</a>\n					"),__p+='\n					<br />\n					<strong>Log:</strong> <a class="virtual" href="/version/'+_.escape(version.id)+"/log/"+_.escape(s.instance_id)+'">View</a>\n				</div>\n			</div>\n		'}__p+="\n	</div>\n\n	",e.instances.length==0&&(__p+="\n		<p>There are no instances of this type.</p>\n	"),__p+="\n"}),__p+="";return __p}}),define("views/version/detail",["jquery","underscore","backbone","context","bases","util","views/widget/routerstats","tpl!templates/version/detail.html","tpl!templates/version/instances.html"],function(e,t,n,r,i,s,o,u,a){var f=i.BaseView.extend({initialize:function(){this.model.on("request",this.startLoadingInline,this),this.model.on("change",this.render,this),this.$el.html(i.errorLoadingHtml+'<div class="top"></div><div class="bottom"></div>'),this.$(".top").html(u({version:this.model,context:r})),this.routerStats=null,this.routerStats=new o({el:this.$(".router-stats"),category:"version",input_id:this.model.id}),this.loadInstanceData()},destroy:function(){this.routerStats&&this.routerStats.destroy(),this.model.off("request",this.startLoadingFull,this),this.model.off("change",this.render,this),this.undelegateEvents()},loadInstanceData:function(){this.startLoadingInline(),e.ajax({url:"/version/"+this.model.id+"/instances?format=json",dataType:"json",success:t.bind(this.gotInstanceData,this),error:t.bind(this.loadingError,this)})},gotInstanceData:function(e){this.instances=e.data.instances,this.frontend_domain_postfix=e.data.frontend_domain_postfix,this.renderInstances()},render:function(){return this.doneLoading(),this.$(".top").html(u({version:this.model,context:r,_:t})),this.routerStats&&this.routerStats.destroy(),this.routerStats=new o({el:this.$(".router-stats"),category:"version",input_id:this.model.id}),this},renderInstances:function(){this.doneLoading(),this.$(".bottom").html(a({version:this.model,instanceTypes:this.instances,context:r,frontend_domain_postfix:this.frontend_domain_postfix,is_current:this.model.attributes.is_current,_:t})),s.shrinkUuids(this.$el),this.delegateEvents()},events:{"click a.virtual":"navigateAway","click a.start":"startVersion","click a.register":"registerVersion","click a.stop":"stopVersion","click a.deregister":"deregisterVersion","click a.makecurrent":"makeCurrentVersion","click a.delete":"deleteVersion","click button.changeQuantity":"changeQuantity"},makeJobRequest:function(n,i){var s=this,o="/version/"+this.model.id+"/"+n+"?format=json";e.ajax({url:o,type:"POST",dataType:"json",success:function(e){s.doneLoading(),r.navigate("/version/"+s.model.id+"/"+n+"/"+e.data.job_id)},error:t.bind(this.loadingError,this)})},startVersion:function(e){e.preventDefault(),this.startLoadingFull(),this.makeJobRequest("start")},registerVersion:function(e){e.preventDefault(),this.startLoadingFull(),this.makeJobRequest("register")},stopVersion:function(e){e.preventDefault(),this.startLoadingFull(),this.makeJobRequest("stop")},deregisterVersion:function(e){e.preventDefault(),this.startLoadingFull(),this.makeJobRequest("deregister")},makeCurrentVersion:function(e){e.preventDefault(),this.startLoadingFull(),this.makeJobRequest("setcurrent")},deleteVersion:function(n){n.preventDefault(),this.startLoadingFull();var i=this;e.ajax({url:"/version/"+this.model.id+"/delete?format=json",type:"POST",dataType:"json",success:function(e){i.doneLoading();var t=r.workspaces.get(i.model.attributes.workspace.id);t.fetch();var n=t.applications.get(i.model.attributes.application_id);n.fetch(),n.versions.fetch(),r.navigate("/application/"+i.model.attributes.application_id)},error:t.bind(this.loadingError,this)})},changeQuantity:function(n){n.preventDefault(),this.startLoadingFull();var i=e(n.currentTarget).parent(),s=e("input[name=instance_type_id]",i).val(),o=parseInt(e("input[name=quantity]",i).val(),10),u=this;e.ajax({url:"/instancetype/"+s+"/quantity?format=json",type:"POST",dataType:"json",data:JSON.stringify({data:{quantity:o}}),success:function(e){u.doneLoading(),r.navigate("/version/"+u.model.id+"/quantity/"+e.data.job_id)},error:t.bind(this.loadingError,this)})}});return f}),define("tpl!templates/widget/jobsingle.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+="\n<h1>"+_.escape(title)+'</h1>\n\n<div class="job job-'+_.escape(job_id)+' well well-small" data-jobid="'+_.escape(job_id)+'">\n	<img src="/static/img/load-inline.gif" width="16" height="11" alt="Loading..." /> Loading...\n</div>';return __p}}),define("views/widget/genericjob",["jquery","underscore","backbone","context","bases","tpl!templates/widget/jobsingle.html","views/widget/jobblock"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){this.render(),this.block=null},render:function(){this.$el.html(s({title:this.options.title,job_id:this.options.job_id}));var e=this.$(".job-"+this.options.job_id);this.block=new o({job_id:this.options.job_id,el:e,finishedCallback:this.options.finishedCallback})},destroy:function(){this.block&&this.block.destroy()}});return u}),define("tpl!templates/application/new.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+="\n",newApplication?__p+="\n	<h1>New Application</h1>\n":__p+="\n	<h1>New Version</h1>\n",__p+='\n\n<ul class="nav nav-tabs" id="scm-exports">\n	',_.each(plugins,function(e,t,n){__p+='\n		<li>\n			<a href="#export-'+_.escape(t)+'" class="export-'+_.escape(t)+'">'+_.escape(e.title)+"</a>\n		</li>\n	"}),__p+='\n</ul>\n\n<div class="tab-content">\n	',_.each(plugins,function(e,t,n){__p+='\n		<div class="tab-pane ',t==0&&(__p+="active"),__p+='" id="export-'+_.escape(t)+'">\n			<form method="post" class="form-horizontal">\n				<input type="hidden" name="scm" value="'+_.escape(e.plugin)+'" />\n\n				<div class="scm-listers clearfix">\n				</div>\n\n				<div class="scm-inner clearfix">\n				</div>\n\n				<div class="control-group">\n					<label class="control-label" for="manifest_path">Manifest Path:</label>\n					<div class="controls">\n						<input name="manifest_path" id="manifest_path" type="text" value="manifest.yml" required="required" />\n					</div>\n				</div>\n\n				<div class="control-group">\n					<div class="controls">\n						<a class="btn btn-success submit" href="#">\n							Create <i class="icon-chevron-right icon-white"></i>\n						</a>\n					</div>\n				</div>\n			</form>\n		</div>\n	'}),__p+="\n</div>";return __p}}),define("views/application/new",["jquery","underscore","backbone","context","bases","tpl!templates/application/new.html"],function(e,t,n,r,i,s){var o=i.BaseView.extend({initialize:function(){this.$el.html(i.errorLoadingHtml+"<h1>Loading...</h1>"),this.startLoadingFull(),this.scmPlugins={},this.scmInstances={},e.ajax({url:this.options.url,dataType:"json",success:t.bind(this.gotNewMetadata,this),error:t.bind(this.loadingError,this)})},gotNewMetadata:function(e){this.metadata=e.data,this.scms=e.data.scms,this.scmsToLoad=e.data.scms.length;var n=this;t.each(this.scms,function(e,i,s){r.loadPlugin(e.plugin,function(t){n.gotScmPlugin(e.plugin,t)},t.bind(n.pluginError,n))})},pluginError:function(e){this.doneLoading(),this.$("h1").remove(),this.$(".alert").show(),this.$(".alert").html("Error loading plugin "+e.requireModules[0]+": "+e.message+". This is probably a programming error with the plugin.")},gotScmPlugin:function(e,t){this.scmPlugins[e]=t,this.scmsToLoad-=1,this.scmsToLoad<=0&&this.render()},destroy:function(){t.each(this.scmInstances,function(e,t,n){e.destroy()}),this.undelegateEvents()},render:function(){this.doneLoading(),this.$el.html(i.errorLoadingHtml+s({plugins:this.scms,context:r,newApplication:this.options.newApplication,_:t})),this.metadata.last_scm_name||this.$(".nav-tabs a:first").tab("show");var n=this;return t.each(this.scms,function(i,s,o){var u=n.$("#export-"+s+" .scm-inner"),a=new n.scmPlugins[i.plugin].SCM_EXPORT({el:u,workspace:n.options.workspace});n.scmInstances[i.plugin]=a,n.metadata.last_scm_name&&n.metadata.last_scm_name==i.plugin&&(n.$(".nav-tabs a.export-"+s).tab("show"),a.loadParameters(n.metadata.last_scm_params),n.metadata.last_scm_params&&n.metadata.last_scm_params.manifest_path&&e("input[name=manifest_path]",u.parent()).val(n.metadata.last_scm_params.manifest_path)),t.each(i.listers,function(i,s,o){r.loadPlugin(i.plugin,function(r){var s=e('<div class="tile scm-list"><img src="/static/img/load-inline.gif" width="16" height="11" alt="Loading..." /></div>'),o=e(".scm-listers",u.parent());o.append(s),n.scmInstances[i.plugin]=new r.SCM_LIST({el:s,title:i.title,plugin:i.plugin,selectedCallback:function(n){var r=e("select, input",u);t.each(n,function(n,i,s){t.each(r,function(t,r,s){t=e(t),t.attr("name")==i&&t.val(n)})})}})},t.bind(n.pluginError,n))})}),this},events:{"click .nav-tabs a":"tabSelect","click a.submit":"submit"},tabSelect:function(t){t.preventDefault(),e(t.currentTarget).tab("show")},submit:function(n){n.preventDefault(),this.$(".alert").hide();var r=e(n.currentTarget),i=r.parent().parent().parent(),s=e("input[name=scm]",i).val(),o=this.scmInstances[s].serialize();typeof o=="string"?(this.$(".alert").html(o),this.$(".alert").show()):(o.scm=s,o.manifest_path=e("input[name=manifest_path]",i).val(),this.startLoadingFull(),e.ajax({url:this.options.url,dataType:"json",method:"POST",data:JSON.stringify({data:o}),success:t.bind(this.startNewVersionSuccess,this),error:t.bind(this.loadingError,this)}))},startNewVersionSuccess:function(e){this.doneLoading(),this.options.newApplication?r.navigate("/workspace/"+this.options.workspace.id+"/applications/new/"+e.data.job_id):r.navigate("/application/"+this.options.application.id+"/newversion/"+e.data.job_id)}});return o}),define("tpl!templates/widget/fileupload.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+='<div class="drop">\n	<a class="btn" href="#"><i class="icon-upload"></i> Upload File</a>\n</div>\n<div class="status" style="display: none;"></div>\n<progress value="0" max="100"></progress>';return __p}}),define("resumable",[],function(){var e=function(t){function i(e,t){var n=this;n._prevProgress=0,n.resumableObj=e,n.file=t,n.fileName=t.fileName||t.name,n.size=t.size,n.relativePath=t.webkitRelativePath||n.fileName,n.uniqueIdentifier=$h.generateUniqueIdentifier(t);var r=!1,i=function(e,t){switch(e){case"progress":n.resumableObj.fire("fileProgress",n);break;case"error":n.abort(),r=!0,n.chunks=[],n.resumableObj.fire("fileError",n,t);break;case"success":if(r)return;n.resumableObj.fire("fileProgress",n),n.progress()==1&&n.resumableObj.fire("fileSuccess",n,t);break;case"retry":n.resumableObj.fire("fileRetry",n)}};return n.chunks=[],n.abort=function(){$h.each(n.chunks,function(e){e.status()=="uploading"&&e.abort()}),n.resumableObj.fire("fileProgress",n)},n.cancel=function(){var e=n.chunks;n.chunks=[],$h.each(e,function(e){e.status()=="uploading"&&(e.abort(),n.resumableObj.uploadNextChunk())}),n.resumableObj.removeFile(n),n.resumableObj.fire("fileProgress",n)},n.retry=function(){n.bootstrap(),n.resumableObj.upload()},n.bootstrap=function(){n.abort(),r=!1,n.chunks=[],n._prevProgress=0;for(var e=0;e<Math.max(Math.floor(n.file.size/n.resumableObj.opts.chunkSize),1);e++)n.chunks.push(new s(n.resumableObj,n,e,i))},n.progress=function(){if(r)return 1;var e=0,t=!1;return $h.each(n.chunks,function(n){n.status()=="error"&&(t=!0),e+=n.progress(!0)}),e=t?1:e>.999?1:e,e=Math.max(n._prevProgress,e),n._prevProgress=e,e},n.bootstrap(),this}function s(e,t,n,r){var i=this;return i.resumableObj=e,i.fileObj=t,i.fileObjSize=t.size,i.offset=n,i.callback=r,i.lastProgressCallback=new Date,i.tested=!1,i.loaded=0,i.startByte=i.offset*i.resumableObj.opts.chunkSize,i.endByte=(i.offset+1)*i.resumableObj.opts.chunkSize,i.fileObjSize-i.endByte<i.resumableObj.opts.chunkSize&&(i.endByte=i.fileObjSize),i.xhr=null,i.test=function(){i.xhr=new XMLHttpRequest;var e=function(e){i.tested=!0;var t=i.status();t=="success"?(i.callback(t,i.message()),i.resumableObj.uploadNextChunk()):i.send()};i.xhr.addEventListener("load",e,!1),i.xhr.addEventListener("error",e,!1);var t="",n=[],r=typeof i.resumableObj.opts.query=="function"?i.resumableObj.opts.query(i.fileObj):i.resumableObj.opts.query;$h.each(r,function(e,t){n.push([encodeURIComponent(e),encodeURIComponent(t)].join("="))}),n.push(["resumableChunkNumber",encodeURIComponent(i.offset+1)].join("=")),n.push(["resumableChunkSize",encodeURIComponent(i.resumableObj.opts.chunkSize)].join("=")),n.push(["resumableTotalSize",encodeURIComponent(i.fileObjSize)].join("=")),n.push(["resumableIdentifier",encodeURIComponent(i.fileObj.uniqueIdentifier)].join("=")),n.push(["resumableFilename",encodeURIComponent(i.fileObj.fileName)].join("=")),n.push(["resumableRelativePath",encodeURIComponent(i.fileObj.relativePath)].join("=")),i.xhr.open("GET",i.resumableObj.opts.target+"?"+n.join("&")),$h.each(i.resumableObj.opts.headers,function(e,t){i.xhr.setRequestHeader(e,t)}),i.xhr.send(null)},i.send=function(){if(i.resumableObj.opts.testChunks&&!i.tested){i.test();return}i.xhr=new XMLHttpRequest,i.xhr.upload.addEventListener("progress",function(e){new Date-i.lastProgressCallback>i.resumableObj.opts.throttleProgressCallbacks*1e3&&(i.callback("progress"),i.lastProgressCallback=new Date),i.loaded=e.loaded||0},!1),i.loaded=0,i.callback("progress");var e=function(e){var t=i.status();t=="success"||t=="error"?(i.callback(t,i.message()),i.resumableObj.uploadNextChunk()):(i.callback("retry",i.message()),i.abort(),i.send())};i.xhr.addEventListener("load",e,!1),i.xhr.addEventListener("error",e,!1);var t=new FormData,n=typeof i.resumableObj.opts.query=="function"?i.resumableObj.opts.query(i.fileObj):i.resumableObj.opts.query;$h.each(n,function(e,n){t.append(e,n)}),t.append("resumableChunkNumber",i.offset+1),t.append("resumableChunkSize",i.resumableObj.opts.chunkSize),t.append("resumableTotalSize",i.fileObjSize),t.append("resumableIdentifier",i.fileObj.uniqueIdentifier),t.append("resumableFilename",i.fileObj.fileName),t.append("resumableRelativePath",i.fileObj.relativePath);var r=i.fileObj.file.slice?"slice":i.fileObj.file.mozSlice?"mozSlice":i.fileObj.file.webkitSlice?"webkitSlice":"slice";t.append(i.resumableObj.opts.fileParameterName,i.fileObj.file[r](i.startByte,i.endByte)),i.xhr.open("POST",i.resumableObj.opts.target),$h.each(i.resumableObj.opts.headers,function(e,t){i.xhr.setRequestHeader(e,t)}),i.xhr.send(t)},i.abort=function(){i.xhr&&i.xhr.abort(),i.xhr=null},i.status=function(){return i.xhr?i.xhr.readyState<4?"uploading":i.xhr.status==200?"success":i.xhr.status==415||i.xhr.status==500||i.xhr.status==501?"error":(i.abort(),"pending"):"pending"},i.message=function(){return i.xhr?i.xhr.responseText:""},i.progress=function(e){typeof e=="undefined"&&(e=!1);var t=e?(i.endByte-i.startByte)/i.fileObjSize:1,n=i.status();switch(n){case"success":case"error":return 1*t;case"pending":return 0*t;default:return i.loaded/(i.endByte-i.startByte)*t}},this}if(this instanceof e){this.support=typeof File!="undefined"&&typeof Blob!="undefined"&&typeof FileList!="undefined"&&(!!Blob.prototype.webkitSlice||!!Blob.prototype.mozSlice||Blob.prototype.slice||!1);if(!this.support)return!1;var n=this;n.files=[],n.defaults={chunkSize:1048576,simultaneousUploads:3,fileParameterName:"file",throttleProgressCallbacks:.5,query:{},headers:{},prioritizeFirstAndLastChunk:!1,target:"/",testChunks:!0,generateUniqueIdentifier:null,maxFiles:undefined,maxFilesErrorCallback:function(){alert("Please upload "+n.opts.maxFiles+" file"+(n.opts.maxFiles===1?"":"s")+" at a time.")}},n.events=[],n.on=function(e,t){n.events.push(e.toLowerCase(),t)},n.fire=function(){var e=[];for(var t=0;t<arguments.length;t++)e.push(arguments[t]);var r=e[0].toLowerCase();for(var t=0;t<=n.events.length;t+=2)n.events[t]==r&&n.events[t+1].apply(n,e.slice(1)),n.events[t]=="catchall"&&n.events[t+1].apply(null,e);r=="fileerror"&&n.fire("error",e[2],e[1]),r=="fileprogress"&&n.fire("progress")},$h={stopEvent:function(e){e.stopPropagation(),e.preventDefault()},each:function(e,t){if(typeof e.length!="undefined"){for(var n=0;n<e.length;n++)if(t(e[n])===!1)return}else for(n in e)if(t(n,e[n])===!1)return},generateUniqueIdentifier:function(e){if(typeof n.opts.generateUniqueIdentifier=="function")return n.opts.generateUniqueIdentifier(e);var t=e.webkitRelativePath||e.fileName||e.name,r=e.size;return r+"-"+t.replace(/[^0-9a-zA-Z_-]/img,"")}};var r=function(e){if(typeof n.opts.maxFiles!="undefined"&&t.maxFiles<e.length+n.files.length)return n.opts.maxFilesErrorCallback(),!1;$h.each(e,function(e){if(e.size>0&&!n.getFromUniqueIdentifier($h.generateUniqueIdentifier(e))){var t=new i(n,e);n.files.push(t),n.fire("fileAdded",t)}})};return n.uploadNextChunk=function(){var e=!1;if(n.opts.prioritizeFirstAndLastChunk){$h.each(n.files,function(t){if(t.chunks.length&&t.chunks[0].status()=="pending")return t.chunks[0].send(),e=!0,!1;if(t.chunks.length>1&&t.chunks[t.chunks.length-1].status()=="pending")return t.chunks[t.chunks.length-1].send(),e=!0,!1});if(e)return!0}return $h.each(n.files,function(t){$h.each(t.chunks,function(t){if(t.status()=="pending")return t.send(),e=!0,!1});if(e)return!1}),e?!0:($h.each(n.files,function(e){outstanding=!1,$h.each(e.chunks,function(e){var t=e.status();if(t=="pending"||t=="uploading")return outstanding=!0,!1});if(outstanding)return!1}),outstanding||n.fire("complete"),!1)},n.assignBrowse=function(e,t){typeof e.length=="undefined"&&(e=[e]),$h.each(e,function(e){var i;e.tagName==="INPUT"&&e.type==="file"?i=e:(i=document.createElement("input"),i.setAttribute("type","file"),e.style.display="inline-block",e.style.position="relative",i.style.position="absolute",i.style.top=i.style.left=i.style.bottom=i.style.right=0,i.style.opacity=0,i.style.cursor="pointer",e.appendChild(i)),typeof n.opts.maxFiles=="undefined"||n.opts.maxFiles!=1?i.setAttribute("multiple","multiple"):i.removeAttribute("multiple"),t?i.setAttribute("webkitdirectory","webkitdirectory"):i.removeAttribute("webkitdirectory"),i.addEventListener("change",function(e){r(e.target.files),e.target.value=""},!1)})},n.assignDrop=function(e){typeof e.length=="undefined"&&(e=[e]),$h.each(e,function(e){e.addEventListener("dragover",function(e){e.preventDefault()},!1),e.addEventListener("drop",function(e){$h.stopEvent(e),r(e.dataTransfer.files)},!1)})},n.isUploading=function(){var e=!1;return $h.each(n.files,function(t){$h.each(t.chunks,function(t){if(t.status()=="uploading")return e=!0,!1});if(e)return!1}),e},n.upload=function(){if(n.isUploading())return;for(var e=1;e<=n.opts.simultaneousUploads;e++)n.uploadNextChunk()},n.pause=function(){$h.each(n.files,function(e){e.abort()}),n.fire("pause")},n.cancel=function(){$h.each(n.files,function(e){e.cancel()}),n.fire("cancel")},n.progress=function(){var e=0,t=0;return $h.each(n.files,function(n){e+=n.progress()*n.size,t+=n.size}),t>0?e/t:0},n.removeFile=function(e){var t=[];$h.each(n.files,function(n,r){n!==e&&t.push(n)}),n.files=t},n.getFromUniqueIdentifier=function(e){var t=!1;return $h.each(n.files,function(n){n.uniqueIdentifier==e&&(t=n)}),t},n.getSize=function(){var e=0;return $h.each(n.files,function(t){e+=t.size}),e},n.opts=t||{},$h.each(n.defaults,function(e,t){typeof n.opts[e]=="undefined"&&(n.opts[e]=t)}),this}return new e(t)};return e}),define("views/widget/fileupload",["jquery","underscore","backbone","context","bases","tpl!templates/widget/fileupload.html","resumable"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){r.hasPermission("FILE_UPLOAD",this.options.workspace_id)?this.render():this.$el.html("<p>Sorry, you need the FILE_UPLOAD permission to upload here.</p>")},render:function(){this.$el.html(s()),this.resumable=new o({chunkSize:524288,target:"/files/upload",fileParameterName:"file.data"}),this.resumable.assignBrowse(this.$("a.btn")),this.resumable.assignDrop(this.$(".drop"));var t=this;this.resumable.on("fileAdded",function(e){t.$(".status").html(e.fileName+", "+e.size+" bytes"),t.resumable.upload(),t.$(".drop").hide(),t.$(".status").show()}),this.resumable.on("fileSuccess",function(n,r){var i=e.parseJSON(r),s=e('<input type="hidden" name="uploaded_file" />');s.attr("value",i.data.identifier),t.$el.append(s),t.$(".status").html("Upload complete.")}),this.resumable.on("fileError",function(n,r){var i=e.parseJSON(r),s=e('<ul class="error"></ul>');for(var o=0;o<i.errors.length;o++){var u=e("<li></li>");u.text(i.errors[o]),s.append(u)}t.$(".status").html(s)}),this.resumable.on("progress",function(e){t.$("progress").val(t.resumable.progress()*100)})},destroy:function(){this.resumable.isUploading()&&this.resumable.cancel()}});return u}),define("tpl!templates/workspace/edit.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+="\n<h1>",newWorkspace?__p+="Create Workspace":__p+="Edit Workspace",__p+='</h1>\n\n<form method="POST" class="form-horizontal">\n	<div class="control-group">\n		<label class="control-label" for="name">Name:</label>\n		<div class="controls">\n			<input name="name" id="name" type="text" value="'+_.escape(workspace.attributes.name)+'" />\n		</div>\n	</div>\n\n	<div class="control-group">\n		<label class="control-label" for="stub">Stub:</label>\n		<div class="controls">\n			<input name="stub" id="stub" type="text" value="'+_.escape(workspace.attributes.stub)+'" />\n		</div>\n	</div>\n\n	<div class="control-group">\n		<label class="control-label">Tags:</label>\n		<div class="controls">\n			<input type="hidden" id="tags" name="serialised_tags" value="">\n			<div class="workspace-tag-editor pm-tag-editor"></div>\n		</div>\n	</div>\n\n	<div class="control-group">\n		<div class="controls">\n			<button class="btn submit">Submit</button>\n		</div>\n	</div>\n</form>';return __p}}),define("views/workspace/edit",["jquery","underscore","backbone","context","bases","tpl!templates/workspace/edit.html","models/workspace"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){this.model?this.newWorkspace=!1:(this.newWorkspace=!0,this.model=new o),this.render()},render:function(){return this.$el.html(i.errorLoadingHtml+s({workspace:this.model,context:r,newWorkspace:this.newWorkspace})),e("head").append('<link rel="stylesheet" href="/static/css/tag_editor.css">'),this.$(".workspace-tag-editor").jsonEditor({Tags:this.model.attributes.tags},{newSingleKey:"New Tag",newGroupKey:"Tag Group",change:function(e){this.$("#tags").val(JSON.stringify(e.Tags)),this.$("#tags").data("tags",e.Tags)},drawproperty:function(t,n,r,i,s){return children={},s=="Tags"&&Object.prototype.toString.call(n[s])=="[object Object]"&&(children.item=e("<div>",{"class":"item","data-path":i}),children.item.addClass("expanded group-top-level"),children.property=e(t.headerElement||'<span class="property group-header">'+s+"</span>")),children}}),this},saveModel:function(e){e.preventDefault(),this.startLoadingFull(),this.model.save({name:this.$("#name").val(),stub:this.$("#stub").val(),tags:this.$("#tags").data("tags")},{success:t.bind(this.saveOk,this),error:t.bind(this.loadingError,this)})},saveOk:function(){r.navigate("/workspace/list")},events:{"click button.submit":"saveModel"}});return u}),define("tpl!templates/application/services.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+='\n<h1>Services</h1>\n\n<div class="service-list clearfix">\n	';for(var i=0;i<services.services.length;i++){__p+="\n		";var service=services.services[i];__p+='\n		<div class="service tile">\n			<div class="title">\n				'+_.escape(service.name)+'\n			</div>\n			<div class="body">\n				<strong>Provider:</strong> '+_.escape(service.provider)+"\n				<br />\n				<strong>State:</strong> "+_.escape(service.state)+"\n				<br />\n				";var actions=[];__p+="\n				",services.exportable_services[service.provider]&&(__p+="\n					",actions.push('<a href="/service/export/'+service.id+'" class="virtual">Export</a>'),__p+="\n				"),__p+="\n				",services.importable_services[service.provider]&&(__p+="\n					",actions.push('<a href="/service/import/'+service.id+'" class="virtual">Import</a>'),__p+="\n				"),__p+="\n				",service.credentials&&(__p+="\n					",actions.push('<a href="#" class="showCredentials">Credentials</a>'),__p+="\n				"),__p+="\n\n				"+actions.join(" &middot; ")+"\n\n				",service.credentials&&(__p+='\n					<pre class="credentials" style="display: none;">'+_.escape(JSON.stringify(service.credentials,null,2))+"</pre>\n				"),__p+="\n			</div>\n		</div>\n	"}__p+="\n</div>\n\n",services.services.length==0&&(__p+='\n	<p class="lead">This application has no services.</p>\n'),__p+=""}return __p}}),define("views/application/services",["jquery","underscore","backbone","context","bases","tpl!templates/application/services.html"],function(e,t,n,r,i,s){var o=i.BaseView.extend({initialize:function(){this.$el.html("<h1>Services</h1>"),this.startLoadingFull()},dataReady:function(e){this.services=e.data,this.render()},render:function(){return this.doneLoading(),this.$el.html(s({services:this.services,context:r})),this},events:{"click a.virtual":"navigateAway","click a.showCredentials":"showCredentials"},showCredentials:function(t){t.preventDefault();var n=e(t.currentTarget),r=e("pre",n.parent());r.slideToggle()}});return o}),define("tpl!templates/version/manifest.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+="\n<h1>Manifest</h1>\n\n<pre>"+_.escape(manifest.manifest)+"</pre>";return __p}}),define("views/version/manifest",["jquery","underscore","backbone","context","bases","tpl!templates/version/manifest.html"],function(e,t,n,r,i,s){var o=i.BaseView.extend({initialize:function(){this.$el.html("<h1>Loading...</h1>")},destroy:function(){},dataReady:function(e){this.data=e.data,this.render()},render:function(){return this.doneLoading(),this.$el.html(s({manifest:this.data,context:r})),this}});return o}),define("tpl!templates/widget/logsingle.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+="\n<h1>"+_.escape(title)+'</h1>\n\n<pre data-jobid="'+_.escape(job_id)+'">Loading...</pre>';return __p}}),define("views/widget/genericlog",["jquery","underscore","backbone","context","bases","tpl!templates/widget/logsingle.html","views/widget/logviewer"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){this.render(),this.block=null},render:function(){this.$el.html(s({title:this.options.title,job_id:this.options.job_id})),this.block=new o({el:this.$("pre")}),this.block.start()},destroy:function(){this.block&&this.block.destroy()}});return u}),define("tpl!templates/service/export.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+="\n<h1>Export "+_.escape(service.attributes.name)+'</h1>\n\n<form method="POST" action="/service/export/'+_.escape(service.id)+'">\n	<div class="export-inner"></div>\n\n	<input type="submit" class="btn" value="Export" />\n</form>';return __p}}),define("views/service/export",["jquery","underscore","backbone","context","bases","tpl!templates/service/export.html"],function(e,t,n,r,i,s){var o=i.BaseView.extend({initialize:function(){this.$el.html(i.errorLoadingHtml+"<h1>Loading...</h1>"),this.startLoadingFull(),this.exportPlugin=null,this.exportPluginInstance=null;var e=this;r.loadPlugin(this.model.attributes.provider,function(t){e.exportPlugin=t,e.render()},function(t){e.render()})},gotPlugin:function(){this.doneLoading()},destroy:function(){this.exportPluginInstance&&this.exportPluginInstance.destroy(),this.undelegateEvents()},render:function(){this.doneLoading(),this.$el.html(i.errorLoadingHtml+s({service:this.model,context:r,_:t}));var e=this.$(".export-inner");return this.exportPlugin&&this.exportPlugin.SERVICE_EXPORT?this.exportPluginInstance=new this.exportPlugin.SERVICE_EXPORT({el:e,service:this.model}):e.text("This plugin has no options."),this}});return o}),define("tpl!templates/service/import.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+="\n<h1>Import into "+_.escape(service.attributes.name)+'</h1>\n\n<form method="POST" class="form-horizontal">\n	<div class="control-group">\n		<label class="control-label">Upload file:</label>\n		<div class="controls">\n			<div class="file-uploader-widget"></div>\n		</div>\n	</div>\n\n	<div class="import-inner"></div>\n\n	<button class="btn submit">Import</button>\n</form>';return __p}}),define("views/service/import",["jquery","underscore","backbone","context","bases","views/widget/fileupload","tpl!templates/service/import.html"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){this.$el.html(i.errorLoadingHtml+"<h1>Loading...</h1>"),this.startLoadingFull(),this.importPlugin=null,this.importPluginInstance=null,this.uploader=null;var e=this;r.loadPlugin(this.model.attributes.provider,function(t){e.importPlugin=t,e.render()},function(t){e.render()})},gotPlugin:function(){this.doneLoading()},destroy:function(){this.importPluginInstance&&this.importPluginInstance.destroy(),this.uploader&&this.uploader.destroy(),this.undelegateEvents()},render:function(){this.doneLoading(),this.$el.html(i.errorLoadingHtml+o({service:this.model,context:r,_:t}));var e=this.$(".import-inner");return this.importPlugin&&this.importPlugin.SERVICE_IMPORT?this.importPluginInstance=new this.importPlugin.SERVICE_IMPORT({el:e,service:this.model}):e.text("This plugin has no options."),this.uploader=new s({workspace_id:this.model.attributes.workspace.id,el:this.$(".file-uploader-widget")}),this},events:{"click button.submit":"submit"},submit:function(n){n.preventDefault();if(this.$("input[name=uploaded_file]").length==0){this.$(".alert").text("No file uploaded."),this.$(".alert").show();return}var i={};i.uploaded_file=this.$("input[name=uploaded_file]").val();if(this.importPluginInstance){i=this.importPluginInstance.serialize(i);if(typeof i=="string"){this.$(".alert").html(i),this.$(".alert").show();return}}var s=this;this.startLoadingFull(),e.ajax({url:"/service/import/"+this.model.id+"?format=json",type:"POST",dataType:"json",data:JSON.stringify({data:i}),success:function(e){s.doneLoading(),r.navigate("/service/import/"+s.model.id+"/"+e.data.job_id)},error:t.bind(this.loadingError,this)})}});return u}),define("router",["jquery","underscore","backbone","tpl!templates/layout/breadcrumb.html","models/node","models/user","models/role","models/application","models/version","models/workspace","models/service","views/node/list","views/workspace/sidebar","views/node/sidebar","views/node/detail","views/administration/sidebar","views/administration/profile","views/administration/list","views/administration/user-list","views/layout/genericloading","views/administration/user-edit","views/administration/role-list","views/administration/role-edit","views/administration/role-allocation-list","views/administration/role-allocation-assign","views/widget/genericjobslist","views/administration/router-dump","views/administration/configuration-dump","views/administration/plugin-dump","views/workspace/list","views/application/list","views/application/detail","views/version/detail","views/widget/genericjob","views/application/new","views/widget/fileupload","views/workspace/edit","views/application/services","views/version/manifest","views/widget/genericlog","views/service/export","views/service/import"],function(e,t,n,r,i,s,o,u,a,f,l,c,h,p,d,v,m,g,y,b,w,E,S,x,T,N,C,k,L,A,O,M,_,D,P,H,B,j,F,I,q,R){var U={workspaces:e(".page-workspaces"),nodes:e(".page-nodes"),administration:e(".page-administration"),404:e(".page-404")},z={},W=n.Router.extend({initialize:function(){this.route(/^$/,"workspaceList"),this.route("workspace/list","workspaceList"),this.route(/^workspace\/(\d+)\/applications$/,"applicationList"),this.route(/^workspace\/(\d+)$/,"workspaceEdit"),this.route("workspace/create","workspaceEdit"),this.route(/^job\/list\/workspace\/(\d+)$/,"workspaceJobsList"),this.route(/^job\/list\/workspace\/(\d+)\?sub\=cron$/,"workspaceJobsList"),this.route(/^workspace\/(\d+)\/applications\/new$/,"applicationNew"),this.route(/^workspace\/(\d+)\/applications\/new\/([-a-z0-9]+)$/,"applicationNewJob"),this.route(/^application\/(\d+)$/,"applicationView"),this.route(/^application\/(\d+)\/newversion$/,"applicationNewVersion"),this.route(/^application\/(\d+)\/newversion\/([-a-z0-9]+)$/,"applicationNewVersionJob"),this.route(/^application\/(\d+)\/services$/,"applicationServices"),this.route(/^application\/(\d+)\/delete\/([-a-z0-9]+)$/,"applicationDeleteJob"),this.route(/^job\/list\/application\/(\d+)$/,"applicationJobsList"),this.route(/^job\/list\/application\/(\d+)\?sub\=cron$/,"applicationJobsList"),this.route(/^version\/(\d+)$/,"versionView"),this.route(/^version\/(\d+)\/log\/([-a-z0-9]+)$/,"versionLogView"),this.route(/^version\/(\d+)\/(start|stop|register|deregister|setcurrent|quantity)\/([-a-z0-9]+)$/,"versionJob"),this.route(/^version\/(\d+)\/manifest$/,"versionManifest"),this.route(/^job\/list\/version\/(\d+)$/,"versionJobsList"),this.route(/^job\/list\/version\/(\d+)\?sub\=cron$/,"versionJobsList"),this.route(/^service\/export\/(\d+)$/,"serviceExport"),this.route(/^service\/import\/(\d+)$/,"serviceImport"),this.route(/^service\/import\/(\d+)\/([-a-z0-9]+)$/,"serviceImportJob"),this.route("node/list","nodeList"),this.route(/^node\/(\d+)$/,"nodeDetail"),this.route(/^node\/(\d+)\/log\/([-a-z0-9]+)$/,"nodeLogView"),this.route("administration/list","administrationList"),this.route("profile","yourProfile"),this.route("user/list","userList"),this.route(/^user\/(\d+)$/,"userEdit"),this.route("user/create","userEdit"),this.route("role/list","roleList"),this.route(/^role\/(\d+)$/,"roleEdit"),this.route("role/create","roleEdit"),this.route("role/allocation/list","roleAllocationList"),this.route("role/allocation/assign","roleAllocationAssign"),this.route("job/list/health","adminHealthJobs"),this.route("job/list/periodic","adminPeriodicJobs"),this.route("router/dump","adminRouterDump"),this.route("configuration/dump","adminConfigurationDump"),this.route("configuration/plugins","adminPluginsDump")},ensureVisible:function(e){this.currentMainView&&(this.currentMainView.destroy(),this.currentMainView=null);var n=this;t.each(U,function(t,n,r){e!=n&&t.hide()}),t.each(U,function(t,r,i){e==r&&(n.currentPage=t,t.is(":visible")||t.fadeIn())}),this.createSidebar(e)},createSidebar:function(t){z[t]||(t=="nodes"&&(z[t]=new p({collection:this.context.nodes,el:e(".sidebar",this.currentPage)}),this.context.nodes.fetch()),t=="workspaces"&&(z[t]=new h({collection:this.context.workspaces,el:e(".sidebar",this.currentPage)})),t=="administration"&&(z[t]=new v({collection:this.context.administrations,el:e(".sidebar",this.currentPage)})))},breadcrumbs:function(t){var n=e("ul.breadcrumb",this.currentPage);n.html(r({crumbs:t}));var i=this;e("a",n).click(function(t){return i.context.navigate(e(t.currentTarget).attr("href")),!1})},adminSetActive:function(e){var t=window.location.pathname;e&&(t=e),this.context.administrations.invoke("set",{active:!1}),this.context.administrations.findWhere({path:t}).set({active:!0})},setMainView:function(e){this.currentMainView&&this.currentMainView.destroy(),this.currentMainView=e},workspaceSetActive:function(e){z.workspaces&&z.workspaces.setActive(e)},genericJobsListPage:function(t,n){this.setMainView(new N({url:t,title:n,el:e(".mainarea",this.currentPage)}))},genericDataTemplatePage:function(n,r){this.setMainView(new r({el:e(".mainarea",this.currentPage)})),e.ajax({url:n,dataType:"json",success:t.bind(this.currentMainView.dataReady,this.currentMainView),error:t.bind(this.currentMainView.loadingError,this.currentMainView)})},fromCollectionOrServer:function(n,r,i,s,o){var u=r.get(n);u?(s(u),o&&o(u)):(this.setMainView(new b({el:e(".mainarea",this.currentPage)})),this.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"#",title:"Loading ..."}]),u=new i({id:n}),u.fetch({success:function(e,t,n){r.add(e),result=r.get(e.id),s(result)},error:t.bind(this.currentMainView.loadingError,this.currentMainView)}))},workspaceEdit:function(n){function i(t){var i=[{href:"/workspace/list",title:"Workspaces"}];t?(i.push({href:"/workspace/"+n+"/applications",title:t.attributes.name}),i.push({href:"/workspace/"+n,title:"Edit"})):(r.workspaceSetActive("create-workspace"),i.push({href:"/workspace/create",title:"Create workspace"})),r.breadcrumbs(i),r.setMainView(new B({model:t,el:e(".mainarea",U.workspaces)}))}this.ensureVisible("workspaces"),this.workspaceSetActive("workspace-"+n);var r=this;if(n){this.setMainView(new b({el:e(".mainarea",this.currentPage)})),this.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"#",title:"Loading workspace "+n+"..."}]);var s=new f({id:n});s.fetch({success:function(e,t,n){i(e)},error:t.bind(this.currentMainView.loadingError,this.currentMainView)})}else i()},workspaceList:function(){this.ensureVisible("workspaces"),this.workspaceSetActive(""),this.setMainView(new A({collection:this.context.workspaces,el:e(".mainarea",this.currentPage)})),this.context.workspaces.fetch(),this.breadcrumbs([{href:"/workspace/list",title:"Workspaces"}]),this.currentMainView.render(),this.currentMainView.startLoadingFull()},workspaceJobsList:function(e){this.ensureVisible("workspaces"),this.workspaceSetActive("workspace-"+e);var t=this;this.fromCollectionOrServer(e,this.context.workspaces,f,function(n){var r=[{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+e+"/applications",title:n.attributes.name}],i=window.location.pathname,s="All Jobs";window.location.search.indexOf("sub=cron")!=-1?(r.push({href:"",title:"Cron Jobs"}),i+="?sub=cron&format=json",s="Cron Jobs"):(r.push({href:"",title:"All Jobs"}),i+="?format=json"),t.breadcrumbs(r),t.genericJobsListPage(i,s)})},applicationList:function(t){this.ensureVisible("workspaces"),this.workspaceSetActive("workspace-"+t);var n=this;this.fromCollectionOrServer(t,this.context.workspaces,f,function(r){n.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+t+"/applications",title:r.attributes.name}]),n.setMainView(new O({collection:r.applications,workspace:r,el:e(".mainarea",n.currentPage)})),r.applications.fetch()})},applicationView:function(t){this.ensureVisible("workspaces"),this.workspaceSetActive("application-"+t);var n=this;this.fromCollectionOrServer(t,this.context.applications,u,function(t){n.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+t.attributes.workspace.id+"/applications",title:t.attributes.workspace.name},{href:"/application/"+t.id,title:t.attributes.name}]),n.setMainView(new M({model:t,el:e(".mainarea",n.currentPage)})),t.fetch(),t.versions.fetch()})},applicationServices:function(e){this.ensureVisible("workspaces"),this.workspaceSetActive("application-"+e);var t=this;this.fromCollectionOrServer(e,this.context.applications,u,function(e){t.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+e.attributes.workspace.id+"/applications",title:e.attributes.workspace.name},{href:"/application/"+e.id,title:e.attributes.name},{href:"/application/"+e.id+"/services",title:"Services"}]),t.genericDataTemplatePage(window.location.pathname+"?format=json",j)})},applicationNew:function(t){this.ensureVisible("workspaces"),this.workspaceSetActive("create-application-"+t);var n=this;this.fromCollectionOrServer(t,this.context.workspaces,f,function(r){n.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+t+"/applications",title:r.attributes.name},{href:"/workspace/"+t+"/applications/new",title:"New Application"}]),n.setMainView(new P({url:window.location.pathname+"?format=json",workspace:r,newApplication:!0,el:e(".mainarea",n.currentPage)}))})},applicationNewJob:function(t,n){this.ensureVisible("workspaces"),this.workspaceSetActive("create-application-"+t);var r=this;this.fromCollectionOrServer(t,this.context.workspaces,f,function(i){r.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+t+"/applications",title:i.attributes.name},{href:window.location.pathname,title:"New Application"}]),r.setMainView(new D({job_id:n,el:e(".mainarea",r.currentPage),finishedCallback:function(e,n){var i=r.context.workspaces.get(t);i.applications.fetch()}}))})},applicationJobsList:function(e){this.ensureVisible("workspaces"),this.workspaceSetActive("application-"+e);var t=this;this.fromCollectionOrServer(e,this.context.applications,u,function(e){var n=[{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+e.attributes.workspace.id+"/applications",title:e.attributes.workspace.name},{href:"/application/"+e.id,title:e.attributes.name}],r=window.location.pathname,i="All Jobs";window.location.search.indexOf("sub=cron")!=-1?(n.push({href:"",title:"Cron Jobs"}),r+="?sub=cron&format=json",i="Cron Jobs"):(n.push({href:"",title:"All Jobs"}),r+="?format=json"),t.breadcrumbs(n),t.genericJobsListPage(r,i)})},applicationNewVersion:function(t){this.ensureVisible("workspaces"),this.workspaceSetActive("create-version-"+t);var n=this;this.fromCollectionOrServer(t,this.context.applications,u,function(t){n.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+t.attributes.workspace.id+"/applications",title:t.attributes.workspace.name},{href:"/application/"+t.id,title:t.attributes.name},{href:window.location.pathname,title:"New Version"}]),n.setMainView(new P({url:window.location.pathname+"?format=json",workspace:t.attributes.workspace,application:t,newApplication:!1,el:e(".mainarea",n.currentPage)}))})},applicationNewVersionJob:function(t,n){this.ensureVisible("workspaces"),this.workspaceSetActive("create-version-"+t);var r=this;this.fromCollectionOrServer(t,this.context.applications,u,function(t){r.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+t.attributes.workspace.id+"/applications",title:t.attributes.workspace.name},{href:"/application/"+t.id,title:t.attributes.name},{href:window.location.pathname,title:"New Version"}]),r.setMainView(new D({job_id:n,el:e(".mainarea",r.currentPage),finishedCallback:function(e,n){var i=r.context.workspaces.get(t.attributes.workspace.id);i.applications.fetch();var s=r.context.applications.get(t.id);s.fetch()}}))})},applicationDeleteJob:function(t,n){this.ensureVisible("workspaces"),this.workspaceSetActive("application-"+t);var r=this;this.fromCollectionOrServer(t,this.context.applications,u,function(t){r.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+t.attributes.workspace.id+"/applications",title:t.attributes.workspace.name},{href:"/application/"+t.attributes.id,title:t.attributes.name},{href:window.location.pathname,title:"Delete"}]),r.setMainView(new D({job_id:n,el:e(".mainarea",r.currentPage),finishedCallback:function(e,n){var i=r.context.workspaces.get(t.attributes.workspace.id);i.applications.fetch()}}))})},versionView:function(t){this.ensureVisible("workspaces"),this.workspaceSetActive("version-"+t);var n=this;this.fromCollectionOrServer(t,this.context.versions,a,function(t){n.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+t.attributes.workspace.id+"/applications",title:t.attributes.workspace.name},{href:"/application/"+t.attributes.application.id,title:t.attributes.application.name},{href:"/version/"+t.attributes.id,title:"Version "+t.attributes.version}]),n.setMainView(new _({model:t,el:e(".mainarea",n.currentPage)}))},function(e){e.fetch()})},versionManifest:function(e){this.ensureVisible("workspaces"),this.workspaceSetActive("version-"+e);var t=this;this.fromCollectionOrServer(e,this.context.versions,a,function(e){t.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+e.attributes.workspace.id+"/applications",title:e.attributes.workspace.name},{href:"/application/"+e.attributes.application.id,title:e.attributes.application.name},{href:"/version/"+e.attributes.id,title:"Version "+e.attributes.version},{href:window.location.pathname,title:"Manifest"}]),t.genericDataTemplatePage(window.location.pathname+"?format=json",F)})},versionLogView:function(t,n){this.ensureVisible("workspaces"),this.workspaceSetActive("version-"+t);var r=this;this.fromCollectionOrServer(t,this.context.versions,a,function(t){r.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+t.attributes.workspace.id+"/applications",title:t.attributes.workspace.name},{href:"/application/"+t.attributes.application.id,title:t.attributes.application.name},{href:"/version/"+t.attributes.id,title:"Version "+t.attributes.version},{href:window.location.pathname,title:"Log File"}]),r.setMainView(new I({el:e(".mainarea",U.workspaces),job_id:n,title:"View log"}))})},versionJobsList:function(e){this.ensureVisible("workspaces"),this.workspaceSetActive("version-"+e);var t=this;this.fromCollectionOrServer(e,this.context.versions,a,function(e){var n=[{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+e.attributes.workspace.id+"/applications",title:e.attributes.workspace.name},{href:"/application/"+e.attributes.application.id,title:e.attributes.application.name},{href:"/version/"+e.attributes.id,title:"Version "+e.attributes.version}],r=window.location.pathname,i="All Jobs";window.location.search.indexOf("sub=cron")!=-1?(n.push({href:"",title:"Cron Jobs"}),r+="?sub=cron&format=json",i="Cron Jobs"):(n.push({href:"",title:"All Jobs"}),r+="?format=json"),t.breadcrumbs(n),t.genericJobsListPage(r,i)})},jobActionMap:{start:"Start",stop:"Stop",register:"Register",deregister:"De-Register",setcurrent:"Make Current",quantity:"Instance Quantity"},versionJob:function(t,n,r){this.ensureVisible("workspaces"),this.workspaceSetActive("version-"+t);var i=this;this.fromCollectionOrServer(t,this.context.versions,a,function(t){i.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+t.attributes.workspace.id+"/applications",title:t.attributes.workspace.name},{href:"/application/"+t.attributes.application.id,title:t.attributes.application.name},{href:"/version/"+t.attributes.id,title:"Version "+t.attributes.version},{href:window.location.pathname,title:i.jobActionMap[n]}]),i.setMainView(new D({job_id:r,el:e(".mainarea",i.currentPage),finishedCallback:function(e,n){var r=i.context.workspaces.get(t.attributes.workspace.id);r.applications.fetch()}}))})},serviceExport:function(n){function i(t){r.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+t.attributes.workspace.id+"/applications",title:t.attributes.workspace.name},{href:"/application/"+t.attributes.application.id,title:t.attributes.application.name},{href:"/application/"+t.attributes.application.id+"/services",title:"Services"},{href:"/service/export/"+n,title:"Export service "+t.attributes.name}]),r.setMainView(new q({el:e(".mainarea",r.currentPage),model:t}))}this.ensureVisible("workspaces"),this.setMainView(new b({el:e(".mainarea",this.currentPage)})),this.breadcrumbs([{href:"#",title:"Loading..."}]);var r=this,s=new l({id:n});s.url="/service/export/"+n+"?format=json",s.fetch({success:function(e,t,n){i(e)},error:t.bind(this.currentMainView.loadingError,this.currentMainView)})},serviceImport:function(n){function i(t){r.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+t.attributes.workspace.id+"/applications",title:t.attributes.workspace.name},{href:"/application/"+t.attributes.application.id,title:t.attributes.application.name},{href:"/application/"+t.attributes.application.id+"/services",title:"Services"},{href:"/service/import/"+n,title:"Import service "+t.attributes.name}]),r.setMainView(new R({el:e(".mainarea",r.currentPage),model:t}))}this.ensureVisible("workspaces"),this.setMainView(new b({el:e(".mainarea",this.currentPage)})),this.breadcrumbs([{href:"#",title:"Loading..."}]);var r=this,s=new l({id:n});s.url="/service/import/"+n+"?format=json",s.fetch({success:function(e,t,n){i(e)},error:t.bind(this.currentMainView.loadingError,this.currentMainView)})},serviceImportJob:function(n,r){function s(t){i.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+t.attributes.workspace.id+"/applications",title:t.attributes.workspace.name},{href:"/application/"+t.attributes.application.id,title:t.attributes.application.name},{href:"/application/"+t.attributes.application.id+"/services",title:"Services"},{href:"/service/import/"+n,title:"Import service "+t.attributes.name},{href:"#",title:"Import Status"}]),i.setMainView(new D({job_id:r,el:e(".mainarea",i.currentPage),title:"Import Status"}))}this.ensureVisible("workspaces"),this.setMainView(new b({el:e(".mainarea",this.currentPage)})),this.breadcrumbs([{href:"#",title:"Loading..."}]);var i=this,o=new l({id:n});o.url="/service/import/"+n+"?format=json",o.fetch({success:function(e,t,n){s(e)},error:t.bind(this.currentMainView.loadingError,this.currentMainView)})},nodeList:function(){this.ensureVisible("nodes"),this.setMainView(new c({collection:this.context.nodes,el:e(".mainarea",U.nodes)})),this.context.nodes.fetch(),this.context.nodes.invoke("set",{active:!1}),this.breadcrumbs([{href:"/node/list",title:"Nodes"}]),this.currentMainView.render(),this.currentMainView.startLoadingFull()},nodeDetail:function(t){this.ensureVisible("nodes");var n=this;this.fromCollectionOrServer(t,this.context.nodes,i,function(r){r.set({active:!0}),n.breadcrumbs([{href:"/node/list",title:"Nodes"},{href:"/node/"+t,title:r.attributes.name}]),n.setMainView(new d({model:r,el:e(".mainarea",U.nodes)}))})},nodeLogView:function(t,n){this.ensureVisible("nodes");var r=this;this.fromCollectionOrServer(t,this.context.nodes,i,function(i){r.breadcrumbs([{href:"/node/list",title:"Nodes"},{href:"/node/"+t,title:i.attributes.name},{href:"#",title:"Log View"}]),r.setMainView(new I({el:e(".mainarea",U.nodes),job_id:n,title:"View log"}))})},administrationList:function(){this.ensureVisible("administration"),this.context.administrations.invoke("set",{active:!1}),this.breadcrumbs([{href:"/administration/list",title:"Administration"}]),this.setMainView(new g({collection:this.context.administrations,el:e(".mainarea",U.administration)}))},yourProfile:function(){this.ensureVisible("administration"),this.breadcrumbs([{href:"/administration/list",title:"Administration"},{href:"/profile",title:"Your Profile"}]),this.adminSetActive(),this.setMainView(new m({el:e(".mainarea",U.administration)}));var t=this;e.getJSON("/profile?format=json",function(e){t.currentMainView.render(e.data.apikey)})},userList:function(){this.ensureVisible("administration"),this.adminSetActive(),this.setMainView(new y({collection:this.context.users,el:e(".mainarea",U.administration)})),this.context.users.fetch(),this.breadcrumbs([{href:"/administration/list",title:"Administration"},{href:"/user/list",title:"Users"}]),this.currentMainView.render(),this.context.users.models.length==0?this.currentMainView.startLoadingFull():this.currentMainView.startLoadingInline()},userEdit:function(n){function i(t){var i=[{href:"/administration/list",title:"Administration"},{href:"/user/list",title:"Users"}];t?i.push({href:"/user/"+n,title:"Edit user "+t.attributes.name}):i.push({href:"/user/create",title:"Create user"}),r.breadcrumbs(i),r.setMainView(new w({model:t,el:e(".mainarea",U.administration)}))}this.ensureVisible("administration"),this.adminSetActive("/user/list");var r=this;if(n){this.setMainView(new b({el:e(".mainarea",U.administration)})),this.breadcrumbs([{href:"/administration/list",title:"Administration"},{href:"/user/list",title:"Users"},{href:"#",title:"Loading user "+n+"..."}]);var o=new s({id:n});o.fetch({success:function(e,t,n){i(e)},error:t.bind(this.currentMainView.loadingError,this.currentMainView)})}else i()},roleList:function(){this.ensureVisible("administration"),this.adminSetActive(),this.setMainView(new E({collection:this.context.roles,el:e(".mainarea",U.administration)})),this.context.roles.fetch(),this.breadcrumbs([{href:"/administration/list",title:"Administration"},{href:"/role/list",title:"Role List"}]),this.currentMainView.render(),this.context.roles.models.length==0?this.currentMainView.startLoadingFull():this.currentMainView.startLoadingInline()},roleEdit:function(n){function i(t){var i=[{href:"/administration/list",title:"Administration"},{href:"/role/list",title:"Roles"}];t?i.push({href:"/role/"+n,title:"Edit Role "+t.attributes.name}):i.push({href:"/role/create",title:"Create role"}),r.breadcrumbs(i),r.setMainView(new S({model:t,el:e(".mainarea",U.administration)}))}this.ensureVisible("administration"),this.adminSetActive("/role/list");var r=this;if(n){this.setMainView(new b({el:e(".mainarea",U.administration)})),this.breadcrumbs([{href:"/administration/list",title:"Administration"},{href:"/role/list",title:"Roles"},{href:"#",title:"Loading role "+n+"..."}]);var s=new o({id:n});s.fetch({success:function(e,t,n){i(e)},error:t.bind(this.currentMainView.loadingError,this.currentMainView)})}else i()},roleAllocationList:function(){this.ensureVisible("administration"),this.adminSetActive(),this.setMainView(new x({collection:this.context.roleallocations,el:e(".mainarea",U.administration)})),this.context.roleallocations.fetch(),this.breadcrumbs([{href:"/administration/list",title:"Administration"},{href:"/role/allocation/list",title:"Role Allocations"}]),this.currentMainView.render(),this.context.roleallocations.models.length==0?this.currentMainView.startLoadingFull():this.currentMainView.startLoadingInline()},roleAllocationAssign:function(){this.ensureVisible("administration"),this.adminSetActive("/role/allocation/list"),this.breadcrumbs([{href:"/administration/list",title:"Administration"},{href:"/role/allocation/list",title:"Role Allocations"},{href:"/role/allocation/assign",title:"Assign Role"}]),this.setMainView(new T({el:e(".mainarea",U.administration)})),this.currentMainView.render(),this.context.roles.fetch(),this.context.users.fetch(),this.context.workspaces.fetch()},adminHealthJobs:function(){this.ensureVisible("administration"),this.adminSetActive("/job/list/health"),this.breadcrumbs([{href:"/administration/list",title:"Administration"},{href:"/job/list/health",title:"Health Checks"}]),this.genericJobsListPage("/job/list/health?format=json","Health Checks")},adminPeriodicJobs:function(){this.ensureVisible("administration"),this.adminSetActive("/job/list/periodic"),this.breadcrumbs([{href:"/administration/list",title:"Administration"},{href:"/job/list/periodic",title:"Periodic Tasks"}]),this.genericJobsListPage("/job/list/periodic?format=json","Periodic Tasks")},adminRouterDump:function(){this.ensureVisible("administration"),this.adminSetActive(),this.breadcrumbs([{href:"/administration/list",title:"Administration"},{href:"/router/dump",title:"Router Dump"}]),this.genericDataTemplatePage("/router/dump?format=json",C)},adminConfigurationDump:function(){this.ensureVisible("administration"),this.adminSetActive(),this.breadcrumbs([{href:"/administration/list",title:"Administration"},{href:"/configuration/dump",title:"Configuration Dump"}]),this.genericDataTemplatePage("/configuration/dump?format=json",k)},adminPluginsDump:function(){this.ensureVisible("administration"),this.adminSetActive(),this.breadcrumbs([{href:"/administration/list",title:"Administration"},{href:"/configuration/plugins",title:"Plugins"}]),this.genericDataTemplatePage("/configuration/plugins?format=json",L)},defaultAction:function(e,t){this.ensureVisible("404")}});return W}),define("models/administration",["underscore","backbone"],function(e,t){var n=t.Model.extend({defaults:{name:"none",path:"/none",active:!1}});return n}),define("collections/administrations",["underscore","backbone","models/administration"],function(e,t,n){var r=t.Collection.extend({model:n});return r}),define("app",["jquery","underscore","backbone","context","router","collections/administrations"],function(e,t,n,r,i,s){var o={};return o.initialize=function(){r.initialize(),r.router=new i,r.router.context=r,r.router.initialize();var t=e(".brand .connected"),o=t.attr("src"),u=e(".brand .disconnected").attr("src");t.attr("src",u),r.streamSocket=new io.connect(window.location.protocol+"//"+window.location.host,{"connect timeout":1e4}),r.streamSocket.on("connect",function(){t.attr("src",o)}),r.streamSocket.on("disconnect",function(){t.attr("src",u),r.streamSocket.socket.reconnect()}),n.emulateHTTP=!0;var a=n.sync;n.sync=function(e,t,n){if(e==="create"||e==="update"){n.attrs={data:t.toJSON(n)};var r=n.success;n.success=function(e,t,i){e.errors&&e.errors.length>0?n.error&&n.error(e,t,n):r&&r(e,t,n)}}a(e,t,n)},e(".navbar .brand, .navbar .nav-collapse a.virtual").click(function(t){if(t.which!=2){var n=e(this);r.navigate(n.attr("href")),e(".nav-collapse").css("height","0px"),t.preventDefault()}else t.stopPropagation()}),r.administrations=new s,r.administrations.add([{name:"Your Profile",path:"/profile"}]),r.hasPermission("USER_LIST")&&r.administrations.add([{name:"Users",path:"/user/list"}]),r.hasPermission("ROLE_LIST")&&r.administrations.add([{name:"Roles",path:"/role/list"}]),r.hasPermission("ROLE_ASSIGN")&&r.administrations.add([{name:"Role Allocations",path:"/role/allocation/list"}]),r.hasPermission("HEALTH_CHECK")&&r.administrations.add([{name:"Health Checks",path:"/job/list/health"}]),r.hasPermission("SYSTEM_ADMINISTRATION")&&r.administrations.add([{name:"Periodic Tasks",path:"/job/list/periodic"},{name:"Router Table Dump",path:"/router/dump"},{name:"System Configuration",path:"/configuration/dump"},{name:"Plugins",path:"/configuration/plugins"}]),e(".page-loading").fadeOut(),e("#page-container").fadeIn(),n.history.start({pushState:!0})},o}),require.config({paths:{jquery:"libs/jquery/jquery",underscore:"libs/underscore/underscore",backbone:"libs/backbone/backbone","jquery.bootstrap":"libs/bootstrap/bootstrap","flot.pie":"libs/flot/flot.pie",flot:"libs/flot/flot",jsoneditor:"libs/jsoneditor/jsoneditor",moment:"libs/moment/moment",socketio:"libs/socket.io/socket.io",resumable:"libs/resumable/resumable",plugin:"/plugin"},shim:{"jquery.bootstrap":{deps:["jquery"],exports:"jquery"},flot:{deps:["jquery"],exports:"jquery"},"flot.pie":{deps:["flot"],exports:"jquery"},jsoneditor:{deps:["jquery"],exports:"jquery"},socketio:{exports:"io"}}}),require(["jquery","jquery.bootstrap","flot","flot.pie","jsoneditor","app","resumable","socketio"],function(e,t,n,r,i,s,o,u){s.initialize()}),define("main",function(){});
\ No newline at end of file
+(function(e,t){function P(e){var t=e.length,n=b.type(e);return b.isWindow(e)?!1:1===e.nodeType&&t?!0:"array"===n||"function"!==n&&(0===t||"number"==typeof t&&t>0&&t-1 in e)}function B(e){var t=H[e]={};return b.each(e.match(E)||[],function(e,n){t[n]=!0}),t}function I(e,n,r,i){if(b.acceptData(e)){var s,o,u=b.expando,a="string"==typeof n,f=e.nodeType,c=f?b.cache:e,h=f?e[u]:e[u]&&u;if(h&&c[h]&&(i||c[h].data)||!a||r!==t)return h||(f?e[u]=h=l.pop()||b.guid++:h=u),c[h]||(c[h]={},f||(c[h].toJSON=b.noop)),("object"==typeof n||"function"==typeof n)&&(i?c[h]=b.extend(c[h],n):c[h].data=b.extend(c[h].data,n)),s=c[h],i||(s.data||(s.data={}),s=s.data),r!==t&&(s[b.camelCase(n)]=r),a?(o=s[n],null==o&&(o=s[b.camelCase(n)])):o=s,o}}function q(e,t,n){if(b.acceptData(e)){var r,i,s,o=e.nodeType,u=o?b.cache:e,a=o?e[b.expando]:b.expando;if(u[a]){if(t&&(s=n?u[a]:u[a].data)){b.isArray(t)?t=t.concat(b.map(t,b.camelCase)):t in s?t=[t]:(t=b.camelCase(t),t=t in s?[t]:t.split(" "));for(r=0,i=t.length;i>r;r++)delete s[t[r]];if(!(n?U:b.isEmptyObject)(s))return}(n||(delete u[a].data,U(u[a])))&&(o?b.cleanData([e],!0):b.support.deleteExpando||u!=u.window?delete u[a]:u[a]=null)}}}function R(e,n,r){if(r===t&&1===e.nodeType){var i="data-"+n.replace(F,"-$1").toLowerCase();if(r=e.getAttribute(i),"string"==typeof r){try{r="true"===r?!0:"false"===r?!1:"null"===r?null:+r+""===r?+r:j.test(r)?b.parseJSON(r):r}catch(s){}b.data(e,n,r)}else r=t}return r}function U(e){var t;for(t in e)if(("data"!==t||!b.isEmptyObject(e[t]))&&"toJSON"!==t)return!1;return!0}function it(){return!0}function st(){return!1}function ct(e,t){do e=e[t];while(e&&1!==e.nodeType);return e}function ht(e,t,n){if(t=t||0,b.isFunction(t))return b.grep(e,function(e,r){var i=!!t.call(e,r,e);return i===n});if(t.nodeType)return b.grep(e,function(e){return e===t===n});if("string"==typeof t){var r=b.grep(e,function(e){return 1===e.nodeType});if(at.test(t))return b.filter(t,r,!n);t=b.filter(t,r)}return b.grep(e,function(e){return b.inArray(e,t)>=0===n})}function pt(e){var t=dt.split("|"),n=e.createDocumentFragment();if(n.createElement)while(t.length)n.createElement(t.pop());return n}function Mt(e,t){return e.getElementsByTagName(t)[0]||e.appendChild(e.ownerDocument.createElement(t))}function _t(e){var t=e.getAttributeNode("type");return e.type=(t&&t.specified)+"/"+e.type,e}function Dt(e){var t=Ct.exec(e.type);return t?e.type=t[1]:e.removeAttribute("type"),e}function Pt(e,t){var n,r=0;for(;null!=(n=e[r]);r++)b._data(n,"globalEval",!t||b._data(t[r],"globalEval"))}function Ht(e,t){if(1===t.nodeType&&b.hasData(e)){var n,r,i,s=b._data(e),o=b._data(t,s),u=s.events;if(u){delete o.handle,o.events={};for(n in u)for(r=0,i=u[n].length;i>r;r++)b.event.add(t,n,u[n][r])}o.data&&(o.data=b.extend({},o.data))}}function Bt(e,t){var n,r,i;if(1===t.nodeType){if(n=t.nodeName.toLowerCase(),!b.support.noCloneEvent&&t[b.expando]){i=b._data(t);for(r in i.events)b.removeEvent(t,r,i.handle);t.removeAttribute(b.expando)}"script"===n&&t.text!==e.text?(_t(t).text=e.text,Dt(t)):"object"===n?(t.parentNode&&(t.outerHTML=e.outerHTML),b.support.html5Clone&&e.innerHTML&&!b.trim(t.innerHTML)&&(t.innerHTML=e.innerHTML)):"input"===n&&xt.test(e.type)?(t.defaultChecked=t.checked=e.checked,t.value!==e.value&&(t.value=e.value)):"option"===n?t.defaultSelected=t.selected=e.defaultSelected:("input"===n||"textarea"===n)&&(t.defaultValue=e.defaultValue)}}function jt(e,n){var r,s,o=0,u=typeof e.getElementsByTagName!==i?e.getElementsByTagName(n||"*"):typeof e.querySelectorAll!==i?e.querySelectorAll(n||"*"):t;if(!u)for(u=[],r=e.childNodes||e;null!=(s=r[o]);o++)!n||b.nodeName(s,n)?u.push(s):b.merge(u,jt(s,n));return n===t||n&&b.nodeName(e,n)?b.merge([e],u):u}function Ft(e){xt.test(e.type)&&(e.defaultChecked=e.checked)}function tn(e,t){if(t in e)return t;var n=t.charAt(0).toUpperCase()+t.slice(1),r=t,i=en.length;while(i--)if(t=en[i]+n,t in e)return t;return r}function nn(e,t){return e=t||e,"none"===b.css(e,"display")||!b.contains(e.ownerDocument,e)}function rn(e,t){var n,r,i,s=[],o=0,u=e.length;for(;u>o;o++)r=e[o],r.style&&(s[o]=b._data(r,"olddisplay"),n=r.style.display,t?(s[o]||"none"!==n||(r.style.display=""),""===r.style.display&&nn(r)&&(s[o]=b._data(r,"olddisplay",an(r.nodeName)))):s[o]||(i=nn(r),(n&&"none"!==n||!i)&&b._data(r,"olddisplay",i?n:b.css(r,"display"))));for(o=0;u>o;o++)r=e[o],r.style&&(t&&"none"!==r.style.display&&""!==r.style.display||(r.style.display=t?s[o]||"":"none"));return e}function sn(e,t,n){var r=$t.exec(t);return r?Math.max(0,r[1]-(n||0))+(r[2]||"px"):t}function on(e,t,n,r,i){var s=n===(r?"border":"content")?4:"width"===t?1:0,o=0;for(;4>s;s+=2)"margin"===n&&(o+=b.css(e,n+Zt[s],!0,i)),r?("content"===n&&(o-=b.css(e,"padding"+Zt[s],!0,i)),"margin"!==n&&(o-=b.css(e,"border"+Zt[s]+"Width",!0,i))):(o+=b.css(e,"padding"+Zt[s],!0,i),"padding"!==n&&(o+=b.css(e,"border"+Zt[s]+"Width",!0,i)));return o}function un(e,t,n){var r=!0,i="width"===t?e.offsetWidth:e.offsetHeight,s=qt(e),o=b.support.boxSizing&&"border-box"===b.css(e,"boxSizing",!1,s);if(0>=i||null==i){if(i=Rt(e,t,s),(0>i||null==i)&&(i=e.style[t]),Jt.test(i))return i;r=o&&(b.support.boxSizingReliable||i===e.style[t]),i=parseFloat(i)||0}return i+on(e,t,n||(o?"border":"content"),r,s)+"px"}function an(e){var t=s,n=Qt[e];return n||(n=fn(e,t),"none"!==n&&n||(It=(It||b("<iframe frameborder='0' width='0' height='0'/>").css("cssText","display:block !important")).appendTo(t.documentElement),t=(It[0].contentWindow||It[0].contentDocument).document,t.write("<!doctype html><html><body>"),t.close(),n=fn(e,t),It.detach()),Qt[e]=n),n}function fn(e,t){var n=b(t.createElement(e)).appendTo(t.body),r=b.css(n[0],"display");return n.remove(),r}function vn(e,t,n,r){var i;if(b.isArray(t))b.each(t,function(t,i){n||cn.test(e)?r(e,i):vn(e+"["+("object"==typeof i?t:"")+"]",i,n,r)});else if(n||"object"!==b.type(t))r(e,t);else for(i in t)vn(e+"["+i+"]",t[i],n,r)}function _n(e){return function(t,n){"string"!=typeof t&&(n=t,t="*");var r,i=0,s=t.toLowerCase().match(E)||[];if(b.isFunction(n))while(r=s[i++])"+"===r[0]?(r=r.slice(1)||"*",(e[r]=e[r]||[]).unshift(n)):(e[r]=e[r]||[]).push(n)}}function Dn(e,n,r,i){function u(a){var f;return s[a]=!0,b.each(e[a]||[],function(e,a){var l=a(n,r,i);return"string"!=typeof l||o||s[l]?o?!(f=l):t:(n.dataTypes.unshift(l),u(l),!1)}),f}var s={},o=e===An;return u(n.dataTypes[0])||!s["*"]&&u("*")}function Pn(e,n){var r,i,s=b.ajaxSettings.flatOptions||{};for(i in n)n[i]!==t&&((s[i]?e:r||(r={}))[i]=n[i]);return r&&b.extend(!0,e,r),e}function Hn(e,n,r){var i,s,o,u,a=e.contents,f=e.dataTypes,l=e.responseFields;for(u in l)u in r&&(n[l[u]]=r[u]);while("*"===f[0])f.shift(),s===t&&(s=e.mimeType||n.getResponseHeader("Content-Type"));if(s)for(u in a)if(a[u]&&a[u].test(s)){f.unshift(u);break}if(f[0]in r)o=f[0];else{for(u in r){if(!f[0]||e.converters[u+" "+f[0]]){o=u;break}i||(i=u)}o=o||i}return o?(o!==f[0]&&f.unshift(o),r[o]):t}function Bn(e,t){var n,r,i,s,o={},u=0,a=e.dataTypes.slice(),f=a[0];if(e.dataFilter&&(t=e.dataFilter(t,e.dataType)),a[1])for(i in e.converters)o[i.toLowerCase()]=e.converters[i];for(;r=a[++u];)if("*"!==r){if("*"!==f&&f!==r){if(i=o[f+" "+r]||o["* "+r],!i)for(n in o)if(s=n.split(" "),s[1]===r&&(i=o[f+" "+s[0]]||o["* "+s[0]])){i===!0?i=o[n]:o[n]!==!0&&(r=s[0],a.splice(u--,0,r));break}if(i!==!0)if(i&&e["throws"])t=i(t);else try{t=i(t)}catch(l){return{state:"parsererror",error:i?l:"No conversion from "+f+" to "+r}}}f=r}return{state:"success",data:t}}function zn(){try{return new e.XMLHttpRequest}catch(t){}}function Wn(){try{return new e.ActiveXObject("Microsoft.XMLHTTP")}catch(t){}}function Yn(){return setTimeout(function(){Xn=t}),Xn=b.now()}function Zn(e,t){b.each(t,function(t,n){var r=(Gn[t]||[]).concat(Gn["*"]),i=0,s=r.length;for(;s>i;i++)if(r[i].call(e,t,n))return})}function er(e,t,n){var r,i,s=0,o=Qn.length,u=b.Deferred().always(function(){delete a.elem}),a=function(){if(i)return!1;var t=Xn||Yn(),n=Math.max(0,f.startTime+f.duration-t),r=n/f.duration||0,s=1-r,o=0,a=f.tweens.length;for(;a>o;o++)f.tweens[o].run(s);return u.notifyWith(e,[f,s,n]),1>s&&a?n:(u.resolveWith(e,[f]),!1)},f=u.promise({elem:e,props:b.extend({},t),opts:b.extend(!0,{specialEasing:{}},n),originalProperties:t,originalOptions:n,startTime:Xn||Yn(),duration:n.duration,tweens:[],createTween:function(t,n){var r=b.Tween(e,f.opts,t,n,f.opts.specialEasing[t]||f.opts.easing);return f.tweens.push(r),r},stop:function(t){var n=0,r=t?f.tweens.length:0;if(i)return this;for(i=!0;r>n;n++)f.tweens[n].run(1);return t?u.resolveWith(e,[f,t]):u.rejectWith(e,[f,t]),this}}),l=f.props;for(tr(l,f.opts.specialEasing);o>s;s++)if(r=Qn[s].call(f,e,l,f.opts))return r;return Zn(f,l),b.isFunction(f.opts.start)&&f.opts.start.call(e,f),b.fx.timer(b.extend(a,{elem:e,anim:f,queue:f.opts.queue})),f.progress(f.opts.progress).done(f.opts.done,f.opts.complete).fail(f.opts.fail).always(f.opts.always)}function tr(e,t){var n,r,i,s,o;for(i in e)if(r=b.camelCase(i),s=t[r],n=e[i],b.isArray(n)&&(s=n[1],n=e[i]=n[0]),i!==r&&(e[r]=n,delete e[i]),o=b.cssHooks[r],o&&"expand"in o){n=o.expand(n),delete e[r];for(i in n)i in e||(e[i]=n[i],t[i]=s)}else t[r]=s}function nr(e,t,n){var r,i,s,o,u,a,f,l,c,h=this,p=e.style,d={},v=[],m=e.nodeType&&nn(e);n.queue||(l=b._queueHooks(e,"fx"),null==l.unqueued&&(l.unqueued=0,c=l.empty.fire,l.empty.fire=function(){l.unqueued||c()}),l.unqueued++,h.always(function(){h.always(function(){l.unqueued--,b.queue(e,"fx").length||l.empty.fire()})})),1===e.nodeType&&("height"in t||"width"in t)&&(n.overflow=[p.overflow,p.overflowX,p.overflowY],"inline"===b.css(e,"display")&&"none"===b.css(e,"float")&&(b.support.inlineBlockNeedsLayout&&"inline"!==an(e.nodeName)?p.zoom=1:p.display="inline-block")),n.overflow&&(p.overflow="hidden",b.support.shrinkWrapBlocks||h.always(function(){p.overflow=n.overflow[0],p.overflowX=n.overflow[1],p.overflowY=n.overflow[2]}));for(i in t)if(o=t[i],$n.exec(o)){if(delete t[i],a=a||"toggle"===o,o===(m?"hide":"show"))continue;v.push(i)}if(s=v.length){u=b._data(e,"fxshow")||b._data(e,"fxshow",{}),"hidden"in u&&(m=u.hidden),a&&(u.hidden=!m),m?b(e).show():h.done(function(){b(e).hide()}),h.done(function(){var t;b._removeData(e,"fxshow");for(t in d)b.style(e,t,d[t])});for(i=0;s>i;i++)r=v[i],f=h.createTween(r,m?u[r]:0),d[r]=u[r]||b.style(e,r),r in u||(u[r]=f.start,m&&(f.end=f.start,f.start="width"===r||"height"===r?1:0))}}function rr(e,t,n,r,i){return new rr.prototype.init(e,t,n,r,i)}function ir(e,t){var n,r={height:e},i=0;for(t=t?1:0;4>i;i+=2-t)n=Zt[i],r["margin"+n]=r["padding"+n]=e;return t&&(r.opacity=r.width=e),r}function sr(e){return b.isWindow(e)?e:9===e.nodeType?e.defaultView||e.parentWindow:!1}var n,r,i=typeof t,s=e.document,o=e.location,u=e.jQuery,a=e.$,f={},l=[],c="1.9.1",h=l.concat,p=l.push,d=l.slice,v=l.indexOf,m=f.toString,g=f.hasOwnProperty,y=c.trim,b=function(e,t){return new b.fn.init(e,t,r)},w=/[+-]?(?:\d*\.|)\d+(?:[eE][+-]?\d+|)/.source,E=/\S+/g,S=/^[\s\uFEFF\xA0]+|[\s\uFEFF\xA0]+$/g,x=/^(?:(<[\w\W]+>)[^>]*|#([\w-]*))$/,T=/^<(\w+)\s*\/?>(?:<\/\1>|)$/,N=/^[\],:{}\s]*$/,C=/(?:^|:|,)(?:\s*\[)+/g,k=/\\(?:["\\\/bfnrt]|u[\da-fA-F]{4})/g,L=/"[^"\\\r\n]*"|true|false|null|-?(?:\d+\.|)\d+(?:[eE][+-]?\d+|)/g,A=/^-ms-/,O=/-([\da-z])/gi,M=function(e,t){return t.toUpperCase()},_=function(e){(s.addEventListener||"load"===e.type||"complete"===s.readyState)&&(D(),b.ready())},D=function(){s.addEventListener?(s.removeEventListener("DOMContentLoaded",_,!1),e.removeEventListener("load",_,!1)):(s.detachEvent("onreadystatechange",_),e.detachEvent("onload",_))};b.fn=b.prototype={jquery:c,constructor:b,init:function(e,n,r){var i,o;if(!e)return this;if("string"==typeof e){if(i="<"===e.charAt(0)&&">"===e.charAt(e.length-1)&&e.length>=3?[null,e,null]:x.exec(e),!i||!i[1]&&n)return!n||n.jquery?(n||r).find(e):this.constructor(n).find(e);if(i[1]){if(n=n instanceof b?n[0]:n,b.merge(this,b.parseHTML(i[1],n&&n.nodeType?n.ownerDocument||n:s,!0)),T.test(i[1])&&b.isPlainObject(n))for(i in n)b.isFunction(this[i])?this[i](n[i]):this.attr(i,n[i]);return this}if(o=s.getElementById(i[2]),o&&o.parentNode){if(o.id!==i[2])return r.find(e);this.length=1,this[0]=o}return this.context=s,this.selector=e,this}return e.nodeType?(this.context=this[0]=e,this.length=1,this):b.isFunction(e)?r.ready(e):(e.selector!==t&&(this.selector=e.selector,this.context=e.context),b.makeArray(e,this))},selector:"",length:0,size:function(){return this.length},toArray:function(){return d.call(this)},get:function(e){return null==e?this.toArray():0>e?this[this.length+e]:this[e]},pushStack:function(e){var t=b.merge(this.constructor(),e);return t.prevObject=this,t.context=this.context,t},each:function(e,t){return b.each(this,e,t)},ready:function(e){return b.ready.promise().done(e),this},slice:function(){return this.pushStack(d.apply(this,arguments))},first:function(){return this.eq(0)},last:function(){return this.eq(-1)},eq:function(e){var t=this.length,n=+e+(0>e?t:0);return this.pushStack(n>=0&&t>n?[this[n]]:[])},map:function(e){return this.pushStack(b.map(this,function(t,n){return e.call(t,n,t)}))},end:function(){return this.prevObject||this.constructor(null)},push:p,sort:[].sort,splice:[].splice},b.fn.init.prototype=b.fn,b.extend=b.fn.extend=function(){var e,n,r,i,s,o,u=arguments[0]||{},a=1,f=arguments.length,l=!1;for("boolean"==typeof u&&(l=u,u=arguments[1]||{},a=2),"object"==typeof u||b.isFunction(u)||(u={}),f===a&&(u=this,--a);f>a;a++)if(null!=(s=arguments[a]))for(i in s)e=u[i],r=s[i],u!==r&&(l&&r&&(b.isPlainObject(r)||(n=b.isArray(r)))?(n?(n=!1,o=e&&b.isArray(e)?e:[]):o=e&&b.isPlainObject(e)?e:{},u[i]=b.extend(l,o,r)):r!==t&&(u[i]=r));return u},b.extend({noConflict:function(t){return e.$===b&&(e.$=a),t&&e.jQuery===b&&(e.jQuery=u),b},isReady:!1,readyWait:1,holdReady:function(e){e?b.readyWait++:b.ready(!0)},ready:function(e){if(e===!0?!--b.readyWait:!b.isReady){if(!s.body)return setTimeout(b.ready);b.isReady=!0,e!==!0&&--b.readyWait>0||(n.resolveWith(s,[b]),b.fn.trigger&&b(s).trigger("ready").off("ready"))}},isFunction:function(e){return"function"===b.type(e)},isArray:Array.isArray||function(e){return"array"===b.type(e)},isWindow:function(e){return null!=e&&e==e.window},isNumeric:function(e){return!isNaN(parseFloat(e))&&isFinite(e)},type:function(e){return null==e?e+"":"object"==typeof e||"function"==typeof e?f[m.call(e)]||"object":typeof e},isPlainObject:function(e){if(!e||"object"!==b.type(e)||e.nodeType||b.isWindow(e))return!1;try{if(e.constructor&&!g.call(e,"constructor")&&!g.call(e.constructor.prototype,"isPrototypeOf"))return!1}catch(n){return!1}var r;for(r in e);return r===t||g.call(e,r)},isEmptyObject:function(e){var t;for(t in e)return!1;return!0},error:function(e){throw Error(e)},parseHTML:function(e,t,n){if(!e||"string"!=typeof e)return null;"boolean"==typeof t&&(n=t,t=!1),t=t||s;var r=T.exec(e),i=!n&&[];return r?[t.createElement(r[1])]:(r=b.buildFragment([e],t,i),i&&b(i).remove(),b.merge([],r.childNodes))},parseJSON:function(n){return e.JSON&&e.JSON.parse?e.JSON.parse(n):null===n?n:"string"==typeof n&&(n=b.trim(n),n&&N.test(n.replace(k,"@").replace(L,"]").replace(C,"")))?Function("return "+n)():(b.error("Invalid JSON: "+n),t)},parseXML:function(n){var r,i;if(!n||"string"!=typeof n)return null;try{e.DOMParser?(i=new DOMParser,r=i.parseFromString(n,"text/xml")):(r=new ActiveXObject("Microsoft.XMLDOM"),r.async="false",r.loadXML(n))}catch(s){r=t}return r&&r.documentElement&&!r.getElementsByTagName("parsererror").length||b.error("Invalid XML: "+n),r},noop:function(){},globalEval:function(t){t&&b.trim(t)&&(e.execScript||function(t){e.eval.call(e,t)})(t)},camelCase:function(e){return e.replace(A,"ms-").replace(O,M)},nodeName:function(e,t){return e.nodeName&&e.nodeName.toLowerCase()===t.toLowerCase()},each:function(e,t,n){var r,i=0,s=e.length,o=P(e);if(n){if(o){for(;s>i;i++)if(r=t.apply(e[i],n),r===!1)break}else for(i in e)if(r=t.apply(e[i],n),r===!1)break}else if(o){for(;s>i;i++)if(r=t.call(e[i],i,e[i]),r===!1)break}else for(i in e)if(r=t.call(e[i],i,e[i]),r===!1)break;return e},trim:y&&!y.call("﻿ ")?function(e){return null==e?"":y.call(e)}:function(e){return null==e?"":(e+"").replace(S,"")},makeArray:function(e,t){var n=t||[];return null!=e&&(P(Object(e))?b.merge(n,"string"==typeof e?[e]:e):p.call(n,e)),n},inArray:function(e,t,n){var r;if(t){if(v)return v.call(t,e,n);for(r=t.length,n=n?0>n?Math.max(0,r+n):n:0;r>n;n++)if(n in t&&t[n]===e)return n}return-1},merge:function(e,n){var r=n.length,i=e.length,s=0;if("number"==typeof r)for(;r>s;s++)e[i++]=n[s];else while(n[s]!==t)e[i++]=n[s++];return e.length=i,e},grep:function(e,t,n){var r,i=[],s=0,o=e.length;for(n=!!n;o>s;s++)r=!!t(e[s],s),n!==r&&i.push(e[s]);return i},map:function(e,t,n){var r,i=0,s=e.length,o=P(e),u=[];if(o)for(;s>i;i++)r=t(e[i],i,n),null!=r&&(u[u.length]=r);else for(i in e)r=t(e[i],i,n),null!=r&&(u[u.length]=r);return h.apply([],u)},guid:1,proxy:function(e,n){var r,i,s;return"string"==typeof n&&(s=e[n],n=e,e=s),b.isFunction(e)?(r=d.call(arguments,2),i=function(){return e.apply(n||this,r.concat(d.call(arguments)))},i.guid=e.guid=e.guid||b.guid++,i):t},access:function(e,n,r,i,s,o,u){var a=0,f=e.length,l=null==r;if("object"===b.type(r)){s=!0;for(a in r)b.access(e,n,a,r[a],!0,o,u)}else if(i!==t&&(s=!0,b.isFunction(i)||(u=!0),l&&(u?(n.call(e,i),n=null):(l=n,n=function(e,t,n){return l.call(b(e),n)})),n))for(;f>a;a++)n(e[a],r,u?i:i.call(e[a],a,n(e[a],r)));return s?e:l?n.call(e):f?n(e[0],r):o},now:function(){return(new Date).getTime()}}),b.ready.promise=function(t){if(!n)if(n=b.Deferred(),"complete"===s.readyState)setTimeout(b.ready);else if(s.addEventListener)s.addEventListener("DOMContentLoaded",_,!1),e.addEventListener("load",_,!1);else{s.attachEvent("onreadystatechange",_),e.attachEvent("onload",_);var r=!1;try{r=null==e.frameElement&&s.documentElement}catch(i){}r&&r.doScroll&&function o(){if(!b.isReady){try{r.doScroll("left")}catch(e){return setTimeout(o,50)}D(),b.ready()}}()}return n.promise(t)},b.each("Boolean Number String Function Array Date RegExp Object Error".split(" "),function(e,t){f["[object "+t+"]"]=t.toLowerCase()}),r=b(s);var H={};b.Callbacks=function(e){e="string"==typeof e?H[e]||B(e):b.extend({},e);var n,r,i,s,o,u,a=[],f=!e.once&&[],l=function(t){for(r=e.memory&&t,i=!0,o=u||0,u=0,s=a.length,n=!0;a&&s>o;o++)if(a[o].apply(t[0],t[1])===!1&&e.stopOnFalse){r=!1;break}n=!1,a&&(f?f.length&&l(f.shift()):r?a=[]:c.disable())},c={add:function(){if(a){var t=a.length;(function i(t){b.each(t,function(t,n){var r=b.type(n);"function"===r?e.unique&&c.has(n)||a.push(n):n&&n.length&&"string"!==r&&i(n)})})(arguments),n?s=a.length:r&&(u=t,l(r))}return this},remove:function(){return a&&b.each(arguments,function(e,t){var r;while((r=b.inArray(t,a,r))>-1)a.splice(r,1),n&&(s>=r&&s--,o>=r&&o--)}),this},has:function(e){return e?b.inArray(e,a)>-1:!!a&&!!a.length},empty:function(){return a=[],this},disable:function(){return a=f=r=t,this},disabled:function(){return!a},lock:function(){return f=t,r||c.disable(),this},locked:function(){return!f},fireWith:function(e,t){return t=t||[],t=[e,t.slice?t.slice():t],!a||i&&!f||(n?f.push(t):l(t)),this},fire:function(){return c.fireWith(this,arguments),this},fired:function(){return!!i}};return c},b.extend({Deferred:function(e){var t=[["resolve","done",b.Callbacks("once memory"),"resolved"],["reject","fail",b.Callbacks("once memory"),"rejected"],["notify","progress",b.Callbacks("memory")]],n="pending",r={state:function(){return n},always:function(){return i.done(arguments).fail(arguments),this},then:function(){var e=arguments;return b.Deferred(function(n){b.each(t,function(t,s){var o=s[0],u=b.isFunction(e[t])&&e[t];i[s[1]](function(){var e=u&&u.apply(this,arguments);e&&b.isFunction(e.promise)?e.promise().done(n.resolve).fail(n.reject).progress(n.notify):n[o+"With"](this===r?n.promise():this,u?[e]:arguments)})}),e=null}).promise()},promise:function(e){return null!=e?b.extend(e,r):r}},i={};return r.pipe=r.then,b.each(t,function(e,s){var o=s[2],u=s[3];r[s[1]]=o.add,u&&o.add(function(){n=u},t[1^e][2].disable,t[2][2].lock),i[s[0]]=function(){return i[s[0]+"With"](this===i?r:this,arguments),this},i[s[0]+"With"]=o.fireWith}),r.promise(i),e&&e.call(i,i),i},when:function(e){var t=0,n=d.call(arguments),r=n.length,i=1!==r||e&&b.isFunction(e.promise)?r:0,s=1===i?e:b.Deferred(),o=function(e,t,n){return function(r){t[e]=this,n[e]=arguments.length>1?d.call(arguments):r,n===u?s.notifyWith(t,n):--i||s.resolveWith(t,n)}},u,a,f;if(r>1)for(u=Array(r),a=Array(r),f=Array(r);r>t;t++)n[t]&&b.isFunction(n[t].promise)?n[t].promise().done(o(t,f,n)).fail(s.reject).progress(o(t,a,u)):--i;return i||s.resolveWith(f,n),s.promise()}}),b.support=function(){var t,n,r,o,u,a,f,l,c,h,p=s.createElement("div");if(p.setAttribute("className","t"),p.innerHTML="  <link/><table></table><a href='/a'>a</a><input type='checkbox'/>",n=p.getElementsByTagName("*"),r=p.getElementsByTagName("a")[0],!n||!r||!n.length)return{};u=s.createElement("select"),f=u.appendChild(s.createElement("option")),o=p.getElementsByTagName("input")[0],r.style.cssText="top:1px;float:left;opacity:.5",t={getSetAttribute:"t"!==p.className,leadingWhitespace:3===p.firstChild.nodeType,tbody:!p.getElementsByTagName("tbody").length,htmlSerialize:!!p.getElementsByTagName("link").length,style:/top/.test(r.getAttribute("style")),hrefNormalized:"/a"===r.getAttribute("href"),opacity:/^0.5/.test(r.style.opacity),cssFloat:!!r.style.cssFloat,checkOn:!!o.value,optSelected:f.selected,enctype:!!s.createElement("form").enctype,html5Clone:"<:nav></:nav>"!==s.createElement("nav").cloneNode(!0).outerHTML,boxModel:"CSS1Compat"===s.compatMode,deleteExpando:!0,noCloneEvent:!0,inlineBlockNeedsLayout:!1,shrinkWrapBlocks:!1,reliableMarginRight:!0,boxSizingReliable:!0,pixelPosition:!1},o.checked=!0,t.noCloneChecked=o.cloneNode(!0).checked,u.disabled=!0,t.optDisabled=!f.disabled;try{delete p.test}catch(d){t.deleteExpando=!1}o=s.createElement("input"),o.setAttribute("value",""),t.input=""===o.getAttribute("value"),o.value="t",o.setAttribute("type","radio"),t.radioValue="t"===o.value,o.setAttribute("checked","t"),o.setAttribute("name","t"),a=s.createDocumentFragment(),a.appendChild(o),t.appendChecked=o.checked,t.checkClone=a.cloneNode(!0).cloneNode(!0).lastChild.checked,p.attachEvent&&(p.attachEvent("onclick",function(){t.noCloneEvent=!1}),p.cloneNode(!0).click());for(h in{submit:!0,change:!0,focusin:!0})p.setAttribute(l="on"+h,"t"),t[h+"Bubbles"]=l in e||p.attributes[l].expando===!1;return p.style.backgroundClip="content-box",p.cloneNode(!0).style.backgroundClip="",t.clearCloneStyle="content-box"===p.style.backgroundClip,b(function(){var n,r,o,u="padding:0;margin:0;border:0;display:block;box-sizing:content-box;-moz-box-sizing:content-box;-webkit-box-sizing:content-box;",a=s.getElementsByTagName("body")[0];a&&(n=s.createElement("div"),n.style.cssText="border:0;width:0;height:0;position:absolute;top:0;left:-9999px;margin-top:1px",a.appendChild(n).appendChild(p),p.innerHTML="<table><tr><td></td><td>t</td></tr></table>",o=p.getElementsByTagName("td"),o[0].style.cssText="padding:0;margin:0;border:0;display:none",c=0===o[0].offsetHeight,o[0].style.display="",o[1].style.display="none",t.reliableHiddenOffsets=c&&0===o[0].offsetHeight,p.innerHTML="",p.style.cssText="box-sizing:border-box;-moz-box-sizing:border-box;-webkit-box-sizing:border-box;padding:1px;border:1px;display:block;width:4px;margin-top:1%;position:absolute;top:1%;",t.boxSizing=4===p.offsetWidth,t.doesNotIncludeMarginInBodyOffset=1!==a.offsetTop,e.getComputedStyle&&(t.pixelPosition="1%"!==(e.getComputedStyle(p,null)||{}).top,t.boxSizingReliable="4px"===(e.getComputedStyle(p,null)||{width:"4px"}).width,r=p.appendChild(s.createElement("div")),r.style.cssText=p.style.cssText=u,r.style.marginRight=r.style.width="0",p.style.width="1px",t.reliableMarginRight=!parseFloat((e.getComputedStyle(r,null)||{}).marginRight)),typeof p.style.zoom!==i&&(p.innerHTML="",p.style.cssText=u+"width:1px;padding:1px;display:inline;zoom:1",t.inlineBlockNeedsLayout=3===p.offsetWidth,p.style.display="block",p.innerHTML="<div></div>",p.firstChild.style.width="5px",t.shrinkWrapBlocks=3!==p.offsetWidth,t.inlineBlockNeedsLayout&&(a.style.zoom=1)),a.removeChild(n),n=p=o=r=null)}),n=u=a=f=r=o=null,t}();var j=/(?:\{[\s\S]*\}|\[[\s\S]*\])$/,F=/([A-Z])/g;b.extend({cache:{},expando:"jQuery"+(c+Math.random()).replace(/\D/g,""),noData:{embed:!0,object:"clsid:D27CDB6E-AE6D-11cf-96B8-444553540000",applet:!0},hasData:function(e){return e=e.nodeType?b.cache[e[b.expando]]:e[b.expando],!!e&&!U(e)},data:function(e,t,n){return I(e,t,n)},removeData:function(e,t){return q(e,t)},_data:function(e,t,n){return I(e,t,n,!0)},_removeData:function(e,t){return q(e,t,!0)},acceptData:function(e){if(e.nodeType&&1!==e.nodeType&&9!==e.nodeType)return!1;var t=e.nodeName&&b.noData[e.nodeName.toLowerCase()];return!t||t!==!0&&e.getAttribute("classid")===t}}),b.fn.extend({data:function(e,n){var r,i,s=this[0],o=0,u=null;if(e===t){if(this.length&&(u=b.data(s),1===s.nodeType&&!b._data(s,"parsedAttrs"))){for(r=s.attributes;r.length>o;o++)i=r[o].name,i.indexOf("data-")||(i=b.camelCase(i.slice(5)),R(s,i,u[i]));b._data(s,"parsedAttrs",!0)}return u}return"object"==typeof e?this.each(function(){b.data(this,e)}):b.access(this,function(n){return n===t?s?R(s,e,b.data(s,e)):null:(this.each(function(){b.data(this,e,n)}),t)},null,n,arguments.length>1,null,!0)},removeData:function(e){return this.each(function(){b.removeData(this,e)})}}),b.extend({queue:function(e,n,r){var i;return e?(n=(n||"fx")+"queue",i=b._data(e,n),r&&(!i||b.isArray(r)?i=b._data(e,n,b.makeArray(r)):i.push(r)),i||[]):t},dequeue:function(e,t){t=t||"fx";var n=b.queue(e,t),r=n.length,i=n.shift(),s=b._queueHooks(e,t),o=function(){b.dequeue(e,t)};"inprogress"===i&&(i=n.shift(),r--),s.cur=i,i&&("fx"===t&&n.unshift("inprogress"),delete s.stop,i.call(e,o,s)),!r&&s&&s.empty.fire()},_queueHooks:function(e,t){var n=t+"queueHooks";return b._data(e,n)||b._data(e,n,{empty:b.Callbacks("once memory").add(function(){b._removeData(e,t+"queue"),b._removeData(e,n)})})}}),b.fn.extend({queue:function(e,n){var r=2;return"string"!=typeof e&&(n=e,e="fx",r--),r>arguments.length?b.queue(this[0],e):n===t?this:this.each(function(){var t=b.queue(this,e,n);b._queueHooks(this,e),"fx"===e&&"inprogress"!==t[0]&&b.dequeue(this,e)})},dequeue:function(e){return this.each(function(){b.dequeue(this,e)})},delay:function(e,t){return e=b.fx?b.fx.speeds[e]||e:e,t=t||"fx",this.queue(t,function(t,n){var r=setTimeout(t,e);n.stop=function(){clearTimeout(r)}})},clearQueue:function(e){return this.queue(e||"fx",[])},promise:function(e,n){var r,i=1,s=b.Deferred(),o=this,u=this.length,a=function(){--i||s.resolveWith(o,[o])};"string"!=typeof e&&(n=e,e=t),e=e||"fx";while(u--)r=b._data(o[u],e+"queueHooks"),r&&r.empty&&(i++,r.empty.add(a));return a(),s.promise(n)}});var z,W,X=/[\t\r\n]/g,V=/\r/g,$=/^(?:input|select|textarea|button|object)$/i,J=/^(?:a|area)$/i,K=/^(?:checked|selected|autofocus|autoplay|async|controls|defer|disabled|hidden|loop|multiple|open|readonly|required|scoped)$/i,Q=/^(?:checked|selected)$/i,G=b.support.getSetAttribute,Y=b.support.input;b.fn.extend({attr:function(e,t){return b.access(this,b.attr,e,t,arguments.length>1)},removeAttr:function(e){return this.each(function(){b.removeAttr(this,e)})},prop:function(e,t){return b.access(this,b.prop,e,t,arguments.length>1)},removeProp:function(e){return e=b.propFix[e]||e,this.each(function(){try{this[e]=t,delete this[e]}catch(n){}})},addClass:function(e){var t,n,r,i,s,o=0,u=this.length,a="string"==typeof e&&e;if(b.isFunction(e))return this.each(function(t){b(this).addClass(e.call(this,t,this.className))});if(a)for(t=(e||"").match(E)||[];u>o;o++)if(n=this[o],r=1===n.nodeType&&(n.className?(" "+n.className+" ").replace(X," "):" ")){s=0;while(i=t[s++])0>r.indexOf(" "+i+" ")&&(r+=i+" ");n.className=b.trim(r)}return this},removeClass:function(e){var t,n,r,i,s,o=0,u=this.length,a=0===arguments.length||"string"==typeof e&&e;if(b.isFunction(e))return this.each(function(t){b(this).removeClass(e.call(this,t,this.className))});if(a)for(t=(e||"").match(E)||[];u>o;o++)if(n=this[o],r=1===n.nodeType&&(n.className?(" "+n.className+" ").replace(X," "):"")){s=0;while(i=t[s++])while(r.indexOf(" "+i+" ")>=0)r=r.replace(" "+i+" "," ");n.className=e?b.trim(r):""}return this},toggleClass:function(e,t){var n=typeof e,r="boolean"==typeof t;return b.isFunction(e)?this.each(function(n){b(this).toggleClass(e.call(this,n,this.className,t),t)}):this.each(function(){if("string"===n){var s,o=0,u=b(this),a=t,f=e.match(E)||[];while(s=f[o++])a=r?a:!u.hasClass(s),u[a?"addClass":"removeClass"](s)}else(n===i||"boolean"===n)&&(this.className&&b._data(this,"__className__",this.className),this.className=this.className||e===!1?"":b._data(this,"__className__")||"")})},hasClass:function(e){var t=" "+e+" ",n=0,r=this.length;for(;r>n;n++)if(1===this[n].nodeType&&(" "+this[n].className+" ").replace(X," ").indexOf(t)>=0)return!0;return!1},val:function(e){var n,r,i,s=this[0];if(arguments.length)return i=b.isFunction(e),this.each(function(n){var s,o=b(this);1===this.nodeType&&(s=i?e.call(this,n,o.val()):e,null==s?s="":"number"==typeof s?s+="":b.isArray(s)&&(s=b.map(s,function(e){return null==e?"":e+""})),r=b.valHooks[this.type]||b.valHooks[this.nodeName.toLowerCase()],r&&"set"in r&&r.set(this,s,"value")!==t||(this.value=s))});if(s)return r=b.valHooks[s.type]||b.valHooks[s.nodeName.toLowerCase()],r&&"get"in r&&(n=r.get(s,"value"))!==t?n:(n=s.value,"string"==typeof n?n.replace(V,""):null==n?"":n)}}),b.extend({valHooks:{option:{get:function(e){var t=e.attributes.value;return!t||t.specified?e.value:e.text}},select:{get:function(e){var t,n,r=e.options,i=e.selectedIndex,s="select-one"===e.type||0>i,o=s?null:[],u=s?i+1:r.length,a=0>i?u:s?i:0;for(;u>a;a++)if(n=r[a],!(!n.selected&&a!==i||(b.support.optDisabled?n.disabled:null!==n.getAttribute("disabled"))||n.parentNode.disabled&&b.nodeName(n.parentNode,"optgroup"))){if(t=b(n).val(),s)return t;o.push(t)}return o},set:function(e,t){var n=b.makeArray(t);return b(e).find("option").each(function(){this.selected=b.inArray(b(this).val(),n)>=0}),n.length||(e.selectedIndex=-1),n}}},attr:function(e,n,r){var s,o,u,a=e.nodeType;if(e&&3!==a&&8!==a&&2!==a)return typeof e.getAttribute===i?b.prop(e,n,r):(o=1!==a||!b.isXMLDoc(e),o&&(n=n.toLowerCase(),s=b.attrHooks[n]||(K.test(n)?W:z)),r===t?s&&o&&"get"in s&&null!==(u=s.get(e,n))?u:(typeof e.getAttribute!==i&&(u=e.getAttribute(n)),null==u?t:u):null!==r?s&&o&&"set"in s&&(u=s.set(e,r,n))!==t?u:(e.setAttribute(n,r+""),r):(b.removeAttr(e,n),t))},removeAttr:function(e,t){var n,r,i=0,s=t&&t.match(E);if(s&&1===e.nodeType)while(n=s[i++])r=b.propFix[n]||n,K.test(n)?!G&&Q.test(n)?e[b.camelCase("default-"+n)]=e[r]=!1:e[r]=!1:b.attr(e,n,""),e.removeAttribute(G?n:r)},attrHooks:{type:{set:function(e,t){if(!b.support.radioValue&&"radio"===t&&b.nodeName(e,"input")){var n=e.value;return e.setAttribute("type",t),n&&(e.value=n),t}}}},propFix:{tabindex:"tabIndex",readonly:"readOnly","for":"htmlFor","class":"className",maxlength:"maxLength",cellspacing:"cellSpacing",cellpadding:"cellPadding",rowspan:"rowSpan",colspan:"colSpan",usemap:"useMap",frameborder:"frameBorder",contenteditable:"contentEditable"},prop:function(e,n,r){var i,s,o,u=e.nodeType;if(e&&3!==u&&8!==u&&2!==u)return o=1!==u||!b.isXMLDoc(e),o&&(n=b.propFix[n]||n,s=b.propHooks[n]),r!==t?s&&"set"in s&&(i=s.set(e,r,n))!==t?i:e[n]=r:s&&"get"in s&&null!==(i=s.get(e,n))?i:e[n]},propHooks:{tabIndex:{get:function(e){var n=e.getAttributeNode("tabindex");return n&&n.specified?parseInt(n.value,10):$.test(e.nodeName)||J.test(e.nodeName)&&e.href?0:t}}}}),W={get:function(e,n){var r=b.prop(e,n),i="boolean"==typeof r&&e.getAttribute(n),s="boolean"==typeof r?Y&&G?null!=i:Q.test(n)?e[b.camelCase("default-"+n)]:!!i:e.getAttributeNode(n);return s&&s.value!==!1?n.toLowerCase():t},set:function(e,t,n){return t===!1?b.removeAttr(e,n):Y&&G||!Q.test(n)?e.setAttribute(!G&&b.propFix[n]||n,n):e[b.camelCase("default-"+n)]=e[n]=!0,n}},Y&&G||(b.attrHooks.value={get:function(e,n){var r=e.getAttributeNode(n);return b.nodeName(e,"input")?e.defaultValue:r&&r.specified?r.value:t},set:function(e,n,r){return b.nodeName(e,"input")?(e.defaultValue=n,t):z&&z.set(e,n,r)}}),G||(z=b.valHooks.button={get:function(e,n){var r=e.getAttributeNode(n);return r&&("id"===n||"name"===n||"coords"===n?""!==r.value:r.specified)?r.value:t},set:function(e,n,r){var i=e.getAttributeNode(r);return i||e.setAttributeNode(i=e.ownerDocument.createAttribute(r)),i.value=n+="","value"===r||n===e.getAttribute(r)?n:t}},b.attrHooks.contenteditable={get:z.get,set:function(e,t,n){z.set(e,""===t?!1:t,n)}},b.each(["width","height"],function(e,n){b.attrHooks[n]=b.extend(b.attrHooks[n],{set:function(e,r){return""===r?(e.setAttribute(n,"auto"),r):t}})})),b.support.hrefNormalized||(b.each(["href","src","width","height"],function(e,n){b.attrHooks[n]=b.extend(b.attrHooks[n],{get:function(e){var r=e.getAttribute(n,2);return null==r?t:r}})}),b.each(["href","src"],function(e,t){b.propHooks[t]={get:function(e){return e.getAttribute(t,4)}}})),b.support.style||(b.attrHooks.style={get:function(e){return e.style.cssText||t},set:function(e,t){return e.style.cssText=t+""}}),b.support.optSelected||(b.propHooks.selected=b.extend(b.propHooks.selected,{get:function(e){var t=e.parentNode;return t&&(t.selectedIndex,t.parentNode&&t.parentNode.selectedIndex),null}})),b.support.enctype||(b.propFix.enctype="encoding"),b.support.checkOn||b.each(["radio","checkbox"],function(){b.valHooks[this]={get:function(e){return null===e.getAttribute("value")?"on":e.value}}}),b.each(["radio","checkbox"],function(){b.valHooks[this]=b.extend(b.valHooks[this],{set:function(e,n){return b.isArray(n)?e.checked=b.inArray(b(e).val(),n)>=0:t}})});var Z=/^(?:input|select|textarea)$/i,et=/^key/,tt=/^(?:mouse|contextmenu)|click/,nt=/^(?:focusinfocus|focusoutblur)$/,rt=/^([^.]*)(?:\.(.+)|)$/;b.event={global:{},add:function(e,n,r,s,o){var u,a,f,l,c,h,p,d,v,m,g,y=b._data(e);if(y){r.handler&&(l=r,r=l.handler,o=l.selector),r.guid||(r.guid=b.guid++),(a=y.events)||(a=y.events={}),(h=y.handle)||(h=y.handle=function(e){return typeof b===i||e&&b.event.triggered===e.type?t:b.event.dispatch.apply(h.elem,arguments)},h.elem=e),n=(n||"").match(E)||[""],f=n.length;while(f--)u=rt.exec(n[f])||[],v=g=u[1],m=(u[2]||"").split(".").sort(),c=b.event.special[v]||{},v=(o?c.delegateType:c.bindType)||v,c=b.event.special[v]||{},p=b.extend({type:v,origType:g,data:s,handler:r,guid:r.guid,selector:o,needsContext:o&&b.expr.match.needsContext.test(o),namespace:m.join(".")},l),(d=a[v])||(d=a[v]=[],d.delegateCount=0,c.setup&&c.setup.call(e,s,m,h)!==!1||(e.addEventListener?e.addEventListener(v,h,!1):e.attachEvent&&e.attachEvent("on"+v,h))),c.add&&(c.add.call(e,p),p.handler.guid||(p.handler.guid=r.guid)),o?d.splice(d.delegateCount++,0,p):d.push(p),b.event.global[v]=!0;e=null}},remove:function(e,t,n,r,i){var s,o,u,a,f,l,c,h,p,d,v,m=b.hasData(e)&&b._data(e);if(m&&(l=m.events)){t=(t||"").match(E)||[""],f=t.length;while(f--)if(u=rt.exec(t[f])||[],p=v=u[1],d=(u[2]||"").split(".").sort(),p){c=b.event.special[p]||{},p=(r?c.delegateType:c.bindType)||p,h=l[p]||[],u=u[2]&&RegExp("(^|\\.)"+d.join("\\.(?:.*\\.|)")+"(\\.|$)"),a=s=h.length;while(s--)o=h[s],!i&&v!==o.origType||n&&n.guid!==o.guid||u&&!u.test(o.namespace)||r&&r!==o.selector&&("**"!==r||!o.selector)||(h.splice(s,1),o.selector&&h.delegateCount--,c.remove&&c.remove.call(e,o));a&&!h.length&&(c.teardown&&c.teardown.call(e,d,m.handle)!==!1||b.removeEvent(e,p,m.handle),delete l[p])}else for(p in l)b.event.remove(e,p+t[f],n,r,!0);b.isEmptyObject(l)&&(delete m.handle,b._removeData(e,"events"))}},trigger:function(n,r,i,o){var u,a,f,l,c,h,p,d=[i||s],v=g.call(n,"type")?n.type:n,m=g.call(n,"namespace")?n.namespace.split("."):[];if(f=h=i=i||s,3!==i.nodeType&&8!==i.nodeType&&!nt.test(v+b.event.triggered)&&(v.indexOf(".")>=0&&(m=v.split("."),v=m.shift(),m.sort()),a=0>v.indexOf(":")&&"on"+v,n=n[b.expando]?n:new b.Event(v,"object"==typeof n&&n),n.isTrigger=!0,n.namespace=m.join("."),n.namespace_re=n.namespace?RegExp("(^|\\.)"+m.join("\\.(?:.*\\.|)")+"(\\.|$)"):null,n.result=t,n.target||(n.target=i),r=null==r?[n]:b.makeArray(r,[n]),c=b.event.special[v]||{},o||!c.trigger||c.trigger.apply(i,r)!==!1)){if(!o&&!c.noBubble&&!b.isWindow(i)){for(l=c.delegateType||v,nt.test(l+v)||(f=f.parentNode);f;f=f.parentNode)d.push(f),h=f;h===(i.ownerDocument||s)&&d.push(h.defaultView||h.parentWindow||e)}p=0;while((f=d[p++])&&!n.isPropagationStopped())n.type=p>1?l:c.bindType||v,u=(b._data(f,"events")||{})[n.type]&&b._data(f,"handle"),u&&u.apply(f,r),u=a&&f[a],u&&b.acceptData(f)&&u.apply&&u.apply(f,r)===!1&&n.preventDefault();if(n.type=v,!(o||n.isDefaultPrevented()||c._default&&c._default.apply(i.ownerDocument,r)!==!1||"click"===v&&b.nodeName(i,"a")||!b.acceptData(i)||!a||!i[v]||b.isWindow(i))){h=i[a],h&&(i[a]=null),b.event.triggered=v;try{i[v]()}catch(y){}b.event.triggered=t,h&&(i[a]=h)}return n.result}},dispatch:function(e){e=b.event.fix(e);var n,r,i,s,o,u=[],a=d.call(arguments),f=(b._data(this,"events")||{})[e.type]||[],l=b.event.special[e.type]||{};if(a[0]=e,e.delegateTarget=this,!l.preDispatch||l.preDispatch.call(this,e)!==!1){u=b.event.handlers.call(this,e,f),n=0;while((s=u[n++])&&!e.isPropagationStopped()){e.currentTarget=s.elem,o=0;while((i=s.handlers[o++])&&!e.isImmediatePropagationStopped())(!e.namespace_re||e.namespace_re.test(i.namespace))&&(e.handleObj=i,e.data=i.data,r=((b.event.special[i.origType]||{}).handle||i.handler).apply(s.elem,a),r!==t&&(e.result=r)===!1&&(e.preventDefault(),e.stopPropagation()))}return l.postDispatch&&l.postDispatch.call(this,e),e.result}},handlers:function(e,n){var r,i,s,o,u=[],a=n.delegateCount,f=e.target;if(a&&f.nodeType&&(!e.button||"click"!==e.type))for(;f!=this;f=f.parentNode||this)if(1===f.nodeType&&(f.disabled!==!0||"click"!==e.type)){for(s=[],o=0;a>o;o++)i=n[o],r=i.selector+" ",s[r]===t&&(s[r]=i.needsContext?b(r,this).index(f)>=0:b.find(r,this,null,[f]).length),s[r]&&s.push(i);s.length&&u.push({elem:f,handlers:s})}return n.length>a&&u.push({elem:this,handlers:n.slice(a)}),u},fix:function(e){if(e[b.expando])return e;var t,n,r,i=e.type,o=e,u=this.fixHooks[i];u||(this.fixHooks[i]=u=tt.test(i)?this.mouseHooks:et.test(i)?this.keyHooks:{}),r=u.props?this.props.concat(u.props):this.props,e=new b.Event(o),t=r.length;while(t--)n=r[t],e[n]=o[n];return e.target||(e.target=o.srcElement||s),3===e.target.nodeType&&(e.target=e.target.parentNode),e.metaKey=!!e.metaKey,u.filter?u.filter(e,o):e},props:"altKey bubbles cancelable ctrlKey currentTarget eventPhase metaKey relatedTarget shiftKey target timeStamp view which".split(" "),fixHooks:{},keyHooks:{props:"char charCode key keyCode".split(" "),filter:function(e,t){return null==e.which&&(e.which=null!=t.charCode?t.charCode:t.keyCode),e}},mouseHooks:{props:"button buttons clientX clientY fromElement offsetX offsetY pageX pageY screenX screenY toElement".split(" "),filter:function(e,n){var r,i,o,u=n.button,a=n.fromElement;return null==e.pageX&&null!=n.clientX&&(i=e.target.ownerDocument||s,o=i.documentElement,r=i.body,e.pageX=n.clientX+(o&&o.scrollLeft||r&&r.scrollLeft||0)-(o&&o.clientLeft||r&&r.clientLeft||0),e.pageY=n.clientY+(o&&o.scrollTop||r&&r.scrollTop||0)-(o&&o.clientTop||r&&r.clientTop||0)),!e.relatedTarget&&a&&(e.relatedTarget=a===e.target?n.toElement:a),e.which||u===t||(e.which=1&u?1:2&u?3:4&u?2:0),e}},special:{load:{noBubble:!0},click:{trigger:function(){return b.nodeName(this,"input")&&"checkbox"===this.type&&this.click?(this.click(),!1):t}},focus:{trigger:function(){if(this!==s.activeElement&&this.focus)try{return this.focus(),!1}catch(e){}},delegateType:"focusin"},blur:{trigger:function(){return this===s.activeElement&&this.blur?(this.blur(),!1):t},delegateType:"focusout"},beforeunload:{postDispatch:function(e){e.result!==t&&(e.originalEvent.returnValue=e.result)}}},simulate:function(e,t,n,r){var i=b.extend(new b.Event,n,{type:e,isSimulated:!0,originalEvent:{}});r?b.event.trigger(i,null,t):b.event.dispatch.call(t,i),i.isDefaultPrevented()&&n.preventDefault()}},b.removeEvent=s.removeEventListener?function(e,t,n){e.removeEventListener&&e.removeEventListener(t,n,!1)}:function(e,t,n){var r="on"+t;e.detachEvent&&(typeof e[r]===i&&(e[r]=null),e.detachEvent(r,n))},b.Event=function(e,n){return this instanceof b.Event?(e&&e.type?(this.originalEvent=e,this.type=e.type,this.isDefaultPrevented=e.defaultPrevented||e.returnValue===!1||e.getPreventDefault&&e.getPreventDefault()?it:st):this.type=e,n&&b.extend(this,n),this.timeStamp=e&&e.timeStamp||b.now(),this[b.expando]=!0,t):new b.Event(e,n)},b.Event.prototype={isDefaultPrevented:st,isPropagationStopped:st,isImmediatePropagationStopped:st,preventDefault:function(){var e=this.originalEvent;this.isDefaultPrevented=it,e&&(e.preventDefault?e.preventDefault():e.returnValue=!1)},stopPropagation:function(){var e=this.originalEvent;this.isPropagationStopped=it,e&&(e.stopPropagation&&e.stopPropagation(),e.cancelBubble=!0)},stopImmediatePropagation:function(){this.isImmediatePropagationStopped=it,this.stopPropagation()}},b.each({mouseenter:"mouseover",mouseleave:"mouseout"},function(e,t){b.event.special[e]={delegateType:t,bindType:t,handle:function(e){var n,r=this,i=e.relatedTarget,s=e.handleObj;return(!i||i!==r&&!b.contains(r,i))&&(e.type=s.origType,n=s.handler.apply(this,arguments),e.type=t),n}}}),b.support.submitBubbles||(b.event.special.submit={setup:function(){return b.nodeName(this,"form")?!1:(b.event.add(this,"click._submit keypress._submit",function(e){var n=e.target,r=b.nodeName(n,"input")||b.nodeName(n,"button")?n.form:t;r&&!b._data(r,"submitBubbles")&&(b.event.add(r,"submit._submit",function(e){e._submit_bubble=!0}),b._data(r,"submitBubbles",!0))}),t)},postDispatch:function(e){e._submit_bubble&&(delete e._submit_bubble,this.parentNode&&!e.isTrigger&&b.event.simulate("submit",this.parentNode,e,!0))},teardown:function(){return b.nodeName(this,"form")?!1:(b.event.remove(this,"._submit"),t)}}),b.support.changeBubbles||(b.event.special.change={setup:function(){return Z.test(this.nodeName)?(("checkbox"===this.type||"radio"===this.type)&&(b.event.add(this,"propertychange._change",function(e){"checked"===e.originalEvent.propertyName&&(this._just_changed=!0)}),b.event.add(this,"click._change",function(e){this._just_changed&&!e.isTrigger&&(this._just_changed=!1),b.event.simulate("change",this,e,!0)})),!1):(b.event.add(this,"beforeactivate._change",function(e){var t=e.target;Z.test(t.nodeName)&&!b._data(t,"changeBubbles")&&(b.event.add(t,"change._change",function(e){!this.parentNode||e.isSimulated||e.isTrigger||b.event.simulate("change",this.parentNode,e,!0)}),b._data(t,"changeBubbles",!0))}),t)},handle:function(e){var n=e.target;return this!==n||e.isSimulated||e.isTrigger||"radio"!==n.type&&"checkbox"!==n.type?e.handleObj.handler.apply(this,arguments):t},teardown:function(){return b.event.remove(this,"._change"),!Z.test(this.nodeName)}}),b.support.focusinBubbles||b.each({focus:"focusin",blur:"focusout"},function(e,t){var n=0,r=function(e){b.event.simulate(t,e.target,b.event.fix(e),!0)};b.event.special[t]={setup:function(){0===n++&&s.addEventListener(e,r,!0)},teardown:function(){0===--n&&s.removeEventListener(e,r,!0)}}}),b.fn.extend({on:function(e,n,r,i,s){var o,u;if("object"==typeof e){"string"!=typeof n&&(r=r||n,n=t);for(o in e)this.on(o,n,r,e[o],s);return this}if(null==r&&null==i?(i=n,r=n=t):null==i&&("string"==typeof n?(i=r,r=t):(i=r,r=n,n=t)),i===!1)i=st;else if(!i)return this;return 1===s&&(u=i,i=function(e){return b().off(e),u.apply(this,arguments)},i.guid=u.guid||(u.guid=b.guid++)),this.each(function(){b.event.add(this,e,i,r,n)})},one:function(e,t,n,r){return this.on(e,t,n,r,1)},off:function(e,n,r){var i,s;if(e&&e.preventDefault&&e.handleObj)return i=e.handleObj,b(e.delegateTarget).off(i.namespace?i.origType+"."+i.namespace:i.origType,i.selector,i.handler),this;if("object"==typeof e){for(s in e)this.off(s,n,e[s]);return this}return(n===!1||"function"==typeof n)&&(r=n,n=t),r===!1&&(r=st),this.each(function(){b.event.remove(this,e,r,n)})},bind:function(e,t,n){return this.on(e,null,t,n)},unbind:function(e,t){return this.off(e,null,t)},delegate:function(e,t,n,r){return this.on(t,e,n,r)},undelegate:function(e,t,n){return 1===arguments.length?this.off(e,"**"):this.off(t,e||"**",n)},trigger:function(e,t){return this.each(function(){b.event.trigger(e,t,this)})},triggerHandler:function(e,n){var r=this[0];return r?b.event.trigger(e,n,r,!0):t}}),function(e,t){function rt(e){return J.test(e+"")}function it(){var e,t=[];return e=function(n,r){return t.push(n+=" ")>i.cacheLength&&delete e[t.shift()],e[n]=r}}function st(e){return e[w]=!0,e}function ot(e){var t=c.createElement("div");try{return e(t)}catch(n){return!1}finally{t=null}}function ut(e,t,n,r){var i,s,o,u,a,f,h,v,m,y;if((t?t.ownerDocument||t:E)!==c&&l(t),t=t||c,n=n||[],!e||"string"!=typeof e)return n;if(1!==(u=t.nodeType)&&9!==u)return[];if(!p&&!r){if(i=K.exec(e))if(o=i[1]){if(9===u){if(s=t.getElementById(o),!s||!s.parentNode)return n;if(s.id===o)return n.push(s),n}else if(t.ownerDocument&&(s=t.ownerDocument.getElementById(o))&&g(t,s)&&s.id===o)return n.push(s),n}else{if(i[2])return _.apply(n,D.call(t.getElementsByTagName(e),0)),n;if((o=i[3])&&S.getByClassName&&t.getElementsByClassName)return _.apply(n,D.call(t.getElementsByClassName(o),0)),n}if(S.qsa&&!d.test(e)){if(h=!0,v=w,m=t,y=9===u&&e,1===u&&"object"!==t.nodeName.toLowerCase()){f=ht(e),(h=t.getAttribute("id"))?v=h.replace(Y,"\\$&"):t.setAttribute("id",v),v="[id='"+v+"'] ",a=f.length;while(a--)f[a]=v+pt(f[a]);m=$.test(e)&&t.parentNode||t,y=f.join(",")}if(y)try{return _.apply(n,D.call(m.querySelectorAll(y),0)),n}catch(b){}finally{h||t.removeAttribute("id")}}}return Et(e.replace(R,"$1"),t,n,r)}function at(e,t){var n=t&&e,r=n&&(~t.sourceIndex||A)-(~e.sourceIndex||A);if(r)return r;if(n)while(n=n.nextSibling)if(n===t)return-1;return e?1:-1}function ft(e){return function(t){var n=t.nodeName.toLowerCase();return"input"===n&&t.type===e}}function lt(e){return function(t){var n=t.nodeName.toLowerCase();return("input"===n||"button"===n)&&t.type===e}}function ct(e){return st(function(t){return t=+t,st(function(n,r){var i,s=e([],n.length,t),o=s.length;while(o--)n[i=s[o]]&&(n[i]=!(r[i]=n[i]))})})}function ht(e,t){var n,r,s,o,u,a,f,l=C[e+" "];if(l)return t?0:l.slice(0);u=e,a=[],f=i.preFilter;while(u){(!n||(r=U.exec(u)))&&(r&&(u=u.slice(r[0].length)||u),a.push(s=[])),n=!1,(r=z.exec(u))&&(n=r.shift(),s.push({value:n,type:r[0].replace(R," ")}),u=u.slice(n.length));for(o in i.filter)!(r=V[o].exec(u))||f[o]&&!(r=f[o](r))||(n=r.shift(),s.push({value:n,type:o,matches:r}),u=u.slice(n.length));if(!n)break}return t?u.length:u?ut.error(e):C(e,a).slice(0)}function pt(e){var t=0,n=e.length,r="";for(;n>t;t++)r+=e[t].value;return r}function dt(e,t,n){var i=t.dir,s=n&&"parentNode"===i,o=T++;return t.first?function(t,n,r){while(t=t[i])if(1===t.nodeType||s)return e(t,n,r)}:function(t,n,u){var a,f,l,c=x+" "+o;if(u){while(t=t[i])if((1===t.nodeType||s)&&e(t,n,u))return!0}else while(t=t[i])if(1===t.nodeType||s)if(l=t[w]||(t[w]={}),(f=l[i])&&f[0]===c){if((a=f[1])===!0||a===r)return a===!0}else if(f=l[i]=[c],f[1]=e(t,n,u)||r,f[1]===!0)return!0}}function vt(e){return e.length>1?function(t,n,r){var i=e.length;while(i--)if(!e[i](t,n,r))return!1;return!0}:e[0]}function mt(e,t,n,r,i){var s,o=[],u=0,a=e.length,f=null!=t;for(;a>u;u++)(s=e[u])&&(!n||n(s,r,i))&&(o.push(s),f&&t.push(u));return o}function gt(e,t,n,r,i,s){return r&&!r[w]&&(r=gt(r)),i&&!i[w]&&(i=gt(i,s)),st(function(s,o,u,a){var f,l,c,h=[],p=[],d=o.length,v=s||wt(t||"*",u.nodeType?[u]:u,[]),m=!e||!s&&t?v:mt(v,h,e,u,a),g=n?i||(s?e:d||r)?[]:o:m;if(n&&n(m,g,u,a),r){f=mt(g,p),r(f,[],u,a),l=f.length;while(l--)(c=f[l])&&(g[p[l]]=!(m[p[l]]=c))}if(s){if(i||e){if(i){f=[],l=g.length;while(l--)(c=g[l])&&f.push(m[l]=c);i(null,g=[],f,a)}l=g.length;while(l--)(c=g[l])&&(f=i?P.call(s,c):h[l])>-1&&(s[f]=!(o[f]=c))}}else g=mt(g===o?g.splice(d,g.length):g),i?i(null,o,g,a):_.apply(o,g)})}function yt(e){var t,n,r,s=e.length,o=i.relative[e[0].type],u=o||i.relative[" "],a=o?1:0,l=dt(function(e){return e===t},u,!0),c=dt(function(e){return P.call(t,e)>-1},u,!0),h=[function(e,n,r){return!o&&(r||n!==f)||((t=n).nodeType?l(e,n,r):c(e,n,r))}];for(;s>a;a++)if(n=i.relative[e[a].type])h=[dt(vt(h),n)];else{if(n=i.filter[e[a].type].apply(null,e[a].matches),n[w]){for(r=++a;s>r;r++)if(i.relative[e[r].type])break;return gt(a>1&&vt(h),a>1&&pt(e.slice(0,a-1)).replace(R,"$1"),n,r>a&&yt(e.slice(a,r)),s>r&&yt(e=e.slice(r)),s>r&&pt(e))}h.push(n)}return vt(h)}function bt(e,t){var n=0,s=t.length>0,o=e.length>0,u=function(u,a,l,h,p){var d,v,m,g=[],y=0,b="0",w=u&&[],E=null!=p,S=f,T=u||o&&i.find.TAG("*",p&&a.parentNode||a),N=x+=null==S?1:Math.random()||.1;for(E&&(f=a!==c&&a,r=n);null!=(d=T[b]);b++){if(o&&d){v=0;while(m=e[v++])if(m(d,a,l)){h.push(d);break}E&&(x=N,r=++n)}s&&((d=!m&&d)&&y--,u&&w.push(d))}if(y+=b,s&&b!==y){v=0;while(m=t[v++])m(w,g,a,l);if(u){if(y>0)while(b--)w[b]||g[b]||(g[b]=M.call(h));g=mt(g)}_.apply(h,g),E&&!u&&g.length>0&&y+t.length>1&&ut.uniqueSort(h)}return E&&(x=N,f=S),w};return s?st(u):u}function wt(e,t,n){var r=0,i=t.length;for(;i>r;r++)ut(e,t[r],n);return n}function Et(e,t,n,r){var s,o,a,f,l,c=ht(e);if(!r&&1===c.length){if(o=c[0]=c[0].slice(0),o.length>2&&"ID"===(a=o[0]).type&&9===t.nodeType&&!p&&i.relative[o[1].type]){if(t=i.find.ID(a.matches[0].replace(et,tt),t)[0],!t)return n;e=e.slice(o.shift().value.length)}s=V.needsContext.test(e)?0:o.length;while(s--){if(a=o[s],i.relative[f=a.type])break;if((l=i.find[f])&&(r=l(a.matches[0].replace(et,tt),$.test(o[0].type)&&t.parentNode||t))){if(o.splice(s,1),e=r.length&&pt(o),!e)return _.apply(n,D.call(r,0)),n;break}}}return u(e,c)(r,t,p,n,$.test(e)),n}function St(){}var n,r,i,s,o,u,a,f,l,c,h,p,d,v,m,g,y,w="sizzle"+ -(new Date),E=e.document,S={},x=0,T=0,N=it(),C=it(),k=it(),L=typeof t,A=1<<31,O=[],M=O.pop,_=O.push,D=O.slice,P=O.indexOf||function(e){var t=0,n=this.length;for(;n>t;t++)if(this[t]===e)return t;return-1},H="[\\x20\\t\\r\\n\\f]",B="(?:\\\\.|[\\w-]|[^\\x00-\\xa0])+",j=B.replace("w","w#"),F="([*^$|!~]?=)",I="\\["+H+"*("+B+")"+H+"*(?:"+F+H+"*(?:(['\"])((?:\\\\.|[^\\\\])*?)\\3|("+j+")|)|)"+H+"*\\]",q=":("+B+")(?:\\(((['\"])((?:\\\\.|[^\\\\])*?)\\3|((?:\\\\.|[^\\\\()[\\]]|"+I.replace(3,8)+")*)|.*)\\)|)",R=RegExp("^"+H+"+|((?:^|[^\\\\])(?:\\\\.)*)"+H+"+$","g"),U=RegExp("^"+H+"*,"+H+"*"),z=RegExp("^"+H+"*([\\x20\\t\\r\\n\\f>+~])"+H+"*"),W=RegExp(q),X=RegExp("^"+j+"$"),V={ID:RegExp("^#("+B+")"),CLASS:RegExp("^\\.("+B+")"),NAME:RegExp("^\\[name=['\"]?("+B+")['\"]?\\]"),TAG:RegExp("^("+B.replace("w","w*")+")"),ATTR:RegExp("^"+I),PSEUDO:RegExp("^"+q),CHILD:RegExp("^:(only|first|last|nth|nth-last)-(child|of-type)(?:\\("+H+"*(even|odd|(([+-]|)(\\d*)n|)"+H+"*(?:([+-]|)"+H+"*(\\d+)|))"+H+"*\\)|)","i"),needsContext:RegExp("^"+H+"*[>+~]|:(even|odd|eq|gt|lt|nth|first|last)(?:\\("+H+"*((?:-\\d)?\\d*)"+H+"*\\)|)(?=[^-]|$)","i")},$=/[\x20\t\r\n\f]*[+~]/,J=/^[^{]+\{\s*\[native code/,K=/^(?:#([\w-]+)|(\w+)|\.([\w-]+))$/,Q=/^(?:input|select|textarea|button)$/i,G=/^h\d$/i,Y=/'|\\/g,Z=/\=[\x20\t\r\n\f]*([^'"\]]*)[\x20\t\r\n\f]*\]/g,et=/\\([\da-fA-F]{1,6}[\x20\t\r\n\f]?|.)/g,tt=function(e,t){var n="0x"+t-65536;return n!==n?t:0>n?String.fromCharCode(n+65536):String.fromCharCode(55296|n>>10,56320|1023&n)};try{D.call(E.documentElement.childNodes,0)[0].nodeType}catch(nt){D=function(e){var t,n=[];while(t=this[e++])n.push(t);return n}}o=ut.isXML=function(e){var t=e&&(e.ownerDocument||e).documentElement;return t?"HTML"!==t.nodeName:!1},l=ut.setDocument=function(e){var n=e?e.ownerDocument||e:E;return n!==c&&9===n.nodeType&&n.documentElement?(c=n,h=n.documentElement,p=o(n),S.tagNameNoComments=ot(function(e){return e.appendChild(n.createComment("")),!e.getElementsByTagName("*").length}),S.attributes=ot(function(e){e.innerHTML="<select></select>";var t=typeof e.lastChild.getAttribute("multiple");return"boolean"!==t&&"string"!==t}),S.getByClassName=ot(function(e){return e.innerHTML="<div class='hidden e'></div><div class='hidden'></div>",e.getElementsByClassName&&e.getElementsByClassName("e").length?(e.lastChild.className="e",2===e.getElementsByClassName("e").length):!1}),S.getByName=ot(function(e){e.id=w+0,e.innerHTML="<a name='"+w+"'></a><div name='"+w+"'></div>",h.insertBefore(e,h.firstChild);var t=n.getElementsByName&&n.getElementsByName(w).length===2+n.getElementsByName(w+0).length;return S.getIdNotName=!n.getElementById(w),h.removeChild(e),t}),i.attrHandle=ot(function(e){return e.innerHTML="<a href='#'></a>",e.firstChild&&typeof e.firstChild.getAttribute!==L&&"#"===e.firstChild.getAttribute("href")})?{}:{href:function(e){return e.getAttribute("href",2)},type:function(e){return e.getAttribute("type")}},S.getIdNotName?(i.find.ID=function(e,t){if(typeof t.getElementById!==L&&!p){var n=t.getElementById(e);return n&&n.parentNode?[n]:[]}},i.filter.ID=function(e){var t=e.replace(et,tt);return function(e){return e.getAttribute("id")===t}}):(i.find.ID=function(e,n){if(typeof n.getElementById!==L&&!p){var r=n.getElementById(e);return r?r.id===e||typeof r.getAttributeNode!==L&&r.getAttributeNode("id").value===e?[r]:t:[]}},i.filter.ID=function(e){var t=e.replace(et,tt);return function(e){var n=typeof e.getAttributeNode!==L&&e.getAttributeNode("id");return n&&n.value===t}}),i.find.TAG=S.tagNameNoComments?function(e,n){return typeof n.getElementsByTagName!==L?n.getElementsByTagName(e):t}:function(e,t){var n,r=[],i=0,s=t.getElementsByTagName(e);if("*"===e){while(n=s[i++])1===n.nodeType&&r.push(n);return r}return s},i.find.NAME=S.getByName&&function(e,n){return typeof n.getElementsByName!==L?n.getElementsByName(name):t},i.find.CLASS=S.getByClassName&&function(e,n){return typeof n.getElementsByClassName===L||p?t:n.getElementsByClassName(e)},v=[],d=[":focus"],(S.qsa=rt(n.querySelectorAll))&&(ot(function(e){e.innerHTML="<select><option selected=''></option></select>",e.querySelectorAll("[selected]").length||d.push("\\["+H+"*(?:checked|disabled|ismap|multiple|readonly|selected|value)"),e.querySelectorAll(":checked").length||d.push(":checked")}),ot(function(e){e.innerHTML="<input type='hidden' i=''/>",e.querySelectorAll("[i^='']").length&&d.push("[*^$]="+H+"*(?:\"\"|'')"),e.querySelectorAll(":enabled").length||d.push(":enabled",":disabled"),e.querySelectorAll("*,:x"),d.push(",.*:")})),(S.matchesSelector=rt(m=h.matchesSelector||h.mozMatchesSelector||h.webkitMatchesSelector||h.oMatchesSelector||h.msMatchesSelector))&&ot(function(e){S.disconnectedMatch=m.call(e,"div"),m.call(e,"[s!='']:x"),v.push("!=",q)}),d=RegExp(d.join("|")),v=RegExp(v.join("|")),g=rt(h.contains)||h.compareDocumentPosition?function(e,t){var n=9===e.nodeType?e.documentElement:e,r=t&&t.parentNode;return e===r||!!r&&1===r.nodeType&&!!(n.contains?n.contains(r):e.compareDocumentPosition&&16&e.compareDocumentPosition(r))}:function(e,t){if(t)while(t=t.parentNode)if(t===e)return!0;return!1},y=h.compareDocumentPosition?function(e,t){var r;return e===t?(a=!0,0):(r=t.compareDocumentPosition&&e.compareDocumentPosition&&e.compareDocumentPosition(t))?1&r||e.parentNode&&11===e.parentNode.nodeType?e===n||g(E,e)?-1:t===n||g(E,t)?1:0:4&r?-1:1:e.compareDocumentPosition?-1:1}:function(e,t){var r,i=0,s=e.parentNode,o=t.parentNode,u=[e],f=[t];if(e===t)return a=!0,0;if(!s||!o)return e===n?-1:t===n?1:s?-1:o?1:0;if(s===o)return at(e,t);r=e;while(r=r.parentNode)u.unshift(r);r=t;while(r=r.parentNode)f.unshift(r);while(u[i]===f[i])i++;return i?at(u[i],f[i]):u[i]===E?-1:f[i]===E?1:0},a=!1,[0,0].sort(y),S.detectDuplicates=a,c):c},ut.matches=function(e,t){return ut(e,null,null,t)},ut.matchesSelector=function(e,t){if((e.ownerDocument||e)!==c&&l(e),t=t.replace(Z,"='$1']"),!(!S.matchesSelector||p||v&&v.test(t)||d.test(t)))try{var n=m.call(e,t);if(n||S.disconnectedMatch||e.document&&11!==e.document.nodeType)return n}catch(r){}return ut(t,c,null,[e]).length>0},ut.contains=function(e,t){return(e.ownerDocument||e)!==c&&l(e),g(e,t)},ut.attr=function(e,t){var n;return(e.ownerDocument||e)!==c&&l(e),p||(t=t.toLowerCase()),(n=i.attrHandle[t])?n(e):p||S.attributes?e.getAttribute(t):((n=e.getAttributeNode(t))||e.getAttribute(t))&&e[t]===!0?t:n&&n.specified?n.value:null},ut.error=function(e){throw Error("Syntax error, unrecognized expression: "+e)},ut.uniqueSort=function(e){var t,n=[],r=1,i=0;if(a=!S.detectDuplicates,e.sort(y),a){for(;t=e[r];r++)t===e[r-1]&&(i=n.push(r));while(i--)e.splice(n[i],1)}return e},s=ut.getText=function(e){var t,n="",r=0,i=e.nodeType;if(i){if(1===i||9===i||11===i){if("string"==typeof e.textContent)return e.textContent;for(e=e.firstChild;e;e=e.nextSibling)n+=s(e)}else if(3===i||4===i)return e.nodeValue}else for(;t=e[r];r++)n+=s(t);return n},i=ut.selectors={cacheLength:50,createPseudo:st,match:V,find:{},relative:{">":{dir:"parentNode",first:!0}," ":{dir:"parentNode"},"+":{dir:"previousSibling",first:!0},"~":{dir:"previousSibling"}},preFilter:{ATTR:function(e){return e[1]=e[1].replace(et,tt),e[3]=(e[4]||e[5]||"").replace(et,tt),"~="===e[2]&&(e[3]=" "+e[3]+" "),e.slice(0,4)},CHILD:function(e){return e[1]=e[1].toLowerCase(),"nth"===e[1].slice(0,3)?(e[3]||ut.error(e[0]),e[4]=+(e[4]?e[5]+(e[6]||1):2*("even"===e[3]||"odd"===e[3])),e[5]=+(e[7]+e[8]||"odd"===e[3])):e[3]&&ut.error(e[0]),e},PSEUDO:function(e){var t,n=!e[5]&&e[2];return V.CHILD.test(e[0])?null:(e[4]?e[2]=e[4]:n&&W.test(n)&&(t=ht(n,!0))&&(t=n.indexOf(")",n.length-t)-n.length)&&(e[0]=e[0].slice(0,t),e[2]=n.slice(0,t)),e.slice(0,3))}},filter:{TAG:function(e){return"*"===e?function(){return!0}:(e=e.replace(et,tt).toLowerCase(),function(t){return t.nodeName&&t.nodeName.toLowerCase()===e})},CLASS:function(e){var t=N[e+" "];return t||(t=RegExp("(^|"+H+")"+e+"("+H+"|$)"))&&N(e,function(e){return t.test(e.className||typeof e.getAttribute!==L&&e.getAttribute("class")||"")})},ATTR:function(e,t,n){return function(r){var i=ut.attr(r,e);return null==i?"!="===t:t?(i+="","="===t?i===n:"!="===t?i!==n:"^="===t?n&&0===i.indexOf(n):"*="===t?n&&i.indexOf(n)>-1:"$="===t?n&&i.slice(-n.length)===n:"~="===t?(" "+i+" ").indexOf(n)>-1:"|="===t?i===n||i.slice(0,n.length+1)===n+"-":!1):!0}},CHILD:function(e,t,n,r,i){var s="nth"!==e.slice(0,3),o="last"!==e.slice(-4),u="of-type"===t;return 1===r&&0===i?function(e){return!!e.parentNode}:function(t,n,a){var f,l,c,h,p,d,v=s!==o?"nextSibling":"previousSibling",m=t.parentNode,g=u&&t.nodeName.toLowerCase(),y=!a&&!u;if(m){if(s){while(v){c=t;while(c=c[v])if(u?c.nodeName.toLowerCase()===g:1===c.nodeType)return!1;d=v="only"===e&&!d&&"nextSibling"}return!0}if(d=[o?m.firstChild:m.lastChild],o&&y){l=m[w]||(m[w]={}),f=l[e]||[],p=f[0]===x&&f[1],h=f[0]===x&&f[2],c=p&&m.childNodes[p];while(c=++p&&c&&c[v]||(h=p=0)||d.pop())if(1===c.nodeType&&++h&&c===t){l[e]=[x,p,h];break}}else if(y&&(f=(t[w]||(t[w]={}))[e])&&f[0]===x)h=f[1];else while(c=++p&&c&&c[v]||(h=p=0)||d.pop())if((u?c.nodeName.toLowerCase()===g:1===c.nodeType)&&++h&&(y&&((c[w]||(c[w]={}))[e]=[x,h]),c===t))break;return h-=i,h===r||0===h%r&&h/r>=0}}},PSEUDO:function(e,t){var n,r=i.pseudos[e]||i.setFilters[e.toLowerCase()]||ut.error("unsupported pseudo: "+e);return r[w]?r(t):r.length>1?(n=[e,e,"",t],i.setFilters.hasOwnProperty(e.toLowerCase())?st(function(e,n){var i,s=r(e,t),o=s.length;while(o--)i=P.call(e,s[o]),e[i]=!(n[i]=s[o])}):function(e){return r(e,0,n)}):r}},pseudos:{not:st(function(e){var t=[],n=[],r=u(e.replace(R,"$1"));return r[w]?st(function(e,t,n,i){var s,o=r(e,null,i,[]),u=e.length;while(u--)(s=o[u])&&(e[u]=!(t[u]=s))}):function(e,i,s){return t[0]=e,r(t,null,s,n),!n.pop()}}),has:st(function(e){return function(t){return ut(e,t).length>0}}),contains:st(function(e){return function(t){return(t.textContent||t.innerText||s(t)).indexOf(e)>-1}}),lang:st(function(e){return X.test(e||"")||ut.error("unsupported lang: "+e),e=e.replace(et,tt).toLowerCase(),function(t){var n;do if(n=p?t.getAttribute("xml:lang")||t.getAttribute("lang"):t.lang)return n=n.toLowerCase(),n===e||0===n.indexOf(e+"-");while((t=t.parentNode)&&1===t.nodeType);return!1}}),target:function(t){var n=e.location&&e.location.hash;return n&&n.slice(1)===t.id},root:function(e){return e===h},focus:function(e){return e===c.activeElement&&(!c.hasFocus||c.hasFocus())&&!!(e.type||e.href||~e.tabIndex)},enabled:function(e){return e.disabled===!1},disabled:function(e){return e.disabled===!0},checked:function(e){var t=e.nodeName.toLowerCase();return"input"===t&&!!e.checked||"option"===t&&!!e.selected},selected:function(e){return e.parentNode&&e.parentNode.selectedIndex,e.selected===!0},empty:function(e){for(e=e.firstChild;e;e=e.nextSibling)if(e.nodeName>"@"||3===e.nodeType||4===e.nodeType)return!1;return!0},parent:function(e){return!i.pseudos.empty(e)},header:function(e){return G.test(e.nodeName)},input:function(e){return Q.test(e.nodeName)},button:function(e){var t=e.nodeName.toLowerCase();return"input"===t&&"button"===e.type||"button"===t},text:function(e){var t;return"input"===e.nodeName.toLowerCase()&&"text"===e.type&&(null==(t=e.getAttribute("type"))||t.toLowerCase()===e.type)},first:ct(function(){return[0]}),last:ct(function(e,t){return[t-1]}),eq:ct(function(e,t,n){return[0>n?n+t:n]}),even:ct(function(e,t){var n=0;for(;t>n;n+=2)e.push(n);return e}),odd:ct(function(e,t){var n=1;for(;t>n;n+=2)e.push(n);return e}),lt:ct(function(e,t,n){var r=0>n?n+t:n;for(;--r>=0;)e.push(r);return e}),gt:ct(function(e,t,n){var r=0>n?n+t:n;for(;t>++r;)e.push(r);return e})}};for(n in{radio:!0,checkbox:!0,file:!0,password:!0,image:!0})i.pseudos[n]=ft(n);for(n in{submit:!0,reset:!0})i.pseudos[n]=lt(n);u=ut.compile=function(e,t){var n,r=[],i=[],s=k[e+" "];if(!s){t||(t=ht(e)),n=t.length;while(n--)s=yt(t[n]),s[w]?r.push(s):i.push(s);s=k(e,bt(i,r))}return s},i.pseudos.nth=i.pseudos.eq,i.filters=St.prototype=i.pseudos,i.setFilters=new St,l(),ut.attr=b.attr,b.find=ut,b.expr=ut.selectors,b.expr[":"]=b.expr.pseudos,b.unique=ut.uniqueSort,b.text=ut.getText,b.isXMLDoc=ut.isXML,b.contains=ut.contains}(e);var ot=/Until$/,ut=/^(?:parents|prev(?:Until|All))/,at=/^.[^:#\[\.,]*$/,ft=b.expr.match.needsContext,lt={children:!0,contents:!0,next:!0,prev:!0};b.fn.extend({find:function(e){var t,n,r,i=this.length;if("string"!=typeof e)return r=this,this.pushStack(b(e).filter(function(){for(t=0;i>t;t++)if(b.contains(r[t],this))return!0}));for(n=[],t=0;i>t;t++)b.find(e,this[t],n);return n=this.pushStack(i>1?b.unique(n):n),n.selector=(this.selector?this.selector+" ":"")+e,n},has:function(e){var t,n=b(e,this),r=n.length;return this.filter(function(){for(t=0;r>t;t++)if(b.contains(this,n[t]))return!0})},not:function(e){return this.pushStack(ht(this,e,!1))},filter:function(e){return this.pushStack(ht(this,e,!0))},is:function(e){return!!e&&("string"==typeof e?ft.test(e)?b(e,this.context).index(this[0])>=0:b.filter(e,this).length>0:this.filter(e).length>0)},closest:function(e,t){var n,r=0,i=this.length,s=[],o=ft.test(e)||"string"!=typeof e?b(e,t||this.context):0;for(;i>r;r++){n=this[r];while(n&&n.ownerDocument&&n!==t&&11!==n.nodeType){if(o?o.index(n)>-1:b.find.matchesSelector(n,e)){s.push(n);break}n=n.parentNode}}return this.pushStack(s.length>1?b.unique(s):s)},index:function(e){return e?"string"==typeof e?b.inArray(this[0],b(e)):b.inArray(e.jquery?e[0]:e,this):this[0]&&this[0].parentNode?this.first().prevAll().length:-1},add:function(e,t){var n="string"==typeof e?b(e,t):b.makeArray(e&&e.nodeType?[e]:e),r=b.merge(this.get(),n);return this.pushStack(b.unique(r))},addBack:function(e){return this.add(null==e?this.prevObject:this.prevObject.filter(e))}}),b.fn.andSelf=b.fn.addBack,b.each({parent:function(e){var t=e.parentNode;return t&&11!==t.nodeType?t:null},parents:function(e){return b.dir(e,"parentNode")},parentsUntil:function(e,t,n){return b.dir(e,"parentNode",n)},next:function(e){return ct(e,"nextSibling")},prev:function(e){return ct(e,"previousSibling")},nextAll:function(e){return b.dir(e,"nextSibling")},prevAll:function(e){return b.dir(e,"previousSibling")},nextUntil:function(e,t,n){return b.dir(e,"nextSibling",n)},prevUntil:function(e,t,n){return b.dir(e,"previousSibling",n)},siblings:function(e){return b.sibling((e.parentNode||{}).firstChild,e)},children:function(e){return b.sibling(e.firstChild)},contents:function(e){return b.nodeName(e,"iframe")?e.contentDocument||e.contentWindow.document:b.merge([],e.childNodes)}},function(e,t){b.fn[e]=function(n,r){var i=b.map(this,t,n);return ot.test(e)||(r=n),r&&"string"==typeof r&&(i=b.filter(r,i)),i=this.length>1&&!lt[e]?b.unique(i):i,this.length>1&&ut.test(e)&&(i=i.reverse()),this.pushStack(i)}}),b.extend({filter:function(e,t,n){return n&&(e=":not("+e+")"),1===t.length?b.find.matchesSelector(t[0],e)?[t[0]]:[]:b.find.matches(e,t)},dir:function(e,n,r){var i=[],s=e[n];while(s&&9!==s.nodeType&&(r===t||1!==s.nodeType||!b(s).is(r)))1===s.nodeType&&i.push(s),s=s[n];return i},sibling:function(e,t){var n=[];for(;e;e=e.nextSibling)1===e.nodeType&&e!==t&&n.push(e);return n}});var dt="abbr|article|aside|audio|bdi|canvas|data|datalist|details|figcaption|figure|footer|header|hgroup|mark|meter|nav|output|progress|section|summary|time|video",vt=/ jQuery\d+="(?:null|\d+)"/g,mt=RegExp("<(?:"+dt+")[\\s/>]","i"),gt=/^\s+/,yt=/<(?!area|br|col|embed|hr|img|input|link|meta|param)(([\w:]+)[^>]*)\/>/gi,bt=/<([\w:]+)/,wt=/<tbody/i,Et=/<|&#?\w+;/,St=/<(?:script|style|link)/i,xt=/^(?:checkbox|radio)$/i,Tt=/checked\s*(?:[^=]|=\s*.checked.)/i,Nt=/^$|\/(?:java|ecma)script/i,Ct=/^true\/(.*)/,kt=/^\s*<!(?:\[CDATA\[|--)|(?:\]\]|--)>\s*$/g,Lt={option:[1,"<select multiple='multiple'>","</select>"],legend:[1,"<fieldset>","</fieldset>"],area:[1,"<map>","</map>"],param:[1,"<object>","</object>"],thead:[1,"<table>","</table>"],tr:[2,"<table><tbody>","</tbody></table>"],col:[2,"<table><tbody></tbody><colgroup>","</colgroup></table>"],td:[3,"<table><tbody><tr>","</tr></tbody></table>"],_default:b.support.htmlSerialize?[0,"",""]:[1,"X<div>","</div>"]},At=pt(s),Ot=At.appendChild(s.createElement("div"));Lt.optgroup=Lt.option,Lt.tbody=Lt.tfoot=Lt.colgroup=Lt.caption=Lt.thead,Lt.th=Lt.td,b.fn.extend({text:function(e){return b.access(this,function(e){return e===t?b.text(this):this.empty().append((this[0]&&this[0].ownerDocument||s).createTextNode(e))},null,e,arguments.length)},wrapAll:function(e){if(b.isFunction(e))return this.each(function(t){b(this).wrapAll(e.call(this,t))});if(this[0]){var t=b(e,this[0].ownerDocument).eq(0).clone(!0);this[0].parentNode&&t.insertBefore(this[0]),t.map(function(){var e=this;while(e.firstChild&&1===e.firstChild.nodeType)e=e.firstChild;return e}).append(this)}return this},wrapInner:function(e){return b.isFunction(e)?this.each(function(t){b(this).wrapInner(e.call(this,t))}):this.each(function(){var t=b(this),n=t.contents();n.length?n.wrapAll(e):t.append(e)})},wrap:function(e){var t=b.isFunction(e);return this.each(function(n){b(this).wrapAll(t?e.call(this,n):e)})},unwrap:function(){return this.parent().each(function(){b.nodeName(this,"body")||b(this).replaceWith(this.childNodes)}).end()},append:function(){return this.domManip(arguments,!0,function(e){(1===this.nodeType||11===this.nodeType||9===this.nodeType)&&this.appendChild(e)})},prepend:function(){return this.domManip(arguments,!0,function(e){(1===this.nodeType||11===this.nodeType||9===this.nodeType)&&this.insertBefore(e,this.firstChild)})},before:function(){return this.domManip(arguments,!1,function(e){this.parentNode&&this.parentNode.insertBefore(e,this)})},after:function(){return this.domManip(arguments,!1,function(e){this.parentNode&&this.parentNode.insertBefore(e,this.nextSibling)})},remove:function(e,t){var n,r=0;for(;null!=(n=this[r]);r++)(!e||b.filter(e,[n]).length>0)&&(t||1!==n.nodeType||b.cleanData(jt(n)),n.parentNode&&(t&&b.contains(n.ownerDocument,n)&&Pt(jt(n,"script")),n.parentNode.removeChild(n)));return this},empty:function(){var e,t=0;for(;null!=(e=this[t]);t++){1===e.nodeType&&b.cleanData(jt(e,!1));while(e.firstChild)e.removeChild(e.firstChild);e.options&&b.nodeName(e,"select")&&(e.options.length=0)}return this},clone:function(e,t){return e=null==e?!1:e,t=null==t?e:t,this.map(function(){return b.clone(this,e,t)})},html:function(e){return b.access(this,function(e){var n=this[0]||{},r=0,i=this.length;if(e===t)return 1===n.nodeType?n.innerHTML.replace(vt,""):t;if(!("string"!=typeof e||St.test(e)||!b.support.htmlSerialize&&mt.test(e)||!b.support.leadingWhitespace&&gt.test(e)||Lt[(bt.exec(e)||["",""])[1].toLowerCase()])){e=e.replace(yt,"<$1></$2>");try{for(;i>r;r++)n=this[r]||{},1===n.nodeType&&(b.cleanData(jt(n,!1)),n.innerHTML=e);n=0}catch(s){}}n&&this.empty().append(e)},null,e,arguments.length)},replaceWith:function(e){var t=b.isFunction(e);return t||"string"==typeof e||(e=b(e).not(this).detach()),this.domManip([e],!0,function(e){var t=this.nextSibling,n=this.parentNode;n&&(b(this).remove(),n.insertBefore(e,t))})},detach:function(e){return this.remove(e,!0)},domManip:function(e,n,r){e=h.apply([],e);var i,s,o,u,a,f,l=0,c=this.length,p=this,d=c-1,v=e[0],m=b.isFunction(v);if(m||!(1>=c||"string"!=typeof v||b.support.checkClone)&&Tt.test(v))return this.each(function(i){var s=p.eq(i);m&&(e[0]=v.call(this,i,n?s.html():t)),s.domManip(e,n,r)});if(c&&(f=b.buildFragment(e,this[0].ownerDocument,!1,this),i=f.firstChild,1===f.childNodes.length&&(f=i),i)){for(n=n&&b.nodeName(i,"tr"),u=b.map(jt(f,"script"),_t),o=u.length;c>l;l++)s=f,l!==d&&(s=b.clone(s,!0,!0),o&&b.merge(u,jt(s,"script"))),r.call(n&&b.nodeName(this[l],"table")?Mt(this[l],"tbody"):this[l],s,l);if(o)for(a=u[u.length-1].ownerDocument,b.map(u,Dt),l=0;o>l;l++)s=u[l],Nt.test(s.type||"")&&!b._data(s,"globalEval")&&b.contains(a,s)&&(s.src?b.ajax({url:s.src,type:"GET",dataType:"script",async:!1,global:!1,"throws":!0}):b.globalEval((s.text||s.textContent||s.innerHTML||"").replace(kt,"")));f=i=null}return this}}),b.each({appendTo:"append",prependTo:"prepend",insertBefore:"before",insertAfter:"after",replaceAll:"replaceWith"},function(e,t){b.fn[e]=function(e){var n,r=0,i=[],s=b(e),o=s.length-1;for(;o>=r;r++)n=r===o?this:this.clone(!0),b(s[r])[t](n),p.apply(i,n.get());return this.pushStack(i)}}),b.extend({clone:function(e,t,n){var r,i,s,o,u,a=b.contains(e.ownerDocument,e);if(b.support.html5Clone||b.isXMLDoc(e)||!mt.test("<"+e.nodeName+">")?s=e.cloneNode(!0):(Ot.innerHTML=e.outerHTML,Ot.removeChild(s=Ot.firstChild)),!(b.support.noCloneEvent&&b.support.noCloneChecked||1!==e.nodeType&&11!==e.nodeType||b.isXMLDoc(e)))for(r=jt(s),u=jt(e),o=0;null!=(i=u[o]);++o)r[o]&&Bt(i,r[o]);if(t)if(n)for(u=u||jt(e),r=r||jt(s),o=0;null!=(i=u[o]);o++)Ht(i,r[o]);else Ht(e,s);return r=jt(s,"script"),r.length>0&&Pt(r,!a&&jt(e,"script")),r=u=i=null,s},buildFragment:function(e,t,n,r){var i,s,o,u,a,f,l,c=e.length,h=pt(t),p=[],d=0;for(;c>d;d++)if(s=e[d],s||0===s)if("object"===b.type(s))b.merge(p,s.nodeType?[s]:s);else if(Et.test(s)){u=u||h.appendChild(t.createElement("div")),a=(bt.exec(s)||["",""])[1].toLowerCase(),l=Lt[a]||Lt._default,u.innerHTML=l[1]+s.replace(yt,"<$1></$2>")+l[2],i=l[0];while(i--)u=u.lastChild;if(!b.support.leadingWhitespace&&gt.test(s)&&p.push(t.createTextNode(gt.exec(s)[0])),!b.support.tbody){s="table"!==a||wt.test(s)?"<table>"!==l[1]||wt.test(s)?0:u:u.firstChild,i=s&&s.childNodes.length;while(i--)b.nodeName(f=s.childNodes[i],"tbody")&&!f.childNodes.length&&s.removeChild(f)}b.merge(p,u.childNodes),u.textContent="";while(u.firstChild)u.removeChild(u.firstChild);u=h.lastChild}else p.push(t.createTextNode(s));u&&h.removeChild(u),b.support.appendChecked||b.grep(jt(p,"input"),Ft),d=0;while(s=p[d++])if((!r||-1===b.inArray(s,r))&&(o=b.contains(s.ownerDocument,s),u=jt(h.appendChild(s),"script"),o&&Pt(u),n)){i=0;while(s=u[i++])Nt.test(s.type||"")&&n.push(s)}return u=null,h},cleanData:function(e,t){var n,r,s,o,u=0,a=b.expando,f=b.cache,c=b.support.deleteExpando,h=b.event.special;for(;null!=(n=e[u]);u++)if((t||b.acceptData(n))&&(s=n[a],o=s&&f[s])){if(o.events)for(r in o.events)h[r]?b.event.remove(n,r):b.removeEvent(n,r,o.handle);f[s]&&(delete f[s],c?delete n[a]:typeof n.removeAttribute!==i?n.removeAttribute(a):n[a]=null,l.push(s))}}});var It,qt,Rt,Ut=/alpha\([^)]*\)/i,zt=/opacity\s*=\s*([^)]*)/,Wt=/^(top|right|bottom|left)$/,Xt=/^(none|table(?!-c[ea]).+)/,Vt=/^margin/,$t=RegExp("^("+w+")(.*)$","i"),Jt=RegExp("^("+w+")(?!px)[a-z%]+$","i"),Kt=RegExp("^([+-])=("+w+")","i"),Qt={BODY:"block"},Gt={position:"absolute",visibility:"hidden",display:"block"},Yt={letterSpacing:0,fontWeight:400},Zt=["Top","Right","Bottom","Left"],en=["Webkit","O","Moz","ms"];b.fn.extend({css:function(e,n){return b.access(this,function(e,n,r){var i,s,o={},u=0;if(b.isArray(n)){for(s=qt(e),i=n.length;i>u;u++)o[n[u]]=b.css(e,n[u],!1,s);return o}return r!==t?b.style(e,n,r):b.css(e,n)},e,n,arguments.length>1)},show:function(){return rn(this,!0)},hide:function(){return rn(this)},toggle:function(e){var t="boolean"==typeof e;return this.each(function(){(t?e:nn(this))?b(this).show():b(this).hide()})}}),b.extend({cssHooks:{opacity:{get:function(e,t){if(t){var n=Rt(e,"opacity");return""===n?"1":n}}}},cssNumber:{columnCount:!0,fillOpacity:!0,fontWeight:!0,lineHeight:!0,opacity:!0,orphans:!0,widows:!0,zIndex:!0,zoom:!0},cssProps:{"float":b.support.cssFloat?"cssFloat":"styleFloat"},style:function(e,n,r,i){if(e&&3!==e.nodeType&&8!==e.nodeType&&e.style){var s,o,u,a=b.camelCase(n),f=e.style;if(n=b.cssProps[a]||(b.cssProps[a]=tn(f,a)),u=b.cssHooks[n]||b.cssHooks[a],r===t)return u&&"get"in u&&(s=u.get(e,!1,i))!==t?s:f[n];if(o=typeof r,"string"===o&&(s=Kt.exec(r))&&(r=(s[1]+1)*s[2]+parseFloat(b.css(e,n)),o="number"),!(null==r||"number"===o&&isNaN(r)||("number"!==o||b.cssNumber[a]||(r+="px"),b.support.clearCloneStyle||""!==r||0!==n.indexOf("background")||(f[n]="inherit"),u&&"set"in u&&(r=u.set(e,r,i))===t)))try{f[n]=r}catch(l){}}},css:function(e,n,r,i){var s,o,u,a=b.camelCase(n);return n=b.cssProps[a]||(b.cssProps[a]=tn(e.style,a)),u=b.cssHooks[n]||b.cssHooks[a],u&&"get"in u&&(o=u.get(e,!0,r)),o===t&&(o=Rt(e,n,i)),"normal"===o&&n in Yt&&(o=Yt[n]),""===r||r?(s=parseFloat(o),r===!0||b.isNumeric(s)?s||0:o):o},swap:function(e,t,n,r){var i,s,o={};for(s in t)o[s]=e.style[s],e.style[s]=t[s];i=n.apply(e,r||[]);for(s in t)e.style[s]=o[s];return i}}),e.getComputedStyle?(qt=function(t){return e.getComputedStyle(t,null)},Rt=function(e,n,r){var i,s,o,u=r||qt(e),a=u?u.getPropertyValue(n)||u[n]:t,f=e.style;return u&&(""!==a||b.contains(e.ownerDocument,e)||(a=b.style(e,n)),Jt.test(a)&&Vt.test(n)&&(i=f.width,s=f.minWidth,o=f.maxWidth,f.minWidth=f.maxWidth=f.width=a,a=u.width,f.width=i,f.minWidth=s,f.maxWidth=o)),a}):s.documentElement.currentStyle&&(qt=function(e){return e.currentStyle},Rt=function(e,n,r){var i,s,o,u=r||qt(e),a=u?u[n]:t,f=e.style;return null==a&&f&&f[n]&&(a=f[n]),Jt.test(a)&&!Wt.test(n)&&(i=f.left,s=e.runtimeStyle,o=s&&s.left,o&&(s.left=e.currentStyle.left),f.left="fontSize"===n?"1em":a,a=f.pixelLeft+"px",f.left=i,o&&(s.left=o)),""===a?"auto":a}),b.each(["height","width"],function(e,n){b.cssHooks[n]={get:function(e,r,i){return r?0===e.offsetWidth&&Xt.test(b.css(e,"display"))?b.swap(e,Gt,function(){return un(e,n,i)}):un(e,n,i):t},set:function(e,t,r){var i=r&&qt(e);return sn(e,t,r?on(e,n,r,b.support.boxSizing&&"border-box"===b.css(e,"boxSizing",!1,i),i):0)}}}),b.support.opacity||(b.cssHooks.opacity={get:function(e,t){return zt.test((t&&e.currentStyle?e.currentStyle.filter:e.style.filter)||"")?.01*parseFloat(RegExp.$1)+"":t?"1":""},set:function(e,t){var n=e.style,r=e.currentStyle,i=b.isNumeric(t)?"alpha(opacity="+100*t+")":"",s=r&&r.filter||n.filter||"";n.zoom=1,(t>=1||""===t)&&""===b.trim(s.replace(Ut,""))&&n.removeAttribute&&(n.removeAttribute("filter"),""===t||r&&!r.filter)||(n.filter=Ut.test(s)?s.replace(Ut,i):s+" "+i)}}),b(function(){b.support.reliableMarginRight||(b.cssHooks.marginRight={get:function(e,n){return n?b.swap(e,{display:"inline-block"},Rt,[e,"marginRight"]):t}}),!b.support.pixelPosition&&b.fn.position&&b.each(["top","left"],function(e,n){b.cssHooks[n]={get:function(e,r){return r?(r=Rt(e,n),Jt.test(r)?b(e).position()[n]+"px":r):t}}})}),b.expr&&b.expr.filters&&(b.expr.filters.hidden=function(e){return 0>=e.offsetWidth&&0>=e.offsetHeight||!b.support.reliableHiddenOffsets&&"none"===(e.style&&e.style.display||b.css(e,"display"))},b.expr.filters.visible=function(e){return!b.expr.filters.hidden(e)}),b.each({margin:"",padding:"",border:"Width"},function(e,t){b.cssHooks[e+t]={expand:function(n){var r=0,i={},s="string"==typeof n?n.split(" "):[n];for(;4>r;r++)i[e+Zt[r]+t]=s[r]||s[r-2]||s[0];return i}},Vt.test(e)||(b.cssHooks[e+t].set=sn)});var ln=/%20/g,cn=/\[\]$/,hn=/\r?\n/g,pn=/^(?:submit|button|image|reset|file)$/i,dn=/^(?:input|select|textarea|keygen)/i;b.fn.extend({serialize:function(){return b.param(this.serializeArray())},serializeArray:function(){return this.map(function(){var e=b.prop(this,"elements");return e?b.makeArray(e):this}).filter(function(){var e=this.type;return this.name&&!b(this).is(":disabled")&&dn.test(this.nodeName)&&!pn.test(e)&&(this.checked||!xt.test(e))}).map(function(e,t){var n=b(this).val();return null==n?null:b.isArray(n)?b.map(n,function(e){return{name:t.name,value:e.replace(hn,"\r\n")}}):{name:t.name,value:n.replace(hn,"\r\n")}}).get()}}),b.param=function(e,n){var r,i=[],s=function(e,t){t=b.isFunction(t)?t():null==t?"":t,i[i.length]=encodeURIComponent(e)+"="+encodeURIComponent(t)};if(n===t&&(n=b.ajaxSettings&&b.ajaxSettings.traditional),b.isArray(e)||e.jquery&&!b.isPlainObject(e))b.each(e,function(){s(this.name,this.value)});else for(r in e)vn(r,e[r],n,s);return i.join("&").replace(ln,"+")},b.each("blur focus focusin focusout load resize scroll unload click dblclick mousedown mouseup mousemove mouseover mouseout mouseenter mouseleave change select submit keydown keypress keyup error contextmenu".split(" "),function(e,t){b.fn[t]=function(e,n){return arguments.length>0?this.on(t,null,e,n):this.trigger(t)}}),b.fn.hover=function(e,t){return this.mouseenter(e).mouseleave(t||e)};var mn,gn,yn=b.now(),bn=/\?/,wn=/#.*$/,En=/([?&])_=[^&]*/,Sn=/^(.*?):[ \t]*([^\r\n]*)\r?$/gm,xn=/^(?:about|app|app-storage|.+-extension|file|res|widget):$/,Tn=/^(?:GET|HEAD)$/,Nn=/^\/\//,Cn=/^([\w.+-]+:)(?:\/\/([^\/?#:]*)(?::(\d+)|)|)/,kn=b.fn.load,Ln={},An={},On="*/".concat("*");try{gn=o.href}catch(Mn){gn=s.createElement("a"),gn.href="",gn=gn.href}mn=Cn.exec(gn.toLowerCase())||[],b.fn.load=function(e,n,r){if("string"!=typeof e&&kn)return kn.apply(this,arguments);var i,s,o,u=this,a=e.indexOf(" ");return a>=0&&(i=e.slice(a,e.length),e=e.slice(0,a)),b.isFunction(n)?(r=n,n=t):n&&"object"==typeof n&&(o="POST"),u.length>0&&b.ajax({url:e,type:o,dataType:"html",data:n}).done(function(e){s=arguments,u.html(i?b("<div>").append(b.parseHTML(e)).find(i):e)}).complete(r&&function(e,t){u.each(r,s||[e.responseText,t,e])}),this},b.each(["ajaxStart","ajaxStop","ajaxComplete","ajaxError","ajaxSuccess","ajaxSend"],function(e,t){b.fn[t]=function(e){return this.on(t,e)}}),b.each(["get","post"],function(e,n){b[n]=function(e,r,i,s){return b.isFunction(r)&&(s=s||i,i=r,r=t),b.ajax({url:e,type:n,dataType:s,data:r,success:i})}}),b.extend({active:0,lastModified:{},etag:{},ajaxSettings:{url:gn,type:"GET",isLocal:xn.test(mn[1]),global:!0,processData:!0,async:!0,contentType:"application/x-www-form-urlencoded; charset=UTF-8",accepts:{"*":On,text:"text/plain",html:"text/html",xml:"application/xml, text/xml",json:"application/json, text/javascript"},contents:{xml:/xml/,html:/html/,json:/json/},responseFields:{xml:"responseXML",text:"responseText"},converters:{"* text":e.String,"text html":!0,"text json":b.parseJSON,"text xml":b.parseXML},flatOptions:{url:!0,context:!0}},ajaxSetup:function(e,t){return t?Pn(Pn(e,b.ajaxSettings),t):Pn(b.ajaxSettings,e)},ajaxPrefilter:_n(Ln),ajaxTransport:_n(An),ajax:function(e,n){function N(e,n,r,i){var l,g,y,E,S,T=n;2!==w&&(w=2,u&&clearTimeout(u),f=t,o=i||"",x.readyState=e>0?4:0,r&&(E=Hn(c,x,r)),e>=200&&300>e||304===e?(c.ifModified&&(S=x.getResponseHeader("Last-Modified"),S&&(b.lastModified[s]=S),S=x.getResponseHeader("etag"),S&&(b.etag[s]=S)),204===e?(l=!0,T="nocontent"):304===e?(l=!0,T="notmodified"):(l=Bn(c,E),T=l.state,g=l.data,y=l.error,l=!y)):(y=T,(e||!T)&&(T="error",0>e&&(e=0))),x.status=e,x.statusText=(n||T)+"",l?d.resolveWith(h,[g,T,x]):d.rejectWith(h,[x,T,y]),x.statusCode(m),m=t,a&&p.trigger(l?"ajaxSuccess":"ajaxError",[x,c,l?g:y]),v.fireWith(h,[x,T]),a&&(p.trigger("ajaxComplete",[x,c]),--b.active||b.event.trigger("ajaxStop")))}"object"==typeof e&&(n=e,e=t),n=n||{};var r,i,s,o,u,a,f,l,c=b.ajaxSetup({},n),h=c.context||c,p=c.context&&(h.nodeType||h.jquery)?b(h):b.event,d=b.Deferred(),v=b.Callbacks("once memory"),m=c.statusCode||{},g={},y={},w=0,S="canceled",x={readyState:0,getResponseHeader:function(e){var t;if(2===w){if(!l){l={};while(t=Sn.exec(o))l[t[1].toLowerCase()]=t[2]}t=l[e.toLowerCase()]}return null==t?null:t},getAllResponseHeaders:function(){return 2===w?o:null},setRequestHeader:function(e,t){var n=e.toLowerCase();return w||(e=y[n]=y[n]||e,g[e]=t),this},overrideMimeType:function(e){return w||(c.mimeType=e),this},statusCode:function(e){var t;if(e)if(2>w)for(t in e)m[t]=[m[t],e[t]];else x.always(e[x.status]);return this},abort:function(e){var t=e||S;return f&&f.abort(t),N(0,t),this}};if(d.promise(x).complete=v.add,x.success=x.done,x.error=x.fail,c.url=((e||c.url||gn)+"").replace(wn,"").replace(Nn,mn[1]+"//"),c.type=n.method||n.type||c.method||c.type,c.dataTypes=b.trim(c.dataType||"*").toLowerCase().match(E)||[""],null==c.crossDomain&&(r=Cn.exec(c.url.toLowerCase()),c.crossDomain=!(!r||r[1]===mn[1]&&r[2]===mn[2]&&(r[3]||("http:"===r[1]?80:443))==(mn[3]||("http:"===mn[1]?80:443)))),c.data&&c.processData&&"string"!=typeof c.data&&(c.data=b.param(c.data,c.traditional)),Dn(Ln,c,n,x),2===w)return x;a=c.global,a&&0===b.active++&&b.event.trigger("ajaxStart"),c.type=c.type.toUpperCase(),c.hasContent=!Tn.test(c.type),s=c.url,c.hasContent||(c.data&&(s=c.url+=(bn.test(s)?"&":"?")+c.data,delete c.data),c.cache===!1&&(c.url=En.test(s)?s.replace(En,"$1_="+yn++):s+(bn.test(s)?"&":"?")+"_="+yn++)),c.ifModified&&(b.lastModified[s]&&x.setRequestHeader("If-Modified-Since",b.lastModified[s]),b.etag[s]&&x.setRequestHeader("If-None-Match",b.etag[s])),(c.data&&c.hasContent&&c.contentType!==!1||n.contentType)&&x.setRequestHeader("Content-Type",c.contentType),x.setRequestHeader("Accept",c.dataTypes[0]&&c.accepts[c.dataTypes[0]]?c.accepts[c.dataTypes[0]]+("*"!==c.dataTypes[0]?", "+On+"; q=0.01":""):c.accepts["*"]);for(i in c.headers)x.setRequestHeader(i,c.headers[i]);if(!c.beforeSend||c.beforeSend.call(h,x,c)!==!1&&2!==w){S="abort";for(i in{success:1,error:1,complete:1})x[i](c[i]);if(f=Dn(An,c,n,x)){x.readyState=1,a&&p.trigger("ajaxSend",[x,c]),c.async&&c.timeout>0&&(u=setTimeout(function(){x.abort("timeout")},c.timeout));try{w=1,f.send(g,N)}catch(T){if(!(2>w))throw T;N(-1,T)}}else N(-1,"No Transport");return x}return x.abort()},getScript:function(e,n){return b.get(e,t,n,"script")},getJSON:function(e,t,n){return b.get(e,t,n,"json")}}),b.ajaxSetup({accepts:{script:"text/javascript, application/javascript, application/ecmascript, application/x-ecmascript"},contents:{script:/(?:java|ecma)script/},converters:{"text script":function(e){return b.globalEval(e),e}}}),b.ajaxPrefilter("script",function(e){e.cache===t&&(e.cache=!1),e.crossDomain&&(e.type="GET",e.global=!1)}),b.ajaxTransport("script",function(e){if(e.crossDomain){var n,r=s.head||b("head")[0]||s.documentElement;return{send:function(t,i){n=s.createElement("script"),n.async=!0,e.scriptCharset&&(n.charset=e.scriptCharset),n.src=e.url,n.onload=n.onreadystatechange=function(e,t){(t||!n.readyState||/loaded|complete/.test(n.readyState))&&(n.onload=n.onreadystatechange=null,n.parentNode&&n.parentNode.removeChild(n),n=null,t||i(200,"success"))},r.insertBefore(n,r.firstChild)},abort:function(){n&&n.onload(t,!0)}}}});var jn=[],Fn=/(=)\?(?=&|$)|\?\?/;b.ajaxSetup({jsonp:"callback",jsonpCallback:function(){var e=jn.pop()||b.expando+"_"+yn++;return this[e]=!0,e}}),b.ajaxPrefilter("json jsonp",function(n,r,i){var s,o,u,a=n.jsonp!==!1&&(Fn.test(n.url)?"url":"string"==typeof n.data&&!(n.contentType||"").indexOf("application/x-www-form-urlencoded")&&Fn.test(n.data)&&"data");return a||"jsonp"===n.dataTypes[0]?(s=n.jsonpCallback=b.isFunction(n.jsonpCallback)?n.jsonpCallback():n.jsonpCallback,a?n[a]=n[a].replace(Fn,"$1"+s):n.jsonp!==!1&&(n.url+=(bn.test(n.url)?"&":"?")+n.jsonp+"="+s),n.converters["script json"]=function(){return u||b.error(s+" was not called"),u[0]},n.dataTypes[0]="json",o=e[s],e[s]=function(){u=arguments},i.always(function(){e[s]=o,n[s]&&(n.jsonpCallback=r.jsonpCallback,jn.push(s)),u&&b.isFunction(o)&&o(u[0]),u=o=t}),"script"):t});var In,qn,Rn=0,Un=e.ActiveXObject&&function(){var e;for(e in In)In[e](t,!0)};b.ajaxSettings.xhr=e.ActiveXObject?function(){return!this.isLocal&&zn()||Wn()}:zn,qn=b.ajaxSettings.xhr(),b.support.cors=!!qn&&"withCredentials"in qn,qn=b.support.ajax=!!qn,qn&&b.ajaxTransport(function(n){if(!n.crossDomain||b.support.cors){var r;return{send:function(i,s){var o,u,a=n.xhr();if(n.username?a.open(n.type,n.url,n.async,n.username,n.password):a.open(n.type,n.url,n.async),n.xhrFields)for(u in n.xhrFields)a[u]=n.xhrFields[u];n.mimeType&&a.overrideMimeType&&a.overrideMimeType(n.mimeType),n.crossDomain||i["X-Requested-With"]||(i["X-Requested-With"]="XMLHttpRequest");try{for(u in i)a.setRequestHeader(u,i[u])}catch(f){}a.send(n.hasContent&&n.data||null),r=function(e,i){var u,f,l,c;try{if(r&&(i||4===a.readyState))if(r=t,o&&(a.onreadystatechange=b.noop,Un&&delete In[o]),i)4!==a.readyState&&a.abort();else{c={},u=a.status,f=a.getAllResponseHeaders(),"string"==typeof a.responseText&&(c.text=a.responseText);try{l=a.statusText}catch(h){l=""}u||!n.isLocal||n.crossDomain?1223===u&&(u=204):u=c.text?200:404}}catch(p){i||s(-1,p)}c&&s(u,l,c,f)},n.async?4===a.readyState?setTimeout(r):(o=++Rn,Un&&(In||(In={},b(e).unload(Un)),In[o]=r),a.onreadystatechange=r):r()},abort:function(){r&&r(t,!0)}}}});var Xn,Vn,$n=/^(?:toggle|show|hide)$/,Jn=RegExp("^(?:([+-])=|)("+w+")([a-z%]*)$","i"),Kn=/queueHooks$/,Qn=[nr],Gn={"*":[function(e,t){var n,r,i=this.createTween(e,t),s=Jn.exec(t),o=i.cur(),u=+o||0,a=1,f=20;if(s){if(n=+s[2],r=s[3]||(b.cssNumber[e]?"":"px"),"px"!==r&&u){u=b.css(i.elem,e,!0)||n||1;do a=a||".5",u/=a,b.style(i.elem,e,u+r);while(a!==(a=i.cur()/o)&&1!==a&&--f)}i.unit=r,i.start=u,i.end=s[1]?u+(s[1]+1)*n:n}return i}]};b.Animation=b.extend(er,{tweener:function(e,t){b.isFunction(e)?(t=e,e=["*"]):e=e.split(" ");var n,r=0,i=e.length;for(;i>r;r++)n=e[r],Gn[n]=Gn[n]||[],Gn[n].unshift(t)},prefilter:function(e,t){t?Qn.unshift(e):Qn.push(e)}}),b.Tween=rr,rr.prototype={constructor:rr,init:function(e,t,n,r,i,s){this.elem=e,this.prop=n,this.easing=i||"swing",this.options=t,this.start=this.now=this.cur(),this.end=r,this.unit=s||(b.cssNumber[n]?"":"px")},cur:function(){var e=rr.propHooks[this.prop];return e&&e.get?e.get(this):rr.propHooks._default.get(this)},run:function(e){var t,n=rr.propHooks[this.prop];return this.pos=t=this.options.duration?b.easing[this.easing](e,this.options.duration*e,0,1,this.options.duration):e,this.now=(this.end-this.start)*t+this.start,this.options.step&&this.options.step.call(this.elem,this.now,this),n&&n.set?n.set(this):rr.propHooks._default.set(this),this}},rr.prototype.init.prototype=rr.prototype,rr.propHooks={_default:{get:function(e){var t;return null==e.elem[e.prop]||e.elem.style&&null!=e.elem.style[e.prop]?(t=b.css(e.elem,e.prop,""),t&&"auto"!==t?t:0):e.elem[e.prop]},set:function(e){b.fx.step[e.prop]?b.fx.step[e.prop](e):e.elem.style&&(null!=e.elem.style[b.cssProps[e.prop]]||b.cssHooks[e.prop])?b.style(e.elem,e.prop,e.now+e.unit):e.elem[e.prop]=e.now}}},rr.propHooks.scrollTop=rr.propHooks.scrollLeft={set:function(e){e.elem.nodeType&&e.elem.parentNode&&(e.elem[e.prop]=e.now)}},b.each(["toggle","show","hide"],function(e,t){var n=b.fn[t];b.fn[t]=function(e,r,i){return null==e||"boolean"==typeof e?n.apply(this,arguments):this.animate(ir(t,!0),e,r,i)}}),b.fn.extend({fadeTo:function(e,t,n,r){return this.filter(nn).css("opacity",0).show().end().animate({opacity:t},e,n,r)},animate:function(e,t,n,r){var i=b.isEmptyObject(e),s=b.speed(t,n,r),o=function(){var t=er(this,b.extend({},e),s);o.finish=function(){t.stop(!0)},(i||b._data(this,"finish"))&&t.stop(!0)};return o.finish=o,i||s.queue===!1?this.each(o):this.queue(s.queue,o)},stop:function(e,n,r){var i=function(e){var t=e.stop;delete e.stop,t(r)};return"string"!=typeof e&&(r=n,n=e,e=t),n&&e!==!1&&this.queue(e||"fx",[]),this.each(function(){var t=!0,n=null!=e&&e+"queueHooks",s=b.timers,o=b._data(this);if(n)o[n]&&o[n].stop&&i(o[n]);else for(n in o)o[n]&&o[n].stop&&Kn.test(n)&&i(o[n]);for(n=s.length;n--;)s[n].elem!==this||null!=e&&s[n].queue!==e||(s[n].anim.stop(r),t=!1,s.splice(n,1));(t||!r)&&b.dequeue(this,e)})},finish:function(e){return e!==!1&&(e=e||"fx"),this.each(function(){var t,n=b._data(this),r=n[e+"queue"],i=n[e+"queueHooks"],s=b.timers,o=r?r.length:0;for(n.finish=!0,b.queue(this,e,[]),i&&i.cur&&i.cur.finish&&i.cur.finish.call(this),t=s.length;t--;)s[t].elem===this&&s[t].queue===e&&(s[t].anim.stop(!0),s.splice(t,1));for(t=0;o>t;t++)r[t]&&r[t].finish&&r[t].finish.call(this);delete n.finish})}}),b.each({slideDown:ir("show"),slideUp:ir("hide"),slideToggle:ir("toggle"),fadeIn:{opacity:"show"},fadeOut:{opacity:"hide"},fadeToggle:{opacity:"toggle"}},function(e,t){b.fn[e]=function(e,n,r){return this.animate(t,e,n,r)}}),b.speed=function(e,t,n){var r=e&&"object"==typeof e?b.extend({},e):{complete:n||!n&&t||b.isFunction(e)&&e,duration:e,easing:n&&t||t&&!b.isFunction(t)&&t};return r.duration=b.fx.off?0:"number"==typeof r.duration?r.duration:r.duration in b.fx.speeds?b.fx.speeds[r.duration]:b.fx.speeds._default,(null==r.queue||r.queue===!0)&&(r.queue="fx"),r.old=r.complete,r.complete=function(){b.isFunction(r.old)&&r.old.call(this),r.queue&&b.dequeue(this,r.queue)},r},b.easing={linear:function(e){return e},swing:function(e){return.5-Math.cos(e*Math.PI)/2}},b.timers=[],b.fx=rr.prototype.init,b.fx.tick=function(){var e,n=b.timers,r=0;for(Xn=b.now();n.length>r;r++)e=n[r],e()||n[r]!==e||n.splice(r--,1);n.length||b.fx.stop(),Xn=t},b.fx.timer=function(e){e()&&b.timers.push(e)&&b.fx.start()},b.fx.interval=13,b.fx.start=function(){Vn||(Vn=setInterval(b.fx.tick,b.fx.interval))},b.fx.stop=function(){clearInterval(Vn),Vn=null},b.fx.speeds={slow:600,fast:200,_default:400},b.fx.step={},b.expr&&b.expr.filters&&(b.expr.filters.animated=function(e){return b.grep(b.timers,function(t){return e===t.elem}).length}),b.fn.offset=function(e){if(arguments.length)return e===t?this:this.each(function(t){b.offset.setOffset(this,e,t)});var n,r,s={top:0,left:0},o=this[0],u=o&&o.ownerDocument;if(u)return n=u.documentElement,b.contains(n,o)?(typeof o.getBoundingClientRect!==i&&(s=o.getBoundingClientRect()),r=sr(u),{top:s.top+(r.pageYOffset||n.scrollTop)-(n.clientTop||0),left:s.left+(r.pageXOffset||n.scrollLeft)-(n.clientLeft||0)}):s},b.offset={setOffset:function(e,t,n){var r=b.css(e,"position");"static"===r&&(e.style.position="relative");var i=b(e),s=i.offset(),o=b.css(e,"top"),u=b.css(e,"left"),a=("absolute"===r||"fixed"===r)&&b.inArray("auto",[o,u])>-1,f={},l={},c,h;a?(l=i.position(),c=l.top,h=l.left):(c=parseFloat(o)||0,h=parseFloat(u)||0),b.isFunction(t)&&(t=t.call(e,n,s)),null!=t.top&&(f.top=t.top-s.top+c),null!=t.left&&(f.left=t.left-s.left+h),"using"in t?t.using.call(e,f):i.css(f)}},b.fn.extend({position:function(){if(this[0]){var e,t,n={top:0,left:0},r=this[0];return"fixed"===b.css(r,"position")?t=r.getBoundingClientRect():(e=this.offsetParent(),t=this.offset(),b.nodeName(e[0],"html")||(n=e.offset()),n.top+=b.css(e[0],"borderTopWidth",!0),n.left+=b.css(e[0],"borderLeftWidth",!0)),{top:t.top-n.top-b.css(r,"marginTop",!0),left:t.left-n.left-b.css(r,"marginLeft",!0)}}},offsetParent:function(){return this.map(function(){var e=this.offsetParent||s.documentElement;while(e&&!b.nodeName(e,"html")&&"static"===b.css(e,"position"))e=e.offsetParent;return e||s.documentElement})}}),b.each({scrollLeft:"pageXOffset",scrollTop:"pageYOffset"},function(e,n){var r=/Y/.test(n);b.fn[e]=function(i){return b.access(this,function(e,i,s){var o=sr(e);return s===t?o?n in o?o[n]:o.document.documentElement[i]:e[i]:(o?o.scrollTo(r?b(o).scrollLeft():s,r?s:b(o).scrollTop()):e[i]=s,t)},e,i,arguments.length,null)}}),b.each({Height:"height",Width:"width"},function(e,n){b.each({padding:"inner"+e,content:n,"":"outer"+e},function(r,i){b.fn[i]=function(i,s){var o=arguments.length&&(r||"boolean"!=typeof i),u=r||(i===!0||s===!0?"margin":"border");return b.access(this,function(n,r,i){var s;return b.isWindow(n)?n.document.documentElement["client"+e]:9===n.nodeType?(s=n.documentElement,Math.max(n.body["scroll"+e],s["scroll"+e],n.body["offset"+e],s["offset"+e],s["client"+e])):i===t?b.css(n,r,u):b.style(n,r,i,u)},n,o?i:t,o,null)}})}),e.jQuery=e.$=b,"function"==typeof define&&define.amd&&define.amd.jQuery&&define("jquery",[],function(){return b})})(window),!function(e){e(function(){e.support.transition=function(){var e=function(){var e=document.createElement("bootstrap"),t={WebkitTransition:"webkitTransitionEnd",MozTransition:"transitionend",OTransition:"oTransitionEnd otransitionend",transition:"transitionend"},n;for(n in t)if(e.style[n]!==undefined)return t[n]}();return e&&{end:e}}()})}(window.jQuery),!function(e){var t='[data-dismiss="alert"]',n=function(n){e(n).on("click",t,this.close)};n.prototype.close=function(t){function s(){i.trigger("closed").remove()}var n=e(this),r=n.attr("data-target"),i;r||(r=n.attr("href"),r=r&&r.replace(/.*(?=#[^\s]*$)/,"")),i=e(r),t&&t.preventDefault(),i.length||(i=n.hasClass("alert")?n:n.parent()),i.trigger(t=e.Event("close"));if(t.isDefaultPrevented())return;i.removeClass("in"),e.support.transition&&i.hasClass("fade")?i.on(e.support.transition.end,s):s()},e.fn.alert=function(t){return this.each(function(){var r=e(this),i=r.data("alert");i||r.data("alert",i=new n(this)),typeof t=="string"&&i[t].call(r)})},e.fn.alert.Constructor=n,e(document).on("click.alert.data-api",t,n.prototype.close)}(window.jQuery),!function(e){var t=function(t,n){this.$element=e(t),this.options=e.extend({},e.fn.button.defaults,n)};t.prototype.setState=function(e){var t="disabled",n=this.$element,r=n.data(),i=n.is("input")?"val":"html";e+="Text",r.resetText||n.data("resetText",n[i]()),n[i](r[e]||this.options[e]),setTimeout(function(){e=="loadingText"?n.addClass(t).attr(t,t):n.removeClass(t).removeAttr(t)},0)},t.prototype.toggle=function(){var e=this.$element.closest('[data-toggle="buttons-radio"]');e&&e.find(".active").removeClass("active"),this.$element.toggleClass("active")},e.fn.button=function(n){return this.each(function(){var r=e(this),i=r.data("button"),s=typeof n=="object"&&n;i||r.data("button",i=new t(this,s)),n=="toggle"?i.toggle():n&&i.setState(n)})},e.fn.button.defaults={loadingText:"loading..."},e.fn.button.Constructor=t,e(document).on("click.button.data-api","[data-toggle^=button]",function(t){var n=e(t.target);n.hasClass("btn")||(n=n.closest(".btn")),n.button("toggle")})}(window.jQuery),!function(e){var t=function(t,n){this.$element=e(t),this.options=n,this.options.slide&&this.slide(this.options.slide),this.options.pause=="hover"&&this.$element.on("mouseenter",e.proxy(this.pause,this)).on("mouseleave",e.proxy(this.cycle,this))};t.prototype={cycle:function(t){return t||(this.paused=!1),this.options.interval&&!this.paused&&(this.interval=setInterval(e.proxy(this.next,this),this.options.interval)),this},to:function(t){var n=this.$element.find(".item.active"),r=n.parent().children(),i=r.index(n),s=this;if(t>r.length-1||t<0)return;return this.sliding?this.$element.one("slid",function(){s.to(t)}):i==t?this.pause().cycle():this.slide(t>i?"next":"prev",e(r[t]))},pause:function(t){return t||(this.paused=!0),this.$element.find(".next, .prev").length&&e.support.transition.end&&(this.$element.trigger(e.support.transition.end),this.cycle()),clearInterval(this.interval),this.interval=null,this},next:function(){if(this.sliding)return;return this.slide("next")},prev:function(){if(this.sliding)return;return this.slide("prev")},slide:function(t,n){var r=this.$element.find(".item.active"),i=n||r[t](),s=this.interval,o=t=="next"?"left":"right",u=t=="next"?"first":"last",a=this,f;this.sliding=!0,s&&this.pause(),i=i.length?i:this.$element.find(".item")[u](),f=e.Event("slide",{relatedTarget:i[0]});if(i.hasClass("active"))return;if(e.support.transition&&this.$element.hasClass("slide")){this.$element.trigger(f);if(f.isDefaultPrevented())return;i.addClass(t),i[0].offsetWidth,r.addClass(o),i.addClass(o),this.$element.one(e.support.transition.end,function(){i.removeClass([t,o].join(" ")).addClass("active"),r.removeClass(["active",o].join(" ")),a.sliding=!1,setTimeout(function(){a.$element.trigger("slid")},0)})}else{this.$element.trigger(f);if(f.isDefaultPrevented())return;r.removeClass("active"),i.addClass("active"),this.sliding=!1,this.$element.trigger("slid")}return s&&this.cycle(),this}},e.fn.carousel=function(n){return this.each(function(){var r=e(this),i=r.data("carousel"),s=e.extend({},e.fn.carousel.defaults,typeof n=="object"&&n),o=typeof n=="string"?n:s.slide;i||r.data("carousel",i=new t(this,s)),typeof n=="number"?i.to(n):o?i[o]():s.interval&&i.cycle()})},e.fn.carousel.defaults={interval:5e3,pause:"hover"},e.fn.carousel.Constructor=t,e(document).on("click.carousel.data-api","[data-slide]",function(t){var n=e(this),r,i=e(n.attr("data-target")||(r=n.attr("href"))&&r.replace(/.*(?=#[^\s]+$)/,"")),s=e.extend({},i.data(),n.data());i.carousel(s),t.preventDefault()})}(window.jQuery),!function(e){var t=function(t,n){this.$element=e(t),this.options=e.extend({},e.fn.collapse.defaults,n),this.options.parent&&(this.$parent=e(this.options.parent)),this.options.toggle&&this.toggle()};t.prototype={constructor:t,dimension:function(){var e=this.$element.hasClass("width");return e?"width":"height"},show:function(){var t,n,r,i;if(this.transitioning)return;t=this.dimension(),n=e.camelCase(["scroll",t].join("-")),r=this.$parent&&this.$parent.find("> .accordion-group > .in");if(r&&r.length){i=r.data("collapse");if(i&&i.transitioning)return;r.collapse("hide"),i||r.data("collapse",null)}this.$element[t](0),this.transition("addClass",e.Event("show"),"shown"),e.support.transition&&this.$element[t](this.$element[0][n])},hide:function(){var t;if(this.transitioning)return;t=this.dimension(),this.reset(this.$element[t]()),this.transition("removeClass",e.Event("hide"),"hidden"),this.$element[t](0)},reset:function(e){var t=this.dimension();return this.$element.removeClass("collapse")[t](e||"auto")[0].offsetWidth,this.$element[e!==null?"addClass":"removeClass"]("collapse"),this},transition:function(t,n,r){var i=this,s=function(){n.type=="show"&&i.reset(),i.transitioning=0,i.$element.trigger(r)};this.$element.trigger(n);if(n.isDefaultPrevented())return;this.transitioning=1,this.$element[t]("in"),e.support.transition&&this.$element.hasClass("collapse")?this.$element.one(e.support.transition.end,s):s()},toggle:function(){this[this.$element.hasClass("in")?"hide":"show"]()}},e.fn.collapse=function(n){return this.each(function(){var r=e(this),i=r.data("collapse"),s=typeof n=="object"&&n;i||r.data("collapse",i=new t(this,s)),typeof n=="string"&&i[n]()})},e.fn.collapse.defaults={toggle:!0},e.fn.collapse.Constructor=t,e(document).on("click.collapse.data-api","[data-toggle=collapse]",function(t){var n=e(this),r,i=n.attr("data-target")||t.preventDefault()||(r=n.attr("href"))&&r.replace(/.*(?=#[^\s]+$)/,""),s=e(i).data("collapse")?"toggle":n.data();n[e(i).hasClass("in")?"addClass":"removeClass"]("collapsed"),e(i).collapse(s)})}(window.jQuery),!function(e){function r(){e(t).each(function(){i(e(this)).removeClass("open")})}function i(t){var n=t.attr("data-target"),r;return n||(n=t.attr("href"),n=n&&/#/.test(n)&&n.replace(/.*(?=#[^\s]*$)/,"")),r=e(n),r.length||(r=t.parent()),r}var t="[data-toggle=dropdown]",n=function(t){var n=e(t).on("click.dropdown.data-api",this.toggle);e("html").on("click.dropdown.data-api",function(){n.parent().removeClass("open")})};n.prototype={constructor:n,toggle:function(t){var n=e(this),s,o;if(n.is(".disabled, :disabled"))return;return s=i(n),o=s.hasClass("open"),r(),o||(s.toggleClass("open"),n.focus()),!1},keydown:function(t){var n,r,s,o,u,a;if(!/(38|40|27)/.test(t.keyCode))return;n=e(this),t.preventDefault(),t.stopPropagation();if(n.is(".disabled, :disabled"))return;o=i(n),u=o.hasClass("open");if(!u||u&&t.keyCode==27)return n.click();r=e("[role=menu] li:not(.divider) a",o);if(!r.length)return;a=r.index(r.filter(":focus")),t.keyCode==38&&a>0&&a--,t.keyCode==40&&a<r.length-1&&a++,~a||(a=0),r.eq(a).focus()}},e.fn.dropdown=function(t){return this.each(function(){var r=e(this),i=r.data("dropdown");i||r.data("dropdown",i=new n(this)),typeof t=="string"&&i[t].call(r)})},e.fn.dropdown.Constructor=n,e(document).on("click.dropdown.data-api touchstart.dropdown.data-api",r).on("click.dropdown touchstart.dropdown.data-api",".dropdown form",function(e){e.stopPropagation()}).on("click.dropdown.data-api touchstart.dropdown.data-api",t,n.prototype.toggle).on("keydown.dropdown.data-api touchstart.dropdown.data-api",t+", [role=menu]",n.prototype.keydown)}(window.jQuery),!function(e){var t=function(t,n){this.options=n,this.$element=e(t).delegate('[data-dismiss="modal"]',"click.dismiss.modal",e.proxy(this.hide,this)),this.options.remote&&this.$element.find(".modal-body").load(this.options.remote)};t.prototype={constructor:t,toggle:function(){return this[this.isShown?"hide":"show"]()},show:function(){var t=this,n=e.Event("show");this.$element.trigger(n);if(this.isShown||n.isDefaultPrevented())return;this.isShown=!0,this.escape(),this.backdrop(function(){var n=e.support.transition&&t.$element.hasClass("fade");t.$element.parent().length||t.$element.appendTo(document.body),t.$element.show(),n&&t.$element[0].offsetWidth,t.$element.addClass("in").attr("aria-hidden",!1),t.enforceFocus(),n?t.$element.one(e.support.transition.end,function(){t.$element.focus().trigger("shown")}):t.$element.focus().trigger("shown")})},hide:function(t){t&&t.preventDefault();var n=this;t=e.Event("hide"),this.$element.trigger(t);if(!this.isShown||t.isDefaultPrevented())return;this.isShown=!1,this.escape(),e(document).off("focusin.modal"),this.$element.removeClass("in").attr("aria-hidden",!0),e.support.transition&&this.$element.hasClass("fade")?this.hideWithTransition():this.hideModal()},enforceFocus:function(){var t=this;e(document).on("focusin.modal",function(e){t.$element[0]!==e.target&&!t.$element.has(e.target).length&&t.$element.focus()})},escape:function(){var e=this;this.isShown&&this.options.keyboard?this.$element.on("keyup.dismiss.modal",function(t){t.which==27&&e.hide()}):this.isShown||this.$element.off("keyup.dismiss.modal")},hideWithTransition:function(){var t=this,n=setTimeout(function(){t.$element.off(e.support.transition.end),t.hideModal()},500);this.$element.one(e.support.transition.end,function(){clearTimeout(n),t.hideModal()})},hideModal:function(e){this.$element.hide().trigger("hidden"),this.backdrop()},removeBackdrop:function(){this.$backdrop.remove(),this.$backdrop=null},backdrop:function(t){var n=this,r=this.$element.hasClass("fade")?"fade":"";if(this.isShown&&this.options.backdrop){var i=e.support.transition&&r;this.$backdrop=e('<div class="modal-backdrop '+r+'" />').appendTo(document.body),this.$backdrop.click(this.options.backdrop=="static"?e.proxy(this.$element[0].focus,this.$element[0]):e.proxy(this.hide,this)),i&&this.$backdrop[0].offsetWidth,this.$backdrop.addClass("in"),i?this.$backdrop.one(e.support.transition.end,t):t()}else!this.isShown&&this.$backdrop?(this.$backdrop.removeClass("in"),e.support.transition&&this.$element.hasClass("fade")?this.$backdrop.one(e.support.transition.end,e.proxy(this.removeBackdrop,this)):this.removeBackdrop()):t&&t()}},e.fn.modal=function(n){return this.each(function(){var r=e(this),i=r.data("modal"),s=e.extend({},e.fn.modal.defaults,r.data(),typeof n=="object"&&n);i||r.data("modal",i=new t(this,s)),typeof n=="string"?i[n]():s.show&&i.show()})},e.fn.modal.defaults={backdrop:!0,keyboard:!0,show:!0},e.fn.modal.Constructor=t,e(document).on("click.modal.data-api",'[data-toggle="modal"]',function(t){var n=e(this),r=n.attr("href"),i=e(n.attr("data-target")||r&&r.replace(/.*(?=#[^\s]+$)/,"")),s=i.data("modal")?"toggle":e.extend({remote:!/#/.test(r)&&r},i.data(),n.data());t.preventDefault(),i.modal(s).one("hide",function(){n.focus()})})}(window.jQuery),!function(e){var t=function(e,t){this.init("tooltip",e,t)};t.prototype={constructor:t,init:function(t,n,r){var i,s;this.type=t,this.$element=e(n),this.options=this.getOptions(r),this.enabled=!0,this.options.trigger=="click"?this.$element.on("click."+this.type,this.options.selector,e.proxy(this.toggle,this)):this.options.trigger!="manual"&&(i=this.options.trigger=="hover"?"mouseenter":"focus",s=this.options.trigger=="hover"?"mouseleave":"blur",this.$element.on(i+"."+this.type,this.options.selector,e.proxy(this.enter,this)),this.$element.on(s+"."+this.type,this.options.selector,e.proxy(this.leave,this))),this.options.selector?this._options=e.extend({},this.options,{trigger:"manual",selector:""}):this.fixTitle()},getOptions:function(t){return t=e.extend({},e.fn[this.type].defaults,t,this.$element.data()),t.delay&&typeof t.delay=="number"&&(t.delay={show:t.delay,hide:t.delay}),t},enter:function(t){var n=e(t.currentTarget)[this.type](this._options).data(this.type);if(!n.options.delay||!n.options.delay.show)return n.show();clearTimeout(this.timeout),n.hoverState="in",this.timeout=setTimeout(function(){n.hoverState=="in"&&n.show()},n.options.delay.show)},leave:function(t){var n=e(t.currentTarget)[this.type](this._options).data(this.type);this.timeout&&clearTimeout(this.timeout);if(!n.options.delay||!n.options.delay.hide)return n.hide();n.hoverState="out",this.timeout=setTimeout(function(){n.hoverState=="out"&&n.hide()},n.options.delay.hide)},show:function(){var e,t,n,r,i,s,o;if(this.hasContent()&&this.enabled){e=this.tip(),this.setContent(),this.options.animation&&e.addClass("fade"),s=typeof this.options.placement=="function"?this.options.placement.call(this,e[0],this.$element[0]):this.options.placement,t=/in/.test(s),e.detach().css({top:0,left:0,display:"block"}).insertAfter(this.$element),n=this.getPosition(t),r=e[0].offsetWidth,i=e[0].offsetHeight;switch(t?s.split(" ")[1]:s){case"bottom":o={top:n.top+n.height,left:n.left+n.width/2-r/2};break;case"top":o={top:n.top-i,left:n.left+n.width/2-r/2};break;case"left":o={top:n.top+n.height/2-i/2,left:n.left-r};break;case"right":o={top:n.top+n.height/2-i/2,left:n.left+n.width}}e.offset(o).addClass(s).addClass("in")}},setContent:function(){var e=this.tip(),t=this.getTitle();e.find(".tooltip-inner")[this.options.html?"html":"text"](t),e.removeClass("fade in top bottom left right")},hide:function(){function r(){var t=setTimeout(function(){n.off(e.support.transition.end).detach()},500);n.one(e.support.transition.end,function(){clearTimeout(t),n.detach()})}var t=this,n=this.tip();return n.removeClass("in"),e.support.transition&&this.$tip.hasClass("fade")?r():n.detach(),this},fixTitle:function(){var e=this.$element;(e.attr("title")||typeof e.attr("data-original-title")!="string")&&e.attr("data-original-title",e.attr("title")||"").removeAttr("title")},hasContent:function(){return this.getTitle()},getPosition:function(t){return e.extend({},t?{top:0,left:0}:this.$element.offset(),{width:this.$element[0].offsetWidth,height:this.$element[0].offsetHeight})},getTitle:function(){var e,t=this.$element,n=this.options;return e=t.attr("data-original-title")||(typeof n.title=="function"?n.title.call(t[0]):n.title),e},tip:function(){return this.$tip=this.$tip||e(this.options.template)},validate:function(){this.$element[0].parentNode||(this.hide(),this.$element=null,this.options=null)},enable:function(){this.enabled=!0},disable:function(){this.enabled=!1},toggleEnabled:function(){this.enabled=!this.enabled},toggle:function(t){var n=e(t.currentTarget)[this.type](this._options).data(this.type);n[n.tip().hasClass("in")?"hide":"show"]()},destroy:function(){this.hide().$element.off("."+this.type).removeData(this.type)}},e.fn.tooltip=function(n){return this.each(function(){var r=e(this),i=r.data("tooltip"),s=typeof n=="object"&&n;i||r.data("tooltip",i=new t(this,s)),typeof n=="string"&&i[n]()})},e.fn.tooltip.Constructor=t,e.fn.tooltip.defaults={animation:!0,placement:"top",selector:!1,template:'<div class="tooltip"><div class="tooltip-arrow"></div><div class="tooltip-inner"></div></div>',trigger:"hover",title:"",delay:0,html:!1}}(window.jQuery),!function(e){var t=function(e,t){this.init("popover",e,t)};t.prototype=e.extend({},e.fn.tooltip.Constructor.prototype,{constructor:t,setContent:function(){var e=this.tip(),t=this.getTitle(),n=this.getContent();e.find(".popover-title")[this.options.html?"html":"text"](t),e.find(".popover-content > *")[this.options.html?"html":"text"](n),e.removeClass("fade top bottom left right in")},hasContent:function(){return this.getTitle()||this.getContent()},getContent:function(){var e,t=this.$element,n=this.options;return e=t.attr("data-content")||(typeof n.content=="function"?n.content.call(t[0]):n.content),e},tip:function(){return this.$tip||(this.$tip=e(this.options.template)),this.$tip},destroy:function(){this.hide().$element.off("."+this.type).removeData(this.type)}}),e.fn.popover=function(n){return this.each(function(){var r=e(this),i=r.data("popover"),s=typeof n=="object"&&n;i||r.data("popover",i=new t(this,s)),typeof n=="string"&&i[n]()})},e.fn.popover.Constructor=t,e.fn.popover.defaults=e.extend({},e.fn.tooltip.defaults,{placement:"right",trigger:"click",content:"",template:'<div class="popover"><div class="arrow"></div><div class="popover-inner"><h3 class="popover-title"></h3><div class="popover-content"><p></p></div></div></div>'})}(window.jQuery),!function(e){function t(t,n){var r=e.proxy(this.process,this),i=e(t).is("body")?e(window):e(t),s;this.options=e.extend({},e.fn.scrollspy.defaults,n),this.$scrollElement=i.on("scroll.scroll-spy.data-api",r),this.selector=(this.options.target||(s=e(t).attr("href"))&&s.replace(/.*(?=#[^\s]+$)/,"")||"")+" .nav li > a",this.$body=e("body"),this.refresh(),this.process()}t.prototype={constructor:t,refresh:function(){var t=this,n;this.offsets=e([]),this.targets=e([]),n=this.$body.find(this.selector).map(function(){var t=e(this),n=t.data("target")||t.attr("href"),r=/^#\w/.test(n)&&e(n);return r&&r.length&&[[r.position().top,n]]||null}).sort(function(e,t){return e[0]-t[0]}).each(function(){t.offsets.push(this[0]),t.targets.push(this[1])})},process:function(){var e=this.$scrollElement.scrollTop()+this.options.offset,t=this.$scrollElement[0].scrollHeight||this.$body[0].scrollHeight,n=t-this.$scrollElement.height(),r=this.offsets,i=this.targets,s=this.activeTarget,o;if(e>=n)return s!=(o=i.last()[0])&&this.activate(o);for(o=r.length;o--;)s!=i[o]&&e>=r[o]&&(!r[o+1]||e<=r[o+1])&&this.activate(i[o])},activate:function(t){var n,r;this.activeTarget=t,e(this.selector).parent(".active").removeClass("active"),r=this.selector+'[data-target="'+t+'"],'+this.selector+'[href="'+t+'"]',n=e(r).parent("li").addClass("active"),n.parent(".dropdown-menu").length&&(n=n.closest("li.dropdown").addClass("active")),n.trigger("activate")}},e.fn.scrollspy=function(n){return this.each(function(){var r=e(this),i=r.data("scrollspy"),s=typeof n=="object"&&n;i||r.data("scrollspy",i=new t(this,s)),typeof n=="string"&&i[n]()})},e.fn.scrollspy.Constructor=t,e.fn.scrollspy.defaults={offset:10},e(window).on("load",function(){e('[data-spy="scroll"]').each(function(){var t=e(this);t.scrollspy(t.data())})})}(window.jQuery),!function(e){var t=function(t){this.element=e(t)};t.prototype={constructor:t,show:function(){var t=this.element,n=t.closest("ul:not(.dropdown-menu)"),r=t.attr("data-target"),i,s,o;r||(r=t.attr("href"),r=r&&r.replace(/.*(?=#[^\s]*$)/,""));if(t.parent("li").hasClass("active"))return;i=n.find(".active:last a")[0],o=e.Event("show",{relatedTarget:i}),t.trigger(o);if(o.isDefaultPrevented())return;s=e(r),this.activate(t.parent("li"),n),this.activate(s,s.parent(),function(){t.trigger({type:"shown",relatedTarget:i})})},activate:function(t,n,r){function o(){i.removeClass("active").find("> .dropdown-menu > .active").removeClass("active"),t.addClass("active"),s?(t[0].offsetWidth,t.addClass("in")):t.removeClass("fade"),t.parent(".dropdown-menu")&&t.closest("li.dropdown").addClass("active"),r&&r()}var i=n.find("> .active"),s=r&&e.support.transition&&i.hasClass("fade");s?i.one(e.support.transition.end,o):o(),i.removeClass("in")}},e.fn.tab=function(n){return this.each(function(){var r=e(this),i=r.data("tab");i||r.data("tab",i=new t(this)),typeof n=="string"&&i[n]()})},e.fn.tab.Constructor=t,e(document).on("click.tab.data-api",'[data-toggle="tab"], [data-toggle="pill"]',function(t){t.preventDefault(),e(this).tab("show")})}(window.jQuery),!function(e){var t=function(t,n){this.$element=e(t),this.options=e.extend({},e.fn.typeahead.defaults,n),this.matcher=this.options.matcher||this.matcher,this.sorter=this.options.sorter||this.sorter,this.highlighter=this.options.highlighter||this.highlighter,this.updater=this.options.updater||this.updater,this.$menu=e(this.options.menu).appendTo("body"),this.source=this.options.source,this.shown=!1,this.listen()};t.prototype={constructor:t,select:function(){var e=this.$menu.find(".active").attr("data-value");return this.$element.val(this.updater(e)).change(),this.hide()},updater:function(e){return e},show:function(){var t=e.extend({},this.$element.offset(),{height:this.$element[0].offsetHeight});return this.$menu.css({top:t.top+t.height,left:t.left}),this.$menu.show(),this.shown=!0,this},hide:function(){return this.$menu.hide(),this.shown=!1,this},lookup:function(t){var n;return this.query=this.$element.val(),!this.query||this.query.length<this.options.minLength?this.shown?this.hide():this:(n=e.isFunction(this.source)?this.source(this.query,e.proxy(this.process,this)):this.source,n?this.process(n):this)},process:function(t){var n=this;return t=e.grep(t,function(e){return n.matcher(e)}),t=this.sorter(t),t.length?this.render(t.slice(0,this.options.items)).show():this.shown?this.hide():this},matcher:function(e){return~e.toLowerCase().indexOf(this.query.toLowerCase())},sorter:function(e){var t=[],n=[],r=[],i;while(i=e.shift())i.toLowerCase().indexOf(this.query.toLowerCase())?~i.indexOf(this.query)?n.push(i):r.push(i):t.push(i);return t.concat(n,r)},highlighter:function(e){var t=this.query.replace(/[\-\[\]{}()*+?.,\\\^$|#\s]/g,"\\$&");return e.replace(new RegExp("("+t+")","ig"),function(e,t){return"<strong>"+t+"</strong>"})},render:function(t){var n=this;return t=e(t).map(function(t,r){return t=e(n.options.item).attr("data-value",r),t.find("a").html(n.highlighter(r)),t[0]}),t.first().addClass("active"),this.$menu.html(t),this},next:function(t){var n=this.$menu.find(".active").removeClass("active"),r=n.next();r.length||(r=e(this.$menu.find("li")[0])),r.addClass("active")},prev:function(e){var t=this.$menu.find(".active").removeClass("active"),n=t.prev();n.length||(n=this.$menu.find("li").last()),n.addClass("active")},listen:function(){this.$element.on("blur",e.proxy(this.blur,this)).on("keypress",e.proxy(this.keypress,this)).on("keyup",e.proxy(this.keyup,this)),this.eventSupported("keydown")&&this.$element.on("keydown",e.proxy(this.keydown,this)),this.$menu.on("click",e.proxy(this.click,this)).on("mouseenter","li",e.proxy(this.mouseenter,this))},eventSupported:function(e){var t=e in this.$element;return t||(this.$element.setAttribute(e,"return;"),t=typeof this.$element[e]=="function"),t},move:function(e){if(!this.shown)return;switch(e.keyCode){case 9:case 13:case 27:e.preventDefault();break;case 38:e.preventDefault(),this.prev();break;case 40:e.preventDefault(),this.next()}e.stopPropagation()},keydown:function(t){this.suppressKeyPressRepeat=!~e.inArray(t.keyCode,[40,38,9,13,27]),this.move(t)},keypress:function(e){if(this.suppressKeyPressRepeat)return;this.move(e)},keyup:function(e){switch(e.keyCode){case 40:case 38:case 16:case 17:case 18:break;case 9:case 13:if(!this.shown)return;this.select();break;case 27:if(!this.shown)return;this.hide();break;default:this.lookup()}e.stopPropagation(),e.preventDefault()},blur:function(e){var t=this;setTimeout(function(){t.hide()},150)},click:function(e){e.stopPropagation(),e.preventDefault(),this.select()},mouseenter:function(t){this.$menu.find(".active").removeClass("active"),e(t.currentTarget).addClass("active")}},e.fn.typeahead=function(n){return this.each(function(){var r=e(this),i=r.data("typeahead"),s=typeof n=="object"&&n;i||r.data("typeahead",i=new t(this,s)),typeof n=="string"&&i[n]()})},e.fn.typeahead.defaults={source:[],items:8,menu:'<ul class="typeahead dropdown-menu"></ul>',item:'<li><a href="#"></a></li>',minLength:1},e.fn.typeahead.Constructor=t,e(document).on("focus.typeahead.data-api",'[data-provide="typeahead"]',function(t){var n=e(this);if(n.data("typeahead"))return;t.preventDefault(),n.typeahead(n.data())})}(window.jQuery),!function(e){var t=function(t,n){this.options=e.extend({},e.fn.affix.defaults,n),this.$window=e(window).on("scroll.affix.data-api",e.proxy(this.checkPosition,this)).on("click.affix.data-api",e.proxy(function(){setTimeout(e.proxy(this.checkPosition,this),1)},this)),this.$element=e(t),this.checkPosition()};t.prototype.checkPosition=function(){if(!this.$element.is(":visible"))return;var t=e(document).height(),n=this.$window.scrollTop(),r=this.$element.offset(),i=this.options.offset,s=i.bottom,o=i.top,u="affix affix-top affix-bottom",a;typeof i!="object"&&(s=o=i),typeof o=="function"&&(o=i.top()),typeof s=="function"&&(s=i.bottom()),a=this.unpin!=null&&n+this.unpin<=r.top?!1:s!=null&&r.top+this.$element.height()>=t-s?"bottom":o!=null&&n<=o?"top":!1;if(this.affixed===a)return;this.affixed=a,this.unpin=a=="bottom"?r.top-n:null,this.$element.removeClass(u).addClass("affix"+(a?"-"+a:""))},e.fn.affix=function(n){return this.each(function(){var r=e(this),i=r.data("affix"),s=typeof n=="object"&&n;i||r.data("affix",i=new t(this,s)),typeof n=="string"&&i[n]()})},e.fn.affix.Constructor=t,e.fn.affix.defaults={offset:0},e(window).on("load",function(){e('[data-spy="affix"]').each(function(){var t=e(this),n=t.data();n.offset=n.offset||{},n.offsetBottom&&(n.offset.bottom=n.offsetBottom),n.offsetTop&&(n.offset.top=n.offsetTop),t.affix(n)})})}(window.jQuery),define("jquery.bootstrap",function(){}),function(e){e.color={},e.color.make=function(t,n,r,i){var s={};return s.r=t||0,s.g=n||0,s.b=r||0,s.a=i!=null?i:1,s.add=function(e,t){for(var n=0;n<e.length;++n)s[e.charAt(n)]+=t;return s.normalize()},s.scale=function(e,t){for(var n=0;n<e.length;++n)s[e.charAt(n)]*=t;return s.normalize()},s.toString=function(){return s.a>=1?"rgb("+[s.r,s.g,s.b].join(",")+")":"rgba("+[s.r,s.g,s.b,s.a].join(",")+")"},s.normalize=function(){function e(e,t,n){return t<e?e:t>n?n:t}return s.r=e(0,parseInt(s.r),255),s.g=e(0,parseInt(s.g),255),s.b=e(0,parseInt(s.b),255),s.a=e(0,s.a,1),s},s.clone=function(){return e.color.make(s.r,s.b,s.g,s.a)},s.normalize()},e.color.extract=function(t,n){var r;do{r=t.css(n).toLowerCase();if(r!=""&&r!="transparent")break;t=t.parent()}while(!e.nodeName(t.get(0),"body"));return r=="rgba(0, 0, 0, 0)"&&(r="transparent"),e.color.parse(r)},e.color.parse=function(n){var r,i=e.color.make;if(r=/rgb\(\s*([0-9]{1,3})\s*,\s*([0-9]{1,3})\s*,\s*([0-9]{1,3})\s*\)/.exec(n))return i(parseInt(r[1],10),parseInt(r[2],10),parseInt(r[3],10));if(r=/rgba\(\s*([0-9]{1,3})\s*,\s*([0-9]{1,3})\s*,\s*([0-9]{1,3})\s*,\s*([0-9]+(?:\.[0-9]+)?)\s*\)/.exec(n))return i(parseInt(r[1],10),parseInt(r[2],10),parseInt(r[3],10),parseFloat(r[4]));if(r=/rgb\(\s*([0-9]+(?:\.[0-9]+)?)\%\s*,\s*([0-9]+(?:\.[0-9]+)?)\%\s*,\s*([0-9]+(?:\.[0-9]+)?)\%\s*\)/.exec(n))return i(parseFloat(r[1])*2.55,parseFloat(r[2])*2.55,parseFloat(r[3])*2.55);if(r=/rgba\(\s*([0-9]+(?:\.[0-9]+)?)\%\s*,\s*([0-9]+(?:\.[0-9]+)?)\%\s*,\s*([0-9]+(?:\.[0-9]+)?)\%\s*,\s*([0-9]+(?:\.[0-9]+)?)\s*\)/.exec(n))return i(parseFloat(r[1])*2.55,parseFloat(r[2])*2.55,parseFloat(r[3])*2.55,parseFloat(r[4]));if(r=/#([a-fA-F0-9]{2})([a-fA-F0-9]{2})([a-fA-F0-9]{2})/.exec(n))return i(parseInt(r[1],16),parseInt(r[2],16),parseInt(r[3],16));if(r=/#([a-fA-F0-9])([a-fA-F0-9])([a-fA-F0-9])/.exec(n))return i(parseInt(r[1]+r[1],16),parseInt(r[2]+r[2],16),parseInt(r[3]+r[3],16));var s=e.trim(n).toLowerCase();return s=="transparent"?i(255,255,255,0):(r=t[s]||[0,0,0],i(r[0],r[1],r[2]))};var t={aqua:[0,255,255],azure:[240,255,255],beige:[245,245,220],black:[0,0,0],blue:[0,0,255],brown:[165,42,42],cyan:[0,255,255],darkblue:[0,0,139],darkcyan:[0,139,139],darkgrey:[169,169,169],darkgreen:[0,100,0],darkkhaki:[189,183,107],darkmagenta:[139,0,139],darkolivegreen:[85,107,47],darkorange:[255,140,0],darkorchid:[153,50,204],darkred:[139,0,0],darksalmon:[233,150,122],darkviolet:[148,0,211],fuchsia:[255,0,255],gold:[255,215,0],green:[0,128,0],indigo:[75,0,130],khaki:[240,230,140],lightblue:[173,216,230],lightcyan:[224,255,255],lightgreen:[144,238,144],lightgrey:[211,211,211],lightpink:[255,182,193],lightyellow:[255,255,224],lime:[0,255,0],magenta:[255,0,255],maroon:[128,0,0],navy:[0,0,128],olive:[128,128,0],orange:[255,165,0],pink:[255,192,203],purple:[128,0,128],violet:[128,0,128],red:[255,0,0],silver:[192,192,192],white:[255,255,255],yellow:[255,255,0]}}(jQuery),function(e){function t(t,r,s,o){function x(e,t){t=[S].concat(t);for(var n=0;n<e.length;++n)e[n].apply(this,t)}function T(){for(var t=0;t<o.length;++t){var n=o[t];n.init(S),n.options&&e.extend(!0,a,n.options)}}function N(t){var n;e.extend(!0,a,t),a.xaxis.color==null&&(a.xaxis.color=a.grid.color),a.yaxis.color==null&&(a.yaxis.color=a.grid.color),a.xaxis.tickColor==null&&(a.xaxis.tickColor=a.grid.tickColor),a.yaxis.tickColor==null&&(a.yaxis.tickColor=a.grid.tickColor),a.grid.borderColor==null&&(a.grid.borderColor=a.grid.color),a.grid.tickColor==null&&(a.grid.tickColor=e.color.parse(a.grid.color).scale("a",.22).toString());for(n=0;n<Math.max(1,a.xaxes.length);++n)a.xaxes[n]=e.extend(!0,{},a.xaxis,a.xaxes[n]);for(n=0;n<Math.max(1,a.yaxes.length);++n)a.yaxes[n]=e.extend(!0,{},a.yaxis,a.yaxes[n]);a.xaxis.noTicks&&a.xaxis.ticks==null&&(a.xaxis.ticks=a.xaxis.noTicks),a.yaxis.noTicks&&a.yaxis.ticks==null&&(a.yaxis.ticks=a.yaxis.noTicks),a.x2axis&&(a.xaxes[1]=e.extend(!0,{},a.xaxis,a.x2axis),a.xaxes[1].position="top"),a.y2axis&&(a.yaxes[1]=e.extend(!0,{},a.yaxis,a.y2axis),a.yaxes[1].position="right"),a.grid.coloredAreas&&(a.grid.markings=a.grid.coloredAreas),a.grid.coloredAreasColor&&(a.grid.markingsColor=a.grid.coloredAreasColor),a.lines&&e.extend(!0,a.series.lines,a.lines),a.points&&e.extend(!0,a.series.points,a.points),a.bars&&e.extend(!0,a.series.bars,a.bars),a.shadowSize!=null&&(a.series.shadowSize=a.shadowSize);for(n=0;n<a.xaxes.length;++n)_(d,n+1).options=a.xaxes[n];for(n=0;n<a.yaxes.length;++n)_(v,n+1).options=a.yaxes[n];for(var r in E)a.hooks[r]&&a.hooks[r].length&&(E[r]=E[r].concat(a.hooks[r]));x(E.processOptions,[a])}function C(e){u=k(e),D(),P()}function k(t){var n=[];for(var r=0;r<t.length;++r){var i=e.extend(!0,{},a.series);t[r].data!=null?(i.data=t[r].data,delete t[r].data,e.extend(!0,i,t[r]),t[r].data=i.data):i.data=t[r],n.push(i)}return n}function L(e,t){var n=e[t+"axis"];return typeof n=="object"&&(n=n.n),typeof n!="number"&&(n=1),n}function A(){return e.grep(d.concat(v),function(e){return e})}function O(e){var t={},n,r;for(n=0;n<d.length;++n)r=d[n],r&&r.used&&(t["x"+r.n]=r.c2p(e.left));for(n=0;n<v.length;++n)r=v[n],r&&r.used&&(t["y"+r.n]=r.c2p(e.top));return t.x1!==undefined&&(t.x=t.x1),t.y1!==undefined&&(t.y=t.y1),t}function M(e){var t={},n,r,i;for(n=0;n<d.length;++n){r=d[n];if(r&&r.used){i="x"+r.n,e[i]==null&&r.n==1&&(i="x");if(e[i]!=null){t.left=r.p2c(e[i]);break}}}for(n=0;n<v.length;++n){r=v[n];if(r&&r.used){i="y"+r.n,e[i]==null&&r.n==1&&(i="y");if(e[i]!=null){t.top=r.p2c(e[i]);break}}}return t}function _(t,n){return t[n-1]||(t[n-1]={n:n,direction:t==d?"x":"y",options:e.extend(!0,{},t==d?a.xaxis:a.yaxis)}),t[n-1]}function D(){var t,n=u.length,r=[],i=[];for(t=0;t<u.length;++t){var s=u[t].color;s!=null&&(--n,typeof s=="number"?i.push(s):r.push(e.color.parse(u[t].color)))}for(t=0;t<i.length;++t)n=Math.max(n,i[t]+1);var o=[],f=0;t=0;while(o.length<n){var l;a.colors.length==t?l=e.color.make(100,100,100):l=e.color.parse(a.colors[t]);var c=f%2==1?-1:1;l.scale("rgb",1+c*Math.ceil(f/2)*.2),o.push(l),++t,t>=a.colors.length&&(t=0,++f)}var h=0,p;for(t=0;t<u.length;++t){p=u[t],p.color==null?(p.color=o[h].toString(),++h):typeof p.color=="number"&&(p.color=o[p.color].toString());if(p.lines.show==null){var m,g=!0;for(m in p)if(p[m]&&p[m].show){g=!1;break}g&&(p.lines.show=!0)}p.xaxis=_(d,L(p,"x")),p.yaxis=_(v,L(p,"y"))}}function P(){function b(e,t,n){t<e.datamin&&t!=-r&&(e.datamin=t),n>e.datamax&&n!=r&&(e.datamax=n)}var t=Number.POSITIVE_INFINITY,n=Number.NEGATIVE_INFINITY,r=Number.MAX_VALUE,i,s,o,a,f,l,c,h,p,d,v,m,g,y;e.each(A(),function(e,r){r.datamin=t,r.datamax=n,r.used=!1});for(i=0;i<u.length;++i)l=u[i],l.datapoints={points:[]},x(E.processRawData,[l,l.data,l.datapoints]);for(i=0;i<u.length;++i){l=u[i];var w=l.data,S=l.datapoints.format;if(!S){S=[],S.push({x:!0,number:!0,required:!0}),S.push({y:!0,number:!0,required:!0});if(l.bars.show||l.lines.show&&l.lines.fill)S.push({y:!0,number:!0,required:!1,defaultValue:0}),l.bars.horizontal&&(delete S[S.length-1].y,S[S.length-1].x=!0);l.datapoints.format=S}if(l.datapoints.pointsize!=null)continue;l.datapoints.pointsize=S.length,h=l.datapoints.pointsize,c=l.datapoints.points,insertSteps=l.lines.show&&l.lines.steps,l.xaxis.used=l.yaxis.used=!0;for(s=o=0;s<w.length;++s,o+=h){y=w[s];var T=y==null;if(!T)for(a=0;a<h;++a)m=y[a],g=S[a],g&&(g.number&&m!=null&&(m=+m,isNaN(m)?m=null:m==Infinity?m=r:m==-Infinity&&(m=-r)),m==null&&(g.required&&(T=!0),g.defaultValue!=null&&(m=g.defaultValue))),c[o+a]=m;if(T)for(a=0;a<h;++a)m=c[o+a],m!=null&&(g=S[a],g.x&&b(l.xaxis,m,m),g.y&&b(l.yaxis,m,m)),c[o+a]=null;else if(insertSteps&&o>0&&c[o-h]!=null&&c[o-h]!=c[o]&&c[o-h+1]!=c[o+1]){for(a=0;a<h;++a)c[o+h+a]=c[o+a];c[o+1]=c[o-h+1],o+=h}}}for(i=0;i<u.length;++i)l=u[i],x(E.processDatapoints,[l,l.datapoints]);for(i=0;i<u.length;++i){l=u[i],c=l.datapoints.points,h=l.datapoints.pointsize;var N=t,C=t,k=n,L=n;for(s=0;s<c.length;s+=h){if(c[s]==null)continue;for(a=0;a<h;++a){m=c[s+a],g=S[a];if(!g||m==r||m==-r)continue;g.x&&(m<N&&(N=m),m>k&&(k=m)),g.y&&(m<C&&(C=m),m>L&&(L=m))}}if(l.bars.show){var O=l.bars.align=="left"?0:-l.bars.barWidth/2;l.bars.horizontal?(C+=O,L+=O+l.bars.barWidth):(N+=O,k+=O+l.bars.barWidth)}b(l.xaxis,N,k),b(l.yaxis,C,L)}e.each(A(),function(e,r){r.datamin==t&&(r.datamin=null),r.datamax==n&&(r.datamax=null)})}function H(n,r){var i=document.createElement("canvas");return i.className=r,i.width=g,i.height=y,n||e(i).css({position:"absolute",left:0,top:0}),e(i).appendTo(t),i.getContext||(i=window.G_vmlCanvasManager.initElement(i)),i.getContext("2d").save(),i}function B(){g=t.width(),y=t.height();if(g<=0||y<=0)throw"Invalid dimensions for plot, width = "+g+", height = "+y}function j(e){e.width!=g&&(e.width=g),e.height!=y&&(e.height=y);var t=e.getContext("2d");t.restore(),t.save()}function F(){var n,r=t.children("canvas.base"),i=t.children("canvas.overlay");r.length==0||i==0?(t.html(""),t.css({padding:0}),t.css("position")=="static"&&t.css("position","relative"),B(),f=H(!0,"base"),l=H(!1,"overlay"),n=!1):(f=r.get(0),l=i.get(0),n=!0),h=f.getContext("2d"),p=l.getContext("2d"),c=e([l,f]),n&&(t.data("plot").shutdown(),S.resize(),p.clearRect(0,0,g,y),c.unbind(),t.children().not([f,l]).remove()),t.data("plot",S)}function I(){a.grid.hoverable&&(c.mousemove(ht),c.mouseleave(pt)),a.grid.clickable&&c.click(dt),x(E.bindEvents,[c])}function q(){lt&&clearTimeout(lt),c.unbind("mousemove",ht),c.unbind("mouseleave",pt),c.unbind("click",dt),x(E.shutdown,[c])}function R(e){function t(e){return e}var n,r,i=e.options.transform||t,s=e.options.inverseTransform;e.direction=="x"?(n=e.scale=b/Math.abs(i(e.max)-i(e.min)),r=Math.min(i(e.max),i(e.min))):(n=e.scale=w/Math.abs(i(e.max)-i(e.min)),n=-n,r=Math.max(i(e.max),i(e.min))),i==t?e.p2c=function(e){return(e-r)*n}:e.p2c=function(e){return(i(e)-r)*n},s?e.c2p=function(e){return s(r+e/n)}:e.c2p=function(e){return r+e/n}}function U(n){function c(r,i){return e('<div style="position:absolute;top:-10000px;'+i+'font-size:smaller">'+'<div class="'+n.direction+"Axis "+n.direction+n.n+'Axis">'+r.join("")+"</div></div>").appendTo(t)}var r=n.options,i,s=n.ticks||[],o=[],u,a=r.labelWidth,f=r.labelHeight,l;if(n.direction=="x"){a==null&&(a=Math.floor(g/(s.length>0?s.length:1)));if(f==null){o=[];for(i=0;i<s.length;++i)u=s[i].label,u&&o.push('<div class="tickLabel" style="float:left;width:'+a+'px">'+u+"</div>");o.length>0&&(o.push('<div style="clear:left"></div>'),l=c(o,"width:10000px;"),f=l.height(),l.remove())}}else if(a==null||f==null){for(i=0;i<s.length;++i)u=s[i].label,u&&o.push('<div class="tickLabel">'+u+"</div>");o.length>0&&(l=c(o,""),a==null&&(a=l.children().width()),f==null&&(f=l.find("div.tickLabel").height()),l.remove())}a==null&&(a=0),f==null&&(f=0),n.labelWidth=a,n.labelHeight=f}function z(t){var n=t.labelWidth,r=t.labelHeight,i=t.options.position,s=t.options.tickLength,o=a.grid.axisMargin,u=a.grid.labelMargin,f=t.direction=="x"?d:v,l,c=e.grep(f,function(e){return e&&e.options.position==i&&e.reserveSpace});e.inArray(t,c)==c.length-1&&(o=0),s==null&&(s="full");var h=e.grep(f,function(e){return e&&e.reserveSpace}),p=e.inArray(t,h)==0;!p&&s=="full"&&(s=5),isNaN(+s)||(u+=+s),t.direction=="x"?(r+=u,i=="bottom"?(m.bottom+=r+o,t.box={top:y-m.bottom,height:r}):(t.box={top:m.top+o,height:r},m.top+=r+o)):(n+=u,i=="left"?(t.box={left:m.left+o,width:n},m.left+=n+o):(m.right+=n+o,t.box={left:g-m.right,width:n})),t.position=i,t.tickLength=s,t.box.padding=u,t.innermost=p}function W(e){e.direction=="x"?(e.box.left=m.left,e.box.width=b):(e.box.top=m.top,e.box.height=w)}function X(){var t,n=A();e.each(n,function(e,t){t.show=t.options.show,t.show==null&&(t.show=t.used),t.reserveSpace=t.show||t.options.reserveSpace,V(t)}),allocatedAxes=e.grep(n,function(e){return e.reserveSpace}),m.left=m.right=m.top=m.bottom=0;if(a.grid.show){e.each(allocatedAxes,function(e,t){J(t),K(t),Q(t,t.ticks),U(t)});for(t=allocatedAxes.length-1;t>=0;--t)z(allocatedAxes[t]);var r=a.grid.minBorderMargin;if(r==null){r=0;for(t=0;t<u.length;++t)r=Math.max(r,u[t].points.radius+u[t].points.lineWidth/2)}for(var i in m)m[i]+=a.grid.borderWidth,m[i]=Math.max(r,m[i])}b=g-m.left-m.right,w=y-m.bottom-m.top,e.each(n,function(e,t){R(t)}),a.grid.show&&(e.each(allocatedAxes,function(e,t){W(t)}),tt()),at()}function V(e){var t=e.options,n=+(t.min!=null?t.min:e.datamin),r=+(t.max!=null?t.max:e.datamax),i=r-n;if(i==0){var s=r==0?1:.01;t.min==null&&(n-=s);if(t.max==null||t.min!=null)r+=s}else{var o=t.autoscaleMargin;o!=null&&(t.min==null&&(n-=i*o,n<0&&e.datamin!=null&&e.datamin>=0&&(n=0)),t.max==null&&(r+=i*o,r>0&&e.datamax!=null&&e.datamax<=0&&(r=0)))}e.min=n,e.max=r}function J(t){var r=t.options,i;typeof r.ticks=="number"&&r.ticks>0?i=r.ticks:i=.3*Math.sqrt(t.direction=="x"?g:y);var s=(t.max-t.min)/i,o,u,a,f,l,c,h;if(r.mode=="time"){var p={second:1e3,minute:6e4,hour:36e5,day:864e5,month:2592e6,year:525949.2*60*1e3},m=[[1,"second"],[2,"second"],[5,"second"],[10,"second"],[30,"second"],[1,"minute"],[2,"minute"],[5,"minute"],[10,"minute"],[30,"minute"],[1,"hour"],[2,"hour"],[4,"hour"],[8,"hour"],[12,"hour"],[1,"day"],[2,"day"],[3,"day"],[.25,"month"],[.5,"month"],[1,"month"],[2,"month"],[3,"month"],[6,"month"],[1,"year"]],b=0;r.minTickSize!=null&&(typeof r.tickSize=="number"?b=r.tickSize:b=r.minTickSize[0]*p[r.minTickSize[1]]);for(var l=0;l<m.length-1;++l)if(s<(m[l][0]*p[m[l][1]]+m[l+1][0]*p[m[l+1][1]])/2&&m[l][0]*p[m[l][1]]>=b)break;o=m[l][0],a=m[l][1],a=="year"&&(c=Math.pow(10,Math.floor(Math.log(s/p.year)/Math.LN10)),h=s/p.year/c,h<1.5?o=1:h<3?o=2:h<7.5?o=5:o=10,o*=c),t.tickSize=r.tickSize||[o,a],u=function(e){var t=[],r=e.tickSize[0],i=e.tickSize[1],s=new Date(e.min),o=r*p[i];i=="second"&&s.setUTCSeconds(n(s.getUTCSeconds(),r)),i=="minute"&&s.setUTCMinutes(n(s.getUTCMinutes(),r)),i=="hour"&&s.setUTCHours(n(s.getUTCHours(),r)),i=="month"&&s.setUTCMonth(n(s.getUTCMonth(),r)),i=="year"&&s.setUTCFullYear(n(s.getUTCFullYear(),r)),s.setUTCMilliseconds(0),o>=p.minute&&s.setUTCSeconds(0),o>=p.hour&&s.setUTCMinutes(0),o>=p.day&&s.setUTCHours(0),o>=p.day*4&&s.setUTCDate(1),o>=p.year&&s.setUTCMonth(0);var u=0,a=Number.NaN,f;do{f=a,a=s.getTime(),t.push(a);if(i=="month")if(r<1){s.setUTCDate(1);var l=s.getTime();s.setUTCMonth(s.getUTCMonth()+1);var c=s.getTime();s.setTime(a+u*p.hour+(c-l)*r),u=s.getUTCHours(),s.setUTCHours(0)}else s.setUTCMonth(s.getUTCMonth()+r);else i=="year"?s.setUTCFullYear(s.getUTCFullYear()+r):s.setTime(a+o)}while(a<e.max&&a!=f);return t},f=function(t,n){var i=new Date(t);if(r.timeformat!=null)return e.plot.formatDate(i,r.timeformat,r.monthNames);var s=n.tickSize[0]*p[n.tickSize[1]],o=n.max-n.min,u=r.twelveHourClock?" %p":"";return s<p.minute?fmt="%h:%M:%S"+u:s<p.day?o<2*p.day?fmt="%h:%M"+u:fmt="%b %d %h:%M"+u:s<p.month?fmt="%b %d":s<p.year?o<p.year?fmt="%b":fmt="%b %y":fmt="%y",e.plot.formatDate(i,fmt,r.monthNames)}}else{var w=r.tickDecimals,E=-Math.floor(Math.log(s)/Math.LN10);w!=null&&E>w&&(E=w),c=Math.pow(10,-E),h=s/c,h<1.5?o=1:h<3?(o=2,h>2.25&&(w==null||E+1<=w)&&(o=2.5,++E)):h<7.5?o=5:o=10,o*=c,r.minTickSize!=null&&o<r.minTickSize&&(o=r.minTickSize),t.tickDecimals=Math.max(0,w!=null?w:E),t.tickSize=r.tickSize||o,u=function(e){var t=[],r=n(e.min,e.tickSize),i=0,s=Number.NaN,o;do o=s,s=r+i*e.tickSize,t.push(s),++i;while(s<e.max&&s!=o);return t},f=function(e,t){return e.toFixed(t.tickDecimals)}}if(r.alignTicksWithAxis!=null){var S=(t.direction=="x"?d:v)[r.alignTicksWithAxis-1];if(S&&S.used&&S!=t){var x=u(t);x.length>0&&(r.min==null&&(t.min=Math.min(t.min,x[0])),r.max==null&&x.length>1&&(t.max=Math.max(t.max,x[x.length-1]))),u=function(e){var t=[],n,r;for(r=0;r<S.ticks.length;++r)n=(S.ticks[r].v-S.min)/(S.max-S.min),n=e.min+n*(e.max-e.min),t.push(n);return t};if(t.mode!="time"&&r.tickDecimals==null){var T=Math.max(0,-Math.floor(Math.log(s)/Math.LN10)+1),N=u(t);N.length>1&&/\..*0$/.test((N[1]-N[0]).toFixed(T))||(t.tickDecimals=T)}}}t.tickGenerator=u,e.isFunction(r.tickFormatter)?t.tickFormatter=function(e,t){return""+r.tickFormatter(e,t)}:t.tickFormatter=f}function K(t){var n=t.options.ticks,r=[];n==null||typeof n=="number"&&n>0?r=t.tickGenerator(t):n&&(e.isFunction(n)?r=n({min:t.min,max:t.max}):r=n);var i,s;t.ticks=[];for(i=0;i<r.length;++i){var o=null,u=r[i];typeof u=="object"?(s=+u[0],u.length>1&&(o=u[1])):s=+u,o==null&&(o=t.tickFormatter(s,t)),isNaN(s)||t.ticks.push({v:s,label:o})}}function Q(e,t){e.options.autoscaleMargin&&t.length>0&&(e.options.min==null&&(e.min=Math.min(e.min,t[0].v)),e.options.max==null&&t.length>1&&(e.max=Math.max(e.max,t[t.length-1].v)))}function G(){h.clearRect(0,0,g,y);var e=a.grid;e.show&&e.backgroundColor&&Z(),e.show&&!e.aboveData&&et();for(var t=0;t<u.length;++t)x(E.drawSeries,[h,u[t]]),nt(u[t]);x(E.draw,[h]),e.show&&e.aboveData&&et()}function Y(e,t){var n,r,s,o,u=A();for(i=0;i<u.length;++i){n=u[i];if(n.direction==t){o=t+n.n+"axis",!e[o]&&n.n==1&&(o=t+"axis");if(e[o]){r=e[o].from,s=e[o].to;break}}}e[o]||(n=t=="x"?d[0]:v[0],r=e[t+"1"],s=e[t+"2"]);if(r!=null&&s!=null&&r>s){var a=r;r=s,s=a}return{from:r,to:s,axis:n}}function Z(){h.save(),h.translate(m.left,m.top),h.fillStyle=xt(a.grid.backgroundColor,w,0,"rgba(255, 255, 255, 0)"),h.fillRect(0,0,b,w),h.restore()}function et(){var t;h.save(),h.translate(m.left,m.top);var n=a.grid.markings;if(n){if(e.isFunction(n)){var r=S.getAxes();r.xmin=r.xaxis.min,r.xmax=r.xaxis.max,r.ymin=r.yaxis.min,r.ymax=r.yaxis.max,n=n(r)}for(t=0;t<n.length;++t){var i=n[t],s=Y(i,"x"),o=Y(i,"y");s.from==null&&(s.from=s.axis.min),s.to==null&&(s.to=s.axis.max),o.from==null&&(o.from=o.axis.min),o.to==null&&(o.to=o.axis.max);if(s.to<s.axis.min||s.from>s.axis.max||o.to<o.axis.min||o.from>o.axis.max)continue;s.from=Math.max(s.from,s.axis.min),s.to=Math.min(s.to,s.axis.max),o.from=Math.max(o.from,o.axis.min),o.to=Math.min(o.to,o.axis.max);if(s.from==s.to&&o.from==o.to)continue;s.from=s.axis.p2c(s.from),s.to=s.axis.p2c(s.to),o.from=o.axis.p2c(o.from),o.to=o.axis.p2c(o.to),s.from==s.to||o.from==o.to?(h.beginPath(),h.strokeStyle=i.color||a.grid.markingsColor,h.lineWidth=i.lineWidth||a.grid.markingsLineWidth,h.moveTo(s.from,o.from),h.lineTo(s.to,o.to),h.stroke()):(h.fillStyle=i.color||a.grid.markingsColor,h.fillRect(s.from,o.to,s.to-s.from,o.from-o.to))}}var r=A(),u=a.grid.borderWidth;for(var f=0;f<r.length;++f){var l=r[f],c=l.box,p=l.tickLength,d,v,g,y;if(!l.show||l.ticks.length==0)continue;h.strokeStyle=l.options.tickColor||e.color.parse(l.options.color).scale("a",.22).toString(),h.lineWidth=1,l.direction=="x"?(d=0,p=="full"?v=l.position=="top"?0:w:v=c.top-m.top+(l.position=="top"?c.height:0)):(v=0,p=="full"?d=l.position=="left"?0:b:d=c.left-m.left+(l.position=="left"?c.width:0)),l.innermost||(h.beginPath(),g=y=0,l.direction=="x"?g=b:y=w,h.lineWidth==1&&(d=Math.floor(d)+.5,v=Math.floor(v)+.5),h.moveTo(d,v),h.lineTo(d+g,v+y),h.stroke()),h.beginPath();for(t=0;t<l.ticks.length;++t){var E=l.ticks[t].v;g=y=0;if(E<l.min||E>l.max||p=="full"&&u>0&&(E==l.min||E==l.max))continue;l.direction=="x"?(d=l.p2c(E),y=p=="full"?-w:p,l.position=="top"&&(y=-y)):(v=l.p2c(E),g=p=="full"?-b:p,l.position=="left"&&(g=-g)),h.lineWidth==1&&(l.direction=="x"?d=Math.floor(d)+.5:v=Math.floor(v)+.5),h.moveTo(d,v),h.lineTo(d+g,v+y)}h.stroke()}u&&(h.lineWidth=u,h.strokeStyle=a.grid.borderColor,h.strokeRect(-u/2,-u/2,b+u,w+u)),h.restore()}function tt(){t.find(".tickLabels").remove();var e=['<div class="tickLabels" style="font-size:smaller">'],n=A();for(var r=0;r<n.length;++r){var i=n[r],s=i.box;if(!i.show)continue;e.push('<div class="'+i.direction+"Axis "+i.direction+i.n+'Axis" style="color:'+i.options.color+'">');for(var o=0;o<i.ticks.length;++o){var u=i.ticks[o];if(!u.label||u.v<i.min||u.v>i.max)continue;var a={},f;i.direction=="x"?(f="center",a.left=Math.round(m.left+i.p2c(u.v)-i.labelWidth/2),i.position=="bottom"?a.top=s.top+s.padding:a.bottom=y-(s.top+s.height-s.padding)):(a.top=Math.round(m.top+i.p2c(u.v)-i.labelHeight/2),i.position=="left"?(a.right=g-(s.left+s.width-s.padding),f="right"):(a.left=s.left+s.padding,f="left")),a.width=i.labelWidth;var l=["position:absolute","text-align:"+f];for(var c in a)l.push(c+":"+a[c]+"px");e.push('<div class="tickLabel" style="'+l.join(";")+'">'+u.label+"</div>")}e.push("</div>")}e.push("</div>"),t.append(e.join(""))}function nt(e){e.lines.show&&rt(e),e.bars.show&&ot(e),e.points.show&&it(e)}function rt(e){function t(e,t,n,r,i){var s=e.points,o=e.pointsize,u=null,a=null;h.beginPath();for(var f=o;f<s.length;f+=o){var l=s[f-o],c=s[f-o+1],p=s[f],d=s[f+1];if(l==null||p==null)continue;if(c<=d&&c<i.min){if(d<i.min)continue;l=(i.min-c)/(d-c)*(p-l)+l,c=i.min}else if(d<=c&&d<i.min){if(c<i.min)continue;p=(i.min-c)/(d-c)*(p-l)+l,d=i.min}if(c>=d&&c>i.max){if(d>i.max)continue;l=(i.max-c)/(d-c)*(p-l)+l,c=i.max}else if(d>=c&&d>i.max){if(c>i.max)continue;p=(i.max-c)/(d-c)*(p-l)+l,d=i.max}if(l<=p&&l<r.min){if(p<r.min)continue;c=(r.min-l)/(p-l)*(d-c)+c,l=r.min}else if(p<=l&&p<r.min){if(l<r.min)continue;d=(r.min-l)/(p-l)*(d-c)+c,p=r.min}if(l>=p&&l>r.max){if(p>r.max)continue;c=(r.max-l)/(p-l)*(d-c)+c,l=r.max}else if(p>=l&&p>r.max){if(l>r.max)continue;d=(r.max-l)/(p-l)*(d-c)+c,p=r.max}(l!=u||c!=a)&&h.moveTo(r.p2c(l)+t,i.p2c(c)+n),u=p,a=d,h.lineTo(r.p2c(p)+t,i.p2c(d)+n)}h.stroke()}function n(e,t,n){var r=e.points,i=e.pointsize,s=Math.min(Math.max(0,n.min),n.max),o=0,u,a=!1,f=1,l=0,c=0;for(;;){if(i>0&&o>r.length+i)break;o+=i;var p=r[o-i],d=r[o-i+f],v=r[o],m=r[o+f];if(a){if(i>0&&p!=null&&v==null){c=o,i=-i,f=2;continue}if(i<0&&o==l+i){h.fill(),a=!1,i=-i,f=1,o=l=c+i;continue}}if(p==null||v==null)continue;if(p<=v&&p<t.min){if(v<t.min)continue;d=(t.min-p)/(v-p)*(m-d)+d,p=t.min}else if(v<=p&&v<t.min){if(p<t.min)continue;m=(t.min-p)/(v-p)*(m-d)+d,v=t.min}if(p>=v&&p>t.max){if(v>t.max)continue;d=(t.max-p)/(v-p)*(m-d)+d,p=t.max}else if(v>=p&&v>t.max){if(p>t.max)continue;m=(t.max-p)/(v-p)*(m-d)+d,v=t.max}a||(h.beginPath(),h.moveTo(t.p2c(p),n.p2c(s)),a=!0);if(d>=n.max&&m>=n.max){h.lineTo(t.p2c(p),n.p2c(n.max)),h.lineTo(t.p2c(v),n.p2c(n.max));continue}if(d<=n.min&&m<=n.min){h.lineTo(t.p2c(p),n.p2c(n.min)),h.lineTo(t.p2c(v),n.p2c(n.min));continue}var g=p,y=v;d<=m&&d<n.min&&m>=n.min?(p=(n.min-d)/(m-d)*(v-p)+p,d=n.min):m<=d&&m<n.min&&d>=n.min&&(v=(n.min-d)/(m-d)*(v-p)+p,m=n.min),d>=m&&d>n.max&&m<=n.max?(p=(n.max-d)/(m-d)*(v-p)+p,d=n.max):m>=d&&m>n.max&&d<=n.max&&(v=(n.max-d)/(m-d)*(v-p)+p,m=n.max),p!=g&&h.lineTo(t.p2c(g),n.p2c(d)),h.lineTo(t.p2c(p),n.p2c(d)),h.lineTo(t.p2c(v),n.p2c(m)),v!=y&&(h.lineTo(t.p2c(v),n.p2c(m)),h.lineTo(t.p2c(y),n.p2c(m)))}}h.save(),h.translate(m.left,m.top),h.lineJoin="round";var r=e.lines.lineWidth,i=e.shadowSize;if(r>0&&i>0){h.lineWidth=i,h.strokeStyle="rgba(0,0,0,0.1)";var s=Math.PI/18;t(e.datapoints,Math.sin(s)*(r/2+i/2),Math.cos(s)*(r/2+i/2),e.xaxis,e.yaxis),h.lineWidth=i/2,t(e.datapoints,Math.sin(s)*(r/2+i/4),Math.cos(s)*(r/2+i/4),e.xaxis,e.yaxis)}h.lineWidth=r,h.strokeStyle=e.color;var o=ut(e.lines,e.color,0,w);o&&(h.fillStyle=o,n(e.datapoints,e.xaxis,e.yaxis)),r>0&&t(e.datapoints,0,0,e.xaxis,e.yaxis),h.restore()}function it(e){function t(e,t,n,r,i,s,o,u){var a=e.points,f=e.pointsize;for(var l=0;l<a.length;l+=f){var c=a[l],p=a[l+1];if(c==null||c<s.min||c>s.max||p<o.min||p>o.max)continue;h.beginPath(),c=s.p2c(c),p=o.p2c(p)+r,u=="circle"?h.arc(c,p,t,0,i?Math.PI:Math.PI*2,!1):u(h,c,p,t,i),h.closePath(),n&&(h.fillStyle=n,h.fill()),h.stroke()}}h.save(),h.translate(m.left,m.top);var n=e.points.lineWidth,r=e.shadowSize,i=e.points.radius,s=e.points.symbol;if(n>0&&r>0){var o=r/2;h.lineWidth=o,h.strokeStyle="rgba(0,0,0,0.1)",t(e.datapoints,i,null,o+o/2,!0,e.xaxis,e.yaxis,s),h.strokeStyle="rgba(0,0,0,0.2)",t(e.datapoints,i,null,o/2,!0,e.xaxis,e.yaxis,s)}h.lineWidth=n,h.strokeStyle=e.color,t(e.datapoints,i,ut(e.points,e.color),0,!1,e.xaxis,e.yaxis,s),h.restore()}function st(e,t,n,r,i,s,o,u,a,f,l,c){var h,p,d,v,m,g,y,b,w;l?(b=g=y=!0,m=!1,h=n,p=e,v=t+r,d=t+i,p<h&&(w=p,p=h,h=w,m=!0,g=!1)):(m=g=y=!0,b=!1,h=e+r,p=e+i,d=n,v=t,v<d&&(w=v,v=d,d=w,b=!0,y=!1));if(p<u.min||h>u.max||v<a.min||d>a.max)return;h<u.min&&(h=u.min,m=!1),p>u.max&&(p=u.max,g=!1),d<a.min&&(d=a.min,b=!1),v>a.max&&(v=a.max,y=!1),h=u.p2c(h),d=a.p2c(d),p=u.p2c(p),v=a.p2c(v),o&&(f.beginPath(),f.moveTo(h,d),f.lineTo(h,v),f.lineTo(p,v),f.lineTo(p,d),f.fillStyle=o(d,v),f.fill()),c>0&&(m||g||y||b)&&(f.beginPath(),f.moveTo(h,d+s),m?f.lineTo(h,v+s):f.moveTo(h,v+s),y?f.lineTo(p,v+s):f.moveTo(p,v+s),g?f.lineTo(p,d+s):f.moveTo(p,d+s),b?f.lineTo(h,d+s):f.moveTo(h,d+s),f.stroke())}function ot(e){function t(t,n,r,i,s,o,u){var a=t.points,f=t.pointsize;for(var l=0;l<a.length;l+=f){if(a[l]==null)continue;st(a[l],a[l+1],a[l+2],n,r,i,s,o,u,h,e.bars.horizontal,e.bars.lineWidth)}}h.save(),h.translate(m.left,m.top),h.lineWidth=e.bars.lineWidth,h.strokeStyle=e.color;var n=e.bars.align=="left"?0:-e.bars.barWidth/2,r=e.bars.fill?function(t,n){return ut(e.bars,e.color,t,n)}:null;t(e.datapoints,n,n+e.bars.barWidth,0,r,e.xaxis,e.yaxis),h.restore()}function ut(t,n,r,i){var s=t.fill;if(!s)return null;if(t.fillColor)return xt(t.fillColor,r,i,n);var o=e.color.parse(n);return o.a=typeof s=="number"?s:.4,o.normalize(),o.toString()}function at(){t.find(".legend").remove();if(!a.legend.show)return;var n=[],r=!1,i=a.legend.labelFormatter,s,o;for(var f=0;f<u.length;++f){s=u[f],o=s.label;if(!o)continue;f%a.legend.noColumns==0&&(r&&n.push("</tr>"),n.push("<tr>"),r=!0),i&&(o=i(o,s)),n.push('<td class="legendColorBox"><div style="border:1px solid '+a.legend.labelBoxBorderColor+';padding:1px"><div style="width:4px;height:0;border:5px solid '+s.color+';overflow:hidden"></div></div></td>'+'<td class="legendLabel">'+o+"</td>")}r&&n.push("</tr>");if(n.length==0)return;var l='<table style="font-size:smaller;color:'+a.grid.color+'">'+n.join("")+"</table>";if(a.legend.container!=null)e(a.legend.container).html(l);else{var c="",h=a.legend.position,p=a.legend.margin;p[0]==null&&(p=[p,p]),h.charAt(0)=="n"?c+="top:"+(p[1]+m.top)+"px;":h.charAt(0)=="s"&&(c+="bottom:"+(p[1]+m.bottom)+"px;"),h.charAt(1)=="e"?c+="right:"+(p[0]+m.right)+"px;":h.charAt(1)=="w"&&(c+="left:"+(p[0]+m.left)+"px;");var d=e('<div class="legend">'+l.replace('style="','style="position:absolute;'+c+";")+"</div>").appendTo(t);if(a.legend.backgroundOpacity!=0){var v=a.legend.backgroundColor;v==null&&(v=a.grid.backgroundColor,v&&typeof v=="string"?v=e.color.parse(v):v=e.color.extract(d,"background-color"),v.a=1,v=v.toString());var g=d.children();e('<div style="position:absolute;width:'+g.width()+"px;height:"+g.height()+"px;"+c+"background-color:"+v+';"> </div>').prependTo(d).css("opacity",a.legend.backgroundOpacity)}}}function ct(e,t,n){var r=a.grid.mouseActiveRadius,i=r*r+1,s=null,o=!1,f,l;for(f=u.length-1;f>=0;--f){if(!n(u[f]))continue;var c=u[f],h=c.xaxis,p=c.yaxis,d=c.datapoints.points,v=c.datapoints.pointsize,m=h.c2p(e),g=p.c2p(t),y=r/h.scale,b=r/p.scale;h.options.inverseTransform&&(y=Number.MAX_VALUE),p.options.inverseTransform&&(b=Number.MAX_VALUE);if(c.lines.show||c.points.show)for(l=0;l<d.length;l+=v){var w=d[l],E=d[l+1];if(w==null)continue;if(w-m>y||w-m<-y||E-g>b||E-g<-b)continue;var S=Math.abs(h.p2c(w)-e),x=Math.abs(p.p2c(E)-t),T=S*S+x*x;T<i&&(i=T,s=[f,l/v])}if(c.bars.show&&!s){var N=c.bars.align=="left"?0:-c.bars.barWidth/2,C=N+c.bars.barWidth;for(l=0;l<d.length;l+=v){var w=d[l],E=d[l+1],k=d[l+2];if(w==null)continue;if(u[f].bars.horizontal?m<=Math.max(k,w)&&m>=Math.min(k,w)&&g>=E+N&&g<=E+C:m>=w+N&&m<=w+C&&g>=Math.min(k,E)&&g<=Math.max(k,E))s=[f,l/v]}}}return s?(f=s[0],l=s[1],v=u[f].datapoints.pointsize,{datapoint:u[f].datapoints.points.slice(l*v,(l+1)*v),dataIndex:l,series:u[f],seriesIndex:f}):null}function ht(e){a.grid.hoverable&&vt("plothover",e,function(e){return e["hoverable"]!=0})}function pt(e){a.grid.hoverable&&vt("plothover",e,function(e){return!1})}function dt(e){vt("plotclick",e,function(e){return e["clickable"]!=0})}function vt(e,n,r){var i=c.offset(),s=n.pageX-i.left-m.left,o=n.pageY-i.top-m.top,u=O({left:s,top:o});u.pageX=n.pageX,u.pageY=n.pageY;var f=ct(s,o,r);f&&(f.pageX=parseInt(f.series.xaxis.p2c(f.datapoint[0])+i.left+m.left),f.pageY=parseInt(f.series.yaxis.p2c(f.datapoint[1])+i.top+m.top));if(a.grid.autoHighlight){for(var l=0;l<ft.length;++l){var h=ft[l];h.auto==e&&(!f||h.series!=f.series||h.point[0]!=f.datapoint[0]||h.point[1]!=f.datapoint[1])&&bt(h.series,h.point)}f&&yt(f.series,f.datapoint,e)}t.trigger(e,[u,f])}function mt(){lt||(lt=setTimeout(gt,30))}function gt(){lt=null,p.save(),p.clearRect(0,0,g,y),p.translate(m.left,m.top);var e,t;for(e=0;e<ft.length;++e)t=ft[e],t.series.bars.show?St(t.series,t.point):Et(t.series,t.point);p.restore(),x(E.drawOverlay,[p])}function yt(e,t,n){typeof e=="number"&&(e=u[e]);if(typeof t=="number"){var r=e.datapoints.pointsize;t=e.datapoints.points.slice(r*t,r*(t+1))}var i=wt(e,t);i==-1?(ft.push({series:e,point:t,auto:n}),mt()):n||(ft[i].auto=!1)}function bt(e,t){e==null&&t==null&&(ft=[],mt()),typeof e=="number"&&(e=u[e]),typeof t=="number"&&(t=e.data[t]);var n=wt(e,t);n!=-1&&(ft.splice(n,1),mt())}function wt(e,t){for(var n=0;n<ft.length;++n){var r=ft[n];if(r.series==e&&r.point[0]==t[0]&&r.point[1]==t[1])return n}return-1}function Et(t,n){var r=n[0],i=n[1],s=t.xaxis,o=t.yaxis;if(r<s.min||r>s.max||i<o.min||i>o.max)return;var u=t.points.radius+t.points.lineWidth/2;p.lineWidth=u,p.strokeStyle=e.color.parse(t.color).scale("a",.5).toString();var a=1.5*u,r=s.p2c(r),i=o.p2c(i);p.beginPath(),t.points.symbol=="circle"?p.arc(r,i,a,0,2*Math.PI,!1):t.points.symbol(p,r,i,a,!1),p.closePath(),p.stroke()}function St(t,n){p.lineWidth=t.bars.lineWidth,p.strokeStyle=e.color.parse(t.color).scale("a",.5).toString();var r=e.color.parse(t.color).scale("a",.5).toString(),i=t.bars.align=="left"?0:-t.bars.barWidth/2;st(n[0],n[1],n[2]||0,i,i+t.bars.barWidth,0,function(){return r},t.xaxis,t.yaxis,p,t.bars.horizontal,t.bars.lineWidth)}function xt(t,n,r,i){if(typeof t=="string")return t;var s=h.createLinearGradient(0,r,0,n);for(var o=0,u=t.colors.length;o<u;++o){var a=t.colors[o];if(typeof a!="string"){var f=e.color.parse(i);a.brightness!=null&&(f=f.scale("rgb",a.brightness)),a.opacity!=null&&(f.a*=a.opacity),a=f.toString()}s.addColorStop(o/(u-1),a)}return s}var u=[],a={colors:["#edc240","#afd8f8","#cb4b4b","#4da74d","#9440ed"],legend:{show:!0,noColumns:1,labelFormatter:null,labelBoxBorderColor:"#ccc",container:null,position:"ne",margin:5,backgroundColor:null,backgroundOpacity:.85},xaxis:{show:null,position:"bottom",mode:null,color:null,tickColor:null,transform:null,inverseTransform:null,min:null,max:null,autoscaleMargin:null,ticks:null,tickFormatter:null,labelWidth:null,labelHeight:null,reserveSpace:null,tickLength:null,alignTicksWithAxis:null,tickDecimals:null,tickSize:null,minTickSize:null,monthNames:null,timeformat:null,twelveHourClock:!1},yaxis:{autoscaleMargin:.02,position:"left"},xaxes:[],yaxes:[],series:{points:{show:!1,radius:3,lineWidth:2,fill:!0,fillColor:"#ffffff",symbol:"circle"},lines:{lineWidth:2,fill:!1,fillColor:null,steps:!1},bars:{show:!1,lineWidth:2,barWidth:1,fill:!0,fillColor:null,align:"left",horizontal:!1},shadowSize:3},grid:{show:!0,aboveData:!1,color:"#545454",backgroundColor:null,borderColor:null,tickColor:null,labelMargin:5,axisMargin:8,borderWidth:2,minBorderMargin:null,markings:null,markingsColor:"#f4f4f4",markingsLineWidth:2,clickable:!1,hoverable:!1,autoHighlight:!0,mouseActiveRadius:10},hooks:{}},f=null,l=null,c=null,h=null,p=null,d=[],v=[],m={left:0,right:0,top:0,bottom:0},g=0,y=0,b=0,w=0,E={processOptions:[],processRawData:[],processDatapoints:[],drawSeries:[],draw:[],bindEvents:[],drawOverlay:[],shutdown:[]},S=this;S.setData=C,S.setupGrid=X,S.draw=G,S.getPlaceholder=function(){return t},S.getCanvas=function(){return f},S.getPlotOffset=function(){return m},S.width=function(){return b},S.height=function(){return w},S.offset=function(){var e=c.offset();return e.left+=m.left,e.top+=m.top,e},S.getData=function(){return u},S.getAxes=function(){var t={},n;return e.each(d.concat(v),function(e,n){n&&(t[n.direction+(n.n!=1?n.n:"")+"axis"]=n)}),t},S.getXAxes=function(){return d},S.getYAxes=function(){return v},S.c2p=O,S.p2c=M,S.getOptions=function(){return a},S.highlight=yt,S.unhighlight=bt,S.triggerRedrawOverlay=mt,S.pointOffset=function(e){return{left:parseInt(d[L(e,"x")-1].p2c(+e.x)+m.left),top:parseInt(v[L(e,"y")-1].p2c(+e.y)+m.top)}},S.shutdown=q,S.resize=function(){B(),j(f),j(l)},S.hooks=E,T(S),N(s),F(),C(r),X(),G(),I();var ft=[],lt=null}function n(e,t){return t*Math.floor(e/t)}e.plot=function(n,r,i){var s=new t(e(n),r,i,e.plot.plugins);return s},e.plot.version="0.7",e.plot.plugins=[],e.plot.formatDate=function(e,t,n){var r=function(e){return e=""+e,e.length==1?"0"+e:e},i=[],s=!1,o=!1,u=e.getUTCHours(),a=u<12;n==null&&(n=["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"]),t.search(/%p|%P/)!=-1&&(u>12?u-=12:u==0&&(u=12));for(var f=0;f<t.length;++f){var l=t.charAt(f);if(s){switch(l){case"h":l=""+u;break;case"H":l=r(u);break;case"M":l=r(e.getUTCMinutes());break;case"S":l=r(e.getUTCSeconds());break;case"d":l=""+e.getUTCDate();break;case"m":l=""+(e.getUTCMonth()+1);break;case"y":l=""+e.getUTCFullYear();break;case"b":l=""+n[e.getUTCMonth()];break;case"p":l=a?"am":"pm";break;case"P":l=a?"AM":"PM";break;case"0":l="",o=!0}l&&o&&(l=r(l),o=!1),i.push(l),o||(s=!1)}else l=="%"?s=!0:i.push(l)}return i.join("")}}(jQuery),define("flot",function(){}),function(e){function t(t){function g(e,t){t.series.pie.show&&(t.grid.show=!1,t.series.pie.label.show=="auto"&&(t.legend.show?t.series.pie.label.show=!1:t.series.pie.label.show=!0),t.series.pie.radius=="auto"&&(t.series.pie.label.show?t.series.pie.radius=.75:t.series.pie.radius=1),t.series.pie.tilt>1&&(t.series.pie.tilt=1),t.series.pie.tilt<0&&(t.series.pie.tilt=0),e.hooks.processDatapoints.push(S),e.hooks.drawOverlay.push(j),e.hooks.draw.push(k))}function b(e,t){var n=e.getOptions();n.series.pie.show&&n.grid.hoverable&&t.unbind("mousemove").mousemove(M),n.series.pie.show&&n.grid.clickable&&t.unbind("click").click(_)}function w(e){function n(e,r){r||(r=0);for(var i=0;i<e.length;++i){for(var s=0;s<r;s++)t+="	";typeof e[i]=="object"?(t+=""+i+":\n",n(e[i],r+1)):t+=""+i+": "+e[i]+"\n"}}var t="";n(e),alert(t)}function E(e){for(var t=0;t<e.length;++t){var n=parseFloat(e[t].data[0][1]);n&&(f+=n)}}function S(t,i,o,u){d||(d=!0,r=t.getCanvas(),s=e(r).parent(),n=t.getOptions(),t.setData(C(t.getData())))}function T(){p=s.children().filter(".legend").children().width(),o=Math.min(r.width,r.height/n.series.pie.tilt)/2,a=r.height/2+n.series.pie.offset.top,u=r.width/2,n.series.pie.offset.left=="auto"?n.legend.position.match("w")?u+=p/2:u-=p/2:u+=n.series.pie.offset.left,u<o?u=o:u>r.width-o&&(u=r.width-o)}function N(e){for(var t=0;t<e.length;++t)if(typeof e[t].data=="number")e[t].data=[[1,e[t].data]];else if(typeof e[t].data=="undefined"||typeof e[t].data[0]=="undefined")typeof e[t].data!="undefined"&&typeof e[t].data.label!="undefined"&&(e[t].label=e[t].data.label),e[t].data=[[1,0]];return e}function C(e){e=N(e),E(e);var t=0,r=0,i=n.series.pie.combine.color,s=[];for(var o=0;o<e.length;++o)e[o].data[0][1]=parseFloat(e[o].data[0][1]),e[o].data[0][1]||(e[o].data[0][1]=0),e[o].data[0][1]/f<=n.series.pie.combine.threshold?(t+=e[o].data[0][1],r++,i||(i=e[o].color)):s.push({data:[[1,e[o].data[0][1]]],color:e[o].color,label:e[o].label,angle:e[o].data[0][1]*Math.PI*2/f,percent:e[o].data[0][1]/f*100});return r>0&&s.push({data:[[1,t]],color:i,label:n.series.pie.combine.label,angle:t*Math.PI*2/f,percent:t/f*100}),s}function k(t,i){function d(){ctx.clearRect(0,0,r.width,r.height),s.children().filter(".pieLabel, .pieLabelBackground").remove()}function v(){var e=5,t=15,i=10,s=.02;if(n.series.pie.radius>1)var f=n.series.pie.radius;else var f=o*n.series.pie.radius;if(f>=r.width/2-e||f*n.series.pie.tilt>=r.height/2-t||f<=i)return;ctx.save(),ctx.translate(e,t),ctx.globalAlpha=s,ctx.fillStyle="#000",ctx.translate(u,a),ctx.scale(1,n.series.pie.tilt);for(var l=1;l<=i;l++)ctx.beginPath(),ctx.arc(0,0,f,0,Math.PI*2,!1),ctx.fill(),f-=l;ctx.restore()}function m(){function h(n,r,s){if(n<=0)return;s?ctx.fillStyle=r:(ctx.strokeStyle=r,ctx.lineJoin="round"),ctx.beginPath(),Math.abs(n-Math.PI*2)>1e-9?ctx.moveTo(0,0):e.browser.msie&&(n-=1e-4),ctx.arc(0,0,t,i,i+n,!1),ctx.closePath(),i+=n,s?ctx.fill():ctx.stroke()}function p(){function h(t,o,f){if(t.data[0][1]==0)return;var c=n.legend.labelFormatter,h,p=n.series.pie.label.formatter;c?h=c(t.label,t):h=t.label,p&&(h=p(h,t));var d=(o+t.angle+o)/2,v=u+Math.round(Math.cos(d)*i),m=a+Math.round(Math.sin(d)*i)*n.series.pie.tilt,g='<span class="pieLabel" id="pieLabel'+f+'" style="position:absolute;top:'+m+"px;left:"+v+'px;">'+h+"</span>";s.append(g);var y=s.children("#pieLabel"+f),b=m-y.height()/2,w=v-y.width()/2;y.css("top",b),y.css("left",w);if(0-b>0||0-w>0||r.height-(b+y.height())<0||r.width-(w+y.width())<0)l=!0;if(n.series.pie.label.background.opacity!=0){var E=n.series.pie.label.background.color;E==null&&(E=t.color);var S="top:"+b+"px;left:"+w+"px;";e('<div class="pieLabelBackground" style="position:absolute;width:'+y.width()+"px;height:"+y.height()+"px;"+S+"background-color:"+E+';"> </div>').insertBefore(y).css("opacity",n.series.pie.label.background.opacity)}}var t=startAngle;if(n.series.pie.label.radius>1)var i=n.series.pie.label.radius;else var i=o*n.series.pie.label.radius;for(var c=0;c<f.length;++c)f[c].percent>=n.series.pie.label.threshold*100&&h(f[c],t,c),t+=f[c].angle}startAngle=Math.PI*n.series.pie.startAngle;if(n.series.pie.radius>1)var t=n.series.pie.radius;else var t=o*n.series.pie.radius;ctx.save(),ctx.translate(u,a),ctx.scale(1,n.series.pie.tilt),ctx.save();var i=startAngle;for(var c=0;c<f.length;++c)f[c].startAngle=i,h(f[c].angle,f[c].color,!0);ctx.restore(),ctx.save(),ctx.lineWidth=n.series.pie.stroke.width,i=startAngle;for(var c=0;c<f.length;++c)h(f[c].angle,n.series.pie.stroke.color,!1);ctx.restore(),L(ctx),n.series.pie.label.show&&p(),ctx.restore()}if(!s)return;ctx=i,T();var f=t.getData(),p=0;while(l&&p<c)l=!1,p>0&&(o*=h),p+=1,d(),n.series.pie.tilt<=.8&&v(),m();p>=c&&(d(),s.prepend('<div class="error">Could not draw pie with labels contained inside canvas</div>')),t.setSeries&&t.insertLegend&&(t.setSeries(f),t.insertLegend())}function L(e){n.series.pie.innerRadius>0&&(e.save(),innerRadius=n.series.pie.innerRadius>1?n.series.pie.innerRadius:o*n.series.pie.innerRadius,e.globalCompositeOperation="destination-out",e.beginPath(),e.fillStyle=n.series.pie.stroke.color,e.arc(0,0,innerRadius,0,Math.PI*2,!1),e.fill(),e.closePath(),e.restore(),e.save(),e.beginPath(),e.strokeStyle=n.series.pie.stroke.color,e.arc(0,0,innerRadius,0,Math.PI*2,!1),e.stroke(),e.closePath(),e.restore())}function A(e,t){for(var n=!1,r=-1,i=e.length,s=i-1;++r<i;s=r)(e[r][1]<=t[1]&&t[1]<e[s][1]||e[s][1]<=t[1]&&t[1]<e[r][1])&&t[0]<(e[s][0]-e[r][0])*(t[1]-e[r][1])/(e[s][1]-e[r][1])+e[r][0]&&(n=!n);return n}function O(e,n){var r=t.getData(),i=t.getOptions(),s=i.series.pie.radius>1?i.series.pie.radius:o*i.series.pie.radius;for(var f=0;f<r.length;++f){var l=r[f];if(l.pie.show){ctx.save(),ctx.beginPath(),ctx.moveTo(0,0),ctx.arc(0,0,s,l.startAngle,l.startAngle+l.angle,!1),ctx.closePath(),x=e-u,y=n-a;if(ctx.isPointInPath){if(ctx.isPointInPath(e-u,n-a))return ctx.restore(),{datapoint:[l.percent,l.data],dataIndex:0,series:l,seriesIndex:f}}else{p1X=s*Math.cos(l.startAngle),p1Y=s*Math.sin(l.startAngle),p2X=s*Math.cos(l.startAngle+l.angle/4),p2Y=s*Math.sin(l.startAngle+l.angle/4),p3X=s*Math.cos(l.startAngle+l.angle/2),p3Y=s*Math.sin(l.startAngle+l.angle/2),p4X=s*Math.cos(l.startAngle+l.angle/1.5),p4Y=s*Math.sin(l.startAngle+l.angle/1.5),p5X=s*Math.cos(l.startAngle+l.angle),p5Y=s*Math.sin(l.startAngle+l.angle),arrPoly=[[0,0],[p1X,p1Y],[p2X,p2Y],[p3X,p3Y],[p4X,p4Y],[p5X,p5Y]],arrPoint=[x,y];if(A(arrPoly,arrPoint))return ctx.restore(),{datapoint:[l.percent,l.data],dataIndex:0,series:l,seriesIndex:f}}ctx.restore()}}return null}function M(e){D("plothover",e)}function _(e){D("plotclick",e)}function D(e,r){var i=t.offset(),o=parseInt(r.pageX-i.left),u=parseInt(r.pageY-i.top),a=O(o,u);if(n.grid.autoHighlight)for(var f=0;f<m.length;++f){var l=m[f];l.auto==e&&(!a||l.series!=a.series)&&H(l.series)}a&&P(a.series,e);var c={pageX:r.pageX,pageY:r.pageY};s.trigger(e,[c,a])}function P(e,n){typeof e=="number"&&(e=series[e]);var r=B(e);r==-1?(m.push({series:e,auto:n}),t.triggerRedrawOverlay()):n||(m[r].auto=!1)}function H(e){e==null&&(m=[],t.triggerRedrawOverlay()),typeof e=="number"&&(e=series[e]);var n=B(e);n!=-1&&(m.splice(n,1),t.triggerRedrawOverlay())}function B(e){for(var t=0;t<m.length;++t){var n=m[t];if(n.series==e)return t}return-1}function j(e,t){function s(e){if(e.angle<0)return;t.fillStyle="rgba(255, 255, 255, "+n.series.pie.highlight.opacity+")",t.beginPath(),Math.abs(e.angle-Math.PI*2)>1e-9&&t.moveTo(0,0),t.arc(0,0,r,e.startAngle,e.startAngle+e.angle,!1),t.closePath(),t.fill()}var n=e.getOptions(),r=n.series.pie.radius>1?n.series.pie.radius:o*n.series.pie.radius;t.save(),t.translate(u,a),t.scale(1,n.series.pie.tilt);for(i=0;i<m.length;++i)s(m[i].series);L(t),t.restore()}var r=null,s=null,o=null,u=null,a=null,f=0,l=!0,c=10,h=.95,p=0,d=!1,v=!1,m=[];t.hooks.processOptions.push(g),t.hooks.bindEvents.push(b)}var n={series:{pie:{show:!1,radius:"auto",innerRadius:0,startAngle:1.5,tilt:1,offset:{top:0,left:"auto"},stroke:{color:"#FFF",width:1},label:{show:"auto",formatter:function(e,t){return'<div style="font-size:x-small;text-align:center;padding:2px;color:'+t.color+';">'+e+"<br/>"+Math.round(t.percent)+"%</div>"},radius:1,background:{color:null,opacity:0},threshold:0},combine:{threshold:-1,color:null,label:"Other"},highlight:{opacity:.5}}}};e.plot.plugins.push({init:t,options:n,name:"pie",version:"1.0"})}(jQuery),define("flot.pie",function(){}),function(e){function r(n,r,a){return t=a||{},t.target_el=n,typeof r=="string"?o(r):u(r),e.extend(this,{getObject:s,getJSON:i,setObject:u,setJSON:o}),this}function i(){return JSON.stringify(n)}function s(){return n}function o(e){u(JSON.parse(e))}function u(e){e!==null&&(n=e,N())}function a(e){return Object.prototype.toString.call(e)=="[object Object]"}function f(e){return Object.prototype.toString.call(e)=="[object Array]"}function l(e){return Object.prototype.toString.call(e)=="[object Boolean]"}function c(e){return Object.prototype.toString.call(e)=="[object Number]"}function h(e){return Object.prototype.toString.call(e)=="[object String]"}function p(e,t,n){var r=arguments.length==2;if(t.indexOf(".")>-1){var i=e,s=0,o=t.split(".");for(var u=o.length;s<u-1;s++)i=i[o[s]];r?delete i[o[u-1]]:i[o[u-1]]=n}else r?delete e[t]:e[t]=n;return e}function d(e,t,n){if(t.indexOf(".")>-1){var r=e,i=0,s=t.split(".");for(var o=s.length;i<o-1;i++)r=r[s[i]];r[n]=r[s[o-1]],delete r[s[o-1]]}else n&&(e[n]=e[t]),delete e[t];return e}function v(e,t,n){t=t.split(".");var r=0;while(r<t.length)if((e=e[t[r++]])==undefined)return n;return e}function m(e,t,r){var i=e,s=0,o=v(n,t);while(typeof o[i]!="undefined")s++,i=e+" "+s;var u=(t?t+".":"")+i;p(n,u,r),N(),y(u),g(t)}function g(n){path_bits=n.match(/(.+)\.([^\.]+)/),path_bits&&path_bits[1]&&path_bits[2]&&e('div[data-path="'+path_bits[1]+'"]'+'[data-key="'+path_bits[2]+'"]',t.target_el).addClass("expanded")}function y(r){t.change.apply(this,[n,r]),t.valueField&&e(t.valueField).val(this.getJSON())}function b(n,r){n.preventDefault(),n.stopPropagation();var i=e(n.target);i.hasClass("expander")&&i.parent().toggleClass("expanded"),i.hasClass("add-property")&&m(t.newSingleKey||"NewKey",r,""),i.hasClass("add-group")&&m(t.newGroupKey||"NewGroupKey",r,{})}function w(t){var r=e(t.target).parent().data("path"),i=e(t.target).next().val(),s=e(t.target).val(),o=e(t.target).attr("title");d(n,(r?r+".":"")+o,s),N(),y((r?r+".":"")+s)}function E(t){var r=e(t.target).prev().val(),i=e(t.target).parent(),s=i.data("path"),o=e(t.target).val()||"null",u=(s?s+".":"")+r;p(n,u,o),N(),y(u)}function S(e,t){var n="null";a(t)?n="object":f(t)?n="array":l(t)?n="boolean":h(t)?n="string":c(t)&&(n="number"),e.removeClass("object array boolean string number null"),e.addClass(n)}function x(t,n){if(t.children(".expander").length==0){var r=e("<span>",{"class":n||"expander"});t.prepend(r)}}function T(n,r,i){i=i||"",r.children(".item").remove();var s=Object.keys(n);s.sort(),e.each(s,function(s,o){var u={};u.item=e("<div>",{"class":"item","data-path":i,"data-key":o}),u.property=e(t.propertyElement||"<input>",{"class":"property"}),u.property.val(o).attr("title",o),u.property.change(w);if(a(n[o])||f(n[o])){var l=Object.keys(n[o]).length;l+=l==1?" item":" items",x(u.item),u.value=e(t.groupElement||"<span>",{"class":"value-group"}),u.value.append('<span class="value-group-count">'+l+"</span>",e(t.buttonElement||'<button class="add-property">Add item</button>'),e(t.buttonElement||'<button class="add-group">Add group</button>'))}else u.value=e(t.valueElement||"<input>",{"class":"value",value:n[o],title:n[o]}),u.value.change(E);var c=t.drawproperty.apply(this,[t,n,r,i,o]);if(c)for(var h in c)u[h]=c[h];(a(n[o])||f(n[o]))&&u.item.bind("click",function(e){b(e,(i?i+".":"")+o,t)}),u.item.append(u.property,u.value),r.append(u.item),S(u.item,n[o]),(a(n[o])||f(n[o]))&&T(n[o],u.item,(i?i+".":"")+o)})}function N(){var r=[];e(".expanded",t.target_el).each(function(t,n){r.push([e(n).data("path"),e(n).data("key")])}),T(n,t.target_el),e.each(r,function(n,r){e('div[data-path="'+r[0]+'"]'+'[data-key="'+r[1]+'"]',t.target_el).addClass("expanded")})}var t,n;e.fn.jsonEditor=function(t,n){var i=n||{},s=function(){};return i.change||(i.change=s),i.drawproperty||(i.drawproperty=s),this.length>1?this.each(function(){e(this).jsonEditor(t,n)}):r(e(this),t,i)}}(jQuery),Object.keys||(Object.keys=function(){var e=Object.prototype.hasOwnProperty,t=!{toString:null}.propertyIsEnumerable("toString"),n=["toString","toLocaleString","valueOf","hasOwnProperty","isPrototypeOf","propertyIsEnumerable","constructor"],r=n.length;return function(i){if(typeof i!="object"&&typeof i!="function"||i===null)throw new TypeError("Object.keys called on non-object");var s=[];for(var o in i)e.call(i,o)&&s.push(o);if(t)for(var u=0;u<r;u++)e.call(i,n[u])&&s.push(n[u]);return s}}()),define("jsoneditor",function(){}),function(){var e=this,t=e._,n={},r=Array.prototype,i=Object.prototype,s=Function.prototype,o=r.push,u=r.slice,a=r.concat,f=i.toString,l=i.hasOwnProperty,c=r.forEach,h=r.map,p=r.reduce,d=r.reduceRight,v=r.filter,m=r.every,g=r.some,y=r.indexOf,b=r.lastIndexOf,w=Array.isArray,E=Object.keys,S=s.bind,x=function(e){if(e instanceof x)return e;if(!(this instanceof x))return new x(e);this._wrapped=e};typeof exports!="undefined"?(typeof module!="undefined"&&module.exports&&(exports=module.exports=x),exports._=x):e._=x,x.VERSION="1.4.4";var T=x.each=x.forEach=function(e,t,r){if(e==null)return;if(c&&e.forEach===c)e.forEach(t,r);else if(e.length===+e.length){for(var i=0,s=e.length;i<s;i++)if(t.call(r,e[i],i,e)===n)return}else for(var o in e)if(x.has(e,o)&&t.call(r,e[o],o,e)===n)return};x.map=x.collect=function(e,t,n){var r=[];return e==null?r:h&&e.map===h?e.map(t,n):(T(e,function(e,i,s){r[r.length]=t.call(n,e,i,s)}),r)};var N="Reduce of empty array with no initial value";x.reduce=x.foldl=x.inject=function(e,t,n,r){var i=arguments.length>2;e==null&&(e=[]);if(p&&e.reduce===p)return r&&(t=x.bind(t,r)),i?e.reduce(t,n):e.reduce(t);T(e,function(e,s,o){i?n=t.call(r,n,e,s,o):(n=e,i=!0)});if(!i)throw new TypeError(N);return n},x.reduceRight=x.foldr=function(e,t,n,r){var i=arguments.length>2;e==null&&(e=[]);if(d&&e.reduceRight===d)return r&&(t=x.bind(t,r)),i?e.reduceRight(t,n):e.reduceRight(t);var s=e.length;if(s!==+s){var o=x.keys(e);s=o.length}T(e,function(u,a,f){a=o?o[--s]:--s,i?n=t.call(r,n,e[a],a,f):(n=e[a],i=!0)});if(!i)throw new TypeError(N);return n},x.find=x.detect=function(e,t,n){var r;return C(e,function(e,i,s){if(t.call(n,e,i,s))return r=e,!0}),r},x.filter=x.select=function(e,t,n){var r=[];return e==null?r:v&&e.filter===v?e.filter(t,n):(T(e,function(e,i,s){t.call(n,e,i,s)&&(r[r.length]=e)}),r)},x.reject=function(e,t,n){return x.filter(e,function(e,r,i){return!t.call(n,e,r,i)},n)},x.every=x.all=function(e,t,r){t||(t=x.identity);var i=!0;return e==null?i:m&&e.every===m?e.every(t,r):(T(e,function(e,s,o){if(!(i=i&&t.call(r,e,s,o)))return n}),!!i)};var C=x.some=x.any=function(e,t,r){t||(t=x.identity);var i=!1;return e==null?i:g&&e.some===g?e.some(t,r):(T(e,function(e,s,o){if(i||(i=t.call(r,e,s,o)))return n}),!!i)};x.contains=x.include=function(e,t){return e==null?!1:y&&e.indexOf===y?e.indexOf(t)!=-1:C(e,function(e){return e===t})},x.invoke=function(e,t){var n=u.call(arguments,2),r=x.isFunction(t);return x.map(e,function(e){return(r?t:e[t]).apply(e,n)})},x.pluck=function(e,t){return x.map(e,function(e){return e[t]})},x.where=function(e,t,n){return x.isEmpty(t)?n?null:[]:x[n?"find":"filter"](e,function(e){for(var n in t)if(t[n]!==e[n])return!1;return!0})},x.findWhere=function(e,t){return x.where(e,t,!0)},x.max=function(e,t,n){if(!t&&x.isArray(e)&&e[0]===+e[0]&&e.length<65535)return Math.max.apply(Math,e);if(!t&&x.isEmpty(e))return-Infinity;var r={computed:-Infinity,value:-Infinity};return T(e,function(e,i,s){var o=t?t.call(n,e,i,s):e;o>=r.computed&&(r={value:e,computed:o})}),r.value},x.min=function(e,t,n){if(!t&&x.isArray(e)&&e[0]===+e[0]&&e.length<65535)return Math.min.apply(Math,e);if(!t&&x.isEmpty(e))return Infinity;var r={computed:Infinity,value:Infinity};return T(e,function(e,i,s){var o=t?t.call(n,e,i,s):e;o<r.computed&&(r={value:e,computed:o})}),r.value},x.shuffle=function(e){var t,n=0,r=[];return T(e,function(e){t=x.random(n++),r[n-1]=r[t],r[t]=e}),r};var k=function(e){return x.isFunction(e)?e:function(t){return t[e]}};x.sortBy=function(e,t,n){var r=k(t);return x.pluck(x.map(e,function(e,t,i){return{value:e,index:t,criteria:r.call(n,e,t,i)}}).sort(function(e,t){var n=e.criteria,r=t.criteria;if(n!==r){if(n>r||n===void 0)return 1;if(n<r||r===void 0)return-1}return e.index<t.index?-1:1}),"value")};var L=function(e,t,n,r){var i={},s=k(t||x.identity);return T(e,function(t,o){var u=s.call(n,t,o,e);r(i,u,t)}),i};x.groupBy=function(e,t,n){return L(e,t,n,function(e,t,n){(x.has(e,t)?e[t]:e[t]=[]).push(n)})},x.countBy=function(e,t,n){return L(e,t,n,function(e,t){x.has(e,t)||(e[t]=0),e[t]++})},x.sortedIndex=function(e,t,n,r){n=n==null?x.identity:k(n);var i=n.call(r,t),s=0,o=e.length;while(s<o){var u=s+o>>>1;n.call(r,e[u])<i?s=u+1:o=u}return s},x.toArray=function(e){return e?x.isArray(e)?u.call(e):e.length===+e.length?x.map(e,x.identity):x.values(e):[]},x.size=function(e){return e==null?0:e.length===+e.length?e.length:x.keys(e).length},x.first=x.head=x.take=function(e,t,n){return e==null?void 0:t!=null&&!n?u.call(e,0,t):e[0]},x.initial=function(e,t,n){return u.call(e,0,e.length-(t==null||n?1:t))},x.last=function(e,t,n){return e==null?void 0:t!=null&&!n?u.call(e,Math.max(e.length-t,0)):e[e.length-1]},x.rest=x.tail=x.drop=function(e,t,n){return u.call(e,t==null||n?1:t)},x.compact=function(e){return x.filter(e,x.identity)};var A=function(e,t,n){return T(e,function(e){x.isArray(e)?t?o.apply(n,e):A(e,t,n):n.push(e)}),n};x.flatten=function(e,t){return A(e,t,[])},x.without=function(e){return x.difference(e,u.call(arguments,1))},x.uniq=x.unique=function(e,t,n,r){x.isFunction(t)&&(r=n,n=t,t=!1);var i=n?x.map(e,n,r):e,s=[],o=[];return T(i,function(n,r){if(t?!r||o[o.length-1]!==n:!x.contains(o,n))o.push(n),s.push(e[r])}),s},x.union=function(){return x.uniq(a.apply(r,arguments))},x.intersection=function(e){var t=u.call(arguments,1);return x.filter(x.uniq(e),function(e){return x.every(t,function(t){return x.indexOf(t,e)>=0})})},x.difference=function(e){var t=a.apply(r,u.call(arguments,1));return x.filter(e,function(e){return!x.contains(t,e)})},x.zip=function(){var e=u.call(arguments),t=x.max(x.pluck(e,"length")),n=new Array(t);for(var r=0;r<t;r++)n[r]=x.pluck(e,""+r);return n},x.object=function(e,t){if(e==null)return{};var n={};for(var r=0,i=e.length;r<i;r++)t?n[e[r]]=t[r]:n[e[r][0]]=e[r][1];return n},x.indexOf=function(e,t,n){if(e==null)return-1;var r=0,i=e.length;if(n){if(typeof n!="number")return r=x.sortedIndex(e,t),e[r]===t?r:-1;r=n<0?Math.max(0,i+n):n}if(y&&e.indexOf===y)return e.indexOf(t,n);for(;r<i;r++)if(e[r]===t)return r;return-1},x.lastIndexOf=function(e,t,n){if(e==null)return-1;var r=n!=null;if(b&&e.lastIndexOf===b)return r?e.lastIndexOf(t,n):e.lastIndexOf(t);var i=r?n:e.length;while(i--)if(e[i]===t)return i;return-1},x.range=function(e,t,n){arguments.length<=1&&(t=e||0,e=0),n=arguments[2]||1;var r=Math.max(Math.ceil((t-e)/n),0),i=0,s=new Array(r);while(i<r)s[i++]=e,e+=n;return s},x.bind=function(e,t){if(e.bind===S&&S)return S.apply(e,u.call(arguments,1));var n=u.call(arguments,2);return function(){return e.apply(t,n.concat(u.call(arguments)))}},x.partial=function(e){var t=u.call(arguments,1);return function(){return e.apply(this,t.concat(u.call(arguments)))}},x.bindAll=function(e){var t=u.call(arguments,1);return t.length===0&&(t=x.functions(e)),T(t,function(t){e[t]=x.bind(e[t],e)}),e},x.memoize=function(e,t){var n={};return t||(t=x.identity),function(){var r=t.apply(this,arguments);return x.has(n,r)?n[r]:n[r]=e.apply(this,arguments)}},x.delay=function(e,t){var n=u.call(arguments,2);return setTimeout(function(){return e.apply(null,n)},t)},x.defer=function(e){return x.delay.apply(x,[e,1].concat(u.call(arguments,1)))},x.throttle=function(e,t){var n,r,i,s,o=0,u=function(){o=new Date,i=null,s=e.apply(n,r)};return function(){var a=new Date,f=t-(a-o);return n=this,r=arguments,f<=0?(clearTimeout(i),i=null,o=a,s=e.apply(n,r)):i||(i=setTimeout(u,f)),s}},x.debounce=function(e,t,n){var r,i;return function(){var s=this,o=arguments,u=function(){r=null,n||(i=e.apply(s,o))},a=n&&!r;return clearTimeout(r),r=setTimeout(u,t),a&&(i=e.apply(s,o)),i}},x.once=function(e){var t=!1,n;return function(){return t?n:(t=!0,n=e.apply(this,arguments),e=null,n)}},x.wrap=function(e,t){return function(){var n=[e];return o.apply(n,arguments),t.apply(this,n)}},x.compose=function(){var e=arguments;return function(){var t=arguments;for(var n=e.length-1;n>=0;n--)t=[e[n].apply(this,t)];return t[0]}},x.after=function(e,t){return e<=0?t():function(){if(--e<1)return t.apply(this,arguments)}},x.keys=E||function(e){if(e!==Object(e))throw new TypeError("Invalid object");var t=[];for(var n in e)x.has(e,n)&&(t[t.length]=n);return t},x.values=function(e){var t=[];for(var n in e)x.has(e,n)&&t.push(e[n]);return t},x.pairs=function(e){var t=[];for(var n in e)x.has(e,n)&&t.push([n,e[n]]);return t},x.invert=function(e){var t={};for(var n in e)x.has(e,n)&&(t[e[n]]=n);return t},x.functions=x.methods=function(e){var t=[];for(var n in e)x.isFunction(e[n])&&t.push(n);return t.sort()},x.extend=function(e){return T(u.call(arguments,1),function(t){if(t)for(var n in t)e[n]=t[n]}),e},x.pick=function(e){var t={},n=a.apply(r,u.call(arguments,1));return T(n,function(n){n in e&&(t[n]=e[n])}),t},x.omit=function(e){var t={},n=a.apply(r,u.call(arguments,1));for(var i in e)x.contains(n,i)||(t[i]=e[i]);return t},x.defaults=function(e){return T(u.call(arguments,1),function(t){if(t)for(var n in t)e[n]==null&&(e[n]=t[n])}),e},x.clone=function(e){return x.isObject(e)?x.isArray(e)?e.slice():x.extend({},e):e},x.tap=function(e,t){return t(e),e};var O=function(e,t,n,r){if(e===t)return e!==0||1/e==1/t;if(e==null||t==null)return e===t;e instanceof x&&(e=e._wrapped),t instanceof x&&(t=t._wrapped);var i=f.call(e);if(i!=f.call(t))return!1;switch(i){case"[object String]":return e==String(t);case"[object Number]":return e!=+e?t!=+t:e==0?1/e==1/t:e==+t;case"[object Date]":case"[object Boolean]":return+e==+t;case"[object RegExp]":return e.source==t.source&&e.global==t.global&&e.multiline==t.multiline&&e.ignoreCase==t.ignoreCase}if(typeof e!="object"||typeof t!="object")return!1;var s=n.length;while(s--)if(n[s]==e)return r[s]==t;n.push(e),r.push(t);var o=0,u=!0;if(i=="[object Array]"){o=e.length,u=o==t.length;if(u)while(o--)if(!(u=O(e[o],t[o],n,r)))break}else{var a=e.constructor,l=t.constructor;if(a!==l&&!(x.isFunction(a)&&a instanceof a&&x.isFunction(l)&&l instanceof l))return!1;for(var c in e)if(x.has(e,c)){o++;if(!(u=x.has(t,c)&&O(e[c],t[c],n,r)))break}if(u){for(c in t)if(x.has(t,c)&&!(o--))break;u=!o}}return n.pop(),r.pop(),u};x.isEqual=function(e,t){return O(e,t,[],[])},x.isEmpty=function(e){if(e==null)return!0;if(x.isArray(e)||x.isString(e))return e.length===0;for(var t in e)if(x.has(e,t))return!1;return!0},x.isElement=function(e){return!!e&&e.nodeType===1},x.isArray=w||function(e){return f.call(e)=="[object Array]"},x.isObject=function(e){return e===Object(e)},T(["Arguments","Function","String","Number","Date","RegExp"],function(e){x["is"+e]=function(t){return f.call(t)=="[object "+e+"]"}}),x.isArguments(arguments)||(x.isArguments=function(e){return!!e&&!!x.has(e,"callee")}),typeof /./!="function"&&(x.isFunction=function(e){return typeof e=="function"}),x.isFinite=function(e){return isFinite(e)&&!isNaN(parseFloat(e))},x.isNaN=function(e){return x.isNumber(e)&&e!=+e},x.isBoolean=function(e){return e===!0||e===!1||f.call(e)=="[object Boolean]"},x.isNull=function(e){return e===null},x.isUndefined=function(e){return e===void 0},x.has=function(e,t){return l.call(e,t)},x.noConflict=function(){return e._=t,this},x.identity=function(e){return e},x.times=function(e,t,n){var r=Array(e);for(var i=0;i<e;i++)r[i]=t.call(n,i);return r},x.random=function(e,t){return t==null&&(t=e,e=0),e+Math.floor(Math.random()*(t-e+1))};var M={escape:{"&":"&amp;","<":"&lt;",">":"&gt;",'"':"&quot;","'":"&#x27;","/":"&#x2F;"}};M.unescape=x.invert(M.escape);var _={escape:new RegExp("["+x.keys(M.escape).join("")+"]","g"),unescape:new RegExp("("+x.keys(M.unescape).join("|")+")","g")};x.each(["escape","unescape"],function(e){x[e]=function(t){return t==null?"":(""+t).replace(_[e],function(t){return M[e][t]})}}),x.result=function(e,t){if(e==null)return null;var n=e[t];return x.isFunction(n)?n.call(e):n},x.mixin=function(e){T(x.functions(e),function(t){var n=x[t]=e[t];x.prototype[t]=function(){var e=[this._wrapped];return o.apply(e,arguments),j.call(this,n.apply(x,e))}})};var D=0;x.uniqueId=function(e){var t=++D+"";return e?e+t:t},x.templateSettings={evaluate:/<%([\s\S]+?)%>/g,interpolate:/<%=([\s\S]+?)%>/g,escape:/<%-([\s\S]+?)%>/g};var P=/(.)^/,H={"'":"'","\\":"\\","\r":"r","\n":"n","	":"t","\u2028":"u2028","\u2029":"u2029"},B=/\\|'|\r|\n|\t|\u2028|\u2029/g;x.template=function(e,t,n){var r;n=x.defaults({},n,x.templateSettings);var i=new RegExp([(n.escape||P).source,(n.interpolate||P).source,(n.evaluate||P).source].join("|")+"|$","g"),s=0,o="__p+='";e.replace(i,function(t,n,r,i,u){return o+=e.slice(s,u).replace(B,function(e){return"\\"+H[e]}),n&&(o+="'+\n((__t=("+n+"))==null?'':_.escape(__t))+\n'"),r&&(o+="'+\n((__t=("+r+"))==null?'':__t)+\n'"),i&&(o+="';\n"+i+"\n__p+='"),s=u+t.length,t}),o+="';\n",n.variable||(o="with(obj||{}){\n"+o+"}\n"),o="var __t,__p='',__j=Array.prototype.join,print=function(){__p+=__j.call(arguments,'');};\n"+o+"return __p;\n";try{r=new Function(n.variable||"obj","_",o)}catch(u){throw u.source=o,u}if(t)return r(t,x);var a=function(e){return r.call(this,e,x)};return a.source="function("+(n.variable||"obj")+"){\n"+o+"}",a},x.chain=function(e){return x(e).chain()};var j=function(e){return this._chain?x(e).chain():e};x.mixin(x),T(["pop","push","reverse","shift","sort","splice","unshift"],function(e){var t=r[e];x.prototype[e]=function(){var n=this._wrapped;return t.apply(n,arguments),(e=="shift"||e=="splice")&&n.length===0&&delete n[0],j.call(this,n)}}),T(["concat","join","slice"],function(e){var t=r[e];x.prototype[e]=function(){return j.call(this,t.apply(this._wrapped,arguments))}}),x.extend(x.prototype,{chain:function(){return this._chain=!0,this},value:function(){return this._wrapped}}),typeof define=="function"&&define.amd&&define("underscore",[],function(){return x})}.call(this),function(e,t){typeof exports!="undefined"?t(e,exports,require("underscore")):typeof define=="function"&&define.amd?define("backbone",["underscore","jquery","exports"],function(n,r,i){e.Backbone=t(e,i,n,r)}):e.Backbone=t(e,{},e._,e.jQuery||e.Zepto||e.ender||e.$)}(this,function(e,t,n,r){var i=e.Backbone,s=[],o=s.push,u=s.slice,a=s.splice;t.VERSION="1.0.0",t.$=r,t.noConflict=function(){return e.Backbone=i,this},t.emulateHTTP=!1,t.emulateJSON=!1;var f=t.Events={on:function(e,t,n){if(!c(this,"on",e,[t,n])||!t)return this;this._events||(this._events={});var r=this._events[e]||(this._events[e]=[]);return r.push({callback:t,context:n,ctx:n||this}),this},once:function(e,t,r){if(!c(this,"once",e,[t,r])||!t)return this;var i=this,s=n.once(function(){i.off(e,s),t.apply(this,arguments)});return s._callback=t,this.on(e,s,r)},off:function(e,t,r){var i,s,o,u,a,f,l,h;if(!this._events||!c(this,"off",e,[t,r]))return this;if(!e&&!t&&!r)return this._events={},this;u=e?[e]:n.keys(this._events);for(a=0,f=u.length;a<f;a++){e=u[a];if(o=this._events[e]){this._events[e]=i=[];if(t||r)for(l=0,h=o.length;l<h;l++)s=o[l],(t&&t!==s.callback&&t!==s.callback._callback||r&&r!==s.context)&&i.push(s);i.length||delete this._events[e]}}return this},trigger:function(e){if(!this._events)return this;var t=u.call(arguments,1);if(!c(this,"trigger",e,t))return this;var n=this._events[e],r=this._events.all;return n&&h(n,t),r&&h(r,arguments),this},stopListening:function(e,t,n){var r=this._listeners;if(!r)return this;var i=!t&&!n;typeof t=="object"&&(n=this),e&&((r={})[e._listenerId]=e);for(var s in r)r[s].off(t,n,this),i&&delete this._listeners[s];return this}},l=/\s+/,c=function(e,t,n,r){if(!n)return!0;if(typeof n=="object"){for(var i in n)e[t].apply(e,[i,n[i]].concat(r));return!1}if(l.test(n)){var s=n.split(l);for(var o=0,u=s.length;o<u;o++)e[t].apply(e,[s[o]].concat(r));return!1}return!0},h=function(e,t){var n,r=-1,i=e.length,s=t[0],o=t[1],u=t[2];switch(t.length){case 0:while(++r<i)(n=e[r]).callback.call(n.ctx);return;case 1:while(++r<i)(n=e[r]).callback.call(n.ctx,s);return;case 2:while(++r<i)(n=e[r]).callback.call(n.ctx,s,o);return;case 3:while(++r<i)(n=e[r]).callback.call(n.ctx,s,o,u);return;default:while(++r<i)(n=e[r]).callback.apply(n.ctx,t)}},p={listenTo:"on",listenToOnce:"once"};n.each(p,function(e,t){f[t]=function(t,r,i){var s=this._listeners||(this._listeners={}),o=t._listenerId||(t._listenerId=n.uniqueId("l"));return s[o]=t,typeof r=="object"&&(i=this),t[e](r,i,this),this}}),f.bind=f.on,f.unbind=f.off,n.extend(t,f);var d=t.Model=function(e,t){var r,i=e||{};t||(t={}),this.cid=n.uniqueId("c"),this.attributes={},n.extend(this,n.pick(t,v)),t.parse&&(i=this.parse(i,t)||{});if(r=n.result(this,"defaults"))i=n.defaults({},i,r);this.set(i,t),this.changed={},this.initialize.apply(this,arguments)},v=["url","urlRoot","collection"];n.extend(d.prototype,f,{changed:null,validationError:null,idAttribute:"id",initialize:function(){},toJSON:function(e){return n.clone(this.attributes)},sync:function(){return t.sync.apply(this,arguments)},get:function(e){return this.attributes[e]},escape:function(e){return n.escape(this.get(e))},has:function(e){return this.get(e)!=null},set:function(e,t,r){var i,s,o,u,a,f,l,c;if(e==null)return this;typeof e=="object"?(s=e,r=t):(s={})[e]=t,r||(r={});if(!this._validate(s,r))return!1;o=r.unset,a=r.silent,u=[],f=this._changing,this._changing=!0,f||(this._previousAttributes=n.clone(this.attributes),this.changed={}),c=this.attributes,l=this._previousAttributes,this.idAttribute in s&&(this.id=s[this.idAttribute]);for(i in s)t=s[i],n.isEqual(c[i],t)||u.push(i),n.isEqual(l[i],t)?delete this.changed[i]:this.changed[i]=t,o?delete c[i]:c[i]=t;if(!a){u.length&&(this._pending=!0);for(var h=0,p=u.length;h<p;h++)this.trigger("change:"+u[h],this,c[u[h]],r)}if(f)return this;if(!a)while(this._pending)this._pending=!1,this.trigger("change",this,r);return this._pending=!1,this._changing=!1,this},unset:function(e,t){return this.set(e,void 0,n.extend({},t,{unset:!0}))},clear:function(e){var t={};for(var r in this.attributes)t[r]=void 0;return this.set(t,n.extend({},e,{unset:!0}))},hasChanged:function(e){return e==null?!n.isEmpty(this.changed):n.has(this.changed,e)},changedAttributes:function(e){if(!e)return this.hasChanged()?n.clone(this.changed):!1;var t,r=!1,i=this._changing?this._previousAttributes:this.attributes;for(var s in e){if(n.isEqual(i[s],t=e[s]))continue;(r||(r={}))[s]=t}return r},previous:function(e){return e==null||!this._previousAttributes?null:this._previousAttributes[e]},previousAttributes:function(){return n.clone(this._previousAttributes)},fetch:function(e){e=e?n.clone(e):{},e.parse===void 0&&(e.parse=!0);var t=this,r=e.success;return e.success=function(n){if(!t.set(t.parse(n,e),e))return!1;r&&r(t,n,e),t.trigger("sync",t,n,e)},F(this,e),this.sync("read",this,e)},save:function(e,t,r){var i,s,o,u=this.attributes;e==null||typeof e=="object"?(i=e,r=t):(i={})[e]=t;if(i&&(!r||!r.wait)&&!this.set(i,r))return!1;r=n.extend({validate:!0},r);if(!this._validate(i,r))return!1;i&&r.wait&&(this.attributes=n.extend({},u,i)),r.parse===void 0&&(r.parse=!0);var a=this,f=r.success;return r.success=function(e){a.attributes=u;var t=a.parse(e,r);r.wait&&(t=n.extend(i||{},t));if(n.isObject(t)&&!a.set(t,r))return!1;f&&f(a,e,r),a.trigger("sync",a,e,r)},F(this,r),s=this.isNew()?"create":r.patch?"patch":"update",s==="patch"&&(r.attrs=i),o=this.sync(s,this,r),i&&r.wait&&(this.attributes=u),o},destroy:function(e){e=e?n.clone(e):{};var t=this,r=e.success,i=function(){t.trigger("destroy",t,t.collection,e)};e.success=function(n){(e.wait||t.isNew())&&i(),r&&r(t,n,e),t.isNew()||t.trigger("sync",t,n,e)};if(this.isNew())return e.success(),!1;F(this,e);var s=this.sync("delete",this,e);return e.wait||i(),s},url:function(){var e=n.result(this,"urlRoot")||n.result(this.collection,"url")||j();return this.isNew()?e:e+(e.charAt(e.length-1)==="/"?"":"/")+encodeURIComponent(this.id)},parse:function(e,t){return e},clone:function(){return new this.constructor(this.attributes)},isNew:function(){return this.id==null},isValid:function(e){return this._validate({},n.extend(e||{},{validate:!0}))},_validate:function(e,t){if(!t.validate||!this.validate)return!0;e=n.extend({},this.attributes,e);var r=this.validationError=this.validate(e,t)||null;return r?(this.trigger("invalid",this,r,n.extend(t||{},{validationError:r})),!1):!0}});var m=["keys","values","pairs","invert","pick","omit"];n.each(m,function(e){d.prototype[e]=function(){var t=u.call(arguments);return t.unshift(this.attributes),n[e].apply(n,t)}});var g=t.Collection=function(e,t){t||(t={}),t.url&&(this.url=t.url),t.model&&(this.model=t.model),t.comparator!==void 0&&(this.comparator=t.comparator),this._reset(),this.initialize.apply(this,arguments),e&&this.reset(e,n.extend({silent:!0},t))},y={add:!0,remove:!0,merge:!0},b={add:!0,merge:!1,remove:!1};n.extend(g.prototype,f,{model:d,initialize:function(){},toJSON:function(e){return this.map(function(t){return t.toJSON(e)})},sync:function(){return t.sync.apply(this,arguments)},add:function(e,t){return this.set(e,n.defaults(t||{},b))},remove:function(e,t){e=n.isArray(e)?e.slice():[e],t||(t={});var r,i,s,o;for(r=0,i=e.length;r<i;r++){o=this.get(e[r]);if(!o)continue;delete this._byId[o.id],delete this._byId[o.cid],s=this.indexOf(o),this.models.splice(s,1),this.length--,t.silent||(t.index=s,o.trigger("remove",o,this,t)),this._removeReference(o)}return this},set:function(e,t){t=n.defaults(t||{},y),t.parse&&(e=this.parse(e,t)),n.isArray(e)||(e=e?[e]:[]);var r,i,s,u,f,l,c=t.at,h=this.comparator&&c==null&&t.sort!==!1,p=n.isString(this.comparator)?this.comparator:null,d=[],v=[],m={};for(r=0,i=e.length;r<i;r++){if(!(s=this._prepareModel(e[r],t)))continue;(f=this.get(s))?(t.remove&&(m[f.cid]=!0),t.merge&&(f.set(s.attributes,t),h&&!l&&f.hasChanged(p)&&(l=!0))):t.add&&(d.push(s),s.on("all",this._onModelEvent,this),this._byId[s.cid]=s,s.id!=null&&(this._byId[s.id]=s))}if(t.remove){for(r=0,i=this.length;r<i;++r)m[(s=this.models[r]).cid]||v.push(s);v.length&&this.remove(v,t)}d.length&&(h&&(l=!0),this.length+=d.length,c!=null?a.apply(this.models,[c,0].concat(d)):o.apply(this.models,d)),l&&this.sort({silent:!0});if(t.silent)return this;for(r=0,i=d.length;r<i;r++)(s=d[r]).trigger("add",s,this,t);return l&&this.trigger("sort",this,t),this},reset:function(e,t){t||(t={});for(var r=0,i=this.models.length;r<i;r++)this._removeReference(this.models[r]);return t.previousModels=this.models,this._reset(),this.add(e,n.extend({silent:!0},t)),t.silent||this.trigger("reset",this,t),this},push:function(e,t){return e=this._prepareModel(e,t),this.add(e,n.extend({at:this.length},t)),e},pop:function(e){var t=this.at(this.length-1);return this.remove(t,e),t},unshift:function(e,t){return e=this._prepareModel(e,t),this.add(e,n.extend({at:0},t)),e},shift:function(e){var t=this.at(0);return this.remove(t,e),t},slice:function(e,t){return this.models.slice(e,t)},get:function(e){return e==null?void 0:this._byId[e.id!=null?e.id:e.cid||e]},at:function(e){return this.models[e]},where:function(e,t){return n.isEmpty(e)?t?void 0:[]:this[t?"find":"filter"](function(t){for(var n in e)if(e[n]!==t.get(n))return!1;return!0})},findWhere:function(e){return this.where(e,!0)},sort:function(e){if(!this.comparator)throw new Error("Cannot sort a set without a comparator");return e||(e={}),n.isString(this.comparator)||this.comparator.length===1?this.models=this.sortBy(this.comparator,this):this.models.sort(n.bind(this.comparator,this)),e.silent||this.trigger("sort",this,e),this},sortedIndex:function(e,t,r){t||(t=this.comparator);var i=n.isFunction(t)?t:function(e){return e.get(t)};return n.sortedIndex(this.models,e,i,r)},pluck:function(e){return n.invoke(this.models,"get",e)},fetch:function(e){e=e?n.clone(e):{},e.parse===void 0&&(e.parse=!0);var t=e.success,r=this;return e.success=function(n){var i=e.reset?"reset":"set";r[i](n,e),t&&t(r,n,e),r.trigger("sync",r,n,e)},F(this,e),this.sync("read",this,e)},create:function(e,t){t=t?n.clone(t):{};if(!(e=this._prepareModel(e,t)))return!1;t.wait||this.add(e,t);var r=this,i=t.success;return t.success=function(n){t.wait&&r.add(e,t),i&&i(e,n,t)},e.save(null,t),e},parse:function(e,t){return e},clone:function(){return new this.constructor(this.models)},_reset:function(){this.length=0,this.models=[],this._byId={}},_prepareModel:function(e,t){if(e instanceof d)return e.collection||(e.collection=this),e;t||(t={}),t.collection=this;var n=new this.model(e,t);return n._validate(e,t)?n:(this.trigger("invalid",this,e,t),!1)},_removeReference:function(e){this===e.collection&&delete e.collection,e.off("all",this._onModelEvent,this)},_onModelEvent:function(e,t,n,r){if((e==="add"||e==="remove")&&n!==this)return;e==="destroy"&&this.remove(t,r),t&&e==="change:"+t.idAttribute&&(delete this._byId[t.previous(t.idAttribute)],t.id!=null&&(this._byId[t.id]=t)),this.trigger.apply(this,arguments)}});var w=["forEach","each","map","collect","reduce","foldl","inject","reduceRight","foldr","find","detect","filter","select","reject","every","all","some","any","include","contains","invoke","max","min","toArray","size","first","head","take","initial","rest","tail","drop","last","without","indexOf","shuffle","lastIndexOf","isEmpty","chain"];n.each(w,function(e){g.prototype[e]=function(){var t=u.call(arguments);return t.unshift(this.models),n[e].apply(n,t)}});var E=["groupBy","countBy","sortBy"];n.each(E,function(e){g.prototype[e]=function(t,r){var i=n.isFunction(t)?t:function(e){return e.get(t)};return n[e](this.models,i,r)}});var S=t.View=function(e){this.cid=n.uniqueId("view"),this._configure(e||{}),this._ensureElement(),this.initialize.apply(this,arguments),this.delegateEvents()},x=/^(\S+)\s*(.*)$/,T=["model","collection","el","id","attributes","className","tagName","events"];n.extend(S.prototype,f,{tagName:"div",$:function(e){return this.$el.find(e)},initialize:function(){},render:function(){return this},remove:function(){return this.$el.remove(),this.stopListening(),this},setElement:function(e,n){return this.$el&&this.undelegateEvents(),this.$el=e instanceof t.$?e:t.$(e),this.el=this.$el[0],n!==!1&&this.delegateEvents(),this},delegateEvents:function(e){if(!e&&!(e=n.result(this,"events")))return this;this.undelegateEvents();for(var t in e){var r=e[t];n.isFunction(r)||(r=this[e[t]]);if(!r)continue;var i=t.match(x),s=i[1],o=i[2];r=n.bind(r,this),s+=".delegateEvents"+this.cid,o===""?this.$el.on(s,r):this.$el.on(s,o,r)}return this},undelegateEvents:function(){return this.$el.off(".delegateEvents"+this.cid),this},_configure:function(e){this.options&&(e=n.extend({},n.result(this,"options"),e)),n.extend(this,n.pick(e,T)),this.options=e},_ensureElement:function(){if(!this.el){var e=n.extend({},n.result(this,"attributes"));this.id&&(e.id=n.result(this,"id")),this.className&&(e["class"]=n.result(this,"className"));var r=t.$("<"+n.result(this,"tagName")+">").attr(e);this.setElement(r,!1)}else this.setElement(n.result(this,"el"),!1)}}),t.sync=function(e,r,i){var s=N[e];n.defaults(i||(i={}),{emulateHTTP:t.emulateHTTP,emulateJSON:t.emulateJSON});var o={type:s,dataType:"json"};i.url||(o.url=n.result(r,"url")||j()),i.data==null&&r&&(e==="create"||e==="update"||e==="patch")&&(o.contentType="application/json",o.data=JSON.stringify(i.attrs||r.toJSON(i))),i.emulateJSON&&(o.contentType="application/x-www-form-urlencoded",o.data=o.data?{model:o.data}:{});if(i.emulateHTTP&&(s==="PUT"||s==="DELETE"||s==="PATCH")){o.type="POST",i.emulateJSON&&(o.data._method=s);var u=i.beforeSend;i.beforeSend=function(e){e.setRequestHeader("X-HTTP-Method-Override",s);if(u)return u.apply(this,arguments)}}o.type!=="GET"&&!i.emulateJSON&&(o.processData=!1),o.type==="PATCH"&&window.ActiveXObject&&(!window.external||!window.external.msActiveXFilteringEnabled)&&(o.xhr=function(){return new ActiveXObject("Microsoft.XMLHTTP")});var a=i.xhr=t.ajax(n.extend(o,i));return r.trigger("request",r,a,i),a};var N={create:"POST",update:"PUT",patch:"PATCH","delete":"DELETE",read:"GET"};t.ajax=function(){return t.$.ajax.apply(t.$,arguments)};var C=t.Router=function(e){e||(e={}),e.routes&&(this.routes=e.routes),this._bindRoutes(),this.initialize.apply(this,arguments)},k=/\((.*?)\)/g,L=/(\(\?)?:\w+/g,A=/\*\w+/g,O=/[\-{}\[\]+?.,\\\^$|#\s]/g;n.extend(C.prototype,f,{initialize:function(){},route:function(e,r,i){n.isRegExp(e)||(e=this._routeToRegExp(e)),n.isFunction(r)&&(i=r,r=""),i||(i=this[r]);var s=this;return t.history.route(e,function(n){var o=s._extractParameters(e,n);i&&i.apply(s,o),s.trigger.apply(s,["route:"+r].concat(o)),s.trigger("route",r,o),t.history.trigger("route",s,r,o)}),this},navigate:function(e,n){return t.history.navigate(e,n),this},_bindRoutes:function(){if(!this.routes)return;this.routes=n.result(this,"routes");var e,t=n.keys(this.routes);while((e=t.pop())!=null)this.route(e,this.routes[e])},_routeToRegExp:function(e){return e=e.replace(O,"\\$&").replace(k,"(?:$1)?").replace(L,function(e,t){return t?e:"([^/]+)"}).replace(A,"(.*?)"),new RegExp("^"+e+"$")},_extractParameters:function(e,t){var r=e.exec(t).slice(1);return n.map(r,function(e){return e?decodeURIComponent(e):null})}});var M=t.History=function(){this.handlers=[],n.bindAll(this,"checkUrl"),typeof window!="undefined"&&(this.location=window.location,this.history=window.history)},_=/^[#\/]|\s+$/g,D=/^\/+|\/+$/g,P=/msie [\w.]+/,H=/\/$/;M.started=!1,n.extend(M.prototype,f,{interval:50,getHash:function(e){var t=(e||this).location.href.match(/#(.*)$/);return t?t[1]:""},getFragment:function(e,t){if(e==null)if(this._hasPushState||!this._wantsHashChange||t){e=this.location.pathname;var n=this.root.replace(H,"");e.indexOf(n)||(e=e.substr(n.length))}else e=this.getHash();return e.replace(_,"")},start:function(e){if(M.started)throw new Error("Backbone.history has already been started");M.started=!0,this.options=n.extend({},{root:"/"},this.options,e),this.root=this.options.root,this._wantsHashChange=this.options.hashChange!==!1,this._wantsPushState=!!this.options.pushState,this._hasPushState=!!(this.options.pushState&&this.history&&this.history.pushState);var r=this.getFragment(),i=document.documentMode,s=P.exec(navigator.userAgent.toLowerCase())&&(!i||i<=7);this.root=("/"+this.root+"/").replace(D,"/"),s&&this._wantsHashChange&&(this.iframe=t.$('<iframe src="javascript:0" tabindex="-1" />').hide().appendTo("body")[0].contentWindow,this.navigate(r)),this._hasPushState?t.$(window).on("popstate",this.checkUrl):this._wantsHashChange&&"onhashchange"in window&&!s?t.$(window).on("hashchange",this.checkUrl):this._wantsHashChange&&(this._checkUrlInterval=setInterval(this.checkUrl,this.interval)),this.fragment=r;var o=this.location,u=o.pathname.replace(/[^\/]$/,"$&/")===this.root;if(this._wantsHashChange&&this._wantsPushState&&!this._hasPushState&&!u)return this.fragment=this.getFragment(null,!0),this.location.replace(this.root+this.location.search+"#"+this.fragment),!0;this._wantsPushState&&this._hasPushState&&u&&o.hash&&(this.fragment=this.getHash().replace(_,""),this.history.replaceState({},document.title,this.root+this.fragment+o.search));if(!this.options.silent)return this.loadUrl()},stop:function(){t.$(window).off("popstate",this.checkUrl).off("hashchange",this.checkUrl),clearInterval(this._checkUrlInterval),M.started=!1},route:function(e,t){this.handlers.unshift({route:e,callback:t})},checkUrl:function(e){var t=this.getFragment();t===this.fragment&&this.iframe&&(t=this.getFragment(this.getHash(this.iframe)));if(t===this.fragment)return!1;this.iframe&&this.navigate(t),this.loadUrl()||this.loadUrl(this.getHash())},loadUrl:function(e){var t=this.fragment=this.getFragment(e),r=n.any(this.handlers,function(e){if(e.route.test(t))return e.callback(t),!0});return r},navigate:function(e,t){if(!M.started)return!1;if(!t||t===!0)t={trigger:t};e=this.getFragment(e||"");if(this.fragment===e)return;this.fragment=e;var n=this.root+e;if(this._hasPushState)this.history[t.replace?"replaceState":"pushState"]({},document.title,n);else{if(!this._wantsHashChange)return this.location.assign(n);this._updateHash(this.location,e,t.replace),this.iframe&&e!==this.getFragment(this.getHash(this.iframe))&&(t.replace||this.iframe.document.open().close(),this._updateHash(this.iframe.location,e,t.replace))}t.trigger&&this.loadUrl(e)},_updateHash:function(e,t,n){if(n){var r=e.href.replace(/(javascript:|#).*$/,"");e.replace(r+"#"+t)}else e.hash="#"+t}}),t.history=new M;var B=function(e,t){var r=this,i;e&&n.has(e,"constructor")?i=e.constructor:i=function(){return r.apply(this,arguments)},n.extend(i,r,t);var s=function(){this.constructor=i};return s.prototype=r.prototype,i.prototype=new s,e&&n.extend(i.prototype,e),i.__super__=r.prototype,i};d.extend=g.extend=C.extend=S.extend=M.extend=B;var j=function(){throw new Error('A "url" property or function must be specified')},F=function(e,t){var n=t.error;t.error=function(r){n&&n(e,r,t),e.trigger("error",e,r,t)}};return t});var io="undefined"==typeof module?{}:module.exports;(function(){(function(e,t){var n=e;n.version="0.9.11",n.protocol=1,n.transports=[],n.j=[],n.sockets={},n.connect=function(e,r){var i=n.util.parseUri(e),s,o;t&&t.location&&(i.protocol=i.protocol||t.location.protocol.slice(0,-1),i.host=i.host||(t.document?t.document.domain:t.location.hostname),i.port=i.port||t.location.port),s=n.util.uniqueUri(i);var u={host:i.host,secure:"https"==i.protocol,port:i.port||("https"==i.protocol?443:80),query:i.query||""};n.util.merge(u,r);if(u["force new connection"]||!n.sockets[s])o=new n.Socket(u);return!u["force new connection"]&&o&&(n.sockets[s]=o),o=o||n.sockets[s],o.of(i.path.length>1?i.path:"")}})("object"==typeof module?module.exports:this.io={},this),function(e,t){var n=e.util={},r=/^(?:(?![^:@]+:[^:@\/]*@)([^:\/?#.]+):)?(?:\/\/)?((?:(([^:@]*)(?::([^:@]*))?)?@)?([^:\/?#]*)(?::(\d*))?)(((\/(?:[^?#](?![^?#\/]*\.[^?#\/.]+(?:[?#]|$)))*\/?)?([^?#\/]*))(?:\?([^#]*))?(?:#(.*))?)/,i=["source","protocol","authority","userInfo","user","password","host","port","relative","path","directory","file","query","anchor"];n.parseUri=function(e){var t=r.exec(e||""),n={},s=14;while(s--)n[i[s]]=t[s]||"";return n},n.uniqueUri=function(e){var n=e.protocol,r=e.host,i=e.port;return"document"in t?(r=r||document.domain,i=i||(n=="https"&&document.location.protocol!=="https:"?443:document.location.port)):(r=r||"localhost",!i&&n=="https"&&(i=443)),(n||"http")+"://"+r+":"+(i||80)},n.query=function(e,t){var r=n.chunkQuery(e||""),i=[];n.merge(r,n.chunkQuery(t||""));for(var s in r)r.hasOwnProperty(s)&&i.push(s+"="+r[s]);return i.length?"?"+i.join("&"):""},n.chunkQuery=function(e){var t={},n=e.split("&"),r=0,i=n.length,s;for(;r<i;++r)s=n[r].split("="),s[0]&&(t[s[0]]=s[1]);return t};var s=!1;n.load=function(e){if("document"in t&&document.readyState==="complete"||s)return e();n.on(t,"load",e,!1)},n.on=function(e,t,n,r){e.attachEvent?e.attachEvent("on"+t,n):e.addEventListener&&e.addEventListener(t,n,r)},n.request=function(e){if(e&&"undefined"!=typeof XDomainRequest&&!n.ua.hasCORS)return new XDomainRequest;if("undefined"!=typeof XMLHttpRequest&&(!e||n.ua.hasCORS))return new XMLHttpRequest;if(!e)try{return new(window[["Active"].concat("Object").join("X")])("Microsoft.XMLHTTP")}catch(t){}return null},"undefined"!=typeof window&&n.load(function(){s=!0}),n.defer=function(e){if(!n.ua.webkit||"undefined"!=typeof importScripts)return e();n.load(function(){setTimeout(e,100)})},n.merge=function(t,r,i,s){var o=s||[],u=typeof i=="undefined"?2:i,a;for(a in r)r.hasOwnProperty(a)&&n.indexOf(o,a)<0&&(typeof t[a]!="object"||!u?(t[a]=r[a],o.push(r[a])):n.merge(t[a],r[a],u-1,o));return t},n.mixin=function(e,t){n.merge(e.prototype,t.prototype)},n.inherit=function(e,t){function n(){}n.prototype=t.prototype,e.prototype=new n},n.isArray=Array.isArray||function(e){return Object.prototype.toString.call(e)==="[object Array]"},n.intersect=function(e,t){var r=[],i=e.length>t.length?e:t,s=e.length>t.length?t:e;for(var o=0,u=s.length;o<u;o++)~n.indexOf(i,s[o])&&r.push(s[o]);return r},n.indexOf=function(e,t,n){for(var r=e.length,n=n<0?n+r<0?0:n+r:n||0;n<r&&e[n]!==t;n++);return r<=n?-1:n},n.toArray=function(e){var t=[];for(var n=0,r=e.length;n<r;n++)t.push(e[n]);return t},n.ua={},n.ua.hasCORS="undefined"!=typeof XMLHttpRequest&&function(){try{var e=new XMLHttpRequest}catch(t){return!1}return e.withCredentials!=undefined}(),n.ua.webkit="undefined"!=typeof navigator&&/webkit/i.test(navigator.userAgent),n.ua.iDevice="undefined"!=typeof navigator&&/iPad|iPhone|iPod/i.test(navigator.userAgent)}("undefined"!=typeof io?io:module.exports,this),function(e,t){function n(){}e.EventEmitter=n,n.prototype.on=function(e,n){return this.$events||(this.$events={}),this.$events[e]?t.util.isArray(this.$events[e])?this.$events[e].push(n):this.$events[e]=[this.$events[e],n]:this.$events[e]=n,this},n.prototype.addListener=n.prototype.on,n.prototype.once=function(e,t){function r(){n.removeListener(e,r),t.apply(this,arguments)}var n=this;return r.listener=t,this.on(e,r),this},n.prototype.removeListener=function(e,n){if(this.$events&&this.$events[e]){var r=this.$events[e];if(t.util.isArray(r)){var i=-1;for(var s=0,o=r.length;s<o;s++)if(r[s]===n||r[s].listener&&r[s].listener===n){i=s;break}if(i<0)return this;r.splice(i,1),r.length||delete this.$events[e]}else(r===n||r.listener&&r.listener===n)&&delete this.$events[e]}return this},n.prototype.removeAllListeners=function(e){return e===undefined?(this.$events={},this):(this.$events&&this.$events[e]&&(this.$events[e]=null),this)},n.prototype.listeners=function(e){return this.$events||(this.$events={}),this.$events[e]||(this.$events[e]=[]),t.util.isArray(this.$events[e])||(this.$events[e]=[this.$events[e]]),this.$events[e]},n.prototype.emit=function(e){if(!this.$events)return!1;var n=this.$events[e];if(!n)return!1;var r=Array.prototype.slice.call(arguments,1);if("function"==typeof n)n.apply(this,r);else{if(!t.util.isArray(n))return!1;var i=n.slice();for(var s=0,o=i.length;s<o;s++)i[s].apply(this,r)}return!0}}("undefined"!=typeof io?io:module.exports,"undefined"!=typeof io?io:module.parent.exports),function(exports,nativeJSON){function f(e){return e<10?"0"+e:e}function date(e,t){return isFinite(e.valueOf())?e.getUTCFullYear()+"-"+f(e.getUTCMonth()+1)+"-"+f(e.getUTCDate())+"T"+f(e.getUTCHours())+":"+f(e.getUTCMinutes())+":"+f(e.getUTCSeconds())+"Z":null}function quote(e){return escapable.lastIndex=0,escapable.test(e)?'"'+e.replace(escapable,function(e){var t=meta[e];return typeof t=="string"?t:"\\u"+("0000"+e.charCodeAt(0).toString(16)).slice(-4)})+'"':'"'+e+'"'}function str(e,t){var n,r,i,s,o=gap,u,a=t[e];a instanceof Date&&(a=date(e)),typeof rep=="function"&&(a=rep.call(t,e,a));switch(typeof a){case"string":return quote(a);case"number":return isFinite(a)?String(a):"null";case"boolean":case"null":return String(a);case"object":if(!a)return"null";gap+=indent,u=[];if(Object.prototype.toString.apply(a)==="[object Array]"){s=a.length;for(n=0;n<s;n+=1)u[n]=str(n,a)||"null";return i=u.length===0?"[]":gap?"[\n"+gap+u.join(",\n"+gap)+"\n"+o+"]":"["+u.join(",")+"]",gap=o,i}if(rep&&typeof rep=="object"){s=rep.length;for(n=0;n<s;n+=1)typeof rep[n]=="string"&&(r=rep[n],i=str(r,a),i&&u.push(quote(r)+(gap?": ":":")+i))}else for(r in a)Object.prototype.hasOwnProperty.call(a,r)&&(i=str(r,a),i&&u.push(quote(r)+(gap?": ":":")+i));return i=u.length===0?"{}":gap?"{\n"+gap+u.join(",\n"+gap)+"\n"+o+"}":"{"+u.join(",")+"}",gap=o,i}}if(nativeJSON&&nativeJSON.parse)return exports.JSON={parse:nativeJSON.parse,stringify:nativeJSON.stringify};var JSON=exports.JSON={},cx=/[\u0000\u00ad\u0600-\u0604\u070f\u17b4\u17b5\u200c-\u200f\u2028-\u202f\u2060-\u206f\ufeff\ufff0-\uffff]/g,escapable=/[\\\"\x00-\x1f\x7f-\x9f\u00ad\u0600-\u0604\u070f\u17b4\u17b5\u200c-\u200f\u2028-\u202f\u2060-\u206f\ufeff\ufff0-\uffff]/g,gap,indent,meta={"\b":"\\b","	":"\\t","\n":"\\n","\f":"\\f","\r":"\\r",'"':'\\"',"\\":"\\\\"},rep;JSON.stringify=function(e,t,n){var r;gap="",indent="";if(typeof n=="number")for(r=0;r<n;r+=1)indent+=" ";else typeof n=="string"&&(indent=n);rep=t;if(!t||typeof t=="function"||typeof t=="object"&&typeof t.length=="number")return str("",{"":e});throw new Error("JSON.stringify")},JSON.parse=function(text,reviver){function walk(e,t){var n,r,i=e[t];if(i&&typeof i=="object")for(n in i)Object.prototype.hasOwnProperty.call(i,n)&&(r=walk(i,n),r!==undefined?i[n]=r:delete i[n]);return reviver.call(e,t,i)}var j;text=String(text),cx.lastIndex=0,cx.test(text)&&(text=text.replace(cx,function(e){return"\\u"+("0000"+e.charCodeAt(0).toString(16)).slice(-4)}));if(/^[\],:{}\s]*$/.test(text.replace(/\\(?:["\\\/bfnrt]|u[0-9a-fA-F]{4})/g,"@").replace(/"[^"\\\n\r]*"|true|false|null|-?\d+(?:\.\d*)?(?:[eE][+\-]?\d+)?/g,"]").replace(/(?:^|:|,)(?:\s*\[)+/g,"")))return j=eval("("+text+")"),typeof reviver=="function"?walk({"":j},""):j;throw new SyntaxError("JSON.parse")}}("undefined"!=typeof io?io:module.exports,typeof JSON!="undefined"?JSON:undefined),function(e,t){var n=e.parser={},r=n.packets=["disconnect","connect","heartbeat","message","json","event","ack","error","noop"],i=n.reasons=["transport not supported","client not handshaken","unauthorized"],s=n.advice=["reconnect"],o=t.JSON,u=t.util.indexOf;n.encodePacket=function(e){var t=u(r,e.type),n=e.id||"",a=e.endpoint||"",f=e.ack,l=null;switch(e.type){case"error":var c=e.reason?u(i,e.reason):"",h=e.advice?u(s,e.advice):"";if(c!==""||h!=="")l=c+(h!==""?"+"+h:"");break;case"message":e.data!==""&&(l=e.data);break;case"event":var p={name:e.name};e.args&&e.args.length&&(p.args=e.args),l=o.stringify(p);break;case"json":l=o.stringify(e.data);break;case"connect":e.qs&&(l=e.qs);break;case"ack":l=e.ackId+(e.args&&e.args.length?"+"+o.stringify(e.args):"")}var d=[t,n+(f=="data"?"+":""),a];return l!==null&&l!==undefined&&d.push(l),d.join(":")},n.encodePayload=function(e){var t="";if(e.length==1)return e[0];for(var n=0,r=e.length;n<r;n++){var i=e[n];t+="�"+i.length+"�"+e[n]}return t};var a=/([^:]+):([0-9]+)?(\+)?:([^:]+)?:?([\s\S]*)?/;n.decodePacket=function(e){var t=e.match(a);if(!t)return{};var n=t[2]||"",e=t[5]||"",u={type:r[t[1]],endpoint:t[4]||""};n&&(u.id=n,t[3]?u.ack="data":u.ack=!0);switch(u.type){case"error":var t=e.split("+");u.reason=i[t[0]]||"",u.advice=s[t[1]]||"";break;case"message":u.data=e||"";break;case"event":try{var f=o.parse(e);u.name=f.name,u.args=f.args}catch(l){}u.args=u.args||[];break;case"json":try{u.data=o.parse(e)}catch(l){}break;case"connect":u.qs=e||"";break;case"ack":var t=e.match(/^([0-9]+)(\+)?(.*)/);if(t){u.ackId=t[1],u.args=[];if(t[3])try{u.args=t[3]?o.parse(t[3]):[]}catch(l){}}break;case"disconnect":case"heartbeat":}return u},n.decodePayload=function(e){if(e.charAt(0)=="�"){var t=[];for(var r=1,i="";r<e.length;r++)e.charAt(r)=="�"?(t.push(n.decodePacket(e.substr(r+1).substr(0,i))),r+=Number(i)+1,i=""):i+=e.charAt(r);return t}return[n.decodePacket(e)]}}("undefined"!=typeof io?io:module.exports,"undefined"!=typeof io?io:module.parent.exports),function(e,t){function n(e,t){this.socket=e,this.sessid=t}e.Transport=n,t.util.mixin(n,t.EventEmitter),n.prototype.heartbeats=function(){return!0},n.prototype.onData=function(e){this.clearCloseTimeout(),(this.socket.connected||this.socket.connecting||this.socket.reconnecting)&&this.setCloseTimeout();if(e!==""){var n=t.parser.decodePayload(e);if(n&&n.length)for(var r=0,i=n.length;r<i;r++)this.onPacket(n[r])}return this},n.prototype.onPacket=function(e){return this.socket.setHeartbeatTimeout(),e.type=="heartbeat"?this.onHeartbeat():(e.type=="connect"&&e.endpoint==""&&this.onConnect(),e.type=="error"&&e.advice=="reconnect"&&(this.isOpen=!1),this.socket.onPacket(e),this)},n.prototype.setCloseTimeout=function(){if(!this.closeTimeout){var e=this;this.closeTimeout=setTimeout(function(){e.onDisconnect()},this.socket.closeTimeout)}},n.prototype.onDisconnect=function(){return this.isOpen&&this.close(),this.clearTimeouts(),this.socket.onDisconnect(),this},n.prototype.onConnect=function(){return this.socket.onConnect(),this},n.prototype.clearCloseTimeout=function(){this.closeTimeout&&(clearTimeout(this.closeTimeout),this.closeTimeout=null)},n.prototype.clearTimeouts=function(){this.clearCloseTimeout(),this.reopenTimeout&&clearTimeout(this.reopenTimeout)},n.prototype.packet=function(e){this.send(t.parser.encodePacket(e))},n.prototype.onHeartbeat=function(e){this.packet({type:"heartbeat"})},n.prototype.onOpen=function(){this.isOpen=!0,this.clearCloseTimeout(),this.socket.onOpen()},n.prototype.onClose=function(){var e=this;this.isOpen=!1,this.socket.onClose(),this.onDisconnect()},n.prototype.prepareUrl=function(){var e=this.socket.options;return this.scheme()+"://"+e.host+":"+e.port+"/"+e.resource+"/"+t.protocol+"/"+this.name+"/"+this.sessid},n.prototype.ready=function(e,t){t.call(this)}}("undefined"!=typeof io?io:module.exports,"undefined"!=typeof io?io:module.parent.exports),function(e,t,n){function r(e){this.options={port:80,secure:!1,document:"document"in n?document:!1,resource:"socket.io",transports:t.transports,"connect timeout":1e4,"try multiple transports":!0,reconnect:!0,"reconnection delay":500,"reconnection limit":Infinity,"reopen delay":3e3,"max reconnection attempts":10,"sync disconnect on unload":!1,"auto connect":!0,"flash policy port":10843,manualFlush:!1},t.util.merge(this.options,e),this.connected=!1,this.open=!1,this.connecting=!1,this.reconnecting=!1,this.namespaces={},this.buffer=[],this.doBuffer=!1;if(this.options["sync disconnect on unload"]&&(!this.isXDomain()||t.util.ua.hasCORS)){var r=this;t.util.on(n,"beforeunload",function(){r.disconnectSync()},!1)}this.options["auto connect"]&&this.connect()}function i(){}e.Socket=r,t.util.mixin(r,t.EventEmitter),r.prototype.of=function(e){return this.namespaces[e]||(this.namespaces[e]=new t.SocketNamespace(this,e),e!==""&&this.namespaces[e].packet({type:"connect"})),this.namespaces[e]},r.prototype.publish=function(){this.emit.apply(this,arguments);var e;for(var t in this.namespaces)this.namespaces.hasOwnProperty(t)&&(e=this.of(t),e.$emit.apply(e,arguments))},r.prototype.handshake=function(e){function s(t){t instanceof Error?(n.connecting=!1,n.onError(t.message)):e.apply(null,t.split(":"))}var n=this,r=this.options,o=["http"+(r.secure?"s":"")+":/",r.host+":"+r.port,r.resource,t.protocol,t.util.query(this.options.query,"t="+ +(new Date))].join("/");if(this.isXDomain()&&!t.util.ua.hasCORS){var u=document.getElementsByTagName("script")[0],a=document.createElement("script");a.src=o+"&jsonp="+t.j.length,u.parentNode.insertBefore(a,u),t.j.push(function(e){s(e),a.parentNode.removeChild(a)})}else{var f=t.util.request();f.open("GET",o,!0),this.isXDomain()&&(f.withCredentials=!0),f.onreadystatechange=function(){f.readyState==4&&(f.onreadystatechange=i,f.status==200?s(f.responseText):f.status==403?n.onError(f.responseText):(n.connecting=!1,!n.reconnecting&&n.onError(f.responseText)))},f.send(null)}},r.prototype.getTransport=function(e){var n=e||this.transports,r;for(var i=0,s;s=n[i];i++)if(t.Transport[s]&&t.Transport[s].check(this)&&(!this.isXDomain()||t.Transport[s].xdomainCheck(this)))return new t.Transport[s](this,this.sessionid);return null},r.prototype.connect=function(e){if(this.connecting)return this;var n=this;return n.connecting=!0,this.handshake(function(r,i,s,o){function u(e){n.transport&&n.transport.clearTimeouts(),n.transport=n.getTransport(e);if(!n.transport)return n.publish("connect_failed");n.transport.ready(n,function(){n.connecting=!0,n.publish("connecting",n.transport.name),n.transport.open(),n.options["connect timeout"]&&(n.handleReconnectionFunction=function(){if(!n.connected){n.connecting=!1;if(n.options["try multiple transports"]){var e=n.transports;while(e.length>0&&e.splice(0,1)[0]!=n.transport.name);e.length?u(e):n.publish("connect_failed")}}},n.connectTimeoutTimer=setTimeout(n.handleReconnectionFunction,n.options["connect timeout"]))})}n.sessionid=r,n.closeTimeout=s*1e3,n.heartbeatTimeout=i*1e3,n.transports||(n.transports=n.origTransports=o?t.util.intersect(o.split(","),n.options.transports):n.options.transports),n.setHeartbeatTimeout(),u(n.transports),n.once("connect",function(){clearTimeout(n.connectTimeoutTimer),e&&typeof e=="function"&&e()})}),this},r.prototype.setHeartbeatTimeout=function(){clearTimeout(this.heartbeatTimeoutTimer);if(this.transport&&!this.transport.heartbeats())return;var e=this;this.heartbeatTimeoutTimer=setTimeout(function(){e.transport.onClose()},this.heartbeatTimeout)},r.prototype.packet=function(e){return this.connected&&!this.doBuffer?this.transport.packet(e):this.buffer.push(e),this},r.prototype.setBuffer=function(e){this.doBuffer=e,!e&&this.connected&&this.buffer.length&&(this.options.manualFlush||this.flushBuffer())},r.prototype.flushBuffer=function(){this.transport.payload(this.buffer),this.buffer=[]},r.prototype.disconnect=function(){if(this.connected||this.connecting)this.open&&this.of("").packet({type:"disconnect"}),this.onDisconnect("booted");return this},r.prototype.disconnectSync=function(){var e=t.util.request(),n=["http"+(this.options.secure?"s":"")+":/",this.options.host+":"+this.options.port,this.options.resource,t.protocol,"",this.sessionid].join("/")+"/?disconnect=1";e.open("GET",n,!1),e.send(null),this.onDisconnect("booted")},r.prototype.isXDomain=function(){var e=n.location.port||("https:"==n.location.protocol?443:80);return this.options.host!==n.location.hostname||this.options.port!=e},r.prototype.onConnect=function(){this.connected||(this.connected=!0,this.connecting=!1,this.doBuffer||this.setBuffer(!1),this.emit("connect"))},r.prototype.onOpen=function(){this.open=!0},r.prototype.onClose=function(){this.open=!1,clearTimeout(this.heartbeatTimeoutTimer)},r.prototype.onPacket=function(e){this.of(e.endpoint).onPacket(e)},r.prototype.onError=function(e){e&&e.advice&&e.advice==="reconnect"&&(this.connected||this.connecting)&&(this.disconnect(),this.options.reconnect&&this.reconnect()),this.publish("error",e&&e.reason?e.reason:e)},r.prototype.onDisconnect=function(e){var t=this.connected,n=this.connecting;this.connected=!1,this.connecting=!1,this.open=!1;if(t||n)this.transport.close(),this.transport.clearTimeouts(),t&&(this.publish("disconnect",e),"booted"!=e&&this.options.reconnect&&!this.reconnecting&&this.reconnect())},r.prototype.reconnect=function(){function i(){if(e.connected){for(var t in e.namespaces)e.namespaces.hasOwnProperty(t)&&""!==t&&e.namespaces[t].packet({type:"connect"});e.publish("reconnect",e.transport.name,e.reconnectionAttempts)}clearTimeout(e.reconnectionTimer),e.removeListener("connect_failed",s),e.removeListener("connect",s),e.reconnecting=!1,delete e.reconnectionAttempts,delete e.reconnectionDelay,delete e.reconnectionTimer,delete e.redoTransports,e.options["try multiple transports"]=n}function s(){if(!e.reconnecting)return;if(e.connected)return i();if(e.connecting&&e.reconnecting)return e.reconnectionTimer=setTimeout(s,1e3);e.reconnectionAttempts++>=t?e.redoTransports?(e.publish("reconnect_failed"),i()):(e.on("connect_failed",s),e.options["try multiple transports"]=!0,e.transports=e.origTransports,e.transport=e.getTransport(),e.redoTransports=!0,e.connect()):(e.reconnectionDelay<r&&(e.reconnectionDelay*=2),e.connect(),e.publish("reconnecting",e.reconnectionDelay,e.reconnectionAttempts),e.reconnectionTimer=setTimeout(s,e.reconnectionDelay))}this.reconnecting=!0,this.reconnectionAttempts=0,this.reconnectionDelay=this.options["reconnection delay"];var e=this,t=this.options["max reconnection attempts"],n=this.options["try multiple transports"],r=this.options["reconnection limit"];this.options["try multiple transports"]=!1,this.reconnectionTimer=setTimeout(s,this.reconnectionDelay),this.on("connect",s)}}("undefined"!=typeof io?io:module.exports,"undefined"!=typeof io?io:module.parent.exports,this),function(e,t){function n(e,t){this.socket=e,this.name=t||"",this.flags={},this.json=new r(this,"json"),this.ackPackets=0,this.acks={}}function r(e,t){this.namespace=e,this.name=t}e.SocketNamespace=n,t.util.mixin(n,t.EventEmitter),n.prototype.$emit=t.EventEmitter.prototype.emit,n.prototype.of=function(){return this.socket.of.apply(this.socket,arguments)},n.prototype.packet=function(e){return e.endpoint=this.name,this.socket.packet(e),this.flags={},this},n.prototype.send=function(e,t){var n={type:this.flags.json?"json":"message",data:e};return"function"==typeof t&&(n.id=++this.ackPackets,n.ack=!0,this.acks[n.id]=t),this.packet(n)},n.prototype.emit=function(e){var t=Array.prototype.slice.call(arguments,1),n=t[t.length-1],r={type:"event",name:e};return"function"==typeof n&&(r.id=++this.ackPackets,r.ack="data",this.acks[r.id]=n,t=t.slice(0,t.length-1)),r.args=t,this.packet(r)},n.prototype.disconnect=function(){return this.name===""?this.socket.disconnect():(this.packet({type:"disconnect"}),this.$emit("disconnect")),this},n.prototype.onPacket=function(e){function r(){n.packet({type:"ack",args:t.util.toArray(arguments),ackId:e.id})}var n=this;switch(e.type){case"connect":this.$emit("connect");break;case"disconnect":this.name===""?this.socket.onDisconnect(e.reason||"booted"):this.$emit("disconnect",e.reason);break;case"message":case"json":var i=["message",e.data];e.ack=="data"?i.push(r):e.ack&&this.packet({type:"ack",ackId:e.id}),this.$emit.apply(this,i);break;case"event":var i=[e.name].concat(e.args);e.ack=="data"&&i.push(r),this.$emit.apply(this,i);break;case"ack":this.acks[e.ackId]&&(this.acks[e.ackId].apply(this,e.args),delete this.acks[e.ackId]);break;case"error":e.advice?this.socket.onError(e):e.reason=="unauthorized"?this.$emit("connect_failed",e.reason):this.$emit("error",e.reason)}},r.prototype.send=function(){this.namespace.flags[this.name]=!0,this.namespace.send.apply(this.namespace,arguments)},r.prototype.emit=function(){this.namespace.flags[this.name]=!0,this.namespace.emit.apply(this.namespace,arguments)}}("undefined"!=typeof io?io:module.exports,"undefined"!=typeof io?io:module.parent.exports),function(e,t,n){function r(e){t.Transport.apply(this,arguments)}e.websocket=r,t.util.inherit(r,t.Transport),r.prototype.name="websocket",r.prototype.open=function(){var e=t.util.query(this.socket.options.query),r=this,i;return i||(i=n.MozWebSocket||n.WebSocket),this.websocket=new i(this.prepareUrl()+e),this.websocket.onopen=function(){r.onOpen(),r.socket.setBuffer(!1)},this.websocket.onmessage=function(e){r.onData(e.data)},this.websocket.onclose=function(){r.onClose(),r.socket.setBuffer(!0)},this.websocket.onerror=function(e){r.onError(e)},this},t.util.ua.iDevice?r.prototype.send=function(e){var t=this;return setTimeout(function(){t.websocket.send(e)},0),this}:r.prototype.send=function(e){return this.websocket.send(e),this},r.prototype.payload=function(e){for(var t=0,n=e.length;t<n;t++)this.packet(e[t]);return this},r.prototype.close=function(){return this.websocket.close(),this},r.prototype.onError=function(e){this.socket.onError(e);var t=this;setTimeout(function(){t.socket.handleReconnectionFunction()},10)},r.prototype.scheme=function(){return this.socket.options.secure?"wss":"ws"},r.check=function(){return"WebSocket"in n&&!("__addTask"in WebSocket)||"MozWebSocket"in n},r.xdomainCheck=function(){return!0},t.transports.push("websocket")}("undefined"!=typeof io?io.Transport:module.exports,"undefined"!=typeof io?io:module.parent.exports,this),function(e,t){function n(){t.Transport.websocket.apply(this,arguments)}e.flashsocket=n,t.util.inherit(n,t.Transport.websocket),n.prototype.name="flashsocket",n.prototype.open=function(){var e=this,n=arguments;return WebSocket.__addTask(function(){t.Transport.websocket.prototype.open.apply(e,n)}),this},n.prototype.send=function(){var e=this,n=arguments;return WebSocket.__addTask(function(){t.Transport.websocket.prototype.send.apply(e,n)}),this},n.prototype.close=function(){return WebSocket.__tasks.length=0,t.Transport.websocket.prototype.close.call(this),this},n.prototype.ready=function(e,r){function i(){var t=e.options,i=t["flash policy port"],o=["http"+(t.secure?"s":"")+":/",t.host+":"+t.port,t.resource,"static/flashsocket","WebSocketMain"+(e.isXDomain()?"Insecure":"")+".swf"];n.loaded||(typeof WEB_SOCKET_SWF_LOCATION=="undefined"&&(WEB_SOCKET_SWF_LOCATION=o.join("/")),i!==843&&WebSocket.loadFlashPolicyFile("xmlsocket://"+t.host+":"+i),WebSocket.__initialize(),n.loaded=!0),r.call(s)}var s=this;if(document.body)return i();t.util.load(i)},n.check=function(){return typeof WebSocket!="undefined"&&"__initialize"in WebSocket&&!!swfobject?swfobject.getFlashPlayerVersion().major>=10:!1},n.xdomainCheck=function(){return!0},typeof window!="undefined"&&(WEB_SOCKET_DISABLE_AUTO_INITIALIZATION=!0),t.transports.push("flashsocket")}("undefined"!=typeof io?io.Transport:module.exports,"undefined"!=typeof io?io:module.parent.exports);if("undefined"!=typeof window)var swfobject=function(){function C(){if(b)return;try{var e=a.getElementsByTagName("body")[0].appendChild(U("span"));e.parentNode.removeChild(e)}catch(t){return}b=!0;var n=c.length;for(var r=0;r<n;r++)c[r]()}function k(e){b?e():c[c.length]=e}function L(t){if(typeof u.addEventListener!=e)u.addEventListener("load",t,!1);else if(typeof a.addEventListener!=e)a.addEventListener("load",t,!1);else if(typeof u.attachEvent!=e)z(u,"onload",t);else if(typeof u.onload=="function"){var n=u.onload;u.onload=function(){n(),t()}}else u.onload=t}function A(){l?O():M()}function O(){var n=a.getElementsByTagName("body")[0],r=U(t);r.setAttribute("type",i);var s=n.appendChild(r);if(s){var o=0;(function(){if(typeof s.GetVariable!=e){var t=s.GetVariable("$version");t&&(t=t.split(" ")[1].split(","),T.pv=[parseInt(t[0],10),parseInt(t[1],10),parseInt(t[2],10)])}else if(o<10){o++,setTimeout(arguments.callee,10);return}n.removeChild(r),s=null,M()})()}else M()}function M(){var t=h.length;if(t>0)for(var n=0;n<t;n++){var r=h[n].id,i=h[n].callbackFn,s={success:!1,id:r};if(T.pv[0]>0){var o=R(r);if(o)if(W(h[n].swfVersion)&&!(T.wk&&T.wk<312))V(r,!0),i&&(s.success=!0,s.ref=_(r),i(s));else if(h[n].expressInstall&&D()){var u={};u.data=h[n].expressInstall,u.width=o.getAttribute("width")||"0",u.height=o.getAttribute("height")||"0",o.getAttribute("class")&&(u.styleclass=o.getAttribute("class")),o.getAttribute("align")&&(u.align=o.getAttribute("align"));var a={},f=o.getElementsByTagName("param"),l=f.length;for(var c=0;c<l;c++)f[c].getAttribute("name").toLowerCase()!="movie"&&(a[f[c].getAttribute("name")]=f[c].getAttribute("value"));P(u,a,r,i)}else H(o),i&&i(s)}else{V(r,!0);if(i){var p=_(r);p&&typeof p.SetVariable!=e&&(s.success=!0,s.ref=p),i(s)}}}}function _(n){var r=null,i=R(n);if(i&&i.nodeName=="OBJECT")if(typeof i.SetVariable!=e)r=i;else{var s=i.getElementsByTagName(t)[0];s&&(r=s)}return r}function D(){return!w&&W("6.0.65")&&(T.win||T.mac)&&!(T.wk&&T.wk<312)}function P(t,n,r,i){w=!0,g=i||null,y={success:!1,id:r};var o=R(r);if(o){o.nodeName=="OBJECT"?(v=B(o),m=null):(v=o,m=r),t.id=s;if(typeof t.width==e||!/%$/.test(t.width)&&parseInt(t.width,10)<310)t.width="310";if(typeof t.height==e||!/%$/.test(t.height)&&parseInt(t.height,10)<137)t.height="137";a.title=a.title.slice(0,47)+" - Flash Player Installation";var f=T.ie&&T.win?["Active"].concat("").join("X"):"PlugIn",l="MMredirectURL="+u.location.toString().replace(/&/g,"%26")+"&MMplayerType="+f+"&MMdoctitle="+a.title;typeof n.flashvars!=e?n.flashvars+="&"+l:n.flashvars=l;if(T.ie&&T.win&&o.readyState!=4){var c=U("div");r+="SWFObjectNew",c.setAttribute("id",r),o.parentNode.insertBefore(c,o),o.style.display="none",function(){o.readyState==4?o.parentNode.removeChild(o):setTimeout(arguments.callee,10)}()}j(t,n,r)}}function H(e){if(T.ie&&T.win&&e.readyState!=4){var t=U("div");e.parentNode.insertBefore(t,e),t.parentNode.replaceChild(B(e),t),e.style.display="none",function(){e.readyState==4?e.parentNode.removeChild(e):setTimeout(arguments.callee,10)}()}else e.parentNode.replaceChild(B(e),e)}function B(e){var n=U("div");if(T.win&&T.ie)n.innerHTML=e.innerHTML;else{var r=e.getElementsByTagName(t)[0];if(r){var i=r.childNodes;if(i){var s=i.length;for(var o=0;o<s;o++)(i[o].nodeType!=1||i[o].nodeName!="PARAM")&&i[o].nodeType!=8&&n.appendChild(i[o].cloneNode(!0))}}}return n}function j(n,r,s){var o,u=R(s);if(T.wk&&T.wk<312)return o;if(u){typeof n.id==e&&(n.id=s);if(T.ie&&T.win){var a="";for(var f in n)n[f]!=Object.prototype[f]&&(f.toLowerCase()=="data"?r.movie=n[f]:f.toLowerCase()=="styleclass"?a+=' class="'+n[f]+'"':f.toLowerCase()!="classid"&&(a+=" "+f+'="'+n[f]+'"'));var l="";for(var c in r)r[c]!=Object.prototype[c]&&(l+='<param name="'+c+'" value="'+r[c]+'" />');u.outerHTML='<object classid="clsid:D27CDB6E-AE6D-11cf-96B8-444553540000"'+a+">"+l+"</object>",p[p.length]=n.id,o=R(n.id)}else{var h=U(t);h.setAttribute("type",i);for(var d in n)n[d]!=Object.prototype[d]&&(d.toLowerCase()=="styleclass"?h.setAttribute("class",n[d]):d.toLowerCase()!="classid"&&h.setAttribute(d,n[d]));for(var v in r)r[v]!=Object.prototype[v]&&v.toLowerCase()!="movie"&&F(h,v,r[v]);u.parentNode.replaceChild(h,u),o=h}}return o}function F(e,t,n){var r=U("param");r.setAttribute("name",t),r.setAttribute("value",n),e.appendChild(r)}function I(e){var t=R(e);t&&t.nodeName=="OBJECT"&&(T.ie&&T.win?(t.style.display="none",function(){t.readyState==4?q(e):setTimeout(arguments.callee,10)}()):t.parentNode.removeChild(t))}function q(e){var t=R(e);if(t){for(var n in t)typeof t[n]=="function"&&(t[n]=null);t.parentNode.removeChild(t)}}function R(e){var t=null;try{t=a.getElementById(e)}catch(n){}return t}function U(e){return a.createElement(e)}function z(e,t,n){e.attachEvent(t,n),d[d.length]=[e,t,n]}function W(e){var t=T.pv,n=e.split(".");return n[0]=parseInt(n[0],10),n[1]=parseInt(n[1],10)||0,n[2]=parseInt(n[2],10)||0,t[0]>n[0]||t[0]==n[0]&&t[1]>n[1]||t[0]==n[0]&&t[1]==n[1]&&t[2]>=n[2]?!0:!1}function X(n,r,i,s){if(T.ie&&T.mac)return;var o=a.getElementsByTagName("head")[0];if(!o)return;var u=i&&typeof i=="string"?i:"screen";s&&(E=null,S=null);if(!E||S!=u){var f=U("style");f.setAttribute("type","text/css"),f.setAttribute("media",u),E=o.appendChild(f),T.ie&&T.win&&typeof a.styleSheets!=e&&a.styleSheets.length>0&&(E=a.styleSheets[a.styleSheets.length-1]),S=u}T.ie&&T.win?E&&typeof E.addRule==t&&E.addRule(n,r):E&&typeof a.createTextNode!=e&&E.appendChild(a.createTextNode(n+" {"+r+"}"))}function V(e,t){if(!x)return;var n=t?"visible":"hidden";b&&R(e)?R(e).style.visibility=n:X("#"+e,"visibility:"+n)}function $(t){var n=/[\\\"<>\.;]/,r=n.exec(t)!=null;return r&&typeof encodeURIComponent!=e?encodeURIComponent(t):t}var e="undefined",t="object",n="Shockwave Flash",r="ShockwaveFlash.ShockwaveFlash",i="application/x-shockwave-flash",s="SWFObjectExprInst",o="onreadystatechange",u=window,a=document,f=navigator,l=!1,c=[A],h=[],p=[],d=[],v,m,g,y,b=!1,w=!1,E,S,x=!0,T=function(){var s=typeof a.getElementById!=e&&typeof a.getElementsByTagName!=e&&typeof a.createElement!=e,o=f.userAgent.toLowerCase(),c=f.platform.toLowerCase(),h=c?/win/.test(c):/win/.test(o),p=c?/mac/.test(c):/mac/.test(o),d=/webkit/.test(o)?parseFloat(o.replace(/^.*webkit\/(\d+(\.\d+)?).*$/,"$1")):!1,v=!1,m=[0,0,0],g=null;if(typeof f.plugins!=e&&typeof f.plugins[n]==t)g=f.plugins[n].description,g&&(typeof f.mimeTypes==e||!f.mimeTypes[i]||!!f.mimeTypes[i].enabledPlugin)&&(l=!0,v=!1,g=g.replace(/^.*\s+(\S+\s+\S+$)/,"$1"),m[0]=parseInt(g.replace(/^(.*)\..*$/,"$1"),10),m[1]=parseInt(g.replace(/^.*\.(.*)\s.*$/,"$1"),10),m[2]=/[a-zA-Z]/.test(g)?parseInt(g.replace(/^.*[a-zA-Z]+(.*)$/,"$1"),10):0);else if(typeof u[["Active"].concat("Object").join("X")]!=e)try{var y=new(window[["Active"].concat("Object").join("X")])(r);y&&(g=y.GetVariable("$version"),g&&(v=!0,g=g.split(" ")[1].split(","),m=[parseInt(g[0],10),parseInt(g[1],10),parseInt(g[2],10)]))}catch(b){}return{w3:s,pv:m,wk:d,ie:v,win:h,mac:p}}(),N=function(){if(!T.w3)return;(typeof a.readyState!=e&&a.readyState=="complete"||typeof a.readyState==e&&(a.getElementsByTagName("body")[0]||a.body))&&C(),b||(typeof a.addEventListener!=e&&a.addEventListener("DOMContentLoaded",C,!1),T.ie&&T.win&&(a.attachEvent(o,function(){a.readyState=="complete"&&(a.detachEvent(o,arguments.callee),C())}),u==top&&function(){if(b)return;try{a.documentElement.doScroll("left")}catch(e){setTimeout(arguments.callee,0);return}C()}()),T.wk&&function(){if(b)return;if(!/loaded|complete/.test(a.readyState)){setTimeout(arguments.callee,0);return}C()}(),L(C))}(),J=function(){T.ie&&T.win&&window.attachEvent("onunload",function(){var e=d.length;for(var t=0;t<e;t++)d[t][0].detachEvent(d[t][1],d[t][2]);var n=p.length;for(var r=0;r<n;r++)I(p[r]);for(var i in T)T[i]=null;T=null;for(var s in swfobject)swfobject[s]=null;swfobject=null})}();return{registerObject:function(e,t,n,r){if(T.w3&&e&&t){var i={};i.id=e,i.swfVersion=t,i.expressInstall=n,i.callbackFn=r,h[h.length]=i,V(e,!1)}else r&&r({success:!1,id:e})},getObjectById:function(e){if(T.w3)return _(e)},embedSWF:function(n,r,i,s,o,u,a,f,l,c){var h={success:!1,id:r};T.w3&&!(T.wk&&T.wk<312)&&n&&r&&i&&s&&o?(V(r,!1),k(function(){i+="",s+="";var p={};if(l&&typeof l===t)for(var d in l)p[d]=l[d];p.data=n,p.width=i,p.height=s;var v={};if(f&&typeof f===t)for(var m in f)v[m]=f[m];if(a&&typeof a===t)for(var g in a)typeof v.flashvars!=e?v.flashvars+="&"+g+"="+a[g]:v.flashvars=g+"="+a[g];if(W(o)){var y=j(p,v,r);p.id==r&&V(r,!0),h.success=!0,h.ref=y}else{if(u&&D()){p.data=u,P(p,v,r,c);return}V(r,!0)}c&&c(h)})):c&&c(h)},switchOffAutoHideShow:function(){x=!1},ua:T,getFlashPlayerVersion:function(){return{major:T.pv[0],minor:T.pv[1],release:T.pv[2]}},hasFlashPlayerVersion:W,createSWF:function(e,t,n){return T.w3?j(e,t,n):undefined},showExpressInstall:function(e,t,n,r){T.w3&&D()&&P(e,t,n,r)},removeSWF:function(e){T.w3&&I(e)},createCSS:function(e,t,n,r){T.w3&&X(e,t,n,r)},addDomLoadEvent:k,addLoadEvent:L,getQueryParamValue:function(e){var t=a.location.search||a.location.hash;if(t){/\?/.test(t)&&(t=t.split("?")[1]);if(e==null)return $(t);var n=t.split("&");for(var r=0;r<n.length;r++)if(n[r].substring(0,n[r].indexOf("="))==e)return $(n[r].substring(n[r].indexOf("=")+1))}return""},expressInstallCallback:function(){if(w){var e=R(s);e&&v&&(e.parentNode.replaceChild(v,e),m&&(V(m,!0),T.ie&&T.win&&(v.style.display="block")),g&&g(y)),w=!1}}}}();(function(){if("undefined"==typeof window||window.WebSocket)return;var e=window.console;if(!e||!e.log||!e.error)e={log:function(){},error:function(){}};if(!swfobject.hasFlashPlayerVersion("10.0.0")){e.error("Flash Player >= 10.0.0 is required.");return}location.protocol=="file:"&&e.error("WARNING: web-socket-js doesn't work in file:///... URL unless you set Flash Security Settings properly. Open the page via Web server i.e. http://..."),WebSocket=function(e,t,n,r,i){var s=this;s.__id=WebSocket.__nextId++,WebSocket.__instances[s.__id]=s,s.readyState=WebSocket.CONNECTING,s.bufferedAmount=0,s.__events={},t?typeof t=="string"&&(t=[t]):t=[],setTimeout(function(){WebSocket.__addTask(function(){WebSocket.__flash.create(s.__id,e,t,n||null,r||0,i||null)})},0)},WebSocket.prototype.send=function(e){if(this.readyState==WebSocket.CONNECTING)throw"INVALID_STATE_ERR: Web Socket connection has not been established";var t=WebSocket.__flash.send(this.__id,encodeURIComponent(e));return t<0?!0:(this.bufferedAmount+=t,!1)},WebSocket.prototype.close=function(){if(this.readyState==WebSocket.CLOSED||this.readyState==WebSocket.CLOSING)return;this.readyState=WebSocket.CLOSING,WebSocket.__flash.close(this.__id)},WebSocket.prototype.addEventListener=function(e,t,n){e in this.__events||(this.__events[e]=[]),this.__events[e].push(t)},WebSocket.prototype.removeEventListener=function(e,t,n){if(!(e in this.__events))return;var r=this.__events[e];for(var i=r.length-1;i>=0;--i)if(r[i]===t){r.splice(i,1);break}},WebSocket.prototype.dispatchEvent=function(e){var t=this.__events[e.type]||[];for(var n=0;n<t.length;++n)t[n](e);var r=this["on"+e.type];r&&r(e)},WebSocket.prototype.__handleEvent=function(e){"readyState"in e&&(this.readyState=e.readyState),"protocol"in e&&(this.protocol=e.protocol);var t;if(e.type=="open"||e.type=="error")t=this.__createSimpleEvent(e.type);else if(e.type=="close")t=this.__createSimpleEvent("close");else{if(e.type!="message")throw"unknown event type: "+e.type;var n=decodeURIComponent(e.message);t=this.__createMessageEvent("message",n)}this.dispatchEvent(t)},WebSocket.prototype.__createSimpleEvent=function(e){if(document.createEvent&&window.Event){var t=document.createEvent("Event");return t.initEvent(e,!1,!1),t}return{type:e,bubbles:!1,cancelable:!1}},WebSocket.prototype.__createMessageEvent=function(e,t){if(document.createEvent&&window.MessageEvent&&!window.opera){var n=document.createEvent("MessageEvent");return n.initMessageEvent("message",!1,!1,t,null,null,window,null),n}return{type:e,data:t,bubbles:!1,cancelable:!1}},WebSocket.CONNECTING=0,WebSocket.OPEN=1,WebSocket.CLOSING=2,WebSocket.CLOSED=3,WebSocket.__flash=null,WebSocket.__instances={},WebSocket.__tasks=[],WebSocket.__nextId=0,WebSocket.loadFlashPolicyFile=function(e){WebSocket.__addTask(function(){WebSocket.__flash.loadManualPolicyFile(e)})},WebSocket.__initialize=function(){if(WebSocket.__flash)return;WebSocket.__swfLocation&&(window.WEB_SOCKET_SWF_LOCATION=WebSocket.__swfLocation);if(!window.WEB_SOCKET_SWF_LOCATION){e.error("[WebSocket] set WEB_SOCKET_SWF_LOCATION to location of WebSocketMain.swf");return}var t=document.createElement("div");t.id="webSocketContainer",t.style.position="absolute",WebSocket.__isFlashLite()?(t.style.left="0px",t.style.top="0px"):(t.style.left="-100px",t.style.top="-100px");var n=document.createElement("div");n.id="webSocketFlash",t.appendChild(n),document.body.appendChild(t),swfobject.embedSWF(WEB_SOCKET_SWF_LOCATION,"webSocketFlash","1","1","10.0.0",null,null,{hasPriority:!0,swliveconnect:!0,allowScriptAccess:"always"},null,function(t){t.success||e.error("[WebSocket] swfobject.embedSWF failed")})},WebSocket.__onFlashInitialized=function(){setTimeout(function(){WebSocket.__flash=document.getElementById("webSocketFlash"),WebSocket.__flash.setCallerUrl(location.href),WebSocket.__flash.setDebug(!!window.WEB_SOCKET_DEBUG);for(var e=0;e<WebSocket.__tasks.length;++e)WebSocket.__tasks[e]();WebSocket.__tasks=[]},0)},WebSocket.__onFlashEvent=function(){return setTimeout(function(){try{var t=WebSocket.__flash.receiveEvents();for(var n=0;n<t.length;++n)WebSocket.__instances[t[n].webSocketId].__handleEvent(t[n])}catch(r){e.error(r)}},0),!0},WebSocket.__log=function(t){e.log(decodeURIComponent(t))},WebSocket.__error=function(t){e.error(decodeURIComponent(t))},WebSocket.__addTask=function(e){WebSocket.__flash?e():WebSocket.__tasks.push(e)},WebSocket.__isFlashLite=function(){if(!window.navigator||!window.navigator.mimeTypes)return!1;var e=window.navigator.mimeTypes["application/x-shockwave-flash"];return!e||!e.enabledPlugin||!e.enabledPlugin.filename?!1:e.enabledPlugin.filename.match(/flashlite/i)?!0:!1},window.WEB_SOCKET_DISABLE_AUTO_INITIALIZATION||(window.addEventListener?window.addEventListener("load",function(){WebSocket.__initialize()},!1):window.attachEvent("onload",function(){WebSocket.__initialize()}))})(),function(e,t,n){function r(e){if(!e)return;t.Transport.apply(this,arguments),this.sendBuffer=[]}function i(){}e.XHR=r,t.util.inherit(r,t.Transport),r.prototype.open=function(){return this.socket.setBuffer(!1),this.onOpen(),this.get(),this.setCloseTimeout(),this},r.prototype.payload=function(e){var n=[];for(var r=0,i=e.length;r<i;r++)n.push(t.parser.encodePacket(e[r]));this.send(t.parser.encodePayload(n))},r.prototype.send=function(e){return this.post(e),this},r.prototype.post=function(e){function r(){this.readyState==4&&(this.onreadystatechange=i,t.posting=!1,this.status==200?t.socket.setBuffer(!1):t.onClose())}function s(){this.onload=i,t.socket.setBuffer(!1)}var t=this;this.socket.setBuffer(!0),this.sendXHR=this.request("POST"),n.XDomainRequest&&this.sendXHR instanceof XDomainRequest?this.sendXHR.onload=this.sendXHR.onerror=s:this.sendXHR.onreadystatechange=r,this.sendXHR.send(e)},r.prototype.close=function(){return this.onClose(),this},r.prototype.request=function(e){var n=t.util.request(this.socket.isXDomain()),r=t.util.query(this.socket.options.query,"t="+ +(new Date));n.open(e||"GET",this.prepareUrl()+r,!0);if(e=="POST")try{n.setRequestHeader?n.setRequestHeader("Content-type","text/plain;charset=UTF-8"):n.contentType="text/plain"}catch(i){}return n},r.prototype.scheme=function(){return this.socket.options.secure?"https":"http"},r.check=function(e,r){try{var i=t.util.request(r),s=n.XDomainRequest&&i instanceof XDomainRequest,o=e&&e.options&&e.options.secure?"https:":"http:",u=n.location&&o!=n.location.protocol;if(i&&(!s||!u))return!0}catch(a){}return!1},r.xdomainCheck=function(e){return r.check(e,!0)}}("undefined"!=typeof io?io.Transport:module.exports,"undefined"!=typeof io?io:module.parent.exports,this),function(e,t){function n(e){t.Transport.XHR.apply(this,arguments)}e.htmlfile=n,t.util.inherit(n,t.Transport.XHR),n.prototype.name="htmlfile",n.prototype.get=function(){this.doc=new(window[["Active"].concat("Object").join("X")])("htmlfile"),this.doc.open(),this.doc.write("<html></html>"),this.doc.close(),this.doc.parentWindow.s=this;var e=this.doc.createElement("div");e.className="socketio",this.doc.body.appendChild(e),this.iframe=this.doc.createElement("iframe"),e.appendChild(this.iframe);var n=this,r=t.util.query(this.socket.options.query,"t="+ +(new Date));this.iframe.src=this.prepareUrl()+r,t.util.on(window,"unload",function(){n.destroy()})},n.prototype._=function(e,t){this.onData(e);try{var n=t.getElementsByTagName("script")[0];n.parentNode.removeChild(n)}catch(r){}},n.prototype.destroy=function(){if(this.iframe){try{this.iframe.src="about:blank"}catch(e){}this.doc=null,this.iframe.parentNode.removeChild(this.iframe),this.iframe=null,CollectGarbage()}},n.prototype.close=function(){return this.destroy(),t.Transport.XHR.prototype.close.call(this)},n.check=function(e){if(typeof window!="undefined"&&["Active"].concat("Object").join("X")in window)try{var n=new(window[["Active"].concat("Object").join("X")])("htmlfile");return n&&t.Transport.XHR.check(e)}catch(r){}return!1},n.xdomainCheck=function(){return!1},t.transports.push("htmlfile")}("undefined"!=typeof io?io.Transport:module.exports,"undefined"!=typeof io?io:module.parent.exports),function(e,t,n){function r(){t.Transport.XHR.apply(this,arguments)}function i(){}e["xhr-polling"]=r,t.util.inherit(r,t.Transport.XHR),t.util.merge(r,t.Transport.XHR),r.prototype.name="xhr-polling",r.prototype.heartbeats=function(){return!1},r.prototype.open=function(){var e=this;return t.Transport.XHR.prototype.open.call(e),!1},r.prototype.get=function(){function t(){this.readyState==4&&(this.onreadystatechange=i,this.status==200?(e.onData(this.responseText),e.get()):e.onClose())}function r(){this.onload=i,this.onerror=i,e.retryCounter=1,e.onData(this.responseText),e.get()}function s(){e.retryCounter++,!e.retryCounter||e.retryCounter>3?e.onClose():e.get()}if(!this.isOpen)return;var e=this;this.xhr=this.request(),n.XDomainRequest&&this.xhr instanceof XDomainRequest?(this.xhr.onload=r,this.xhr.onerror=s):this.xhr.onreadystatechange=t,this.xhr.send(null)},r.prototype.onClose=function(){t.Transport.XHR.prototype.onClose.call(this);if(this.xhr){this.xhr.onreadystatechange=this.xhr.onload=this.xhr.onerror=i;try{this.xhr.abort()}catch(e){}this.xhr=null}},r.prototype.ready=function(e,n){var r=this;t.util.defer(function(){n.call(r)})},t.transports.push("xhr-polling")}("undefined"!=typeof io?io.Transport:module.exports,"undefined"!=typeof io?io:module.parent.exports,this),function(e,t,n){function i(e){t.Transport["xhr-polling"].apply(this,arguments),this.index=t.j.length;var n=this;t.j.push(function(e){n._(e)})}var r=n.document&&"MozAppearance"in n.document.documentElement.style;e["jsonp-polling"]=i,t.util.inherit(i,t.Transport["xhr-polling"]),i.prototype.name="jsonp-polling",i.prototype.post=function(e){function a(){f(),n.socket.setBuffer(!1)}function f(){n.iframe&&n.form.removeChild(n.iframe);try{u=document.createElement('<iframe name="'+n.iframeId+'">')}catch(e){u=document.createElement("iframe"),u.name=n.iframeId}u.id=n.iframeId,n.form.appendChild(u),n.iframe=u}var n=this,r=t.util.query(this.socket.options.query,"t="+ +(new Date)+"&i="+this.index);if(!this.form){var i=document.createElement("form"),s=document.createElement("textarea"),o=this.iframeId="socketio_iframe_"+this.index,u;i.className="socketio",i.style.position="absolute",i.style.top="0px",i.style.left="0px",i.style.display="none",i.target=o,i.method="POST",i.setAttribute("accept-charset","utf-8"),s.name="d",i.appendChild(s),document.body.appendChild(i),this.form=i,this.area=s}this.form.action=this.prepareUrl()+r,f(),this.area.value=t.JSON.stringify(e);try{this.form.submit()}catch(l){}this.iframe.attachEvent?u.onreadystatechange=function(){n.iframe.readyState=="complete"&&a()}:this.iframe.onload=a,this.socket.setBuffer(!0)},i.prototype.get=function(){var e=this,n=document.createElement("script"),i=t.util.query(this.socket.options.query,"t="+ +(new Date)+"&i="+this.index);this.script&&(this.script.parentNode.removeChild(this.script),this.script=null),n.async=!0,n.src=this.prepareUrl()+i,n.onerror=function(){e.onClose()};var s=document.getElementsByTagName("script")[0];s.parentNode.insertBefore(n,s),this.script=n,r&&setTimeout(function(){var e=document.createElement("iframe");document.body.appendChild(e),document.body.removeChild(e)},100)},i.prototype._=function(e){return this.onData(e),this.isOpen&&this.get(),this},i.prototype.ready=function(e,n){var i=this;if(!r)return n.call(this);t.util.load(function(){n.call(i)})},i.check=function(){return"document"in n},i.xdomainCheck=function(){return!0},t.transports.push("jsonp-polling")}("undefined"!=typeof io?io.Transport:module.exports,"undefined"!=typeof io?io:module.parent.exports,this),typeof define=="function"&&define.amd&&define("socketio",[],function(){return io})})(),function(e){function t(e,t){return function(n){return a(e.call(this,n),t)}}function n(e){return function(t){return this.lang().ordinal(e.call(this,t))}}function r(){}function i(e){o(this,e)}function s(e){var t=this._data={},n=e.years||e.year||e.y||0,r=e.months||e.month||e.M||0,i=e.weeks||e.week||e.w||0,s=e.days||e.day||e.d||0,o=e.hours||e.hour||e.h||0,a=e.minutes||e.minute||e.m||0,f=e.seconds||e.second||e.s||0,l=e.milliseconds||e.millisecond||e.ms||0;this._milliseconds=l+f*1e3+a*6e4+o*36e5,this._days=s+i*7,this._months=r+n*12,t.milliseconds=l%1e3,f+=u(l/1e3),t.seconds=f%60,a+=u(f/60),t.minutes=a%60,o+=u(a/60),t.hours=o%24,s+=u(o/24),s+=i*7,t.days=s%30,r+=u(s/30),t.months=r%12,n+=u(r/12),t.years=n}function o(e,t){for(var n in t)t.hasOwnProperty(n)&&(e[n]=t[n]);return e}function u(e){return e<0?Math.ceil(e):Math.floor(e)}function a(e,t){var n=e+"";while(n.length<t)n="0"+n;return n}function f(e,t,n){var r=t._milliseconds,i=t._days,s=t._months,o;r&&e._d.setTime(+e+r*n),i&&e.date(e.date()+i*n),s&&(o=e.date(),e.date(1).month(e.month()+s*n).date(Math.min(o,e.daysInMonth())))}function l(e){return Object.prototype.toString.call(e)==="[object Array]"}function c(e,t){var n=Math.min(e.length,t.length),r=Math.abs(e.length-t.length),i=0,s;for(s=0;s<n;s++)~~e[s]!==~~t[s]&&i++;return i+r}function h(e,t){return t.abbr=e,H[e]||(H[e]=new r),H[e].set(t),H[e]}function p(e){return e?(!H[e]&&B&&require("./lang/"+e),H[e]):M.fn._lang}function d(e){return e.match(/\[.*\]/)?e.replace(/^\[|\]$/g,""):e.replace(/\\/g,"")}function v(e){var t=e.match(F),n,r;for(n=0,r=t.length;n<r;n++)st[t[n]]?t[n]=st[t[n]]:t[n]=d(t[n]);return function(i){var s="";for(n=0;n<r;n++)s+=typeof t[n].call=="function"?t[n].call(i,e):t[n];return s}}function m(e,t){function n(t){return e.lang().longDateFormat(t)||t}var r=5;while(r--&&I.test(t))t=t.replace(I,n);return nt[t]||(nt[t]=v(t)),nt[t](e)}function g(e){switch(e){case"DDDD":return z;case"YYYY":return W;case"YYYYY":return X;case"S":case"SS":case"SSS":case"DDD":return U;case"MMM":case"MMMM":case"dd":case"ddd":case"dddd":case"a":case"A":return V;case"X":return K;case"Z":case"ZZ":return $;case"T":return J;case"MM":case"DD":case"YY":case"HH":case"hh":case"mm":case"ss":case"M":case"D":case"d":case"H":case"h":case"m":case"s":return R;default:return new RegExp(e.replace("\\",""))}}function y(e,t,n){var r,i,s=n._a;switch(e){case"M":case"MM":s[1]=t==null?0:~~t-1;break;case"MMM":case"MMMM":r=p(n._l).monthsParse(t),r!=null?s[1]=r:n._isValid=!1;break;case"D":case"DD":case"DDD":case"DDDD":t!=null&&(s[2]=~~t);break;case"YY":s[0]=~~t+(~~t>68?1900:2e3);break;case"YYYY":case"YYYYY":s[0]=~~t;break;case"a":case"A":n._isPm=(t+"").toLowerCase()==="pm";break;case"H":case"HH":case"h":case"hh":s[3]=~~t;break;case"m":case"mm":s[4]=~~t;break;case"s":case"ss":s[5]=~~t;break;case"S":case"SS":case"SSS":s[6]=~~(("0."+t)*1e3);break;case"X":n._d=new Date(parseFloat(t)*1e3);break;case"Z":case"ZZ":n._useUTC=!0,r=(t+"").match(Z),r&&r[1]&&(n._tzh=~~r[1]),r&&r[2]&&(n._tzm=~~r[2]),r&&r[0]==="+"&&(n._tzh=-n._tzh,n._tzm=-n._tzm)}t==null&&(n._isValid=!1)}function b(e){var t,n,r=[];if(e._d)return;for(t=0;t<7;t++)e._a[t]=r[t]=e._a[t]==null?t===2?1:0:e._a[t];r[3]+=e._tzh||0,r[4]+=e._tzm||0,n=new Date(0),e._useUTC?(n.setUTCFullYear(r[0],r[1],r[2]),n.setUTCHours(r[3],r[4],r[5],r[6])):(n.setFullYear(r[0],r[1],r[2]),n.setHours(r[3],r[4],r[5],r[6])),e._d=n}function w(e){var t=e._f.match(F),n=e._i,r,i;e._a=[];for(r=0;r<t.length;r++)i=(g(t[r]).exec(n)||[])[0],i&&(n=n.slice(n.indexOf(i)+i.length)),st[t[r]]&&y(t[r],i,e);e._isPm&&e._a[3]<12&&(e._a[3]+=12),e._isPm===!1&&e._a[3]===12&&(e._a[3]=0),b(e)}function E(e){var t,n,r,s=99,u,a,f;while(e._f.length){t=o({},e),t._f=e._f.pop(),w(t),n=new i(t);if(n.isValid()){r=n;break}f=c(t._a,n.toArray()),f<s&&(s=f,r=n)}o(e,r)}function S(e){var t,n=e._i;if(Q.exec(n)){e._f="YYYY-MM-DDT";for(t=0;t<4;t++)if(Y[t][1].exec(n)){e._f+=Y[t][0];break}$.exec(n)&&(e._f+=" Z"),w(e)}else e._d=new Date(n)}function x(t){var n=t._i,r=j.exec(n);n===e?t._d=new Date:r?t._d=new Date(+r[1]):typeof n=="string"?S(t):l(n)?(t._a=n.slice(0),b(t)):t._d=n instanceof Date?new Date(+n):new Date(n)}function T(e,t,n,r,i){return i.relativeTime(t||1,!!n,e,r)}function N(e,t,n){var r=D(Math.abs(e)/1e3),i=D(r/60),s=D(i/60),o=D(s/24),u=D(o/365),a=r<45&&["s",r]||i===1&&["m"]||i<45&&["mm",i]||s===1&&["h"]||s<22&&["hh",s]||o===1&&["d"]||o<=25&&["dd",o]||o<=45&&["M"]||o<345&&["MM",D(o/30)]||u===1&&["y"]||["yy",u];return a[2]=t,a[3]=e>0,a[4]=n,T.apply({},a)}function C(e,t,n){var r=n-t,i=n-e.day();return i>r&&(i-=7),i<r-7&&(i+=7),Math.ceil(M(e).add("d",i).dayOfYear()/7)}function k(e){var t=e._i,n=e._f;return t===null||t===""?null:(typeof t=="string"&&(e._i=t=p().preparse(t)),M.isMoment(t)?(e=o({},t),e._d=new Date(+t._d)):n?l(n)?E(e):w(e):x(e),new i(e))}function L(e,t){M.fn[e]=M.fn[e+"s"]=function(e){var n=this._isUTC?"UTC":"";return e!=null?(this._d["set"+n+t](e),this):this._d["get"+n+t]()}}function A(e){M.duration.fn[e]=function(){return this._data[e]}}function O(e,t){M.duration.fn["as"+e]=function(){return+this/t}}var M,_="2.0.0",D=Math.round,P,H={},B=typeof module!="undefined"&&module.exports,j=/^\/?Date\((\-?\d+)/i,F=/(\[[^\[]*\])|(\\)?(Mo|MM?M?M?|Do|DDDo|DD?D?D?|ddd?d?|do?|w[o|w]?|W[o|W]?|YYYYY|YYYY|YY|a|A|hh?|HH?|mm?|ss?|SS?S?|X|zz?|ZZ?|.)/g,I=/(\[[^\[]*\])|(\\)?(LT|LL?L?L?|l{1,4})/g,q=/([0-9a-zA-Z\u00A0-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF]+)/gi,R=/\d\d?/,U=/\d{1,3}/,z=/\d{3}/,W=/\d{1,4}/,X=/[+\-]?\d{1,6}/,V=/[0-9]*[a-z\u00A0-\u05FF\u0700-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF]+|[\u0600-\u06FF]+\s*?[\u0600-\u06FF]+/i,$=/Z|[\+\-]\d\d:?\d\d/i,J=/T/i,K=/[\+\-]?\d+(\.\d{1,3})?/,Q=/^\s*\d{4}-\d\d-\d\d((T| )(\d\d(:\d\d(:\d\d(\.\d\d?\d?)?)?)?)?([\+\-]\d\d:?\d\d)?)?/,G="YYYY-MM-DDTHH:mm:ssZ",Y=[["HH:mm:ss.S",/(T| )\d\d:\d\d:\d\d\.\d{1,3}/],["HH:mm:ss",/(T| )\d\d:\d\d:\d\d/],["HH:mm",/(T| )\d\d:\d\d/],["HH",/(T| )\d\d/]],Z=/([\+\-]|\d\d)/gi,et="Month|Date|Hours|Minutes|Seconds|Milliseconds".split("|"),tt={Milliseconds:1,Seconds:1e3,Minutes:6e4,Hours:36e5,Days:864e5,Months:2592e6,Years:31536e6},nt={},rt="DDD w W M D d".split(" "),it="M D H h m s w W".split(" "),st={M:function(){return this.month()+1},MMM:function(e){return this.lang().monthsShort(this,e)},MMMM:function(e){return this.lang().months(this,e)},D:function(){return this.date()},DDD:function(){return this.dayOfYear()},d:function(){return this.day()},dd:function(e){return this.lang().weekdaysMin(this,e)},ddd:function(e){return this.lang().weekdaysShort(this,e)},dddd:function(e){return this.lang().weekdays(this,e)},w:function(){return this.week()},W:function(){return this.isoWeek()},YY:function(){return a(this.year()%100,2)},YYYY:function(){return a(this.year(),4)},YYYYY:function(){return a(this.year(),5)},a:function(){return this.lang().meridiem(this.hours(),this.minutes(),!0)},A:function(){return this.lang().meridiem(this.hours(),this.minutes(),!1)},H:function(){return this.hours()},h:function(){return this.hours()%12||12},m:function(){return this.minutes()},s:function(){return this.seconds()},S:function(){return~~(this.milliseconds()/100)},SS:function(){return a(~~(this.milliseconds()/10),2)},SSS:function(){return a(this.milliseconds(),3)},Z:function(){var e=-this.zone(),t="+";return e<0&&(e=-e,t="-"),t+a(~~(e/60),2)+":"+a(~~e%60,2)},ZZ:function(){var e=-this.zone(),t="+";return e<0&&(e=-e,t="-"),t+a(~~(10*e/6),4)},X:function(){return this.unix()}};while(rt.length)P=rt.pop(),st[P+"o"]=n(st[P]);while(it.length)P=it.pop(),st[P+P]=t(st[P],2);st.DDDD=t(st.DDD,3),r.prototype={set:function(e){var t,n;for(n in e)t=e[n],typeof t=="function"?this[n]=t:this["_"+n]=t},_months:"January_February_March_April_May_June_July_August_September_October_November_December".split("_"),months:function(e){return this._months[e.month()]},_monthsShort:"Jan_Feb_Mar_Apr_May_Jun_Jul_Aug_Sep_Oct_Nov_Dec".split("_"),monthsShort:function(e){return this._monthsShort[e.month()]},monthsParse:function(e){var t,n,r,i;this._monthsParse||(this._monthsParse=[]);for(t=0;t<12;t++){this._monthsParse[t]||(n=M([2e3,t]),r="^"+this.months(n,"")+"|^"+this.monthsShort(n,""),this._monthsParse[t]=new RegExp(r.replace(".",""),"i"));if(this._monthsParse[t].test(e))return t}},_weekdays:"Sunday_Monday_Tuesday_Wednesday_Thursday_Friday_Saturday".split("_"),weekdays:function(e){return this._weekdays[e.day()]},_weekdaysShort:"Sun_Mon_Tue_Wed_Thu_Fri_Sat".split("_"),weekdaysShort:function(e){return this._weekdaysShort[e.day()]},_weekdaysMin:"Su_Mo_Tu_We_Th_Fr_Sa".split("_"),weekdaysMin:function(e){return this._weekdaysMin[e.day()]},_longDateFormat:{LT:"h:mm A",L:"MM/DD/YYYY",LL:"MMMM D YYYY",LLL:"MMMM D YYYY LT",LLLL:"dddd, MMMM D YYYY LT"},longDateFormat:function(e){var t=this._longDateFormat[e];return!t&&this._longDateFormat[e.toUpperCase()]&&(t=this._longDateFormat[e.toUpperCase()].replace(/MMMM|MM|DD|dddd/g,function(e){return e.slice(1)}),this._longDateFormat[e]=t),t},meridiem:function(e,t,n){return e>11?n?"pm":"PM":n?"am":"AM"},_calendar:{sameDay:"[Today at] LT",nextDay:"[Tomorrow at] LT",nextWeek:"dddd [at] LT",lastDay:"[Yesterday at] LT",lastWeek:"[last] dddd [at] LT",sameElse:"L"},calendar:function(e,t){var n=this._calendar[e];return typeof n=="function"?n.apply(t):n},_relativeTime:{future:"in %s",past:"%s ago",s:"a few seconds",m:"a minute",mm:"%d minutes",h:"an hour",hh:"%d hours",d:"a day",dd:"%d days",M:"a month",MM:"%d months",y:"a year",yy:"%d years"},relativeTime:function(e,t,n,r){var i=this._relativeTime[n];return typeof i=="function"?i(e,t,n,r):i.replace(/%d/i,e)},pastFuture:function(e,t){var n=this._relativeTime[e>0?"future":"past"];return typeof n=="function"?n(t):n.replace(/%s/i,t)},ordinal:function(e){return this._ordinal.replace("%d",e)},_ordinal:"%d",preparse:function(e){return e},postformat:function(e){return e},week:function(e){return C(e,this._week.dow,this._week.doy)},_week:{dow:0,doy:6}},M=function(e,t,n){return k({_i:e,_f:t,_l:n,_isUTC:!1})},M.utc=function(e,t,n){return k({_useUTC:!0,_isUTC:!0,_l:n,_i:e,_f:t})},M.unix=function(e){return M(e*1e3)},M.duration=function(e,t){var n=M.isDuration(e),r=typeof e=="number",i=n?e._data:r?{}:e,o;return r&&(t?i[t]=e:i.milliseconds=e),o=new s(i),n&&e.hasOwnProperty("_lang")&&(o._lang=e._lang),o},M.version=_,M.defaultFormat=G,M.lang=function(e,t){var n;if(!e)return M.fn._lang._abbr;t?h(e,t):H[e]||p(e),M.duration.fn._lang=M.fn._lang=p(e)},M.langData=function(e){return e&&e._lang&&e._lang._abbr&&(e=e._lang._abbr),p(e)},M.isMoment=function(e){return e instanceof i},M.isDuration=function(e){return e instanceof s},M.fn=i.prototype={clone:function(){return M(this)},valueOf:function(){return+this._d},unix:function(){return Math.floor(+this._d/1e3)},toString:function(){return this.format("ddd MMM DD YYYY HH:mm:ss [GMT]ZZ")},toDate:function(){return this._d},toJSON:function(){return M.utc(this).format("YYYY-MM-DD[T]HH:mm:ss.SSS[Z]")},toArray:function(){var e=this;return[e.year(),e.month(),e.date(),e.hours(),e.minutes(),e.seconds(),e.milliseconds()]},isValid:function(){return this._isValid==null&&(this._a?this._isValid=!c(this._a,(this._isUTC?M.utc(this._a):M(this._a)).toArray()):this._isValid=!isNaN(this._d.getTime())),!!this._isValid},utc:function(){return this._isUTC=!0,this},local:function(){return this._isUTC=!1,this},format:function(e){var t=m(this,e||M.defaultFormat);return this.lang().postformat(t)},add:function(e,t){var n;return typeof e=="string"?n=M.duration(+t,e):n=M.duration(e,t),f(this,n,1),this},subtract:function(e,t){var n;return typeof e=="string"?n=M.duration(+t,e):n=M.duration(e,t),f(this,n,-1),this},diff:function(e,t,n){var r=this._isUTC?M(e).utc():M(e).local(),i=(this.zone()-r.zone())*6e4,s,o;return t&&(t=t.replace(/s$/,"")),t==="year"||t==="month"?(s=(this.daysInMonth()+r.daysInMonth())*432e5,o=(this.year()-r.year())*12+(this.month()-r.month()),o+=(this-M(this).startOf("month")-(r-M(r).startOf("month")))/s,t==="year"&&(o/=12)):(s=this-r-i,o=t==="second"?s/1e3:t==="minute"?s/6e4:t==="hour"?s/36e5:t==="day"?s/864e5:t==="week"?s/6048e5:s),n?o:u(o)},from:function(e,t){return M.duration(this.diff(e)).lang(this.lang()._abbr).humanize(!t)},fromNow:function(e){return this.from(M(),e)},calendar:function(){var e=this.diff(M().startOf("day"),"days",!0),t=e<-6?"sameElse":e<-1?"lastWeek":e<0?"lastDay":e<1?"sameDay":e<2?"nextDay":e<7?"nextWeek":"sameElse";return this.format(this.lang().calendar(t,this))},isLeapYear:function(){var e=this.year();return e%4===0&&e%100!==0||e%400===0},isDST:function(){return this.zone()<M([this.year()]).zone()||this.zone()<M([this.year(),5]).zone()},day:function(e){var t=this._isUTC?this._d.getUTCDay():this._d.getDay();return e==null?t:this.add({d:e-t})},startOf:function(e){e=e.replace(/s$/,"");switch(e){case"year":this.month(0);case"month":this.date(1);case"week":case"day":this.hours(0);case"hour":this.minutes(0);case"minute":this.seconds(0);case"second":this.milliseconds(0)}return e==="week"&&this.day(0),this},endOf:function(e){return this.startOf(e).add(e.replace(/s?$/,"s"),1).subtract("ms",1)},isAfter:function(e,t){return t=typeof t!="undefined"?t:"millisecond",+this.clone().startOf(t)>+M(e).startOf(t)},isBefore:function(e,t){return t=typeof t!="undefined"?t:"millisecond",+this.clone().startOf(t)<+M(e).startOf(t)},isSame:function(e,t){return t=typeof t!="undefined"?t:"millisecond",+this.clone().startOf(t)===+M(e).startOf(t)},zone:function(){return this._isUTC?0:this._d.getTimezoneOffset()},daysInMonth:function(){return M.utc([this.year(),this.month()+1,0]).date()},dayOfYear:function(e){var t=D((M(this).startOf("day")-M(this).startOf("year"))/864e5)+1;return e==null?t:this.add("d",e-t)},isoWeek:function(e){var t=C(this,1,4);return e==null?t:this.add("d",(e-t)*7)},week:function(e){var t=this.lang().week(this);return e==null?t:this.add("d",(e-t)*7)},lang:function(t){return t===e?this._lang:(this._lang=p(t),this)}};for(P=0;P<et.length;P++)L(et[P].toLowerCase().replace(/s$/,""),et[P]);L("year","FullYear"),M.fn.days=M.fn.day,M.fn.weeks=M.fn.week,M.fn.isoWeeks=M.fn.isoWeek,M.duration.fn=s.prototype={weeks:function(){return u(this.days()/7)},valueOf:function(){return this._milliseconds+this._days*864e5+this._months*2592e6},humanize:function(e){var t=+this,n=N(t,!e,this.lang());return e&&(n=this.lang().pastFuture(t,n)),this.lang().postformat(n)},lang:M.fn.lang};for(P in tt)tt.hasOwnProperty(P)&&(O(P,tt[P]),A(P.toLowerCase()));O("Weeks",6048e5),M.lang("en",{ordinal:function(e){var t=e%10,n=~~(e%100/10)===1?"th":t===1?"st":t===2?"nd":t===3?"rd":"th";return e+n}}),B&&(module.exports=M),typeof ender=="undefined"&&(this.moment=M),typeof define=="function"&&define.amd&&define("moment",[],function(){return M})}.call(this),define("models/version",["underscore","backbone"],function(e,t){var n=t.Model.extend({defaults:{version:0},url:function(){return"/version/"+this.id+"?format=json"},parse:function(e){if(e.data){var t=e.data.version;return t.application=e.data.application,t.workspace=e.data.workspace,t}return e},canRegister:function(e){return e.hasPermission("APPLICATION_DEPLOY",this.attributes.workspace.id)&&this.attributes.state=="PREPARED"},canStart:function(e){return e.hasPermission("APPLICATION_DEPLOY",this.attributes.workspace.id)&&(this.attributes.state=="READY"||this.attributes.state=="PREPARED")},canStop:function(e){return e.hasPermission("APPLICATION_DEPLOY",this.attributes.workspace.id)&&this.attributes.state=="RUNNING"},canDeregister:function(e){return e.hasPermission("APPLICATION_DEPLOY",this.attributes.workspace.id)&&this.attributes.state=="READY"},canMakeCurrent:function(e){return e.hasPermission("APPLICATION_DEPLOY",this.attributes.workspace.id)&&this.attributes.state=="RUNNING"&&!this.attributes.is_current},canDelete:function(e){return e.hasPermission("APPLICATION_DEPLOY",this.attributes.workspace.id)&&(this.attributes.state=="PREPARED"||this.attributes.state=="NEW")&&!this.attributes.is_current}});return n}),define("collections/versions",["underscore","backbone","models/version"],function(e,t,n){var r=t.Collection.extend({model:n,parse:function(e){return e.data.versions},healthClasses:{OK:{badge:"badge-success",icon:"icon-ok"},WARNING:{badge:"badge-warning",icon:"icon-warning-sign"},ERROR:{badge:"badge-important",icon:"icon-ban-circle"}},comparator:function(e){return-e.get("version")}});return r}),define("models/application",["underscore","backbone","collections/versions"],function(e,t,n){var r=t.Model.extend({defaults:{name:"none"},initialize:function(){this.versions=new n,this.versions.url="/application/"+this.id+"?format=json"},url:function(){return"/application/"+this.id+"?format=json"},parse:function(e){if(e.data){var t=e.data.application;return t.versions=e.data.versions,t.workspace=e.data.workspace,t.instance_counts=e.data.instance_counts,t}return e}});return r}),define("collections/applications",["underscore","backbone","models/application"],function(e,t,n){var r=t.Collection.extend({model:n,healthClasses:{OK:{badge:"badge-success",icon:"icon-ok"},WARNING:{badge:"badge-warning",icon:"icon-warning-sign"},ERROR:{badge:"badge-important",icon:"icon-ban-circle"}},parse:function(e){return e.data?e.data.applications:e},comparator:function(e){return e.get("name")}});return r}),define("models/workspace",["underscore","backbone","collections/applications"],function(e,t,n){var r=t.Model.extend({defaults:{name:"",stub:"",tags:{}},initialize:function(){this.applications=new n,this.applications.url="/workspace/"+this.id+"/applications?format=json"},url:function(){return this.id?"/workspace/"+this.id+"?format=json":"/workspace/create?format=json"},parse:function(e){return e.data?e.data.workspace:e}});return r}),define("collections/workspaces",["underscore","backbone","models/workspace"],function(e,t,n){var r=t.Collection.extend({model:n,url:"/workspace/list?format=json",parse:function(e){return e.data.workspaces},comparator:function(e){return e.get("name")}});return r}),define("util",["jquery","underscore","backbone","moment"],function(e,t,n,r){var i={};return i.dateFormats={pacemaker:"YYYY-MM-DD_HH:mm:ss.______ Z",word:"MMMM Do YYYY, HH:mm:ss Z"},i.parseDate=function(e){return r(e+" +0000",i.dateFormats.pacemaker)},i.shrinkUuids=function(t){e("code.uuid-shrink",t).each(function(t,n){n=e(n),n.text(n.attr("title").substr(0,8)),n.on("click",i.shrinkClickHandler)})},i.shrinkClickHandler=function(t){var n=e(t.target);n.text().length>8?n.text(n.attr("title").substr(0,8)):n.text(n.attr("title"))},i.number_format=function(e,t,n,r){e=(e+"").replace(/[^0-9+\-Ee.]/g,"");var i=isFinite(+e)?+e:0,s=isFinite(+t)?Math.abs(t):0,o=typeof r=="undefined"?",":r,u=typeof n=="undefined"?".":n,a="",f=function(e,t){var n=Math.pow(10,t);return""+Math.round(e*n)/n};return a=(s?f(i,s):""+Math.round(i)).split("."),a[0].length>3&&(a[0]=a[0].replace(/\B(?=(?:\d{3})+(?!\d))/g,o)),(a[1]||"").length<s&&(a[1]=a[1]||"",a[1]+=(new Array(s-a[1].length+1)).join("0")),a.join(u)},i}),define("models/instance",["underscore","backbone","util"],function(e,t,n){var r=t.Model.extend({defaults:{name:"none",uuid:"none"}});return r}),define("collections/instances",["underscore","backbone","models/instance"],function(e,t,n){var r=t.Collection.extend({model:n,parse:function(e){return e.data.instances}});return r}),define("models/node",["underscore","backbone","util","collections/instances"],function(e,t,n,r){var i=t.Model.extend({initialize:function(){this.instances=new r,this.instances.url="/node/"+this.id+"/instances?format=json"},defaults:{name:"none",uuid:"none"},url:function(){return"/node/"+this.id+"?format=json"},parse:function(e){return e.data?e.data.node:e},uptimeString:function(e){e||(e=n.parseDate(this.attributes.start_time));var t=moment().diff(e,"seconds"),r="";if(t>86400){var i=Math.floor(t/86400);r+=i+(i==1?" day, ":" days, "),t%=86400}if(t>3600){var s=Math.floor(t/3600);r+=s+(s==1?" hour, ":" hours, "),t%=3600}if(t>60){var o=Math.floor(t/60);r+=o+(o==1?" minute, ":" minutes, "),t%=60}return r+=t+(t==1?" second":" seconds"),r},runtimeSummary:function(){var e=[];if(this.attributes.tags.runtimes&&Object.keys(this.attributes.tags.runtimes).length>0)for(var t in this.attributes.tags.runtimes)e.push({name:t,versions:this.attributes.tags.runtimes[t].join(", ")});return e}});return i}),define("collections/nodes",["underscore","backbone","models/node"],function(e,t,n){var r=t.Collection.extend({model:n,url:"/node/list?format=json",parse:function(e){return e.data.nodes},stateClasses:{ACTIVE:{badge:"badge-success",icon:"icon-ok"},STOPPED:{badge:"badge-warning",icon:"icon-warning-sign"},INACTIVE:{badge:"badge-warning",icon:"icon-warning-sign"},DOWN:{badge:"badge-important",icon:"icon-ban-circle"}}});return r}),define("models/user",["underscore","backbone","util"],function(e,t,n){var r=t.Model.extend({defaults:{name:"",login:"",email:"",enabled:!0,password:""},url:function(){return this.id?"/user/"+this.id+"?format=json":"/user/create?format=json"},parse:function(e){return e.data?e.data.user:e}});return r}),define("collections/users",["underscore","backbone","models/user"],function(e,t,n){var r=t.Collection.extend({model:n,url:"/user/list?format=json",parse:function(e){return e.data.users}});return r}),define("models/role",["underscore","backbone","util"],function(e,t,n){var r=t.Model.extend({defaults:{name:"",permissions:[]},url:function(){return this.id?"/role/"+this.id+"?format=json":"/role/create?format=json"},parse:function(e){return e.data?e.data.role:e}});return r}),define("collections/roles",["underscore","backbone","models/role"],function(e,t,n){var r=t.Collection.extend({model:n,url:"/role/list?format=json",parse:function(e){return e.data.roles}});return r}),define("models/roleallocation",["underscore","backbone","util"],function(e,t,n){var r=t.Model.extend({defaults:{workspace_id:null,user_id:null,role_id:null},url:function(){return this.id?"/role/allocation/unassign?format=json":"/role/allocation/assign?format=json"}});return r}),define("collections/roleallocations",["underscore","backbone","models/roleallocation"],function(e,t,n){var r=t.Collection.extend({model:n,url:"/role/allocation/list?format=json",parse:function(e){return e.data.allocations}});return r}),define("models/usermeta",["underscore","backbone","util"],function(e,t,n){var r=t.Model.extend({defaults:{expanded_workspaces:[],expanded_applications:[]},url:"/profile/userdata?format=json",parse:function(e){return e.data?e.data.userdata:e},isWorkspaceExpanded:function(t){return this.attributes.expanded_workspaces||(this.attributes.expanded_workspaces=[]),e.indexOf(this.attributes.expanded_workspaces,t)!=-1},isApplicationExpanded:function(t){return this.attributes.expanded_applications||(this.attributes.expanded_applications=[]),e.indexOf(this.attributes.expanded_applications,t)!=-1},markWorkspaceExpanded:function(e){this.isWorkspaceExpanded(e)||(this.attributes.expanded_workspaces.push(e),this.saveUpdates())},markApplicationExpanded:function(e){this.isApplicationExpanded(e)||(this.attributes.expanded_applications.push(e),this.saveUpdates())},markWorkspaceCollapsed:function(e){this.isWorkspaceExpanded(e)&&(this.unexpand_workspace||(this.unexpand_workspace=[]),this.unexpand_workspace.push(e),this.saveUpdates())},markApplicationCollapsed:function(e){this.isApplicationExpanded(e)&&(this.unexpand_application||(this.unexpand_application=[]),this.unexpand_application.push(e),this.saveUpdates())},saveUpdates:function(){var t={};t.expanded_workspaces=this.attributes.expanded_workspaces,t.expanded_applications=this.attributes.expanded_applications;var n=this;this.fetch({success:function(r,i,s){r.attributes.expanded_workspaces||(r.attributes.expanded_workspaces=[]),r.attributes.expanded_applications||(r.attributes.expanded_applications=[]),n.unexpand_workspace||(n.unexpand_workspace=[]),n.unexpand_application||(n.unexpand_application=[]);var o=e.union(t.expanded_workspaces,r.attributes.expanded_workspaces);o=e.difference(o,n.unexpand_workspace);var u=e.union(t.expanded_applications,r.attributes.expanded_applications);u=e.difference(u,n.unexpand_application),n.save({userdata:{expanded_workspaces:o,expanded_applications:u}})}})}});return r}),define("context",["jquery","underscore","backbone","socketio","moment","collections/workspaces","collections/nodes","collections/users","collections/roles","collections/roleallocations","collections/applications","collections/versions","models/usermeta"],function(e,t,n,r,i,s,o,u,a,f,l,c,h){var p={};return p.dispatcher=t.clone(n.Events),p.workspaces=new s,p.applications=new l,p.versions=new c,p.nodes=new o,p.users=new u,p.roles=new a,p.roleallocations=new f,p.navigate=function(e){p.router.navigate(e,{trigger:!0})},p.hasPermission=function(e,t,n){n||(n=permissions);var r=[];t&&r.push(""+t+"_"+e),r.push("None_"+e);for(var i=0;i<r.length;i++)if(n[r[i]])return!0;return!1},p.initialize=function(){p.workspaces.reset(workspaces),p.usermeta=new h(usermeta)},p.loadPlugin=function(t,n,r){var i="plugin/"+t+"/script";require([i],function(r){var i=function(){n&&n(r)};if(!r._called_name){var s="/plugin/"+t+"/stylesheet.css";e("head").append('<link href="'+s+'" rel="stylesheet">'),r._called_name=t,r._resource_path="/plugin/"+t+"/",r.initialize(r._called_name,r._resource_path,i)}else i()},r)},p.getScmListSimple=function(t,n,r){var i="/scm/list/repos?plugin="+t;e.ajax({url:i,dataType:"json",success:function(e){e.error&&e.error.length>0?r({},e):n(e.data.repositories)},error:r})},p}),function(){function v(e,t,n){n=a;var r="__p+='"+e.replace(h,function(e){return"\\"+l[e]}).replace(n.escape||f,function(e,t){return"'+_.escape("+d(t)+")+'"}).replace(n.interpolate||f,function(e,t){return"'+("+d(t)+")+'"}).replace(n.evaluate||f,function(e,t){return"';"+d(t)+";__p+='"})+"';";n.variable||(r="with(obj||{}){"+r+"}"),r="var __p='';var print=function(){__p+=Array.prototype.join.call(arguments, '')};"+r+"return __p;";var i=new Function(n.variable||"obj","_",r);if(t)return i(t,_);var s=function(e){return i.call(this,e,_)};return s.source="function("+(n.variable||"obj")+"){"+r+"}",s}var e=["Msxml2.XMLHTTP","Microsoft.XMLHTTP","Msxml2.XMLHTTP.4.0"],t=/^\s*<\?xml(\s)+version=[\'\"](\d)*.(\d)*[\'\"](\s)*\?>/im,n=/<body[^>]*>\s*([\s\S]+)\s*<\/body>/im,r=typeof location!="undefined"&&location.href,i=r&&location.protocol&&location.protocol.replace(/\:/,""),s=r&&location.hostname,o=r&&(location.port||undefined),u=[],a={evaluate:/\{\{%(.+?)\}\}/g,interpolate:/\{\{=(.+?)\}\}/g,escape:/\{\{[^=%](.+?)\}\}/g},f=/.^/,l={"\\":"\\","'":"'",r:"\r",n:"\n",t:"	",u2028:"\u2028",u2029:"\u2029"};for(var c in l)l[l[c]]=c;var h=/\\|'|\r|\n|\t|\u2028|\u2029/g,p=/\\(\\|'|r|n|t|u2028|u2029)/g,d=function(e){return e.replace(p,function(e,t){return l[t]})};define("tpl",[],function(){var a,f,l;return typeof window!="undefined"&&window.navigator&&window.document?f=function(e,t){var n=a.createXhr();n.open("GET",e,!0),n.onreadystatechange=function(e){n.readyState===4&&t(n.responseText)},n.send(null)}:typeof process!="undefined"&&process.versions&&!!process.versions.node?(l=require.nodeRequire("fs"),f=function(e,t){t(l.readFileSync(e,"utf8"))}):typeof Packages!="undefined"&&(f=function(e,t){var n="utf-8",r=new java.io.File(e),i=java.lang.System.getProperty("line.separator"),s=new java.io.BufferedReader(new java.io.InputStreamReader(new java.io.FileInputStream(r),n)),o,u,a="";try{o=new java.lang.StringBuffer,u=s.readLine(),u&&u.length()&&u.charAt(0)===65279&&(u=u.substring(1)),o.append(u);while((u=s.readLine())!==null)o.append(i),o.append(u);a=String(o.toString())}finally{s.close()}t(a)}),a={version:"1.0.0",strip:function(e){if(e){e=e.replace(t,"");var r=e.match(n);r&&(e=r[1])}else e="";return e},jsEscape:function(e){return e.replace(/(['\\])/g,"\\$1").replace(/[\f]/g,"\\f").replace(/[\b]/g,"\\b").replace(/[\n]/g,"\\n").replace(/[\t]/g,"\\t").replace(/[\r]/g,"\\r")},createXhr:function(){var t,n,r;if(typeof XMLHttpRequest!="undefined")return new XMLHttpRequest;for(n=0;n<3;n++){r=e[n];try{t=new ActiveXObject(r)}catch(i){}if(t){e=[r];break}}if(!t)throw new Error("createXhr(): XMLHttpRequest not available");return t},get:f,parseName:function(e){var t=!1,n=e.indexOf("."),r=e.substring(0,n),i=e.substring(n+1,e.length);return n=i.indexOf("!"),n!==-1&&(t=i.substring(n+1,i.length),t=t==="strip",i=i.substring(0,n)),{moduleName:r,ext:i,strip:t}},xdRegExp:/^((\w+)\:)?\/\/([^\/\\]+)/,useXhr:function(e,t,n,r){var i=a.xdRegExp.exec(e),s,o,u;return i?(s=i[2],o=i[3],o=o.split(":"),u=o[1],o=o[0],(!s||s===t)&&(!o||o===n)&&(!u&&!o||u===r)):!0},finishLoad:function(e,t,n,r,i){n=t?a.strip(n):n;var s=v(n),o=s.source;i.isBuild&&i.inlineText&&(u[e]=o),r(s)},load:function(e,t,n,u){var f=a.parseName(e),l=f.moduleName+"."+f.ext,c=t.toUrl(l),h=u&&u.text&&u.text.useXhr||a.useXhr;!r||h(c,i,s,o)?a.get(c,function(t){a.finishLoad(e,f.strip,t,n,u)}):t([l],function(e){a.finishLoad(f.moduleName+"."+f.ext,f.strip,e,n,u)})},write:function(e,t,n,r){if(t in u){var i=u[t];n('define("'+e+"!"+t+'", function() { return '+i+"; });\n")}},writeFile:function(e,t,n,r,i){var s=a.parseName(t),o=s.moduleName+"."+s.ext,u=n.toUrl(s.moduleName+"."+s.ext)+".js";a.load(o,n,function(t){var n=function(e){return r(u,e)};n.asModule=function(e,t){return r.asModule(e,u,t)},a.write(e,o,n,i)},i)}},a})}(),define("tpl!templates/layout/breadcrumb.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+="";for(var i=0;i<crumbs.length;i++){__p+="\n	";var isLast=crumbs.length-1==i;__p+="\n	<li>\n		",isLast||(__p+='<a href="'+_.escape(crumbs[i].href)+'">'),__p+=""+_.escape(crumbs[i].title)+"",isLast||(__p+='</a>\n		<span class="divider">&middot;</span>'),__p+="\n	</li>\n"}__p+=""}return __p}}),define("models/service",["underscore","backbone"],function(e,t){var n=t.Model.extend({defaults:{name:""},parse:function(e){if(e.data){var t=e.data.service;return t.workspace=e.data.workspace,t.application=e.data.application,t}return e}});return n}),define("tpl!templates/layout/loadingerror.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+='<div class="area-controls">\n	<span class="loading" style="display: none;">\n		<img src="/static/img/load-inline.gif" width="16" height="11" alt="Loading..." />\n	</span>\n</div>\n<div class="alert alert-error" style="display: none;">\n</div>';return __p}}),define("bases",["jquery","underscore","backbone","context","tpl!templates/layout/loadingerror.html"],function(e,t,n,r,i){var s={};return s.errorLoadingHtml=i(),s.BaseView=n.View.extend({navigateAway:function(t){t.which!=2?(t.preventDefault(),r.navigate(e(t.currentTarget).attr("href"))):t.stopPropagation()},startLoadingInline:function(){this.$(".loading").show(),this.$(".error").hide()},startLoadingFull:function(){var t=e('<div class="loading-overlay"><img src="/static/img/spinner32.gif" alt=""></div>');this.$el.append(t),t.animate({opacity:.8})},doneLoading:function(){this.$(".loading").hide(),this.$(".loading-overlay").remove()},loadingError:function(n,r,i){function f(n){try{var r=JSON.parse(n);u=e("<ul></ul>"),r.data&&r.data.input_errors?t.each(r.data.input_errors,function(t,n,r){var i=e("<li></li>");i.text(n+": "+t),u.append(i)}):r.errors&&t.each(r.errors,function(t,n,r){var i=e("<li></li>");i.text(t),u.append(i)})}catch(i){o=e("<pre></pre>"),o.text(n)}}this.doneLoading(),this.$(".alert").show();var s=e("<strong></strong>"),o="",u="",a="";r.status&&(a+=r.status+" "),n.status&&(a+=n.status+" "),r.statusText&&(a+=r.statusText+" "),n.statusText&&(a+=n.statusText+" "),a.length>0&&s.text(a),r.responseText&&f(r.responseText),n.responseText&&f(n.responseText),r.errors&&(u=e("<ul></ul>"),t.each(r.errors,function(t,n,r){var i=e("<li></li>");i.text(t),u.append(i)})),this.$(".alert").empty(),this.$(".alert").append(s),this.$(".alert").append(o),this.$(".alert").append(u)},destroy:function(){this.undelegateEvents()}}),s}),define("tpl!templates/node/list.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+='\n<h1>Nodes</h1>\n\n<div class="node-list clearfix">\n	';for(var i=0;i<nodes.length;i++){__p+="\n		";var node=nodes[i];__p+='\n		<div class="node tile">\n			<div class="title">\n				<span class="state">\n					<span class="badge '+_.escape(stateClasses[node.attributes.state].badge)+'" title="State: '+_.escape(node.attributes.state)+'"><i class="'+_.escape(stateClasses[node.attributes.state].icon)+' icon-white"></i></span>\n				</span>\n				',context.hasPermission("NODE_DETAIL_VIEW")&&(__p+='\n					<a href="/node/'+_.escape(node.attributes.id)+'">\n				'),__p+="\n\n				"+_.escape(node.attributes.name)+"\n\n				",context.hasPermission("NODE_DETAIL_VIEW")&&(__p+="\n					</a>\n				"),__p+='\n			</div>\n			<div class="body">\n				',node.attributes.pacemaker&&(__p+='\n					<i class="icon-calendar"></i> Pacemaker\n				'),__p+="\n				",node.attributes.heart&&(__p+='\n					<i class="icon-heart"></i> Heart\n				'),__p+="\n				",node.attributes.router&&(__p+='\n					<i class="icon-random"></i> Router\n				'),__p+="\n				<br />\n				<strong>Uptime:</strong> "+_.escape(node.uptimeString())+"\n				<br />\n				<strong>Last report:</strong> "+_.escape(node.attributes.updated_age.toFixed(2))+" seconds ago\n				<br />\n				<strong>Score:</strong> "+_.escape(node.attributes.score.toFixed(2))+"\n			</div>\n		</div>\n	"}__p+="\n</div>"}return __p}}),define("views/node/list",["jquery","underscore","backbone","context","bases","tpl!templates/node/list.html"],function(e,t,n,r,i,s){var o=i.BaseView.extend({initialize:function(){this.collection.on("request",this.startLoadingFull,this),this.collection.on("sync",this.render,this),this.$el.html(s({nodes:[],context:r}))},destroy:function(){this.collection.off("request",this.startLoadingFull,this),this.collection.off("sync",this.render,this),this.undelegateEvents()},render:function(){return this.doneLoading(),this.$el.html(s({nodes:this.collection.models,context:r,stateClasses:this.collection.stateClasses})),this},events:{"click a":"navigateAway"}});return o}),define("tpl!templates/workspace/sidebar.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+='\n<ul class="nav nav-list workspace-sidebar-list">\n	<li class="nav-header">Workspaces</li>\n	',context.hasPermission("WORKSPACE_EDIT")&&(__p+='\n		<li class="divider"></li>\n		<li class="create-workspace"><a href="/workspace/create" class="virtual"><i class="icon-plus"></i> Create workspace</a></li>\n	'),__p+="\n</ul>";return __p}}),define("tpl!templates/workspace/sidebar-entry.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+='<li class="workspace workspace-'+_.escape(workspace.attributes.id)+'">\n	',context.hasPermission("WORKSPACE_VIEW")&&(__p+='<a href="/workspace/'+_.escape(workspace.attributes.id)+'/applications" class="virtual">'),__p+='<span class="workspace-title">'+_.escape(workspace.attributes.name)+"</span>",context.hasPermission("WORKSPACE_VIEW")&&(__p+="</a>"),__p+='\n	<a href="#" class="expand-applications" data-workspace="'+_.escape(workspace.attributes.id)+'"><i class="icon-chevron-down"></i></a>\n	<ul class="nav nav-list applications" style="display: none;">\n		<li><img src="/static/img/load-inline.gif" width="16" height="11" alt="Loading..." /></li>\n	</ul>\n</li>';return __p}}),define("tpl!templates/workspace/application-sidebar-entry.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+='<li class="application application-'+_.escape(application.attributes.id)+'">\n	<a href="/application/'+_.escape(application.attributes.id)+'" class="virtual">\n		<span class="state">\n			<span class="badge '+_.escape(healthClasses[application.attributes.health].badge)+'" title="Health: '+_.escape(application.attributes.health)+'">\n				<i class="'+_.escape(healthClasses[application.attributes.health].icon)+' icon-white"></i>\n			</span>\n		</span>\n		'+_.escape(application.attributes.name)+'\n	</a>\n	<a href="#" class="expand-versions" data-workspace="'+_.escape(workspace_id)+'" data-application="'+_.escape(application.attributes.id)+'"><i class="icon-chevron-down"></i></a>\n	<ul class="nav nav-list versions" style="display: none;">\n		<li><img src="/static/img/load-inline.gif" width="16" height="11" alt="Loading..." /></li>\n	</ul>\n</li>';return __p}}),define("tpl!templates/workspace/version-sidebar-entry.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+='<li class="version version-'+_.escape(version.id)+'">\n	<a href="/version/'+_.escape(version.id)+'" class="virtual">\n		Version '+_.escape(version.attributes.version)+"\n		",version.attributes.is_current&&(__p+='\n			<i class="icon-star"></i>\n		'),__p+="\n		",version.attributes.state=="RUNNING"&&(__p+='\n			<i class="icon-play"></i>\n		'),__p+="\n	</a>\n</li>";return __p}}),define("views/workspace/sidebar",["jquery","underscore","backbone","context","bases","tpl!templates/workspace/sidebar.html","tpl!templates/workspace/sidebar-entry.html","tpl!templates/workspace/application-sidebar-entry.html","tpl!templates/workspace/version-sidebar-entry.html"],function(e,t,n,r,i,s,o,u,a){var f=i.BaseView.extend({initialize:function(){this.$el.html(i.errorLoadingHtml+s({workspaces:[],context:r})),this.$(".area-controls").append(e('<a href="#" class="refresh"><i class="icon-refresh"></i></a>')),this.activeItem="";var t=this;this.collection.each(function(e,n,r){t.addWorkspace(e)}),this.collection.on("request",this.startLoadingInline,this),this.collection.on("sync",this.render,this),this.collection.on("add",this.addWorkspace,this),this.collection.on("change",this.changeWorkspace,this),this.collection.on("remove",this.removeWorkspace,this),this.collection.on("error",this.loadingError,this)},setActive:function(e){this.activeItem=e,this.$("li").removeClass("active"),e!=""&&this.$("li."+e).addClass("active")},resetActive:function(){this.setActive(this.activeItem)},addWorkspace:function(e){var t='<li class="divider"></li>'+o({workspace:e,context:r}),n=this.$(".workspace-sidebar-list .workspace:last");n.length==0&&(n=this.$(".workspace-sidebar-list .nav-header")),n.after(t);var i=e.id,s=this;e.applications.on("request",this.startLoadingInline,this),e.applications.on("sync",function(e,t,n){n.workspace_id=i,e.collection&&(e=e.collection),s.renderApplications(e,t,n)}),this.delegateEvents(),r.usermeta.isWorkspaceExpanded(e.id)&&this.expandApplications(e.id)},changeWorkspace:function(e,t){var n=this.$(".workspace-"+e.id+" .workspace-title");n.text(e.attributes.name)},removeWorkspace:function(e,t,n){this.$(".workspace-"+e.id).remove()},render:function(){this.doneLoading()},events:{"click a.refresh":"refreshList","click a.virtual":"navigateAway","click a.expand-applications":"expandApplicationsClick","click a.expand-versions":"expandVersionsClick"},refreshList:function(e){this.collection.fetch(),e.preventDefault()},expandApplicationsClick:function(t){t.preventDefault();var n=e(t.currentTarget),i=n.data("workspace"),s=e(".applications",n.parent());s.is(":visible")?(s.slideUp(),r.usermeta.markWorkspaceCollapsed(i),e("i",n).attr("class","icon-chevron-down")):(s.slideDown(),this.expandApplications(i),r.usermeta.markWorkspaceExpanded(i),e("i",n).attr("class","icon-chevron-up"))},expandApplications:function(e){var t=this.collection.get(e);t.applications.fetch({workspace_id:e})},renderApplications:function(t,n,i){this.doneLoading();var s=this.$(".workspace-"+i.workspace_id+" .applications"),o=e('<ul class="nav nav-list applications"></ul>');r.hasPermission("APPLICATION_CREATE",i.workspace_id)&&o.append('<li class="create-application-'+i.workspace_id+'"><a class="virtual" href="/workspace/'+i.workspace_id+'/applications/new"><i class="icon-plus"></i> Create Application</a>'),t.each(function(n,s,a){o.append(u({application:n,context:r,workspace_id:i.workspace_id,healthClasses:t.healthClasses}));var f=this.$(".application-"+n.id+" ul.versions"),l=f.is(":visible"),c=e("li",f);l&&c.length>1&&(e(".application-"+n.id+" ul.versions",o).html(f.clone()),e(".application-"+n.id+" ul.versions",o).show())}),t.length==0&&o.append("<li>No applications</li>"),s.replaceWith(o),this.delegateEvents(),this.resetActive();var a=this;t.each(function(e,t,n){r.usermeta.isApplicationExpanded(e.id)&&a.expandVersions(i.workspace_id,e.id)})},expandVersionsClick:function(t){t.preventDefault();var n=e(t.currentTarget),i=n.data("workspace"),s=n.data("application"),o=e(".versions",n.parent());o.is(":visible")?(o.slideUp(),e("i",n).attr("class","icon-chevron-down"),r.usermeta.markApplicationCollapsed(s)):(o.slideDown(),this.expandVersions(i,s),r.usermeta.markApplicationExpanded(s),e("i",n).attr("class","icon-chevron-up"))},expandVersions:function(e,t){var n=this.collection.get(e),r=n.applications.get(t);r.versions.on("sync",this.renderVersions,this),r.versions.fetch({application_id:t,workspace_id:e})},renderVersions:function(t,n,i){var s=this.$(".application-"+i.application_id+" .versions"),o=e('<ul class="nav nav-list versions"></ul>');r.hasPermission("APPLICATION_CREATE",i.workspace_id)&&o.append('<li class="create-version-'+i.application_id+'"><a class="virtual" href="/application/'+i.application_id+'/newversion"><i class="icon-plus"></i> Create New Version</a>'),t.each(function(e,t,n){o.append(a({version:e,context:r}))}),t.length==0&&o.append("<li>No versions</li>"),o.append('<li class="divider"></li>'),s.replaceWith(o),this.delegateEvents(),this.resetActive()}});return f}),define("tpl!templates/node/sidebar.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+='<ul class="nav nav-list node-sidebar-list">\n	<li class="nav-header">Nodes</li>\n</ul>\n';return __p}}),define("tpl!templates/node/sidebar-entry.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+="",context.hasPermission("NODE_DETAIL_VIEW")&&(__p+='\n	<a href="/node/'+_.escape(node.attributes.id)+'">\n'),__p+='\n<div class="title">\n	<span class="state">\n		<span class="badge '+_.escape(stateClasses[node.attributes.state].badge)+'" title="State: '+_.escape(node.attributes.state)+'"><i class="'+_.escape(stateClasses[node.attributes.state].icon)+' icon-white"></i></span>\n	</span>\n	<span class="name">'+_.escape(node.attributes.name)+'</span>\n</div>\n<div class="details">\n	Score: '+_.escape(node.attributes.score.toFixed(2))+", Last heard: "+_.escape(node.attributes.updated_age.toFixed(2))+"s\n	",node.attributes.pacemaker&&(__p+='\n		<i class="icon-calendar" title="Pacemaker"></i>\n	'),__p+="\n	",node.attributes.heart&&(__p+='\n		<i class="icon-heart" title="Heart"></i>\n	'),__p+="\n	",node.attributes.router&&(__p+='\n		<i class="icon-random" title="Router"></i>\n	'),__p+="\n</div>\n",context.hasPermission("NODE_DETAIL_VIEW")&&(__p+="\n	</a>\n"),__p+="";return __p}}),define("views/node/sidebar-entry",["jquery","underscore","backbone","context","bases","tpl!templates/node/sidebar-entry.html"],function(e,t,n,r,i,s){var o=i.BaseView.extend({initialize:function(){this.model.on("change",this.render,this),this.render()},render:function(){this.$el.html(s({context:r,node:this.model,stateClasses:r.nodes.stateClasses})),this.model.attributes.active?this.$el.addClass("active"):this.$el.removeClass("active")},events:{"click a":"navigateAway"}});return o}),define("views/node/sidebar",["jquery","underscore","backbone","context","bases","tpl!templates/node/sidebar.html","views/node/sidebar-entry"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){this.$el.html(i.errorLoadingHtml+s({nodes:[],context:r})),this.$(".area-controls").append(e('<a href="#" class="refresh"><i class="icon-refresh"></i></a>')),this.collection.on("request",this.startLoadingInline,this),this.collection.on("sync",this.render,this),this.collection.on("add",this.addNode,this),this.collection.on("error",this.loadingError,this),this.startLoadingInline()},addNode:function(t){var n=e('<li class="node node-'+t.attributes.id+'"></li>');this.$(".nav-list").append(n);var r=new o({el:n,model:t})},render:function(){this.doneLoading()},events:{"click a.refresh":"refreshList"},refreshList:function(e){this.collection.fetch(),e.preventDefault()}});return u}),define("tpl!templates/node/detail.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+="<h1>\n	Node "+_.escape(node.attributes.name)+'\n</h1>\n\n<div class="row-fluid">\n	<div class="span6">\n		<ul class="node-details" style="clear: left;">\n			<li><strong>Roles:</strong>\n			',node.attributes.pacemaker&&(__p+='\n				<i class="icon-calendar"></i> Pacemaker\n			'),__p+="\n			",node.attributes.heart&&(__p+='\n				<i class="icon-heart"></i> Heart\n			'),__p+="\n			",node.attributes.router&&(__p+='\n				<i class="icon-random"></i> Router\n			'),__p+="\n			</li>\n			<li><strong>UUID:</strong> <code>"+_.escape(node.attributes.uuid)+"</code></li>\n			<li><strong>Route:</strong> "+_.escape(node.attributes.route)+":"+_.escape(node.attributes.apiport)+"</li>\n			<li><strong>State:</strong> "+_.escape(node.attributes.state)+'</li>\n			<li title="Started at '+_.escape(node.attributes.start_time)+'"><strong>Uptime:</strong> '+_.escape(node.uptimeString())+'</li>\n			<li title="'+_.escape(node.attributes.updated_age.toFixed(2))+'"><strong>Last report:</strong> '+_.escape(node.attributes.updated_age.toFixed(2))+" seconds ago</li>\n			<li><strong>Score:</strong> "+_.escape(node.attributes.score.toFixed(2))+'</li>\n		</ul>\n	</div>\n	<div class="span6">\n		<div class="node-chart node-disk">\n			<div class="chart"></div><div class="legend"></div>\n		</div>\n		<div class="node-chart node-memory">\n			<div class="chart"></div><div class="legend"></div>\n		</div>\n	</div>\n</div>\n\n';var runtimes=node.runtimeSummary();__p+="\n";if(runtimes.length>0){__p+='\n	<h3>Runtimes</h3>\n	<div class="runtimes-list tile-box clearfix">\n		';for(var i=0;i<runtimes.length;i++){__p+="\n			";var runtime=runtimes[i];__p+='\n			<div class="runtime tile">\n				<div class="title">\n					<strong>'+_.escape(runtime.name)+'</strong>\n				</div>\n				<div class="body">\n					Versions: '+_.escape(runtime.versions)+"\n				</div>\n			</div>\n		"}__p+="\n	</div>\n\n	<hr/>\n"}__p+='\n\n<div class="row-fluid">\n	<div class="span6">\n		<h3>Tags</h3>\n		<pre>'+_.escape(JSON.stringify(node.attributes.tags,undefined,4))+'</pre>\n	</div>\n	<div class="span6">\n		<h3>Stats</h3>\n		<pre>'+_.escape(JSON.stringify(node.attributes.stats,undefined,4))+'</pre>\n	</div>\n</div>\n\n<hr>\n\n<h2 class="node-instances">Instances</h2>\n<div class="instances-list tile-box clearfix">\n</div>'}return __p}}),define("tpl!templates/node/instances.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+="\n";for(var i=0;i<instances.length;i++){__p+="\n	";var instance=instances[i];__p+='\n	<div class="instance tile">\n		<div class="title-multilink">\n			<strong>\n				<a href="/application/'+_.escape(instance.attributes.application.id)+'">'+_.escape(instance.attributes.application.name)+'</a>,\n				<a href="/version/'+_.escape(instance.attributes.version.id)+'">version '+_.escape(instance.attributes.version.version)+'</a>\n			</strong>\n		</div>\n		<div class="body">\n			<strong>State:</strong> '+_.escape(instance.attributes.state)+'\n			<br />\n			<code class="uuid-shrink" title="'+_.escape(instance.attributes.instance_id)+'">'+_.escape(instance.attributes.instance_id.substr(0,8))+'</code>\n			<br />\n			<strong>Log:</strong> <a href="/node/'+_.escape(instance.attributes.node_id)+"/log/"+_.escape(instance.attributes.instance_id)+'">View</a>\n		</div>\n	</div>\n'}__p+=""}return __p}}),define("views/node/instances",["jquery","underscore","backbone","context","bases","util","tpl!templates/node/instances.html"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){this.collection.on("request",this.startLoadingFull,this),this.collection.on("sync",this.render,this),this.$el.html(o({instances:this.collection.models,context:r})),this.startLoadingFull()},destroy:function(){this.collection.off("request",this.startLoadingFull,this),this.collection.off("sync",this.render,this),this.undelegateEvents()},render:function(){return this.doneLoading(),this.$el.html(o({instances:this.collection.models,context:r})),s.shrinkUuids(this.$el),this}});return u}),define("views/node/detail",["jquery","underscore","backbone","context","bases","util","tpl!templates/node/detail.html","views/node/instances"],function(e,t,n,r,i,s,o,u){var a=i.BaseView.extend({initialize:function(){this.model?(this.model.on("change",this.render,this),this.render()):this.startLoadingFull()},destroy:function(){this.model&&this.model.off("change",this.render,this),this.nodeInstancesView&&this.nodeInstancesView.destroy(),this.undelegateEvents()},render:function(){return this.$el.html(o({context:r,node:this.model})),s.shrinkUuids(this.$el),this.model.attributes.stats.disk_total&&this.model.attributes.stats.disk_free&&e.plot(this.$(".node-disk .chart"),[{label:"Disk used",color:"darkviolet",data:this.model.attributes.stats.disk_total-this.model.attributes.stats.disk_free},{label:"Disk free",color:"lightblue",data:this.model.attributes.stats.disk_free}],{series:{pie:{show:!0}},legend:{container:this.$(".node-disk .legend")}}),this.model.attributes.stats.mem_total&&this.model.attributes.stats.mem_adjusted_free&&e.plot(this.$(".node-memory .chart"),[{label:"Memory used",color:"darksalmon",data:this.model.attributes.stats.mem_total-this.model.attributes.stats.mem_adjusted_free},{label:"Memory free",color:"lightblue",data:this.model.attributes.stats.mem_adjusted_free}],{series:{pie:{show:!0}},legend:{container:this.$(".node-memory .legend")}}),this.nodeInstancesView=new u({collection:this.model.instances,el:this.$(".instances-list")}),this.model.instances.fetch(),this},events:{"click a":"navigateAway"}});return a}),define("tpl!templates/administration/sidebar.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+='<ul class="nav nav-list node-sidebar-list">\n	<li class="nav-header">Administration</li>\n	';for(var i=0;i<administrations.length;i++){__p+="\n		";var administration=administrations[i];__p+="\n		<li ",administration.attributes.active&&(__p+='class="active"'),__p+='>\n			<a href="'+_.escape(administration.attributes.path)+'">\n				'+_.escape(administration.attributes.name)+"\n			</a>\n		</li>\n	"}__p+="\n</ul>\n"}return __p}}),define("views/administration/sidebar",["jquery","underscore","backbone","context","bases","tpl!templates/administration/sidebar.html"],function(e,t,n,r,i,s){var o=i.BaseView.extend({initialize:function(){this.collection.on("change",this.render,this),this.render()},render:function(){this.$el.html(s({administrations:this.collection.models,context:r}))},events:{"click a":"navigateAway"}});return o}),define("tpl!templates/administration/profile.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+='<h1>Your profile</h1>\n\n<p class="lead">Your API key is <code>'+_.escape(apikey)+"</code>.</p>";return __p}}),define("views/administration/profile",["jquery","underscore","backbone","context","bases","util","tpl!templates/administration/profile.html"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){this.$el.html(o({context:r,apikey:"loading"})),this.startLoadingFull()},render:function(e){return this.$el.html(o({context:r,apikey:e})),this}});return u}),define("tpl!templates/administration/list.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+='<div class="administration-list tile-box">\n	';for(var i=0;i<administrations.length;i++){__p+="\n		";var administration=administrations[i];__p+='\n		<div class="administration tile">\n			<div class="title">\n				<a href="'+_.escape(administration.attributes.path)+'">\n					'+_.escape(administration.attributes.name)+"\n				</a>\n			</div>\n		</div>\n	"}__p+="\n</div>\n"}return __p}}),define("views/administration/list",["jquery","underscore","backbone","context","bases","tpl!templates/administration/list.html"],function(e,t,n,r,i,s){var o=i.BaseView.extend({initialize:function(){this.render()},render:function(){this.$el.html(s({administrations:this.collection.models,context:r}))},events:{"click a":"navigateAway"}});return o}),define("tpl!templates/administration/user-list.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+='\n<h1>Users</h1>\n\n<div class="btn-group btn-group-header">\n	',context.hasPermission("USER_EDIT")&&(__p+='\n		<a class="btn" href="/user/create"><i class="icon-plus"></i> Create User</a>\n	'),__p+='\n</div>\n\n<div class="user-list clearfix">\n	';for(var i=0;i<users.length;i++){__p+="\n		";var user=users[i];__p+='\n		<div class="user tile">\n			<div class="title">\n				',context.hasPermission("USER_EDIT")&&(__p+='\n					<a href="/user/'+_.escape(user.attributes.id)+'">\n				'),__p+="\n\n				"+_.escape(user.attributes.name)+" ("+_.escape(user.attributes.login)+")\n\n				",context.hasPermission("USER_EDIT")&&(__p+="\n					</a>\n				"),__p+='\n			</div>\n			<div class="body">\n				<strong>Method:</strong> '+_.escape(user.attributes.auth_source)+"\n				<br />\n				<strong>Enabled:</strong> "+_.escape(user.attributes.enabled?"Enabled":"Disabled")+"\n			</div>\n		</div>\n	"}__p+="\n</div>"}return __p}}),define("views/administration/user-list",["jquery","underscore","backbone","context","bases","tpl!templates/administration/user-list.html"],function(e,t,n,r,i,s){var o=i.BaseView.extend({initialize:function(){this.collection.on("request",this.startLoadingFull,this),this.collection.on("sync",this.render,this),this.$el.html(s({users:[],context:r}))},destroy:function(){this.collection.off("request",this.startLoadingFull,this),this.collection.off("sync",this.render,this),this.undelegateEvents()},render:function(){return this.doneLoading(),this.$el.html(i.errorLoadingHtml+s({users:this.collection.models,context:r})),this},events:{"click a":"navigateAway"}});return o}),define("views/layout/genericloading",["jquery","underscore","backbone","context","bases"],function(e,t,n,r,i){var s=i.BaseView.extend({initialize:function(){this.render()},render:function(){this.$el.html(i.errorLoadingHtml+"<h1>Loading...</h1>"),this.startLoadingFull()},loadingError:function(e,t,n){this.$("h1").remove(),i.BaseView.prototype.loadingError.apply(this,[e,t,n])}});return s}),define("tpl!templates/administration/user-edit.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+="\n<h1>",newUser?__p+="Create user":__p+="Edit user",__p+='</h1>\n\n<form method="POST" class="form-horizontal">\n	<div class="control-group">\n		<label class="control-label" for="name">Name:</label>\n		<div class="controls">\n			<input name="name" id="name" type="text" value="'+_.escape(user.attributes.name)+'" />\n		</div>\n	</div>\n\n	<div class="control-group">\n		<label class="control-label" for="login">Login:</label>\n		<div class="controls">\n			<input name="login" id="login" type="text" value="'+_.escape(user.attributes.login)+'" />\n		</div>\n	</div>\n\n	<div class="control-group">\n		<label class="control-label" for="email">Email address:</label>\n		<div class="controls">\n			<input name="email" id="email" type="email" value="'+_.escape(user.attributes.email)+'" />\n		</div>\n	</div>\n\n	<div class="control-group">\n		<label class="control-label" for="password">Password:</label>\n		<div class="controls">\n			<input name="password" id="password" type="password" value="" />\n		</div>\n	</div>\n\n	<div class="control-group">\n		<div class="controls">\n			<label for="enabled" class="checkbox">\n				<input name="enabled" id="enabled" type="checkbox" ',user.attributes.enabled&&(__p+='checked="checked"'),__p+=' />\n				Enabled\n			</label>\n		</div>\n	</div>\n\n	<div class="control-group">\n		<div class="controls">\n			<button type="submit" class="btn">Submit</button>\n		</div>\n	</div>\n</form>';return __p}}),define("views/administration/user-edit",["jquery","underscore","backbone","context","bases","tpl!templates/administration/user-edit.html","models/user"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){this.model?this.newUser=!1:(this.newUser=!0,this.model=new o),this.render()},render:function(){return this.$el.html(i.errorLoadingHtml+s({user:this.model,context:r,newUser:this.newUser})),this},saveModel:function(e){e.preventDefault(),this.startLoadingFull(),this.model.save({name:this.$("#name").val(),login:this.$("#login").val(),email:this.$("#email").val(),enabled:this.$("#enabled").is(":checked"),password:this.$("#password").val()},{success:t.bind(this.saveOk,this),error:t.bind(this.loadingError,this)})},saveOk:function(){r.navigate("/user/list")},events:{"click button":"saveModel"}});return u}),define("tpl!templates/administration/role-list.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+='\n<h1>Roles</h1>\n\n<div class="btn-group btn-group-header">\n	',context.hasPermission("ROLE_EDIT")&&(__p+='\n		<a class="btn" href="/role/create"><i class="icon-plus"></i> Create Role</a>\n	'),__p+='\n</div>\n\n<div class="role-list clearfix">\n	';for(var i=0;i<roles.length;i++){__p+="\n		";var role=roles[i];__p+='\n		<div class="role tile">\n			<div class="title">\n				',context.hasPermission("ROLE_EDIT")&&(__p+='\n					<a href="/role/'+_.escape(role.attributes.id)+'">\n				'),__p+="\n\n				"+_.escape(role.attributes.name)+"\n\n				",context.hasPermission("ROLE_EDIT")&&(__p+="\n					</a>\n				"),__p+='\n			</div>\n			<div class="body">\n				'+_.escape(role.attributes.permissions.length)+" permissions\n			</div>\n		</div>\n	"}__p+="\n</div>"}return __p}}),define("views/administration/role-list",["jquery","underscore","backbone","context","bases","tpl!templates/administration/role-list.html"],function(e,t,n,r,i,s){var o=i.BaseView.extend({initialize:function(){this.collection.on("request",this.startLoadingFull,this),this.collection.on("sync",this.render,this),this.$el.html(s({roles:[],context:r}))},destroy:function(){this.collection.off("request",this.startLoadingFull,this),this.collection.off("sync",this.render,this),this.undelegateEvents()},render:function(){return this.doneLoading(),this.$el.html(i.errorLoadingHtml+s({roles:this.collection.models,context:r})),this},events:{"click a":"navigateAway"}});return o}),define("tpl!templates/administration/role-edit.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+="\n<h1>",newRole?__p+="Create role":__p+="Edit role",__p+='</h1>\n\n<form method="POST" class="form-horizontal">\n	<div class="control-group">\n		<label class="control-label" for="name">Name:</label>\n		<div class="controls">\n			<input name="name" id="name" type="text" value="'+_.escape(role.attributes.name)+'" />\n		</div>\n	</div>\n\n	<div class="control-group">\n		<label class="control-label">Permissions</label>\n		<div class="controls">\n			';for(var i=0;i<availablePermissions.length;i++){__p+="\n				";var permission=availablePermissions[i];__p+='\n				<label class="checkbox">\n					<input type="checkbox" name="'+_.escape(permission)+'" ',_.indexOf(role.attributes.permissions,permission)!=-1&&(__p+='checked="checked"'),__p+=' value="'+_.escape(permission)+'" />\n					'+_.escape(permission)+"\n				</label>\n			"}__p+='\n		</div>\n	</div>\n\n	<div class="control-group">\n		<div class="controls">\n			<button type="submit" class="btn">Submit</button>\n		</div>\n	</div>\n</form>'}return __p}}),define("views/administration/role-edit",["jquery","underscore","backbone","context","bases","tpl!templates/administration/role-edit.html","models/role"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){this.model?this.newRole=!1:(this.newRole=!0,this.model=new o),this.render()},render:function(){return this.$el.html(i.errorLoadingHtml+s({role:this.model,context:r,newRole:this.newRole,availablePermissions:available_permissions,_:t})),this},saveModel:function(e){e.preventDefault(),this.startLoadingFull();var n=[];for(var r=0;r<available_permissions.length;r++)this.$("input[name="+available_permissions[r]+"]").is(":checked")&&n.push(available_permissions[r]);this.model.save({name:this.$("#name").val(),permissions:n},{success:t.bind(this.saveOk,this),error:t.bind(this.loadingError,this)})},saveOk:function(){r.navigate("/role/list")},events:{"click button":"saveModel"}});return u}),define("tpl!templates/administration/role-allocation-list.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+='\n<h1>Role Allocations</h1>\n\n<div class="btn-group btn-group-header">\n	',context.hasPermission("ROLE_ASSIGN")&&(__p+='\n		<a class="btn" href="/role/allocation/assign"><i class="icon-plus"></i> Assign Role</a>\n	'),__p+='\n</div>\n\n<div class="role-allocation-list clearfix">\n	';for(var i=0;i<allocations.length;i++){__p+="\n		";var allocation=allocations[i];__p+='\n		<div class="role-allocation tile">\n			<div class="title-multilink">\n				Allocation ID '+_.escape(allocation.attributes.id)+' <button class="btn btn-mini btn-danger remove" href="#" data-allocation="'+_.escape(allocation.attributes.id)+'">Remove</button>\n			</div>\n			<div class="body">\n				<strong>Role:</strong> <a href="/role/'+_.escape(allocation.attributes.role.id)+'">'+_.escape(allocation.attributes.role.name)+'</a>\n				<br />\n				<strong>User:</strong> <a href="/user/'+_.escape(allocation.attributes.user.id)+'">'+_.escape(allocation.attributes.user.name)+" ("+_.escape(allocation.attributes.user.login)+")</a>\n				<br />\n				<strong>Workspace:</strong>\n				",allocation.attributes.workspace?__p+='\n					<a href="/workspace/'+_.escape(allocation.attributes.workspace.id)+'">'+_.escape(allocation.attributes.workspace.name)+"</a>\n				":__p+="\n					All workspaces\n				",__p+="\n				</strong>\n			</div>\n		</div>\n	"}__p+="\n</div>"}return __p}}),define("views/administration/role-allocation-list",["jquery","underscore","backbone","context","bases","tpl!templates/administration/role-allocation-list.html"],function(e,t,n,r,i,s){var o=i.BaseView.extend({initialize:function(){this.collection.on("request",this.startLoadingFull,this),this.collection.on("sync",this.render,this),this.$el.html(s({allocations:[],context:r}))},destroy:function(){this.collection.off("request",this.startLoadingFull,this),this.collection.off("sync",this.render,this),this.undelegateEvents()},render:function(){return this.doneLoading(),this.$el.html(i.errorLoadingHtml+s({allocations:this.collection.models,context:r})),this},events:{"click button.remove":"removeAllocation","click a":"navigateAway"},removeAllocation:function(n){n.preventDefault();var r=e(n.currentTarget),i=r.data("allocation"),s=this;e.ajax("/role/allocation/unassign?format=json",{type:"POST",data:JSON.stringify({data:{allocation_id:i}}),dataType:"json",success:function(){s.startLoadingFull(),s.collection.fetch()},error:t.bind(this.loadingError,this)}),this.startLoadingInline()}});return o}),define("tpl!templates/administration/role-allocation-assign.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+='\n<h1>Assign Role</h1>\n\n<form method="POST" class="form-horizontal">\n	<div class="control-group">\n		<label class="control-label" for="user_id">User:</label>\n		<div class="controls">\n			<select name="user_id" id="user_id"></select>\n		</div>\n	</div>\n\n	<div class="control-group">\n		<label class="control-label" for="role_id">Role:</label>\n		<div class="controls">\n			<select name="role_id" id="role_id"></select>\n		</div>\n	</div>\n\n	<div class="control-group">\n		<label class="control-label" for="workspace_id">Workspace:</label>\n		<div class="controls">\n			<select name="workspace_id" id="workspace_id">\n				<option value="">-- Global</option>\n			</select>\n		</div>\n	</div>\n\n	<div class="control-group">\n		<div class="controls">\n			<button type="submit" class="btn">Submit</button>\n		<div>\n	</div>\n</form>';return __p}}),define("views/administration/role-allocation-assign",["jquery","underscore","backbone","context","bases","tpl!templates/administration/role-allocation-assign.html","models/roleallocation"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){r.roles.on("sync",this.renderRoles,this),r.workspaces.on("sync",this.renderWorkspaces,this),r.users.on("sync",this.renderUsers,this),this.$el.html(i.errorLoadingHtml+s({context:r})),this.renderRoles(r.roles),this.renderWorkspaces(r.workspaces),this.renderUsers(r.users)},destroy:function(){r.roles.off("sync",this.renderRoles,this),r.workspaces.off("sync",this.renderWorkspaces,this),r.users.off("sync",this.renderUsers,this),this.undelegateEvents()},renderRoles:function(e,t,n){this.renderSelect(e,this.$("#role_id"))},renderWorkspaces:function(t,n,r){var i=this.$("#workspace_id");this.renderSelect(t,i),i.prepend(e('<option value="">-- Global</option>'))},renderUsers:function(e,t,n){this.renderSelect(e,this.$("#user_id"))},renderSelect:function(t,n){n.empty(),t.each(function(t,r,i){var s=e("<option></option>");s.attr("value",t.attributes.id),s.text(t.attributes.name),n.append(s)})},saveModel:function(e){e.preventDefault(),this.startLoadingFull();var n=new o;n.save({user_id:this.$("#user_id").val(),role_id:this.$("#role_id").val(),workspace_id:this.$("#workspace_id").val()},{success:t.bind(this.saveOk,this),error:t.bind(this.loadingError,this)})},saveOk:function(){r.navigate("/role/allocation/list")},events:{"click button":"saveModel"}});return u}),define("tpl!templates/widget/joblist.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+="\n<h1>"+_.escape(title)+"</h1>\n\n";for(var i=0;i<jobs.length;i++){__p+="\n	";var jobId=jobs[i];__p+="\n	";var jobMeta=job_detail[jobId];__p+='\n	<div class="job well well-small" data-jobid="'+_.escape(jobId)+'">\n		',jobMeta?__p+='\n			<img src="/static/img/load-inline.gif" width="16" height="11" alt="Loading..." /> Job \''+_.escape(jobMeta.title)+"' in state "+_.escape(jobMeta.state)+"\n		":__p+='\n			<img src="/static/img/load-inline.gif" width="16" height="11" alt="Loading..." /> Loading...\n		',__p+="\n	</div>\n"}__p+="\n\n",next_cursor&&(__p+='\n	<p><a href="#" class="older-jobs btn">Older jobs</a></p>\n'),__p+="\n"}return __p}}),define("tpl!templates/widget/jobblock.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+='<div class="title title-'+_.escape(job.job_id)+'">\n	<span class="icon label label-'+_.escape(statusClassMap[job.state])+'">\n		<i class="'+_.escape(statusIconMap[job.state])+' icon-white"></i>\n	</span>\n	<span class="title"><a href="#" class="viewlog" data-jobid="'+_.escape(job.job_id)+'">'+_.escape(job.title)+'</a></span>\n	<span class="area-controls">\n		',isRoot&&!isFinished&&(__p+='<a href="#" class="abort btn"><i class="icon-off"></i>Abort</a>'),__p+='\n	</span>\n</div>\n<div class="particulars particulars-'+_.escape(job.job_id)+' clearfix">\n	<div class="summary summary-'+_.escape(job.state)+'">',job.summary&&(__p+=""+_.escape(job.summary)+""),__p+='</div>\n	<div class="log">\n		<pre data-jobid="'+_.escape(job.job_id)+'">Loading...</pre>\n	</div>\n</div>\n<div class="children children-'+_.escape(job.job_id)+' clearfix">\n</div>';return __p}}),define("views/widget/logviewer",["jquery","underscore","backbone","context","bases"],function(e,t,n,r,i){var s=[["DEBUG","label",new RegExp("\\d\\sDEBUG\\s","g")],["INFO","label label-info",new RegExp("\\d\\sINFO\\s","g")],["WARNING","label label-warning",new RegExp("\\d\\sWARNING\\s","g")],["ERROR","label label-important",new RegExp("\\d\\sERROR\\s","g")],["CRITICAL","label label-important",new RegExp("\\d\\sCRITICAL\\s","g")]],o=i.BaseView.extend({initialize:function(){this.linesBinder=t.bind(this.onLines,this),this.zeroBinder=t.bind(this.onZeroSize,this),this.cantFindBinder=t.bind(this.onCantFind,this),this.jobId=this.$el.data("jobid"),r.streamSocket.on("log.lines",this.linesBinder),r.streamSocket.on("log.zerosize",this.zeroBinder),r.streamSocket.on("log.cantfind",this.cantFindBinder),this.isReading=!1},isScrolledToBottom:function(){var e=this.$el.scrollHeight,t=this.$el.scrollTop+this.$el.innerHeight();return e==t},onLines:function(e,t,n){if(this.jobId!=e)return;this.$el.hasClass("data")||this.$el.empty();if(this.isScrolledToBottom())var r=!0;this.$el.data("position",n),this.$el.addClass("data"),this.$el.append(this.formatLogLines(t)),r&&(this.$el.scrollTop=this.$el.scrollHeight)},onZeroSize:function(e){if(this.jobId!=e)return;this.$el.text("This log is currently empty."),this.$el.removeClass("data")},onCantFind:function(e,t){if(this.jobId!=e)return;this.$el.text(t),this.$el.removeClass("data")},start:function(){if(!this.isReading){var e=this.$el.data("position");e||(e=0),r.streamSocket.emit("log.subscribe",this.jobId,e),this.isReading=!0}},pause:function(){this.isReading&&(r.streamSocket.emit("log.unsubscribe",this.jobId),this.isReading=!1)},destroy:function(){this.isReading&&r.streamSocket.emit("log.unsubscribe",this.jobId),r.streamSocket.removeListener("log.lines",this.linesBinder),r.streamSocket.removeListener("log.zerosize",this.zeroBinder),r.streamSocket.removeListener("log.cantfind",this.cantFindBinder)},formatLogLines:function(e){var n=e.join("");n=t.escape(n);for(var r=0;r<s.length;r++)n=n.replace(s[r][2],' <span class="'+s[r][1]+'">'+s[r][0]+"</span> ");return n}});return o}),define("views/widget/jobblock",["jquery","underscore","backbone","context","bases","tpl!templates/widget/jobblock.html","views/widget/logviewer"],function(e,t,n,r,i,s,o){var u={FAILED:"important",ABORTED:"warning",SUCCESS:"success",WAITING:"info",RUNNING:"primary"},a={FAILED:"icon-remove",ABORTED:"icon-ban-circle",SUCCESS:"icon-ok",WAITING:"icon-time",RUNNING:"icon-loading",NEW:"icon-certificate"},f=["SUCCESS","FAILED","ABORTED"],l=i.BaseView.extend({initialize:function(){this.myJobs={},this.myJobs[this.options.job_id]=!0,this.logViewers={},this.temporarilyOrphanedChildren=[],this.gotJobTreeBinder=t.bind(this.gotJobTree,this),r.streamSocket.on("job.tree",this.gotJobTreeBinder),this.gotJobStatusBinder=t.bind(this.gotJobStatus,this),r.streamSocket.on("job.status",this.gotJobStatusBinder),this.gotNewJobBinder=t.bind(this.gotNewJob,this),r.streamSocket.on("job.new",this.gotNewJobBinder),r.streamSocket.emit("job.subscribe",this.options.job_id)},events:{"click a.viewlog":"viewLog","click a.abort":"abortJob"},render:function(){this.$el.html(i.errorLoadingHtml),this.$el.append(this.renderRecurse(this.jobTree,!0))},renderRecurse:function(n,r){var i=t.indexOf(f,n.state)!=-1,o=e(s({job:n,statusClassMap:u,statusIconMap:a,finishedStates:f,isFinished:i,isRoot:r}));this.myJobs[n.job_id]=!0;if(n.children){var l=e(o[4]);n.children.sort(function(e,t){return e.time-t.time});for(var c=0;c<n.children.length;c++){var h=e('<div class="job clearfix"></div>'),p=this.renderRecurse(n.children[c]);h.html(p),l.append(h)}}return o},gotJobTree:function(e,t){if(!this.myJobs[e])return;this.jobTree=t,this.render()},gotNewJob:function(e){this.myJobs[e.root_id]&&this.addNewChild(e)},addNewChild:function(t){var n=e(".children-"+t.parent_id,this.$el);if(n.length==0)this.temporarilyOrphanedChildren.push(t);else if(this.$(".title-"+t.job_id).length==0){var r=e('<div class="job clearfix"></div>');r.html(this.renderRecurse(t)),n.append(r)}},gotJobStatus:function(n,r){!this.myJobs[n]&&this.myJobs[r.root_id]&&this.addNewChild(r);if(!this.myJobs[n])return;if(this.temporarilyOrphanedChildren.length>0){var i=this.temporarilyOrphanedChildren;this.temporarilyOrphanedChildren=[];for(var s=0;s<i.length;s++)this.addNewChild(i[s])}var o=e(".title-"+n,this.$el);if(o.length){var l=e("span.icon",o),c=e(".label i",o);l.attr("class","icon label label-"+u[r.state]),c.attr("class","icon-white "+a[r.state])}var h=t.indexOf(f,r.state)!=-1;n==this.options.job_id&&h&&(e(".abort",this.$el).remove(),this.options.finishedCallback&&this.options.finishedCallback(this.options.job_id,r.state));if(h&&r.state!="SUCCESS"){var p=e(".particulars-"+n+" .summary",this.$el);p.text(r.summary),p.attr("class","summary summary-"+r.state)}},viewLog:function(t){t.preventDefault();var n=e(t.currentTarget),r=n.data("jobid"),i=this.$(".particulars-"+r+" .log");i.is(":visible")?(i.slideUp(),this.logViewers[r]&&this.logViewers[r].pause()):(i.slideDown(),this.logViewers[r]||(this.logViewers[r]=new o({el:e("pre",i)})),this.logViewers[r].start())},abortJob:function(n){n.preventDefault(),this.startLoadingInline();var r=this;e.ajax({url:"/job/abort/"+this.options.job_id+"?format=json",dataType:"json",success:function(e){r.doneLoading()},error:t.bind(this.loadingError,this)})},destroy:function(){r.streamSocket.removeListener("job.tree",this.gotJobTreeBinder),r.streamSocket.removeListener("job.status",this.gotJobStatusBinder),r.streamSocket.removeListener("job.new",this.gotNewJobBinder),t.each(this.myJobs,function(e,t,n){r.streamSocket.emit("job.unsubscribe",t)}),t.each(this.logViewers,function(e,t,n){e.destroy()})}});return l}),define("views/widget/genericjobslist",["jquery","underscore","backbone","context","bases","tpl!templates/widget/joblist.html","views/widget/jobblock"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){this.$el.html(i.errorLoadingHtml+"<h1>Loading...</h1>"),this.startLoadingFull(),this.myJobs={},this.views=[],this.jobs=[],this.job_detail={},this.fetchPage(null)},events:{"click .older-jobs":"olderJobs"},fetchPage:function(n){var r={};n&&(r.cursor=n),e.ajax({url:this.options.url,data:r,dataType:"json",success:t.bind(this.gotJobList,this),error:t.bind(this.loadingError,this)})},olderJobs:function(e){e.preventDefault(),this.startLoadingFull(),this.fetchPage(this.next_cursor)},gotJobList:function(e){this.doneLoading(),this.jobs=this.jobs.concat(e.data.jobs),t.extend(this.job_detail,e.data.job_detail),this.next_cursor=e.data.next_cursor,this.render()},render:function(){for(var n=0;n<this.views.length;n++)this.views[n].destroy();this.views=[],this.$el.html(s({jobs:this.jobs,job_detail:this.job_detail,next_cursor:this.next_cursor,title:this.options.title,context:r,_:t}));var i=this;this.$(".job").each(function(t,n){var r=e(n),s=r.data("jobid"),u=new o({job_id:s,el:r});i.views.push(u)}),this.jobs.length==0&&this.$el.append('<p class="lead">No jobs found.</p>')},loadingError:function(e,t,n){this.$("h1").remove(),i.BaseView.prototype.loadingError.apply(this,[e,t,n])},destroy:function(){for(var e=0;e<this.views.length;e++)this.views[e].destroy()}});return u}),define("tpl!templates/administration/router-dump.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+="<h1>Router Table dump</h1>\n\n<p>Serial number "+_.escape(table.serial)+'.</p>\n\n<div class="router-dump">\n	';for(var i=0;i<table.table.length;i++){__p+="\n		";var entry=table.table[i];__p+='\n		<div class="tile">\n			<div class="title">\n				<a target="_blank" href="http://'+_.escape(entry.hostname)+""+_.escape(table.frontend_domain_postfix)+'">\n					'+_.escape(entry.hostname)+'\n				</a>\n			</div>\n			<div class="body">\n				<a href="#" class="instances">'+_.escape(entry.instances.length)+" instance",entry.instances.length!=1&&(__p+="s"),__p+='</a>,\n				<a href="#" class="nodes">'+_.escape(entry.nodes.length)+" node",entry.nodes.length!=1&&(__p+="s"),__p+='</a>,\n				<a href="#" class="routes">'+_.escape(entry.routes.length)+" route",entry.routes.length!=1&&(__p+="s"),__p+='</a>\n\n				<div class="instances" style="display: none;">\n					<strong>Instances:</strong><br />\n					';for(var j=0;j<entry.instances.length;j++)__p+='\n						<code class="uuid-shrink" title="'+_.escape(entry.instances[j].instance_id)+'">'+_.escape(entry.instances[j].instance_id)+"</code>, "+_.escape(entry.instances[j].state)+"",j<entry.instances.length-1&&(__p+="<br />"),__p+="\n					";__p+="\n					",entry.instances.length==0&&(__p+="No instances"),__p+='\n				</div>\n				<div class="nodes" style="display: none;">\n					<strong>Nodes:</strong><br />\n					';for(var j=0;j<entry.nodes.length;j++)__p+='\n						<code class="uuid-shrink" title="'+_.escape(entry.nodes[j].uuid)+'">'+_.escape(entry.nodes[j].uuid)+"</code>, "+_.escape(entry.nodes[j].state)+"",j<entry.nodes.length-1&&(__p+="<br />"),__p+="\n					";__p+="\n					",entry.nodes.length==0&&(__p+="No nodes"),__p+='\n				</div>\n				<div class="routes" style="display: none;">\n					<strong>Routes:</strong><br />\n					';for(var j=0;j<entry.routes.length;j++)__p+="\n						"+_.escape(entry.routes[j])+"",j<entry.routes.length-1&&(__p+="<br />"),__p+="\n					";__p+="\n					",entry.routes.length==0&&(__p+="No routes"),__p+="\n				</div>\n			</div>\n		</div>\n	"}__p+="\n</div>"}return __p}}),define("views/administration/router-dump",["jquery","underscore","backbone","context","bases","util","tpl!templates/administration/router-dump.html"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){this.$el.html(i.errorLoadingHtml+"<h1>Loading...</h1>"),this.startLoadingFull()},dataReady:function(e){this.doneLoading(),this.routerTable=e.data,this.render()},render:function(){this.$el.html(o({context:r,table:this.routerTable})),s.shrinkUuids(this.$el)},events:{"click a.instances":"expandInstances","click a.nodes":"expandNodes","click a.routes":"expandRoutes"},expandInstances:function(t){t.preventDefault();var n=e(t.currentTarget),r=e("div.instances",n.parent());r.slideToggle()},expandNodes:function(t){t.preventDefault();var n=e(t.currentTarget),r=e("div.nodes",n.parent());r.slideToggle()},expandRoutes:function(t){t.preventDefault();var n=e(t.currentTarget),r=e("div.routes",n.parent());r.slideToggle()}});return u}),define("tpl!templates/administration/configuration-dump.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+="<h1>Configuration dump</h1>\n\n<pre>\n"+_.escape(JSON.stringify(configuration.configuration,null,4))+"\n</pre>";return __p}}),define("views/administration/configuration-dump",["jquery","underscore","backbone","context","bases","util","tpl!templates/administration/configuration-dump.html"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){this.$el.html(i.errorLoadingHtml+"<h1>Loading...</h1>"),this.startLoadingFull()},dataReady:function(e){this.doneLoading(),this.configuration=e.data,this.render()},render:function(){this.$el.html(o({context:r,configuration:this.configuration}))}});return u}),define("tpl!templates/administration/plugin-dump.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+='<h1>Plugins</h1>\n\n<table class="table table-striped table-bordered">\n	<thead>\n		<tr>\n			<th>Plugin</th>\n			<th>Symbolic Name</th>\n			<th>Configuration</th>\n			<th>Available Modes</th>\n		</tr>\n	</thead>\n	<tbody>\n	',_.each(plugins.plugins,function(e,t,n){__p+="\n		<tr>\n			<td><strong>"+_.escape(e.title)+"</strong></td>\n			<td>"+_.escape(e.name)+"</td>\n			<td>\n				",e.options&&(__p+="\n					<pre>"+_.escape(JSON.stringify(e.options,null,2))+"</pre>\n				"),__p+="\n			</td>\n			<td><ul>\n				",_.each(e.modes,function(e,t,n){__p+="\n					<li>"+_.escape(e)+"</li>\n				"}),__p+="\n			</ul></td>\n		</tr>\n	"}),__p+="\n	</tbody>\n</table>";return __p}}),define("views/administration/plugin-dump",["jquery","underscore","backbone","context","bases","util","tpl!templates/administration/plugin-dump.html"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){this.$el.html(i.errorLoadingHtml+"<h1>Loading...</h1>"),this.startLoadingFull()},dataReady:function(e){this.doneLoading(),this.plugins=e.data,this.render()},render:function(){this.$el.html(o({context:r,plugins:this.plugins,_:t}))},events:{"click a.configuration":"expandConfiguration"},expandConfiguration:function(t){t.preventDefault();var n=e(t.currentTarget),r=e("pre.configuration",n.parent());r.slideToggle()}});return u}),define("tpl!templates/workspace/list.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+='\n<h1>Workspaces</h1>\n\n<div class="workspace-list clearfix">\n	';for(var i=0;i<workspaces.length;i++){__p+="\n		";var workspace=workspaces[i];__p+='\n		<div class="workspace tile">\n			<div class="title">\n				<a href="/workspace/'+_.escape(workspace.attributes.id)+'/applications" class="virtual">'+_.escape(workspace.attributes.name)+"</a>\n			</div>\n		</div>\n	"}__p+="\n</div>"}return __p}}),define("views/workspace/list",["jquery","underscore","backbone","context","bases","tpl!templates/workspace/list.html"],function(e,t,n,r,i,s){var o=i.BaseView.extend({initialize:function(){this.collection.on("request",this.startLoadingFull,this),this.collection.on("sync",this.render,this),this.$el.html(s({workspaces:[],context:r}))},destroy:function(){this.collection.off("request",this.startLoadingFull,this),this.collection.off("sync",this.render,this),this.undelegateEvents()},render:function(){return this.doneLoading(),this.$el.html(s({workspaces:this.collection.models,context:r})),this},events:{"click a.virtual":"navigateAway"}});return o}),define("tpl!templates/application/list.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+="\n<h1>Workspace: "+_.escape(workspace.attributes.name)+'</h1>\n\n<div class="btn-toolbar">\n	',context.hasPermission("WORKSPACE_EDIT",workspace.id)&&(__p+='\n		<div class="btn-group btn-group-header">\n			<a class="btn virtual" href="/workspace/'+_.escape(workspace.id)+'"><i class="icon-edit"></i> Edit Workspace</a>\n		</div>\n	'),__p+="\n	",context.hasPermission("WORKSPACE_DELETE",workspace.id)&&workspace.attributes.can_delete&&(__p+='\n		<div class="btn-group btn-group-header">\n			<a class="btn btn-danger delete" href="/workspace/'+_.escape(workspace.id)+'/delete"><i class="icon-trash icon-white"></i> Delete Workspace</a>\n		</div>\n	'),__p+="\n	",context.hasPermission("APPLICATION_CREATE",workspace.id)&&(__p+='\n		<div class="btn-group btn-group-header">\n			<a class="btn virtual" href="/workspace/'+_.escape(workspace.id)+'/applications/new"><i class="icon-plus"></i> Create Application</a>\n		</div>\n	'),__p+='\n	<div class="btn-group btn-group-header">\n		<a class="btn virtual" href="/job/list/workspace/'+_.escape(workspace.id)+'">All Jobs</a>\n		<a class="btn virtual" href="/job/list/workspace/'+_.escape(workspace.id)+'?sub=cron">Cron Jobs</a>\n	</div>\n</div>\n\n<div class="deleteConfirm well well-small" style="display: none;">\n	<p>Are you sure you want to delete this workspace? This can not be undone.</p>\n	<button class="realDelete btn btn-danger">Delete</button> <button class="noDelete btn">Cancel</button>\n</div>\n\n<h2>Statistics</h2>\n\n<div class="graph-list clearfix">\n	<div class="tile graph-requests">\n		<span class="graph-title">Requests by type</span>\n		<div class="graph-tile-inner">\n			Loading...\n		</div>\n	</div>\n	<div class="tile graph-bytes">\n		<span class="graph-title">Bytes Transferred</span>\n		<div class="graph-tile-inner">\n			Loading...\n		</div>\n	</div>\n</div>\n\n<h2>Applications</h2>\n\n<div class="application-list clearfix">\n	';for(var i=0;i<applications.length;i++){__p+="\n		";var application=applications[i];__p+='\n		<div class="application tile">\n			<div class="title title-status">\n				<span class="state">\n					<span class="badge '+_.escape(healthClasses[application.attributes.health].badge)+'" title="Health: '+_.escape(application.attributes.health)+'">\n						<i class="'+_.escape(healthClasses[application.attributes.health].icon)+' icon-white"></i>\n					</span>\n				</span>\n				<a class="virtual" href="/application/'+_.escape(application.attributes.id)+'">'+_.escape(application.attributes.name)+"</a>\n			</div>\n		</div>\n	"}__p+="\n</div>\n\n",applications.length==0&&(__p+='\n	<p>There are no applications in this workspace. <a href="/workspace/'+_.escape(workspace.id)+'/applications/new" class="virtual">Create one.</a></p>\n'),__p+=""}return __p}}),define("views/widget/routergraph",["jquery","underscore","backbone","context","bases"],function(e,t,n,r,i){var s=function(e){var t=[],n=1,r=0,i=[1,2.5,10,25,100,250],s=1,o=["","kb","Mb","Gb","Tb"];while(e.max>Math.pow(1024,n)*i[r]*s)s++,s>3&&(s=1,r++),r>=i.length&&(s=1,r=0,n++);for(var u=0,a=0;a<e.max;u++)a=u*Math.pow(1024,n)*i[r],t.push([a,a/Math.pow(1024,n)+o[n]]);return t},o={requests:{socket_request:["requests"],flot_options:{series:{color:"#edc240",shadowSize:1,bars:{show:!0,fill:!0,barWidth:1e3}},yaxis:{min:0},xaxis:{mode:"time",minTickSize:[30,"second"]}}},bytes:{socket_request:["bytes"],flot_options:{series:{color:"#cb4b4b",shadowSize:1,bars:{show:!0,fill:!0,barWidth:1e3}},yaxis:{min:0,ticks:s},xaxis:{mode:"time",minTickSize:[15,"second"]}}},time:{socket_request:["time"],flot_options:{series:{color:"#afd8f8",shadowSize:1,lines:{show:!0}},yaxis:{min:0},xaxis:{mode:"time",minTickSize:[15,"second"]}}},requests_by_code:{socket_request:["1xx","2xx","3xx","4xx","5xx"],legend:{"1xx":"1xx Informational","2xx":"2xx Successful","3xx":"3xx Redirection","4xx":"4xx Client Error","5xx":"5xx Server Error"},colours:{"1xx":"#3333e0","2xx":"#66e000","3xx":"#dada00","4xx":"#ff9966","5xx":"#a90000"},flot_options:{yaxis:{min:0},xaxis:{mode:"time",minTickSize:[15,"second"]},legend:{position:"sw",sorted:!0}}}},u=i.BaseView.extend({initialize:function(){this.timeout=null,this.graphOptions=o[this.options.graphType],this.statCategory=this.options.category,this.statInputId=this.options.input_id,this.updateBinder=t.bind(this.onData,this),this.errorBinder=t.bind(this.onError,this),r.streamSocket.on("router.history.update",this.updateBinder),r.streamSocket.on("router.history.error",this.errorBinder),this.plot=e.plot(this.$el,[],this.graphOptions.flot_options),this.plot.setupGrid(),this.awaitingUpdate=!1,this.requestUpdate()},destroy:function(){r.streamSocket.removeListener("router.history.update",this.updateBinder),r.streamSocket.removeListener("router.history.error",this.errorBinder),this.timeout&&clearTimeout(this.timeout)},requestUpdate:function(){if(!this.awaitingUpdate){var e=new Date;r.streamSocket.emit("router.history.update",this.statCategory,this.statInputId,this.graphOptions.socket_request,e.getTime()/1e3-60),this.awaitingUpdate=!0}},onData:function(n,r,i,s,u){if(n==this.statCategory&&r==this.statInputId){this.awaitingUpdate=!1;var a={};e(".graph-error",this.$el.parent()).remove();for(var f in u){if(o[this.options.graphType].socket_request.indexOf(f)===-1)return!1;for(var f in u)a[f]=this.processTimeSeries(i,s,u[f])}this.showGraph(a),this.timeout=setTimeout(t.bind(this.requestUpdate,this),1e3)}},onError:function(n,r,i){if(r==this.statCategory&&i==this.statInputId){this.awaitingUpdate=!1;var s=e(".graph-error",this.$el.parent());s.length==0&&(s=e('<div class="graph-error"></div>'),container.parent().append(s)),s.text("Graph error: "+n),this.timeout=setTimeout(t.bind(this.requestUpdate,this),5e3)}},processTimeSeries:function(e,t,n){var r=Math.floor(e),i=0,s=[];while(r<Math.floor(t)+1){var o=n[i]||[null,0];!o[0]||o[0]>r?s.push([r*1e3,0]):(s.push([o[0]*1e3,o[1]]),i++),r++}return n[i]&&s.push([n[i][0]*1e3,n[i][1]]),s},formatDatasetForFlot:function(e){var t=[];for(var n in e){var r={};r.data=e[n],this.graphOptions.legend&&(r.label=this.graphOptions.legend[n]),this.graphOptions.colours&&(r.color=this.graphOptions.colours[n]),t.push(r)}return t},showGraph:function(e){this.plot.setData(this.formatDatasetForFlot(e)),this.plot.setupGrid(),this.plot.draw()}});return u}),define("views/application/list",["jquery","underscore","backbone","context","bases","tpl!templates/application/list.html","views/widget/routergraph"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){this.collection.on("request",this.startLoadingFull,this),this.collection.on("sync",this.render,this),this.$el.html(s({workspace:this.options.workspace,applications:[],context:r,healthClasses:this.collection.healthClasses})),this.views=[]},destroy:function(){t.each(this.views,function(e,t,n){e.destroy()}),this.collection.off("request",this.startLoadingFull,this),this.collection.off("sync",this.render,this),this.undelegateEvents()},render:function(){return this.doneLoading(),this.$el.html(s({workspace:this.options.workspace,applications:this.collection.models,context:r,healthClasses:this.collection.healthClasses})),this.views.push(new o({graphType:"requests_by_code",category:"workspace",input_id:this.options.workspace.id,el:this.$(".graph-requests .graph-tile-inner")})),this.views.push(new o({graphType:"bytes",category:"workspace",input_id:this.options.workspace.id,el:this.$(".graph-bytes .graph-tile-inner")})),this},events:{"click a.virtual":"navigateAway","click a.delete":"deleteConfirm","click button.realDelete":"realDelete","click button.noDelete":"deleteCancel"},deleteConfirm:function(e){e.preventDefault(),this.$(".deleteConfirm").slideDown()},deleteCancel:function(e){e.preventDefault(),this.$(".deleteConfirm").slideUp()},realDelete:function(n){n.preventDefault();var i=this;this.startLoadingFull();var s="/workspace/"+this.options.workspace.id+"/delete?format=json";e.ajax({url:s,type:"POST",dataType:"json",success:function(e){i.doneLoading(),r.navigate("/workspace/list")},error:t.bind(this.loadingError,this)})}});return u}),define("tpl!templates/widget/routerstats.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+="";if(error)__p+='\n<div class="alert alert-error">'+_.escape(error)+"</div>\n";else{__p+="\n	";for(var i=0;i<data.primary.length;i++){__p+="\n		";var stat=data.primary[i];__p+='\n		<div class="stats-row clearfix">\n			<span class="title">'+_.escape(stat.title)+':</span>\n			<span class="value">'+_.escape(stat.value)+"\n				",stat.unit&&(__p+='<span class="unit">'+_.escape(stat.unit)+"</span>"),__p+="\n				",stat.diff&&(__p+=' | <span class="diff">'+_.escape(stat.diff)+"/s</span>"),__p+="\n			</span>\n		</div>\n	"}__p+="\n"}__p+=""}return __p}}),define("views/widget/routerstats",["jquery","underscore","backbone","context","bases","util","tpl!templates/widget/routerstats.html"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){this.statCategory=this.options.category,this.statInputId=this.options.input_id,this.updateBinder=t.bind(this.onData,this),this.errorBinder=t.bind(this.onError,this),r.streamSocket.on("router.stats.update",this.updateBinder),r.streamSocket.on("router.stats.error",this.errorBinder),this.errorMessage=null,this.data=null,this.awaitingUpdate=!1,this.requestUpdate()},destroy:function(){r.streamSocket.removeListener("router.stats.update",this.updateBinder),r.streamSocket.removeListener("router.stats.error",this.errorBinder),this.timeout&&clearTimeout(this.timeout)},requestUpdate:function(){this.awaitingUpdate||(r.streamSocket.emit("router.stats.update",this.options.category,this.options.input_id),this.awaitingUpdate=!0)},onData:function(e,n,r){if(e==this.options.category&&n==this.options.input_id){this.awaitingUpdate=!1;var i=[{title:"Requests",value:s.number_format(r.requests),diff:this.calculateDifference("requests",r)},{title:"Bytes",value:s.number_format(r.bytes),diff:this.calculateDifference("bytes",r)},{title:"Average Time",value:s.number_format(r.time_average),unit:"ms",diff:""}],o=[{title:"1xx Requests",value:r["1xx"],diff:""},{title:"2xx Requests",value:r["2xx"],diff:""},{title:"3xx Requests",value:r["3xx"],diff:""},{title:"4xx Requests",value:r["4xx"],diff:""},{title:"5xx Requests",value:r["5xx"],diff:""},{title:"NGINX time Average",value:s.number_format(r.nginxtime_average),diff:""}];this.data={primary:i,secondary:o},this.lastNumbers=r,this.render(),this.timeout=setTimeout(t.bind(this.requestUpdate,this),1e3)}},onError:function(e,n,r){n==this.options.category&&r==this.options.input_id&&(this.awaitingUpdate=!1,this.errorMessage=e,this.data=null,this.render(),this.timeout=setTimeout(t.bind(this.requestUpdate,this),5e3))},render:function(){this.$el.html(o({data:this.data,error:this.errorMessage}))},calculateDifference:function(e,t){if(this.lastNumbers){var n=t[e]-this.lastNumbers[e],r=t.as_at-this.lastNumbers.as_at;return" "+s.number_format(n/r)}return""}});return u}),define("tpl!templates/application/detail.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+="\n<h1>Application "+_.escape(application.attributes.name)+'</h1>\n\n<div class="row-fluid">\n	<div class="span8">\n		<div class="btn-toolbar">\n			',context.hasPermission("APPLICATION_CREATE",application.workspace_id)&&(__p+='\n				<div class="btn-group btn-group-header">\n					<a class="btn virtual" href="/application/'+_.escape(application.id)+'/newversion"><i class="icon-plus"></i> Create new version</a>\n				</div>\n			'),__p+='\n			<div class="btn-group btn-group-header">\n				<a class="btn virtual" href="/job/list/application/'+_.escape(application.id)+'">All Jobs</a>\n				',context.hasPermission("SERVICE_VIEW",application.workspace_id)&&(__p+='\n					<a class="btn virtual" href="/application/'+_.escape(application.id)+'/services">Services</a>\n				'),__p+='\n				<a class="btn virtual" href="/job/list/application/'+_.escape(application.id)+'?sub=cron">Crons</a>\n			</div>\n			',context.hasPermission("APPLICATION_DELETE")&&application.attributes.can_delete&&(__p+='\n				<div class="btn-group btn-group-header">\n					<a class="btn btn-danger deleteApplication"><i class="icon-trash icon-white"></i> Delete Application</a>\n				</div>\n			'),__p+='\n		</div>\n\n		<p class="lead">Health: '+_.escape(application.attributes.health)+'</p>\n	</div>\n	<div class="span4">\n		<div class="well well-small router-stats">Loading router stats...</div>\n	</div>\n</div>\n\n<div class="deleteConfirm well well-small" style="display: none;">\n	<p>Are you sure you want to delete this application? All services and their data will be deleted. This can not be undone.</p>\n	<button class="realDelete btn btn-danger">Delete</button> <button class="noDelete btn">Cancel</button>\n</div>\n\n<div class="version-list clearfix">\n	';for(var i=0;i<application.attributes.versions.length;i++){__p+="\n		";var version=new VersionModel(application.attributes.versions[i]);__p+="\n		",version.attributes.workspace={id:application.attributes.workspace_id},__p+='\n		<div class="version tile">\n			<div class="title title-status">\n				',version.attributes.is_current&&(__p+="<strong>"),__p+='\n				<a href="/version/'+_.escape(version.id)+'" class="virtual">Version '+_.escape(version.attributes.version)+" ",version.attributes.state=="RUNNING"&&(__p+='<i class="icon-play"></i>'),__p+="",version.attributes.is_current&&(__p+='<i class="icon-star"></i>'),__p+="</a>\n				",version.attributes.is_current&&(__p+="</strong>"),__p+='\n			</div>\n			<div class="body">\n				<strong>State:</strong>\n\n					'+_.escape(version.attributes.state)+",\n					",version.attributes.is_current?__p+="\n						Current Version\n					":__p+="\n						Not current\n					",__p+="\n				<br />\n				<strong>Health:</strong> "+_.escape(version.attributes.health.overall)+"\n				<br />\n				";var actions=[];__p+="\n				",version.canRegister(context)&&(__p+="\n					",actions.push('<a class="btn btn-success btn-mini register" data-version="'+_.escape(version.id)+'">Register</a>'),__p+="\n				"),__p+="\n				",version.canStart(context)&&(__p+="\n					",actions.push('<a class="btn btn-success btn-mini start" data-version="'+_.escape(version.id)+'">Start</a>'),__p+="\n				"),__p+="\n				",version.canStop(context)&&(__p+="\n					",actions.push('<a class="btn btn-danger btn-mini stop" data-version="'+_.escape(version.id)+'">Stop</a>'),__p+="\n				"),__p+="\n				",version.canDeregister(context)&&(__p+="\n					",actions.push('<a class="btn btn-warning btn-mini deregister" data-version="'+_.escape(version.id)+'">Deregister</a>'),__p+="\n				"),__p+="\n				",version.canMakeCurrent(context)&&(__p+="\n					",actions.push('<a class="btn btn-info btn-mini makecurrent" data-version="'+_.escape(version.id)+'">Make Current</a>'),__p+="\n				"),__p+="\n				",version.canDelete(context)&&(__p+="\n					",actions.push('<a class="btn btn-danger btn-mini deleteVersion" data-version="'+_.escape(version.id)+'">Delete</a>'),__p+="\n				"),__p+='\n\n				<div class="btn-group">\n					'+actions.join(" &middot; ")+"\n				</div>\n			</div>\n		</div>\n	"}__p+="\n</div>"}return __p}}),define("views/application/detail",["jquery","underscore","backbone","context","bases","views/widget/routerstats","tpl!templates/application/detail.html","models/version"],function(e,t,n,r,i,s,o,u){var a=i.BaseView.extend({initialize:function(){this.model.on("request",this.startLoadingInline,this),this.model.on("change",this.render,this),this.model.versions.on("request",this.startLoadingInline,this),this.model.versions.on("change",this.render,this),this.model.versions.on("sync",this.render,this),this.$el.html(o({application:this.model,context:r,VersionModel:u})),this.routerStats=null},destroy:function(){this.model.off("request",this.startLoadingFull,this),this.model.off("change",this.render,this),this.model.versions.off("request",this.startLoadingInline,this),this.model.versions.off("change",this.render,this),this.model.versions.off("sync",this.render,this),this.routerStats&&this.routerStats.destroy(),this.undelegateEvents()},render:function(){return this.doneLoading(),this.$el.html(o({application:this.model,context:r,VersionModel:u})),this.routerStats&&this.routerStats.destroy(),this.routerStats=new s({el:this.$(".router-stats"),category:"application",input_id:this.model.id}),this},events:{"click a.virtual":"navigateAway","click a.deleteApplication":"deleteConfirm","click button.realDelete":"realDelete","click button.noDelete":"deleteCancel","click a.start":"startVersion","click a.register":"registerVersion","click a.stop":"stopVersion","click a.deregister":"deregisterVersion","click a.makecurrent":"makeCurrentVersion","click a.deleteVersion":"deleteVersion"},deleteConfirm:function(e){e.preventDefault(),this.$(".deleteConfirm").slideDown()},deleteCancel:function(e){e.preventDefault(),this.$(".deleteConfirm").slideUp()},realDelete:function(n){n.preventDefault();var i=this;this.startLoadingFull();var s="/application/"+this.model.id+"/delete?format=json";e.ajax({url:s,type:"POST",dataType:"json",success:function(e){i.doneLoading(),r.navigate("/application/"+i.model.id+"/delete/"+e.data.job_id)},error:t.bind(this.loadingError,this)})},makeJobRequest:function(n,i){var s=this;this.startLoadingFull();var o="/version/"+i+"/"+n+"?format=json";e.ajax({url:o,type:"POST",dataType:"json",success:function(e){s.doneLoading(),r.navigate("/version/"+i+"/"+n+"/"+e.data.job_id)},error:t.bind(this.loadingError,this)})},startVersion:function(t){t.preventDefault(),this.makeJobRequest("start",e(t.currentTarget).data("version"))},registerVersion:function(t){t.preventDefault(),this.makeJobRequest("register",e(t.currentTarget).data("version"))},stopVersion:function(t){t.preventDefault(),this.makeJobRequest("stop",e(t.currentTarget).data("version"))},deregisterVersion:function(t){t.preventDefault(),this.makeJobRequest("deregister",e(t.currentTarget).data("version"))},makeCurrentVersion:function(t){t.preventDefault(),this.makeJobRequest("setcurrent",e(t.currentTarget).data("version"))},deleteVersion:function(n){n.preventDefault(),this.startLoadingFull();var i=this;e.ajax({url:"/version/"+e(n.currentTarget).data("version")+"/delete?format=json",type:"POST",dataType:"json",success:function(e){i.doneLoading();var t=r.workspaces.get(i.model.attributes.workspace.id);t.fetch();var n=t.applications.get(i.model.attributes.application_id);n.fetch(),n.versions.fetch(),r.navigate("/application/"+i.model.attributes.application_id)},error:t.bind(this.loadingError,this)})}});return a}),define("tpl!templates/version/detail.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+="\n<h1>Version "+_.escape(version.attributes.version)+" of "+_.escape(version.attributes.application.name)+'</h1>\n\n<div class="row-fluid">\n	<div class="span8">\n		<div class="btn-toolbar">\n			<div class="btn-group btn-group-header">\n				<a class="btn virtual" href="/job/list/version/'+_.escape(version.id)+'">All Jobs</a>\n				<a class="btn virtual" href="/job/list/version/'+_.escape(version.id)+'?sub=cron">Crons</a>\n			</div>\n			',context.hasPermission("APPLICATION_VIEW_MANIFEST",version.attributes.workspace.id)&&(__p+='\n				<div class="btn-group btn-group-header">\n					<a class="btn virtual" href="/version/'+_.escape(version.id)+'/manifest">View Manifest</a>\n				</div>\n			'),__p+='\n			<div class="btn-group btn-group-header">\n				',version.canRegister(context)&&(__p+='\n					<a class="btn btn-success register">Register</a>\n				'),__p+="\n				",version.canStart(context)&&(__p+='\n					<a class="btn btn-success start">Start</a>\n				'),__p+="\n				",version.canStop(context)&&(__p+='\n					<a class="btn btn-danger stop">Stop</a>\n				'),__p+="\n				",version.canDeregister(context)&&(__p+='\n					<a class="btn btn-warning deregister">Deregister</a>\n				'),__p+="\n				",version.canMakeCurrent(context)&&(__p+='\n					<a class="btn btn-info makecurrent">Make Current</a>\n				'),__p+="\n				",version.canDelete(context)&&(__p+='\n					<a class="btn btn-danger delete">Delete</a>\n				'),__p+="\n			</div>\n		</div>\n\n		<ul>\n			<li>\n				",version.attributes.is_current?__p+='\n					<i class="icon-star"></i> Current\n				':__p+='\n					<i class="icon-minus"></i> Not current\n				',__p+="\n			</li>\n			<li><b>State:</b> "+_.escape(version.attributes.state)+"</li>\n			<li>\n				<b>Health:</b> "+_.escape(version.attributes.health.overall)+"\n				",version.attributes.health.overall!="OK"&&(__p+="\n					<ul>\n						",_.each(version.attributes.health.types,function(e,t,n){__p+="\n							<li><strong>"+_.escape(t)+"</strong>: "+_.escape(e.message)+"</li>\n						"}),__p+="\n					</ul>\n				"),__p+="\n			</li>\n			<li><b>SCM:</b> "+_.escape(version.attributes.scm_name)+"</li>\n			",version.attributes.scm_parameters.formatted_location?__p+="\n				<li><b>Original source location:</b> "+_.escape(version.attributes.scm_parameters.formatted_location)+"</li>\n			":(__p+="\n				",version.attributes.scm_parameters.location&&(__p+="\n					<li><b>Original source location:</b> "+_.escape(version.attributes.scm_parameters.location)+"</li>\n				"),__p+="\n			"),__p+="\n			",version.attributes.source_package_type&&version.attributes.source_package_type=="devdirectory"&&(__p+="\n				<li><b>Package type:</b> "+_.escape(version.attributes.source_package_type)+"</li>\n			"),__p+='\n		</ul>\n\n	</div>\n	<div class="span4">\n		<div class="well well-small router-stats">Loading router stats...</div>\n	</div>\n</div>\n';return __p}}),define("tpl!templates/version/instances.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+="\n",_.each(instanceTypes,function(e,t,n){__p+="\n	<h2>Instance type: "+_.escape(t)+'</h2>\n\n	<div class="row-fluid">\n		<div class="span6">\n			<ul>\n				<li><strong>Exclusive:</strong> '+_.escape(e.instance_type.exclusive)+"</li>\n				<li><strong>Standalone:</strong> "+_.escape(e.instance_type.standalone)+"</li>\n				<li>\n					<strong>Runtime:</strong>\n					"+_.escape(e.instance_type.runtime_name)+",\n					"+_.escape(e.instance_type.runtime_version)+"\n				</li>\n				<li>\n					",context.hasPermission("APPLICATION_DEPLOY",version.attributes.workspace.id)?__p+='\n						<form method="POST" class="form-inline">\n							<input type="hidden" name="instance_type_id" value="'+_.escape(e.instance_type.id)+'" />\n							<label for="quantity"><strong>Quantity:</strong></label>\n							<input type="text" name="quantity" id="quantity" size="3" class="quantity input-small" value="'+_.escape(e.instance_type.quantity)+'" style="width: 20px;" />\n							<button class="btn changeQuantity">Change</button>\n						</form>\n					':__p+='\n						<strong>Quantity:</strong> <span class="quantity">'+_.escape(e.instance_type.quantity)+"</span></li>\n					",__p+='\n			</ul>\n		</div>\n		<div class="span6">\n			';if(!e.instance_type.standalone){__p+='\n			<ul>\n				<li>\n					<a href="http://'+_.escape(e.instance_type.version_url)+""+_.escape(frontend_domain_postfix)+'" target="_blank">\n						'+_.escape(e.instance_type.version_url)+"\n					</a>\n				</li>\n				";for(var r=0;r<e.instance_type.hostnames.length;r++){__p+="\n					";var i=e.instance_type.hostnames[r];__p+="\n					<li>\n						",is_current&&(__p+='\n							<a href="http://'+_.escape(i)+""+_.escape(frontend_domain_postfix)+'" target="_blank">\n						'),__p+="\n							"+_.escape(i)+"\n						",is_current&&(__p+="\n							</a>\n						"),__p+="\n					</li>\n				"}__p+="\n			</ul>\n			"}__p+='\n		</div>\n	</div>\n\n	<div class="instances tile-box clearfix">\n		';for(var r=0;r<e.instances.length;r++){__p+="\n			";var s=e.instances[r];__p+='\n			<div class="instance tile">\n				<div class="title">\n					<code class="uuid-shrink" title="'+_.escape(s.instance_id)+'">'+_.escape(s.instance_id.substr(0,8))+'</code>\n				</div>\n				<div class="body">\n					<strong>State:</strong> '+_.escape(s.state)+"\n					<br />\n					<strong>Node:</strong>\n					",context.hasPermission("NODE_DETAIL_VIEW")&&(__p+='\n						<a href="/node/'+_.escape(s.node_id)+'">\n					'),__p+="\n						"+_.escape(s.node_name)+"\n					",context.hasPermission("NODE_DETAIL_VIEW")&&(__p+="\n						</a>\n					"),__p+='\n					<br />\n					<strong>Log:</strong> <a class="virtual" href="/version/'+_.escape(version.id)+"/log/"+_.escape(s.instance_id)+'">View</a>\n				</div>\n			</div>\n		'}__p+="\n	</div>\n\n	",e.instances.length==0&&(__p+="\n		<p>There are no instances of this type.</p>\n	"),__p+="\n"}),__p+="";return __p}}),define("views/version/detail",["jquery","underscore","backbone","context","bases","util","views/widget/routerstats","tpl!templates/version/detail.html","tpl!templates/version/instances.html"],function(e,t,n,r,i,s,o,u,a){var f=i.BaseView.extend({initialize:function(){this.model.on("request",this.startLoadingInline,this),this.model.on("change",this.render,this),this.$el.html(i.errorLoadingHtml+'<div class="top"></div><div class="bottom"></div>'),this.$(".top").html(u({version:this.model,context:r})),this.routerStats=null,this.routerStats=new o({el:this.$(".router-stats"),category:"version",input_id:this.model.id}),this.loadInstanceData()},destroy:function(){this.routerStats&&this.routerStats.destroy(),this.model.off("request",this.startLoadingFull,this),this.model.off("change",this.render,this),this.undelegateEvents()},loadInstanceData:function(){this.startLoadingInline(),e.ajax({url:"/version/"+this.model.id+"/instances?format=json",dataType:"json",success:t.bind(this.gotInstanceData,this),error:t.bind(this.loadingError,this)})},gotInstanceData:function(e){this.instances=e.data.instances,this.frontend_domain_postfix=e.data.frontend_domain_postfix,this.renderInstances()},render:function(){return this.doneLoading(),this.$(".top").html(u({version:this.model,context:r,_:t})),this.routerStats&&this.routerStats.destroy(),this.routerStats=new o({el:this.$(".router-stats"),category:"version",input_id:this.model.id}),this},renderInstances:function(){this.doneLoading(),this.$(".bottom").html(a({version:this.model,instanceTypes:this.instances,context:r,frontend_domain_postfix:this.frontend_domain_postfix,is_current:this.model.attributes.is_current,_:t})),s.shrinkUuids(this.$el),this.delegateEvents()},events:{"click a.virtual":"navigateAway","click a.start":"startVersion","click a.register":"registerVersion","click a.stop":"stopVersion","click a.deregister":"deregisterVersion","click a.makecurrent":"makeCurrentVersion","click a.delete":"deleteVersion","click button.changeQuantity":"changeQuantity"},makeJobRequest:function(n,i){var s=this,o="/version/"+this.model.id+"/"+n+"?format=json";e.ajax({url:o,type:"POST",dataType:"json",success:function(e){s.doneLoading(),r.navigate("/version/"+s.model.id+"/"+n+"/"+e.data.job_id)},error:t.bind(this.loadingError,this)})},startVersion:function(e){e.preventDefault(),this.startLoadingFull(),this.makeJobRequest("start")},registerVersion:function(e){e.preventDefault(),this.startLoadingFull(),this.makeJobRequest("register")},stopVersion:function(e){e.preventDefault(),this.startLoadingFull(),this.makeJobRequest("stop")},deregisterVersion:function(e){e.preventDefault(),this.startLoadingFull(),this.makeJobRequest("deregister")},makeCurrentVersion:function(e){e.preventDefault(),this.startLoadingFull(),this.makeJobRequest("setcurrent")},deleteVersion:function(n){n.preventDefault(),this.startLoadingFull();var i=this;e.ajax({url:"/version/"+this.model.id+"/delete?format=json",type:"POST",dataType:"json",success:function(e){i.doneLoading();var t=r.workspaces.get(i.model.attributes.workspace.id);t.fetch();var n=t.applications.get(i.model.attributes.application_id);n.fetch(),n.versions.fetch(),r.navigate("/application/"+i.model.attributes.application_id)},error:t.bind(this.loadingError,this)})},changeQuantity:function(n){n.preventDefault(),this.startLoadingFull();var i=e(n.currentTarget).parent(),s=e("input[name=instance_type_id]",i).val(),o=parseInt(e("input[name=quantity]",i).val(),10),u=this;e.ajax({url:"/instancetype/"+s+"/quantity?format=json",type:"POST",dataType:"json",data:JSON.stringify({data:{quantity:o}}),success:function(e){u.doneLoading(),r.navigate("/version/"+u.model.id+"/quantity/"+e.data.job_id)},error:t.bind(this.loadingError,this)})}});return f}),define("tpl!templates/widget/jobsingle.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+="\n<h1>"+_.escape(title)+'</h1>\n\n<div class="job job-'+_.escape(job_id)+' well well-small" data-jobid="'+_.escape(job_id)+'">\n	<img src="/static/img/load-inline.gif" width="16" height="11" alt="Loading..." /> Loading...\n</div>';return __p}}),define("views/widget/genericjob",["jquery","underscore","backbone","context","bases","tpl!templates/widget/jobsingle.html","views/widget/jobblock"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){this.render(),this.block=null},render:function(){this.$el.html(s({title:this.options.title,job_id:this.options.job_id}));var e=this.$(".job-"+this.options.job_id);this.block=new o({job_id:this.options.job_id,el:e,finishedCallback:this.options.finishedCallback})},destroy:function(){this.block&&this.block.destroy()}});return u}),define("tpl!templates/application/new.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+="\n",newApplication?__p+="\n	<h1>New Application</h1>\n":__p+="\n	<h1>New Version</h1>\n",__p+='\n\n<ul class="nav nav-tabs" id="scm-exports">\n	',_.each(plugins,function(e,t,n){__p+='\n		<li>\n			<a href="#export-'+_.escape(t)+'" class="export-'+_.escape(t)+'">'+_.escape(e.title)+"</a>\n		</li>\n	"}),__p+='\n</ul>\n\n<div class="tab-content">\n	',_.each(plugins,function(e,t,n){__p+='\n		<div class="tab-pane ',t==0&&(__p+="active"),__p+='" id="export-'+_.escape(t)+'">\n			<form method="post" class="form-horizontal">\n				<input type="hidden" name="scm" value="'+_.escape(e.plugin)+'" />\n\n				<div class="scm-listers clearfix">\n				</div>\n\n				<div class="scm-inner clearfix">\n				</div>\n\n				<div class="control-group">\n					<label class="control-label" for="manifest_path">Manifest Path:</label>\n					<div class="controls">\n						<input name="manifest_path" id="manifest_path" type="text" value="manifest.yml" required="required" />\n					</div>\n				</div>\n\n				<div class="control-group">\n					<div class="controls">\n						<a class="btn btn-success submit" href="#">\n							Create <i class="icon-chevron-right icon-white"></i>\n						</a>\n					</div>\n				</div>\n			</form>\n		</div>\n	'}),__p+="\n</div>";return __p}}),define("views/application/new",["jquery","underscore","backbone","context","bases","tpl!templates/application/new.html"],function(e,t,n,r,i,s){var o=i.BaseView.extend({initialize:function(){this.$el.html(i.errorLoadingHtml+"<h1>Loading...</h1>"),this.startLoadingFull(),this.scmPlugins={},this.scmInstances={},e.ajax({url:this.options.url,dataType:"json",success:t.bind(this.gotNewMetadata,this),error:t.bind(this.loadingError,this)})},gotNewMetadata:function(e){this.metadata=e.data,this.scms=e.data.scms,this.scmsToLoad=e.data.scms.length;var n=this;t.each(this.scms,function(e,i,s){r.loadPlugin(e.plugin,function(t){n.gotScmPlugin(e.plugin,t)},t.bind(n.pluginError,n))})},pluginError:function(e){this.doneLoading(),this.$("h1").remove(),this.$(".alert").show(),this.$(".alert").html("Error loading plugin "+e.requireModules[0]+": "+e.message+". This is probably a programming error with the plugin.")},gotScmPlugin:function(e,t){this.scmPlugins[e]=t,this.scmsToLoad-=1,this.scmsToLoad<=0&&this.render()},destroy:function(){t.each(this.scmInstances,function(e,t,n){e.destroy()}),this.undelegateEvents()},render:function(){this.doneLoading(),this.$el.html(i.errorLoadingHtml+s({plugins:this.scms,context:r,newApplication:this.options.newApplication,_:t})),this.metadata.last_scm_name||this.$(".nav-tabs a:first").tab("show");var n=this;return t.each(this.scms,function(i,s,o){var u=n.$("#export-"+s+" .scm-inner"),a=new n.scmPlugins[i.plugin].SCM_EXPORT({el:u,workspace:n.options.workspace});n.scmInstances[i.plugin]=a,n.metadata.last_scm_name&&n.metadata.last_scm_name==i.plugin&&(n.$(".nav-tabs a.export-"+s).tab("show"),a.loadParameters(n.metadata.last_scm_params),n.metadata.last_scm_params&&n.metadata.last_scm_params.manifest_path&&e("input[name=manifest_path]",u.parent()).val(n.metadata.last_scm_params.manifest_path)),t.each(i.listers,function(i,s,o){r.loadPlugin(i.plugin,function(r){var s=e('<div class="tile scm-list"><img src="/static/img/load-inline.gif" width="16" height="11" alt="Loading..." /></div>'),o=e(".scm-listers",u.parent());o.append(s),n.scmInstances[i.plugin]=new r.SCM_LIST({el:s,title:i.title,plugin:i.plugin,selectedCallback:function(n){var r=e("select, input",u);t.each(n,function(n,i,s){t.each(r,function(t,r,s){t=e(t),t.attr("name")==i&&t.val(n)})})}})},t.bind(n.pluginError,n))})}),this},events:{"click .nav-tabs a":"tabSelect","click a.submit":"submit"},tabSelect:function(t){t.preventDefault(),e(t.currentTarget).tab("show")},submit:function(n){n.preventDefault(),this.$(".alert").hide();var r=e(n.currentTarget),i=r.parent().parent().parent(),s=e("input[name=scm]",i).val(),o=this.scmInstances[s].serialize();typeof o=="string"?(this.$(".alert").html(o),this.$(".alert").show()):(o.scm=s,o.manifest_path=e("input[name=manifest_path]",i).val(),this.startLoadingFull(),e.ajax({url:this.options.url,dataType:"json",method:"POST",data:JSON.stringify({data:o}),success:t.bind(this.startNewVersionSuccess,this),error:t.bind(this.loadingError,this)}))},startNewVersionSuccess:function(e){this.doneLoading(),this.options.newApplication?r.navigate("/workspace/"+this.options.workspace.id+"/applications/new/"+e.data.job_id):r.navigate("/application/"+this.options.application.id+"/newversion/"+e.data.job_id)}});return o}),define("tpl!templates/widget/fileupload.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+='<div class="drop">\n	<a class="btn" href="#"><i class="icon-upload"></i> Upload File</a>\n</div>\n<div class="status" style="display: none;"></div>\n<progress value="0" max="100"></progress>';return __p}}),define("resumable",[],function(){var e=function(t){function i(e,t){var n=this;n._prevProgress=0,n.resumableObj=e,n.file=t,n.fileName=t.fileName||t.name,n.size=t.size,n.relativePath=t.webkitRelativePath||n.fileName,n.uniqueIdentifier=$h.generateUniqueIdentifier(t);var r=!1,i=function(e,t){switch(e){case"progress":n.resumableObj.fire("fileProgress",n);break;case"error":n.abort(),r=!0,n.chunks=[],n.resumableObj.fire("fileError",n,t);break;case"success":if(r)return;n.resumableObj.fire("fileProgress",n),n.progress()==1&&n.resumableObj.fire("fileSuccess",n,t);break;case"retry":n.resumableObj.fire("fileRetry",n)}};return n.chunks=[],n.abort=function(){$h.each(n.chunks,function(e){e.status()=="uploading"&&e.abort()}),n.resumableObj.fire("fileProgress",n)},n.cancel=function(){var e=n.chunks;n.chunks=[],$h.each(e,function(e){e.status()=="uploading"&&(e.abort(),n.resumableObj.uploadNextChunk())}),n.resumableObj.removeFile(n),n.resumableObj.fire("fileProgress",n)},n.retry=function(){n.bootstrap(),n.resumableObj.upload()},n.bootstrap=function(){n.abort(),r=!1,n.chunks=[],n._prevProgress=0;for(var e=0;e<Math.max(Math.floor(n.file.size/n.resumableObj.opts.chunkSize),1);e++)n.chunks.push(new s(n.resumableObj,n,e,i))},n.progress=function(){if(r)return 1;var e=0,t=!1;return $h.each(n.chunks,function(n){n.status()=="error"&&(t=!0),e+=n.progress(!0)}),e=t?1:e>.999?1:e,e=Math.max(n._prevProgress,e),n._prevProgress=e,e},n.bootstrap(),this}function s(e,t,n,r){var i=this;return i.resumableObj=e,i.fileObj=t,i.fileObjSize=t.size,i.offset=n,i.callback=r,i.lastProgressCallback=new Date,i.tested=!1,i.loaded=0,i.startByte=i.offset*i.resumableObj.opts.chunkSize,i.endByte=(i.offset+1)*i.resumableObj.opts.chunkSize,i.fileObjSize-i.endByte<i.resumableObj.opts.chunkSize&&(i.endByte=i.fileObjSize),i.xhr=null,i.test=function(){i.xhr=new XMLHttpRequest;var e=function(e){i.tested=!0;var t=i.status();t=="success"?(i.callback(t,i.message()),i.resumableObj.uploadNextChunk()):i.send()};i.xhr.addEventListener("load",e,!1),i.xhr.addEventListener("error",e,!1);var t="",n=[],r=typeof i.resumableObj.opts.query=="function"?i.resumableObj.opts.query(i.fileObj):i.resumableObj.opts.query;$h.each(r,function(e,t){n.push([encodeURIComponent(e),encodeURIComponent(t)].join("="))}),n.push(["resumableChunkNumber",encodeURIComponent(i.offset+1)].join("=")),n.push(["resumableChunkSize",encodeURIComponent(i.resumableObj.opts.chunkSize)].join("=")),n.push(["resumableTotalSize",encodeURIComponent(i.fileObjSize)].join("=")),n.push(["resumableIdentifier",encodeURIComponent(i.fileObj.uniqueIdentifier)].join("=")),n.push(["resumableFilename",encodeURIComponent(i.fileObj.fileName)].join("=")),n.push(["resumableRelativePath",encodeURIComponent(i.fileObj.relativePath)].join("=")),i.xhr.open("GET",i.resumableObj.opts.target+"?"+n.join("&")),$h.each(i.resumableObj.opts.headers,function(e,t){i.xhr.setRequestHeader(e,t)}),i.xhr.send(null)},i.send=function(){if(i.resumableObj.opts.testChunks&&!i.tested){i.test();return}i.xhr=new XMLHttpRequest,i.xhr.upload.addEventListener("progress",function(e){new Date-i.lastProgressCallback>i.resumableObj.opts.throttleProgressCallbacks*1e3&&(i.callback("progress"),i.lastProgressCallback=new Date),i.loaded=e.loaded||0},!1),i.loaded=0,i.callback("progress");var e=function(e){var t=i.status();t=="success"||t=="error"?(i.callback(t,i.message()),i.resumableObj.uploadNextChunk()):(i.callback("retry",i.message()),i.abort(),i.send())};i.xhr.addEventListener("load",e,!1),i.xhr.addEventListener("error",e,!1);var t=new FormData,n=typeof i.resumableObj.opts.query=="function"?i.resumableObj.opts.query(i.fileObj):i.resumableObj.opts.query;$h.each(n,function(e,n){t.append(e,n)}),t.append("resumableChunkNumber",i.offset+1),t.append("resumableChunkSize",i.resumableObj.opts.chunkSize),t.append("resumableTotalSize",i.fileObjSize),t.append("resumableIdentifier",i.fileObj.uniqueIdentifier),t.append("resumableFilename",i.fileObj.fileName),t.append("resumableRelativePath",i.fileObj.relativePath);var r=i.fileObj.file.slice?"slice":i.fileObj.file.mozSlice?"mozSlice":i.fileObj.file.webkitSlice?"webkitSlice":"slice";t.append(i.resumableObj.opts.fileParameterName,i.fileObj.file[r](i.startByte,i.endByte)),i.xhr.open("POST",i.resumableObj.opts.target),$h.each(i.resumableObj.opts.headers,function(e,t){i.xhr.setRequestHeader(e,t)}),i.xhr.send(t)},i.abort=function(){i.xhr&&i.xhr.abort(),i.xhr=null},i.status=function(){return i.xhr?i.xhr.readyState<4?"uploading":i.xhr.status==200?"success":i.xhr.status==415||i.xhr.status==500||i.xhr.status==501?"error":(i.abort(),"pending"):"pending"},i.message=function(){return i.xhr?i.xhr.responseText:""},i.progress=function(e){typeof e=="undefined"&&(e=!1);var t=e?(i.endByte-i.startByte)/i.fileObjSize:1,n=i.status();switch(n){case"success":case"error":return 1*t;case"pending":return 0*t;default:return i.loaded/(i.endByte-i.startByte)*t}},this}if(this instanceof e){this.support=typeof File!="undefined"&&typeof Blob!="undefined"&&typeof FileList!="undefined"&&(!!Blob.prototype.webkitSlice||!!Blob.prototype.mozSlice||Blob.prototype.slice||!1);if(!this.support)return!1;var n=this;n.files=[],n.defaults={chunkSize:1048576,simultaneousUploads:3,fileParameterName:"file",throttleProgressCallbacks:.5,query:{},headers:{},prioritizeFirstAndLastChunk:!1,target:"/",testChunks:!0,generateUniqueIdentifier:null,maxFiles:undefined,maxFilesErrorCallback:function(){alert("Please upload "+n.opts.maxFiles+" file"+(n.opts.maxFiles===1?"":"s")+" at a time.")}},n.events=[],n.on=function(e,t){n.events.push(e.toLowerCase(),t)},n.fire=function(){var e=[];for(var t=0;t<arguments.length;t++)e.push(arguments[t]);var r=e[0].toLowerCase();for(var t=0;t<=n.events.length;t+=2)n.events[t]==r&&n.events[t+1].apply(n,e.slice(1)),n.events[t]=="catchall"&&n.events[t+1].apply(null,e);r=="fileerror"&&n.fire("error",e[2],e[1]),r=="fileprogress"&&n.fire("progress")},$h={stopEvent:function(e){e.stopPropagation(),e.preventDefault()},each:function(e,t){if(typeof e.length!="undefined"){for(var n=0;n<e.length;n++)if(t(e[n])===!1)return}else for(n in e)if(t(n,e[n])===!1)return},generateUniqueIdentifier:function(e){if(typeof n.opts.generateUniqueIdentifier=="function")return n.opts.generateUniqueIdentifier(e);var t=e.webkitRelativePath||e.fileName||e.name,r=e.size;return r+"-"+t.replace(/[^0-9a-zA-Z_-]/img,"")}};var r=function(e){if(typeof n.opts.maxFiles!="undefined"&&t.maxFiles<e.length+n.files.length)return n.opts.maxFilesErrorCallback(),!1;$h.each(e,function(e){if(e.size>0&&!n.getFromUniqueIdentifier($h.generateUniqueIdentifier(e))){var t=new i(n,e);n.files.push(t),n.fire("fileAdded",t)}})};return n.uploadNextChunk=function(){var e=!1;if(n.opts.prioritizeFirstAndLastChunk){$h.each(n.files,function(t){if(t.chunks.length&&t.chunks[0].status()=="pending")return t.chunks[0].send(),e=!0,!1;if(t.chunks.length>1&&t.chunks[t.chunks.length-1].status()=="pending")return t.chunks[t.chunks.length-1].send(),e=!0,!1});if(e)return!0}return $h.each(n.files,function(t){$h.each(t.chunks,function(t){if(t.status()=="pending")return t.send(),e=!0,!1});if(e)return!1}),e?!0:($h.each(n.files,function(e){outstanding=!1,$h.each(e.chunks,function(e){var t=e.status();if(t=="pending"||t=="uploading")return outstanding=!0,!1});if(outstanding)return!1}),outstanding||n.fire("complete"),!1)},n.assignBrowse=function(e,t){typeof e.length=="undefined"&&(e=[e]),$h.each(e,function(e){var i;e.tagName==="INPUT"&&e.type==="file"?i=e:(i=document.createElement("input"),i.setAttribute("type","file"),e.style.display="inline-block",e.style.position="relative",i.style.position="absolute",i.style.top=i.style.left=i.style.bottom=i.style.right=0,i.style.opacity=0,i.style.cursor="pointer",e.appendChild(i)),typeof n.opts.maxFiles=="undefined"||n.opts.maxFiles!=1?i.setAttribute("multiple","multiple"):i.removeAttribute("multiple"),t?i.setAttribute("webkitdirectory","webkitdirectory"):i.removeAttribute("webkitdirectory"),i.addEventListener("change",function(e){r(e.target.files),e.target.value=""},!1)})},n.assignDrop=function(e){typeof e.length=="undefined"&&(e=[e]),$h.each(e,function(e){e.addEventListener("dragover",function(e){e.preventDefault()},!1),e.addEventListener("drop",function(e){$h.stopEvent(e),r(e.dataTransfer.files)},!1)})},n.isUploading=function(){var e=!1;return $h.each(n.files,function(t){$h.each(t.chunks,function(t){if(t.status()=="uploading")return e=!0,!1});if(e)return!1}),e},n.upload=function(){if(n.isUploading())return;for(var e=1;e<=n.opts.simultaneousUploads;e++)n.uploadNextChunk()},n.pause=function(){$h.each(n.files,function(e){e.abort()}),n.fire("pause")},n.cancel=function(){$h.each(n.files,function(e){e.cancel()}),n.fire("cancel")},n.progress=function(){var e=0,t=0;return $h.each(n.files,function(n){e+=n.progress()*n.size,t+=n.size}),t>0?e/t:0},n.removeFile=function(e){var t=[];$h.each(n.files,function(n,r){n!==e&&t.push(n)}),n.files=t},n.getFromUniqueIdentifier=function(e){var t=!1;return $h.each(n.files,function(n){n.uniqueIdentifier==e&&(t=n)}),t},n.getSize=function(){var e=0;return $h.each(n.files,function(t){e+=t.size}),e},n.opts=t||{},$h.each(n.defaults,function(e,t){typeof n.opts[e]=="undefined"&&(n.opts[e]=t)}),this}return new e(t)};return e}),define("views/widget/fileupload",["jquery","underscore","backbone","context","bases","tpl!templates/widget/fileupload.html","resumable"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){r.hasPermission("FILE_UPLOAD",this.options.workspace_id)?this.render():this.$el.html("<p>Sorry, you need the FILE_UPLOAD permission to upload here.</p>")},render:function(){this.$el.html(s()),this.resumable=new o({chunkSize:524288,target:"/files/upload",fileParameterName:"file.data"}),this.resumable.assignBrowse(this.$("a.btn")),this.resumable.assignDrop(this.$(".drop"));var t=this;this.resumable.on("fileAdded",function(e){t.$(".status").html(e.fileName+", "+e.size+" bytes"),t.resumable.upload(),t.$(".drop").hide(),t.$(".status").show()}),this.resumable.on("fileSuccess",function(n,r){var i=e.parseJSON(r),s=e('<input type="hidden" name="uploaded_file" />');s.attr("value",i.data.identifier),t.$el.append(s),t.$(".status").html("Upload complete.")}),this.resumable.on("fileError",function(n,r){var i=e.parseJSON(r),s=e('<ul class="error"></ul>');for(var o=0;o<i.errors.length;o++){var u=e("<li></li>");u.text(i.errors[o]),s.append(u)}t.$(".status").html(s)}),this.resumable.on("progress",function(e){t.$("progress").val(t.resumable.progress()*100)})},destroy:function(){this.resumable.isUploading()&&this.resumable.cancel()}});return u}),define("tpl!templates/workspace/edit.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+="\n<h1>",newWorkspace?__p+="Create Workspace":__p+="Edit Workspace",__p+='</h1>\n\n<form method="POST" class="form-horizontal">\n	<div class="control-group">\n		<label class="control-label" for="name">Name:</label>\n		<div class="controls">\n			<input name="name" id="name" type="text" value="'+_.escape(workspace.attributes.name)+'" />\n		</div>\n	</div>\n\n	<div class="control-group">\n		<label class="control-label" for="stub">Stub:</label>\n		<div class="controls">\n			<input name="stub" id="stub" type="text" value="'+_.escape(workspace.attributes.stub)+'" />\n		</div>\n	</div>\n\n	<div class="control-group">\n		<label class="control-label">Tags:</label>\n		<div class="controls">\n			<input type="hidden" id="tags" name="serialised_tags" value="">\n			<div class="workspace-tag-editor pm-tag-editor"></div>\n		</div>\n	</div>\n\n	<div class="control-group">\n		<div class="controls">\n			<button class="btn submit">Submit</button>\n		</div>\n	</div>\n</form>';return __p}}),define("views/workspace/edit",["jquery","underscore","backbone","context","bases","tpl!templates/workspace/edit.html","models/workspace"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){this.model?this.newWorkspace=!1:(this.newWorkspace=!0,this.model=new o),this.render()},render:function(){return this.$el.html(i.errorLoadingHtml+s({workspace:this.model,context:r,newWorkspace:this.newWorkspace})),e("head").append('<link rel="stylesheet" href="/static/css/tag_editor.css">'),this.$(".workspace-tag-editor").jsonEditor({Tags:this.model.attributes.tags},{newSingleKey:"New Tag",newGroupKey:"Tag Group",change:function(e){this.$("#tags").val(JSON.stringify(e.Tags)),this.$("#tags").data("tags",e.Tags)},drawproperty:function(t,n,r,i,s){return children={},s=="Tags"&&Object.prototype.toString.call(n[s])=="[object Object]"&&(children.item=e("<div>",{"class":"item","data-path":i}),children.item.addClass("expanded group-top-level"),children.property=e(t.headerElement||'<span class="property group-header">'+s+"</span>")),children}}),this},saveModel:function(e){e.preventDefault(),this.startLoadingFull(),this.model.save({name:this.$("#name").val(),stub:this.$("#stub").val(),tags:this.$("#tags").data("tags")},{success:t.bind(this.saveOk,this),error:t.bind(this.loadingError,this)})},saveOk:function(){r.navigate("/workspace/list")},events:{"click button.submit":"saveModel"}});return u}),define("tpl!templates/application/services.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{}){__p+='\n<h1>Services</h1>\n\n<div class="service-list clearfix">\n	';for(var i=0;i<services.services.length;i++){__p+="\n		";var service=services.services[i];__p+='\n		<div class="service tile">\n			<div class="title">\n				'+_.escape(service.name)+'\n			</div>\n			<div class="body">\n				<strong>Provider:</strong> '+_.escape(service.provider)+"\n				<br />\n				<strong>State:</strong> "+_.escape(service.state)+"\n				<br />\n				";var actions=[];__p+="\n				",services.exportable_services[service.provider]&&(__p+="\n					",actions.push('<a href="/service/export/'+service.id+'" class="virtual">Export</a>'),__p+="\n				"),__p+="\n				",services.importable_services[service.provider]&&(__p+="\n					",actions.push('<a href="/service/import/'+service.id+'" class="virtual">Import</a>'),__p+="\n				"),__p+="\n				",service.credentials&&(__p+="\n					",actions.push('<a href="#" class="showCredentials">Credentials</a>'),__p+="\n				"),__p+="\n\n				"+actions.join(" &middot; ")+"\n\n				",service.credentials&&(__p+='\n					<pre class="credentials" style="display: none;">'+_.escape(JSON.stringify(service.credentials,null,2))+"</pre>\n				"),__p+="\n			</div>\n		</div>\n	"}__p+="\n</div>\n\n",services.services.length==0&&(__p+='\n	<p class="lead">This application has no services.</p>\n'),__p+=""}return __p}}),define("views/application/services",["jquery","underscore","backbone","context","bases","tpl!templates/application/services.html"],function(e,t,n,r,i,s){var o=i.BaseView.extend({initialize:function(){this.$el.html("<h1>Services</h1>"),this.startLoadingFull()},dataReady:function(e){this.services=e.data,this.render()},render:function(){return this.doneLoading(),this.$el.html(s({services:this.services,context:r})),this},events:{"click a.virtual":"navigateAway","click a.showCredentials":"showCredentials"},showCredentials:function(t){t.preventDefault();var n=e(t.currentTarget),r=e("pre",n.parent());r.slideToggle()}});return o}),define("tpl!templates/version/manifest.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+="\n<h1>Manifest</h1>\n\n<pre>"+_.escape(manifest.manifest)+"</pre>";return __p}}),define("views/version/manifest",["jquery","underscore","backbone","context","bases","tpl!templates/version/manifest.html"],function(e,t,n,r,i,s){var o=i.BaseView.extend({initialize:function(){this.$el.html("<h1>Loading...</h1>")},destroy:function(){},dataReady:function(e){this.data=e.data,this.render()},render:function(){return this.doneLoading(),this.$el.html(s({manifest:this.data,context:r})),this}});return o}),define("tpl!templates/widget/logsingle.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+="\n<h1>"+_.escape(title)+'</h1>\n\n<pre data-jobid="'+_.escape(job_id)+'">Loading...</pre>';return __p}}),define("views/widget/genericlog",["jquery","underscore","backbone","context","bases","tpl!templates/widget/logsingle.html","views/widget/logviewer"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){this.render(),this.block=null},render:function(){this.$el.html(s({title:this.options.title,job_id:this.options.job_id})),this.block=new o({el:this.$("pre")}),this.block.start()},destroy:function(){this.block&&this.block.destroy()}});return u}),define("tpl!templates/service/export.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+="\n<h1>Export "+_.escape(service.attributes.name)+'</h1>\n\n<form method="POST" action="/service/export/'+_.escape(service.id)+'">\n	<div class="export-inner"></div>\n\n	<input type="submit" class="btn" value="Export" />\n</form>';return __p}}),define("views/service/export",["jquery","underscore","backbone","context","bases","tpl!templates/service/export.html"],function(e,t,n,r,i,s){var o=i.BaseView.extend({initialize:function(){this.$el.html(i.errorLoadingHtml+"<h1>Loading...</h1>"),this.startLoadingFull(),this.exportPlugin=null,this.exportPluginInstance=null;var e=this;r.loadPlugin(this.model.attributes.provider,function(t){e.exportPlugin=t,e.render()},function(t){e.render()})},gotPlugin:function(){this.doneLoading()},destroy:function(){this.exportPluginInstance&&this.exportPluginInstance.destroy(),this.undelegateEvents()},render:function(){this.doneLoading(),this.$el.html(i.errorLoadingHtml+s({service:this.model,context:r,_:t}));var e=this.$(".export-inner");return this.exportPlugin&&this.exportPlugin.SERVICE_EXPORT?this.exportPluginInstance=new this.exportPlugin.SERVICE_EXPORT({el:e,service:this.model}):e.text("This plugin has no options."),this}});return o}),define("tpl!templates/service/import.html",function(){return function(obj){var __p="",print=function(){__p+=Array.prototype.join.call(arguments,"")};with(obj||{})__p+="\n<h1>Import into "+_.escape(service.attributes.name)+'</h1>\n\n<form method="POST" class="form-horizontal">\n	<div class="control-group">\n		<label class="control-label">Upload file:</label>\n		<div class="controls">\n			<div class="file-uploader-widget"></div>\n		</div>\n	</div>\n\n	<div class="import-inner"></div>\n\n	<button class="btn submit">Import</button>\n</form>';return __p}}),define("views/service/import",["jquery","underscore","backbone","context","bases","views/widget/fileupload","tpl!templates/service/import.html"],function(e,t,n,r,i,s,o){var u=i.BaseView.extend({initialize:function(){this.$el.html(i.errorLoadingHtml+"<h1>Loading...</h1>"),this.startLoadingFull(),this.importPlugin=null,this.importPluginInstance=null,this.uploader=null;var e=this;r.loadPlugin(this.model.attributes.provider,function(t){e.importPlugin=t,e.render()},function(t){e.render()})},gotPlugin:function(){this.doneLoading()},destroy:function(){this.importPluginInstance&&this.importPluginInstance.destroy(),this.uploader&&this.uploader.destroy(),this.undelegateEvents()},render:function(){this.doneLoading(),this.$el.html(i.errorLoadingHtml+o({service:this.model,context:r,_:t}));var e=this.$(".import-inner");return this.importPlugin&&this.importPlugin.SERVICE_IMPORT?this.importPluginInstance=new this.importPlugin.SERVICE_IMPORT({el:e,service:this.model}):e.text("This plugin has no options."),this.uploader=new s({workspace_id:this.model.attributes.workspace.id,el:this.$(".file-uploader-widget")}),this},events:{"click button.submit":"submit"},submit:function(n){n.preventDefault();if(this.$("input[name=uploaded_file]").length==0){this.$(".alert").text("No file uploaded."),this.$(".alert").show();return}var i={};i.uploaded_file=this.$("input[name=uploaded_file]").val();if(this.importPluginInstance){i=this.importPluginInstance.serialize(i);if(typeof i=="string"){this.$(".alert").html(i),this.$(".alert").show();return}}var s=this;this.startLoadingFull(),e.ajax({url:"/service/import/"+this.model.id+"?format=json",type:"POST",dataType:"json",data:JSON.stringify({data:i}),success:function(e){s.doneLoading(),r.navigate("/service/import/"+s.model.id+"/"+e.data.job_id)},error:t.bind(this.loadingError,this)})}});return u}),define("router",["jquery","underscore","backbone","tpl!templates/layout/breadcrumb.html","models/node","models/user","models/role","models/application","models/version","models/workspace","models/service","views/node/list","views/workspace/sidebar","views/node/sidebar","views/node/detail","views/administration/sidebar","views/administration/profile","views/administration/list","views/administration/user-list","views/layout/genericloading","views/administration/user-edit","views/administration/role-list","views/administration/role-edit","views/administration/role-allocation-list","views/administration/role-allocation-assign","views/widget/genericjobslist","views/administration/router-dump","views/administration/configuration-dump","views/administration/plugin-dump","views/workspace/list","views/application/list","views/application/detail","views/version/detail","views/widget/genericjob","views/application/new","views/widget/fileupload","views/workspace/edit","views/application/services","views/version/manifest","views/widget/genericlog","views/service/export","views/service/import"],function(e,t,n,r,i,s,o,u,a,f,l,c,h,p,d,v,m,g,y,b,w,E,S,x,T,N,C,k,L,A,O,M,_,D,P,H,B,j,F,I,q,R){var U={workspaces:e(".page-workspaces"),nodes:e(".page-nodes"),administration:e(".page-administration"),404:e(".page-404")},z={},W=n.Router.extend({initialize:function(){this.route(/^$/,"workspaceList"),this.route("workspace/list","workspaceList"),this.route(/^workspace\/(\d+)\/applications$/,"applicationList"),this.route(/^workspace\/(\d+)$/,"workspaceEdit"),this.route("workspace/create","workspaceEdit"),this.route(/^job\/list\/workspace\/(\d+)$/,"workspaceJobsList"),this.route(/^job\/list\/workspace\/(\d+)\?sub\=cron$/,"workspaceJobsList"),this.route(/^workspace\/(\d+)\/applications\/new$/,"applicationNew"),this.route(/^workspace\/(\d+)\/applications\/new\/([-a-z0-9]+)$/,"applicationNewJob"),this.route(/^application\/(\d+)$/,"applicationView"),this.route(/^application\/(\d+)\/newversion$/,"applicationNewVersion"),this.route(/^application\/(\d+)\/newversion\/([-a-z0-9]+)$/,"applicationNewVersionJob"),this.route(/^application\/(\d+)\/services$/,"applicationServices"),this.route(/^application\/(\d+)\/delete\/([-a-z0-9]+)$/,"applicationDeleteJob"),this.route(/^job\/list\/application\/(\d+)$/,"applicationJobsList"),this.route(/^job\/list\/application\/(\d+)\?sub\=cron$/,"applicationJobsList"),this.route(/^version\/(\d+)$/,"versionView"),this.route(/^version\/(\d+)\/log\/([-a-z0-9]+)$/,"versionLogView"),this.route(/^version\/(\d+)\/(start|stop|register|deregister|setcurrent|quantity)\/([-a-z0-9]+)$/,"versionJob"),this.route(/^version\/(\d+)\/manifest$/,"versionManifest"),this.route(/^job\/list\/version\/(\d+)$/,"versionJobsList"),this.route(/^job\/list\/version\/(\d+)\?sub\=cron$/,"versionJobsList"),this.route(/^service\/export\/(\d+)$/,"serviceExport"),this.route(/^service\/import\/(\d+)$/,"serviceImport"),this.route(/^service\/import\/(\d+)\/([-a-z0-9]+)$/,"serviceImportJob"),this.route("node/list","nodeList"),this.route(/^node\/(\d+)$/,"nodeDetail"),this.route(/^node\/(\d+)\/log\/([-a-z0-9]+)$/,"nodeLogView"),this.route("administration/list","administrationList"),this.route("profile","yourProfile"),this.route("user/list","userList"),this.route(/^user\/(\d+)$/,"userEdit"),this.route("user/create","userEdit"),this.route("role/list","roleList"),this.route(/^role\/(\d+)$/,"roleEdit"),this.route("role/create","roleEdit"),this.route("role/allocation/list","roleAllocationList"),this.route("role/allocation/assign","roleAllocationAssign"),this.route("job/list/health","adminHealthJobs"),this.route("job/list/periodic","adminPeriodicJobs"),this.route("router/dump","adminRouterDump"),this.route("configuration/dump","adminConfigurationDump"),this.route("configuration/plugins","adminPluginsDump")},ensureVisible:function(e){this.currentMainView&&(this.currentMainView.destroy(),this.currentMainView=null);var n=this;t.each(U,function(t,n,r){e!=n&&t.hide()}),t.each(U,function(t,r,i){e==r&&(n.currentPage=t,t.is(":visible")||t.fadeIn())}),this.createSidebar(e)},createSidebar:function(t){z[t]||(t=="nodes"&&(z[t]=new p({collection:this.context.nodes,el:e(".sidebar",this.currentPage)}),this.context.nodes.fetch()),t=="workspaces"&&(z[t]=new h({collection:this.context.workspaces,el:e(".sidebar",this.currentPage)})),t=="administration"&&(z[t]=new v({collection:this.context.administrations,el:e(".sidebar",this.currentPage)})))},breadcrumbs:function(t){var n=e("ul.breadcrumb",this.currentPage);n.html(r({crumbs:t}));var i=this;e("a",n).click(function(t){return i.context.navigate(e(t.currentTarget).attr("href")),!1})},adminSetActive:function(e){var t=window.location.pathname;e&&(t=e),this.context.administrations.invoke("set",{active:!1}),this.context.administrations.findWhere({path:t}).set({active:!0})},setMainView:function(e){this.currentMainView&&this.currentMainView.destroy(),this.currentMainView=e},workspaceSetActive:function(e){z.workspaces&&z.workspaces.setActive(e)},genericJobsListPage:function(t,n){this.setMainView(new N({url:t,title:n,el:e(".mainarea",this.currentPage)}))},genericDataTemplatePage:function(n,r){this.setMainView(new r({el:e(".mainarea",this.currentPage)})),e.ajax({url:n,dataType:"json",success:t.bind(this.currentMainView.dataReady,this.currentMainView),error:t.bind(this.currentMainView.loadingError,this.currentMainView)})},fromCollectionOrServer:function(n,r,i,s,o){var u=r.get(n);u?(s(u),o&&o(u)):(this.setMainView(new b({el:e(".mainarea",this.currentPage)})),this.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"#",title:"Loading ..."}]),u=new i({id:n}),u.fetch({success:function(e,t,n){r.add(e),result=r.get(e.id),s(result)},error:t.bind(this.currentMainView.loadingError,this.currentMainView)}))},workspaceEdit:function(n){function i(t){var i=[{href:"/workspace/list",title:"Workspaces"}];t?(i.push({href:"/workspace/"+n+"/applications",title:t.attributes.name}),i.push({href:"/workspace/"+n,title:"Edit"})):(r.workspaceSetActive("create-workspace"),i.push({href:"/workspace/create",title:"Create workspace"})),r.breadcrumbs(i),r.setMainView(new B({model:t,el:e(".mainarea",U.workspaces)}))}this.ensureVisible("workspaces"),this.workspaceSetActive("workspace-"+n);var r=this;if(n){this.setMainView(new b({el:e(".mainarea",this.currentPage)})),this.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"#",title:"Loading workspace "+n+"..."}]);var s=new f({id:n});s.fetch({success:function(e,t,n){i(e)},error:t.bind(this.currentMainView.loadingError,this.currentMainView)})}else i()},workspaceList:function(){this.ensureVisible("workspaces"),this.workspaceSetActive(""),this.setMainView(new A({collection:this.context.workspaces,el:e(".mainarea",this.currentPage)})),this.context.workspaces.fetch(),this.breadcrumbs([{href:"/workspace/list",title:"Workspaces"}]),this.currentMainView.render(),this.currentMainView.startLoadingFull()},workspaceJobsList:function(e){this.ensureVisible("workspaces"),this.workspaceSetActive("workspace-"+e);var t=this;this.fromCollectionOrServer(e,this.context.workspaces,f,function(n){var r=[{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+e+"/applications",title:n.attributes.name}],i=window.location.pathname,s="All Jobs";window.location.search.indexOf("sub=cron")!=-1?(r.push({href:"",title:"Cron Jobs"}),i+="?sub=cron&format=json",s="Cron Jobs"):(r.push({href:"",title:"All Jobs"}),i+="?format=json"),t.breadcrumbs(r),t.genericJobsListPage(i,s)})},applicationList:function(t){this.ensureVisible("workspaces"),this.workspaceSetActive("workspace-"+t);var n=this;this.fromCollectionOrServer(t,this.context.workspaces,f,function(r){n.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+t+"/applications",title:r.attributes.name}]),n.setMainView(new O({collection:r.applications,workspace:r,el:e(".mainarea",n.currentPage)})),r.applications.fetch()})},applicationView:function(t){this.ensureVisible("workspaces"),this.workspaceSetActive("application-"+t);var n=this;this.fromCollectionOrServer(t,this.context.applications,u,function(t){n.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+t.attributes.workspace.id+"/applications",title:t.attributes.workspace.name},{href:"/application/"+t.id,title:t.attributes.name}]),n.setMainView(new M({model:t,el:e(".mainarea",n.currentPage)})),t.fetch(),t.versions.fetch()})},applicationServices:function(e){this.ensureVisible("workspaces"),this.workspaceSetActive("application-"+e);var t=this;this.fromCollectionOrServer(e,this.context.applications,u,function(e){t.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+e.attributes.workspace.id+"/applications",title:e.attributes.workspace.name},{href:"/application/"+e.id,title:e.attributes.name},{href:"/application/"+e.id+"/services",title:"Services"}]),t.genericDataTemplatePage(window.location.pathname+"?format=json",j)})},applicationNew:function(t){this.ensureVisible("workspaces"),this.workspaceSetActive("create-application-"+t);var n=this;this.fromCollectionOrServer(t,this.context.workspaces,f,function(r){n.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+t+"/applications",title:r.attributes.name},{href:"/workspace/"+t+"/applications/new",title:"New Application"}]),n.setMainView(new P({url:window.location.pathname+"?format=json",workspace:r,newApplication:!0,el:e(".mainarea",n.currentPage)}))})},applicationNewJob:function(t,n){this.ensureVisible("workspaces"),this.workspaceSetActive("create-application-"+t);var r=this;this.fromCollectionOrServer(t,this.context.workspaces,f,function(i){r.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+t+"/applications",title:i.attributes.name},{href:window.location.pathname,title:"New Application"}]),r.setMainView(new D({job_id:n,el:e(".mainarea",r.currentPage),finishedCallback:function(e,n){var i=r.context.workspaces.get(t);i.applications.fetch()}}))})},applicationJobsList:function(e){this.ensureVisible("workspaces"),this.workspaceSetActive("application-"+e);var t=this;this.fromCollectionOrServer(e,this.context.applications,u,function(e){var n=[{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+e.attributes.workspace.id+"/applications",title:e.attributes.workspace.name},{href:"/application/"+e.id,title:e.attributes.name}],r=window.location.pathname,i="All Jobs";window.location.search.indexOf("sub=cron")!=-1?(n.push({href:"",title:"Cron Jobs"}),r+="?sub=cron&format=json",i="Cron Jobs"):(n.push({href:"",title:"All Jobs"}),r+="?format=json"),t.breadcrumbs(n),t.genericJobsListPage(r,i)})},applicationNewVersion:function(t){this.ensureVisible("workspaces"),this.workspaceSetActive("create-version-"+t);var n=this;this.fromCollectionOrServer(t,this.context.applications,u,function(t){n.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+t.attributes.workspace.id+"/applications",title:t.attributes.workspace.name},{href:"/application/"+t.id,title:t.attributes.name},{href:window.location.pathname,title:"New Version"}]),n.setMainView(new P({url:window.location.pathname+"?format=json",workspace:t.attributes.workspace,application:t,newApplication:!1,el:e(".mainarea",n.currentPage)}))})},applicationNewVersionJob:function(t,n){this.ensureVisible("workspaces"),this.workspaceSetActive("create-version-"+t);var r=this;this.fromCollectionOrServer(t,this.context.applications,u,function(t){r.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+t.attributes.workspace.id+"/applications",title:t.attributes.workspace.name},{href:"/application/"+t.id,title:t.attributes.name},{href:window.location.pathname,title:"New Version"}]),r.setMainView(new D({job_id:n,el:e(".mainarea",r.currentPage),finishedCallback:function(e,n){var i=r.context.workspaces.get(t.attributes.workspace.id);i.applications.fetch();var s=r.context.applications.get(t.id);s.fetch()}}))})},applicationDeleteJob:function(t,n){this.ensureVisible("workspaces"),this.workspaceSetActive("application-"+t);var r=this;this.fromCollectionOrServer(t,this.context.applications,u,function(t){r.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+t.attributes.workspace.id+"/applications",title:t.attributes.workspace.name},{href:"/application/"+t.attributes.id,title:t.attributes.name},{href:window.location.pathname,title:"Delete"}]),r.setMainView(new D({job_id:n,el:e(".mainarea",r.currentPage),finishedCallback:function(e,n){var i=r.context.workspaces.get(t.attributes.workspace.id);i.applications.fetch()}}))})},versionView:function(t){this.ensureVisible("workspaces"),this.workspaceSetActive("version-"+t);var n=this;this.fromCollectionOrServer(t,this.context.versions,a,function(t){n.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+t.attributes.workspace.id+"/applications",title:t.attributes.workspace.name},{href:"/application/"+t.attributes.application.id,title:t.attributes.application.name},{href:"/version/"+t.attributes.id,title:"Version "+t.attributes.version}]),n.setMainView(new _({model:t,el:e(".mainarea",n.currentPage)}))},function(e){e.fetch()})},versionManifest:function(e){this.ensureVisible("workspaces"),this.workspaceSetActive("version-"+e);var t=this;this.fromCollectionOrServer(e,this.context.versions,a,function(e){t.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+e.attributes.workspace.id+"/applications",title:e.attributes.workspace.name},{href:"/application/"+e.attributes.application.id,title:e.attributes.application.name},{href:"/version/"+e.attributes.id,title:"Version "+e.attributes.version},{href:window.location.pathname,title:"Manifest"}]),t.genericDataTemplatePage(window.location.pathname+"?format=json",F)})},versionLogView:function(t,n){this.ensureVisible("workspaces"),this.workspaceSetActive("version-"+t);var r=this;this.fromCollectionOrServer(t,this.context.versions,a,function(t){r.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+t.attributes.workspace.id+"/applications",title:t.attributes.workspace.name},{href:"/application/"+t.attributes.application.id,title:t.attributes.application.name},{href:"/version/"+t.attributes.id,title:"Version "+t.attributes.version},{href:window.location.pathname,title:"Log File"}]),r.setMainView(new I({el:e(".mainarea",U.workspaces),job_id:n,title:"View log"}))})},versionJobsList:function(e){this.ensureVisible("workspaces"),this.workspaceSetActive("version-"+e);var t=this;this.fromCollectionOrServer(e,this.context.versions,a,function(e){var n=[{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+e.attributes.workspace.id+"/applications",title:e.attributes.workspace.name},{href:"/application/"+e.attributes.application.id,title:e.attributes.application.name},{href:"/version/"+e.attributes.id,title:"Version "+e.attributes.version}],r=window.location.pathname,i="All Jobs";window.location.search.indexOf("sub=cron")!=-1?(n.push({href:"",title:"Cron Jobs"}),r+="?sub=cron&format=json",i="Cron Jobs"):(n.push({href:"",title:"All Jobs"}),r+="?format=json"),t.breadcrumbs(n),t.genericJobsListPage(r,i)})},jobActionMap:{start:"Start",stop:"Stop",register:"Register",deregister:"De-Register",setcurrent:"Make Current",quantity:"Instance Quantity"},versionJob:function(t,n,r){this.ensureVisible("workspaces"),this.workspaceSetActive("version-"+t);var i=this;this.fromCollectionOrServer(t,this.context.versions,a,function(t){i.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+t.attributes.workspace.id+"/applications",title:t.attributes.workspace.name},{href:"/application/"+t.attributes.application.id,title:t.attributes.application.name},{href:"/version/"+t.attributes.id,title:"Version "+t.attributes.version},{href:window.location.pathname,title:i.jobActionMap[n]}]),i.setMainView(new D({job_id:r,el:e(".mainarea",i.currentPage),finishedCallback:function(e,n){var r=i.context.workspaces.get(t.attributes.workspace.id);r.applications.fetch()}}))})},serviceExport:function(n){function i(t){r.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+t.attributes.workspace.id+"/applications",title:t.attributes.workspace.name},{href:"/application/"+t.attributes.application.id,title:t.attributes.application.name},{href:"/application/"+t.attributes.application.id+"/services",title:"Services"},{href:"/service/export/"+n,title:"Export service "+t.attributes.name}]),r.setMainView(new q({el:e(".mainarea",r.currentPage),model:t}))}this.ensureVisible("workspaces"),this.setMainView(new b({el:e(".mainarea",this.currentPage)})),this.breadcrumbs([{href:"#",title:"Loading..."}]);var r=this,s=new l({id:n});s.url="/service/export/"+n+"?format=json",s.fetch({success:function(e,t,n){i(e)},error:t.bind(this.currentMainView.loadingError,this.currentMainView)})},serviceImport:function(n){function i(t){r.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+t.attributes.workspace.id+"/applications",title:t.attributes.workspace.name},{href:"/application/"+t.attributes.application.id,title:t.attributes.application.name},{href:"/application/"+t.attributes.application.id+"/services",title:"Services"},{href:"/service/import/"+n,title:"Import service "+t.attributes.name}]),r.setMainView(new R({el:e(".mainarea",r.currentPage),model:t}))}this.ensureVisible("workspaces"),this.setMainView(new b({el:e(".mainarea",this.currentPage)})),this.breadcrumbs([{href:"#",title:"Loading..."}]);var r=this,s=new l({id:n});s.url="/service/import/"+n+"?format=json",s.fetch({success:function(e,t,n){i(e)},error:t.bind(this.currentMainView.loadingError,this.currentMainView)})},serviceImportJob:function(n,r){function s(t){i.breadcrumbs([{href:"/workspace/list",title:"Workspaces"},{href:"/workspace/"+t.attributes.workspace.id+"/applications",title:t.attributes.workspace.name},{href:"/application/"+t.attributes.application.id,title:t.attributes.application.name},{href:"/application/"+t.attributes.application.id+"/services",title:"Services"},{href:"/service/import/"+n,title:"Import service "+t.attributes.name},{href:"#",title:"Import Status"}]),i.setMainView(new D({job_id:r,el:e(".mainarea",i.currentPage),title:"Import Status"}))}this.ensureVisible("workspaces"),this.setMainView(new b({el:e(".mainarea",this.currentPage)})),this.breadcrumbs([{href:"#",title:"Loading..."}]);var i=this,o=new l({id:n});o.url="/service/import/"+n+"?format=json",o.fetch({success:function(e,t,n){s(e)},error:t.bind(this.currentMainView.loadingError,this.currentMainView)})},nodeList:function(){this.ensureVisible("nodes"),this.setMainView(new c({collection:this.context.nodes,el:e(".mainarea",U.nodes)})),this.context.nodes.fetch(),this.context.nodes.invoke("set",{active:!1}),this.breadcrumbs([{href:"/node/list",title:"Nodes"}]),this.currentMainView.render(),this.currentMainView.startLoadingFull()},nodeDetail:function(t){this.ensureVisible("nodes");var n=this;this.fromCollectionOrServer(t,this.context.nodes,i,function(r){r.set({active:!0}),n.breadcrumbs([{href:"/node/list",title:"Nodes"},{href:"/node/"+t,title:r.attributes.name}]),n.setMainView(new d({model:r,el:e(".mainarea",U.nodes)}))})},nodeLogView:function(t,n){this.ensureVisible("nodes");var r=this;this.fromCollectionOrServer(t,this.context.nodes,i,function(i){r.breadcrumbs([{href:"/node/list",title:"Nodes"},{href:"/node/"+t,title:i.attributes.name},{href:"#",title:"Log View"}]),r.setMainView(new I({el:e(".mainarea",U.nodes),job_id:n,title:"View log"}))})},administrationList:function(){this.ensureVisible("administration"),this.context.administrations.invoke("set",{active:!1}),this.breadcrumbs([{href:"/administration/list",title:"Administration"}]),this.setMainView(new g({collection:this.context.administrations,el:e(".mainarea",U.administration)}))},yourProfile:function(){this.ensureVisible("administration"),this.breadcrumbs([{href:"/administration/list",title:"Administration"},{href:"/profile",title:"Your Profile"}]),this.adminSetActive(),this.setMainView(new m({el:e(".mainarea",U.administration)}));var t=this;e.getJSON("/profile?format=json",function(e){t.currentMainView.render(e.data.apikey)})},userList:function(){this.ensureVisible("administration"),this.adminSetActive(),this.setMainView(new y({collection:this.context.users,el:e(".mainarea",U.administration)})),this.context.users.fetch(),this.breadcrumbs([{href:"/administration/list",title:"Administration"},{href:"/user/list",title:"Users"}]),this.currentMainView.render(),this.context.users.models.length==0?this.currentMainView.startLoadingFull():this.currentMainView.startLoadingInline()},userEdit:function(n){function i(t){var i=[{href:"/administration/list",title:"Administration"},{href:"/user/list",title:"Users"}];t?i.push({href:"/user/"+n,title:"Edit user "+t.attributes.name}):i.push({href:"/user/create",title:"Create user"}),r.breadcrumbs(i),r.setMainView(new w({model:t,el:e(".mainarea",U.administration)}))}this.ensureVisible("administration"),this.adminSetActive("/user/list");var r=this;if(n){this.setMainView(new b({el:e(".mainarea",U.administration)})),this.breadcrumbs([{href:"/administration/list",title:"Administration"},{href:"/user/list",title:"Users"},{href:"#",title:"Loading user "+n+"..."}]);var o=new s({id:n});o.fetch({success:function(e,t,n){i(e)},error:t.bind(this.currentMainView.loadingError,this.currentMainView)})}else i()},roleList:function(){this.ensureVisible("administration"),this.adminSetActive(),this.setMainView(new E({collection:this.context.roles,el:e(".mainarea",U.administration)})),this.context.roles.fetch(),this.breadcrumbs([{href:"/administration/list",title:"Administration"},{href:"/role/list",title:"Role List"}]),this.currentMainView.render(),this.context.roles.models.length==0?this.currentMainView.startLoadingFull():this.currentMainView.startLoadingInline()},roleEdit:function(n){function i(t){var i=[{href:"/administration/list",title:"Administration"},{href:"/role/list",title:"Roles"}];t?i.push({href:"/role/"+n,title:"Edit Role "+t.attributes.name}):i.push({href:"/role/create",title:"Create role"}),r.breadcrumbs(i),r.setMainView(new S({model:t,el:e(".mainarea",U.administration)}))}this.ensureVisible("administration"),this.adminSetActive("/role/list");var r=this;if(n){this.setMainView(new b({el:e(".mainarea",U.administration)})),this.breadcrumbs([{href:"/administration/list",title:"Administration"},{href:"/role/list",title:"Roles"},{href:"#",title:"Loading role "+n+"..."}]);var s=new o({id:n});s.fetch({success:function(e,t,n){i(e)},error:t.bind(this.currentMainView.loadingError,this.currentMainView)})}else i()},roleAllocationList:function(){this.ensureVisible("administration"),this.adminSetActive(),this.setMainView(new x({collection:this.context.roleallocations,el:e(".mainarea",U.administration)})),this.context.roleallocations.fetch(),this.breadcrumbs([{href:"/administration/list",title:"Administration"},{href:"/role/allocation/list",title:"Role Allocations"}]),this.currentMainView.render(),this.context.roleallocations.models.length==0?this.currentMainView.startLoadingFull():this.currentMainView.startLoadingInline()},roleAllocationAssign:function(){this.ensureVisible("administration"),this.adminSetActive("/role/allocation/list"),this.breadcrumbs([{href:"/administration/list",title:"Administration"},{href:"/role/allocation/list",title:"Role Allocations"},{href:"/role/allocation/assign",title:"Assign Role"}]),this.setMainView(new T({el:e(".mainarea",U.administration)})),this.currentMainView.render(),this.context.roles.fetch(),this.context.users.fetch(),this.context.workspaces.fetch()},adminHealthJobs:function(){this.ensureVisible("administration"),this.adminSetActive("/job/list/health"),this.breadcrumbs([{href:"/administration/list",title:"Administration"},{href:"/job/list/health",title:"Health Checks"}]),this.genericJobsListPage("/job/list/health?format=json","Health Checks")},adminPeriodicJobs:function(){this.ensureVisible("administration"),this.adminSetActive("/job/list/periodic"),this.breadcrumbs([{href:"/administration/list",title:"Administration"},{href:"/job/list/periodic",title:"Periodic Tasks"}]),this.genericJobsListPage("/job/list/periodic?format=json","Periodic Tasks")},adminRouterDump:function(){this.ensureVisible("administration"),this.adminSetActive(),this.breadcrumbs([{href:"/administration/list",title:"Administration"},{href:"/router/dump",title:"Router Dump"}]),this.genericDataTemplatePage("/router/dump?format=json",C)},adminConfigurationDump:function(){this.ensureVisible("administration"),this.adminSetActive(),this.breadcrumbs([{href:"/administration/list",title:"Administration"},{href:"/configuration/dump",title:"Configuration Dump"}]),this.genericDataTemplatePage("/configuration/dump?format=json",k)},adminPluginsDump:function(){this.ensureVisible("administration"),this.adminSetActive(),this.breadcrumbs([{href:"/administration/list",title:"Administration"},{href:"/configuration/plugins",title:"Plugins"}]),this.genericDataTemplatePage("/configuration/plugins?format=json",L)},defaultAction:function(e,t){this.ensureVisible("404")}});return W}),define("models/administration",["underscore","backbone"],function(e,t){var n=t.Model.extend({defaults:{name:"none",path:"/none",active:!1}});return n}),define("collections/administrations",["underscore","backbone","models/administration"],function(e,t,n){var r=t.Collection.extend({model:n});return r}),define("app",["jquery","underscore","backbone","context","router","collections/administrations"],function(e,t,n,r,i,s){var o={};return o.initialize=function(){r.initialize(),r.router=new i,r.router.context=r,r.router.initialize();var t=e(".brand .connected"),o=t.attr("src"),u=e(".brand .disconnected").attr("src");t.attr("src",u),r.streamSocket=new io.connect(window.location.protocol+"//"+window.location.host,{"connect timeout":1e4}),r.streamSocket.on("connect",function(){t.attr("src",o)}),r.streamSocket.on("disconnect",function(){t.attr("src",u),r.streamSocket.socket.reconnect()}),n.emulateHTTP=!0;var a=n.sync;n.sync=function(e,t,n){if(e==="create"||e==="update"){n.attrs={data:t.toJSON(n)};var r=n.success;n.success=function(e,t,i){e.errors&&e.errors.length>0?n.error&&n.error(e,t,n):r&&r(e,t,n)}}a(e,t,n)},e(".navbar .brand, .navbar .nav-collapse a.virtual").click(function(t){if(t.which!=2){var n=e(this);r.navigate(n.attr("href")),e(".nav-collapse").css("height","0px"),t.preventDefault()}else t.stopPropagation()}),r.administrations=new s,r.administrations.add([{name:"Your Profile",path:"/profile"}]),r.hasPermission("USER_LIST")&&r.administrations.add([{name:"Users",path:"/user/list"}]),r.hasPermission("ROLE_LIST")&&r.administrations.add([{name:"Roles",path:"/role/list"}]),r.hasPermission("ROLE_ASSIGN")&&r.administrations.add([{name:"Role Allocations",path:"/role/allocation/list"}]),r.hasPermission("HEALTH_CHECK")&&r.administrations.add([{name:"Health Checks",path:"/job/list/health"}]),r.hasPermission("SYSTEM_ADMINISTRATION")&&r.administrations.add([{name:"Periodic Tasks",path:"/job/list/periodic"},{name:"Router Table Dump",path:"/router/dump"},{name:"System Configuration",path:"/configuration/dump"},{name:"Plugins",path:"/configuration/plugins"}]),e(".page-loading").fadeOut(),e("#page-container").fadeIn(),n.history.start({pushState:!0})},o}),require.config({paths:{jquery:"libs/jquery/jquery",underscore:"libs/underscore/underscore",backbone:"libs/backbone/backbone","jquery.bootstrap":"libs/bootstrap/bootstrap","flot.pie":"libs/flot/flot.pie",flot:"libs/flot/flot",jsoneditor:"libs/jsoneditor/jsoneditor",moment:"libs/moment/moment",socketio:"libs/socket.io/socket.io",resumable:"libs/resumable/resumable",plugin:"/plugin"},shim:{"jquery.bootstrap":{deps:["jquery"],exports:"jquery"},flot:{deps:["jquery"],exports:"jquery"},"flot.pie":{deps:["flot"],exports:"jquery"},jsoneditor:{deps:["jquery"],exports:"jquery"},socketio:{exports:"io"}}}),require(["jquery","jquery.bootstrap","flot","flot.pie","jsoneditor","app","resumable","socketio"],function(e,t,n,r,i,s,o,u){s.initialize()}),define("main",function(){});
\ No newline at end of file
@@ -15,25 +15,50 @@ define([
 			this.startLoadingFull();
 			this.myJobs = {};
 			this.views = [];
+			this.jobs = [];
+			this.job_detail = {};
 
 			// Request the job list from the server.
+			this.fetchPage(null);
+		},
+		events: {
+			'click .older-jobs': 'olderJobs'
+		},
+		fetchPage: function(cursor) {
+			var data = {};
+			if (cursor) {
+				data.cursor = cursor;
+			}
 			$.ajax({
 				url: this.options.url,
+				data: data,
 				dataType: 'json',
 				success: _.bind(this.gotJobList, this),
 				error: _.bind(this.loadingError, this)
 			});
 		},
+		olderJobs: function(e) {
+			e.preventDefault();
+			this.startLoadingFull();
+			this.fetchPage(this.next_cursor);
+		},
 		gotJobList: function(data) {
 			this.doneLoading();
-			this.jobs = data.data.jobs;
-			this.job_detail = data.data.job_detail;
+			this.jobs = this.jobs.concat(data.data.jobs);
+			_.extend(this.job_detail, data.data.job_detail);
+			this.next_cursor = data.data.next_cursor;
 			this.render();
 		},
 		render: function() {
+			for (var i = 0; i < this.views.length; i++) {
+				this.views[i].destroy();
+			}
+			this.views = [];
+
 			this.$el.html(JobListTemplate({
 				jobs: this.jobs,
 				job_detail: this.job_detail,
+				next_cursor: this.next_cursor,
 				title: this.options.title,
 				context: context,
 				_: _
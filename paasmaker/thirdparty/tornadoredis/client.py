@@ -335,8 +335,6 @@ class Client(object):
                 {'MULTI_PART': make_reply_assert_msg('QUEUED')},
             )
 
-        self._pipeline = None
-
     def __repr__(self):
         return 'Tornadoredis client (host=%s, port=%s)' \
                 % (self.connection.host, self.connection.port)
@@ -348,14 +346,16 @@ class Client(object):
         pass
 
     def pipeline(self, transactional=False):
-        if not self._pipeline:
-            self._pipeline = Pipeline(
-                selected_db=self.selected_db,
-                io_loop=self._io_loop,
-                transactional=transactional
-            )
-            self._pipeline.connection = self.connection
-        return self._pipeline
+        # Paasmaker: return a new pipeline each time, as clients
+        # are shared, and a pipeline's transactional flag and
+        # command stack belong to whoever asked for it.
+        pipeline = Pipeline(
+            selected_db=self.selected_db,
+            io_loop=self._io_loop,
+            transactional=transactional
+        )
+        pipeline.connection = self.connection
+        return pipeline
 
     #### connection
 
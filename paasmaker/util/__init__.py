@@ -30,6 +30,12 @@ from multipaas import MultiPaas
 from flattenizr import Flattenizr
 from threadcallback import ThreadCallback
 from callbackprocesslist import CallbackProcessList
+from lrucache import LRUCache
+from histogram import Histogram
+from logindex import LogIndex, LogIndexSeek
+from compressedlog import CompressedLogFile, CompressLogThread, DecompressLogThread
+from logsearch import LogSearch
+from redispool import RedisPool
 
 import platform
 if platform.system() == 'Darwin':
@@ -12,6 +12,7 @@ import os
 import json
 import signal
 import shlex
+import gzip
 
 import paasmaker
 from paasmaker.common.controller import BaseController, BaseControllerTest
@@ -57,6 +58,12 @@ class CommandSupervisorLauncher(object):
 		payload['exit_key'] = exit_key
 		payload['port'] = port
 		payload['log_file'] = self.configuration.get_job_log_path(self.instance_id)
+		heart = self.configuration['heart']
+		payload['log_rotation'] = {
+			'segment_size': heart['instance_log_segment_size'],
+			'segment_age': heart['instance_log_segment_age'],
+			'max_size': heart['instance_log_max_size']
+		}
 		payload['pidfile'] = self._get_pid_path()
 		payload['startflagfile'] = self._get_startflag_path()
 
@@ -312,4 +319,48 @@ class CommandSupervisorTest(BaseControllerTest):
 		if os.path.exists(job_path):
 			job_contents = open(job_path, 'r').read()
 
-		self.assertIn("No such file or directory", job_contents, "Missing output.")
\ No newline at end of file
+		self.assertIn("No such file or directory", job_contents, "Missing output.")
+
+	def test_log_rotation(self):
+		self.configuration['heart']['instance_log_segment_size'] = 16384
+		self.configuration['heart']['instance_log_max_size'] = 65536
+
+		instance_id = str(uuid.uuid4())
+		exit_key = self.get_exit_key(instance_id)
+		environment = self.get_env()
+		launcher = CommandSupervisorLauncher(self.configuration, instance_id)
+		launcher.launch(
+			["seq", "1", "50000"],
+			self.get_misc_path(),
+			environment,
+			exit_key,
+			self.get_http_port()
+		)
+
+		# Wait for the subprocess to finish.
+		self.short_wait_hack(length=1.0)
+
+		self.assertTrue(launcher.has_started(), "Supervisor is not started.")
+
+		job_path = self.configuration.get_job_log_path(instance_id)
+		segments = [job_path + '.1']
+		number = 2
+		while os.path.exists("%s.%d.gz" % (job_path, number)):
+			segments.append("%s.%d.gz" % (job_path, number))
+			number += 1
+
+		# The log was rotated, the older segments compressed, and
+		# the oldest removed to keep within the budget.
+		self.assertTrue(os.path.exists(job_path + '.1'), "Log was not rotated.")
+		self.assertTrue(len(segments) > 1, "Segments were not compressed.")
+		self.assertFalse(os.path.exists(job_path + '.2'), "Segment was left uncompressed.")
+		total = sum([os.path.getsize(path) for path in segments + [job_path]])
+		self.assertTrue(total <= 65536, "Logs are over their budget.")
+
+		# Each segment starts on a new line, and the output is in order.
+		newest = open(job_path, 'r').read()
+		previous = open(job_path + '.1', 'r').read()
+		older = gzip.open(segments[-1], 'r').read()
+		self.assertIn("50000\n", previous + newest, "Missing output.")
+		self.assertTrue(previous.endswith("\n"), "Segment was split mid line.")
+		self.assertTrue(int(older.splitlines()[-1]) < int(previous.splitlines()[0]), "Segments out of order.")
\ No newline at end of file
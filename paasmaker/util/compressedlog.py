@@ -0,0 +1,433 @@
+#
+# Paasmaker - Platform as a Service
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+
+import os
+import errno
+import struct
+import zlib
+import gzip
+import bisect
+import threading
+import tempfile
+import shutil
+import unittest
+
+from threadcallback import ThreadCallback
+from lrucache import LRUCache
+
+import tornado.testing
+
+# Compressed logs are stored alongside where the log was, with this suffix.
+COMPRESSED_SUFFIX = '.gz'
+# The amount of log compressed into each block. Reading any part of a
+# compressed log means decompressing at most one block.
+BLOCK_SIZE = 262144
+
+# Compressed logs are a series of gzip members, one per block, so
+# standard tools like zcat can read them. Like BGZF, each member's
+# header has an extra field; ours records the size of the member and
+# the size of the block, so we can find any block without decompressing.
+# ID1, ID2, CM, FLG (FEXTRA), MTIME, XFL, OS, XLEN.
+GZIP_HEADER = struct.Struct('<BBBBIBBH')
+# SI1, SI2, SLEN, member size, block size.
+BLOCK_FIELD = struct.Struct('<BBHII')
+HEADER_SIZE = GZIP_HEADER.size + BLOCK_FIELD.size
+# CRC32, ISIZE.
+GZIP_TRAILER = struct.Struct('<II')
+
+# Block tables of recently read compressed logs. These are read from
+# the IO loop and from worker threads, so hold the lock to use them.
+_block_tables = LRUCache(64)
+_block_tables_lock = threading.Lock()
+
+class CompressedLogError(Exception):
+	"""
+	Raised if a compressed log is not in the expected format.
+	"""
+	pass
+
+def compressed_path(path):
+	"""
+	Get the path of the compressed version of the given log file.
+
+	:arg str path: The path to the uncompressed log file.
+	"""
+	return path + COMPRESSED_SUFFIX
+
+def log_exists(path):
+	"""
+	Check to see if the given log file exists, either
+	uncompressed or compressed.
+
+	:arg str path: The path to the uncompressed log file.
+	"""
+	return os.path.exists(path) or os.path.exists(compressed_path(path))
+
+def log_size(path):
+	"""
+	Get the size of the given log file, as it would be
+	uncompressed. Returns 0 if it doesn't exist.
+
+	:arg str path: The path to the uncompressed log file.
+	"""
+	if os.path.exists(path):
+		return os.path.getsize(path)
+	if os.path.exists(compressed_path(path)):
+		return _get_block_table(compressed_path(path))[-1][0]
+	return 0
+
+def open_log(path):
+	"""
+	Open the given log file for reading, whether it's
+	compressed or not. Compressed logs are returned as a
+	``CompressedLogFile``, which can be read, seeked, and iterated
+	over like a normal file. Raises an IOError if it doesn't exist.
+
+	:arg str path: The path to the uncompressed log file.
+	"""
+	if os.path.exists(path):
+		return open(path, 'rb')
+	if os.path.exists(compressed_path(path)):
+		return CompressedLogFile(compressed_path(path))
+	raise IOError(errno.ENOENT, "No such log file", path)
+
+def compress_log(path, block_size=BLOCK_SIZE, level=6):
+	"""
+	Compress the given log file, and then remove the uncompressed
+	file. The compressed file keeps the log's modification time.
+
+	If the log changes whilst it's being compressed, it is left
+	alone, and this returns False. Otherwise, it returns True.
+
+	This blocks until done, so don't call it on the IO loop
+	thread. See ``CompressLogThread``.
+
+	:arg str path: The path to the log file to compress.
+	:arg int block_size: The uncompressed size of each block.
+	:arg int level: The zlib compression level.
+	"""
+	before = os.stat(path)
+	target = compressed_path(path)
+	temporary = target + '.tmp'
+
+	source = open(path, 'rb')
+	output = open(temporary, 'wb')
+	try:
+		while True:
+			block = source.read(block_size)
+			if len(block) == 0:
+				break
+			output.write(_compress_block(block, level))
+	finally:
+		source.close()
+		output.close()
+
+	after = os.stat(path)
+	if after.st_size != before.st_size or after.st_mtime != before.st_mtime:
+		# Someone wrote to it. Try again later.
+		os.unlink(temporary)
+		return False
+
+	os.utime(temporary, (before.st_atime, before.st_mtime))
+	os.rename(temporary, target)
+	os.unlink(path)
+	return True
+
+def decompress_log(path):
+	"""
+	Decompress the compressed version of the given log file,
+	so it can be written to again, and then remove the compressed file.
+
+	:arg str path: The path to the uncompressed log file.
+	"""
+	source = CompressedLogFile(compressed_path(path))
+	temporary = path + '.tmp'
+	output = open(temporary, 'wb')
+	try:
+		while True:
+			data = source.read(BLOCK_SIZE)
+			if len(data) == 0:
+				break
+			output.write(data)
+	finally:
+		source.close()
+		output.close()
+
+	os.rename(temporary, path)
+	os.unlink(compressed_path(path))
+
+def _compress_block(block, level):
+	compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+	deflated = compressor.compress(block) + compressor.flush()
+	member_size = HEADER_SIZE + len(deflated) + GZIP_TRAILER.size
+	return ''.join([
+		GZIP_HEADER.pack(0x1f, 0x8b, 8, 4, 0, 0, 255, BLOCK_FIELD.size),
+		BLOCK_FIELD.pack(ord('P'), ord('M'), 8, member_size, len(block)),
+		deflated,
+		GZIP_TRAILER.pack(zlib.crc32(block) & 0xffffffff, len(block) & 0xffffffff)
+	])
+
+def _get_block_table(path):
+	# Returns a list of (uncompressed start, compressed start, member size)
+	# for each block, followed by (total size, compressed size, 0).
+	info = os.stat(path)
+	_block_tables_lock.acquire()
+	try:
+		cached = _block_tables.get(path)
+	finally:
+		_block_tables_lock.release()
+	if cached and cached[0] == (info.st_mtime, info.st_size):
+		return cached[1]
+
+	table = []
+	uncompressed = 0
+	offset = 0
+	fp = open(path, 'rb')
+	try:
+		while offset < info.st_size:
+			fp.seek(offset)
+			header = fp.read(HEADER_SIZE)
+			if len(header) < HEADER_SIZE:
+				raise CompressedLogError("Truncated block header in %s" % path)
+			id1, id2, cm, flags, mtime, xfl, os_type, xlen = GZIP_HEADER.unpack_from(header)
+			si1, si2, slen, member_size, block_size = BLOCK_FIELD.unpack_from(header, GZIP_HEADER.size)
+			if id1 != 0x1f or id2 != 0x8b or si1 != ord('P') or si2 != ord('M') or member_size < HEADER_SIZE + GZIP_TRAILER.size:
+				raise CompressedLogError("Invalid block header in %s" % path)
+			table.append((uncompressed, offset, member_size))
+			uncompressed += block_size
+			offset += member_size
+	finally:
+		fp.close()
+
+	table.append((uncompressed, offset, 0))
+	_block_tables_lock.acquire()
+	try:
+		_block_tables[path] = ((info.st_mtime, info.st_size), table)
+	finally:
+		_block_tables_lock.release()
+	return table
+
+class CompressedLogFile(object):
+	"""
+	A read only, file like view of a compressed log file. It
+	supports ``read()``, ``readline()``, ``seek()``, ``tell()``, and
+	iterating over lines, with positions as they would be in the
+	uncompressed log.
+
+	Seeking is cheap; only the block containing the position
+	is decompressed when it's read.
+
+	:arg str path: The path to the compressed log file.
+	"""
+	def __init__(self, path):
+		self.path = path
+		self.table = _get_block_table(path)
+		self.starts = [entry[0] for entry in self.table]
+		self.size = self.table[-1][0]
+		self.position = 0
+		self.fp = open(path, 'rb')
+		# The most recently decompressed block.
+		self.block_start = None
+		self.block = ''
+
+	def _load_block(self, position):
+		# Load the block containing the given position.
+		index = bisect.bisect_right(self.starts, position) - 1
+		start, offset, member_size = self.table[index]
+		if start == self.block_start:
+			return
+		self.fp.seek(offset + HEADER_SIZE)
+		deflated = self.fp.read(member_size - HEADER_SIZE - GZIP_TRAILER.size)
+		self.block = zlib.decompress(deflated, -zlib.MAX_WBITS)
+		self.block_start = start
+
+	def read(self, size=-1):
+		"""
+		Read up to size bytes, or the rest of the log if size is negative.
+		"""
+		if size < 0:
+			size = self.size - self.position
+		parts = []
+		while size > 0 and self.position < self.size:
+			self._load_block(self.position)
+			offset = self.position - self.block_start
+			part = self.block[offset:offset + size]
+			parts.append(part)
+			self.position += len(part)
+			size -= len(part)
+		return ''.join(parts)
+
+	def readline(self):
+		"""
+		Read the next line, including its newline.
+		"""
+		parts = []
+		while self.position < self.size:
+			self._load_block(self.position)
+			offset = self.position - self.block_start
+			end = self.block.find('\n', offset)
+			if end == -1:
+				part = self.block[offset:]
+			else:
+				part = self.block[offset:end + 1]
+			parts.append(part)
+			self.position += len(part)
+			if end != -1:
+				break
+		return ''.join(parts)
+
+	def __iter__(self):
+		return self
+
+	def next(self):
+		line = self.readline()
+		if len(line) == 0:
+			raise StopIteration()
+		return line
+
+	def seek(self, offset, whence=os.SEEK_SET):
+		if whence == os.SEEK_CUR:
+			offset += self.position
+		elif whence == os.SEEK_END:
+			offset += self.size
+		self.position = max(0, offset)
+
+	def tell(self):
+		return self.position
+
+	def close(self):
+		self.fp.close()
+
+class CompressLogThread(ThreadCallback):
+	"""
+	Compress a log file on another thread. The callback is called
+	with the result of ``compress_log()``.
+	"""
+	def compress(self, path, block_size=BLOCK_SIZE):
+		"""
+		Compress the given log file.
+
+		:arg str path: The path to the log file to compress.
+		:arg int block_size: The uncompressed size of each block.
+		"""
+		self.work(path, block_size=block_size)
+
+	def _work(self, path, block_size=BLOCK_SIZE):
+		self._callback(compress_log(path, block_size))
+
+class DecompressLogThread(ThreadCallback):
+	"""
+	Decompress a log file on another thread, so it can be written
+	to again. The callback is called with no arguments once done.
+	"""
+	def decompress(self, path):
+		"""
+		Decompress the given log file.
+
+		:arg str path: The path to the uncompressed log file.
+		"""
+		self.work(path)
+
+	def _work(self, path):
+		decompress_log(path)
+		self._callback()
+
+class CompressedLogTest(tornado.testing.AsyncTestCase):
+	def setUp(self):
+		super(CompressedLogTest, self).setUp()
+		self.path = tempfile.mkdtemp()
+		self.log_path = os.path.join(self.path, 'test.log')
+		self.lines = ["Log line number %d\n" % i for i in range(5000)]
+		self.contents = ''.join(self.lines)
+		fp = open(self.log_path, 'wb')
+		fp.write(self.contents)
+		fp.close()
+
+	def tearDown(self):
+		shutil.rmtree(self.path)
+		super(CompressedLogTest, self).tearDown()
+
+	def test_simple(self):
+		mtime = os.path.getmtime(self.log_path)
+		self.assertTrue(compress_log(self.log_path, 1000), "Log was not compressed.")
+
+		self.assertFalse(os.path.exists(self.log_path), "Uncompressed log still exists.")
+		self.assertTrue(log_exists(self.log_path), "Log doesn't exist.")
+		self.assertEquals(log_size(self.log_path), len(self.contents), "Wrong size.")
+		self.assertEquals(int(os.path.getmtime(compressed_path(self.log_path))), int(mtime), "Modification time changed.")
+
+		# Standard tools can read it.
+		self.assertEquals(gzip.open(compressed_path(self.log_path)).read(), self.contents)
+
+		fp = open_log(self.log_path)
+		self.assertEquals(fp.read(), self.contents, "Contents differ.")
+
+		# Seek into the middle of a block, and across blocks.
+		fp.seek(12345)
+		self.assertEquals(fp.read(3000), self.contents[12345:15345])
+		self.assertEquals(fp.tell(), 15345)
+		fp.seek(-100, os.SEEK_END)
+		self.assertEquals(fp.read(), self.contents[-100:])
+
+		# Read lines.
+		fp.seek(0)
+		self.assertEquals(list(fp), self.lines, "Lines differ.")
+		fp.close()
+
+		# And back again.
+		decompress_log(self.log_path)
+		self.assertFalse(os.path.exists(compressed_path(self.log_path)), "Compressed log still exists.")
+		self.assertEquals(open(self.log_path, 'rb').read(), self.contents, "Contents differ.")
+
+	def test_threads(self):
+		# Read several compressed logs from several threads at once,
+		# with a cache small enough that they keep evicting each other.
+		global _block_tables
+		paths = []
+		for i in range(4):
+			path = os.path.join(self.path, 'test%d.log' % i)
+			fp = open(path, 'wb')
+			fp.write(self.contents)
+			fp.close()
+			compress_log(path, 1000)
+			paths.append(path)
+
+		errors = []
+		def reader():
+			try:
+				for i in range(50):
+					for path in paths:
+						fp = open_log(path)
+						fp.seek(12345)
+						if fp.read(100) != self.contents[12345:12445]:
+							errors.append("Contents differ.")
+						fp.close()
+			except Exception, ex:
+				errors.append(ex)
+
+		original = _block_tables
+		_block_tables = LRUCache(2)
+		try:
+			threads = [threading.Thread(target=reader) for i in range(8)]
+			for thread in threads:
+				thread.start()
+			for thread in threads:
+				thread.join()
+		finally:
+			_block_tables = original
+
+		self.assertEquals(errors, [], "Reading from several threads failed.")
+
+	def _error(self, message, exception=None):
+		self.stop(exception)
+
+	def test_thread(self):
+		compressor = CompressLogThread(self.io_loop, self.stop, self._error)
+		compressor.compress(self.log_path)
+		self.assertTrue(self.wait(), "Log was not compressed.")
+		self.assertEquals(open_log(self.log_path).read(), self.contents, "Contents differ.")
@@ -0,0 +1,131 @@
+#
+# Paasmaker - Platform as a Service
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+
+import bisect
+import unittest
+
+# Bucket upper bounds, in seconds. Roughly exponential, from 10ms
+# to an hour, which covers the range of jobs that Paasmaker runs.
+DEFAULT_BUCKETS = [
+	0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+	1, 2.5, 5, 10, 25, 50,
+	100, 250, 500, 1000, 2500, 3600
+]
+
+class Histogram(object):
+	"""
+	A fixed bucket histogram of values, that uses constant memory
+	no matter how many values are added. Percentiles are estimated
+	from the buckets, so are only as accurate as the bucket bounds.
+
+	Values larger than the last bucket are counted in an overflow
+	bucket.
+
+	For example::
+
+		histogram = Histogram()
+		histogram.add(0.3)
+		histogram.add(12)
+		histogram.percentile(50) # 0.5, the upper bound of 0.3's bucket.
+
+	:arg list buckets: A sorted list of bucket upper bounds.
+	"""
+
+	def __init__(self, buckets=DEFAULT_BUCKETS):
+		self.buckets = list(buckets)
+		self.counts = [0] * (len(self.buckets) + 1)
+		self.count = 0
+		self.total = 0.0
+		self.minimum = None
+		self.maximum = None
+
+	def add(self, value):
+		"""
+		Add a value to the histogram.
+		"""
+		self.counts[bisect.bisect_left(self.buckets, value)] += 1
+		self.count += 1
+		self.total += value
+		if self.minimum is None or value < self.minimum:
+			self.minimum = value
+		if self.maximum is None or value > self.maximum:
+			self.maximum = value
+
+	def percentile(self, percent):
+		"""
+		Estimate the given percentile, as the upper bound of the
+		bucket that contains it. Returns None if there are no values.
+		Values in the overflow bucket are reported as the maximum.
+		"""
+		if self.count == 0:
+			return None
+
+		target = self.count * percent / 100.0
+		seen = 0
+		for index, count in enumerate(self.counts):
+			seen += count
+			if seen >= target and count > 0:
+				if index < len(self.buckets):
+					return min(self.buckets[index], self.maximum)
+				return self.maximum
+
+		return self.maximum
+
+	def flatten(self):
+		"""
+		Return a dict describing the histogram, suitable
+		for encoding as JSON.
+		"""
+		buckets = []
+		for index, count in enumerate(self.counts):
+			if count > 0:
+				if index < len(self.buckets):
+					buckets.append([self.buckets[index], count])
+				else:
+					buckets.append(['+inf', count])
+
+		mean = None
+		if self.count > 0:
+			mean = self.total / self.count
+
+		return {
+			'count': self.count,
+			'sum': self.total,
+			'min': self.minimum,
+			'max': self.maximum,
+			'mean': mean,
+			'p50': self.percentile(50),
+			'p90': self.percentile(90),
+			'p99': self.percentile(99),
+			'buckets': buckets
+		}
+
+class HistogramTest(unittest.TestCase):
+	def test_simple(self):
+		histogram = Histogram([1, 10, 100])
+
+		self.assertEquals(histogram.percentile(50), None, "Empty histogram returned a percentile.")
+
+		for value in [0.5, 0.5, 5, 50, 500]:
+			histogram.add(value)
+
+		self.assertEquals(histogram.count, 5, "Values were not counted.")
+		self.assertEquals(histogram.minimum, 0.5, "Wrong minimum.")
+		self.assertEquals(histogram.maximum, 500, "Wrong maximum.")
+		self.assertEquals(histogram.percentile(40), 1, "Wrong percentile.")
+		self.assertEquals(histogram.percentile(50), 10, "Wrong percentile.")
+		self.assertEquals(histogram.percentile(99), 500, "Overflow not reported as the maximum.")
+
+		flat = histogram.flatten()
+		self.assertEquals(flat['buckets'], [[1, 2], [10, 1], [100, 1], ['+inf', 1]], "Wrong buckets.")
+		self.assertEquals(flat['mean'], 556.0 / 5, "Wrong mean.")
+
+		# Values on a bucket bound go into that bucket.
+		histogram = Histogram([1, 10])
+		histogram.add(1)
+		self.assertEquals(histogram.flatten()['buckets'], [[1, 1]], "Bound value in the wrong bucket.")
@@ -11,12 +11,21 @@ import logging
 import paasmaker
 import os
 import uuid
+import collections
 import json
 import time
-
+import sys
+import errno
+import shutil
+import struct
+import ctypes
+import ctypes.util
+
+import tornado.ioloop
 import tornado.testing
 
 from paasmaker.common.core import constants
+from logindex import LogIndex
 
 from pubsub import pub
 
@@ -25,13 +34,34 @@ logger.addHandler(logging.NullHandler())
 
 JOB_LOG_FORMAT = '%(asctime)s %(levelname)s %(message)s'
 
+# The size of the write buffer for each open job log file.
+JOB_LOG_BUFFER_SIZE = 65536
+# How often to retry watching a log directory that was removed
+# and couldn't be watched again, in seconds.
+INOTIFY_REWATCH_INTERVAL = 5
+
 class JobLoggingFileHandler(logging.Handler):
 	"""
 	A log handler to write job logs to seperate files based
 	on the job ID.
 
-	This class basically sorts the incoming log entries
-	to write them to the appropriate JobLoggerAdapter.
+	The log files are kept open in a pool, which is limited to
+	the ``max_open_files`` setting in the ``job_logs`` section of
+	the configuration. When the pool is full, the least recently
+	written file is closed to make room; it is reopened if
+	the job logs again.
+
+	Writes are buffered, and flushed ``flush_interval``
+	milliseconds after the first unflushed write, so a job that
+	logs heavily costs a few system calls per interval rather than
+	one per log entry. Files are always flushed when closed.
+
+	The line index of each log (see ``LogIndex``) is updated as
+	the log grows, once every ``index_interval`` bytes.
+
+	If a job logs again after it's log was compressed, the log is
+	decompressed on another thread first, and the entries are held
+	until that's done.
 
 	:arg Configuration configuration: The configuration
 		object to use to get settings.
@@ -39,7 +69,19 @@ class JobLoggingFileHandler(logging.Handler):
 	def __init__(self, configuration):
 		logger.debug("Setting up JobLoggingFileHandler.")
 		self.configuration = configuration
-		self.handlers = {}
+		self.max_open_files = configuration['job_logs']['max_open_files']
+		self.flush_interval = configuration['job_logs']['flush_interval']
+		self.index_interval = configuration['job_logs']['index_interval']
+		self.io_loop = configuration.io_loop or tornado.ioloop.IOLoop.instance()
+		# Job ID -> open file, least recently used first.
+		self.files = collections.OrderedDict()
+		# Job IDs with unflushed writes.
+		self.dirty = set()
+		# Job ID -> bytes written since the log's index was updated.
+		self.unindexed = {}
+		# Job ID -> entries held whilst it's log is decompressed.
+		self.decompressing = {}
+		self.flush_scheduled = False
 		logging.Handler.__init__(self)
 		self.formatter = logging.Formatter(JOB_LOG_FORMAT)
 
@@ -47,6 +89,8 @@ class JobLoggingFileHandler(logging.Handler):
 		pub.subscribe(self._job_status_change, 'job.status')
 		# And a close if we want to free the FD's for another purpose.
 		pub.subscribe(self._job_file_close, 'job.close')
+		# And a flush if someone wants to read the file right now.
+		pub.subscribe(self._job_file_flush, 'job.flush')
 
 		logger.debug("Completed __init__ of JobLoggingFileHandler.")
 
@@ -54,49 +98,188 @@ class JobLoggingFileHandler(logging.Handler):
 		"""
 		Overridden ``emit()`` function. If the incoming
 		record has a job ID, it is written to the appropriate
-		handler. Otherwise, the record is dropped.
+		file. Otherwise, the record is dropped.
 		"""
 		# This handler only logs if there is a job id.
 		if record.__dict__.has_key('job'):
 			job_id = record.job
-			# Find a handler, and get that one to emit the record.
-			handler = self.get_handler(job_id)
-			handler.emit(record)
+			try:
+				message = self.format(record)
+				if isinstance(message, unicode):
+					message = message.encode('utf-8')
+				if self.decompressing.has_key(job_id):
+					self.decompressing[job_id].append(message)
+				elif not self.files.has_key(job_id) and self._is_compressed(job_id):
+					self.decompressing[job_id] = [message]
+					self.io_loop.add_callback(lambda: self._decompress(job_id))
+				else:
+					self._write(job_id, message)
+			except (KeyboardInterrupt, SystemExit):
+				raise
+			except:
+				self.handleError(record)
+
+	def _write(self, job_id, message):
+		self.get_file(job_id).write(message + "\n")
+		self.unindexed[job_id] = self.unindexed.get(job_id, 0) + len(message) + 1
+		self._mark_dirty(job_id)
+
+	def _is_compressed(self, job_id):
+		path = self.configuration.get_job_log_path(job_id, create_if_missing=False)
+		return not os.path.exists(path) and os.path.exists(paasmaker.util.compressedlog.compressed_path(path))
+
+	def _decompress(self, job_id):
+		# Decompress the log, then write out what was logged meanwhile.
+		path = self.configuration.get_job_log_path(job_id, create_if_missing=False)
+
+		def decompressed():
+			self.acquire()
+			try:
+				for message in self.decompressing.pop(job_id, []):
+					self._write(job_id, message)
+			finally:
+				self.release()
+
+		def failed(message, exception=None):
+			logger.error("Unable to decompress the log for job %s, new entries will be logged without it: %s", job_id, message)
+			if exception:
+				logger.error("Exception:", exc_info=exception)
+			decompressed()
+
+		decompressor = paasmaker.util.compressedlog.DecompressLogThread(
+			self.io_loop,
+			decompressed,
+			failed
+		)
+		decompressor.decompress(path)
 
-	def get_handler(self, job_id):
+	def get_file(self, job_id):
 		"""
-		For the given job ID, find a handler that can write it
-		to file. Creates a new handler if required.
+		For the given job ID, find an open file that log entries
+		can be written to. Opens the file if required, closing
+		the least recently used file if the pool is full.
 
-		:arg str job_id: The job ID to fetch the handler for.
+		:arg str job_id: The job ID to fetch the file for.
 		"""
-		if self.handlers.has_key(job_id):
-			return self.handlers[job_id]
-		else:
-			handler = logging.FileHandler(self.configuration.get_job_log_path(job_id))
-			handler.setFormatter(self.formatter)
-			self.handlers[job_id] = handler
-			return handler
+		if self.files.has_key(job_id):
+			# Move it to the most recently used end.
+			fp = self.files.pop(job_id)
+			self.files[job_id] = fp
+			return fp
+
+		if self.max_open_files > 0:
+			while len(self.files) >= self.max_open_files:
+				oldest_id, oldest_fp = self.files.popitem(last=False)
+				logger.debug("Closing log file for job %s to make room in the pool.", oldest_id)
+				self._close_file(oldest_id, oldest_fp)
+
+		fp = open(self.configuration.get_job_log_path(job_id), 'ab', JOB_LOG_BUFFER_SIZE)
+		self.files[job_id] = fp
+		return fp
 
 	def has_handler(self, job_id):
 		"""
-		Determine if we have a handler for the given job ID.
+		Determine if we have an open file for the given job ID.
 		Designed for unit testing.
 
 		:arg str job_id: The job ID to check for.
 		"""
-		return self.handlers.has_key(job_id)
+		return self.files.has_key(job_id)
 
 	def close_handler(self, job_id):
 		"""
-		Explicitely close a job log handler, typically so it
+		Explicitely close a job log file, typically so it
 		can be taken over by another process for writing.
 		Or, because the job has finished, in which case it
 		saves memory.
 		"""
-		if self.handlers.has_key(job_id):
-			self.handlers[job_id].close()
-			del self.handlers[job_id]
+		self.acquire()
+		try:
+			if self.files.has_key(job_id):
+				self._close_file(job_id, self.files.pop(job_id))
+			if self.unindexed.has_key(job_id):
+				del self.unindexed[job_id]
+		finally:
+			self.release()
+
+	def flush_job(self, job_id):
+		"""
+		Flush any buffered log entries for the given job ID
+		to disk.
+
+		:arg str job_id: The job ID to flush.
+		"""
+		self.acquire()
+		try:
+			if job_id in self.dirty:
+				self.dirty.remove(job_id)
+				self.files[job_id].flush()
+				self._update_index(job_id)
+		finally:
+			self.release()
+
+	def flush(self):
+		"""
+		Flush all buffered log entries to disk.
+		"""
+		self.acquire()
+		try:
+			for job_id in self.dirty:
+				self.files[job_id].flush()
+				self._update_index(job_id)
+			self.dirty.clear()
+		finally:
+			self.release()
+
+	def close(self):
+		"""
+		Close all the open log files.
+		"""
+		self.acquire()
+		try:
+			while len(self.files) > 0:
+				job_id, fp = self.files.popitem()
+				self._close_file(job_id, fp)
+		finally:
+			self.release()
+		logging.Handler.close(self)
+
+	def _close_file(self, job_id, fp):
+		fp.close()
+		self.dirty.discard(job_id)
+		self._update_index(job_id)
+
+	def _update_index(self, job_id):
+		# Index the new part of the log, once there's enough of it.
+		# It's likely still in the page cache, so this is cheap. Logs
+		# without an index yet are left for LogIndexSeek to index in
+		# full on another thread, when someone seeks in them. If the index
+		# is being updated elsewhere right now, the next update catches up.
+		if self.unindexed.get(job_id, 0) >= self.index_interval:
+			self.unindexed[job_id] = 0
+			index = LogIndex(self.configuration.get_job_log_path(job_id, create_if_missing=False), self.index_interval)
+			index.update(existing_only=True, blocking=False)
+
+	def _mark_dirty(self, job_id):
+		self.dirty.add(job_id)
+		if self.flush_interval <= 0:
+			self.flush()
+		elif not self.flush_scheduled:
+			self.flush_scheduled = True
+			# Log entries can come from other threads, and add_callback()
+			# is the only IO loop function that is safe to call from them.
+			self.io_loop.add_callback(self._schedule_flush)
+
+	def _schedule_flush(self):
+		self.io_loop.add_timeout(time.time() + self.flush_interval / 1000.0, self._scheduled_flush)
+
+	def _scheduled_flush(self):
+		self.acquire()
+		try:
+			self.flush_scheduled = False
+			self.flush()
+		finally:
+			self.release()
 
 	def _job_status_change(self, message):
 		logger.debug(
@@ -114,20 +297,51 @@ class JobLoggingFileHandler(logging.Handler):
 		# Close the handler for that job - freeing up the file.
 		self.close_handler(job_id)
 
-# TODO: This doesn't seem like the best idea from the outset.
-# However... inotify will notify us as soon as the file changes.
-# And if there is a lot of log output, it would make sense to batch
-# it up in 200ms batches. I'm open to suggestions here.
-class JobWatcher(object):
+	def _job_file_flush(self, job_id):
+		self.flush_job(job_id)
+
+# Constants and structures for the Linux inotify API, which we call
+# directly via ctypes. See inotify(7) for the details.
+IN_MODIFY = 0x00000002
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 02000000
+# struct inotify_event { int wd; uint32_t mask; uint32_t cookie; uint32_t len; char name[]; }
+INOTIFY_EVENT = struct.Struct('iIII')
+
+def _load_inotify():
+	"""
+	Load the inotify functions from the C library, returning
+	None if inotify is not available on this platform.
 	"""
-	Watch a job log file, publishing a message when the contents
-	of the file changes.
+	if not sys.platform.startswith('linux'):
+		return None
+	try:
+		libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+		libc.inotify_init1.argtypes = [ctypes.c_int]
+		libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+		libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+		return libc
+	except (OSError, AttributeError):
+		return None
+
+_inotify = _load_inotify()
+
+def _inotify_error():
+	code = ctypes.get_errno()
+	return OSError(code, os.strerror(code))
 
-	This is a poor-mans inotify handler. See the source code
-	for the justification for this purpose at this time.
+class JobWatcher(object):
+	"""
+	Watch job log files, publishing a message when the contents
+	of a file changes.
 
-	Internally, it works by checking to see if the log file
-	has changed size every 200ms, and publishing an event if it has.
+	This is the base class, which keeps reference counts for the
+	watched jobs. Subclasses do the actual watching. Use ``create()``
+	to get the best watcher for this platform.
 
 	:arg Configuration configuration: The configuration object to
 		fetch settings from.
@@ -135,13 +349,23 @@ class JobWatcher(object):
 	def __init__(self, configuration):
 		self.configuration = configuration
 		self.watches = {}
-		# TODO: Allow this interval to be adjusted?
-		self.periodic = tornado.ioloop.PeriodicCallback(
-			self._check_log_files,
-			200,
-			io_loop=configuration.io_loop
-		)
-		self.active = False
+
+	@classmethod
+	def create(cls, configuration):
+		"""
+		Create a job watcher. On Linux, this uses inotify, so
+		changes are published as soon as they are written and
+		nothing is done whilst the files are idle. Otherwise, or if
+		inotify can't be set up, this falls back to polling.
+
+		:arg Configuration configuration: The configuration object.
+		"""
+		if _inotify:
+			try:
+				return InotifyJobWatcher(configuration)
+			except OSError, ex:
+				logger.warning("Unable to set up inotify, falling back to polling job logs: %s", str(ex))
+		return PollingJobWatcher(configuration)
 
 	def add_watch(self, job_id):
 		"""
@@ -158,19 +382,12 @@ class JobWatcher(object):
 			)
 		else:
 			filename = self.configuration.get_job_log_path(job_id, create_if_missing=False)
-			size = 0
-			if os.path.exists(filename):
-				size = os.path.getsize(filename)
 			self.watches[job_id] = {
-				'size': size,
 				'filename': filename,
 				'ref': 1
 			}
 			logger.debug("Adding watch on file %s for job %s", filename, job_id)
-			if not self.active:
-				logger.debug("Watch for job %s means we're starting the timer.", job_id)
-				self.periodic.start()
-				self.active = True
+			self._start_watch(job_id, self.watches[job_id])
 
 	def remove_watch(self, job_id):
 		"""
@@ -178,7 +395,6 @@ class JobWatcher(object):
 
 		:arg str job_id: The job ID to stop watching.
 		"""
-		filename = self.configuration.get_job_log_path(job_id)
 		if self.watches.has_key(job_id):
 			self.watches[job_id]['ref'] -= 1
 			logger.debug(
@@ -187,12 +403,10 @@ class JobWatcher(object):
 				self.watches[job_id]['ref']
 			)
 			if self.watches[job_id]['ref'] < 1:
-				logger.debug("Removing watch of %s for job %s", filename, job_id)
+				meta = self.watches[job_id]
+				logger.debug("Removing watch of %s for job %s", meta['filename'], job_id)
 				del self.watches[job_id]
-				if len(self.watches.keys()) == 0:
-					logger.debug("No more watches, so stopping the loop for the moment.")
-					self.periodic.stop()
-					self.active = False
+				self._stop_watch(job_id, meta)
 
 	def trigger_watch(self, job_id):
 		"""
@@ -207,16 +421,225 @@ class JobWatcher(object):
 		topic = self.configuration.get_job_message_pub_topic(job_id)
 		pub.sendMessage(topic, job_id=job_id)
 
+	def close(self):
+		"""
+		Stop watching all files, and release any resources
+		held by this watcher.
+		"""
+		watches = self.watches
+		self.watches = {}
+		for job_id, meta in watches.iteritems():
+			self._stop_watch(job_id, meta)
+
+	def _start_watch(self, job_id, meta):
+		raise NotImplementedError("You must implement _start_watch().")
+
+	def _stop_watch(self, job_id, meta):
+		raise NotImplementedError("You must implement _stop_watch().")
+
+class PollingJobWatcher(JobWatcher):
+	"""
+	A job watcher that works by checking to see if the watched
+	log files have changed size every 200ms, and publishing
+	an event if they have.
+
+	This is used where inotify is not available.
+	"""
+	def __init__(self, configuration):
+		super(PollingJobWatcher, self).__init__(configuration)
+		# TODO: Allow this interval to be adjusted?
+		self.periodic = tornado.ioloop.PeriodicCallback(
+			self._check_log_files,
+			200,
+			io_loop=configuration.io_loop
+		)
+		self.active = False
+
+	def _start_watch(self, job_id, meta):
+		meta['size'] = 0
+		if os.path.exists(meta['filename']):
+			meta['size'] = os.path.getsize(meta['filename'])
+		if not self.active:
+			logger.debug("Watch for job %s means we're starting the timer.", job_id)
+			self.periodic.start()
+			self.active = True
+
+	def _stop_watch(self, job_id, meta):
+		if len(self.watches.keys()) == 0 and self.active:
+			logger.debug("No more watches, so stopping the loop for the moment.")
+			self.periodic.stop()
+			self.active = False
+
 	def _check_log_files(self):
-		for job_id, meta in self.watches.iteritems():
+		for job_id, meta in self.watches.items():
 			size = 0
 			if os.path.exists(meta['filename']):
 				size = os.path.getsize(meta['filename'])
 			#logger.debug("Checking file %s (old %d, new %d)", meta['filename'], meta['size'], size)
 			if meta['size'] != size:
-				self.watches[job_id]['size'] = size
+				meta['size'] = size
 				self.trigger_watch(job_id)
 
+class InotifyJobWatcher(JobWatcher):
+	"""
+	A job watcher that uses Linux's inotify to be told when
+	the watched log files change, via the IO loop.
+
+	Rather than watching each file, this watches the directories
+	that contain them. Job log files are sorted into directories
+	by the first two characters of the job ID, so this needs at most
+	a few hundred inotify watches no matter how many jobs are watched,
+	and it also picks up log files that don't exist yet.
+
+	All the events available at once are coalesced, so each job is
+	notified once, even if many lines were written to it's log.
+
+	If a watched directory is removed, it's created and watched
+	again, as it is when a job is first watched. If that fails, it's
+	retried every ``INOTIFY_REWATCH_INTERVAL`` seconds.
+
+	Raises an OSError if inotify can't be set up.
+	"""
+	WATCH_MASK = IN_MODIFY | IN_CREATE | IN_MOVED_TO
+
+	def __init__(self, configuration):
+		super(InotifyJobWatcher, self).__init__(configuration)
+		self.io_loop = configuration.io_loop or tornado.ioloop.IOLoop.instance()
+		# Watch descriptor -> {'path': directory, 'files': {filename: job_id}}
+		self.directories = {}
+		# Directory -> watch descriptor.
+		self.directory_watches = {}
+
+		self.fd = _inotify.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+		if self.fd < 0:
+			raise _inotify_error()
+		self.io_loop.add_handler(self.fd, self._handle_events, self.io_loop.READ)
+
+	def _start_watch(self, job_id, meta):
+		directory, name = os.path.split(meta['filename'])
+		# The directory has to exist to watch it. The log file
+		# will be created in it later.
+		if not os.path.exists(directory):
+			try:
+				os.makedirs(directory)
+			except OSError, ex:
+				if ex.errno != errno.EEXIST:
+					raise ex
+
+		if not self.directory_watches.has_key(directory):
+			wd = _inotify.inotify_add_watch(self.fd, directory, self.WATCH_MASK)
+			if wd < 0:
+				raise _inotify_error()
+			self.directory_watches[directory] = wd
+			self.directories[wd] = {'path': directory, 'files': {}}
+
+		wd = self.directory_watches[directory]
+		self.directories[wd]['files'][name] = job_id
+		meta['wd'] = wd
+
+	def _stop_watch(self, job_id, meta):
+		wd = meta['wd']
+		if self.directories.has_key(wd):
+			files = self.directories[wd]['files']
+			name = os.path.basename(meta['filename'])
+			if files.has_key(name):
+				del files[name]
+			if len(files) == 0:
+				# No more jobs in this directory, so stop watching it.
+				_inotify.inotify_rm_watch(self.fd, wd)
+				self._forget_directory(wd)
+
+	def _forget_directory(self, wd):
+		del self.directory_watches[self.directories[wd]['path']]
+		del self.directories[wd]
+
+	def _handle_events(self, fd, events):
+		changed = set()
+		while True:
+			try:
+				buf = os.read(self.fd, 65536)
+			except OSError, ex:
+				if ex.errno == errno.EINTR:
+					continue
+				if ex.errno == errno.EAGAIN:
+					break
+				raise ex
+
+			offset = 0
+			while offset + INOTIFY_EVENT.size <= len(buf):
+				wd, mask, cookie, length = INOTIFY_EVENT.unpack_from(buf, offset)
+				offset += INOTIFY_EVENT.size
+				name = buf[offset:offset + length].rstrip('\0')
+				offset += length
+
+				if mask & IN_Q_OVERFLOW:
+					# Events were lost, so assume everything changed.
+					logger.warning("inotify event queue overflowed; notifying all watched jobs.")
+					changed.update(self.watches.keys())
+				elif mask & IN_IGNORED:
+					# The watch was removed, either by us or because
+					# the directory was deleted. We forget directories
+					# before removing their watch, so if we still know
+					# about it, it was deleted whilst jobs were watched.
+					if self.directories.has_key(wd):
+						job_ids = self.directories[wd]['files'].values()
+						logger.warning(
+							"Directory %s was removed whilst %d jobs were watched in it. Watching it again.",
+							self.directories[wd]['path'],
+							len(job_ids)
+						)
+						self._forget_directory(wd)
+						self._rewatch(job_ids)
+						# Their logs are gone, so tell the subscribers.
+						changed.update(job_ids)
+				elif self.directories.has_key(wd):
+					job_id = self.directories[wd]['files'].get(name)
+					if job_id:
+						changed.add(job_id)
+
+		for job_id in changed:
+			# The watch may have been removed by an earlier subscriber.
+			if self.watches.has_key(job_id):
+				self.trigger_watch(job_id)
+
+	def _rewatch(self, job_ids):
+		if self.fd is None:
+			# We've been closed.
+			return
+
+		failed = []
+		for job_id in job_ids:
+			# The job may have stopped being watched since.
+			if self.watches.has_key(job_id):
+				try:
+					self._start_watch(job_id, self.watches[job_id])
+				except OSError, ex:
+					failed.append(job_id)
+					error = ex
+
+		if len(failed) > 0:
+			logger.warning(
+				"Unable to watch the log directory of %d jobs again, retrying in %d seconds: %s",
+				len(failed),
+				INOTIFY_REWATCH_INTERVAL,
+				str(error)
+			)
+			self.io_loop.add_timeout(
+				time.time() + INOTIFY_REWATCH_INTERVAL,
+				lambda: self._rewatch(failed)
+			)
+
+	def close(self):
+		super(InotifyJobWatcher, self).close()
+		if self.fd is not None:
+			self.io_loop.remove_handler(self.fd)
+			try:
+				os.close(self.fd)
+			except OSError, ex:
+				# It may already have been closed along with the IO loop.
+				pass
+			self.fd = None
+
 class JobLoggerAdapter(logging.LoggerAdapter):
 	"""
 	A job logging adapter that encapsulates the extra
@@ -244,6 +667,8 @@ class JobLoggerAdapter(logging.LoggerAdapter):
 		"""
 		Mark this job as complete.
 		"""
+		# Make sure everything logged so far is on disk.
+		pub.sendMessage('job.flush', job_id=self.job_id)
 		if self.watcher:
 			# Trigger a file watch.
 			self.watcher.trigger_watch(self.job_id)
@@ -344,6 +769,9 @@ class JobLoggingTest(tornado.testing.AsyncTestCase):
 		job2logger = self.configuration.get_job_logger(id2)
 		job2logger.debug('Test 2')
 
+		# Write out the buffered entries.
+		self.handler.flush()
+
 		job1path = self.configuration.get_job_log_path(id1)
 		job2path = self.configuration.get_job_log_path(id2)
 
@@ -368,9 +796,20 @@ class JobLoggingTest(tornado.testing.AsyncTestCase):
 		self.stop(job_id)
 
 	def test_watcher(self):
+		watcher = self.configuration.get_job_watcher()
+		if _inotify:
+			self.assertTrue(isinstance(watcher, InotifyJobWatcher), "Not using inotify when it's available.")
+		self._test_watcher(watcher)
+
+	def test_polling_watcher(self):
+		watcher = PollingJobWatcher(self.configuration)
+		self._test_watcher(watcher)
+		watcher.close()
+		self.assertFalse(watcher.active, "Polling timer was not stopped.")
+
+	def _test_watcher(self, watcher):
 		pub.subscribe(self.on_job_watch_update, 'job.message')
 
-		watcher = self.configuration.get_job_watcher()
 		id1 = str(uuid.uuid4())
 		job1logger = self.configuration.get_job_logger(id1)
 		job1logger.debug('Test')
@@ -397,8 +836,7 @@ class JobLoggingTest(tornado.testing.AsyncTestCase):
 
 		# Now stop watching again.
 		watcher.remove_watch(id1)
-
-		# TODO: Check that we're not watching anymore properly...
+		self.assertEquals(len(watcher.watches), 0, "Still watching the job.")
 
 		# Start watching again, which causes the timer to start again.
 		watcher.add_watch(id1)
@@ -416,7 +854,44 @@ class JobLoggingTest(tornado.testing.AsyncTestCase):
 		watcher.add_watch(id2)
 		self.io_loop.add_timeout(time.time() + 0.5, self.stop)
 		self.wait()
+
+		# Once the file is written to, it should be noticed.
+		watcher.remove_watch(id1)
+		job2logger = self.configuration.get_job_logger(id2)
+		job2logger.debug('Now it exists')
+		return_id = self.wait()
+		self.assertEquals(return_id, id2, "Another job id returned... ?")
+
 		watcher.remove_watch(id2)
+		pub.unsubscribe(self.on_job_watch_update, 'job.message')
+
+	def test_watcher_directory_removed(self):
+		watcher = self.configuration.get_job_watcher()
+		if not isinstance(watcher, InotifyJobWatcher):
+			# Only inotify watches directories.
+			return
+
+		pub.subscribe(self.on_job_watch_update, 'job.message')
+
+		job_id = str(uuid.uuid4())
+		watcher.add_watch(job_id)
+		directory = os.path.dirname(watcher.watches[job_id]['filename'])
+
+		# Remove the directory out from under the watcher.
+		shutil.rmtree(directory)
+		return_id = self.wait()
+		self.assertEquals(return_id, job_id, "Job was not notified that it's log was removed.")
+		self.assertTrue(watcher.directory_watches.has_key(directory), "Directory is not watched again.")
+
+		# Changes to the recreated directory are still noticed.
+		job_logger = self.configuration.get_job_logger(job_id)
+		job_logger.debug('After the directory was removed')
+		pub.sendMessage('job.flush', job_id=job_id)
+		return_id = self.wait()
+		self.assertEquals(return_id, job_id, "Another job id returned... ?")
+
+		watcher.remove_watch(job_id)
+		pub.unsubscribe(self.on_job_watch_update, 'job.message')
 
 	def test_takeover(self):
 		# This test makes sure that we can take over a FP, and it closes everything cleanly.
@@ -427,6 +902,7 @@ class JobLoggingTest(tornado.testing.AsyncTestCase):
 
 		joblogger = self.configuration.get_job_logger(job_id)
 		joblogger.debug('Test')
+		self.handler.flush()
 
 		contents = open(log_file, 'r').read()
 		self.assertIn('Test', contents)
@@ -448,6 +924,7 @@ class JobLoggingTest(tornado.testing.AsyncTestCase):
 
 		self.assertTrue(self.handler.has_handler(job_id), "Doesn't have a handler for this job ID.")
 
+		self.handler.flush()
 		contents = open(log_file, 'r').read()
 		self.assertIn('Test 2', contents)
 
@@ -460,6 +937,7 @@ class JobLoggingTest(tornado.testing.AsyncTestCase):
 
 		joblogger = self.configuration.get_job_logger(job_id)
 		joblogger.debug('Test')
+		self.handler.flush()
 
 		contents = open(log_file, 'r').read()
 		self.assertIn('Test', contents)
@@ -474,8 +952,68 @@ class JobLoggingTest(tornado.testing.AsyncTestCase):
 		joblogger.debug('Test 2')
 		self.assertTrue(self.handler.has_handler(job_id), "Doesn't have a handler for this job ID.")
 
+		self.handler.flush()
 		contents = open(log_file, 'r').read()
 		self.assertIn('Test 2', contents)
 
 		# Close it differently.
-		JobLoggerAdapter.finished_job(job_id)
\ No newline at end of file
+		JobLoggerAdapter.finished_job(job_id)
+	def test_file_pool(self):
+		# Limit the pool, and log to more jobs than fit in it.
+		self.handler.max_open_files = 2
+		job_ids = [str(uuid.uuid4()) for i in range(3)]
+		for job_id in job_ids:
+			self.configuration.get_job_logger(job_id).debug('First %s' % job_id)
+
+		self.assertFalse(self.handler.has_handler(job_ids[0]), "Oldest file was not closed.")
+		self.assertTrue(self.handler.has_handler(job_ids[1]), "File was closed.")
+		self.assertTrue(self.handler.has_handler(job_ids[2]), "File was closed.")
+
+		# Logging to the second job makes the third job the oldest.
+		self.configuration.get_job_logger(job_ids[1]).debug('Second')
+		self.configuration.get_job_logger(job_ids[0]).debug('Second')
+		self.assertTrue(self.handler.has_handler(job_ids[0]), "File was not reopened.")
+		self.assertTrue(self.handler.has_handler(job_ids[1]), "Recently used file was closed.")
+		self.assertFalse(self.handler.has_handler(job_ids[2]), "Least recently used file was not closed.")
+
+		# Entries are buffered until the flush interval passes.
+		log_file = self.configuration.get_job_log_path(job_ids[1])
+		self.assertNotIn('Second', open(log_file, 'r').read(), "Entry was not buffered.")
+
+		self.io_loop.add_timeout(time.time() + (self.handler.flush_interval * 2) / 1000.0, self.stop)
+		self.wait()
+
+		contents = open(log_file, 'r').read()
+		self.assertIn('First %s' % job_ids[1], contents)
+		self.assertIn('Second', contents)
+
+		# Closed files had their entries written out.
+		contents = open(self.configuration.get_job_log_path(job_ids[0]), 'r').read()
+		self.assertIn('First %s' % job_ids[0], contents)
+		self.assertIn('Second', contents)
+
+	def test_compressed_log(self):
+		# Reading a compressed log leaves it compressed.
+		job_id = str(uuid.uuid4())
+		joblogger = self.configuration.get_job_logger(job_id)
+		joblogger.debug('Before compression')
+		joblogger.finished()
+		log_file = self.configuration.get_job_log_path(job_id, create_if_missing=False)
+		paasmaker.util.compressedlog.compress_log(log_file)
+
+		self.assertEquals(self.configuration.get_job_log_path(job_id), log_file, "Wrong path.")
+		self.assertFalse(os.path.exists(log_file), "Log was decompressed by looking it up.")
+
+		# Logging to it again decompresses it on another thread first,
+		# and nothing logged meanwhile is lost.
+		joblogger.debug('After compression')
+		self.assertFalse(os.path.exists(log_file), "Log was decompressed straight away.")
+		joblogger.debug('And again')
+		self.io_loop.add_timeout(time.time() + 0.5, self.stop)
+		self.wait()
+		self.handler.flush()
+
+		self.assertFalse(os.path.exists(paasmaker.util.compressedlog.compressed_path(log_file)), "Compressed log still exists.")
+		contents = open(log_file, 'r').read()
+		self.assertIn('Before compression', contents)
+		self.assertTrue(contents.find('After compression') < contents.find('And again'), "Entries were out of order.")
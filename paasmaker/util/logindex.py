@@ -0,0 +1,423 @@
+#
+# Paasmaker - Platform as a Service
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+
+import os
+import re
+import time
+import struct
+import tempfile
+import shutil
+import threading
+import unittest
+
+from threadcallback import ThreadCallback
+from compressedlog import log_exists, log_size, open_log
+
+import tornado.testing
+
+# Index entries are written roughly this many bytes apart in the log.
+DEFAULT_INTERVAL = 65536
+# The index for a log file is stored alongside it, with this suffix.
+INDEX_SUFFIX = '.idx'
+# Each entry is the line number, byte offset, and time of a line.
+INDEX_ENTRY = struct.Struct('!QQd')
+
+# Job log lines start with a timestamp like "2013-04-01 12:30:01,123".
+LOG_TIME_RE = re.compile(r'^(\d{4}-\d\d-\d\d \d\d:\d\d:\d\d),(\d{3}) ')
+
+# Serialises updates to each index, which can come from both the
+# IO loop thread and seek threads. Index path -> [lock, users].
+_update_locks = {}
+_update_locks_lock = threading.Lock()
+
+def _acquire_update_lock(index_path, blocking=True):
+	# Returns False if the lock is held and blocking is false.
+	_update_locks_lock.acquire()
+	try:
+		entry = _update_locks.setdefault(index_path, [threading.Lock(), 0])
+		entry[1] += 1
+	finally:
+		_update_locks_lock.release()
+
+	if entry[0].acquire(blocking):
+		return True
+
+	_forget_update_lock(index_path)
+	return False
+
+def _release_update_lock(index_path):
+	_update_locks[index_path][0].release()
+	_forget_update_lock(index_path)
+
+def _forget_update_lock(index_path):
+	_update_locks_lock.acquire()
+	try:
+		entry = _update_locks[index_path]
+		entry[1] -= 1
+		if entry[1] == 0:
+			del _update_locks[index_path]
+	finally:
+		_update_locks_lock.release()
+
+def parse_log_time(line):
+	"""
+	Parse the time from the start of a job log line, returning it
+	as a unix timestamp, or None if the line doesn't start with a time.
+	Times are assumed to be in local time, as that's what the job
+	logger writes.
+
+	:arg str line: The log line.
+	"""
+	match = LOG_TIME_RE.match(line)
+	if not match:
+		return None
+	try:
+		parsed = time.strptime(match.group(1), '%Y-%m-%d %H:%M:%S')
+	except ValueError, ex:
+		return None
+	return time.mktime(parsed) + int(match.group(2)) / 1000.0
+
+class LogIndex(object):
+	"""
+	A sparse index of the lines in a log file, so that a line number
+	or time can be found without reading the whole log.
+
+	Every ``interval`` bytes or so, the line number, offset and time of
+	the line starting there is recorded in an index file alongside the
+	log. Finding a line is then a binary search of the index, followed
+	by reading at most ``interval`` bytes of the log.
+
+	The index is brought up to date with the log whenever it is used,
+	indexing only what was added since the last update. So indexes
+	are created lazily for existing logs. Logs smaller than one
+	interval don't get an index file, as they are cheap to scan.
+
+	Times come from the start of each line. Lines that don't start
+	with a time (such as instance output) are given the time of the
+	line before them.
+
+	Compressed logs are read transparently, and keep their index, as
+	offsets in the index are for the uncompressed log.
+
+	:arg str log_path: The path to the log file.
+	:arg int interval: The approximate distance between index entries,
+		in bytes.
+	"""
+	def __init__(self, log_path, interval=DEFAULT_INTERVAL):
+		self.log_path = log_path
+		self.index_path = log_path + INDEX_SUFFIX
+		self.interval = interval
+		# The number of complete lines in the log, and where they end.
+		# Set by update().
+		self.lines = 0
+		self.end = 0
+
+	def update(self, existing_only=False, blocking=True):
+		"""
+		Index anything added to the log since the last update.
+		Returns the number of complete lines in the log, or None
+		if the update was skipped.
+
+		:arg bool existing_only: If true, only update the index if
+			it already exists, rather than indexing the whole log.
+		:arg bool blocking: If false, skip the update if the index
+			is already being updated elsewhere.
+		"""
+		if existing_only and not os.path.exists(self.index_path):
+			return None
+		if not _acquire_update_lock(self.index_path, blocking):
+			return None
+		try:
+			return self._update()
+		finally:
+			_release_update_lock(self.index_path)
+
+	def find_line(self, number):
+		"""
+		Find the byte offset of the start of the given line.
+		Lines are numbered from zero. Negative numbers count back from
+		the end of the log, so -10 is the start of the last ten lines.
+		Numbers past the end of the log return the end of the log.
+
+		:arg int number: The line number to find.
+		"""
+		lines = self.update()
+		if number < 0:
+			number = max(lines + number, 0)
+		if number >= lines:
+			return self.end
+
+		entry = self._search(0, number)
+		line, position = entry[0], entry[1]
+
+		fp = open_log(self.log_path)
+		fp.seek(position)
+		for text in fp:
+			if line == number:
+				break
+			line += 1
+			position += len(text)
+		fp.close()
+
+		return position
+
+	def find_time(self, when):
+		"""
+		Find the byte offset of the first line logged at or after
+		the given time. Returns the end of the log if there are no
+		such lines.
+
+		:arg float when: The unix timestamp to find.
+		"""
+		self.update()
+
+		# Start from the last entry before the time, as the line
+		# we want could be any line after that one.
+		entry = self._search(2, when, strict=True)
+		position = entry[1]
+
+		fp = open_log(self.log_path)
+		fp.seek(position)
+		for text in fp:
+			if position >= self.end:
+				break
+			line_time = parse_log_time(text)
+			if line_time is not None and line_time >= when:
+				break
+			position += len(text)
+		fp.close()
+
+		return min(position, self.end)
+
+	def remove(self):
+		"""
+		Remove the index file, if it exists.
+		"""
+		if os.path.exists(self.index_path):
+			os.unlink(self.index_path)
+
+	def _update(self):
+		if not log_exists(self.log_path):
+			self.lines = 0
+			self.end = 0
+			return 0
+
+		size = log_size(self.log_path)
+		count = self._entry_count()
+		if count > 0:
+			line, position, last_time = self._entry(count - 1)
+			next_entry = position + self.interval
+		else:
+			line, position, last_time = 0, 0, 0.0
+			next_entry = 0
+
+		if position > size:
+			# The log was truncated or replaced, so start again.
+			self.remove()
+			count = 0
+			line, position, last_time = 0, 0, 0.0
+			next_entry = 0
+
+		entries = []
+		fp = open_log(self.log_path)
+		fp.seek(position)
+		for text in fp:
+			if not text.endswith('\n'):
+				# Incomplete line; index it once it's finished.
+				break
+			line_time = parse_log_time(text)
+			if line_time is not None:
+				last_time = line_time
+			if position >= next_entry:
+				entries.append(INDEX_ENTRY.pack(line, position, last_time))
+				next_entry = position + self.interval
+			position += len(text)
+			line += 1
+		fp.close()
+
+		self.lines = line
+		self.end = position
+
+		# Don't bother with an index for a log that fits in one interval.
+		if count == 0 and len(entries) < 2:
+			return self.lines
+
+		if len(entries) > 0:
+			fp = open(self.index_path, 'ab')
+			fp.write(''.join(entries))
+			fp.close()
+
+		return self.lines
+
+	def _entry_count(self):
+		if not os.path.exists(self.index_path):
+			return 0
+		size = os.path.getsize(self.index_path)
+		if size % INDEX_ENTRY.size != 0:
+			# A partly written entry; drop it.
+			fp = open(self.index_path, 'r+b')
+			fp.truncate(size - size % INDEX_ENTRY.size)
+			fp.close()
+		return size / INDEX_ENTRY.size
+
+	def _entry(self, number, fp=None):
+		own = fp is None
+		if own:
+			fp = open(self.index_path, 'rb')
+		fp.seek(number * INDEX_ENTRY.size)
+		entry = INDEX_ENTRY.unpack(fp.read(INDEX_ENTRY.size))
+		if own:
+			fp.close()
+		return entry
+
+	def _search(self, field, value, strict=False):
+		# Binary search for the last entry whose field is at or before
+		# (or strictly before) the value. If there isn't one, this
+		# returns the start of the log.
+		count = self._entry_count()
+		if count == 0:
+			return (0, 0, 0.0)
+
+		fp = open(self.index_path, 'rb')
+		low = 0
+		high = count
+		found = (0, 0, 0.0)
+		while low < high:
+			middle = (low + high) / 2
+			entry = self._entry(middle, fp)
+			if entry[field] < value or (not strict and entry[field] == value):
+				found = entry
+				low = middle + 1
+			else:
+				high = middle
+		fp.close()
+
+		return found
+
+class LogIndexSeek(ThreadCallback):
+	"""
+	Find a line number or time in a log, using the log's index,
+	on another thread. This is useful as the index may need to be
+	built first, which can take a while on a large log.
+
+	The callback is called with the byte offset found.
+	"""
+	def seek(self, log_path, line=None, timestamp=None, interval=DEFAULT_INTERVAL):
+		"""
+		Find the given line number or time in the log.
+		Supply one of ``line`` or ``timestamp``.
+
+		:arg str log_path: The path to the log file.
+		:arg int|None line: The line number to find, as for
+			``LogIndex.find_line()``.
+		:arg float|None timestamp: The time to find, as for
+			``LogIndex.find_time()``.
+		:arg int interval: The index interval.
+		"""
+		self.work(log_path, line=line, timestamp=timestamp, interval=interval)
+
+	def _work(self, log_path, line=None, timestamp=None, interval=DEFAULT_INTERVAL):
+		index = LogIndex(log_path, interval)
+		if line is not None:
+			self._callback(index.find_line(line))
+		else:
+			self._callback(index.find_time(timestamp))
+
+class LogIndexTest(tornado.testing.AsyncTestCase):
+	def setUp(self):
+		super(LogIndexTest, self).setUp()
+		self.path = tempfile.mkdtemp()
+		self.log_path = os.path.join(self.path, 'test.log')
+		self.start = int(time.time()) - 1000
+
+	def tearDown(self):
+		shutil.rmtree(self.path)
+		super(LogIndexTest, self).tearDown()
+
+	def _write_lines(self, first, count):
+		fp = open(self.log_path, 'ab')
+		for i in range(first, first + count):
+			stamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.start + i))
+			fp.write("%s,000 INFO Line %d\n" % (stamp, i))
+			if i % 10 == 0:
+				# Some output without a time.
+				fp.write("Untimed output for %d\n" % i)
+		fp.close()
+
+	def _line_at(self, offset):
+		fp = open(self.log_path, 'rb')
+		fp.seek(offset)
+		line = fp.readline()
+		fp.close()
+		return line
+
+	def test_simple(self):
+		self._write_lines(0, 500)
+		index = LogIndex(self.log_path, 1024)
+
+		# Indexes that don't exist yet can be left for later.
+		self.assertEquals(index.update(existing_only=True), None, "Index was not skipped.")
+		self.assertFalse(os.path.exists(index.index_path), "Index was written.")
+
+		self.assertEquals(index.update(), 550, "Wrong number of lines.")
+		self.assertTrue(os.path.exists(index.index_path), "Index was not written.")
+		self.assertEquals(index.update(existing_only=True), 550, "Existing index was not updated.")
+
+		# Updates to one index don't wait for another.
+		_acquire_update_lock(index.index_path)
+		try:
+			self.assertEquals(index.update(blocking=False), None, "Update didn't skip a busy index.")
+			other = LogIndex(os.path.join(self.path, 'other.log'), 1024)
+			self.assertEquals(other.update(blocking=False), 0, "Update waited for another index.")
+		finally:
+			_release_update_lock(index.index_path)
+		self.assertEquals(len(_update_locks), 0, "Locks were not cleaned up.")
+
+		self.assertIn("Line 0\n", self._line_at(index.find_line(0)))
+		self.assertIn("Untimed output for 0\n", self._line_at(index.find_line(1)))
+		self.assertIn("Line 1\n", self._line_at(index.find_line(2)))
+		self.assertIn("Line 499\n", self._line_at(index.find_line(-1)))
+		self.assertEquals(index.find_line(10000), os.path.getsize(self.log_path))
+
+		self.assertIn("Line 0\n", self._line_at(index.find_time(0)))
+		self.assertIn("Line 250\n", self._line_at(index.find_time(self.start + 250)))
+		self.assertIn("Line 251\n", self._line_at(index.find_time(self.start + 250.5)))
+		self.assertEquals(index.find_time(self.start + 10000), os.path.getsize(self.log_path))
+
+		# Add more lines, and an incomplete line. Only the new lines are indexed.
+		entries = os.path.getsize(index.index_path)
+		self._write_lines(500, 500)
+		fp = open(self.log_path, 'ab')
+		fp.write("Incomplete")
+		fp.close()
+
+		index = LogIndex(self.log_path, 1024)
+		self.assertEquals(index.update(), 1100, "Wrong number of lines.")
+		self.assertTrue(os.path.getsize(index.index_path) > entries, "Index was not extended.")
+		self.assertIn("Line 999\n", self._line_at(index.find_line(-1)))
+		self.assertIn("Line 750\n", self._line_at(index.find_time(self.start + 750)))
+
+		# Small logs don't get an index.
+		os.unlink(self.log_path)
+		index.remove()
+		self._write_lines(0, 5)
+		self.assertEquals(index.update(), 6, "Wrong number of lines.")
+		self.assertFalse(os.path.exists(index.index_path), "Index was written for a small log.")
+		self.assertIn("Line 4\n", self._line_at(index.find_line(5)))
+
+	def _error(self, message, exception=None):
+		self.stop(exception)
+
+	def test_seek(self):
+		self._write_lines(0, 100)
+
+		seek = LogIndexSeek(self.io_loop, self.stop, self._error)
+		seek.seek(self.log_path, line=-1, interval=1024)
+		offset = self.wait()
+
+		self.assertIn("Line 99\n", self._line_at(offset))
@@ -0,0 +1,352 @@
+#
+# Paasmaker - Platform as a Service
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+
+import os
+import re
+import time
+import gzip
+import tempfile
+import shutil
+import unittest
+import multiprocessing
+
+from threadcallback import ThreadCallback
+from compressedlog import log_exists, open_log, compress_log
+
+import tornado.testing
+
+# The default limits on a search, so that one search can't tie up a node.
+DEFAULT_MAX_MATCHES = 1000
+DEFAULT_TIME_LIMIT = 10.0
+# Logs are searched this many bytes at a time.
+SEARCH_BLOCK_SIZE = 1048576
+# Matching lines longer than this are cut short in the results.
+MAX_LINE_LENGTH = 1024
+# Patterns can't be longer than this.
+MAX_PATTERN_LENGTH = 1024
+# Regular expression searches run in another process, as the regular
+# expression engine can take a very long time on some patterns and
+# can't be interrupted. The process is killed if it hasn't finished
+# this many seconds after its time limit.
+ISOLATED_GRACE = 1.0
+
+def log_segments(path):
+	"""
+	List the parts of a log, oldest first, as a list of
+	(segment number, open function) tuples. The log itself is
+	segment 0. Instance logs rotated by the supervisor also have
+	older segments, numbered from 1 for the most recent.
+
+	:arg str path: The path to the uncompressed log file.
+	"""
+	segments = []
+	number = 1
+	while True:
+		if number == 1:
+			segment_path = "%s.1" % path
+			opener = lambda segment_path=segment_path: open(segment_path, 'rb')
+		else:
+			segment_path = "%s.%d.gz" % (path, number)
+			opener = lambda segment_path=segment_path: gzip.open(segment_path, 'rb')
+		if not os.path.exists(segment_path):
+			break
+		segments.insert(0, (number, opener))
+		number += 1
+
+	if log_exists(path):
+		segments.append((0, lambda: open_log(path)))
+
+	return segments
+
+def compile_pattern(pattern, regex=False, ignore_case=False):
+	"""
+	Compile a search pattern. Unless ``regex`` is true, the
+	pattern is matched as a plain string. Raises ``re.error`` if
+	the regular expression is invalid.
+
+	:arg str pattern: The pattern to search for.
+	:arg bool regex: If true, the pattern is a regular expression.
+	:arg bool ignore_case: If true, match regardless of case.
+	"""
+	if not regex:
+		pattern = re.escape(pattern)
+	flags = re.MULTILINE
+	if ignore_case:
+		flags |= re.IGNORECASE
+	return re.compile(pattern, flags)
+
+def search_log(path, pattern, max_matches=DEFAULT_MAX_MATCHES, time_limit=DEFAULT_TIME_LIMIT):
+	"""
+	Search a log, and any rotated segments of it, for lines
+	matching the given pattern. Compressed logs and segments are
+	searched without decompressing them to disk.
+
+	Returns a dict with these keys:
+
+	* **matches**: A list of dicts, with the ``segment`` and byte
+	  ``offset`` of the start of the matching line, and the ``line``
+	  itself, cut short if it's very long.
+	* **truncated**: True if the search stopped early.
+	* **reason**: Why the search stopped early; ``max_matches``
+	  or ``time_limit``. None if it didn't.
+	* **searched**: The number of bytes searched.
+
+	This blocks until done, so don't call it on the IO loop
+	thread. See ``LogSearch``.
+
+	:arg str path: The path to the uncompressed log file.
+	:arg pattern: A compiled pattern, from ``compile_pattern()``.
+	:arg int max_matches: Stop after finding this many lines.
+	:arg float time_limit: Stop after searching for this many seconds.
+	"""
+	deadline = time.time() + time_limit
+	result = {
+		'matches': [],
+		'truncated': False,
+		'reason': None,
+		'searched': 0
+	}
+
+	for segment, opener in log_segments(path):
+		fp = opener()
+		try:
+			reason = _search_segment(fp, segment, pattern, result, max_matches, deadline)
+		finally:
+			fp.close()
+		if reason:
+			result['truncated'] = True
+			result['reason'] = reason
+			break
+
+	return result
+
+def _search_segment(fp, segment, pattern, result, max_matches, deadline):
+	# Search a block at a time, cut back to a line boundary, so the
+	# regular expression engine does the scanning rather than Python.
+	offset = 0
+	carry = ''
+	while True:
+		if time.time() > deadline:
+			return 'time_limit'
+
+		data = fp.read(SEARCH_BLOCK_SIZE)
+		if len(data) == 0:
+			if len(carry) == 0:
+				return None
+			block = carry
+			carry = ''
+		else:
+			data = carry + data
+			end = data.rfind('\n')
+			if end == -1 and len(data) < SEARCH_BLOCK_SIZE * 4:
+				# No complete line yet; read some more.
+				carry = data
+				continue
+			if end == -1:
+				# A very long line. Search what we have.
+				end = len(data) - 1
+			block = data[:end + 1]
+			carry = data[end + 1:]
+
+		position = 0
+		while True:
+			match = pattern.search(block, position)
+			if not match:
+				break
+			start = block.rfind('\n', 0, match.start()) + 1
+			finish = block.find('\n', match.start())
+			if finish == -1:
+				finish = len(block)
+			result['matches'].append({
+				'segment': segment,
+				'offset': offset + start,
+				'line': block[start:min(finish, start + MAX_LINE_LENGTH)]
+			})
+			if len(result['matches']) >= max_matches:
+				result['searched'] += finish + 1
+				return 'max_matches'
+			position = finish + 1
+
+		result['searched'] += len(block)
+		offset += len(block)
+
+def search_log_isolated(path, pattern, max_matches=DEFAULT_MAX_MATCHES, time_limit=DEFAULT_TIME_LIMIT):
+	"""
+	Search a log as for ``search_log()``, but in another process,
+	which is killed if it runs more than ``ISOLATED_GRACE`` seconds
+	over the time limit. The time limit is only checked between
+	blocks of the log, so use this for user supplied regular
+	expressions, which can take much longer than that on a block.
+
+	If the process is killed, the result has no matches, and the
+	reason is ``time_limit``.
+
+	This blocks until done, so don't call it on the IO loop
+	thread. See ``LogSearch``.
+
+	:arg str path: The path to the uncompressed log file.
+	:arg pattern: A compiled pattern, from ``compile_pattern()``.
+	:arg int max_matches: Stop after finding this many lines.
+	:arg float time_limit: Stop after searching for this many seconds.
+	"""
+	receiver, sender = multiprocessing.Pipe(False)
+	process = multiprocessing.Process(
+		target=_search_process,
+		args=(sender, path, pattern, max_matches, time_limit)
+	)
+	process.daemon = True
+	process.start()
+	sender.close()
+
+	try:
+		if receiver.poll(max(time_limit, 0) + ISOLATED_GRACE):
+			try:
+				result = receiver.recv()
+			except EOFError, ex:
+				raise Exception("Search process exited without a result.")
+		else:
+			result = {
+				'matches': [],
+				'truncated': True,
+				'reason': 'time_limit',
+				'searched': 0
+			}
+	finally:
+		receiver.close()
+		if process.is_alive():
+			process.terminate()
+		process.join()
+
+	return result
+
+def _search_process(sender, path, pattern, max_matches, time_limit):
+	sender.send(search_log(path, pattern, max_matches=max_matches, time_limit=time_limit))
+	sender.close()
+
+class LogSearch(ThreadCallback):
+	"""
+	Search a log on another thread. The callback is called with
+	the result of ``search_log()``.
+	"""
+	def search(self, path, pattern, max_matches=DEFAULT_MAX_MATCHES, time_limit=DEFAULT_TIME_LIMIT, isolate=False):
+		"""
+		Search the given log.
+
+		:arg str path: The path to the uncompressed log file.
+		:arg pattern: A compiled pattern, from ``compile_pattern()``.
+		:arg int max_matches: Stop after finding this many lines.
+		:arg float time_limit: Stop after searching for this many seconds.
+		:arg bool isolate: If true, search in another process,
+			with ``search_log_isolated()``. Do this for regular
+			expressions supplied by users.
+		"""
+		self.work(path, pattern, max_matches=max_matches, time_limit=time_limit, isolate=isolate)
+
+	def _work(self, path, pattern, max_matches=DEFAULT_MAX_MATCHES, time_limit=DEFAULT_TIME_LIMIT, isolate=False):
+		if isolate:
+			self._callback(search_log_isolated(path, pattern, max_matches=max_matches, time_limit=time_limit))
+		else:
+			self._callback(search_log(path, pattern, max_matches=max_matches, time_limit=time_limit))
+
+class LogSearchTest(tornado.testing.AsyncTestCase):
+	def setUp(self):
+		super(LogSearchTest, self).setUp()
+		self.path = tempfile.mkdtemp()
+		self.log_path = os.path.join(self.path, 'test.log')
+
+	def tearDown(self):
+		shutil.rmtree(self.path)
+		super(LogSearchTest, self).tearDown()
+
+	def _write(self, path, first, count):
+		lines = []
+		for i in range(first, first + count):
+			if i % 100 == 0:
+				lines.append("ERROR Something broke at %d\n" % i)
+			else:
+				lines.append("INFO All good at %d\n" % i)
+		contents = ''.join(lines)
+		fp = open(path, 'wb')
+		fp.write(contents)
+		fp.close()
+		return contents
+
+	def test_simple(self):
+		contents = self._write(self.log_path, 0, 1000)
+
+		result = search_log(self.log_path, compile_pattern("ERROR"))
+		self.assertEquals(len(result['matches']), 10, "Wrong number of matches.")
+		self.assertFalse(result['truncated'], "Search was truncated.")
+		self.assertEquals(result['searched'], len(contents), "Wrong number of bytes searched.")
+		match = result['matches'][3]
+		self.assertEquals(match['line'], "ERROR Something broke at 300", "Wrong line.")
+		self.assertTrue(contents[match['offset']:].startswith("ERROR Something broke at 300\n"), "Wrong offset.")
+
+		# Case, regular expressions, and plain strings that look like them.
+		result = search_log(self.log_path, compile_pattern("error", ignore_case=True))
+		self.assertEquals(len(result['matches']), 10, "Wrong number of matches.")
+		result = search_log(self.log_path, compile_pattern(r"^INFO .* 9[5-9]\d$", regex=True))
+		self.assertEquals(len(result['matches']), 50, "Wrong number of matches.")
+		result = search_log(self.log_path, compile_pattern(r"at 99\d"))
+		self.assertEquals(len(result['matches']), 0, "Plain string was treated as a regular expression.")
+
+		# Limits.
+		result = search_log(self.log_path, compile_pattern("INFO"), max_matches=5)
+		self.assertEquals(len(result['matches']), 5, "Wrong number of matches.")
+		self.assertTrue(result['truncated'], "Search was not truncated.")
+		self.assertEquals(result['reason'], 'max_matches', "Wrong reason.")
+		result = search_log(self.log_path, compile_pattern("INFO"), time_limit=-1)
+		self.assertEquals(result['reason'], 'time_limit', "Wrong reason.")
+
+		# Missing logs have nothing in them.
+		result = search_log(os.path.join(self.path, 'missing.log'), compile_pattern("ERROR"))
+		self.assertEquals(len(result['matches']), 0, "Found matches in a missing log.")
+
+	def test_segments(self):
+		# A compressed log, with a recent and an older rotated segment.
+		self._write(self.log_path + '.1', 1000, 1000)
+		older = self._write(self.log_path + '.2', 0, 1000)
+		source = open(self.log_path + '.2', 'rb')
+		target = gzip.open(self.log_path + '.2.gz', 'wb')
+		target.write(source.read())
+		target.close()
+		source.close()
+		os.unlink(self.log_path + '.2')
+		self._write(self.log_path, 2000, 1000)
+		compress_log(self.log_path, 4096)
+
+		search = LogSearch(self.io_loop, self.stop, self.stop)
+		search.search(self.log_path, compile_pattern("ERROR"))
+		result = self.wait()
+
+		self.assertEquals(len(result['matches']), 30, "Wrong number of matches.")
+		self.assertEquals([match['segment'] for match in result['matches'][::10]], [2, 1, 0], "Segments searched in the wrong order.")
+		match = result['matches'][5]
+		self.assertEquals(match['line'], "ERROR Something broke at 500", "Wrong line.")
+		self.assertTrue(older[match['offset']:].startswith("ERROR Something broke at 500\n"), "Wrong offset.")
+		self.assertEquals(result['matches'][-1]['line'], "ERROR Something broke at 2900", "Wrong line.")
+
+	def test_isolated(self):
+		self._write(self.log_path, 0, 1000)
+
+		# Isolated searches find the same lines.
+		result = search_log_isolated(self.log_path, compile_pattern("ERROR"))
+		self.assertEquals(len(result['matches']), 10, "Wrong number of matches.")
+		self.assertEquals(result['matches'][3]['line'], "ERROR Something broke at 300", "Wrong line.")
+
+		# A pattern that takes forever is stopped.
+		fp = open(self.log_path, 'ab')
+		fp.write("a" * 40 + "b\n")
+		fp.close()
+		started = time.time()
+		search = LogSearch(self.io_loop, self.stop, self.stop)
+		search.search(self.log_path, compile_pattern(r"^(a+)+$", regex=True), time_limit=0.5, isolate=True)
+		result = self.wait(timeout=10)
+		self.assertTrue(time.time() - started < 5, "Search was not stopped.")
+		self.assertTrue(result['truncated'], "Search was not truncated.")
+		self.assertEquals(result['reason'], 'time_limit', "Wrong reason.")
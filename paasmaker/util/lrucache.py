@@ -0,0 +1,158 @@
+#
+# Paasmaker - Platform as a Service
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+
+import collections
+import unittest
+
+class LRUCache(object):
+	"""
+	A dict-like cache that holds at most ``size`` entries. When
+	it's full, the least recently used entry is evicted to make room
+	for a new one. Inserting, fetching and evicting are all O(1).
+
+	It also keeps hit and miss counters, so callers can tell how
+	effective the cache is.
+
+	For example::
+
+		cache = LRUCache(2)
+		cache['a'] = 1
+		cache['b'] = 2
+		cache.get('a') # 1, and 'a' is now the most recently used.
+		cache['c'] = 3 # 'b' is evicted.
+
+	:arg int size: The maximum number of entries to hold.
+	"""
+
+	def __init__(self, size):
+		if size < 1:
+			raise ValueError("Size must be at least 1.")
+		self.size = size
+		self.entries = collections.OrderedDict()
+		self.hits = 0
+		self.misses = 0
+		self.evictions = 0
+
+	def get(self, key, default=None):
+		"""
+		Fetch the value for the given key, marking it as the most
+		recently used. Returns the default if the key is not present.
+		Updates the hit and miss counters.
+		"""
+		if key in self.entries:
+			self.hits += 1
+			value = self.entries.pop(key)
+			self.entries[key] = value
+			return value
+		else:
+			self.misses += 1
+			return default
+
+	def __setitem__(self, key, value):
+		if key in self.entries:
+			del self.entries[key]
+		elif len(self.entries) >= self.size:
+			self.entries.popitem(last=False)
+			self.evictions += 1
+		self.entries[key] = value
+
+	def __getitem__(self, key):
+		if key not in self.entries:
+			self.misses += 1
+			raise KeyError(key)
+		return self.get(key)
+
+	def __contains__(self, key):
+		# NOTE: This doesn't update the counters or the order.
+		return key in self.entries
+
+	def __delitem__(self, key):
+		del self.entries[key]
+
+	def __len__(self):
+		return len(self.entries)
+
+	def seen(self, key):
+		"""
+		Check if the given key has been seen before, and record
+		it as seen. Returns True if it was already present. This is
+		useful to filter out duplicate events.
+		"""
+		if self.get(key) is not None:
+			return True
+		self[key] = True
+		return False
+
+	def clear(self):
+		"""
+		Remove all the entries. The counters are not reset.
+		"""
+		self.entries.clear()
+
+	def stats(self):
+		"""
+		Return a dict of the cache counters and current size.
+		"""
+		return {
+			'size': len(self.entries),
+			'limit': self.size,
+			'hits': self.hits,
+			'misses': self.misses,
+			'evictions': self.evictions
+		}
+
+class LRUCacheTest(unittest.TestCase):
+	def test_simple(self):
+		cache = LRUCache(2)
+		cache['a'] = 1
+		cache['b'] = 2
+
+		self.assertEquals(cache.get('a'), 1, "Wrong value returned.")
+		self.assertEquals(cache['b'], 2, "Wrong value returned.")
+		self.assertEquals(cache.get('c'), None, "Missing key returned a value.")
+		self.assertRaises(KeyError, lambda: cache['c'])
+
+		stats = cache.stats()
+		self.assertEquals(stats['hits'], 2, "Hits were not counted.")
+		self.assertEquals(stats['misses'], 2, "Misses were not counted.")
+
+	def test_eviction(self):
+		cache = LRUCache(2)
+		cache['a'] = 1
+		cache['b'] = 2
+
+		# Use 'a', so 'b' is the least recently used.
+		cache.get('a')
+		cache['c'] = 3
+
+		self.assertEquals(len(cache), 2, "Cache grew past it's size.")
+		self.assertTrue('a' in cache, "Recently used entry was evicted.")
+		self.assertTrue('c' in cache, "New entry was not stored.")
+		self.assertFalse('b' in cache, "Least recently used entry was not evicted.")
+		self.assertEquals(cache.stats()['evictions'], 1, "Eviction was not counted.")
+
+		# Replacing an entry doesn't evict anything.
+		cache['c'] = 4
+		self.assertEquals(len(cache), 2, "Replacing an entry changed the size.")
+		self.assertEquals(cache['c'], 4, "Entry was not replaced.")
+		self.assertEquals(cache.stats()['evictions'], 1, "Replacing an entry evicted something.")
+
+		self.assertRaises(ValueError, LRUCache, 0)
+
+	def test_seen(self):
+		cache = LRUCache(3)
+
+		self.assertFalse(cache.seen('a'), "New key reported as seen.")
+		self.assertTrue(cache.seen('a'), "Repeated key not reported as seen.")
+
+		for key in ['b', 'c', 'd']:
+			cache.seen(key)
+
+		# 'a' has been pushed out by now.
+		self.assertFalse(cache.seen('a'), "Evicted key reported as seen.")
+		self.assertTrue(cache.seen('d'), "Recent key not reported as seen.")
@@ -0,0 +1,339 @@
+#
+# Paasmaker - Platform as a Service
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+
+import time
+import logging
+import unittest
+
+import paasmaker
+from ..common.testhelpers import TestHelpers
+from redisdaemon import RedisDaemon
+
+import tornado.ioloop
+import tornado.stack_context
+import tornado.testing
+from paasmaker.thirdparty.tornadoredis import Client as TornadoRedisClient
+from paasmaker.thirdparty.tornadoredis.exceptions import ConnectionError
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# The defaults for a pool. These match the defaults in
+# the redis.pool section of the configuration.
+DEFAULT_SIZE = 4
+DEFAULT_HEALTH_CHECK_INTERVAL = 30
+DEFAULT_CONNECT_TIMEOUT = 5
+DEFAULT_BACKOFF_MIN = 0.5
+DEFAULT_BACKOFF_MAX = 30
+
+class RedisPool(object):
+	"""
+	A pool of connected Redis clients for one Redis server, shared
+	by everything on this node that talks to that server.
+
+	Clients are shared rather than checked out: each client
+	queues commands on its connection, so callers can use one
+	concurrently, and don't need to give it back. ``get()`` returns
+	an idle client if there is one, otherwise opens another client
+	if the pool isn't full, otherwise returns the least busy
+	client. So callers must not disconnect, subscribe with, or
+	otherwise change the state of a pooled client. Use
+	``dedicated()`` for a client of your own for that.
+
+	Idle clients are sent a PING every ``health_check_interval``
+	seconds, and dropped from the pool if they don't reply in
+	time. Clients that have disconnected are dropped when next
+	found. If a connection can't be made, no new connections are
+	attempted for ``backoff_min`` seconds, doubling on each failure
+	up to ``backoff_max`` seconds; meanwhile, callers get a client
+	that is still connected, or an error straight away.
+
+	:arg IOLoop io_loop: The IO loop to use.
+	:arg str host: The Redis host.
+	:arg int port: The Redis port.
+	:arg str|None password: The Redis password, if any.
+	:arg int size: The most clients to open.
+	:arg int health_check_interval: How often, in seconds, to check
+		idle clients. 0 disables checks.
+	:arg float connect_timeout: How long, in seconds, to wait for a
+		connection to be made.
+	:arg float backoff_min: The first delay, in seconds, before
+		trying to connect again after a failure.
+	:arg float backoff_max: The longest delay, in seconds, before
+		trying to connect again.
+	"""
+	def __init__(self,
+			io_loop,
+			host,
+			port,
+			password=None,
+			size=DEFAULT_SIZE,
+			health_check_interval=DEFAULT_HEALTH_CHECK_INTERVAL,
+			connect_timeout=DEFAULT_CONNECT_TIMEOUT,
+			backoff_min=DEFAULT_BACKOFF_MIN,
+			backoff_max=DEFAULT_BACKOFF_MAX):
+		self.io_loop = io_loop
+		self.host = host
+		self.port = port
+		self.password = password
+		self.size = max(size, 1)
+		self.health_check_interval = health_check_interval
+		self.connect_timeout = connect_timeout
+		self.backoff_min = backoff_min
+		self.backoff_max = backoff_max
+
+		self.clients = []
+		self.failures = 0
+		self.retry_at = 0
+		self.last_error = None
+		self.checker = None
+
+	def get(self, callback, error_callback):
+		"""
+		Get a shared client from the pool. The callback is
+		called with the client, or the error callback with a
+		message if there isn't a connected client and one
+		can't be opened.
+
+		:arg callable callback: The callback to call with the client.
+		:arg callable error_callback: The callback to call on error.
+		"""
+		# Forget clients that have gone away, or that someone
+		# has subscribed with, as they can't be shared any more.
+		for client in list(self.clients):
+			if not client.connection.connected() or client.subscribed:
+				self._drop(client)
+
+		for client in self.clients:
+			if client.connection.ready():
+				callback(client)
+				return
+
+		if len(self.clients) < self.size:
+			try:
+				client = self._connect()
+				self.clients.append(client)
+				self._start_checker()
+				callback(client)
+				return
+			except ConnectionError, ex:
+				if len(self.clients) == 0:
+					error_callback(str(ex), ex)
+					return
+
+		callback(min(self.clients, key=self._pending))
+
+	def dedicated(self, callback, error_callback):
+		"""
+		Open a new client to the same server, that isn't part of
+		the pool. It's up to the caller to disconnect it when done.
+		Use this for subscribing, or anything else that changes the
+		state of the connection.
+
+		:arg callable callback: The callback to call with the client.
+		:arg callable error_callback: The callback to call on error.
+		"""
+		try:
+			client = self._connect()
+		except ConnectionError, ex:
+			error_callback(str(ex), ex)
+			return
+
+		callback(client)
+
+	def check(self):
+		"""
+		Check the health of the idle clients in the pool now.
+		This is done automatically every ``health_check_interval``
+		seconds.
+		"""
+		for client in list(self.clients):
+			if not client.connection.connected() or client.subscribed:
+				self._drop(client)
+			elif client.connection.ready():
+				self._ping(client)
+
+	def close(self):
+		"""
+		Disconnect all the clients in the pool, and stop
+		checking them. The pool can still be used afterwards,
+		and will reconnect as required.
+		"""
+		if self.checker:
+			self.checker.stop()
+			self.checker = None
+		for client in list(self.clients):
+			self._drop(client)
+
+	def _pending(self, client):
+		# The number of commands queued or waiting on a reply.
+		return len(client.connection.read_callbacks) + len(client.connection.ready_callbacks)
+
+	def _connect(self):
+		now = time.time()
+		if now < self.retry_at:
+			raise ConnectionError(
+				"Not connecting to redis at %s:%d for another %0.1f seconds, after failing to connect: %s" % (
+					self.host,
+					self.port,
+					self.retry_at - now,
+					self.last_error
+				)
+			)
+
+		client = TornadoRedisClient(
+			host=self.host,
+			port=self.port,
+			password=self.password,
+			io_loop=self.io_loop
+		)
+		client.connection.timeout = self.connect_timeout
+		try:
+			client.connect()
+		except ConnectionError, ex:
+			self.failures += 1
+			delay = min(self.backoff_min * (2 ** (self.failures - 1)), self.backoff_max)
+			self.retry_at = time.time() + delay
+			self.last_error = str(ex)
+			logger.error(
+				"Unable to connect to redis at %s:%d, will retry in %0.1f seconds: %s",
+				self.host,
+				self.port,
+				delay,
+				self.last_error
+			)
+			raise ConnectionError("Unable to connect to redis at %s:%d: %s" % (self.host, self.port, self.last_error))
+
+		self.failures = 0
+		self.retry_at = 0
+		return client
+
+	def _drop(self, client):
+		if client in self.clients:
+			self.clients.remove(client)
+		if not client.subscribed:
+			client.disconnect()
+
+	def _start_checker(self):
+		if self.checker or self.health_check_interval <= 0:
+			return
+		self.checker = tornado.ioloop.PeriodicCallback(
+			self.check,
+			self.health_check_interval * 1000,
+			io_loop=self.io_loop
+		)
+		self.checker.start()
+
+	def _ping(self, client):
+		state = {'done': False}
+
+		def finished(healthy):
+			if state['done']:
+				return
+			state['done'] = True
+			self.io_loop.remove_timeout(timeout)
+			if not healthy:
+				logger.warning("Redis client for %s:%d failed its health check; dropping it.", self.host, self.port)
+				self._drop(client)
+
+		def handle_exception(type, value, traceback):
+			finished(False)
+			return True
+
+		timeout = self.io_loop.add_timeout(
+			time.time() + self.connect_timeout,
+			lambda: finished(False)
+		)
+		with tornado.stack_context.ExceptionStackContext(handle_exception):
+			client.ping(lambda result: finished(result is True))
+
+class RedisPoolTest(tornado.testing.AsyncTestCase, TestHelpers):
+	def setUp(self):
+		super(RedisPoolTest, self).setUp()
+		self.configuration = paasmaker.common.configuration.ConfigurationStub(0, [], io_loop=self.io_loop)
+
+		self.server = RedisDaemon(self.configuration)
+		self.server.configure(
+			self.configuration.get_scratch_path_exists('redis'),
+			self.configuration.get_free_port(),
+			'127.0.0.1',
+			self.stop,
+			self.stop
+		)
+		self.wait()
+		self.server.start(self.stop, self.stop)
+		self.wait()
+
+	def tearDown(self):
+		self.server.destroy(self.stop, self.stop)
+		self.wait()
+
+		self.configuration.cleanup(self.stop, self.stop)
+		self.wait()
+		super(RedisPoolTest, self).tearDown()
+
+	def _error(self, message, exception=None):
+		self.stop(message)
+
+	def test_simple(self):
+		pool = RedisPool(self.io_loop, '127.0.0.1', self.server.parameters['port'], size=2)
+
+		# Idle clients are reused.
+		pool.get(self.stop, self._error)
+		first = self.wait()
+		first.set('foo', 'bar', self.stop)
+		self.wait()
+		pool.get(self.stop, self._error)
+		self.assertIs(self.wait(), first, "Did not reuse an idle client.")
+		self.assertEquals(len(pool.clients), 1, "Opened too many clients.")
+
+		# Busy clients are shared, up to the size of the pool.
+		clients = []
+		for i in range(4):
+			pool.get(clients.append, self._error)
+			clients[-1].get('foo', lambda result: None)
+		self.assertEquals(len(pool.clients), 2, "Wrong number of clients.")
+		self.assertEquals(len(set(clients)), 2, "Busy clients were not shared.")
+
+		# Healthy clients stay after a check; dropped ones go.
+		self.short_wait_hack()
+		pool.check()
+		self.short_wait_hack()
+		self.assertEquals(len(pool.clients), 2, "Healthy clients were dropped.")
+		clients[0].disconnect()
+		pool.check()
+		self.assertEquals(len(pool.clients), 1, "Disconnected client was kept.")
+
+		# Dedicated clients are not part of the pool.
+		pool.dedicated(self.stop, self._error)
+		dedicated = self.wait()
+		self.assertNotIn(dedicated, pool.clients, "Dedicated client is in the pool.")
+		dedicated.disconnect()
+
+		pool.close()
+		self.assertEquals(len(pool.clients), 0, "Clients remain after close.")
+
+	def test_backoff(self):
+		port = self.configuration.get_free_port()
+		pool = RedisPool(self.io_loop, '127.0.0.1', port, backoff_min=0.5, backoff_max=1)
+
+		pool.get(self.stop, self._error)
+		self.assertIn("Unable to connect", self.wait())
+		self.assertEquals(pool.failures, 1, "Failure was not recorded.")
+
+		# Whilst backing off, it doesn't try to connect.
+		pool.get(self.stop, self._error)
+		self.assertIn("Not connecting", self.wait())
+		self.assertEquals(pool.failures, 1, "Connection was attempted.")
+
+		# Once the delay is up, it tries again, and backs off for longer.
+		pool.retry_at = 0
+		pool.get(self.stop, self._error)
+		self.wait()
+		self.assertEquals(pool.failures, 2, "Connection was not attempted.")
+		self.assertTrue(pool.retry_at - time.time() > 0.5, "Did not back off for longer.")
@@ -901,6 +901,42 @@ class JobFollowAction(RootAction):
 		self.args = args
 		self._follow_job(self.args.job_id)
 
+class JobMetricsAction(RootAction):
+	def describe(self):
+		return "Show how long jobs waited and ran for, by job plugin, on the node given by --remote."
+
+	def process(self):
+		request = paasmaker.common.api.job.JobMetricsAPIRequest(None)
+		self.point_and_auth(request)
+		request.send(self.generic_api_response)
+
+	def _format_seconds(self, value):
+		if value is None:
+			return '-'
+		return "%0.2fs" % value
+
+	def _format_human(self, data):
+		lines = []
+		lines.append("Job metrics for node %s." % data['node'])
+		row = "%-45s %8s %8s %8s %8s %8s %8s %s"
+		lines.append(row % ('Plugin', 'Jobs', 'Wait p50', 'Wait p90', 'Run p50', 'Run p90', 'Run max', 'Outcomes'))
+		for plugin in sorted(data['metrics'].keys()):
+			metrics = data['metrics'][plugin]
+			outcomes = ", ".join(["%s: %d" % (state, count) for state, count in sorted(metrics['outcomes'].items())])
+			lines.append(
+				row % (
+					plugin,
+					metrics['queue_wait']['count'],
+					self._format_seconds(metrics['queue_wait']['p50']),
+					self._format_seconds(metrics['queue_wait']['p90']),
+					self._format_seconds(metrics['run_time']['p50']),
+					self._format_seconds(metrics['run_time']['p90']),
+					self._format_seconds(metrics['run_time']['max']),
+					outcomes
+				)
+			)
+		return "\n".join(lines)
+
 class RouterTableDumpAction(RootAction):
 	def describe(self):
 		return "Dump all the entries in the router table."
@@ -971,6 +1007,8 @@ class LogStreamAction(RootAction):
 	def options(self, parser):
 		parser.add_argument("job_id", help="Job ID to stream")
 		parser.add_argument("--position", default=0, help="Only return the log since this position.")
+		parser.add_argument("--line", type=int, default=None, help="Return the log from this line number. Negative numbers count back from the end, so -100 shows the last 100 lines.")
+		parser.add_argument("--since", type=float, default=None, help="Return the log from the first line logged at or after this unix timestamp.")
 
 	def describe(self):
 		return "Stream the given job ID."
@@ -990,9 +1028,42 @@ class LogStreamAction(RootAction):
 
 		request.set_lines_callback(on_message)
 		request.set_cantfind_callback(on_error)
-		request.subscribe(self.args.job_id, position=self.args.position)
+		request.subscribe(
+			self.args.job_id,
+			position=self.args.position,
+			line=self.args.line,
+			timestamp=self.args.since
+		)
 		request.connect()
 
+class LogSearchAction(RootAction):
+	def options(self, parser):
+		parser.add_argument("job_id", help="Job ID to search")
+		parser.add_argument("pattern", help="The text to search for.")
+		parser.add_argument("--regex", default=False, help="Treat the pattern as a regular expression.", action="store_true")
+		parser.add_argument("--ignore-case", default=False, help="Match regardless of case.", action="store_true")
+		parser.add_argument("--max-matches", type=int, default=1000, help="Stop after finding this many lines.")
+		parser.add_argument("--time-limit", type=float, default=10, help="Stop after searching for this many seconds.")
+
+	def describe(self):
+		return "Search the log of the given job ID, on the node that has it."
+
+	def process(self):
+		request = paasmaker.common.api.job.JobLogSearchAPIRequest(None)
+		self.point_and_auth(request)
+		request.set_job(self.args.job_id)
+		request.set_pattern(self.args.pattern, regex=self.args.regex, ignore_case=self.args.ignore_case)
+		request.set_limits(self.args.max_matches, self.args.time_limit)
+		request.send(self.generic_api_response)
+
+	def _format_human(self, data):
+		lines = []
+		for match in data['matches']:
+			lines.append("%d:%d: %s" % (match['segment'], match['offset'], match['line']))
+		if data['truncated']:
+			lines.append("Search stopped early (%s) after %d bytes." % (data['reason'], data['searched']))
+		return "\n".join(lines)
+
 class ServiceExportAction(RootAction):
 	def options(self, parser):
 		parser.add_argument("service_id", help="Service ID to export")
@@ -1132,7 +1203,9 @@ ACTION_MAP = {
 	'version-delete': VersionDeleteAction(),
 	'job-abort': JobAbortAction(),
 	'job-follow': JobFollowAction(),
+	'job-metrics': JobMetricsAction(),
 	'log-stream': LogStreamAction(),
+	'log-search': LogSearchAction(),
 	'router-table-dump': RouterTableDumpAction(),
 	'router-stream': RouterStreamAction(),
 	'service-export': ServiceExportAction(),
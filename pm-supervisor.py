@@ -12,12 +12,15 @@ import sys
 import json
 import subprocess
 import os
-import fcntl
 import datetime
 import signal
 import urllib2
 import time
 import httplib
+import errno
+import select
+import fcntl
+import gzip
 
 # NOTE: This doesn't use the virtualenv, because it doesn't rely on
 # anything inside the virtualenv. If this changes in the future,
@@ -44,23 +47,297 @@ except ValueError, ex:
 	print "Invalid JSON: %s" % str(ex)
 	sys.exit(3)
 
+# Read the command's output in chunks of this size.
+READ_SIZE = 65536
+# How often to check if the command has exited, if something else
+# still has it's output open. In seconds. This is only a fallback;
+# SIGCHLD wakes us up as soon as it exits.
+EXIT_CHECK_INTERVAL = 1.0
+# Once the command has exited, copy at most this much more of it's
+# output, in case something it started is still writing to it.
+EXIT_DRAIN_SIZE = READ_SIZE * 4
+# Compress this much of the last rotated segment between reads.
+COMPRESS_STEP_SIZE = READ_SIZE
+
+class RotatingLog(object):
+	"""
+	Writes the command's output to it's log file, rotating the log
+	when it gets too big or too old, and keeping the rotated segments
+	within a disk budget.
+
+	Rotated segments sit alongside the log. The most recent is
+	``<log>.1``, left uncompressed so that log viewers can finish
+	reading it after a rotation. Older ones are gzipped, as
+	``<log>.2.gz``, ``<log>.3.gz``, and so on. Once the log and
+	it's segments take up more than the budget, the oldest segments
+	are removed.
+
+	So that the command's output keeps being read, ``<log>.1`` is
+	compressed a step at a time between reads, into a temporary
+	file that replaces it at the next rotation.
+
+	The older segments are plain gzip files, not the seekable format
+	that job logs are compressed into. Log viewers only follow the log
+	and ``<log>.1``; the older segments are only ever read from start
+	to finish, by log searches.
+
+	A limit of 0 turns that limit off.
+	"""
+	def __init__(self, path, segment_size=0, segment_age=0, max_size=0):
+		self.path = path
+		self.segment_size = segment_size
+		self.segment_age = segment_age
+		self.max_size = max_size
+		self.compression = None
+		self._open()
+		# Carry on with a segment left over from last time.
+		self._start_compression()
+
+	def _open(self):
+		# Unbuffered, so viewers see output as it arrives.
+		self.fp = open(self.path, 'ab', 0)
+		self.size = os.fstat(self.fp.fileno()).st_size
+		self.opened = time.time()
+
+	def write(self, data):
+		while len(data) > 0:
+			if self._should_rotate(len(data)):
+				# Fill up this segment to the last whole line that fits.
+				room = len(data)
+				if self.segment_size > 0:
+					room = max(self.segment_size - self.size, 0)
+				end = data.rfind('\n', 0, room)
+				if end != -1:
+					self._write(data[:end + 1])
+					data = data[end + 1:]
+				self.rotate()
+
+			if self.segment_size > 0 and len(data) > self.segment_size:
+				# More than a segment's worth. Write what fits,
+				# splitting a very long line if we have to.
+				end = data.rfind('\n', 0, self.segment_size)
+				if end == -1:
+					end = self.segment_size - 1
+				self._write(data[:end + 1])
+				data = data[end + 1:]
+			else:
+				self._write(data)
+				data = ''
+
+	def _write(self, data):
+		self.fp.write(data)
+		self.size += len(data)
+
+	def _should_rotate(self, incoming):
+		if self.size == 0:
+			return False
+		if self.segment_size > 0 and self.size + incoming > self.segment_size:
+			return True
+		if self.segment_age > 0 and time.time() - self.opened > self.segment_age:
+			return True
+		return False
+
+	def _segment(self, number):
+		if number == 1:
+			return "%s.1" % self.path
+		return "%s.%d.gz" % (self.path, number)
+
+	def _segment_count(self):
+		count = 0
+		while os.path.exists(self._segment(count + 1)):
+			count += 1
+		return count
+
+	def _compressing_path(self):
+		return "%s.1.gz.tmp" % self.path
+
+	def _start_compression(self):
+		if not os.path.exists(self._segment(1)):
+			return
+		self.compression = (
+			open(self._segment(1), 'rb'),
+			gzip.open(self._compressing_path(), 'wb')
+		)
+
+	def is_compressing(self):
+		"""
+		Check to see if the last rotated segment still has
+		some left to compress.
+		"""
+		return self.compression is not None
+
+	def compress_step(self, size=COMPRESS_STEP_SIZE):
+		"""
+		Compress the next part of the last rotated segment.
+		Returns True once it's all compressed.
+		"""
+		if self.compression is None:
+			return True
+
+		source, target = self.compression
+		data = source.read(size)
+		if len(data) == 0:
+			source.close()
+			target.close()
+			self.compression = None
+			return True
+
+		target.write(data)
+		return False
+
+	def _stop_compression(self):
+		if self.compression is not None:
+			source, target = self.compression
+			source.close()
+			target.close()
+			self.compression = None
+			os.unlink(self._compressing_path())
+
+	def rotate(self):
+		self.fp.close()
+
+		# Normally the last segment was compressed between reads,
+		# but if the output came too fast, finish it off now.
+		while not self.compress_step(READ_SIZE):
+			pass
+
+		# Shuffle the older segments along.
+		count = self._segment_count()
+		for number in range(count, 1, -1):
+			os.rename(self._segment(number), self._segment(number + 1))
+
+		# Swap in the compressed last segment, now that viewers have moved on.
+		if count > 0:
+			os.rename(self._compressing_path(), self._segment(2))
+			os.unlink(self._segment(1))
+
+		os.rename(self.path, self._segment(1))
+		# The line index is for the old log.
+		if os.path.exists(self.path + '.idx'):
+			os.unlink(self.path + '.idx')
+
+		self._open()
+		self._enforce_budget()
+		self._start_compression()
+
+	def _enforce_budget(self):
+		if self.max_size <= 0:
+			return
+
+		# Leave room for the current log to grow to a full segment.
+		count = self._segment_count()
+		total = sum([os.path.getsize(self._segment(number)) for number in range(1, count + 1)])
+		while count > 0 and total + max(self.segment_size, self.size) > self.max_size:
+			total -= os.path.getsize(self._segment(count))
+			os.unlink(self._segment(count))
+			count -= 1
+
+	def close(self):
+		self.fp.close()
+		# The next supervisor for this log starts it again.
+		self._stop_compression()
+
 class CommandSupervisor(object):
 	def __init__(self, data):
 		self.data = data
 
 		# Open the log file used later.
-		self.log_fp = open(data['log_file'], 'a')
+		rotation = data.get('log_rotation', {})
+		self.log = RotatingLog(
+			data['log_file'],
+			segment_size=rotation.get('segment_size', 0),
+			segment_age=rotation.get('segment_age', 0),
+			max_size=rotation.get('max_size', 0)
+		)
 		self.log_backlog = []
 		self.process_active = False
+		self.process = None
+
+		# Written to by the SIGCHLD handler, to wake up copy_output()
+		# when the command exits. Neither end is passed to the command.
+		self.wake_read, self.wake_write = os.pipe()
+		for fd in [self.wake_read, self.wake_write]:
+			fcntl.fcntl(fd, fcntl.F_SETFL, fcntl.fcntl(fd, fcntl.F_GETFL) | os.O_NONBLOCK)
+			fcntl.fcntl(fd, fcntl.F_SETFD, fcntl.fcntl(fd, fcntl.F_GETFD) | fcntl.FD_CLOEXEC)
 
 	def log_helper(self, level, message):
 		timestamp = str(datetime.datetime.now())
 		formatted_message = "%s %s %s\n" % (timestamp, level, message)
 		if self.process_active:
+			# We might be in the middle of writing output, so
+			# hold onto this until the command exits.
 			self.log_backlog.append(formatted_message)
 		else:
-			self.log_fp.write(formatted_message)
-			self.log_fp.flush()
+			self.log.write(formatted_message)
+
+	def copy_output(self):
+		# Copy the command's output into the log until it exits.
+		# Something it started may still have the output open after
+		# that, and keep writing to it, so check if it has exited each
+		# time around. Once it has, copy what's already waiting (up to
+		# EXIT_DRAIN_SIZE) and stop. Anything written to the output
+		# after we've exited gets SIGPIPE, rather than going to the log.
+		# Between reads, compress the last rotated segment a step at
+		# a time, without waiting whilst there's some left.
+		pipe = self.process.stdout.fileno()
+		drained = None
+		while True:
+			if drained is None and self.process.poll() is not None:
+				drained = 0
+
+			timeout = EXIT_CHECK_INTERVAL
+			if drained is not None or self.log.is_compressing():
+				timeout = 0
+			try:
+				readable, writable, errored = select.select([pipe, self.wake_read], [], [], timeout)
+			except select.error, ex:
+				if ex.args[0] == errno.EINTR:
+					continue
+				raise
+
+			if self.wake_read in readable:
+				# A child exited. Check if it's the command.
+				self._clear_wake()
+				continue
+
+			if not readable:
+				if drained is not None:
+					# It exited, and nothing more is waiting.
+					break
+				self.log.compress_step()
+				continue
+
+			try:
+				chunk = os.read(pipe, READ_SIZE)
+			except OSError, ex:
+				if ex.errno == errno.EINTR:
+					continue
+				raise
+			if len(chunk) == 0:
+				# Everything has closed it's output.
+				break
+			self.log.write(chunk)
+			self.log.compress_step()
+
+			if drained is not None:
+				drained += len(chunk)
+				if drained >= EXIT_DRAIN_SIZE:
+					break
+
+	def _clear_wake(self):
+		try:
+			while os.read(self.wake_read, READ_SIZE):
+				pass
+		except OSError, ex:
+			if ex.errno not in (errno.EAGAIN, errno.EINTR):
+				raise
+
+	def sigchld_handler(self, signum, frame):
+		try:
+			os.write(self.wake_write, "x")
+		except OSError, ex:
+			# The pipe is full, so a wake up is already waiting.
+			pass
 
 	def signal_handler(self, signum, frame):
 		# Attempt to kill our child process.
@@ -88,23 +365,22 @@ class CommandSupervisor(object):
 		signal.signal(signal.SIGHUP, signal.SIG_IGN)
 		signal.signal(signal.SIGINT, signal.SIG_IGN)
 
+		# Notice straight away when the command exits. Other system
+		# calls carry on rather than being interrupted by it.
+		signal.signal(signal.SIGCHLD, self.sigchld_handler)
+		signal.siginterrupt(signal.SIGCHLD, False)
+
 		try:
 			self.log_helper("INFO", "Running command: %s" % str(self.data['command']))
-			self.log_fp.flush()
-
-			# Attempt to disable output buffering.
-			# Ref: http://stackoverflow.com/questions/107705/python-output-buffering/1736047#1736047
-			fl = fcntl.fcntl(self.log_fp.fileno(), fcntl.F_GETFL)
-			fl |= os.O_SYNC
-			fcntl.fcntl(self.log_fp.fileno(), fcntl.F_SETFL, fl)
 
 			self.process_active = True
 			try:
+				# Output comes through us, so we can rotate the log.
 				self.process = subprocess.Popen(
 					self.data['command'],
 					stdin=None,
-					stdout=self.log_fp,
-					stderr=self.log_fp,
+					stdout=subprocess.PIPE,
+					stderr=subprocess.STDOUT,
 					shell=shell,
 					cwd=self.data['cwd'],
 					env=self.data['environment']
@@ -124,6 +400,7 @@ class CommandSupervisor(object):
 				startflag_fd.close()
 
 				# Wait for it to complete, or for a signal.
+				self.copy_output()
 				self.process.wait()
 
 				# Remove the pidfile.
@@ -145,11 +422,9 @@ class CommandSupervisor(object):
 				startflag_fd.write("started")
 				startflag_fd.close()
 
-			# Reopen the log file.
+			# Write out anything logged whilst it was running.
 			self.process_active = False
-			self.log_fp.close()
-			self.log_fp = open(data['log_file'], 'a')
-			self.log_fp.write("".join(self.log_backlog))
+			self.log.write("".join(self.log_backlog))
 
 			# And record the result.
 			self.log_helper("INFO", "Completed with result code %d" % return_code)
@@ -206,6 +481,7 @@ class CommandSupervisor(object):
 
 supervisor = CommandSupervisor(data)
 supervisor.run()
+supervisor.log.close()
 
 # Clean up.
 if os.path.exists(data['pidfile']):
@@ -67,6 +67,7 @@ test_sets = {
 	paasmaker.util.processcheck: ['normal', 'util', 'process'],
 	#paasmaker.util.managedrabbitmq: ['slow', 'util', 'messaging', 'managedservice', 'rabbitmq'],
 	paasmaker.util.redisdaemon: ['util', 'redis', 'managedservice'],
+	paasmaker.util.redispool: ['util', 'redis'],
 	paasmaker.util.postgresdaemon: ['slow', 'util', 'postgres', 'managedservice', 'postgresdaemon'],
 	paasmaker.util.mongodaemon: ['util', 'mongodb', 'managedservice', 'mongodaemon'],
 	paasmaker.util.mysqldaemon: ['slow', 'util', 'mysql', 'managedservice', 'mysqldaemon'],
@@ -75,6 +76,11 @@ test_sets = {
 	paasmaker.util.asyncdns: ['normal', 'util', 'network'],
 	paasmaker.util.flattenizr: ['normal', 'util', 'data'],
 	paasmaker.util.threadcallback: ['normal', 'util', 'thread'],
+	paasmaker.util.lrucache: ['normal', 'quick', 'util', 'data'],
+	paasmaker.util.histogram: ['normal', 'quick', 'util', 'data'],
+	paasmaker.util.logindex: ['normal', 'util', 'logging'],
+	paasmaker.util.compressedlog: ['normal', 'util', 'logging'],
+	paasmaker.util.logsearch: ['normal', 'util', 'logging'],
 
 	paasmaker.router.router: ['normal', 'router', 'routeronly'],
 	paasmaker.pacemaker.cron.cronrunner: ['normal', 'cron'],
@@ -84,6 +90,8 @@ test_sets = {
 	paasmaker.common.application.configuration: ['normal', 'configuration'],
 	paasmaker.common.job.manager.backendredis: ['normal', 'util', 'job', 'jobmanager', 'jobmanagerbackend'],
 	paasmaker.common.job.manager.manager: ['normal', 'util', 'job', 'jobmanager', 'jobmanagercore'],
+	paasmaker.common.job.manager.archive: ['normal', 'util', 'job', 'jobmanager', 'jobarchive'],
+	paasmaker.common.job.manager.codec: ['normal', 'quick', 'util', 'job', 'jobmanager'],
 
 	paasmaker.common.dynamictags.default: ['normal', 'dynamictags'],
 	paasmaker.common.dynamictags.ec2: ['normal', 'dynamictags'],